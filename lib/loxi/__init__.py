@@ -5,6 +5,9 @@
 # Automatically generated by LOXI from template toplevel_init.py
 # Do not modify
 
+import struct
+import sys
+
 version_names = {
     1: "1.0",
     4: "1.3",
@@ -29,6 +32,111 @@ def protocol(ver):
 
     raise ValueError
 
+class LazyModule(object):
+    """
+    Placeholder for a rarely used submodule of a protocol package
+
+    The submodule is imported on first attribute access. Importing it
+    replaces this placeholder in the package, so later lookups of
+    ofp.<name> find the real module. Each submodule registers its own
+    subtypes, so its subtype tables are complete once it is loaded.
+    """
+    def __init__(self, package, name):
+        self.__package = package
+        self.__name = name
+
+    def load(self):
+        """
+        Import and return the real module.
+        """
+        fullname = "%s.%s" % (self.__package, self.__name)
+        __import__(fullname)
+        return sys.modules[fullname]
+
+    def __getattr__(self, name):
+        return getattr(self.load(), name)
+
+    def __dir__(self):
+        return dir(self.load())
+
+    def __repr__(self):
+        return "<lazy module '%s.%s'>" % (self.__package, self.__name)
+
+def load_lazy_modules(ofp):
+    """
+    Import every lazily loaded submodule of the protocol module ofp.
+    """
+    for name in ofp.lazy_modules:
+        module = getattr(ofp, name)
+        if isinstance(module, LazyModule):
+            module.load()
+
+def parse_stream(buf, offset=0, lazy=False, protocols=None):
+    """
+    Iterate over the complete OpenFlow messages in buf starting at offset.
+
+    Returns a StreamParser yielding (msg, start, end) for each message. Each
+    message is parsed by the protocol module matching the version in its
+    header, resolved once and kept in the protocols dict; reuse the same
+    dict for every call on a connection.
+    """
+    return StreamParser(buf, offset, lazy, protocols)
+
+_header_struct = struct.Struct("!BBHL")
+
+class StreamParser(object):
+    """
+    Framer over a buffer holding a sequence of OpenFlow messages
+
+    Iteration stops at the first incomplete message. offset is then the
+    start of the unconsumed bytes and consumed the number of bytes used.
+    Messages are handed to parse_message as zero-copy slices of buf.
+    The offset is advanced past a message before it is parsed, so a parse
+    error can be handled and iteration resumed at the next message.
+    """
+    def __init__(self, buf, offset=0, lazy=False, protocols=None):
+        self.buf = buf
+        self.start = offset
+        self.offset = offset
+        self.lazy = lazy
+        if protocols is None:
+            protocols = {}
+        self.protocols = protocols
+        if isinstance(buf, (bytearray, memoryview)):
+            self.view = memoryview(buf)
+        else:
+            self.view = None
+
+    @property
+    def consumed(self):
+        return self.offset - self.start
+
+    def __iter__(self):
+        return self
+
+    def next(self):
+        buf = self.buf
+        start = self.offset
+        if start + 8 > len(buf):
+            raise StopIteration
+        version, _, length, _ = _header_struct.unpack_from(buf, start)
+        if length < 8:
+            raise ProtocolError("invalid message length %d" % length)
+        end = start + length
+        if end > len(buf):
+            raise StopIteration
+        self.offset = end
+
+        ofp = self.protocols.get(version)
+        if ofp is None:
+            ofp = self.protocols[version] = protocol(version)
+
+        if self.view is not None:
+            msgbuf = self.view[start:end]
+        else:
+            msgbuf = buffer(buf, start, length)
+        return (ofp.message.parse_message(msgbuf, lazy=self.lazy), start, end)
+
 class ProtocolError(Exception):
     """
     Raised when failing to deserialize an invalid OpenFlow message.
@@ -47,13 +155,89 @@ def unimplemented(msg):
 class OFObject(object):
     """
     Superclass of all OpenFlow classes
+
+    Generated subclasses declare __slots__ for their fields so decoded
+    objects carry no per-instance __dict__.
     """
+    __slots__ = ()
+
     def __init__(self, *args):
         raise NotImplementedError("cannot instantiate abstract class")
 
+    def pack(self):
+        """
+        Return the wire representation of this object as a string.
+        """
+        buf = bytearray()
+        self.pack_into(buf, 0)
+        return str(buf)
+
+    def pack_into(self, buf, offset):
+        """
+        Write the wire representation of this object into the bytearray buf
+        at offset, growing it if needed, and return the offset past the end.
+        Length fields are backpatched in place once the children are written.
+        """
+        raise NotImplementedError()
+
+    def wire_length(self):
+        """
+        Return the number of bytes pack() would produce, without packing.
+        """
+        raise NotImplementedError()
+
     def __ne__(self, other):
         return not self.__eq__(other)
 
+    def __getstate__(self):
+        # Slots only, for copy and pickle
+        import loxi.generic_util
+        return dict((name, getattr(self, name))
+                    for name in loxi.generic_util.fields(type(self))
+                    if hasattr(self, name))
+
+    def __setstate__(self, state):
+        for name, value in state.items():
+            setattr(self, name, value)
+
+    def clone(self, **overrides):
+        """
+        Return a copy of this object with the given fields replaced.
+
+        Unchanged children are shared with this object rather than copied,
+        only the lists holding them are new, so they must be treated as
+        immutable; override a field to change it. Overriding values are
+        deep-copied.
+        """
+        import copy
+        import loxi.generic_util
+        cls = type(self)
+        names = loxi.generic_util.fields(cls)
+        for name in overrides:
+            if name not in names:
+                raise TypeError("%s has no field %s" % (cls.__name__, name))
+        obj = cls.__new__(cls)
+        for name in names:
+            if name in overrides:
+                value = copy.deepcopy(overrides[name])
+            else:
+                try:
+                    value = getattr(self, name)
+                except AttributeError:
+                    continue
+                if type(value) is list:
+                    value = list(value)
+            setattr(obj, name, value)
+        return obj
+
     def show(self):
         import loxi.pp
         return loxi.pp.pp(self)
+
+    def frozen(self):
+        """
+        Return a copy of this object that memoizes its packed bytes.
+        See loxi.frozen.
+        """
+        import loxi.frozen
+        return loxi.frozen.freeze(self)
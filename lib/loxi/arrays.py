@@ -0,0 +1,288 @@
+"""
+arrays - decode fixed-layout stats replies into NumPy structured arrays
+
+The entries of port, queue and table stats replies have a fixed size, so
+the body of a reply is an array of big-endian records. decode_entries_array
+returns it as a NumPy structured array viewing the reply bytes, without
+creating an object per entry:
+
+>>> ports = loxi.arrays.decode_entries_array(reply_bytes)
+>>> ports["port_no"], ports["rx_packets"]
+
+Fields keep their wire names and big-endian dtypes, so counters of two
+samples can be subtracted directly:
+
+>>> rx_pps = now["rx_packets"] - before["rx_packets"]
+
+Group and meter stats entries carry a list of bucket or band counters. For
+those replies decode_entries_array returns the fixed part of each entry and
+decode_nested_array the counters, with the index of the owning entry.
+
+Flow stats entries have a variable-length match and instruction list.
+decode_flow_stats_columns returns their fixed fields as arrays, and the
+offsets of the match and instructions in the reply for decoding on demand:
+
+>>> flows = loxi.arrays.decode_flow_stats_columns(reply_bytes)
+>>> total = flows["packet_count"].sum()
+>>> flows.match(0)
+
+Requires NumPy.
+"""
+
+import re
+import struct
+import numpy
+import loxi
+import loxi.generic_util
+
+def decode_entries_array(reply_bytes):
+    """
+    Return the entries of a stats reply as a NumPy structured array.
+
+    For fixed-size entries the array is a view of reply_bytes.
+    """
+    layout, body, end = _reply_body(reply_bytes)
+    dtype = layout.dtype
+    if layout.nested_dtype is None:
+        if (end - body) % dtype.itemsize != 0:
+            raise loxi.ProtocolError("stats reply body is not a whole number of %d byte entries" % dtype.itemsize)
+        return _bytes_array(reply_bytes)[body:end].view(dtype)
+    offsets, _ = _entry_offsets(reply_bytes, body, end, layout.length_offset, dtype.itemsize)
+    return _gather(reply_bytes, dtype, offsets)
+
+def decode_nested_array(reply_bytes):
+    """
+    Return the bucket or band counters of a group or meter stats reply.
+
+    Returns (counters, owner), where counters is a NumPy structured array
+    and owner[i] is the index in decode_entries_array() of the entry
+    counters[i] belongs to.
+    """
+    layout, body, end = _reply_body(reply_bytes)
+    if layout.nested_dtype is None:
+        raise loxi.Unimplemented("stats reply entries have no nested counters")
+    head = layout.dtype.itemsize
+    offsets, lengths = _entry_offsets(reply_bytes, body, end, layout.length_offset, head)
+    size = layout.nested_dtype.itemsize
+    if ((lengths - head) % size).any():
+        raise loxi.ProtocolError("stats entry length is not a whole number of %d byte counters" % size)
+    counts = (lengths - head) // size
+    owner = numpy.repeat(numpy.arange(len(offsets)), counts)
+    # Position of each counter within its entry's list
+    firsts = numpy.cumsum(counts) - counts
+    index = numpy.arange(counts.sum()) - numpy.repeat(firsts, counts)
+    starts = offsets[owner] + head + index * size
+    return _gather(reply_bytes, layout.nested_dtype, starts), owner
+
+def decode_flow_stats_columns(reply_bytes):
+    """
+    Return the entries of a flow stats reply as a FlowStatsColumns.
+    """
+    version, stats_type, body, end = _reply_header(reply_bytes)
+    if stats_type != 1:
+        raise loxi.ProtocolError("stats type %d is not flow stats" % stats_type)
+    return FlowStatsColumns(reply_bytes, version, body, end)
+
+class FlowStatsColumns(object):
+    """
+    Columnar view of the entries of a flow stats reply
+
+    columns["packet_count"] and the other fixed fields of flow_stats_entry
+    are NumPy arrays, read without creating an object per entry. The match
+    and the instructions (actions in OpenFlow 1.0) of entry i stay in the
+    reply bytes, at match_offsets[i]:match_ends[i] and
+    instructions_offsets[i]:instructions_ends[i], and are decoded on demand
+    by match(i) and instructions(i).
+    """
+    def __init__(self, buf, version, offset, end):
+        self.buf = buf
+        self.version = version
+        dtype, match_offset = _flow_stats_layouts[version]
+        offsets, lengths = _entry_offsets(buf, offset, end, 0, dtype.itemsize)
+        self.columns = _gather(buf, dtype, offsets)
+        self.match_offsets = offsets + match_offset
+        if version == 1:
+            # Fixed-length ofp_match in the middle of the entry
+            self.match_ends = self.match_offsets + 40
+            self.instructions_offsets = offsets + dtype.itemsize
+        else:
+            # OXM match after the fixed fields, padded to 8 bytes
+            match_lengths = _gather(buf, _match_header_dtype, self.match_offsets)["length"].astype(numpy.intp)
+            self.match_ends = self.match_offsets + match_lengths
+            self.instructions_offsets = self.match_offsets + (match_lengths + 7) // 8 * 8
+        self.instructions_ends = offsets + lengths
+        if (self.instructions_offsets > self.instructions_ends).any():
+            raise loxi.ProtocolError("flow stats entry too short for its match")
+
+    def __len__(self):
+        return len(self.columns)
+
+    def __getitem__(self, name):
+        return self.columns[name]
+
+    def match(self, i):
+        """
+        Decode the match of entry i.
+        """
+        ofp = loxi.protocol(self.version)
+        return ofp.match.unpack(self._reader(self.match_offsets[i], self.instructions_offsets[i]))
+
+    def instructions(self, i):
+        """
+        Decode the instructions of entry i, or its actions in OpenFlow 1.0.
+        """
+        ofp = loxi.protocol(self.version)
+        reader = self._reader(self.instructions_offsets[i], self.instructions_ends[i])
+        if self.version == 1:
+            return loxi.generic_util.unpack_list(reader, ofp.action.action.unpack)
+        return loxi.generic_util.unpack_list(reader, ofp.instruction.instruction.unpack)
+
+    def _reader(self, start, end):
+        return loxi.generic_util.OFReader(self.buf, int(start), int(end - start))
+
+class Layout(object):
+    """
+    Wire layout of the entries of one stats reply type
+
+    dtype covers the fixed part of an entry. Entries with a nested counter
+    list also have length_offset, the offset of their 16-bit length field,
+    and nested_dtype for the counters.
+    """
+    def __init__(self, fmt, names, nested_fmt=None, nested_names=None, length_offset=None):
+        self.dtype = struct_dtype(fmt, names)
+        self.nested_dtype = None
+        if nested_fmt is not None:
+            self.nested_dtype = struct_dtype(nested_fmt, nested_names)
+        self.length_offset = length_offset
+
+def struct_dtype(fmt, names):
+    """
+    Return the big-endian NumPy dtype for a struct format without the
+    byte order prefix, naming its fields in order. Pad bytes get no field.
+    """
+    codes = { "B": "u1", "H": ">u2", "L": ">u4", "Q": ">u8", "s": "S" }
+    formats = []
+    offsets = []
+    offset = 0
+    for count, code in _fmt_re.findall(fmt):
+        count = int(count or 1)
+        if code == "x":
+            offset += count
+        elif code == "s":
+            formats.append("S%d" % count)
+            offsets.append(offset)
+            offset += count
+        else:
+            for i in range(count):
+                formats.append(codes[code])
+                offsets.append(offset)
+                offset += struct.calcsize("!" + code)
+    assert len(names) == len(formats)
+    return numpy.dtype({ "names": names, "formats": formats, "offsets": offsets, "itemsize": offset })
+
+_fmt_re = re.compile(r"(\d*)([BHLQsx])")
+
+_port_stats_names = [
+    "port_no", "rx_packets", "tx_packets", "rx_bytes", "tx_bytes",
+    "rx_dropped", "tx_dropped", "rx_errors", "tx_errors", "rx_frame_err",
+    "rx_over_err", "rx_crc_err", "collisions",
+]
+
+# (version, stats_type) -> Layout
+layouts = {
+    # OpenFlow 1.0
+    (1, 3): Layout("B3x32sLLLQQ", ["table_id", "name", "wildcards", "max_entries", "active_count", "lookup_count", "matched_count"]),
+    (1, 4): Layout("H6xQQQQQQQQQQQQ", _port_stats_names),
+    (1, 5): Layout("H2xLQQQ", ["port_no", "queue_id", "tx_bytes", "tx_packets", "tx_errors"]),
+    # OpenFlow 1.3
+    (4, 3): Layout("B3xLQQ", ["table_id", "active_count", "lookup_count", "matched_count"]),
+    (4, 4): Layout("L4xQQQQQQQQQQQQLL", _port_stats_names + ["duration_sec", "duration_nsec"]),
+    (4, 5): Layout("LLQQQLL", ["port_no", "queue_id", "tx_bytes", "tx_packets", "tx_errors", "duration_sec", "duration_nsec"]),
+    (4, 6): Layout("H2xLL4xQQLL", ["length", "group_id", "ref_count", "packet_count", "byte_count", "duration_sec", "duration_nsec"],
+                   "QQ", ["packet_count", "byte_count"], length_offset=0),
+    (4, 9): Layout("LH6xLQQLL", ["meter_id", "length", "flow_count", "packet_in_count", "byte_in_count", "duration_sec", "duration_nsec"],
+                   "QQ", ["packet_band_count", "byte_band_count"], length_offset=4),
+}
+
+# version -> (dtype of the fixed fields of flow_stats_entry, offset of the match)
+_flow_stats_layouts = {
+    1: (struct_dtype("HBx40xLLHHH6xQQQ", ["length", "table_id", "duration_sec", "duration_nsec", "priority", "idle_timeout", "hard_timeout", "cookie", "packet_count", "byte_count"]), 4),
+    4: (struct_dtype("HBxLLHHHH4xQQQ", ["length", "table_id", "duration_sec", "duration_nsec", "priority", "idle_timeout", "hard_timeout", "flags", "cookie", "packet_count", "byte_count"]), 48),
+}
+
+_match_header_dtype = struct_dtype("HH", ["type", "length"])
+
+# version -> (OFPT_STATS_REPLY, offset of the entries)
+_reply_headers = {
+    1: (17, 12),
+    4: (19, 16),
+}
+
+_header_struct = struct.Struct("!BBHLH")
+_length_struct = struct.Struct("!H")
+
+def _reply_body(buf):
+    """
+    Return (layout, start, end) of the entries of the stats reply in buf.
+    """
+    version, stats_type, start, length = _reply_header(buf)
+    layout = layouts.get((version, stats_type))
+    if layout is None:
+        raise loxi.Unimplemented("array decoding of version %d stats type %d" % (version, stats_type))
+    return layout, start, length
+
+def _reply_header(buf):
+    """
+    Check the header of the stats reply in buf.
+
+    Returns (version, stats_type, start, end), the last two delimiting its
+    entries.
+    """
+    if len(buf) < _header_struct.size:
+        raise loxi.ProtocolError("stats reply truncated")
+    version, type, length, xid, stats_type = _header_struct.unpack_from(buf, 0)
+    if version not in _reply_headers:
+        raise loxi.Unimplemented("array decoding of version %d stats replies" % version)
+    reply_type, start = _reply_headers[version]
+    if type != reply_type:
+        raise loxi.ProtocolError("message type %d is not a stats reply" % type)
+    if length < start or length > len(buf):
+        raise loxi.ProtocolError("invalid message length %d" % length)
+    return version, stats_type, start, length
+
+def _entry_offsets(buf, offset, end, length_offset, head):
+    """
+    Walk the variable-length entries between offset and end, each at least
+    head bytes long with a 16-bit length field at length_offset.
+
+    Returns NumPy arrays of their offsets and lengths.
+    """
+    offsets = []
+    lengths = []
+    while offset < end:
+        if offset + head > end:
+            raise loxi.ProtocolError("stats entry truncated")
+        length, = _length_struct.unpack_from(buf, offset + length_offset)
+        if length < head or offset + length > end:
+            raise loxi.ProtocolError("invalid stats entry length %d" % length)
+        offsets.append(offset)
+        lengths.append(length)
+        offset += length
+    return numpy.array(offsets, dtype=numpy.intp), numpy.array(lengths, dtype=numpy.intp)
+
+def _gather(buf, dtype, offsets):
+    """
+    Copy the records of the given dtype starting at each offset into a new
+    structured array.
+    """
+    raw = _bytes_array(buf)
+    rows = raw[offsets[:, numpy.newaxis] + numpy.arange(dtype.itemsize)]
+    return numpy.ascontiguousarray(rows).view(dtype).reshape(len(offsets))
+
+def _bytes_array(buf):
+    """
+    Return a uint8 array viewing buf without copying.
+    """
+    if isinstance(buf, memoryview):
+        return numpy.asarray(buf).view(numpy.uint8)
+    return numpy.frombuffer(buf, numpy.uint8)
@@ -0,0 +1,202 @@
+"""
+frozen - loxi objects that memoize their packed bytes
+
+A frozen object is a copy of a loxi object (and of every loxi object below
+it) that keeps the bytes produced by its first pack_into() and splices them
+straight into later parents. It is meant for sub-objects built once and
+reused many times, such as a match or an instruction list shared by
+thousands of flow-mods:
+
+>>> match = freeze(ofp.match([ofp.oxm.in_port(1)]))
+>>> msgs = [ofp.message.flow_add(match=match, priority=p) for p in range(1000)]
+
+Assigning an attribute of a frozen object drops its cached bytes and those
+of the frozen objects containing it. Lists are frozen into FrozenList,
+which refuses in-place modification; assign a new list instead.
+
+Frozen objects are instances of a subclass of the original class with the
+same name, and compare equal to frozen or unfrozen objects of that class
+with the same wire form, from either side of ==. A parent holding a frozen
+child thus still equals the same message built normally or decoded.
+
+Frozen objects also hash by their wire form, so they can be put in sets and
+used as dict keys. Unfrozen objects hash by identity, so only put frozen
+objects in a set or dict: an unfrozen object equal to a frozen key is not
+found. Diffing two flow tables is then a set difference:
+
+>>> missing = set(map(freeze, expected)) - set(map(freeze, actual))
+
+As with any key, a frozen object must not be modified while it is in a set
+or dict.
+"""
+
+import struct
+import loxi
+import loxi.generic_util
+
+def freeze(obj):
+    """
+    Return a frozen copy of a loxi object.
+    """
+    if isinstance(obj, FrozenObject):
+        return obj
+    return _copy(obj, frozen_class(type(obj)))
+
+def fields(cls):
+    """
+    Return the names of the per-instance fields of a loxi class.
+    """
+    names = _fields.get(cls)
+    if names is None:
+        names = [name for name in loxi.generic_util.fields(cls)
+                 if name not in ("_packed", "_owner")]
+        _fields[cls] = names
+    return names
+
+_fields = {}
+
+class FrozenObject(object):
+    """
+    Mixin for frozen classes, which add two slots:
+
+    _packed: bytes from the first pack_into(), or None
+    _owner: the frozen object this one is a field of, if any
+    """
+    __slots__ = ()
+
+    def __setattr__(self, name, value):
+        object.__setattr__(self, name, _freeze_value(value, self))
+        self.invalidate()
+
+    def invalidate(self):
+        """
+        Drop the cached bytes of this object and of its frozen owners.
+        """
+        obj = self
+        while obj is not None:
+            object.__setattr__(obj, "_packed", None)
+            obj = obj._owner
+
+    def pack_into(self, buf, offset):
+        packed = self._packed
+        if packed is None:
+            start = offset
+            offset = super(FrozenObject, self).pack_into(buf, offset)
+            object.__setattr__(self, "_packed", str(buf[start:offset]))
+            return offset
+        return loxi.generic_util.pack_bytes_into(packed, buf, offset)
+
+    def wire_length(self):
+        if self._packed is not None:
+            return len(self._packed)
+        return super(FrozenObject, self).wire_length()
+
+    def packed(self):
+        """
+        Return the wire form of this object, packing it only once.
+        """
+        if self._packed is None:
+            self.pack_into(bytearray(), 0)
+        return self._packed
+
+    def __eq__(self, other):
+        # Being a subclass, this is called first on either side of ==
+        if not isinstance(other, self._thawed_class):
+            return False
+        try:
+            if isinstance(other, FrozenObject):
+                return self.packed() == other.packed()
+            return self.packed() == other.pack()
+        except _pack_errors:
+            # Not packable yet, such as a message without an xid
+            return all(getattr(self, name, None) == getattr(other, name, None)
+                       for name in fields(self._thawed_class))
+
+    def __ne__(self, other):
+        return not self.__eq__(other)
+
+    def __hash__(self):
+        try:
+            return hash(self.packed())
+        except _pack_errors:
+            # Equal objects are either both packable or both not
+            return hash(self._thawed_class)
+
+    def clone(self, **overrides):
+        # Frozen children can only have one owner, so they are copied
+        import copy
+        obj = _copy(self, type(self))
+        for name, value in overrides.items():
+            if name not in fields(self._thawed_class):
+                raise TypeError("%s has no field %s" % (type(self).__name__, name))
+            setattr(obj, name, copy.deepcopy(value))
+        return obj
+
+    def __deepcopy__(self, memo):
+        import copy
+        return _copy(self, type(self), lambda x: copy.deepcopy(x, memo))
+
+_pack_errors = (struct.error, TypeError)
+
+class FrozenList(list):
+    """
+    List of frozen objects that refuses in-place modification
+    """
+    def _immutable(self, *args, **kwargs):
+        raise TypeError("frozen list cannot be modified, assign a new list instead")
+
+    append = extend = insert = remove = pop = sort = reverse = _immutable
+    __setitem__ = __delitem__ = __setslice__ = __delslice__ = _immutable
+    __iadd__ = __imul__ = _immutable
+
+    def __deepcopy__(self, memo):
+        import copy
+        return [copy.deepcopy(x, memo) for x in self]
+
+def frozen_class(cls):
+    """
+    Return the frozen subclass of a loxi class.
+    """
+    frozen = _frozen_classes.get(cls)
+    if frozen is None:
+        frozen = type(cls.__name__, (FrozenObject, cls), {
+            "__slots__": ["_packed", "_owner"],
+            "__module__": cls.__module__,
+            "_thawed_class": cls,
+        })
+        _frozen_classes[cls] = frozen
+    return frozen
+
+_frozen_classes = {}
+
+def _copy(obj, cls, copy_value=None):
+    frozen = cls.__new__(cls)
+    # Fields are set directly, a new copy has no cached bytes to invalidate
+    set_field = object.__setattr__
+    set_field(frozen, "_packed", None)
+    set_field(frozen, "_owner", None)
+    for name in fields(type(obj)):
+        value = getattr(obj, name, _unset)
+        if value is _unset:
+            continue
+        if copy_value:
+            value = copy_value(value)
+        set_field(frozen, name, _freeze_value(value, frozen))
+    return frozen
+
+_unset = object()
+
+def _freeze_value(value, owner):
+    if not isinstance(value, (loxi.OFObject, list)):
+        return value
+    if isinstance(value, FrozenObject):
+        # A frozen object can only invalidate a single owner
+        if value._owner is not None and value._owner is not owner:
+            value = _copy(value, type(value))
+        object.__setattr__(value, "_owner", owner)
+    elif isinstance(value, loxi.OFObject):
+        value = freeze(value)
+        object.__setattr__(value, "_owner", owner)
+    elif isinstance(value, list):
+        value = FrozenList([_freeze_value(x, owner) for x in value])
+    return value
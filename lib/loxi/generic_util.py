@@ -11,9 +11,48 @@ Utility functions independent of the protocol version
 
 import loxi
 import struct
+import types
 
 def pack_list(values):
-    return "".join([x.pack() for x in values])
+    buf = bytearray()
+    pack_list_into(values, buf, 0)
+    return str(buf)
+
+def pack_list_into(values, buf, offset):
+    """
+    Pack each value into buf at offset and return the offset past the last one.
+    """
+    for x in values:
+        offset = x.pack_into(buf, offset)
+    return offset
+
+def list_wire_length(values):
+    """
+    Return the total encoded length of a list of objects.
+    """
+    length = 0
+    for x in values:
+        length += x.wire_length()
+    return length
+
+def pack_struct_into(st, buf, offset, *values):
+    """
+    Pack values with the precompiled struct st into buf at offset, growing
+    buf if needed, and return the offset past the packed fields.
+    """
+    end = offset + st.size
+    if end > len(buf):
+        buf.extend("\x00" * (end - len(buf)))
+    st.pack_into(buf, offset, *values)
+    return end
+
+def pack_bytes_into(value, buf, offset):
+    """
+    Copy a string into buf at offset and return the offset past it.
+    """
+    end = offset + len(value)
+    buf[offset:end] = value
+    return end
 
 def unpack_list(reader, deserializer):
     """
@@ -24,6 +63,47 @@ def unpack_list(reader, deserializer):
         entries.append(deserializer(reader))
     return entries
 
+def dispatch_table(cls, fields):
+    """
+    Return the subtype tree below cls as nested tables for
+    unpack_dispatched().
+
+    fields maps each class with subtypes to the (struct, offset) of the
+    field its unpack() peeks to pick the subtype. A class without subtypes
+    is represented by its unpack(), and a class with subtypes by a tuple of
+    that struct and offset, a dict from field values to the representations
+    of the subclasses, and its own unpack().
+
+    The table is a snapshot, it must be built after all subtypes are
+    registered.
+    """
+    field = fields.get(cls)
+    if field is None:
+        return cls.unpack
+    st, offset = field
+    table = {}
+    for value, subclass in cls.subtypes.items():
+        table[value] = dispatch_table(subclass, fields)
+    return (st, offset, table, cls.unpack)
+
+def unpack_dispatched(reader, node):
+    """
+    Unpack the object at the reader with the unpack() of its most derived
+    class in a dispatch_table(), reading the subtype fields directly from
+    the buffer instead of going through the unpack() of each class above it.
+    """
+    buf = reader.buf
+    start = reader.start + reader.offset
+    end = reader.start + reader.length
+    while type(node) is tuple:
+        st, offset, table, unpack = node
+        if start + offset + st.size > end:
+            return unpack(reader)
+        node = table.get(st.unpack_from(buf, start + offset)[0])
+        if node is None:
+            return unpack(reader)
+    return node(reader)
+
 def pad_to(alignment, length):
     """
     Return a string of zero bytes that will pad a string of length 'length' to
@@ -31,6 +111,44 @@ def pad_to(alignment, length):
     """
     return "\x00" * ((length + alignment - 1)/alignment*alignment - length)
 
+def pack_pad_into(alignment, length, buf, offset):
+    """
+    Write the padding pad_to(alignment, length) would return into buf at
+    offset and return the offset past it.
+    """
+    return pack_bytes_into(pad_to(alignment, length), buf, offset)
+
+def fields(cls):
+    """
+    Return the names of the per-instance fields of a loxi class, in slot
+    order. Slots shadowed by a class attribute, such as the type of a
+    message subclass, are left out.
+    """
+    names = _fields.get(cls)
+    if names is None:
+        names = []
+        for klass in reversed(cls.__mro__):
+            for name in klass.__dict__.get("__slots__", ()):
+                if name in names:
+                    continue
+                if isinstance(getattr(cls, name, None), types.MemberDescriptorType):
+                    names.append(name)
+        _fields[cls] = names
+    return names
+
+_fields = {}
+
+_structs = {}
+
+def _struct(fmt):
+    """
+    Return a cached struct.Struct for the given format string
+    """
+    st = _structs.get(fmt)
+    if st is None:
+        st = _structs[fmt] = struct.Struct(fmt)
+    return st
+
 class OFReader(object):
     """
     Cursor over a read-only buffer
@@ -41,12 +159,18 @@ class OFReader(object):
     fields sequentially and is intended to be used recursively by the
     parsers of child objects which will implicitly update the offset.
 
-    buf: buffer object
+    buf: buffer object (str, bytearray or memoryview)
     start: initial position in the buffer
     length: number of bytes after start
     offset: distance from start
+
+    A bytearray or memoryview is read without copying: read_all() then
+    returns memoryview slices that share the original buffer, and callers
+    wanting an independent string must ask for one with tobytes().
     """
     def __init__(self, buf, start=0, length=None):
+        if isinstance(buf, bytearray):
+            buf = memoryview(buf)
         self.buf = buf
         self.start = start
         if length is None:
@@ -56,7 +180,12 @@ class OFReader(object):
         self.offset = 0
 
     def read(self, fmt):
-        st = struct.Struct(fmt)
+        return self.read_struct(_struct(fmt))
+
+    def read_struct(self, st):
+        """
+        Read the fields of a precompiled struct.Struct in one step
+        """
         if self.offset + st.size > self.length:
             raise loxi.ProtocolError("Buffer too short")
         result = st.unpack_from(self.buf, self.start+self.offset)
@@ -70,7 +199,7 @@ class OFReader(object):
         return s
 
     def peek(self, fmt, offset=0):
-        st = struct.Struct(fmt)
+        st = _struct(fmt)
         if self.offset + offset + st.size > self.length:
             raise loxi.ProtocolError("Buffer too short")
         result = st.unpack_from(self.buf, self.start + self.offset + offset)
@@ -98,3 +227,46 @@ class OFReader(object):
         reader.skip(rewind)
         self.offset += length - rewind
         return reader
+
+_header_struct = struct.Struct("!BBHL")
+
+class LazyMessage(object):
+    """
+    Header-only view of an OpenFlow message
+
+    Only version, type, length and xid are parsed up front. The rest of
+    the message is unpacked with the deserializer the first time any other
+    attribute is used, so messages nobody looks at are never decoded.
+    isinstance() and == see the decoded message.
+    """
+    __slots__ = ["version", "type", "length", "xid", "_buf", "_deserializer", "_msg"]
+
+    def __init__(self, buf, deserializer):
+        self.version, self.type, self.length, self.xid = _header_struct.unpack_from(buf)
+        self._buf = buf
+        self._deserializer = deserializer
+        self._msg = None
+
+    def decode(self):
+        """
+        Return the fully unpacked message, decoding it on first use.
+        """
+        if self._msg is None:
+            self._msg = self._deserializer(OFReader(self._buf))
+            self._buf = None
+        return self._msg
+
+    @property
+    def __class__(self):
+        return type(self.decode())
+
+    def __getattr__(self, name):
+        return getattr(self.decode(), name)
+
+    def __eq__(self, other):
+        if isinstance(other, LazyMessage):
+            other = other.decode()
+        return self.decode() == other
+
+    def __ne__(self, other):
+        return not self.__eq__(other)
@@ -13,3 +13,6 @@ import common
 from const import *
 from common import *
 from loxi import ProtocolError
+
+# Rarely used families, imported on first reference
+lazy_modules = ()
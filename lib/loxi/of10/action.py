@@ -14,7 +14,31 @@ import loxi.generic_util
 import sys
 ofp = sys.modules['loxi.of10']
 
+# Precompiled layouts for the fixed-length parts of each pack_into() and unpack()
+_struct_6B = struct.Struct("!6B")
+_struct_6x = struct.Struct("!6x")
+_struct_H = struct.Struct("!H")
+_struct_H6xL = struct.Struct("!H6xL")
+_struct_HH = struct.Struct("!HH")
+_struct_HH4x = struct.Struct("!HH4x")
+_struct_HHB3x = struct.Struct("!HHB3x")
+_struct_HHH2x = struct.Struct("!HHH2x")
+_struct_HHH6xL = struct.Struct("!HHH6xL")
+_struct_HHHH = struct.Struct("!HHHH")
+_struct_HHL = struct.Struct("!HHL")
+_struct_HHLH6x = struct.Struct("!HHLH6x")
+_struct_HHLL = struct.Struct("!HHLL")
+_struct_HHLL4x = struct.Struct("!HHLL4x")
+_struct_HHLLL = struct.Struct("!HHLLL")
+_struct_HHLLLLB3x = struct.Struct("!HHLLLLB3x")
+_struct_LH6x = struct.Struct("!LH6x")
+_struct_LL = struct.Struct("!LL")
+_struct_LL4x = struct.Struct("!LL4x")
+_struct_LLL = struct.Struct("!LLL")
+_struct_LLLLB3x = struct.Struct("!LLLLB3x")
+
 class action(loxi.OFObject):
+    __slots__ = ["type"]
     subtypes = {}
 
 
@@ -25,14 +49,15 @@ class action(loxi.OFObject):
             self.type = 0
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!H", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for len at index 1
-        packed.append('\x00' * 4)
-        length = sum([len(x) for x in packed])
-        packed[1] = struct.pack("!H", length)
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_HH4x, buf, offset, self.type, 0)
+        length = offset - start
+        _struct_H.pack_into(buf, start + 2, length)
+        return offset
+
+    def wire_length(self):
+        return 8
 
     @staticmethod
     def unpack(reader):
@@ -42,8 +67,7 @@ class action(loxi.OFObject):
             return subclass.unpack(reader)
 
         obj = action()
-        obj.type = reader.read("!H")[0]
-        _len = reader.read("!H")[0]
+        obj.type, _len = reader.read_struct(_struct_HH)
         orig_reader = reader
         reader = orig_reader.slice(_len, 4)
         reader.skip(4)
@@ -64,6 +88,7 @@ class action(loxi.OFObject):
 
 
 class experimenter(action):
+    __slots__ = ["data", "experimenter"]
     subtypes = {}
 
     type = 65535
@@ -79,15 +104,16 @@ class experimenter(action):
             self.data = ''
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!H", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for len at index 1
-        packed.append(struct.pack("!L", self.experimenter))
-        packed.append(self.data)
-        length = sum([len(x) for x in packed])
-        packed[1] = struct.pack("!H", length)
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_HHL, buf, offset, self.type, 0, self.experimenter)
+        offset = loxi.generic_util.pack_bytes_into(self.data, buf, offset)
+        length = offset - start
+        _struct_H.pack_into(buf, start + 2, length)
+        return offset
+
+    def wire_length(self):
+        return 8 + len(self.data)
 
     @staticmethod
     def unpack(reader):
@@ -97,13 +123,12 @@ class experimenter(action):
             return subclass.unpack(reader)
 
         obj = experimenter()
-        _type = reader.read("!H")[0]
+        _type, _len = reader.read_struct(_struct_HH)
         assert(_type == 65535)
-        _len = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_len, 4)
         obj.experimenter = reader.read("!L")[0]
-        obj.data = str(reader.read_all())
+        obj.data = reader.read_all()
         return obj
 
     def __eq__(self, other):
@@ -125,6 +150,7 @@ class experimenter(action):
 action.subtypes[65535] = experimenter
 
 class bsn(experimenter):
+    __slots__ = ["subtype"]
     subtypes = {}
 
     type = 65535
@@ -137,16 +163,15 @@ class bsn(experimenter):
             self.subtype = 0
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!H", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for len at index 1
-        packed.append(struct.pack("!L", self.experimenter))
-        packed.append(struct.pack("!L", self.subtype))
-        packed.append('\x00' * 4)
-        length = sum([len(x) for x in packed])
-        packed[1] = struct.pack("!H", length)
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_HHLL4x, buf, offset, self.type, 0, self.experimenter, self.subtype)
+        length = offset - start
+        _struct_H.pack_into(buf, start + 2, length)
+        return offset
+
+    def wire_length(self):
+        return 16
 
     @staticmethod
     def unpack(reader):
@@ -156,15 +181,12 @@ class bsn(experimenter):
             return subclass.unpack(reader)
 
         obj = bsn()
-        _type = reader.read("!H")[0]
+        _type, _len = reader.read_struct(_struct_HH)
         assert(_type == 65535)
-        _len = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_len, 4)
-        _experimenter = reader.read("!L")[0]
+        _experimenter, obj.subtype = reader.read_struct(_struct_LL4x)
         assert(_experimenter == 6035143)
-        obj.subtype = reader.read("!L")[0]
-        reader.skip(4)
         return obj
 
     def __eq__(self, other):
@@ -183,6 +205,7 @@ class bsn(experimenter):
 experimenter.subtypes[6035143] = bsn
 
 class bsn_checksum(bsn):
+    __slots__ = ["checksum"]
     type = 65535
     experimenter = 6035143
     subtype = 4
@@ -194,28 +217,26 @@ class bsn_checksum(bsn):
             self.checksum = 0
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!H", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for len at index 1
-        packed.append(struct.pack("!L", self.experimenter))
-        packed.append(struct.pack("!L", self.subtype))
-        packed.append(util.pack_checksum_128(self.checksum))
-        length = sum([len(x) for x in packed])
-        packed[1] = struct.pack("!H", length)
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_HHLL, buf, offset, self.type, 0, self.experimenter, self.subtype)
+        offset = loxi.generic_util.pack_bytes_into(util.pack_checksum_128(self.checksum), buf, offset)
+        length = offset - start
+        _struct_H.pack_into(buf, start + 2, length)
+        return offset
+
+    def wire_length(self):
+        return 28
 
     @staticmethod
     def unpack(reader):
         obj = bsn_checksum()
-        _type = reader.read("!H")[0]
+        _type, _len = reader.read_struct(_struct_HH)
         assert(_type == 65535)
-        _len = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_len, 4)
-        _experimenter = reader.read("!L")[0]
+        _experimenter, _subtype = reader.read_struct(_struct_LL)
         assert(_experimenter == 6035143)
-        _subtype = reader.read("!L")[0]
         assert(_subtype == 4)
         obj.checksum = util.unpack_checksum_128(reader)
         return obj
@@ -238,6 +259,7 @@ class bsn_checksum(bsn):
 bsn.subtypes[4] = bsn_checksum
 
 class bsn_mirror(bsn):
+    __slots__ = ["copy_stage", "dest_port", "vlan_tag"]
     type = 65535
     experimenter = 6035143
     subtype = 1
@@ -257,36 +279,26 @@ class bsn_mirror(bsn):
             self.copy_stage = 0
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!H", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for len at index 1
-        packed.append(struct.pack("!L", self.experimenter))
-        packed.append(struct.pack("!L", self.subtype))
-        packed.append(struct.pack("!L", self.dest_port))
-        packed.append(struct.pack("!L", self.vlan_tag))
-        packed.append(struct.pack("!B", self.copy_stage))
-        packed.append('\x00' * 3)
-        length = sum([len(x) for x in packed])
-        packed[1] = struct.pack("!H", length)
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_HHLLLLB3x, buf, offset, self.type, 0, self.experimenter, self.subtype, self.dest_port, self.vlan_tag, self.copy_stage)
+        length = offset - start
+        _struct_H.pack_into(buf, start + 2, length)
+        return offset
+
+    def wire_length(self):
+        return 24
 
     @staticmethod
     def unpack(reader):
         obj = bsn_mirror()
-        _type = reader.read("!H")[0]
+        _type, _len = reader.read_struct(_struct_HH)
         assert(_type == 65535)
-        _len = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_len, 4)
-        _experimenter = reader.read("!L")[0]
+        _experimenter, _subtype, obj.dest_port, obj.vlan_tag, obj.copy_stage = reader.read_struct(_struct_LLLLB3x)
         assert(_experimenter == 6035143)
-        _subtype = reader.read("!L")[0]
         assert(_subtype == 1)
-        obj.dest_port = reader.read("!L")[0]
-        obj.vlan_tag = reader.read("!L")[0]
-        obj.copy_stage = reader.read("!B")[0]
-        reader.skip(3)
         return obj
 
     def __eq__(self, other):
@@ -315,6 +327,7 @@ class bsn_mirror(bsn):
 bsn.subtypes[1] = bsn_mirror
 
 class bsn_set_tunnel_dst(bsn):
+    __slots__ = ["dst"]
     type = 65535
     experimenter = 6035143
     subtype = 2
@@ -326,30 +339,26 @@ class bsn_set_tunnel_dst(bsn):
             self.dst = 0
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!H", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for len at index 1
-        packed.append(struct.pack("!L", self.experimenter))
-        packed.append(struct.pack("!L", self.subtype))
-        packed.append(struct.pack("!L", self.dst))
-        length = sum([len(x) for x in packed])
-        packed[1] = struct.pack("!H", length)
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_HHLLL, buf, offset, self.type, 0, self.experimenter, self.subtype, self.dst)
+        length = offset - start
+        _struct_H.pack_into(buf, start + 2, length)
+        return offset
+
+    def wire_length(self):
+        return 16
 
     @staticmethod
     def unpack(reader):
         obj = bsn_set_tunnel_dst()
-        _type = reader.read("!H")[0]
+        _type, _len = reader.read_struct(_struct_HH)
         assert(_type == 65535)
-        _len = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_len, 4)
-        _experimenter = reader.read("!L")[0]
+        _experimenter, _subtype, obj.dst = reader.read_struct(_struct_LLL)
         assert(_experimenter == 6035143)
-        _subtype = reader.read("!L")[0]
         assert(_subtype == 2)
-        obj.dst = reader.read("!L")[0]
         return obj
 
     def __eq__(self, other):
@@ -370,6 +379,7 @@ class bsn_set_tunnel_dst(bsn):
 bsn.subtypes[2] = bsn_set_tunnel_dst
 
 class enqueue(action):
+    __slots__ = ["port", "queue_id"]
     type = 11
 
     def __init__(self, port=None, queue_id=None):
@@ -383,28 +393,24 @@ class enqueue(action):
             self.queue_id = 0
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!H", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for len at index 1
-        packed.append(util.pack_port_no(self.port))
-        packed.append('\x00' * 6)
-        packed.append(struct.pack("!L", self.queue_id))
-        length = sum([len(x) for x in packed])
-        packed[1] = struct.pack("!H", length)
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_HHH6xL, buf, offset, self.type, 0, self.port, self.queue_id)
+        length = offset - start
+        _struct_H.pack_into(buf, start + 2, length)
+        return offset
+
+    def wire_length(self):
+        return 16
 
     @staticmethod
     def unpack(reader):
         obj = enqueue()
-        _type = reader.read("!H")[0]
+        _type, _len = reader.read_struct(_struct_HH)
         assert(_type == 11)
-        _len = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_len, 4)
-        obj.port = util.unpack_port_no(reader)
-        reader.skip(6)
-        obj.queue_id = reader.read("!L")[0]
+        obj.port, obj.queue_id = reader.read_struct(_struct_H6xL)
         return obj
 
     def __eq__(self, other):
@@ -429,6 +435,7 @@ class enqueue(action):
 action.subtypes[11] = enqueue
 
 class nicira(experimenter):
+    __slots__ = ["subtype"]
     subtypes = {}
 
     type = 65535
@@ -441,17 +448,15 @@ class nicira(experimenter):
             self.subtype = 0
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!H", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for len at index 1
-        packed.append(struct.pack("!L", self.experimenter))
-        packed.append(struct.pack("!H", self.subtype))
-        packed.append('\x00' * 2)
-        packed.append('\x00' * 4)
-        length = sum([len(x) for x in packed])
-        packed[1] = struct.pack("!H", length)
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_HHLH6x, buf, offset, self.type, 0, self.experimenter, self.subtype)
+        length = offset - start
+        _struct_H.pack_into(buf, start + 2, length)
+        return offset
+
+    def wire_length(self):
+        return 16
 
     @staticmethod
     def unpack(reader):
@@ -461,16 +466,12 @@ class nicira(experimenter):
             return subclass.unpack(reader)
 
         obj = nicira()
-        _type = reader.read("!H")[0]
+        _type, _len = reader.read_struct(_struct_HH)
         assert(_type == 65535)
-        _len = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_len, 4)
-        _experimenter = reader.read("!L")[0]
+        _experimenter, obj.subtype = reader.read_struct(_struct_LH6x)
         assert(_experimenter == 8992)
-        obj.subtype = reader.read("!H")[0]
-        reader.skip(2)
-        reader.skip(4)
         return obj
 
     def __eq__(self, other):
@@ -489,6 +490,7 @@ class nicira(experimenter):
 experimenter.subtypes[8992] = nicira
 
 class nicira_dec_ttl(nicira):
+    __slots__ = []
     type = 65535
     experimenter = 8992
     subtype = 18
@@ -496,32 +498,26 @@ class nicira_dec_ttl(nicira):
     def __init__(self):
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!H", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for len at index 1
-        packed.append(struct.pack("!L", self.experimenter))
-        packed.append(struct.pack("!H", self.subtype))
-        packed.append('\x00' * 2)
-        packed.append('\x00' * 4)
-        length = sum([len(x) for x in packed])
-        packed[1] = struct.pack("!H", length)
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_HHLH6x, buf, offset, self.type, 0, self.experimenter, self.subtype)
+        length = offset - start
+        _struct_H.pack_into(buf, start + 2, length)
+        return offset
+
+    def wire_length(self):
+        return 16
 
     @staticmethod
     def unpack(reader):
         obj = nicira_dec_ttl()
-        _type = reader.read("!H")[0]
+        _type, _len = reader.read_struct(_struct_HH)
         assert(_type == 65535)
-        _len = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_len, 4)
-        _experimenter = reader.read("!L")[0]
+        _experimenter, _subtype = reader.read_struct(_struct_LH6x)
         assert(_experimenter == 8992)
-        _subtype = reader.read("!H")[0]
         assert(_subtype == 18)
-        reader.skip(2)
-        reader.skip(4)
         return obj
 
     def __eq__(self, other):
@@ -539,6 +535,7 @@ class nicira_dec_ttl(nicira):
 nicira.subtypes[18] = nicira_dec_ttl
 
 class output(action):
+    __slots__ = ["max_len", "port"]
     type = 0
 
     def __init__(self, port=None, max_len=None):
@@ -552,26 +549,24 @@ class output(action):
             self.max_len = 0
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!H", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for len at index 1
-        packed.append(util.pack_port_no(self.port))
-        packed.append(struct.pack("!H", self.max_len))
-        length = sum([len(x) for x in packed])
-        packed[1] = struct.pack("!H", length)
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_HHHH, buf, offset, self.type, 0, self.port, self.max_len)
+        length = offset - start
+        _struct_H.pack_into(buf, start + 2, length)
+        return offset
+
+    def wire_length(self):
+        return 8
 
     @staticmethod
     def unpack(reader):
         obj = output()
-        _type = reader.read("!H")[0]
+        _type, _len = reader.read_struct(_struct_HH)
         assert(_type == 0)
-        _len = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_len, 4)
-        obj.port = util.unpack_port_no(reader)
-        obj.max_len = reader.read("!H")[0]
+        obj.port, obj.max_len = reader.read_struct(_struct_HH)
         return obj
 
     def __eq__(self, other):
@@ -596,6 +591,7 @@ class output(action):
 action.subtypes[0] = output
 
 class set_dl_dst(action):
+    __slots__ = ["dl_addr"]
     type = 5
 
     def __init__(self, dl_addr=None):
@@ -605,22 +601,23 @@ class set_dl_dst(action):
             self.dl_addr = [0,0,0,0,0,0]
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!H", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for len at index 1
-        packed.append(struct.pack("!6B", *self.dl_addr))
-        packed.append('\x00' * 6)
-        length = sum([len(x) for x in packed])
-        packed[1] = struct.pack("!H", length)
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_HH, buf, offset, self.type, 0)
+        offset = loxi.generic_util.pack_struct_into(_struct_6B, buf, offset, *self.dl_addr)
+        offset = loxi.generic_util.pack_struct_into(_struct_6x, buf, offset, )
+        length = offset - start
+        _struct_H.pack_into(buf, start + 2, length)
+        return offset
+
+    def wire_length(self):
+        return 16
 
     @staticmethod
     def unpack(reader):
         obj = set_dl_dst()
-        _type = reader.read("!H")[0]
+        _type, _len = reader.read_struct(_struct_HH)
         assert(_type == 5)
-        _len = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_len, 4)
         obj.dl_addr = list(reader.read('!6B'))
@@ -645,6 +642,7 @@ class set_dl_dst(action):
 action.subtypes[5] = set_dl_dst
 
 class set_dl_src(action):
+    __slots__ = ["dl_addr"]
     type = 4
 
     def __init__(self, dl_addr=None):
@@ -654,22 +652,23 @@ class set_dl_src(action):
             self.dl_addr = [0,0,0,0,0,0]
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!H", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for len at index 1
-        packed.append(struct.pack("!6B", *self.dl_addr))
-        packed.append('\x00' * 6)
-        length = sum([len(x) for x in packed])
-        packed[1] = struct.pack("!H", length)
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_HH, buf, offset, self.type, 0)
+        offset = loxi.generic_util.pack_struct_into(_struct_6B, buf, offset, *self.dl_addr)
+        offset = loxi.generic_util.pack_struct_into(_struct_6x, buf, offset, )
+        length = offset - start
+        _struct_H.pack_into(buf, start + 2, length)
+        return offset
+
+    def wire_length(self):
+        return 16
 
     @staticmethod
     def unpack(reader):
         obj = set_dl_src()
-        _type = reader.read("!H")[0]
+        _type, _len = reader.read_struct(_struct_HH)
         assert(_type == 4)
-        _len = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_len, 4)
         obj.dl_addr = list(reader.read('!6B'))
@@ -694,6 +693,7 @@ class set_dl_src(action):
 action.subtypes[4] = set_dl_src
 
 class set_nw_dst(action):
+    __slots__ = ["nw_addr"]
     type = 7
 
     def __init__(self, nw_addr=None):
@@ -703,21 +703,21 @@ class set_nw_dst(action):
             self.nw_addr = 0
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!H", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for len at index 1
-        packed.append(struct.pack("!L", self.nw_addr))
-        length = sum([len(x) for x in packed])
-        packed[1] = struct.pack("!H", length)
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_HHL, buf, offset, self.type, 0, self.nw_addr)
+        length = offset - start
+        _struct_H.pack_into(buf, start + 2, length)
+        return offset
+
+    def wire_length(self):
+        return 8
 
     @staticmethod
     def unpack(reader):
         obj = set_nw_dst()
-        _type = reader.read("!H")[0]
+        _type, _len = reader.read_struct(_struct_HH)
         assert(_type == 7)
-        _len = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_len, 4)
         obj.nw_addr = reader.read("!L")[0]
@@ -741,6 +741,7 @@ class set_nw_dst(action):
 action.subtypes[7] = set_nw_dst
 
 class set_nw_src(action):
+    __slots__ = ["nw_addr"]
     type = 6
 
     def __init__(self, nw_addr=None):
@@ -750,21 +751,21 @@ class set_nw_src(action):
             self.nw_addr = 0
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!H", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for len at index 1
-        packed.append(struct.pack("!L", self.nw_addr))
-        length = sum([len(x) for x in packed])
-        packed[1] = struct.pack("!H", length)
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_HHL, buf, offset, self.type, 0, self.nw_addr)
+        length = offset - start
+        _struct_H.pack_into(buf, start + 2, length)
+        return offset
+
+    def wire_length(self):
+        return 8
 
     @staticmethod
     def unpack(reader):
         obj = set_nw_src()
-        _type = reader.read("!H")[0]
+        _type, _len = reader.read_struct(_struct_HH)
         assert(_type == 6)
-        _len = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_len, 4)
         obj.nw_addr = reader.read("!L")[0]
@@ -788,6 +789,7 @@ class set_nw_src(action):
 action.subtypes[6] = set_nw_src
 
 class set_nw_tos(action):
+    __slots__ = ["nw_tos"]
     type = 8
 
     def __init__(self, nw_tos=None):
@@ -797,22 +799,21 @@ class set_nw_tos(action):
             self.nw_tos = 0
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!H", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for len at index 1
-        packed.append(struct.pack("!B", self.nw_tos))
-        packed.append('\x00' * 3)
-        length = sum([len(x) for x in packed])
-        packed[1] = struct.pack("!H", length)
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_HHB3x, buf, offset, self.type, 0, self.nw_tos)
+        length = offset - start
+        _struct_H.pack_into(buf, start + 2, length)
+        return offset
+
+    def wire_length(self):
+        return 8
 
     @staticmethod
     def unpack(reader):
         obj = set_nw_tos()
-        _type = reader.read("!H")[0]
+        _type, _len = reader.read_struct(_struct_HH)
         assert(_type == 8)
-        _len = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_len, 4)
         obj.nw_tos = reader.read("!B")[0]
@@ -837,6 +838,7 @@ class set_nw_tos(action):
 action.subtypes[8] = set_nw_tos
 
 class set_tp_dst(action):
+    __slots__ = ["tp_port"]
     type = 10
 
     def __init__(self, tp_port=None):
@@ -846,22 +848,21 @@ class set_tp_dst(action):
             self.tp_port = 0
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!H", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for len at index 1
-        packed.append(struct.pack("!H", self.tp_port))
-        packed.append('\x00' * 2)
-        length = sum([len(x) for x in packed])
-        packed[1] = struct.pack("!H", length)
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_HHH2x, buf, offset, self.type, 0, self.tp_port)
+        length = offset - start
+        _struct_H.pack_into(buf, start + 2, length)
+        return offset
+
+    def wire_length(self):
+        return 8
 
     @staticmethod
     def unpack(reader):
         obj = set_tp_dst()
-        _type = reader.read("!H")[0]
+        _type, _len = reader.read_struct(_struct_HH)
         assert(_type == 10)
-        _len = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_len, 4)
         obj.tp_port = reader.read("!H")[0]
@@ -886,6 +887,7 @@ class set_tp_dst(action):
 action.subtypes[10] = set_tp_dst
 
 class set_tp_src(action):
+    __slots__ = ["tp_port"]
     type = 9
 
     def __init__(self, tp_port=None):
@@ -895,22 +897,21 @@ class set_tp_src(action):
             self.tp_port = 0
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!H", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for len at index 1
-        packed.append(struct.pack("!H", self.tp_port))
-        packed.append('\x00' * 2)
-        length = sum([len(x) for x in packed])
-        packed[1] = struct.pack("!H", length)
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_HHH2x, buf, offset, self.type, 0, self.tp_port)
+        length = offset - start
+        _struct_H.pack_into(buf, start + 2, length)
+        return offset
+
+    def wire_length(self):
+        return 8
 
     @staticmethod
     def unpack(reader):
         obj = set_tp_src()
-        _type = reader.read("!H")[0]
+        _type, _len = reader.read_struct(_struct_HH)
         assert(_type == 9)
-        _len = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_len, 4)
         obj.tp_port = reader.read("!H")[0]
@@ -935,6 +936,7 @@ class set_tp_src(action):
 action.subtypes[9] = set_tp_src
 
 class set_vlan_pcp(action):
+    __slots__ = ["vlan_pcp"]
     type = 2
 
     def __init__(self, vlan_pcp=None):
@@ -944,22 +946,21 @@ class set_vlan_pcp(action):
             self.vlan_pcp = 0
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!H", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for len at index 1
-        packed.append(struct.pack("!B", self.vlan_pcp))
-        packed.append('\x00' * 3)
-        length = sum([len(x) for x in packed])
-        packed[1] = struct.pack("!H", length)
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_HHB3x, buf, offset, self.type, 0, self.vlan_pcp)
+        length = offset - start
+        _struct_H.pack_into(buf, start + 2, length)
+        return offset
+
+    def wire_length(self):
+        return 8
 
     @staticmethod
     def unpack(reader):
         obj = set_vlan_pcp()
-        _type = reader.read("!H")[0]
+        _type, _len = reader.read_struct(_struct_HH)
         assert(_type == 2)
-        _len = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_len, 4)
         obj.vlan_pcp = reader.read("!B")[0]
@@ -984,6 +985,7 @@ class set_vlan_pcp(action):
 action.subtypes[2] = set_vlan_pcp
 
 class set_vlan_vid(action):
+    __slots__ = ["vlan_vid"]
     type = 1
 
     def __init__(self, vlan_vid=None):
@@ -993,22 +995,21 @@ class set_vlan_vid(action):
             self.vlan_vid = 0
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!H", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for len at index 1
-        packed.append(struct.pack("!H", self.vlan_vid))
-        packed.append('\x00' * 2)
-        length = sum([len(x) for x in packed])
-        packed[1] = struct.pack("!H", length)
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_HHH2x, buf, offset, self.type, 0, self.vlan_vid)
+        length = offset - start
+        _struct_H.pack_into(buf, start + 2, length)
+        return offset
+
+    def wire_length(self):
+        return 8
 
     @staticmethod
     def unpack(reader):
         obj = set_vlan_vid()
-        _type = reader.read("!H")[0]
+        _type, _len = reader.read_struct(_struct_HH)
         assert(_type == 1)
-        _len = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_len, 4)
         obj.vlan_vid = reader.read("!H")[0]
@@ -1033,26 +1034,27 @@ class set_vlan_vid(action):
 action.subtypes[1] = set_vlan_vid
 
 class strip_vlan(action):
+    __slots__ = []
     type = 3
 
     def __init__(self):
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!H", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for len at index 1
-        packed.append('\x00' * 4)
-        length = sum([len(x) for x in packed])
-        packed[1] = struct.pack("!H", length)
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_HH4x, buf, offset, self.type, 0)
+        length = offset - start
+        _struct_H.pack_into(buf, start + 2, length)
+        return offset
+
+    def wire_length(self):
+        return 8
 
     @staticmethod
     def unpack(reader):
         obj = strip_vlan()
-        _type = reader.read("!H")[0]
+        _type, _len = reader.read_struct(_struct_HH)
         assert(_type == 3)
-        _len = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_len, 4)
         reader.skip(4)
@@ -14,7 +14,31 @@ import loxi.generic_util
 import sys
 ofp = sys.modules['loxi.of10']
 
+# Precompiled layouts for the fixed-length parts of each pack_into() and unpack()
+_struct_16sLL = struct.Struct("!16sLL")
+_struct_16sLLLLLL = struct.Struct("!16sLLLLLL")
+_struct_2x16sLL = struct.Struct("!2x16sLL")
+_struct_6B = struct.Struct("!6B")
+_struct_B3x32sLLLQQ = struct.Struct("!B3x32sLLLQQ")
+_struct_H = struct.Struct("!H")
+_struct_H2xLQQQ = struct.Struct("!H2xLQQQ")
+_struct_H6xQQQQQQQQQQQQ = struct.Struct("!H6xQQQQQQQQQQQQ")
+_struct_HBx = struct.Struct("!HBx")
+_struct_HBxHBB2xLLHH = struct.Struct("!HBxHBB2xLLHH")
+_struct_HH = struct.Struct("!HH")
+_struct_HH4x = struct.Struct("!HH4x")
+_struct_HH4xH6x = struct.Struct("!HH4xH6x")
+_struct_HHLHH = struct.Struct("!HHLHH")
+_struct_HHLHHHH16s = struct.Struct("!HHLHHHH16s")
+_struct_LH = struct.Struct("!LH")
+_struct_LH2x = struct.Struct("!LH2x")
+_struct_LHH = struct.Struct("!LHH")
+_struct_LHHHH16s = struct.Struct("!LHHHH16s")
+_struct_LLBB2xLL16s = struct.Struct("!LLBB2xLL16s")
+_struct_LLHHH6xQQQ = struct.Struct("!LLHHH6xQQQ")
+
 class bsn_interface(loxi.OFObject):
+    __slots__ = ["hw_addr", "ipv4_addr", "ipv4_netmask", "name"]
 
     def __init__(self, hw_addr=None, name=None, ipv4_addr=None, ipv4_netmask=None):
         if hw_addr != None:
@@ -35,23 +59,22 @@ class bsn_interface(loxi.OFObject):
             self.ipv4_netmask = 0
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!6B", *self.hw_addr))
-        packed.append('\x00' * 2)
-        packed.append(struct.pack("!16s", self.name))
-        packed.append(struct.pack("!L", self.ipv4_addr))
-        packed.append(struct.pack("!L", self.ipv4_netmask))
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_6B, buf, offset, *self.hw_addr)
+        offset = loxi.generic_util.pack_struct_into(_struct_2x16sLL, buf, offset, self.name, self.ipv4_addr, self.ipv4_netmask)
+        return offset
+
+    def wire_length(self):
+        return 32
 
     @staticmethod
     def unpack(reader):
         obj = bsn_interface()
         obj.hw_addr = list(reader.read('!6B'))
         reader.skip(2)
-        obj.name = reader.read("!16s")[0].rstrip("\x00")
-        obj.ipv4_addr = reader.read("!L")[0]
-        obj.ipv4_netmask = reader.read("!L")[0]
+        obj.name, obj.ipv4_addr, obj.ipv4_netmask = reader.read_struct(_struct_16sLL)
+        obj.name = obj.name.rstrip("\x00")
         return obj
 
     def __eq__(self, other):
@@ -83,6 +106,7 @@ class bsn_interface(loxi.OFObject):
 
 
 class bsn_vport(loxi.OFObject):
+    __slots__ = ["type"]
     subtypes = {}
 
 
@@ -93,13 +117,15 @@ class bsn_vport(loxi.OFObject):
             self.type = 0
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!H", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
-        length = sum([len(x) for x in packed])
-        packed[1] = struct.pack("!H", length)
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_HH, buf, offset, self.type, 0)
+        length = offset - start
+        _struct_H.pack_into(buf, start + 2, length)
+        return offset
+
+    def wire_length(self):
+        return 4
 
     @staticmethod
     def unpack(reader):
@@ -109,8 +135,7 @@ class bsn_vport(loxi.OFObject):
             return subclass.unpack(reader)
 
         obj = bsn_vport()
-        obj.type = reader.read("!H")[0]
-        _length = reader.read("!H")[0]
+        obj.type, _length = reader.read_struct(_struct_HH)
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
         return obj
@@ -130,6 +155,7 @@ class bsn_vport(loxi.OFObject):
 
 
 class bsn_vport_l2gre(bsn_vport):
+    __slots__ = ["dscp", "dst_ip", "flags", "if_name", "local_mac", "loopback_port_no", "nh_mac", "port_no", "rate_limit", "src_ip", "ttl", "vpn"]
     type = 1
 
     def __init__(self, flags=None, port_no=None, loopback_port_no=None, local_mac=None, nh_mac=None, src_ip=None, dst_ip=None, dscp=None, ttl=None, vpn=None, rate_limit=None, if_name=None):
@@ -183,48 +209,31 @@ class bsn_vport_l2gre(bsn_vport):
             self.if_name = ""
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!H", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
-        packed.append(struct.pack("!L", self.flags))
-        packed.append(util.pack_port_no(self.port_no))
-        packed.append(util.pack_port_no(self.loopback_port_no))
-        packed.append(struct.pack("!6B", *self.local_mac))
-        packed.append(struct.pack("!6B", *self.nh_mac))
-        packed.append(struct.pack("!L", self.src_ip))
-        packed.append(struct.pack("!L", self.dst_ip))
-        packed.append(struct.pack("!B", self.dscp))
-        packed.append(struct.pack("!B", self.ttl))
-        packed.append('\x00' * 2)
-        packed.append(struct.pack("!L", self.vpn))
-        packed.append(struct.pack("!L", self.rate_limit))
-        packed.append(struct.pack("!16s", self.if_name))
-        length = sum([len(x) for x in packed])
-        packed[1] = struct.pack("!H", length)
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_HHLHH, buf, offset, self.type, 0, self.flags, self.port_no, self.loopback_port_no)
+        offset = loxi.generic_util.pack_struct_into(_struct_6B, buf, offset, *self.local_mac)
+        offset = loxi.generic_util.pack_struct_into(_struct_6B, buf, offset, *self.nh_mac)
+        offset = loxi.generic_util.pack_struct_into(_struct_LLBB2xLL16s, buf, offset, self.src_ip, self.dst_ip, self.dscp, self.ttl, self.vpn, self.rate_limit, self.if_name)
+        length = offset - start
+        _struct_H.pack_into(buf, start + 2, length)
+        return offset
+
+    def wire_length(self):
+        return 60
 
     @staticmethod
     def unpack(reader):
         obj = bsn_vport_l2gre()
-        _type = reader.read("!H")[0]
+        _type, _length = reader.read_struct(_struct_HH)
         assert(_type == 1)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.flags = reader.read("!L")[0]
-        obj.port_no = util.unpack_port_no(reader)
-        obj.loopback_port_no = util.unpack_port_no(reader)
+        obj.flags, obj.port_no, obj.loopback_port_no = reader.read_struct(_struct_LHH)
         obj.local_mac = list(reader.read('!6B'))
         obj.nh_mac = list(reader.read('!6B'))
-        obj.src_ip = reader.read("!L")[0]
-        obj.dst_ip = reader.read("!L")[0]
-        obj.dscp = reader.read("!B")[0]
-        obj.ttl = reader.read("!B")[0]
-        reader.skip(2)
-        obj.vpn = reader.read("!L")[0]
-        obj.rate_limit = reader.read("!L")[0]
-        obj.if_name = reader.read("!16s")[0].rstrip("\x00")
+        obj.src_ip, obj.dst_ip, obj.dscp, obj.ttl, obj.vpn, obj.rate_limit, obj.if_name = reader.read_struct(_struct_LLBB2xLL16s)
+        obj.if_name = obj.if_name.rstrip("\x00")
         return obj
 
     def __eq__(self, other):
@@ -289,6 +298,7 @@ class bsn_vport_l2gre(bsn_vport):
 bsn_vport.subtypes[1] = bsn_vport_l2gre
 
 class bsn_vport_q_in_q(bsn_vport):
+    __slots__ = ["egress_tpid", "egress_vlan_id", "if_name", "ingress_tpid", "ingress_vlan_id", "port_no"]
     type = 0
 
     def __init__(self, port_no=None, ingress_tpid=None, ingress_vlan_id=None, egress_tpid=None, egress_vlan_id=None, if_name=None):
@@ -318,34 +328,25 @@ class bsn_vport_q_in_q(bsn_vport):
             self.if_name = ""
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!H", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
-        packed.append(struct.pack("!L", self.port_no))
-        packed.append(struct.pack("!H", self.ingress_tpid))
-        packed.append(struct.pack("!H", self.ingress_vlan_id))
-        packed.append(struct.pack("!H", self.egress_tpid))
-        packed.append(struct.pack("!H", self.egress_vlan_id))
-        packed.append(struct.pack("!16s", self.if_name))
-        length = sum([len(x) for x in packed])
-        packed[1] = struct.pack("!H", length)
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_HHLHHHH16s, buf, offset, self.type, 0, self.port_no, self.ingress_tpid, self.ingress_vlan_id, self.egress_tpid, self.egress_vlan_id, self.if_name)
+        length = offset - start
+        _struct_H.pack_into(buf, start + 2, length)
+        return offset
+
+    def wire_length(self):
+        return 32
 
     @staticmethod
     def unpack(reader):
         obj = bsn_vport_q_in_q()
-        _type = reader.read("!H")[0]
+        _type, _length = reader.read_struct(_struct_HH)
         assert(_type == 0)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.port_no = reader.read("!L")[0]
-        obj.ingress_tpid = reader.read("!H")[0]
-        obj.ingress_vlan_id = reader.read("!H")[0]
-        obj.egress_tpid = reader.read("!H")[0]
-        obj.egress_vlan_id = reader.read("!H")[0]
-        obj.if_name = reader.read("!16s")[0].rstrip("\x00")
+        obj.port_no, obj.ingress_tpid, obj.ingress_vlan_id, obj.egress_tpid, obj.egress_vlan_id, obj.if_name = reader.read_struct(_struct_LHHHH16s)
+        obj.if_name = obj.if_name.rstrip("\x00")
         return obj
 
     def __eq__(self, other):
@@ -386,6 +387,7 @@ class bsn_vport_q_in_q(bsn_vport):
 bsn_vport.subtypes[0] = bsn_vport_q_in_q
 
 class flow_stats_entry(loxi.OFObject):
+    __slots__ = ["actions", "byte_count", "cookie", "duration_nsec", "duration_sec", "hard_timeout", "idle_timeout", "match", "packet_count", "priority", "table_id"]
 
     def __init__(self, table_id=None, match=None, duration_sec=None, duration_nsec=None, priority=None, idle_timeout=None, hard_timeout=None, cookie=None, packet_count=None, byte_count=None, actions=None):
         if table_id != None:
@@ -434,25 +436,18 @@ class flow_stats_entry(loxi.OFObject):
             self.actions = []
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 0
-        packed.append(struct.pack("!B", self.table_id))
-        packed.append('\x00' * 1)
-        packed.append(self.match.pack())
-        packed.append(struct.pack("!L", self.duration_sec))
-        packed.append(struct.pack("!L", self.duration_nsec))
-        packed.append(struct.pack("!H", self.priority))
-        packed.append(struct.pack("!H", self.idle_timeout))
-        packed.append(struct.pack("!H", self.hard_timeout))
-        packed.append('\x00' * 6)
-        packed.append(struct.pack("!Q", self.cookie))
-        packed.append(struct.pack("!Q", self.packet_count))
-        packed.append(struct.pack("!Q", self.byte_count))
-        packed.append(loxi.generic_util.pack_list(self.actions))
-        length = sum([len(x) for x in packed])
-        packed[0] = struct.pack("!H", length)
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_HBx, buf, offset, 0, self.table_id)
+        offset = self.match.pack_into(buf, offset)
+        offset = loxi.generic_util.pack_struct_into(_struct_LLHHH6xQQQ, buf, offset, self.duration_sec, self.duration_nsec, self.priority, self.idle_timeout, self.hard_timeout, self.cookie, self.packet_count, self.byte_count)
+        offset = loxi.generic_util.pack_list_into(self.actions, buf, offset)
+        length = offset - start
+        _struct_H.pack_into(buf, start + 0, length)
+        return offset
+
+    def wire_length(self):
+        return 48 + self.match.wire_length() + loxi.generic_util.list_wire_length(self.actions)
 
     @staticmethod
     def unpack(reader):
@@ -463,15 +458,7 @@ class flow_stats_entry(loxi.OFObject):
         obj.table_id = reader.read("!B")[0]
         reader.skip(1)
         obj.match = ofp.match.unpack(reader)
-        obj.duration_sec = reader.read("!L")[0]
-        obj.duration_nsec = reader.read("!L")[0]
-        obj.priority = reader.read("!H")[0]
-        obj.idle_timeout = reader.read("!H")[0]
-        obj.hard_timeout = reader.read("!H")[0]
-        reader.skip(6)
-        obj.cookie = reader.read("!Q")[0]
-        obj.packet_count = reader.read("!Q")[0]
-        obj.byte_count = reader.read("!Q")[0]
+        obj.duration_sec, obj.duration_nsec, obj.priority, obj.idle_timeout, obj.hard_timeout, obj.cookie, obj.packet_count, obj.byte_count = reader.read_struct(_struct_LLHHH6xQQQ)
         obj.actions = loxi.generic_util.unpack_list(reader, ofp.action.action.unpack)
         return obj
 
@@ -532,6 +519,7 @@ class flow_stats_entry(loxi.OFObject):
 
 
 class match_v1(loxi.OFObject):
+    __slots__ = ["eth_dst", "eth_src", "eth_type", "in_port", "ip_dscp", "ip_proto", "ipv4_dst", "ipv4_src", "tcp_dst", "tcp_src", "vlan_pcp", "vlan_vid", "wildcards"]
 
     def __init__(self, wildcards=None, in_port=None, eth_src=None, eth_dst=None, vlan_vid=None, vlan_pcp=None, eth_type=None, ip_dscp=None, ip_proto=None, ipv4_src=None, ipv4_dst=None, tcp_src=None, tcp_dst=None):
         if wildcards != None:
@@ -588,43 +576,24 @@ class match_v1(loxi.OFObject):
             self.tcp_dst = 0
         return
 
-    def pack(self):
-        packed = []
-        packed.append(util.pack_wc_bmap(self.wildcards))
-        packed.append(util.pack_port_no(self.in_port))
-        packed.append(struct.pack("!6B", *self.eth_src))
-        packed.append(struct.pack("!6B", *self.eth_dst))
-        packed.append(struct.pack("!H", self.vlan_vid))
-        packed.append(struct.pack("!B", self.vlan_pcp))
-        packed.append('\x00' * 1)
-        packed.append(struct.pack("!H", self.eth_type))
-        packed.append(struct.pack("!B", self.ip_dscp))
-        packed.append(struct.pack("!B", self.ip_proto))
-        packed.append('\x00' * 2)
-        packed.append(struct.pack("!L", self.ipv4_src))
-        packed.append(struct.pack("!L", self.ipv4_dst))
-        packed.append(struct.pack("!H", self.tcp_src))
-        packed.append(struct.pack("!H", self.tcp_dst))
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_LH, buf, offset, self.wildcards, self.in_port)
+        offset = loxi.generic_util.pack_struct_into(_struct_6B, buf, offset, *self.eth_src)
+        offset = loxi.generic_util.pack_struct_into(_struct_6B, buf, offset, *self.eth_dst)
+        offset = loxi.generic_util.pack_struct_into(_struct_HBxHBB2xLLHH, buf, offset, self.vlan_vid, self.vlan_pcp, self.eth_type, self.ip_dscp, self.ip_proto, self.ipv4_src, self.ipv4_dst, self.tcp_src, self.tcp_dst)
+        return offset
+
+    def wire_length(self):
+        return 40
 
     @staticmethod
     def unpack(reader):
         obj = match_v1()
-        obj.wildcards = util.unpack_wc_bmap(reader)
-        obj.in_port = util.unpack_port_no(reader)
+        obj.wildcards, obj.in_port = reader.read_struct(_struct_LH)
         obj.eth_src = list(reader.read('!6B'))
         obj.eth_dst = list(reader.read('!6B'))
-        obj.vlan_vid = reader.read("!H")[0]
-        obj.vlan_pcp = reader.read("!B")[0]
-        reader.skip(1)
-        obj.eth_type = reader.read("!H")[0]
-        obj.ip_dscp = reader.read("!B")[0]
-        obj.ip_proto = reader.read("!B")[0]
-        reader.skip(2)
-        obj.ipv4_src = reader.read("!L")[0]
-        obj.ipv4_dst = reader.read("!L")[0]
-        obj.tcp_src = reader.read("!H")[0]
-        obj.tcp_dst = reader.read("!H")[0]
+        obj.vlan_vid, obj.vlan_pcp, obj.eth_type, obj.ip_dscp, obj.ip_proto, obj.ipv4_src, obj.ipv4_dst, obj.tcp_src, obj.tcp_dst = reader.read_struct(_struct_HBxHBB2xLLHH)
         return obj
 
     def __eq__(self, other):
@@ -692,6 +661,7 @@ class match_v1(loxi.OFObject):
 
 
 class packet_queue(loxi.OFObject):
+    __slots__ = ["properties", "queue_id"]
 
     def __init__(self, queue_id=None, properties=None):
         if queue_id != None:
@@ -704,21 +674,21 @@ class packet_queue(loxi.OFObject):
             self.properties = []
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!L", self.queue_id))
-        packed.append(struct.pack("!H", 0)) # placeholder for len at index 1
-        packed.append('\x00' * 2)
-        packed.append(loxi.generic_util.pack_list(self.properties))
-        length = sum([len(x) for x in packed])
-        packed[1] = struct.pack("!H", length)
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_LH2x, buf, offset, self.queue_id, 0)
+        offset = loxi.generic_util.pack_list_into(self.properties, buf, offset)
+        length = offset - start
+        _struct_H.pack_into(buf, start + 4, length)
+        return offset
+
+    def wire_length(self):
+        return 8 + loxi.generic_util.list_wire_length(self.properties)
 
     @staticmethod
     def unpack(reader):
         obj = packet_queue()
-        obj.queue_id = reader.read("!L")[0]
-        _len = reader.read("!H")[0]
+        obj.queue_id, _len = reader.read_struct(_struct_LH)
         orig_reader = reader
         reader = orig_reader.slice(_len, 6)
         reader.skip(2)
@@ -746,6 +716,7 @@ class packet_queue(loxi.OFObject):
 
 
 class port_desc(loxi.OFObject):
+    __slots__ = ["advertised", "config", "curr", "hw_addr", "name", "peer", "port_no", "state", "supported"]
 
     def __init__(self, port_no=None, hw_addr=None, name=None, config=None, state=None, curr=None, advertised=None, supported=None, peer=None):
         if port_no != None:
@@ -786,31 +757,23 @@ class port_desc(loxi.OFObject):
             self.peer = 0
         return
 
-    def pack(self):
-        packed = []
-        packed.append(util.pack_port_no(self.port_no))
-        packed.append(struct.pack("!6B", *self.hw_addr))
-        packed.append(struct.pack("!16s", self.name))
-        packed.append(struct.pack("!L", self.config))
-        packed.append(struct.pack("!L", self.state))
-        packed.append(struct.pack("!L", self.curr))
-        packed.append(struct.pack("!L", self.advertised))
-        packed.append(struct.pack("!L", self.supported))
-        packed.append(struct.pack("!L", self.peer))
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_H, buf, offset, self.port_no)
+        offset = loxi.generic_util.pack_struct_into(_struct_6B, buf, offset, *self.hw_addr)
+        offset = loxi.generic_util.pack_struct_into(_struct_16sLLLLLL, buf, offset, self.name, self.config, self.state, self.curr, self.advertised, self.supported, self.peer)
+        return offset
+
+    def wire_length(self):
+        return 48
 
     @staticmethod
     def unpack(reader):
         obj = port_desc()
         obj.port_no = util.unpack_port_no(reader)
         obj.hw_addr = list(reader.read('!6B'))
-        obj.name = reader.read("!16s")[0].rstrip("\x00")
-        obj.config = reader.read("!L")[0]
-        obj.state = reader.read("!L")[0]
-        obj.curr = reader.read("!L")[0]
-        obj.advertised = reader.read("!L")[0]
-        obj.supported = reader.read("!L")[0]
-        obj.peer = reader.read("!L")[0]
+        obj.name, obj.config, obj.state, obj.curr, obj.advertised, obj.supported, obj.peer = reader.read_struct(_struct_16sLLLLLL)
+        obj.name = obj.name.rstrip("\x00")
         return obj
 
     def __eq__(self, other):
@@ -862,6 +825,7 @@ class port_desc(loxi.OFObject):
 
 
 class port_stats_entry(loxi.OFObject):
+    __slots__ = ["collisions", "port_no", "rx_bytes", "rx_crc_err", "rx_dropped", "rx_errors", "rx_frame_err", "rx_over_err", "rx_packets", "tx_bytes", "tx_dropped", "tx_errors", "tx_packets"]
 
     def __init__(self, port_no=None, rx_packets=None, tx_packets=None, rx_bytes=None, tx_bytes=None, rx_dropped=None, tx_dropped=None, rx_errors=None, tx_errors=None, rx_frame_err=None, rx_over_err=None, rx_crc_err=None, collisions=None):
         if port_no != None:
@@ -918,41 +882,18 @@ class port_stats_entry(loxi.OFObject):
             self.collisions = 0
         return
 
-    def pack(self):
-        packed = []
-        packed.append(util.pack_port_no(self.port_no))
-        packed.append('\x00' * 6)
-        packed.append(struct.pack("!Q", self.rx_packets))
-        packed.append(struct.pack("!Q", self.tx_packets))
-        packed.append(struct.pack("!Q", self.rx_bytes))
-        packed.append(struct.pack("!Q", self.tx_bytes))
-        packed.append(struct.pack("!Q", self.rx_dropped))
-        packed.append(struct.pack("!Q", self.tx_dropped))
-        packed.append(struct.pack("!Q", self.rx_errors))
-        packed.append(struct.pack("!Q", self.tx_errors))
-        packed.append(struct.pack("!Q", self.rx_frame_err))
-        packed.append(struct.pack("!Q", self.rx_over_err))
-        packed.append(struct.pack("!Q", self.rx_crc_err))
-        packed.append(struct.pack("!Q", self.collisions))
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_H6xQQQQQQQQQQQQ, buf, offset, self.port_no, self.rx_packets, self.tx_packets, self.rx_bytes, self.tx_bytes, self.rx_dropped, self.tx_dropped, self.rx_errors, self.tx_errors, self.rx_frame_err, self.rx_over_err, self.rx_crc_err, self.collisions)
+        return offset
+
+    def wire_length(self):
+        return 104
 
     @staticmethod
     def unpack(reader):
         obj = port_stats_entry()
-        obj.port_no = util.unpack_port_no(reader)
-        reader.skip(6)
-        obj.rx_packets = reader.read("!Q")[0]
-        obj.tx_packets = reader.read("!Q")[0]
-        obj.rx_bytes = reader.read("!Q")[0]
-        obj.tx_bytes = reader.read("!Q")[0]
-        obj.rx_dropped = reader.read("!Q")[0]
-        obj.tx_dropped = reader.read("!Q")[0]
-        obj.rx_errors = reader.read("!Q")[0]
-        obj.tx_errors = reader.read("!Q")[0]
-        obj.rx_frame_err = reader.read("!Q")[0]
-        obj.rx_over_err = reader.read("!Q")[0]
-        obj.rx_crc_err = reader.read("!Q")[0]
-        obj.collisions = reader.read("!Q")[0]
+        obj.port_no, obj.rx_packets, obj.tx_packets, obj.rx_bytes, obj.tx_bytes, obj.rx_dropped, obj.tx_dropped, obj.rx_errors, obj.tx_errors, obj.rx_frame_err, obj.rx_over_err, obj.rx_crc_err, obj.collisions = reader.read_struct(_struct_H6xQQQQQQQQQQQQ)
         return obj
 
     def __eq__(self, other):
@@ -1020,6 +961,7 @@ class port_stats_entry(loxi.OFObject):
 
 
 class queue_prop(loxi.OFObject):
+    __slots__ = ["type"]
     subtypes = {}
 
 
@@ -1030,14 +972,15 @@ class queue_prop(loxi.OFObject):
             self.type = 0
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!H", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for len at index 1
-        packed.append('\x00' * 4)
-        length = sum([len(x) for x in packed])
-        packed[1] = struct.pack("!H", length)
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_HH4x, buf, offset, self.type, 0)
+        length = offset - start
+        _struct_H.pack_into(buf, start + 2, length)
+        return offset
+
+    def wire_length(self):
+        return 8
 
     @staticmethod
     def unpack(reader):
@@ -1047,8 +990,7 @@ class queue_prop(loxi.OFObject):
             return subclass.unpack(reader)
 
         obj = queue_prop()
-        obj.type = reader.read("!H")[0]
-        _len = reader.read("!H")[0]
+        obj.type, _len = reader.read_struct(_struct_HH)
         orig_reader = reader
         reader = orig_reader.slice(_len, 4)
         reader.skip(4)
@@ -1069,6 +1011,7 @@ class queue_prop(loxi.OFObject):
 
 
 class queue_prop_min_rate(queue_prop):
+    __slots__ = ["rate"]
     type = 1
 
     def __init__(self, rate=None):
@@ -1078,23 +1021,21 @@ class queue_prop_min_rate(queue_prop):
             self.rate = 0
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!H", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for len at index 1
-        packed.append('\x00' * 4)
-        packed.append(struct.pack("!H", self.rate))
-        packed.append('\x00' * 6)
-        length = sum([len(x) for x in packed])
-        packed[1] = struct.pack("!H", length)
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_HH4xH6x, buf, offset, self.type, 0, self.rate)
+        length = offset - start
+        _struct_H.pack_into(buf, start + 2, length)
+        return offset
+
+    def wire_length(self):
+        return 16
 
     @staticmethod
     def unpack(reader):
         obj = queue_prop_min_rate()
-        _type = reader.read("!H")[0]
+        _type, _len = reader.read_struct(_struct_HH)
         assert(_type == 1)
-        _len = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_len, 4)
         reader.skip(4)
@@ -1120,6 +1061,7 @@ class queue_prop_min_rate(queue_prop):
 queue_prop.subtypes[1] = queue_prop_min_rate
 
 class queue_stats_entry(loxi.OFObject):
+    __slots__ = ["port_no", "queue_id", "tx_bytes", "tx_errors", "tx_packets"]
 
     def __init__(self, port_no=None, queue_id=None, tx_bytes=None, tx_packets=None, tx_errors=None):
         if port_no != None:
@@ -1144,25 +1086,18 @@ class queue_stats_entry(loxi.OFObject):
             self.tx_errors = 0
         return
 
-    def pack(self):
-        packed = []
-        packed.append(util.pack_port_no(self.port_no))
-        packed.append('\x00' * 2)
-        packed.append(struct.pack("!L", self.queue_id))
-        packed.append(struct.pack("!Q", self.tx_bytes))
-        packed.append(struct.pack("!Q", self.tx_packets))
-        packed.append(struct.pack("!Q", self.tx_errors))
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_H2xLQQQ, buf, offset, self.port_no, self.queue_id, self.tx_bytes, self.tx_packets, self.tx_errors)
+        return offset
+
+    def wire_length(self):
+        return 32
 
     @staticmethod
     def unpack(reader):
         obj = queue_stats_entry()
-        obj.port_no = util.unpack_port_no(reader)
-        reader.skip(2)
-        obj.queue_id = reader.read("!L")[0]
-        obj.tx_bytes = reader.read("!Q")[0]
-        obj.tx_packets = reader.read("!Q")[0]
-        obj.tx_errors = reader.read("!Q")[0]
+        obj.port_no, obj.queue_id, obj.tx_bytes, obj.tx_packets, obj.tx_errors = reader.read_struct(_struct_H2xLQQQ)
         return obj
 
     def __eq__(self, other):
@@ -1198,6 +1133,7 @@ class queue_stats_entry(loxi.OFObject):
 
 
 class table_stats_entry(loxi.OFObject):
+    __slots__ = ["active_count", "lookup_count", "matched_count", "max_entries", "name", "table_id", "wildcards"]
 
     def __init__(self, table_id=None, name=None, wildcards=None, max_entries=None, active_count=None, lookup_count=None, matched_count=None):
         if table_id != None:
@@ -1230,29 +1166,19 @@ class table_stats_entry(loxi.OFObject):
             self.matched_count = 0
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!B", self.table_id))
-        packed.append('\x00' * 3)
-        packed.append(struct.pack("!32s", self.name))
-        packed.append(util.pack_wc_bmap(self.wildcards))
-        packed.append(struct.pack("!L", self.max_entries))
-        packed.append(struct.pack("!L", self.active_count))
-        packed.append(struct.pack("!Q", self.lookup_count))
-        packed.append(struct.pack("!Q", self.matched_count))
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_B3x32sLLLQQ, buf, offset, self.table_id, self.name, self.wildcards, self.max_entries, self.active_count, self.lookup_count, self.matched_count)
+        return offset
+
+    def wire_length(self):
+        return 64
 
     @staticmethod
     def unpack(reader):
         obj = table_stats_entry()
-        obj.table_id = reader.read("!B")[0]
-        reader.skip(3)
-        obj.name = reader.read("!32s")[0].rstrip("\x00")
-        obj.wildcards = util.unpack_wc_bmap(reader)
-        obj.max_entries = reader.read("!L")[0]
-        obj.active_count = reader.read("!L")[0]
-        obj.lookup_count = reader.read("!Q")[0]
-        obj.matched_count = reader.read("!Q")[0]
+        obj.table_id, obj.name, obj.wildcards, obj.max_entries, obj.active_count, obj.lookup_count, obj.matched_count = reader.read_struct(_struct_B3x32sLLLQQ)
+        obj.name = obj.name.rstrip("\x00")
         return obj
 
     def __eq__(self, other):
@@ -14,7 +14,76 @@ import loxi.generic_util
 import sys
 ofp = sys.modules['loxi.of10']
 
+# Precompiled layouts for the fixed-length parts of each pack_into() and unpack()
+_struct_6B = struct.Struct("!6B")
+_struct_B = struct.Struct("!B")
+_struct_BBH = struct.Struct("!BBH")
+_struct_BBHL = struct.Struct("!BBHL")
+_struct_BBHLB3xL = struct.Struct("!BBHLB3xL")
+_struct_BBHLB7x = struct.Struct("!BBHLB7x")
+_struct_BBHLH = struct.Struct("!BBHLH")
+_struct_BBHLH2x = struct.Struct("!BBHLH2x")
+_struct_BBHLH6x = struct.Struct("!BBHLH6x")
+_struct_BBHLHH = struct.Struct("!BBHLHH")
+_struct_BBHLHH256s256s256s32s256s = struct.Struct("!BBHLHH256s256s256s32s256s")
+_struct_BBHLHH4xLL = struct.Struct("!BBHLHH4xLL")
+_struct_BBHLHHH2xL = struct.Struct("!BBHLHHH2xL")
+_struct_BBHLHHH6x = struct.Struct("!BBHLHHH6x")
+_struct_BBHLHHL = struct.Struct("!BBHLHHL")
+_struct_BBHLHHQQL4x = struct.Struct("!BBHLHHQQL4x")
+_struct_BBHLL = struct.Struct("!BBHLL")
+_struct_BBHLLHH = struct.Struct("!BBHLLHH")
+_struct_BBHLLHHBx = struct.Struct("!BBHLLHHBx")
+_struct_BBHLLL = struct.Struct("!BBHLLL")
+_struct_BBHLLLB3x = struct.Struct("!BBHLLLB3x")
+_struct_BBHLLLB3xL = struct.Struct("!BBHLLLB3xL")
+_struct_BBHLLLB7x = struct.Struct("!BBHLLLB7x")
+_struct_BBHLLLBxH4x = struct.Struct("!BBHLLLBxH4x")
+_struct_BBHLLLBxHHHQ = struct.Struct("!BBHLLLBxHHHQ")
+_struct_BBHLLLBxHL = struct.Struct("!BBHLLLBxHL")
+_struct_BBHLLLHB = struct.Struct("!BBHLLLHB")
+_struct_BBHLLLL = struct.Struct("!BBHLLLL")
+_struct_BBHLLLLHB = struct.Struct("!BBHLLLLHB")
+_struct_BBHLLLLHB3x = struct.Struct("!BBHLLLLHB3x")
+_struct_BBHLLLLL = struct.Struct("!BBHLLLLL")
+_struct_BBHLQLB3xLL = struct.Struct("!BBHLQLB3xLL")
+_struct_BxH = struct.Struct("!BxH")
+_struct_H = struct.Struct("!H")
+_struct_L = struct.Struct("!L")
+_struct_LB3xL = struct.Struct("!LB3xL")
+_struct_LB7x = struct.Struct("!LB7x")
+_struct_LH = struct.Struct("!LH")
+_struct_LH2x = struct.Struct("!LH2x")
+_struct_LH6x = struct.Struct("!LH6x")
+_struct_LHH = struct.Struct("!LHH")
+_struct_LHH256s256s256s32s256s = struct.Struct("!LHH256s256s256s32s256s")
+_struct_LHH4xLL = struct.Struct("!LHH4xLL")
+_struct_LHHH2xL = struct.Struct("!LHHH2xL")
+_struct_LHHH6x = struct.Struct("!LHHH6x")
+_struct_LHHL = struct.Struct("!LHHL")
+_struct_LHHQQL4x = struct.Struct("!LHHQQL4x")
+_struct_LL = struct.Struct("!LL")
+_struct_LLHH = struct.Struct("!LLHH")
+_struct_LLHHBx = struct.Struct("!LLHHBx")
+_struct_LLL = struct.Struct("!LLL")
+_struct_LLL4x = struct.Struct("!LLL4x")
+_struct_LLLB3x = struct.Struct("!LLLB3x")
+_struct_LLLB3xL = struct.Struct("!LLLB3xL")
+_struct_LLLB7x = struct.Struct("!LLLB7x")
+_struct_LLLBxH4x = struct.Struct("!LLLBxH4x")
+_struct_LLLBxHHHQ = struct.Struct("!LLLBxHHHQ")
+_struct_LLLBxHL = struct.Struct("!LLLBxHL")
+_struct_LLLHB = struct.Struct("!LLLHB")
+_struct_LLLL = struct.Struct("!LLLL")
+_struct_LLLLHB = struct.Struct("!LLLLHB")
+_struct_LLLLHB3x = struct.Struct("!LLLLHB3x")
+_struct_LLLLL = struct.Struct("!LLLLL")
+_struct_LQLB3xLL = struct.Struct("!LQLB3xLL")
+_struct_QHBxLLH2xQQ = struct.Struct("!QHBxLLH2xQQ")
+_struct_QHHHHLHH = struct.Struct("!QHHHHLHH")
+
 class message(loxi.OFObject):
+    __slots__ = ["type", "xid"]
     subtypes = {}
 
     version = 1
@@ -30,15 +99,15 @@ class message(loxi.OFObject):
             self.xid = None
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_BBHL, buf, offset, self.version, self.type, 0, self.xid)
+        length = offset - start
+        _struct_H.pack_into(buf, start + 2, length)
+        return offset
+
+    def wire_length(self):
+        return 8
 
     @staticmethod
     def unpack(reader):
@@ -48,10 +117,8 @@ class message(loxi.OFObject):
             return subclass.unpack(reader)
 
         obj = message()
-        _version = reader.read("!B")[0]
+        _version, obj.type, _length = reader.read_struct(_struct_BBH)
         assert(_version == 1)
-        obj.type = reader.read("!B")[0]
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
         obj.xid = reader.read("!L")[0]
@@ -78,6 +145,7 @@ class message(loxi.OFObject):
 
 
 class stats_reply(message):
+    __slots__ = ["flags", "stats_type"]
     subtypes = {}
 
     version = 1
@@ -98,17 +166,15 @@ class stats_reply(message):
             self.flags = 0
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!H", self.stats_type))
-        packed.append(struct.pack("!H", self.flags))
-        length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_BBHLHH, buf, offset, self.version, self.type, 0, self.xid, self.stats_type, self.flags)
+        length = offset - start
+        _struct_H.pack_into(buf, start + 2, length)
+        return offset
+
+    def wire_length(self):
+        return 12
 
     @staticmethod
     def unpack(reader):
@@ -118,16 +184,12 @@ class stats_reply(message):
             return subclass.unpack(reader)
 
         obj = stats_reply()
-        _version = reader.read("!B")[0]
+        _version, _type, _length = reader.read_struct(_struct_BBH)
         assert(_version == 1)
-        _type = reader.read("!B")[0]
         assert(_type == 17)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        obj.stats_type = reader.read("!H")[0]
-        obj.flags = reader.read("!H")[0]
+        obj.xid, obj.stats_type, obj.flags = reader.read_struct(_struct_LHH)
         return obj
 
     def __eq__(self, other):
@@ -156,6 +218,7 @@ class stats_reply(message):
 message.subtypes[17] = stats_reply
 
 class aggregate_stats_reply(stats_reply):
+    __slots__ = ["byte_count", "flow_count", "packet_count"]
     version = 1
     type = 17
     stats_type = 2
@@ -183,40 +246,26 @@ class aggregate_stats_reply(stats_reply):
             self.flow_count = 0
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!H", self.stats_type))
-        packed.append(struct.pack("!H", self.flags))
-        packed.append(struct.pack("!Q", self.packet_count))
-        packed.append(struct.pack("!Q", self.byte_count))
-        packed.append(struct.pack("!L", self.flow_count))
-        packed.append('\x00' * 4)
-        length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_BBHLHHQQL4x, buf, offset, self.version, self.type, 0, self.xid, self.stats_type, self.flags, self.packet_count, self.byte_count, self.flow_count)
+        length = offset - start
+        _struct_H.pack_into(buf, start + 2, length)
+        return offset
+
+    def wire_length(self):
+        return 36
 
     @staticmethod
     def unpack(reader):
         obj = aggregate_stats_reply()
-        _version = reader.read("!B")[0]
+        _version, _type, _length = reader.read_struct(_struct_BBH)
         assert(_version == 1)
-        _type = reader.read("!B")[0]
         assert(_type == 17)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        _stats_type = reader.read("!H")[0]
+        obj.xid, _stats_type, obj.flags, obj.packet_count, obj.byte_count, obj.flow_count = reader.read_struct(_struct_LHHQQL4x)
         assert(_stats_type == 2)
-        obj.flags = reader.read("!H")[0]
-        obj.packet_count = reader.read("!Q")[0]
-        obj.byte_count = reader.read("!Q")[0]
-        obj.flow_count = reader.read("!L")[0]
-        reader.skip(4)
         return obj
 
     def __eq__(self, other):
@@ -256,6 +305,7 @@ class aggregate_stats_reply(stats_reply):
 stats_reply.subtypes[2] = aggregate_stats_reply
 
 class stats_request(message):
+    __slots__ = ["flags", "stats_type"]
     subtypes = {}
 
     version = 1
@@ -276,17 +326,15 @@ class stats_request(message):
             self.flags = 0
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!H", self.stats_type))
-        packed.append(struct.pack("!H", self.flags))
-        length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_BBHLHH, buf, offset, self.version, self.type, 0, self.xid, self.stats_type, self.flags)
+        length = offset - start
+        _struct_H.pack_into(buf, start + 2, length)
+        return offset
+
+    def wire_length(self):
+        return 12
 
     @staticmethod
     def unpack(reader):
@@ -296,16 +344,12 @@ class stats_request(message):
             return subclass.unpack(reader)
 
         obj = stats_request()
-        _version = reader.read("!B")[0]
+        _version, _type, _length = reader.read_struct(_struct_BBH)
         assert(_version == 1)
-        _type = reader.read("!B")[0]
         assert(_type == 16)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        obj.stats_type = reader.read("!H")[0]
-        obj.flags = reader.read("!H")[0]
+        obj.xid, obj.stats_type, obj.flags = reader.read_struct(_struct_LHH)
         return obj
 
     def __eq__(self, other):
@@ -334,6 +378,7 @@ class stats_request(message):
 message.subtypes[16] = stats_request
 
 class aggregate_stats_request(stats_request):
+    __slots__ = ["match", "out_port", "table_id"]
     version = 1
     type = 16
     stats_type = 2
@@ -361,40 +406,30 @@ class aggregate_stats_request(stats_request):
             self.out_port = 0
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!H", self.stats_type))
-        packed.append(struct.pack("!H", self.flags))
-        packed.append(self.match.pack())
-        packed.append(struct.pack("!B", self.table_id))
-        packed.append('\x00' * 1)
-        packed.append(util.pack_port_no(self.out_port))
-        length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_BBHLHH, buf, offset, self.version, self.type, 0, self.xid, self.stats_type, self.flags)
+        offset = self.match.pack_into(buf, offset)
+        offset = loxi.generic_util.pack_struct_into(_struct_BxH, buf, offset, self.table_id, self.out_port)
+        length = offset - start
+        _struct_H.pack_into(buf, start + 2, length)
+        return offset
+
+    def wire_length(self):
+        return 16 + self.match.wire_length()
 
     @staticmethod
     def unpack(reader):
         obj = aggregate_stats_request()
-        _version = reader.read("!B")[0]
+        _version, _type, _length = reader.read_struct(_struct_BBH)
         assert(_version == 1)
-        _type = reader.read("!B")[0]
         assert(_type == 16)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        _stats_type = reader.read("!H")[0]
+        obj.xid, _stats_type, obj.flags = reader.read_struct(_struct_LHH)
         assert(_stats_type == 2)
-        obj.flags = reader.read("!H")[0]
         obj.match = ofp.match.unpack(reader)
-        obj.table_id = reader.read("!B")[0]
-        reader.skip(1)
-        obj.out_port = util.unpack_port_no(reader)
+        obj.table_id, obj.out_port = reader.read_struct(_struct_BxH)
         return obj
 
     def __eq__(self, other):
@@ -434,6 +469,7 @@ class aggregate_stats_request(stats_request):
 stats_request.subtypes[2] = aggregate_stats_request
 
 class error_msg(message):
+    __slots__ = ["err_type"]
     subtypes = {}
 
     version = 1
@@ -450,16 +486,15 @@ class error_msg(message):
             self.err_type = 0
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!H", self.err_type))
-        length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_BBHLH, buf, offset, self.version, self.type, 0, self.xid, self.err_type)
+        length = offset - start
+        _struct_H.pack_into(buf, start + 2, length)
+        return offset
+
+    def wire_length(self):
+        return 10
 
     @staticmethod
     def unpack(reader):
@@ -469,15 +504,12 @@ class error_msg(message):
             return subclass.unpack(reader)
 
         obj = error_msg()
-        _version = reader.read("!B")[0]
+        _version, _type, _length = reader.read_struct(_struct_BBH)
         assert(_version == 1)
-        _type = reader.read("!B")[0]
         assert(_type == 1)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        obj.err_type = reader.read("!H")[0]
+        obj.xid, obj.err_type = reader.read_struct(_struct_LH)
         return obj
 
     def __eq__(self, other):
@@ -502,6 +534,7 @@ class error_msg(message):
 message.subtypes[1] = error_msg
 
 class bad_action_error_msg(error_msg):
+    __slots__ = ["code", "data"]
     version = 1
     type = 1
     err_type = 2
@@ -521,34 +554,28 @@ class bad_action_error_msg(error_msg):
             self.data = ''
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!H", self.err_type))
-        packed.append(struct.pack("!H", self.code))
-        packed.append(self.data)
-        length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_BBHLHH, buf, offset, self.version, self.type, 0, self.xid, self.err_type, self.code)
+        offset = loxi.generic_util.pack_bytes_into(self.data, buf, offset)
+        length = offset - start
+        _struct_H.pack_into(buf, start + 2, length)
+        return offset
+
+    def wire_length(self):
+        return 12 + len(self.data)
 
     @staticmethod
     def unpack(reader):
         obj = bad_action_error_msg()
-        _version = reader.read("!B")[0]
+        _version, _type, _length = reader.read_struct(_struct_BBH)
         assert(_version == 1)
-        _type = reader.read("!B")[0]
         assert(_type == 1)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        _err_type = reader.read("!H")[0]
+        obj.xid, _err_type, obj.code = reader.read_struct(_struct_LHH)
         assert(_err_type == 2)
-        obj.code = reader.read("!H")[0]
-        obj.data = str(reader.read_all())
+        obj.data = reader.read_all()
         return obj
 
     def __eq__(self, other):
@@ -580,6 +607,7 @@ class bad_action_error_msg(error_msg):
 error_msg.subtypes[2] = bad_action_error_msg
 
 class bad_request_error_msg(error_msg):
+    __slots__ = ["code", "data"]
     version = 1
     type = 1
     err_type = 1
@@ -599,34 +627,28 @@ class bad_request_error_msg(error_msg):
             self.data = ''
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!H", self.err_type))
-        packed.append(struct.pack("!H", self.code))
-        packed.append(self.data)
-        length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_BBHLHH, buf, offset, self.version, self.type, 0, self.xid, self.err_type, self.code)
+        offset = loxi.generic_util.pack_bytes_into(self.data, buf, offset)
+        length = offset - start
+        _struct_H.pack_into(buf, start + 2, length)
+        return offset
+
+    def wire_length(self):
+        return 12 + len(self.data)
 
     @staticmethod
     def unpack(reader):
         obj = bad_request_error_msg()
-        _version = reader.read("!B")[0]
+        _version, _type, _length = reader.read_struct(_struct_BBH)
         assert(_version == 1)
-        _type = reader.read("!B")[0]
         assert(_type == 1)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        _err_type = reader.read("!H")[0]
+        obj.xid, _err_type, obj.code = reader.read_struct(_struct_LHH)
         assert(_err_type == 1)
-        obj.code = reader.read("!H")[0]
-        obj.data = str(reader.read_all())
+        obj.data = reader.read_all()
         return obj
 
     def __eq__(self, other):
@@ -658,6 +680,7 @@ class bad_request_error_msg(error_msg):
 error_msg.subtypes[1] = bad_request_error_msg
 
 class barrier_reply(message):
+    __slots__ = []
     version = 1
     type = 19
 
@@ -668,24 +691,22 @@ class barrier_reply(message):
             self.xid = None
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_BBHL, buf, offset, self.version, self.type, 0, self.xid)
+        length = offset - start
+        _struct_H.pack_into(buf, start + 2, length)
+        return offset
+
+    def wire_length(self):
+        return 8
 
     @staticmethod
     def unpack(reader):
         obj = barrier_reply()
-        _version = reader.read("!B")[0]
+        _version, _type, _length = reader.read_struct(_struct_BBH)
         assert(_version == 1)
-        _type = reader.read("!B")[0]
         assert(_type == 19)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
         obj.xid = reader.read("!L")[0]
@@ -712,6 +733,7 @@ class barrier_reply(message):
 message.subtypes[19] = barrier_reply
 
 class barrier_request(message):
+    __slots__ = []
     version = 1
     type = 18
 
@@ -722,24 +744,22 @@ class barrier_request(message):
             self.xid = None
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_BBHL, buf, offset, self.version, self.type, 0, self.xid)
+        length = offset - start
+        _struct_H.pack_into(buf, start + 2, length)
+        return offset
+
+    def wire_length(self):
+        return 8
 
     @staticmethod
     def unpack(reader):
         obj = barrier_request()
-        _version = reader.read("!B")[0]
+        _version, _type, _length = reader.read_struct(_struct_BBH)
         assert(_version == 1)
-        _type = reader.read("!B")[0]
         assert(_type == 18)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
         obj.xid = reader.read("!L")[0]
@@ -766,6 +786,7 @@ class barrier_request(message):
 message.subtypes[18] = barrier_request
 
 class experimenter(message):
+    __slots__ = ["data", "experimenter"]
     subtypes = {}
 
     version = 1
@@ -786,17 +807,16 @@ class experimenter(message):
             self.data = ''
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!L", self.experimenter))
-        packed.append(self.data)
-        length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_BBHLL, buf, offset, self.version, self.type, 0, self.xid, self.experimenter)
+        offset = loxi.generic_util.pack_bytes_into(self.data, buf, offset)
+        length = offset - start
+        _struct_H.pack_into(buf, start + 2, length)
+        return offset
+
+    def wire_length(self):
+        return 12 + len(self.data)
 
     @staticmethod
     def unpack(reader):
@@ -806,16 +826,13 @@ class experimenter(message):
             return subclass.unpack(reader)
 
         obj = experimenter()
-        _version = reader.read("!B")[0]
+        _version, _type, _length = reader.read_struct(_struct_BBH)
         assert(_version == 1)
-        _type = reader.read("!B")[0]
         assert(_type == 4)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        obj.experimenter = reader.read("!L")[0]
-        obj.data = str(reader.read_all())
+        obj.xid, obj.experimenter = reader.read_struct(_struct_LL)
+        obj.data = reader.read_all()
         return obj
 
     def __eq__(self, other):
@@ -844,6 +861,7 @@ class experimenter(message):
 message.subtypes[4] = experimenter
 
 class bsn_header(experimenter):
+    __slots__ = ["subtype"]
     subtypes = {}
 
     version = 1
@@ -861,17 +879,15 @@ class bsn_header(experimenter):
             self.subtype = 0
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!L", self.experimenter))
-        packed.append(struct.pack("!L", self.subtype))
-        length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_BBHLLL, buf, offset, self.version, self.type, 0, self.xid, self.experimenter, self.subtype)
+        length = offset - start
+        _struct_H.pack_into(buf, start + 2, length)
+        return offset
+
+    def wire_length(self):
+        return 16
 
     @staticmethod
     def unpack(reader):
@@ -881,17 +897,13 @@ class bsn_header(experimenter):
             return subclass.unpack(reader)
 
         obj = bsn_header()
-        _version = reader.read("!B")[0]
+        _version, _type, _length = reader.read_struct(_struct_BBH)
         assert(_version == 1)
-        _type = reader.read("!B")[0]
         assert(_type == 4)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        _experimenter = reader.read("!L")[0]
+        obj.xid, _experimenter, obj.subtype = reader.read_struct(_struct_LLL)
         assert(_experimenter == 6035143)
-        obj.subtype = reader.read("!L")[0]
         return obj
 
     def __eq__(self, other):
@@ -916,6 +928,7 @@ class bsn_header(experimenter):
 experimenter.subtypes[6035143] = bsn_header
 
 class bsn_bw_clear_data_reply(bsn_header):
+    __slots__ = ["status"]
     version = 1
     type = 4
     experimenter = 6035143
@@ -932,35 +945,27 @@ class bsn_bw_clear_data_reply(bsn_header):
             self.status = 0
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!L", self.experimenter))
-        packed.append(struct.pack("!L", self.subtype))
-        packed.append(struct.pack("!L", self.status))
-        length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_BBHLLLL, buf, offset, self.version, self.type, 0, self.xid, self.experimenter, self.subtype, self.status)
+        length = offset - start
+        _struct_H.pack_into(buf, start + 2, length)
+        return offset
+
+    def wire_length(self):
+        return 20
 
     @staticmethod
     def unpack(reader):
         obj = bsn_bw_clear_data_reply()
-        _version = reader.read("!B")[0]
+        _version, _type, _length = reader.read_struct(_struct_BBH)
         assert(_version == 1)
-        _type = reader.read("!B")[0]
         assert(_type == 4)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        _experimenter = reader.read("!L")[0]
+        obj.xid, _experimenter, _subtype, obj.status = reader.read_struct(_struct_LLLL)
         assert(_experimenter == 6035143)
-        _subtype = reader.read("!L")[0]
         assert(_subtype == 22)
-        obj.status = reader.read("!L")[0]
         return obj
 
     def __eq__(self, other):
@@ -988,6 +993,7 @@ class bsn_bw_clear_data_reply(bsn_header):
 bsn_header.subtypes[22] = bsn_bw_clear_data_reply
 
 class bsn_bw_clear_data_request(bsn_header):
+    __slots__ = []
     version = 1
     type = 4
     experimenter = 6035143
@@ -1000,32 +1006,26 @@ class bsn_bw_clear_data_request(bsn_header):
             self.xid = None
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!L", self.experimenter))
-        packed.append(struct.pack("!L", self.subtype))
-        length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_BBHLLL, buf, offset, self.version, self.type, 0, self.xid, self.experimenter, self.subtype)
+        length = offset - start
+        _struct_H.pack_into(buf, start + 2, length)
+        return offset
+
+    def wire_length(self):
+        return 16
 
     @staticmethod
     def unpack(reader):
         obj = bsn_bw_clear_data_request()
-        _version = reader.read("!B")[0]
+        _version, _type, _length = reader.read_struct(_struct_BBH)
         assert(_version == 1)
-        _type = reader.read("!B")[0]
         assert(_type == 4)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        _experimenter = reader.read("!L")[0]
+        obj.xid, _experimenter, _subtype = reader.read_struct(_struct_LLL)
         assert(_experimenter == 6035143)
-        _subtype = reader.read("!L")[0]
         assert(_subtype == 21)
         return obj
 
@@ -1050,6 +1050,7 @@ class bsn_bw_clear_data_request(bsn_header):
 bsn_header.subtypes[21] = bsn_bw_clear_data_request
 
 class bsn_bw_enable_get_reply(bsn_header):
+    __slots__ = ["enabled"]
     version = 1
     type = 4
     experimenter = 6035143
@@ -1066,35 +1067,27 @@ class bsn_bw_enable_get_reply(bsn_header):
             self.enabled = 0
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!L", self.experimenter))
-        packed.append(struct.pack("!L", self.subtype))
-        packed.append(struct.pack("!L", self.enabled))
-        length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_BBHLLLL, buf, offset, self.version, self.type, 0, self.xid, self.experimenter, self.subtype, self.enabled)
+        length = offset - start
+        _struct_H.pack_into(buf, start + 2, length)
+        return offset
+
+    def wire_length(self):
+        return 20
 
     @staticmethod
     def unpack(reader):
         obj = bsn_bw_enable_get_reply()
-        _version = reader.read("!B")[0]
+        _version, _type, _length = reader.read_struct(_struct_BBH)
         assert(_version == 1)
-        _type = reader.read("!B")[0]
         assert(_type == 4)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        _experimenter = reader.read("!L")[0]
+        obj.xid, _experimenter, _subtype, obj.enabled = reader.read_struct(_struct_LLLL)
         assert(_experimenter == 6035143)
-        _subtype = reader.read("!L")[0]
         assert(_subtype == 20)
-        obj.enabled = reader.read("!L")[0]
         return obj
 
     def __eq__(self, other):
@@ -1122,6 +1115,7 @@ class bsn_bw_enable_get_reply(bsn_header):
 bsn_header.subtypes[20] = bsn_bw_enable_get_reply
 
 class bsn_bw_enable_get_request(bsn_header):
+    __slots__ = []
     version = 1
     type = 4
     experimenter = 6035143
@@ -1134,32 +1128,26 @@ class bsn_bw_enable_get_request(bsn_header):
             self.xid = None
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!L", self.experimenter))
-        packed.append(struct.pack("!L", self.subtype))
-        length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_BBHLLL, buf, offset, self.version, self.type, 0, self.xid, self.experimenter, self.subtype)
+        length = offset - start
+        _struct_H.pack_into(buf, start + 2, length)
+        return offset
+
+    def wire_length(self):
+        return 16
 
     @staticmethod
     def unpack(reader):
         obj = bsn_bw_enable_get_request()
-        _version = reader.read("!B")[0]
+        _version, _type, _length = reader.read_struct(_struct_BBH)
         assert(_version == 1)
-        _type = reader.read("!B")[0]
         assert(_type == 4)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        _experimenter = reader.read("!L")[0]
+        obj.xid, _experimenter, _subtype = reader.read_struct(_struct_LLL)
         assert(_experimenter == 6035143)
-        _subtype = reader.read("!L")[0]
         assert(_subtype == 19)
         return obj
 
@@ -1184,6 +1172,7 @@ class bsn_bw_enable_get_request(bsn_header):
 bsn_header.subtypes[19] = bsn_bw_enable_get_request
 
 class bsn_bw_enable_set_reply(bsn_header):
+    __slots__ = ["enable", "status"]
     version = 1
     type = 4
     experimenter = 6035143
@@ -1204,37 +1193,27 @@ class bsn_bw_enable_set_reply(bsn_header):
             self.status = 0
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!L", self.experimenter))
-        packed.append(struct.pack("!L", self.subtype))
-        packed.append(struct.pack("!L", self.enable))
-        packed.append(struct.pack("!L", self.status))
-        length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_BBHLLLLL, buf, offset, self.version, self.type, 0, self.xid, self.experimenter, self.subtype, self.enable, self.status)
+        length = offset - start
+        _struct_H.pack_into(buf, start + 2, length)
+        return offset
+
+    def wire_length(self):
+        return 24
 
     @staticmethod
     def unpack(reader):
         obj = bsn_bw_enable_set_reply()
-        _version = reader.read("!B")[0]
+        _version, _type, _length = reader.read_struct(_struct_BBH)
         assert(_version == 1)
-        _type = reader.read("!B")[0]
         assert(_type == 4)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        _experimenter = reader.read("!L")[0]
+        obj.xid, _experimenter, _subtype, obj.enable, obj.status = reader.read_struct(_struct_LLLLL)
         assert(_experimenter == 6035143)
-        _subtype = reader.read("!L")[0]
         assert(_subtype == 23)
-        obj.enable = reader.read("!L")[0]
-        obj.status = reader.read("!L")[0]
         return obj
 
     def __eq__(self, other):
@@ -1266,6 +1245,7 @@ class bsn_bw_enable_set_reply(bsn_header):
 bsn_header.subtypes[23] = bsn_bw_enable_set_reply
 
 class bsn_bw_enable_set_request(bsn_header):
+    __slots__ = ["enable"]
     version = 1
     type = 4
     experimenter = 6035143
@@ -1282,35 +1262,27 @@ class bsn_bw_enable_set_request(bsn_header):
             self.enable = 0
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!L", self.experimenter))
-        packed.append(struct.pack("!L", self.subtype))
-        packed.append(struct.pack("!L", self.enable))
-        length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_BBHLLLL, buf, offset, self.version, self.type, 0, self.xid, self.experimenter, self.subtype, self.enable)
+        length = offset - start
+        _struct_H.pack_into(buf, start + 2, length)
+        return offset
+
+    def wire_length(self):
+        return 20
 
     @staticmethod
     def unpack(reader):
         obj = bsn_bw_enable_set_request()
-        _version = reader.read("!B")[0]
+        _version, _type, _length = reader.read_struct(_struct_BBH)
         assert(_version == 1)
-        _type = reader.read("!B")[0]
         assert(_type == 4)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        _experimenter = reader.read("!L")[0]
+        obj.xid, _experimenter, _subtype, obj.enable = reader.read_struct(_struct_LLLL)
         assert(_experimenter == 6035143)
-        _subtype = reader.read("!L")[0]
         assert(_subtype == 18)
-        obj.enable = reader.read("!L")[0]
         return obj
 
     def __eq__(self, other):
@@ -1338,6 +1310,7 @@ class bsn_bw_enable_set_request(bsn_header):
 bsn_header.subtypes[18] = bsn_bw_enable_set_request
 
 class bsn_get_interfaces_reply(bsn_header):
+    __slots__ = ["interfaces"]
     version = 1
     type = 4
     experimenter = 6035143
@@ -1354,33 +1327,27 @@ class bsn_get_interfaces_reply(bsn_header):
             self.interfaces = []
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!L", self.experimenter))
-        packed.append(struct.pack("!L", self.subtype))
-        packed.append(loxi.generic_util.pack_list(self.interfaces))
-        length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_BBHLLL, buf, offset, self.version, self.type, 0, self.xid, self.experimenter, self.subtype)
+        offset = loxi.generic_util.pack_list_into(self.interfaces, buf, offset)
+        length = offset - start
+        _struct_H.pack_into(buf, start + 2, length)
+        return offset
+
+    def wire_length(self):
+        return 16 + loxi.generic_util.list_wire_length(self.interfaces)
 
     @staticmethod
     def unpack(reader):
         obj = bsn_get_interfaces_reply()
-        _version = reader.read("!B")[0]
+        _version, _type, _length = reader.read_struct(_struct_BBH)
         assert(_version == 1)
-        _type = reader.read("!B")[0]
         assert(_type == 4)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        _experimenter = reader.read("!L")[0]
+        obj.xid, _experimenter, _subtype = reader.read_struct(_struct_LLL)
         assert(_experimenter == 6035143)
-        _subtype = reader.read("!L")[0]
         assert(_subtype == 10)
         obj.interfaces = loxi.generic_util.unpack_list(reader, ofp.common.bsn_interface.unpack)
         return obj
@@ -1410,6 +1377,7 @@ class bsn_get_interfaces_reply(bsn_header):
 bsn_header.subtypes[10] = bsn_get_interfaces_reply
 
 class bsn_get_interfaces_request(bsn_header):
+    __slots__ = []
     version = 1
     type = 4
     experimenter = 6035143
@@ -1422,32 +1390,26 @@ class bsn_get_interfaces_request(bsn_header):
             self.xid = None
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!L", self.experimenter))
-        packed.append(struct.pack("!L", self.subtype))
-        length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_BBHLLL, buf, offset, self.version, self.type, 0, self.xid, self.experimenter, self.subtype)
+        length = offset - start
+        _struct_H.pack_into(buf, start + 2, length)
+        return offset
+
+    def wire_length(self):
+        return 16
 
     @staticmethod
     def unpack(reader):
         obj = bsn_get_interfaces_request()
-        _version = reader.read("!B")[0]
+        _version, _type, _length = reader.read_struct(_struct_BBH)
         assert(_version == 1)
-        _type = reader.read("!B")[0]
         assert(_type == 4)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        _experimenter = reader.read("!L")[0]
+        obj.xid, _experimenter, _subtype = reader.read_struct(_struct_LLL)
         assert(_experimenter == 6035143)
-        _subtype = reader.read("!L")[0]
         assert(_subtype == 9)
         return obj
 
@@ -1472,6 +1434,7 @@ class bsn_get_interfaces_request(bsn_header):
 bsn_header.subtypes[9] = bsn_get_interfaces_request
 
 class bsn_get_ip_mask_reply(bsn_header):
+    __slots__ = ["index", "mask"]
     version = 1
     type = 4
     experimenter = 6035143
@@ -1492,39 +1455,27 @@ class bsn_get_ip_mask_reply(bsn_header):
             self.mask = 0
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!L", self.experimenter))
-        packed.append(struct.pack("!L", self.subtype))
-        packed.append(struct.pack("!B", self.index))
-        packed.append('\x00' * 3)
-        packed.append(struct.pack("!L", self.mask))
-        length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_BBHLLLB3xL, buf, offset, self.version, self.type, 0, self.xid, self.experimenter, self.subtype, self.index, self.mask)
+        length = offset - start
+        _struct_H.pack_into(buf, start + 2, length)
+        return offset
+
+    def wire_length(self):
+        return 24
 
     @staticmethod
     def unpack(reader):
         obj = bsn_get_ip_mask_reply()
-        _version = reader.read("!B")[0]
+        _version, _type, _length = reader.read_struct(_struct_BBH)
         assert(_version == 1)
-        _type = reader.read("!B")[0]
         assert(_type == 4)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        _experimenter = reader.read("!L")[0]
+        obj.xid, _experimenter, _subtype, obj.index, obj.mask = reader.read_struct(_struct_LLLB3xL)
         assert(_experimenter == 6035143)
-        _subtype = reader.read("!L")[0]
         assert(_subtype == 2)
-        obj.index = reader.read("!B")[0]
-        reader.skip(3)
-        obj.mask = reader.read("!L")[0]
         return obj
 
     def __eq__(self, other):
@@ -1556,6 +1507,7 @@ class bsn_get_ip_mask_reply(bsn_header):
 bsn_header.subtypes[2] = bsn_get_ip_mask_reply
 
 class bsn_get_ip_mask_request(bsn_header):
+    __slots__ = ["index"]
     version = 1
     type = 4
     experimenter = 6035143
@@ -1572,37 +1524,27 @@ class bsn_get_ip_mask_request(bsn_header):
             self.index = 0
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!L", self.experimenter))
-        packed.append(struct.pack("!L", self.subtype))
-        packed.append(struct.pack("!B", self.index))
-        packed.append('\x00' * 7)
-        length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_BBHLLLB7x, buf, offset, self.version, self.type, 0, self.xid, self.experimenter, self.subtype, self.index)
+        length = offset - start
+        _struct_H.pack_into(buf, start + 2, length)
+        return offset
+
+    def wire_length(self):
+        return 24
 
     @staticmethod
     def unpack(reader):
         obj = bsn_get_ip_mask_request()
-        _version = reader.read("!B")[0]
+        _version, _type, _length = reader.read_struct(_struct_BBH)
         assert(_version == 1)
-        _type = reader.read("!B")[0]
         assert(_type == 4)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        _experimenter = reader.read("!L")[0]
+        obj.xid, _experimenter, _subtype, obj.index = reader.read_struct(_struct_LLLB7x)
         assert(_experimenter == 6035143)
-        _subtype = reader.read("!L")[0]
         assert(_subtype == 1)
-        obj.index = reader.read("!B")[0]
-        reader.skip(7)
         return obj
 
     def __eq__(self, other):
@@ -1630,6 +1572,7 @@ class bsn_get_ip_mask_request(bsn_header):
 bsn_header.subtypes[1] = bsn_get_ip_mask_request
 
 class bsn_get_l2_table_reply(bsn_header):
+    __slots__ = ["l2_table_enable", "l2_table_priority"]
     version = 1
     type = 4
     experimenter = 6035143
@@ -1650,41 +1593,27 @@ class bsn_get_l2_table_reply(bsn_header):
             self.l2_table_priority = 0
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!L", self.experimenter))
-        packed.append(struct.pack("!L", self.subtype))
-        packed.append(struct.pack("!B", self.l2_table_enable))
-        packed.append('\x00' * 1)
-        packed.append(struct.pack("!H", self.l2_table_priority))
-        packed.append('\x00' * 4)
-        length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_BBHLLLBxH4x, buf, offset, self.version, self.type, 0, self.xid, self.experimenter, self.subtype, self.l2_table_enable, self.l2_table_priority)
+        length = offset - start
+        _struct_H.pack_into(buf, start + 2, length)
+        return offset
+
+    def wire_length(self):
+        return 24
 
     @staticmethod
     def unpack(reader):
         obj = bsn_get_l2_table_reply()
-        _version = reader.read("!B")[0]
+        _version, _type, _length = reader.read_struct(_struct_BBH)
         assert(_version == 1)
-        _type = reader.read("!B")[0]
         assert(_type == 4)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        _experimenter = reader.read("!L")[0]
+        obj.xid, _experimenter, _subtype, obj.l2_table_enable, obj.l2_table_priority = reader.read_struct(_struct_LLLBxH4x)
         assert(_experimenter == 6035143)
-        _subtype = reader.read("!L")[0]
         assert(_subtype == 14)
-        obj.l2_table_enable = reader.read("!B")[0]
-        reader.skip(1)
-        obj.l2_table_priority = reader.read("!H")[0]
-        reader.skip(4)
         return obj
 
     def __eq__(self, other):
@@ -1716,6 +1645,7 @@ class bsn_get_l2_table_reply(bsn_header):
 bsn_header.subtypes[14] = bsn_get_l2_table_reply
 
 class bsn_get_l2_table_request(bsn_header):
+    __slots__ = []
     version = 1
     type = 4
     experimenter = 6035143
@@ -1728,32 +1658,26 @@ class bsn_get_l2_table_request(bsn_header):
             self.xid = None
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!L", self.experimenter))
-        packed.append(struct.pack("!L", self.subtype))
-        length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_BBHLLL, buf, offset, self.version, self.type, 0, self.xid, self.experimenter, self.subtype)
+        length = offset - start
+        _struct_H.pack_into(buf, start + 2, length)
+        return offset
+
+    def wire_length(self):
+        return 16
 
     @staticmethod
     def unpack(reader):
         obj = bsn_get_l2_table_request()
-        _version = reader.read("!B")[0]
+        _version, _type, _length = reader.read_struct(_struct_BBH)
         assert(_version == 1)
-        _type = reader.read("!B")[0]
         assert(_type == 4)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        _experimenter = reader.read("!L")[0]
+        obj.xid, _experimenter, _subtype = reader.read_struct(_struct_LLL)
         assert(_experimenter == 6035143)
-        _subtype = reader.read("!L")[0]
         assert(_subtype == 13)
         return obj
 
@@ -1778,6 +1702,7 @@ class bsn_get_l2_table_request(bsn_header):
 bsn_header.subtypes[13] = bsn_get_l2_table_request
 
 class bsn_get_mirroring_reply(bsn_header):
+    __slots__ = ["report_mirror_ports"]
     version = 1
     type = 4
     experimenter = 6035143
@@ -1794,37 +1719,27 @@ class bsn_get_mirroring_reply(bsn_header):
             self.report_mirror_ports = 0
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!L", self.experimenter))
-        packed.append(struct.pack("!L", self.subtype))
-        packed.append(struct.pack("!B", self.report_mirror_ports))
-        packed.append('\x00' * 3)
-        length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_BBHLLLB3x, buf, offset, self.version, self.type, 0, self.xid, self.experimenter, self.subtype, self.report_mirror_ports)
+        length = offset - start
+        _struct_H.pack_into(buf, start + 2, length)
+        return offset
+
+    def wire_length(self):
+        return 20
 
     @staticmethod
     def unpack(reader):
         obj = bsn_get_mirroring_reply()
-        _version = reader.read("!B")[0]
+        _version, _type, _length = reader.read_struct(_struct_BBH)
         assert(_version == 1)
-        _type = reader.read("!B")[0]
         assert(_type == 4)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        _experimenter = reader.read("!L")[0]
+        obj.xid, _experimenter, _subtype, obj.report_mirror_ports = reader.read_struct(_struct_LLLB3x)
         assert(_experimenter == 6035143)
-        _subtype = reader.read("!L")[0]
         assert(_subtype == 5)
-        obj.report_mirror_ports = reader.read("!B")[0]
-        reader.skip(3)
         return obj
 
     def __eq__(self, other):
@@ -1852,6 +1767,7 @@ class bsn_get_mirroring_reply(bsn_header):
 bsn_header.subtypes[5] = bsn_get_mirroring_reply
 
 class bsn_get_mirroring_request(bsn_header):
+    __slots__ = ["report_mirror_ports"]
     version = 1
     type = 4
     experimenter = 6035143
@@ -1868,37 +1784,27 @@ class bsn_get_mirroring_request(bsn_header):
             self.report_mirror_ports = 0
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!L", self.experimenter))
-        packed.append(struct.pack("!L", self.subtype))
-        packed.append(struct.pack("!B", self.report_mirror_ports))
-        packed.append('\x00' * 3)
-        length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_BBHLLLB3x, buf, offset, self.version, self.type, 0, self.xid, self.experimenter, self.subtype, self.report_mirror_ports)
+        length = offset - start
+        _struct_H.pack_into(buf, start + 2, length)
+        return offset
+
+    def wire_length(self):
+        return 20
 
     @staticmethod
     def unpack(reader):
         obj = bsn_get_mirroring_request()
-        _version = reader.read("!B")[0]
+        _version, _type, _length = reader.read_struct(_struct_BBH)
         assert(_version == 1)
-        _type = reader.read("!B")[0]
         assert(_type == 4)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        _experimenter = reader.read("!L")[0]
+        obj.xid, _experimenter, _subtype, obj.report_mirror_ports = reader.read_struct(_struct_LLLB3x)
         assert(_experimenter == 6035143)
-        _subtype = reader.read("!L")[0]
         assert(_subtype == 4)
-        obj.report_mirror_ports = reader.read("!B")[0]
-        reader.skip(3)
         return obj
 
     def __eq__(self, other):
@@ -1926,6 +1832,7 @@ class bsn_get_mirroring_request(bsn_header):
 bsn_header.subtypes[4] = bsn_get_mirroring_request
 
 class bsn_hybrid_get_reply(bsn_header):
+    __slots__ = ["hybrid_enable", "hybrid_version"]
     version = 1
     type = 4
     experimenter = 6035143
@@ -1946,41 +1853,27 @@ class bsn_hybrid_get_reply(bsn_header):
             self.hybrid_version = 0
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!L", self.experimenter))
-        packed.append(struct.pack("!L", self.subtype))
-        packed.append(struct.pack("!B", self.hybrid_enable))
-        packed.append('\x00' * 1)
-        packed.append(struct.pack("!H", self.hybrid_version))
-        packed.append('\x00' * 4)
-        length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_BBHLLLBxH4x, buf, offset, self.version, self.type, 0, self.xid, self.experimenter, self.subtype, self.hybrid_enable, self.hybrid_version)
+        length = offset - start
+        _struct_H.pack_into(buf, start + 2, length)
+        return offset
+
+    def wire_length(self):
+        return 24
 
     @staticmethod
     def unpack(reader):
         obj = bsn_hybrid_get_reply()
-        _version = reader.read("!B")[0]
+        _version, _type, _length = reader.read_struct(_struct_BBH)
         assert(_version == 1)
-        _type = reader.read("!B")[0]
         assert(_type == 4)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        _experimenter = reader.read("!L")[0]
+        obj.xid, _experimenter, _subtype, obj.hybrid_enable, obj.hybrid_version = reader.read_struct(_struct_LLLBxH4x)
         assert(_experimenter == 6035143)
-        _subtype = reader.read("!L")[0]
         assert(_subtype == 28)
-        obj.hybrid_enable = reader.read("!B")[0]
-        reader.skip(1)
-        obj.hybrid_version = reader.read("!H")[0]
-        reader.skip(4)
         return obj
 
     def __eq__(self, other):
@@ -2012,6 +1905,7 @@ class bsn_hybrid_get_reply(bsn_header):
 bsn_header.subtypes[28] = bsn_hybrid_get_reply
 
 class bsn_hybrid_get_request(bsn_header):
+    __slots__ = []
     version = 1
     type = 4
     experimenter = 6035143
@@ -2024,32 +1918,26 @@ class bsn_hybrid_get_request(bsn_header):
             self.xid = None
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!L", self.experimenter))
-        packed.append(struct.pack("!L", self.subtype))
-        length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_BBHLLL, buf, offset, self.version, self.type, 0, self.xid, self.experimenter, self.subtype)
+        length = offset - start
+        _struct_H.pack_into(buf, start + 2, length)
+        return offset
+
+    def wire_length(self):
+        return 16
 
     @staticmethod
     def unpack(reader):
         obj = bsn_hybrid_get_request()
-        _version = reader.read("!B")[0]
+        _version, _type, _length = reader.read_struct(_struct_BBH)
         assert(_version == 1)
-        _type = reader.read("!B")[0]
         assert(_type == 4)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        _experimenter = reader.read("!L")[0]
+        obj.xid, _experimenter, _subtype = reader.read_struct(_struct_LLL)
         assert(_experimenter == 6035143)
-        _subtype = reader.read("!L")[0]
         assert(_subtype == 27)
         return obj
 
@@ -2074,6 +1962,7 @@ class bsn_hybrid_get_request(bsn_header):
 bsn_header.subtypes[27] = bsn_hybrid_get_request
 
 class bsn_pdu_rx_reply(bsn_header):
+    __slots__ = ["port_no", "slot_num", "status"]
     version = 1
     type = 4
     experimenter = 6035143
@@ -2098,39 +1987,27 @@ class bsn_pdu_rx_reply(bsn_header):
             self.slot_num = 0
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!L", self.experimenter))
-        packed.append(struct.pack("!L", self.subtype))
-        packed.append(struct.pack("!L", self.status))
-        packed.append(util.pack_port_no(self.port_no))
-        packed.append(struct.pack("!B", self.slot_num))
-        length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_BBHLLLLHB, buf, offset, self.version, self.type, 0, self.xid, self.experimenter, self.subtype, self.status, self.port_no, self.slot_num)
+        length = offset - start
+        _struct_H.pack_into(buf, start + 2, length)
+        return offset
+
+    def wire_length(self):
+        return 23
 
     @staticmethod
     def unpack(reader):
         obj = bsn_pdu_rx_reply()
-        _version = reader.read("!B")[0]
+        _version, _type, _length = reader.read_struct(_struct_BBH)
         assert(_version == 1)
-        _type = reader.read("!B")[0]
         assert(_type == 4)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        _experimenter = reader.read("!L")[0]
+        obj.xid, _experimenter, _subtype, obj.status, obj.port_no, obj.slot_num = reader.read_struct(_struct_LLLLHB)
         assert(_experimenter == 6035143)
-        _subtype = reader.read("!L")[0]
         assert(_subtype == 34)
-        obj.status = reader.read("!L")[0]
-        obj.port_no = util.unpack_port_no(reader)
-        obj.slot_num = reader.read("!B")[0]
         return obj
 
     def __eq__(self, other):
@@ -2166,6 +2043,7 @@ class bsn_pdu_rx_reply(bsn_header):
 bsn_header.subtypes[34] = bsn_pdu_rx_reply
 
 class bsn_pdu_rx_request(bsn_header):
+    __slots__ = ["port_no", "slot_num", "timeout_ms"]
     version = 1
     type = 4
     experimenter = 6035143
@@ -2194,43 +2072,29 @@ class bsn_pdu_rx_request(bsn_header):
             self.data = ''
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!L", self.experimenter))
-        packed.append(struct.pack("!L", self.subtype))
-        packed.append(struct.pack("!L", self.timeout_ms))
-        packed.append(util.pack_port_no(self.port_no))
-        packed.append(struct.pack("!B", self.slot_num))
-        packed.append('\x00' * 3)
-        packed.append(self.data)
-        length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_BBHLLLLHB3x, buf, offset, self.version, self.type, 0, self.xid, self.experimenter, self.subtype, self.timeout_ms, self.port_no, self.slot_num)
+        offset = loxi.generic_util.pack_bytes_into(self.data, buf, offset)
+        length = offset - start
+        _struct_H.pack_into(buf, start + 2, length)
+        return offset
+
+    def wire_length(self):
+        return 26 + len(self.data)
 
     @staticmethod
     def unpack(reader):
         obj = bsn_pdu_rx_request()
-        _version = reader.read("!B")[0]
+        _version, _type, _length = reader.read_struct(_struct_BBH)
         assert(_version == 1)
-        _type = reader.read("!B")[0]
         assert(_type == 4)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        _experimenter = reader.read("!L")[0]
+        obj.xid, _experimenter, _subtype, obj.timeout_ms, obj.port_no, obj.slot_num = reader.read_struct(_struct_LLLLHB3x)
         assert(_experimenter == 6035143)
-        _subtype = reader.read("!L")[0]
         assert(_subtype == 33)
-        obj.timeout_ms = reader.read("!L")[0]
-        obj.port_no = util.unpack_port_no(reader)
-        obj.slot_num = reader.read("!B")[0]
-        reader.skip(3)
-        obj.data = str(reader.read_all())
+        obj.data = reader.read_all()
         return obj
 
     def __eq__(self, other):
@@ -2270,6 +2134,7 @@ class bsn_pdu_rx_request(bsn_header):
 bsn_header.subtypes[33] = bsn_pdu_rx_request
 
 class bsn_pdu_rx_timeout(bsn_header):
+    __slots__ = ["port_no", "slot_num"]
     version = 1
     type = 4
     experimenter = 6035143
@@ -2290,37 +2155,27 @@ class bsn_pdu_rx_timeout(bsn_header):
             self.slot_num = 0
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!L", self.experimenter))
-        packed.append(struct.pack("!L", self.subtype))
-        packed.append(util.pack_port_no(self.port_no))
-        packed.append(struct.pack("!B", self.slot_num))
-        length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_BBHLLLHB, buf, offset, self.version, self.type, 0, self.xid, self.experimenter, self.subtype, self.port_no, self.slot_num)
+        length = offset - start
+        _struct_H.pack_into(buf, start + 2, length)
+        return offset
+
+    def wire_length(self):
+        return 19
 
     @staticmethod
     def unpack(reader):
         obj = bsn_pdu_rx_timeout()
-        _version = reader.read("!B")[0]
+        _version, _type, _length = reader.read_struct(_struct_BBH)
         assert(_version == 1)
-        _type = reader.read("!B")[0]
         assert(_type == 4)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        _experimenter = reader.read("!L")[0]
+        obj.xid, _experimenter, _subtype, obj.port_no, obj.slot_num = reader.read_struct(_struct_LLLHB)
         assert(_experimenter == 6035143)
-        _subtype = reader.read("!L")[0]
         assert(_subtype == 35)
-        obj.port_no = util.unpack_port_no(reader)
-        obj.slot_num = reader.read("!B")[0]
         return obj
 
     def __eq__(self, other):
@@ -2352,6 +2207,7 @@ class bsn_pdu_rx_timeout(bsn_header):
 bsn_header.subtypes[35] = bsn_pdu_rx_timeout
 
 class bsn_pdu_tx_reply(bsn_header):
+    __slots__ = ["port_no", "slot_num", "status"]
     version = 1
     type = 4
     experimenter = 6035143
@@ -2376,39 +2232,27 @@ class bsn_pdu_tx_reply(bsn_header):
             self.slot_num = 0
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!L", self.experimenter))
-        packed.append(struct.pack("!L", self.subtype))
-        packed.append(struct.pack("!L", self.status))
-        packed.append(util.pack_port_no(self.port_no))
-        packed.append(struct.pack("!B", self.slot_num))
-        length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_BBHLLLLHB, buf, offset, self.version, self.type, 0, self.xid, self.experimenter, self.subtype, self.status, self.port_no, self.slot_num)
+        length = offset - start
+        _struct_H.pack_into(buf, start + 2, length)
+        return offset
+
+    def wire_length(self):
+        return 23
 
     @staticmethod
     def unpack(reader):
         obj = bsn_pdu_tx_reply()
-        _version = reader.read("!B")[0]
+        _version, _type, _length = reader.read_struct(_struct_BBH)
         assert(_version == 1)
-        _type = reader.read("!B")[0]
         assert(_type == 4)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        _experimenter = reader.read("!L")[0]
+        obj.xid, _experimenter, _subtype, obj.status, obj.port_no, obj.slot_num = reader.read_struct(_struct_LLLLHB)
         assert(_experimenter == 6035143)
-        _subtype = reader.read("!L")[0]
         assert(_subtype == 32)
-        obj.status = reader.read("!L")[0]
-        obj.port_no = util.unpack_port_no(reader)
-        obj.slot_num = reader.read("!B")[0]
         return obj
 
     def __eq__(self, other):
@@ -2444,6 +2288,7 @@ class bsn_pdu_tx_reply(bsn_header):
 bsn_header.subtypes[32] = bsn_pdu_tx_reply
 
 class bsn_pdu_tx_request(bsn_header):
+    __slots__ = ["port_no", "slot_num", "tx_interval_ms"]
     version = 1
     type = 4
     experimenter = 6035143
@@ -2472,43 +2317,29 @@ class bsn_pdu_tx_request(bsn_header):
             self.data = ''
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!L", self.experimenter))
-        packed.append(struct.pack("!L", self.subtype))
-        packed.append(struct.pack("!L", self.tx_interval_ms))
-        packed.append(util.pack_port_no(self.port_no))
-        packed.append(struct.pack("!B", self.slot_num))
-        packed.append('\x00' * 3)
-        packed.append(self.data)
-        length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_BBHLLLLHB3x, buf, offset, self.version, self.type, 0, self.xid, self.experimenter, self.subtype, self.tx_interval_ms, self.port_no, self.slot_num)
+        offset = loxi.generic_util.pack_bytes_into(self.data, buf, offset)
+        length = offset - start
+        _struct_H.pack_into(buf, start + 2, length)
+        return offset
+
+    def wire_length(self):
+        return 26 + len(self.data)
 
     @staticmethod
     def unpack(reader):
         obj = bsn_pdu_tx_request()
-        _version = reader.read("!B")[0]
+        _version, _type, _length = reader.read_struct(_struct_BBH)
         assert(_version == 1)
-        _type = reader.read("!B")[0]
         assert(_type == 4)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        _experimenter = reader.read("!L")[0]
+        obj.xid, _experimenter, _subtype, obj.tx_interval_ms, obj.port_no, obj.slot_num = reader.read_struct(_struct_LLLLHB3x)
         assert(_experimenter == 6035143)
-        _subtype = reader.read("!L")[0]
         assert(_subtype == 31)
-        obj.tx_interval_ms = reader.read("!L")[0]
-        obj.port_no = util.unpack_port_no(reader)
-        obj.slot_num = reader.read("!B")[0]
-        reader.skip(3)
-        obj.data = str(reader.read_all())
+        obj.data = reader.read_all()
         return obj
 
     def __eq__(self, other):
@@ -2548,6 +2379,7 @@ class bsn_pdu_tx_request(bsn_header):
 bsn_header.subtypes[31] = bsn_pdu_tx_request
 
 class bsn_set_ip_mask(bsn_header):
+    __slots__ = ["index", "mask"]
     version = 1
     type = 4
     experimenter = 6035143
@@ -2568,39 +2400,27 @@ class bsn_set_ip_mask(bsn_header):
             self.mask = 0
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!L", self.experimenter))
-        packed.append(struct.pack("!L", self.subtype))
-        packed.append(struct.pack("!B", self.index))
-        packed.append('\x00' * 3)
-        packed.append(struct.pack("!L", self.mask))
-        length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_BBHLLLB3xL, buf, offset, self.version, self.type, 0, self.xid, self.experimenter, self.subtype, self.index, self.mask)
+        length = offset - start
+        _struct_H.pack_into(buf, start + 2, length)
+        return offset
+
+    def wire_length(self):
+        return 24
 
     @staticmethod
     def unpack(reader):
         obj = bsn_set_ip_mask()
-        _version = reader.read("!B")[0]
+        _version, _type, _length = reader.read_struct(_struct_BBH)
         assert(_version == 1)
-        _type = reader.read("!B")[0]
         assert(_type == 4)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        _experimenter = reader.read("!L")[0]
+        obj.xid, _experimenter, _subtype, obj.index, obj.mask = reader.read_struct(_struct_LLLB3xL)
         assert(_experimenter == 6035143)
-        _subtype = reader.read("!L")[0]
         assert(_subtype == 0)
-        obj.index = reader.read("!B")[0]
-        reader.skip(3)
-        obj.mask = reader.read("!L")[0]
         return obj
 
     def __eq__(self, other):
@@ -2632,6 +2452,7 @@ class bsn_set_ip_mask(bsn_header):
 bsn_header.subtypes[0] = bsn_set_ip_mask
 
 class bsn_set_l2_table_reply(bsn_header):
+    __slots__ = ["l2_table_enable", "l2_table_priority", "status"]
     version = 1
     type = 4
     experimenter = 6035143
@@ -2656,41 +2477,27 @@ class bsn_set_l2_table_reply(bsn_header):
             self.status = 0
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!L", self.experimenter))
-        packed.append(struct.pack("!L", self.subtype))
-        packed.append(struct.pack("!B", self.l2_table_enable))
-        packed.append('\x00' * 1)
-        packed.append(struct.pack("!H", self.l2_table_priority))
-        packed.append(struct.pack("!L", self.status))
-        length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_BBHLLLBxHL, buf, offset, self.version, self.type, 0, self.xid, self.experimenter, self.subtype, self.l2_table_enable, self.l2_table_priority, self.status)
+        length = offset - start
+        _struct_H.pack_into(buf, start + 2, length)
+        return offset
+
+    def wire_length(self):
+        return 24
 
     @staticmethod
     def unpack(reader):
         obj = bsn_set_l2_table_reply()
-        _version = reader.read("!B")[0]
+        _version, _type, _length = reader.read_struct(_struct_BBH)
         assert(_version == 1)
-        _type = reader.read("!B")[0]
         assert(_type == 4)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        _experimenter = reader.read("!L")[0]
+        obj.xid, _experimenter, _subtype, obj.l2_table_enable, obj.l2_table_priority, obj.status = reader.read_struct(_struct_LLLBxHL)
         assert(_experimenter == 6035143)
-        _subtype = reader.read("!L")[0]
         assert(_subtype == 24)
-        obj.l2_table_enable = reader.read("!B")[0]
-        reader.skip(1)
-        obj.l2_table_priority = reader.read("!H")[0]
-        obj.status = reader.read("!L")[0]
         return obj
 
     def __eq__(self, other):
@@ -2726,6 +2533,7 @@ class bsn_set_l2_table_reply(bsn_header):
 bsn_header.subtypes[24] = bsn_set_l2_table_reply
 
 class bsn_set_l2_table_request(bsn_header):
+    __slots__ = ["l2_table_enable", "l2_table_priority"]
     version = 1
     type = 4
     experimenter = 6035143
@@ -2746,41 +2554,27 @@ class bsn_set_l2_table_request(bsn_header):
             self.l2_table_priority = 0
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!L", self.experimenter))
-        packed.append(struct.pack("!L", self.subtype))
-        packed.append(struct.pack("!B", self.l2_table_enable))
-        packed.append('\x00' * 1)
-        packed.append(struct.pack("!H", self.l2_table_priority))
-        packed.append('\x00' * 4)
-        length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_BBHLLLBxH4x, buf, offset, self.version, self.type, 0, self.xid, self.experimenter, self.subtype, self.l2_table_enable, self.l2_table_priority)
+        length = offset - start
+        _struct_H.pack_into(buf, start + 2, length)
+        return offset
+
+    def wire_length(self):
+        return 24
 
     @staticmethod
     def unpack(reader):
         obj = bsn_set_l2_table_request()
-        _version = reader.read("!B")[0]
+        _version, _type, _length = reader.read_struct(_struct_BBH)
         assert(_version == 1)
-        _type = reader.read("!B")[0]
         assert(_type == 4)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        _experimenter = reader.read("!L")[0]
+        obj.xid, _experimenter, _subtype, obj.l2_table_enable, obj.l2_table_priority = reader.read_struct(_struct_LLLBxH4x)
         assert(_experimenter == 6035143)
-        _subtype = reader.read("!L")[0]
         assert(_subtype == 12)
-        obj.l2_table_enable = reader.read("!B")[0]
-        reader.skip(1)
-        obj.l2_table_priority = reader.read("!H")[0]
-        reader.skip(4)
         return obj
 
     def __eq__(self, other):
@@ -2812,6 +2606,7 @@ class bsn_set_l2_table_request(bsn_header):
 bsn_header.subtypes[12] = bsn_set_l2_table_request
 
 class bsn_set_mirroring(bsn_header):
+    __slots__ = ["report_mirror_ports"]
     version = 1
     type = 4
     experimenter = 6035143
@@ -2828,37 +2623,27 @@ class bsn_set_mirroring(bsn_header):
             self.report_mirror_ports = 0
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!L", self.experimenter))
-        packed.append(struct.pack("!L", self.subtype))
-        packed.append(struct.pack("!B", self.report_mirror_ports))
-        packed.append('\x00' * 3)
-        length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_BBHLLLB3x, buf, offset, self.version, self.type, 0, self.xid, self.experimenter, self.subtype, self.report_mirror_ports)
+        length = offset - start
+        _struct_H.pack_into(buf, start + 2, length)
+        return offset
+
+    def wire_length(self):
+        return 20
 
     @staticmethod
     def unpack(reader):
         obj = bsn_set_mirroring()
-        _version = reader.read("!B")[0]
+        _version, _type, _length = reader.read_struct(_struct_BBH)
         assert(_version == 1)
-        _type = reader.read("!B")[0]
         assert(_type == 4)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        _experimenter = reader.read("!L")[0]
+        obj.xid, _experimenter, _subtype, obj.report_mirror_ports = reader.read_struct(_struct_LLLB3x)
         assert(_experimenter == 6035143)
-        _subtype = reader.read("!L")[0]
         assert(_subtype == 3)
-        obj.report_mirror_ports = reader.read("!B")[0]
-        reader.skip(3)
         return obj
 
     def __eq__(self, other):
@@ -2886,6 +2671,7 @@ class bsn_set_mirroring(bsn_header):
 bsn_header.subtypes[3] = bsn_set_mirroring
 
 class bsn_set_pktin_suppression_reply(bsn_header):
+    __slots__ = ["status"]
     version = 1
     type = 4
     experimenter = 6035143
@@ -2902,35 +2688,27 @@ class bsn_set_pktin_suppression_reply(bsn_header):
             self.status = 0
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!L", self.experimenter))
-        packed.append(struct.pack("!L", self.subtype))
-        packed.append(struct.pack("!L", self.status))
-        length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_BBHLLLL, buf, offset, self.version, self.type, 0, self.xid, self.experimenter, self.subtype, self.status)
+        length = offset - start
+        _struct_H.pack_into(buf, start + 2, length)
+        return offset
+
+    def wire_length(self):
+        return 20
 
     @staticmethod
     def unpack(reader):
         obj = bsn_set_pktin_suppression_reply()
-        _version = reader.read("!B")[0]
+        _version, _type, _length = reader.read_struct(_struct_BBH)
         assert(_version == 1)
-        _type = reader.read("!B")[0]
         assert(_type == 4)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        _experimenter = reader.read("!L")[0]
+        obj.xid, _experimenter, _subtype, obj.status = reader.read_struct(_struct_LLLL)
         assert(_experimenter == 6035143)
-        _subtype = reader.read("!L")[0]
         assert(_subtype == 25)
-        obj.status = reader.read("!L")[0]
         return obj
 
     def __eq__(self, other):
@@ -2958,6 +2736,7 @@ class bsn_set_pktin_suppression_reply(bsn_header):
 bsn_header.subtypes[25] = bsn_set_pktin_suppression_reply
 
 class bsn_set_pktin_suppression_request(bsn_header):
+    __slots__ = ["cookie", "enabled", "hard_timeout", "idle_timeout", "priority"]
     version = 1
     type = 4
     experimenter = 6035143
@@ -2990,45 +2769,27 @@ class bsn_set_pktin_suppression_request(bsn_header):
             self.cookie = 0
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!L", self.experimenter))
-        packed.append(struct.pack("!L", self.subtype))
-        packed.append(struct.pack("!B", self.enabled))
-        packed.append('\x00' * 1)
-        packed.append(struct.pack("!H", self.idle_timeout))
-        packed.append(struct.pack("!H", self.hard_timeout))
-        packed.append(struct.pack("!H", self.priority))
-        packed.append(struct.pack("!Q", self.cookie))
-        length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_BBHLLLBxHHHQ, buf, offset, self.version, self.type, 0, self.xid, self.experimenter, self.subtype, self.enabled, self.idle_timeout, self.hard_timeout, self.priority, self.cookie)
+        length = offset - start
+        _struct_H.pack_into(buf, start + 2, length)
+        return offset
+
+    def wire_length(self):
+        return 32
 
     @staticmethod
     def unpack(reader):
         obj = bsn_set_pktin_suppression_request()
-        _version = reader.read("!B")[0]
+        _version, _type, _length = reader.read_struct(_struct_BBH)
         assert(_version == 1)
-        _type = reader.read("!B")[0]
         assert(_type == 4)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        _experimenter = reader.read("!L")[0]
+        obj.xid, _experimenter, _subtype, obj.enabled, obj.idle_timeout, obj.hard_timeout, obj.priority, obj.cookie = reader.read_struct(_struct_LLLBxHHHQ)
         assert(_experimenter == 6035143)
-        _subtype = reader.read("!L")[0]
         assert(_subtype == 11)
-        obj.enabled = reader.read("!B")[0]
-        reader.skip(1)
-        obj.idle_timeout = reader.read("!H")[0]
-        obj.hard_timeout = reader.read("!H")[0]
-        obj.priority = reader.read("!H")[0]
-        obj.cookie = reader.read("!Q")[0]
         return obj
 
     def __eq__(self, other):
@@ -3072,6 +2833,7 @@ class bsn_set_pktin_suppression_request(bsn_header):
 bsn_header.subtypes[11] = bsn_set_pktin_suppression_request
 
 class bsn_shell_command(bsn_header):
+    __slots__ = ["service"]
     version = 1
     type = 4
     experimenter = 6035143
@@ -3092,37 +2854,29 @@ class bsn_shell_command(bsn_header):
             self.data = ''
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!L", self.experimenter))
-        packed.append(struct.pack("!L", self.subtype))
-        packed.append(struct.pack("!L", self.service))
-        packed.append(self.data)
-        length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_BBHLLLL, buf, offset, self.version, self.type, 0, self.xid, self.experimenter, self.subtype, self.service)
+        offset = loxi.generic_util.pack_bytes_into(self.data, buf, offset)
+        length = offset - start
+        _struct_H.pack_into(buf, start + 2, length)
+        return offset
+
+    def wire_length(self):
+        return 20 + len(self.data)
 
     @staticmethod
     def unpack(reader):
         obj = bsn_shell_command()
-        _version = reader.read("!B")[0]
+        _version, _type, _length = reader.read_struct(_struct_BBH)
         assert(_version == 1)
-        _type = reader.read("!B")[0]
         assert(_type == 4)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        _experimenter = reader.read("!L")[0]
+        obj.xid, _experimenter, _subtype, obj.service = reader.read_struct(_struct_LLLL)
         assert(_experimenter == 6035143)
-        _subtype = reader.read("!L")[0]
         assert(_subtype == 6)
-        obj.service = reader.read("!L")[0]
-        obj.data = str(reader.read_all())
+        obj.data = reader.read_all()
         return obj
 
     def __eq__(self, other):
@@ -3154,6 +2908,7 @@ class bsn_shell_command(bsn_header):
 bsn_header.subtypes[6] = bsn_shell_command
 
 class bsn_shell_output(bsn_header):
+    __slots__ = []
     version = 1
     type = 4
     experimenter = 6035143
@@ -3170,35 +2925,29 @@ class bsn_shell_output(bsn_header):
             self.data = ''
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!L", self.experimenter))
-        packed.append(struct.pack("!L", self.subtype))
-        packed.append(self.data)
-        length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_BBHLLL, buf, offset, self.version, self.type, 0, self.xid, self.experimenter, self.subtype)
+        offset = loxi.generic_util.pack_bytes_into(self.data, buf, offset)
+        length = offset - start
+        _struct_H.pack_into(buf, start + 2, length)
+        return offset
+
+    def wire_length(self):
+        return 16 + len(self.data)
 
     @staticmethod
     def unpack(reader):
         obj = bsn_shell_output()
-        _version = reader.read("!B")[0]
+        _version, _type, _length = reader.read_struct(_struct_BBH)
         assert(_version == 1)
-        _type = reader.read("!B")[0]
         assert(_type == 4)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        _experimenter = reader.read("!L")[0]
+        obj.xid, _experimenter, _subtype = reader.read_struct(_struct_LLL)
         assert(_experimenter == 6035143)
-        _subtype = reader.read("!L")[0]
         assert(_subtype == 7)
-        obj.data = str(reader.read_all())
+        obj.data = reader.read_all()
         return obj
 
     def __eq__(self, other):
@@ -3226,6 +2975,7 @@ class bsn_shell_output(bsn_header):
 bsn_header.subtypes[7] = bsn_shell_output
 
 class bsn_shell_status(bsn_header):
+    __slots__ = ["status"]
     version = 1
     type = 4
     experimenter = 6035143
@@ -3242,35 +2992,27 @@ class bsn_shell_status(bsn_header):
             self.status = 0
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!L", self.experimenter))
-        packed.append(struct.pack("!L", self.subtype))
-        packed.append(struct.pack("!L", self.status))
-        length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_BBHLLLL, buf, offset, self.version, self.type, 0, self.xid, self.experimenter, self.subtype, self.status)
+        length = offset - start
+        _struct_H.pack_into(buf, start + 2, length)
+        return offset
+
+    def wire_length(self):
+        return 20
 
     @staticmethod
     def unpack(reader):
         obj = bsn_shell_status()
-        _version = reader.read("!B")[0]
+        _version, _type, _length = reader.read_struct(_struct_BBH)
         assert(_version == 1)
-        _type = reader.read("!B")[0]
         assert(_type == 4)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        _experimenter = reader.read("!L")[0]
+        obj.xid, _experimenter, _subtype, obj.status = reader.read_struct(_struct_LLLL)
         assert(_experimenter == 6035143)
-        _subtype = reader.read("!L")[0]
         assert(_subtype == 8)
-        obj.status = reader.read("!L")[0]
         return obj
 
     def __eq__(self, other):
@@ -3298,6 +3040,7 @@ class bsn_shell_status(bsn_header):
 bsn_header.subtypes[8] = bsn_shell_status
 
 class experimenter_stats_reply(stats_reply):
+    __slots__ = ["data", "experimenter"]
     subtypes = {}
 
     version = 1
@@ -3323,19 +3066,16 @@ class experimenter_stats_reply(stats_reply):
             self.data = ''
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!H", self.stats_type))
-        packed.append(struct.pack("!H", self.flags))
-        packed.append(struct.pack("!L", self.experimenter))
-        packed.append(self.data)
-        length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_BBHLHHL, buf, offset, self.version, self.type, 0, self.xid, self.stats_type, self.flags, self.experimenter)
+        offset = loxi.generic_util.pack_bytes_into(self.data, buf, offset)
+        length = offset - start
+        _struct_H.pack_into(buf, start + 2, length)
+        return offset
+
+    def wire_length(self):
+        return 16 + len(self.data)
 
     @staticmethod
     def unpack(reader):
@@ -3345,19 +3085,14 @@ class experimenter_stats_reply(stats_reply):
             return subclass.unpack(reader)
 
         obj = experimenter_stats_reply()
-        _version = reader.read("!B")[0]
+        _version, _type, _length = reader.read_struct(_struct_BBH)
         assert(_version == 1)
-        _type = reader.read("!B")[0]
         assert(_type == 17)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        _stats_type = reader.read("!H")[0]
+        obj.xid, _stats_type, obj.flags, obj.experimenter = reader.read_struct(_struct_LHHL)
         assert(_stats_type == 65535)
-        obj.flags = reader.read("!H")[0]
-        obj.experimenter = reader.read("!L")[0]
-        obj.data = str(reader.read_all())
+        obj.data = reader.read_all()
         return obj
 
     def __eq__(self, other):
@@ -3390,6 +3125,7 @@ class experimenter_stats_reply(stats_reply):
 stats_reply.subtypes[65535] = experimenter_stats_reply
 
 class bsn_stats_reply(experimenter_stats_reply):
+    __slots__ = ["subtype"]
     subtypes = {}
 
     version = 1
@@ -3412,20 +3148,15 @@ class bsn_stats_reply(experimenter_stats_reply):
             self.subtype = 0
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!H", self.stats_type))
-        packed.append(struct.pack("!H", self.flags))
-        packed.append('\x00' * 4)
-        packed.append(struct.pack("!L", self.experimenter))
-        packed.append(struct.pack("!L", self.subtype))
-        length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_BBHLHH4xLL, buf, offset, self.version, self.type, 0, self.xid, self.stats_type, self.flags, self.experimenter, self.subtype)
+        length = offset - start
+        _struct_H.pack_into(buf, start + 2, length)
+        return offset
+
+    def wire_length(self):
+        return 24
 
     @staticmethod
     def unpack(reader):
@@ -3435,21 +3166,14 @@ class bsn_stats_reply(experimenter_stats_reply):
             return subclass.unpack(reader)
 
         obj = bsn_stats_reply()
-        _version = reader.read("!B")[0]
+        _version, _type, _length = reader.read_struct(_struct_BBH)
         assert(_version == 1)
-        _type = reader.read("!B")[0]
         assert(_type == 19)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        _stats_type = reader.read("!H")[0]
+        obj.xid, _stats_type, obj.flags, _experimenter, obj.subtype = reader.read_struct(_struct_LHH4xLL)
         assert(_stats_type == 65535)
-        obj.flags = reader.read("!H")[0]
-        reader.skip(4)
-        _experimenter = reader.read("!L")[0]
         assert(_experimenter == 6035143)
-        obj.subtype = reader.read("!L")[0]
         return obj
 
     def __eq__(self, other):
@@ -3478,6 +3202,7 @@ class bsn_stats_reply(experimenter_stats_reply):
 experimenter_stats_reply.subtypes[6035143] = bsn_stats_reply
 
 class experimenter_stats_request(stats_request):
+    __slots__ = ["data", "experimenter"]
     subtypes = {}
 
     version = 1
@@ -3503,19 +3228,16 @@ class experimenter_stats_request(stats_request):
             self.data = ''
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!H", self.stats_type))
-        packed.append(struct.pack("!H", self.flags))
-        packed.append(struct.pack("!L", self.experimenter))
-        packed.append(self.data)
-        length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_BBHLHHL, buf, offset, self.version, self.type, 0, self.xid, self.stats_type, self.flags, self.experimenter)
+        offset = loxi.generic_util.pack_bytes_into(self.data, buf, offset)
+        length = offset - start
+        _struct_H.pack_into(buf, start + 2, length)
+        return offset
+
+    def wire_length(self):
+        return 16 + len(self.data)
 
     @staticmethod
     def unpack(reader):
@@ -3525,19 +3247,14 @@ class experimenter_stats_request(stats_request):
             return subclass.unpack(reader)
 
         obj = experimenter_stats_request()
-        _version = reader.read("!B")[0]
+        _version, _type, _length = reader.read_struct(_struct_BBH)
         assert(_version == 1)
-        _type = reader.read("!B")[0]
         assert(_type == 16)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        _stats_type = reader.read("!H")[0]
+        obj.xid, _stats_type, obj.flags, obj.experimenter = reader.read_struct(_struct_LHHL)
         assert(_stats_type == 65535)
-        obj.flags = reader.read("!H")[0]
-        obj.experimenter = reader.read("!L")[0]
-        obj.data = str(reader.read_all())
+        obj.data = reader.read_all()
         return obj
 
     def __eq__(self, other):
@@ -3570,6 +3287,7 @@ class experimenter_stats_request(stats_request):
 stats_request.subtypes[65535] = experimenter_stats_request
 
 class bsn_stats_request(experimenter_stats_request):
+    __slots__ = ["subtype"]
     subtypes = {}
 
     version = 1
@@ -3592,20 +3310,15 @@ class bsn_stats_request(experimenter_stats_request):
             self.subtype = 0
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!H", self.stats_type))
-        packed.append(struct.pack("!H", self.flags))
-        packed.append('\x00' * 4)
-        packed.append(struct.pack("!L", self.experimenter))
-        packed.append(struct.pack("!L", self.subtype))
-        length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_BBHLHH4xLL, buf, offset, self.version, self.type, 0, self.xid, self.stats_type, self.flags, self.experimenter, self.subtype)
+        length = offset - start
+        _struct_H.pack_into(buf, start + 2, length)
+        return offset
+
+    def wire_length(self):
+        return 24
 
     @staticmethod
     def unpack(reader):
@@ -3615,21 +3328,14 @@ class bsn_stats_request(experimenter_stats_request):
             return subclass.unpack(reader)
 
         obj = bsn_stats_request()
-        _version = reader.read("!B")[0]
+        _version, _type, _length = reader.read_struct(_struct_BBH)
         assert(_version == 1)
-        _type = reader.read("!B")[0]
         assert(_type == 18)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        _stats_type = reader.read("!H")[0]
+        obj.xid, _stats_type, obj.flags, _experimenter, obj.subtype = reader.read_struct(_struct_LHH4xLL)
         assert(_stats_type == 65535)
-        obj.flags = reader.read("!H")[0]
-        reader.skip(4)
-        _experimenter = reader.read("!L")[0]
         assert(_experimenter == 6035143)
-        obj.subtype = reader.read("!L")[0]
         return obj
 
     def __eq__(self, other):
@@ -3658,6 +3364,7 @@ class bsn_stats_request(experimenter_stats_request):
 experimenter_stats_request.subtypes[6035143] = bsn_stats_request
 
 class bsn_virtual_port_create_reply(bsn_header):
+    __slots__ = ["status", "vport_no"]
     version = 1
     type = 4
     experimenter = 6035143
@@ -3678,37 +3385,27 @@ class bsn_virtual_port_create_reply(bsn_header):
             self.vport_no = 0
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!L", self.experimenter))
-        packed.append(struct.pack("!L", self.subtype))
-        packed.append(struct.pack("!L", self.status))
-        packed.append(struct.pack("!L", self.vport_no))
-        length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_BBHLLLLL, buf, offset, self.version, self.type, 0, self.xid, self.experimenter, self.subtype, self.status, self.vport_no)
+        length = offset - start
+        _struct_H.pack_into(buf, start + 2, length)
+        return offset
+
+    def wire_length(self):
+        return 24
 
     @staticmethod
     def unpack(reader):
         obj = bsn_virtual_port_create_reply()
-        _version = reader.read("!B")[0]
+        _version, _type, _length = reader.read_struct(_struct_BBH)
         assert(_version == 1)
-        _type = reader.read("!B")[0]
         assert(_type == 4)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        _experimenter = reader.read("!L")[0]
+        obj.xid, _experimenter, _subtype, obj.status, obj.vport_no = reader.read_struct(_struct_LLLLL)
         assert(_experimenter == 6035143)
-        _subtype = reader.read("!L")[0]
         assert(_subtype == 16)
-        obj.status = reader.read("!L")[0]
-        obj.vport_no = reader.read("!L")[0]
         return obj
 
     def __eq__(self, other):
@@ -3740,6 +3437,7 @@ class bsn_virtual_port_create_reply(bsn_header):
 bsn_header.subtypes[16] = bsn_virtual_port_create_reply
 
 class bsn_virtual_port_create_request(bsn_header):
+    __slots__ = ["vport"]
     version = 1
     type = 4
     experimenter = 6035143
@@ -3756,33 +3454,27 @@ class bsn_virtual_port_create_request(bsn_header):
             self.vport = ofp.bsn_vport()
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!L", self.experimenter))
-        packed.append(struct.pack("!L", self.subtype))
-        packed.append(self.vport.pack())
-        length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_BBHLLL, buf, offset, self.version, self.type, 0, self.xid, self.experimenter, self.subtype)
+        offset = self.vport.pack_into(buf, offset)
+        length = offset - start
+        _struct_H.pack_into(buf, start + 2, length)
+        return offset
+
+    def wire_length(self):
+        return 16 + self.vport.wire_length()
 
     @staticmethod
     def unpack(reader):
         obj = bsn_virtual_port_create_request()
-        _version = reader.read("!B")[0]
+        _version, _type, _length = reader.read_struct(_struct_BBH)
         assert(_version == 1)
-        _type = reader.read("!B")[0]
         assert(_type == 4)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        _experimenter = reader.read("!L")[0]
+        obj.xid, _experimenter, _subtype = reader.read_struct(_struct_LLL)
         assert(_experimenter == 6035143)
-        _subtype = reader.read("!L")[0]
         assert(_subtype == 15)
         obj.vport = ofp.bsn_vport.unpack(reader)
         return obj
@@ -3812,6 +3504,7 @@ class bsn_virtual_port_create_request(bsn_header):
 bsn_header.subtypes[15] = bsn_virtual_port_create_request
 
 class bsn_virtual_port_remove_reply(bsn_header):
+    __slots__ = ["status"]
     version = 1
     type = 4
     experimenter = 6035143
@@ -3828,35 +3521,27 @@ class bsn_virtual_port_remove_reply(bsn_header):
             self.status = 0
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!L", self.experimenter))
-        packed.append(struct.pack("!L", self.subtype))
-        packed.append(struct.pack("!L", self.status))
-        length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_BBHLLLL, buf, offset, self.version, self.type, 0, self.xid, self.experimenter, self.subtype, self.status)
+        length = offset - start
+        _struct_H.pack_into(buf, start + 2, length)
+        return offset
+
+    def wire_length(self):
+        return 20
 
     @staticmethod
     def unpack(reader):
         obj = bsn_virtual_port_remove_reply()
-        _version = reader.read("!B")[0]
+        _version, _type, _length = reader.read_struct(_struct_BBH)
         assert(_version == 1)
-        _type = reader.read("!B")[0]
         assert(_type == 4)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        _experimenter = reader.read("!L")[0]
+        obj.xid, _experimenter, _subtype, obj.status = reader.read_struct(_struct_LLLL)
         assert(_experimenter == 6035143)
-        _subtype = reader.read("!L")[0]
         assert(_subtype == 26)
-        obj.status = reader.read("!L")[0]
         return obj
 
     def __eq__(self, other):
@@ -3884,6 +3569,7 @@ class bsn_virtual_port_remove_reply(bsn_header):
 bsn_header.subtypes[26] = bsn_virtual_port_remove_reply
 
 class bsn_virtual_port_remove_request(bsn_header):
+    __slots__ = ["vport_no"]
     version = 1
     type = 4
     experimenter = 6035143
@@ -3900,35 +3586,27 @@ class bsn_virtual_port_remove_request(bsn_header):
             self.vport_no = 0
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!L", self.experimenter))
-        packed.append(struct.pack("!L", self.subtype))
-        packed.append(struct.pack("!L", self.vport_no))
-        length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_BBHLLLL, buf, offset, self.version, self.type, 0, self.xid, self.experimenter, self.subtype, self.vport_no)
+        length = offset - start
+        _struct_H.pack_into(buf, start + 2, length)
+        return offset
+
+    def wire_length(self):
+        return 20
 
     @staticmethod
     def unpack(reader):
         obj = bsn_virtual_port_remove_request()
-        _version = reader.read("!B")[0]
+        _version, _type, _length = reader.read_struct(_struct_BBH)
         assert(_version == 1)
-        _type = reader.read("!B")[0]
         assert(_type == 4)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        _experimenter = reader.read("!L")[0]
+        obj.xid, _experimenter, _subtype, obj.vport_no = reader.read_struct(_struct_LLLL)
         assert(_experimenter == 6035143)
-        _subtype = reader.read("!L")[0]
         assert(_subtype == 17)
-        obj.vport_no = reader.read("!L")[0]
         return obj
 
     def __eq__(self, other):
@@ -3956,6 +3634,7 @@ class bsn_virtual_port_remove_request(bsn_header):
 bsn_header.subtypes[17] = bsn_virtual_port_remove_request
 
 class desc_stats_reply(stats_reply):
+    __slots__ = ["dp_desc", "hw_desc", "mfr_desc", "serial_num", "sw_desc"]
     version = 1
     type = 17
     stats_type = 0
@@ -3991,42 +3670,31 @@ class desc_stats_reply(stats_reply):
             self.dp_desc = ""
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!H", self.stats_type))
-        packed.append(struct.pack("!H", self.flags))
-        packed.append(struct.pack("!256s", self.mfr_desc))
-        packed.append(struct.pack("!256s", self.hw_desc))
-        packed.append(struct.pack("!256s", self.sw_desc))
-        packed.append(struct.pack("!32s", self.serial_num))
-        packed.append(struct.pack("!256s", self.dp_desc))
-        length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_BBHLHH256s256s256s32s256s, buf, offset, self.version, self.type, 0, self.xid, self.stats_type, self.flags, self.mfr_desc, self.hw_desc, self.sw_desc, self.serial_num, self.dp_desc)
+        length = offset - start
+        _struct_H.pack_into(buf, start + 2, length)
+        return offset
+
+    def wire_length(self):
+        return 1068
 
     @staticmethod
     def unpack(reader):
         obj = desc_stats_reply()
-        _version = reader.read("!B")[0]
+        _version, _type, _length = reader.read_struct(_struct_BBH)
         assert(_version == 1)
-        _type = reader.read("!B")[0]
         assert(_type == 17)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        _stats_type = reader.read("!H")[0]
+        obj.xid, _stats_type, obj.flags, obj.mfr_desc, obj.hw_desc, obj.sw_desc, obj.serial_num, obj.dp_desc = reader.read_struct(_struct_LHH256s256s256s32s256s)
         assert(_stats_type == 0)
-        obj.flags = reader.read("!H")[0]
-        obj.mfr_desc = reader.read("!256s")[0].rstrip("\x00")
-        obj.hw_desc = reader.read("!256s")[0].rstrip("\x00")
-        obj.sw_desc = reader.read("!256s")[0].rstrip("\x00")
-        obj.serial_num = reader.read("!32s")[0].rstrip("\x00")
-        obj.dp_desc = reader.read("!256s")[0].rstrip("\x00")
+        obj.mfr_desc = obj.mfr_desc.rstrip("\x00")
+        obj.hw_desc = obj.hw_desc.rstrip("\x00")
+        obj.sw_desc = obj.sw_desc.rstrip("\x00")
+        obj.serial_num = obj.serial_num.rstrip("\x00")
+        obj.dp_desc = obj.dp_desc.rstrip("\x00")
         return obj
 
     def __eq__(self, other):
@@ -4074,6 +3742,7 @@ class desc_stats_reply(stats_reply):
 stats_reply.subtypes[0] = desc_stats_reply
 
 class desc_stats_request(stats_request):
+    __slots__ = []
     version = 1
     type = 16
     stats_type = 0
@@ -4089,32 +3758,26 @@ class desc_stats_request(stats_request):
             self.flags = 0
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!H", self.stats_type))
-        packed.append(struct.pack("!H", self.flags))
-        length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_BBHLHH, buf, offset, self.version, self.type, 0, self.xid, self.stats_type, self.flags)
+        length = offset - start
+        _struct_H.pack_into(buf, start + 2, length)
+        return offset
+
+    def wire_length(self):
+        return 12
 
     @staticmethod
     def unpack(reader):
         obj = desc_stats_request()
-        _version = reader.read("!B")[0]
+        _version, _type, _length = reader.read_struct(_struct_BBH)
         assert(_version == 1)
-        _type = reader.read("!B")[0]
         assert(_type == 16)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        _stats_type = reader.read("!H")[0]
+        obj.xid, _stats_type, obj.flags = reader.read_struct(_struct_LHH)
         assert(_stats_type == 0)
-        obj.flags = reader.read("!H")[0]
         return obj
 
     def __eq__(self, other):
@@ -4142,6 +3805,7 @@ class desc_stats_request(stats_request):
 stats_request.subtypes[0] = desc_stats_request
 
 class echo_reply(message):
+    __slots__ = ["data"]
     version = 1
     type = 3
 
@@ -4156,29 +3820,27 @@ class echo_reply(message):
             self.data = ''
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(self.data)
-        length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_BBHL, buf, offset, self.version, self.type, 0, self.xid)
+        offset = loxi.generic_util.pack_bytes_into(self.data, buf, offset)
+        length = offset - start
+        _struct_H.pack_into(buf, start + 2, length)
+        return offset
+
+    def wire_length(self):
+        return 8 + len(self.data)
 
     @staticmethod
     def unpack(reader):
         obj = echo_reply()
-        _version = reader.read("!B")[0]
+        _version, _type, _length = reader.read_struct(_struct_BBH)
         assert(_version == 1)
-        _type = reader.read("!B")[0]
         assert(_type == 3)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
         obj.xid = reader.read("!L")[0]
-        obj.data = str(reader.read_all())
+        obj.data = reader.read_all()
         return obj
 
     def __eq__(self, other):
@@ -4206,6 +3868,7 @@ class echo_reply(message):
 message.subtypes[3] = echo_reply
 
 class echo_request(message):
+    __slots__ = ["data"]
     version = 1
     type = 2
 
@@ -4220,29 +3883,27 @@ class echo_request(message):
             self.data = ''
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(self.data)
-        length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_BBHL, buf, offset, self.version, self.type, 0, self.xid)
+        offset = loxi.generic_util.pack_bytes_into(self.data, buf, offset)
+        length = offset - start
+        _struct_H.pack_into(buf, start + 2, length)
+        return offset
+
+    def wire_length(self):
+        return 8 + len(self.data)
 
     @staticmethod
     def unpack(reader):
         obj = echo_request()
-        _version = reader.read("!B")[0]
+        _version, _type, _length = reader.read_struct(_struct_BBH)
         assert(_version == 1)
-        _type = reader.read("!B")[0]
         assert(_type == 2)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
         obj.xid = reader.read("!L")[0]
-        obj.data = str(reader.read_all())
+        obj.data = reader.read_all()
         return obj
 
     def __eq__(self, other):
@@ -4270,6 +3931,7 @@ class echo_request(message):
 message.subtypes[2] = echo_request
 
 class features_reply(message):
+    __slots__ = ["actions", "capabilities", "datapath_id", "n_buffers", "n_tables", "ports"]
     version = 1
     type = 6
 
@@ -4304,40 +3966,26 @@ class features_reply(message):
             self.ports = []
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!Q", self.datapath_id))
-        packed.append(struct.pack("!L", self.n_buffers))
-        packed.append(struct.pack("!B", self.n_tables))
-        packed.append('\x00' * 3)
-        packed.append(struct.pack("!L", self.capabilities))
-        packed.append(struct.pack("!L", self.actions))
-        packed.append(loxi.generic_util.pack_list(self.ports))
-        length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_BBHLQLB3xLL, buf, offset, self.version, self.type, 0, self.xid, self.datapath_id, self.n_buffers, self.n_tables, self.capabilities, self.actions)
+        offset = loxi.generic_util.pack_list_into(self.ports, buf, offset)
+        length = offset - start
+        _struct_H.pack_into(buf, start + 2, length)
+        return offset
+
+    def wire_length(self):
+        return 32 + loxi.generic_util.list_wire_length(self.ports)
 
     @staticmethod
     def unpack(reader):
         obj = features_reply()
-        _version = reader.read("!B")[0]
+        _version, _type, _length = reader.read_struct(_struct_BBH)
         assert(_version == 1)
-        _type = reader.read("!B")[0]
         assert(_type == 6)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        obj.datapath_id = reader.read("!Q")[0]
-        obj.n_buffers = reader.read("!L")[0]
-        obj.n_tables = reader.read("!B")[0]
-        reader.skip(3)
-        obj.capabilities = reader.read("!L")[0]
-        obj.actions = reader.read("!L")[0]
+        obj.xid, obj.datapath_id, obj.n_buffers, obj.n_tables, obj.capabilities, obj.actions = reader.read_struct(_struct_LQLB3xLL)
         obj.ports = loxi.generic_util.unpack_list(reader, ofp.common.port_desc.unpack)
         return obj
 
@@ -4386,6 +4034,7 @@ class features_reply(message):
 message.subtypes[6] = features_reply
 
 class features_request(message):
+    __slots__ = []
     version = 1
     type = 5
 
@@ -4396,24 +4045,22 @@ class features_request(message):
             self.xid = None
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_BBHL, buf, offset, self.version, self.type, 0, self.xid)
+        length = offset - start
+        _struct_H.pack_into(buf, start + 2, length)
+        return offset
+
+    def wire_length(self):
+        return 8
 
     @staticmethod
     def unpack(reader):
         obj = features_request()
-        _version = reader.read("!B")[0]
+        _version, _type, _length = reader.read_struct(_struct_BBH)
         assert(_version == 1)
-        _type = reader.read("!B")[0]
         assert(_type == 5)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
         obj.xid = reader.read("!L")[0]
@@ -4440,6 +4087,7 @@ class features_request(message):
 message.subtypes[5] = features_request
 
 class flow_mod(message):
+    __slots__ = ["_command", "actions", "buffer_id", "cookie", "flags", "hard_timeout", "idle_timeout", "match", "out_port", "priority"]
     subtypes = {}
 
     version = 1
@@ -4492,25 +4140,18 @@ class flow_mod(message):
             self.actions = []
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(self.match.pack())
-        packed.append(struct.pack("!Q", self.cookie))
-        packed.append(util.pack_fm_cmd(self._command))
-        packed.append(struct.pack("!H", self.idle_timeout))
-        packed.append(struct.pack("!H", self.hard_timeout))
-        packed.append(struct.pack("!H", self.priority))
-        packed.append(struct.pack("!L", self.buffer_id))
-        packed.append(util.pack_port_no(self.out_port))
-        packed.append(struct.pack("!H", self.flags))
-        packed.append(loxi.generic_util.pack_list(self.actions))
-        length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_BBHL, buf, offset, self.version, self.type, 0, self.xid)
+        offset = self.match.pack_into(buf, offset)
+        offset = loxi.generic_util.pack_struct_into(_struct_QHHHHLHH, buf, offset, self.cookie, self._command, self.idle_timeout, self.hard_timeout, self.priority, self.buffer_id, self.out_port, self.flags)
+        offset = loxi.generic_util.pack_list_into(self.actions, buf, offset)
+        length = offset - start
+        _struct_H.pack_into(buf, start + 2, length)
+        return offset
+
+    def wire_length(self):
+        return 32 + self.match.wire_length() + loxi.generic_util.list_wire_length(self.actions)
 
     @staticmethod
     def unpack(reader):
@@ -4520,23 +4161,14 @@ class flow_mod(message):
             return subclass.unpack(reader)
 
         obj = flow_mod()
-        _version = reader.read("!B")[0]
+        _version, _type, _length = reader.read_struct(_struct_BBH)
         assert(_version == 1)
-        _type = reader.read("!B")[0]
         assert(_type == 14)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
         obj.xid = reader.read("!L")[0]
         obj.match = ofp.match.unpack(reader)
-        obj.cookie = reader.read("!Q")[0]
-        obj._command = util.unpack_fm_cmd(reader)
-        obj.idle_timeout = reader.read("!H")[0]
-        obj.hard_timeout = reader.read("!H")[0]
-        obj.priority = reader.read("!H")[0]
-        obj.buffer_id = reader.read("!L")[0]
-        obj.out_port = util.unpack_port_no(reader)
-        obj.flags = reader.read("!H")[0]
+        obj.cookie, obj._command, obj.idle_timeout, obj.hard_timeout, obj.priority, obj.buffer_id, obj.out_port, obj.flags = reader.read_struct(_struct_QHHHHLHH)
         obj.actions = loxi.generic_util.unpack_list(reader, ofp.action.action.unpack)
         return obj
 
@@ -4598,6 +4230,7 @@ class flow_mod(message):
 message.subtypes[14] = flow_mod
 
 class flow_add(flow_mod):
+    __slots__ = []
     version = 1
     type = 14
     _command = 0
@@ -4645,47 +4278,31 @@ class flow_add(flow_mod):
             self.actions = []
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(self.match.pack())
-        packed.append(struct.pack("!Q", self.cookie))
-        packed.append(util.pack_fm_cmd(self._command))
-        packed.append(struct.pack("!H", self.idle_timeout))
-        packed.append(struct.pack("!H", self.hard_timeout))
-        packed.append(struct.pack("!H", self.priority))
-        packed.append(struct.pack("!L", self.buffer_id))
-        packed.append(util.pack_port_no(self.out_port))
-        packed.append(struct.pack("!H", self.flags))
-        packed.append(loxi.generic_util.pack_list(self.actions))
-        length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_BBHL, buf, offset, self.version, self.type, 0, self.xid)
+        offset = self.match.pack_into(buf, offset)
+        offset = loxi.generic_util.pack_struct_into(_struct_QHHHHLHH, buf, offset, self.cookie, self._command, self.idle_timeout, self.hard_timeout, self.priority, self.buffer_id, self.out_port, self.flags)
+        offset = loxi.generic_util.pack_list_into(self.actions, buf, offset)
+        length = offset - start
+        _struct_H.pack_into(buf, start + 2, length)
+        return offset
+
+    def wire_length(self):
+        return 32 + self.match.wire_length() + loxi.generic_util.list_wire_length(self.actions)
 
     @staticmethod
     def unpack(reader):
         obj = flow_add()
-        _version = reader.read("!B")[0]
+        _version, _type, _length = reader.read_struct(_struct_BBH)
         assert(_version == 1)
-        _type = reader.read("!B")[0]
         assert(_type == 14)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
         obj.xid = reader.read("!L")[0]
         obj.match = ofp.match.unpack(reader)
-        obj.cookie = reader.read("!Q")[0]
-        __command = util.unpack_fm_cmd(reader)
+        obj.cookie, __command, obj.idle_timeout, obj.hard_timeout, obj.priority, obj.buffer_id, obj.out_port, obj.flags = reader.read_struct(_struct_QHHHHLHH)
         assert(__command == 0)
-        obj.idle_timeout = reader.read("!H")[0]
-        obj.hard_timeout = reader.read("!H")[0]
-        obj.priority = reader.read("!H")[0]
-        obj.buffer_id = reader.read("!L")[0]
-        obj.out_port = util.unpack_port_no(reader)
-        obj.flags = reader.read("!H")[0]
         obj.actions = loxi.generic_util.unpack_list(reader, ofp.action.action.unpack)
         return obj
 
@@ -4746,6 +4363,7 @@ class flow_add(flow_mod):
 flow_mod.subtypes[0] = flow_add
 
 class flow_delete(flow_mod):
+    __slots__ = []
     version = 1
     type = 14
     _command = 3
@@ -4793,47 +4411,31 @@ class flow_delete(flow_mod):
             self.actions = []
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(self.match.pack())
-        packed.append(struct.pack("!Q", self.cookie))
-        packed.append(util.pack_fm_cmd(self._command))
-        packed.append(struct.pack("!H", self.idle_timeout))
-        packed.append(struct.pack("!H", self.hard_timeout))
-        packed.append(struct.pack("!H", self.priority))
-        packed.append(struct.pack("!L", self.buffer_id))
-        packed.append(util.pack_port_no(self.out_port))
-        packed.append(struct.pack("!H", self.flags))
-        packed.append(loxi.generic_util.pack_list(self.actions))
-        length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_BBHL, buf, offset, self.version, self.type, 0, self.xid)
+        offset = self.match.pack_into(buf, offset)
+        offset = loxi.generic_util.pack_struct_into(_struct_QHHHHLHH, buf, offset, self.cookie, self._command, self.idle_timeout, self.hard_timeout, self.priority, self.buffer_id, self.out_port, self.flags)
+        offset = loxi.generic_util.pack_list_into(self.actions, buf, offset)
+        length = offset - start
+        _struct_H.pack_into(buf, start + 2, length)
+        return offset
+
+    def wire_length(self):
+        return 32 + self.match.wire_length() + loxi.generic_util.list_wire_length(self.actions)
 
     @staticmethod
     def unpack(reader):
         obj = flow_delete()
-        _version = reader.read("!B")[0]
+        _version, _type, _length = reader.read_struct(_struct_BBH)
         assert(_version == 1)
-        _type = reader.read("!B")[0]
         assert(_type == 14)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
         obj.xid = reader.read("!L")[0]
         obj.match = ofp.match.unpack(reader)
-        obj.cookie = reader.read("!Q")[0]
-        __command = util.unpack_fm_cmd(reader)
+        obj.cookie, __command, obj.idle_timeout, obj.hard_timeout, obj.priority, obj.buffer_id, obj.out_port, obj.flags = reader.read_struct(_struct_QHHHHLHH)
         assert(__command == 3)
-        obj.idle_timeout = reader.read("!H")[0]
-        obj.hard_timeout = reader.read("!H")[0]
-        obj.priority = reader.read("!H")[0]
-        obj.buffer_id = reader.read("!L")[0]
-        obj.out_port = util.unpack_port_no(reader)
-        obj.flags = reader.read("!H")[0]
         obj.actions = loxi.generic_util.unpack_list(reader, ofp.action.action.unpack)
         return obj
 
@@ -4894,6 +4496,7 @@ class flow_delete(flow_mod):
 flow_mod.subtypes[3] = flow_delete
 
 class flow_delete_strict(flow_mod):
+    __slots__ = []
     version = 1
     type = 14
     _command = 4
@@ -4941,47 +4544,31 @@ class flow_delete_strict(flow_mod):
             self.actions = []
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(self.match.pack())
-        packed.append(struct.pack("!Q", self.cookie))
-        packed.append(util.pack_fm_cmd(self._command))
-        packed.append(struct.pack("!H", self.idle_timeout))
-        packed.append(struct.pack("!H", self.hard_timeout))
-        packed.append(struct.pack("!H", self.priority))
-        packed.append(struct.pack("!L", self.buffer_id))
-        packed.append(util.pack_port_no(self.out_port))
-        packed.append(struct.pack("!H", self.flags))
-        packed.append(loxi.generic_util.pack_list(self.actions))
-        length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_BBHL, buf, offset, self.version, self.type, 0, self.xid)
+        offset = self.match.pack_into(buf, offset)
+        offset = loxi.generic_util.pack_struct_into(_struct_QHHHHLHH, buf, offset, self.cookie, self._command, self.idle_timeout, self.hard_timeout, self.priority, self.buffer_id, self.out_port, self.flags)
+        offset = loxi.generic_util.pack_list_into(self.actions, buf, offset)
+        length = offset - start
+        _struct_H.pack_into(buf, start + 2, length)
+        return offset
+
+    def wire_length(self):
+        return 32 + self.match.wire_length() + loxi.generic_util.list_wire_length(self.actions)
 
     @staticmethod
     def unpack(reader):
         obj = flow_delete_strict()
-        _version = reader.read("!B")[0]
+        _version, _type, _length = reader.read_struct(_struct_BBH)
         assert(_version == 1)
-        _type = reader.read("!B")[0]
         assert(_type == 14)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
         obj.xid = reader.read("!L")[0]
         obj.match = ofp.match.unpack(reader)
-        obj.cookie = reader.read("!Q")[0]
-        __command = util.unpack_fm_cmd(reader)
+        obj.cookie, __command, obj.idle_timeout, obj.hard_timeout, obj.priority, obj.buffer_id, obj.out_port, obj.flags = reader.read_struct(_struct_QHHHHLHH)
         assert(__command == 4)
-        obj.idle_timeout = reader.read("!H")[0]
-        obj.hard_timeout = reader.read("!H")[0]
-        obj.priority = reader.read("!H")[0]
-        obj.buffer_id = reader.read("!L")[0]
-        obj.out_port = util.unpack_port_no(reader)
-        obj.flags = reader.read("!H")[0]
         obj.actions = loxi.generic_util.unpack_list(reader, ofp.action.action.unpack)
         return obj
 
@@ -5042,6 +4629,7 @@ class flow_delete_strict(flow_mod):
 flow_mod.subtypes[4] = flow_delete_strict
 
 class flow_mod_failed_error_msg(error_msg):
+    __slots__ = ["code", "data"]
     version = 1
     type = 1
     err_type = 3
@@ -5061,34 +4649,28 @@ class flow_mod_failed_error_msg(error_msg):
             self.data = ''
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!H", self.err_type))
-        packed.append(struct.pack("!H", self.code))
-        packed.append(self.data)
-        length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_BBHLHH, buf, offset, self.version, self.type, 0, self.xid, self.err_type, self.code)
+        offset = loxi.generic_util.pack_bytes_into(self.data, buf, offset)
+        length = offset - start
+        _struct_H.pack_into(buf, start + 2, length)
+        return offset
+
+    def wire_length(self):
+        return 12 + len(self.data)
 
     @staticmethod
     def unpack(reader):
         obj = flow_mod_failed_error_msg()
-        _version = reader.read("!B")[0]
+        _version, _type, _length = reader.read_struct(_struct_BBH)
         assert(_version == 1)
-        _type = reader.read("!B")[0]
         assert(_type == 1)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        _err_type = reader.read("!H")[0]
+        obj.xid, _err_type, obj.code = reader.read_struct(_struct_LHH)
         assert(_err_type == 3)
-        obj.code = reader.read("!H")[0]
-        obj.data = str(reader.read_all())
+        obj.data = reader.read_all()
         return obj
 
     def __eq__(self, other):
@@ -5120,6 +4702,7 @@ class flow_mod_failed_error_msg(error_msg):
 error_msg.subtypes[3] = flow_mod_failed_error_msg
 
 class flow_modify(flow_mod):
+    __slots__ = []
     version = 1
     type = 14
     _command = 1
@@ -5167,47 +4750,31 @@ class flow_modify(flow_mod):
             self.actions = []
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(self.match.pack())
-        packed.append(struct.pack("!Q", self.cookie))
-        packed.append(util.pack_fm_cmd(self._command))
-        packed.append(struct.pack("!H", self.idle_timeout))
-        packed.append(struct.pack("!H", self.hard_timeout))
-        packed.append(struct.pack("!H", self.priority))
-        packed.append(struct.pack("!L", self.buffer_id))
-        packed.append(util.pack_port_no(self.out_port))
-        packed.append(struct.pack("!H", self.flags))
-        packed.append(loxi.generic_util.pack_list(self.actions))
-        length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_BBHL, buf, offset, self.version, self.type, 0, self.xid)
+        offset = self.match.pack_into(buf, offset)
+        offset = loxi.generic_util.pack_struct_into(_struct_QHHHHLHH, buf, offset, self.cookie, self._command, self.idle_timeout, self.hard_timeout, self.priority, self.buffer_id, self.out_port, self.flags)
+        offset = loxi.generic_util.pack_list_into(self.actions, buf, offset)
+        length = offset - start
+        _struct_H.pack_into(buf, start + 2, length)
+        return offset
+
+    def wire_length(self):
+        return 32 + self.match.wire_length() + loxi.generic_util.list_wire_length(self.actions)
 
     @staticmethod
     def unpack(reader):
         obj = flow_modify()
-        _version = reader.read("!B")[0]
+        _version, _type, _length = reader.read_struct(_struct_BBH)
         assert(_version == 1)
-        _type = reader.read("!B")[0]
         assert(_type == 14)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
         obj.xid = reader.read("!L")[0]
         obj.match = ofp.match.unpack(reader)
-        obj.cookie = reader.read("!Q")[0]
-        __command = util.unpack_fm_cmd(reader)
+        obj.cookie, __command, obj.idle_timeout, obj.hard_timeout, obj.priority, obj.buffer_id, obj.out_port, obj.flags = reader.read_struct(_struct_QHHHHLHH)
         assert(__command == 1)
-        obj.idle_timeout = reader.read("!H")[0]
-        obj.hard_timeout = reader.read("!H")[0]
-        obj.priority = reader.read("!H")[0]
-        obj.buffer_id = reader.read("!L")[0]
-        obj.out_port = util.unpack_port_no(reader)
-        obj.flags = reader.read("!H")[0]
         obj.actions = loxi.generic_util.unpack_list(reader, ofp.action.action.unpack)
         return obj
 
@@ -5268,6 +4835,7 @@ class flow_modify(flow_mod):
 flow_mod.subtypes[1] = flow_modify
 
 class flow_modify_strict(flow_mod):
+    __slots__ = []
     version = 1
     type = 14
     _command = 2
@@ -5315,47 +4883,31 @@ class flow_modify_strict(flow_mod):
             self.actions = []
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(self.match.pack())
-        packed.append(struct.pack("!Q", self.cookie))
-        packed.append(util.pack_fm_cmd(self._command))
-        packed.append(struct.pack("!H", self.idle_timeout))
-        packed.append(struct.pack("!H", self.hard_timeout))
-        packed.append(struct.pack("!H", self.priority))
-        packed.append(struct.pack("!L", self.buffer_id))
-        packed.append(util.pack_port_no(self.out_port))
-        packed.append(struct.pack("!H", self.flags))
-        packed.append(loxi.generic_util.pack_list(self.actions))
-        length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_BBHL, buf, offset, self.version, self.type, 0, self.xid)
+        offset = self.match.pack_into(buf, offset)
+        offset = loxi.generic_util.pack_struct_into(_struct_QHHHHLHH, buf, offset, self.cookie, self._command, self.idle_timeout, self.hard_timeout, self.priority, self.buffer_id, self.out_port, self.flags)
+        offset = loxi.generic_util.pack_list_into(self.actions, buf, offset)
+        length = offset - start
+        _struct_H.pack_into(buf, start + 2, length)
+        return offset
+
+    def wire_length(self):
+        return 32 + self.match.wire_length() + loxi.generic_util.list_wire_length(self.actions)
 
     @staticmethod
     def unpack(reader):
         obj = flow_modify_strict()
-        _version = reader.read("!B")[0]
+        _version, _type, _length = reader.read_struct(_struct_BBH)
         assert(_version == 1)
-        _type = reader.read("!B")[0]
         assert(_type == 14)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
         obj.xid = reader.read("!L")[0]
         obj.match = ofp.match.unpack(reader)
-        obj.cookie = reader.read("!Q")[0]
-        __command = util.unpack_fm_cmd(reader)
+        obj.cookie, __command, obj.idle_timeout, obj.hard_timeout, obj.priority, obj.buffer_id, obj.out_port, obj.flags = reader.read_struct(_struct_QHHHHLHH)
         assert(__command == 2)
-        obj.idle_timeout = reader.read("!H")[0]
-        obj.hard_timeout = reader.read("!H")[0]
-        obj.priority = reader.read("!H")[0]
-        obj.buffer_id = reader.read("!L")[0]
-        obj.out_port = util.unpack_port_no(reader)
-        obj.flags = reader.read("!H")[0]
         obj.actions = loxi.generic_util.unpack_list(reader, ofp.action.action.unpack)
         return obj
 
@@ -5416,6 +4968,7 @@ class flow_modify_strict(flow_mod):
 flow_mod.subtypes[2] = flow_modify_strict
 
 class flow_removed(message):
+    __slots__ = ["byte_count", "cookie", "duration_nsec", "duration_sec", "idle_timeout", "match", "packet_count", "priority", "reason"]
     version = 1
     type = 11
 
@@ -5462,49 +5015,29 @@ class flow_removed(message):
             self.byte_count = 0
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(self.match.pack())
-        packed.append(struct.pack("!Q", self.cookie))
-        packed.append(struct.pack("!H", self.priority))
-        packed.append(struct.pack("!B", self.reason))
-        packed.append('\x00' * 1)
-        packed.append(struct.pack("!L", self.duration_sec))
-        packed.append(struct.pack("!L", self.duration_nsec))
-        packed.append(struct.pack("!H", self.idle_timeout))
-        packed.append('\x00' * 2)
-        packed.append(struct.pack("!Q", self.packet_count))
-        packed.append(struct.pack("!Q", self.byte_count))
-        length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_BBHL, buf, offset, self.version, self.type, 0, self.xid)
+        offset = self.match.pack_into(buf, offset)
+        offset = loxi.generic_util.pack_struct_into(_struct_QHBxLLH2xQQ, buf, offset, self.cookie, self.priority, self.reason, self.duration_sec, self.duration_nsec, self.idle_timeout, self.packet_count, self.byte_count)
+        length = offset - start
+        _struct_H.pack_into(buf, start + 2, length)
+        return offset
+
+    def wire_length(self):
+        return 48 + self.match.wire_length()
 
     @staticmethod
     def unpack(reader):
         obj = flow_removed()
-        _version = reader.read("!B")[0]
+        _version, _type, _length = reader.read_struct(_struct_BBH)
         assert(_version == 1)
-        _type = reader.read("!B")[0]
         assert(_type == 11)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
         obj.xid = reader.read("!L")[0]
         obj.match = ofp.match.unpack(reader)
-        obj.cookie = reader.read("!Q")[0]
-        obj.priority = reader.read("!H")[0]
-        obj.reason = reader.read("!B")[0]
-        reader.skip(1)
-        obj.duration_sec = reader.read("!L")[0]
-        obj.duration_nsec = reader.read("!L")[0]
-        obj.idle_timeout = reader.read("!H")[0]
-        reader.skip(2)
-        obj.packet_count = reader.read("!Q")[0]
-        obj.byte_count = reader.read("!Q")[0]
+        obj.cookie, obj.priority, obj.reason, obj.duration_sec, obj.duration_nsec, obj.idle_timeout, obj.packet_count, obj.byte_count = reader.read_struct(_struct_QHBxLLH2xQQ)
         return obj
 
     def __eq__(self, other):
@@ -5564,6 +5097,7 @@ class flow_removed(message):
 message.subtypes[11] = flow_removed
 
 class flow_stats_reply(stats_reply):
+    __slots__ = ["entries"]
     version = 1
     type = 17
     stats_type = 1
@@ -5583,33 +5117,27 @@ class flow_stats_reply(stats_reply):
             self.entries = []
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!H", self.stats_type))
-        packed.append(struct.pack("!H", self.flags))
-        packed.append(loxi.generic_util.pack_list(self.entries))
-        length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_BBHLHH, buf, offset, self.version, self.type, 0, self.xid, self.stats_type, self.flags)
+        offset = loxi.generic_util.pack_list_into(self.entries, buf, offset)
+        length = offset - start
+        _struct_H.pack_into(buf, start + 2, length)
+        return offset
+
+    def wire_length(self):
+        return 12 + loxi.generic_util.list_wire_length(self.entries)
 
     @staticmethod
     def unpack(reader):
         obj = flow_stats_reply()
-        _version = reader.read("!B")[0]
+        _version, _type, _length = reader.read_struct(_struct_BBH)
         assert(_version == 1)
-        _type = reader.read("!B")[0]
         assert(_type == 17)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        _stats_type = reader.read("!H")[0]
+        obj.xid, _stats_type, obj.flags = reader.read_struct(_struct_LHH)
         assert(_stats_type == 1)
-        obj.flags = reader.read("!H")[0]
         obj.entries = loxi.generic_util.unpack_list(reader, ofp.common.flow_stats_entry.unpack)
         return obj
 
@@ -5642,6 +5170,7 @@ class flow_stats_reply(stats_reply):
 stats_reply.subtypes[1] = flow_stats_reply
 
 class flow_stats_request(stats_request):
+    __slots__ = ["match", "out_port", "table_id"]
     version = 1
     type = 16
     stats_type = 1
@@ -5669,40 +5198,30 @@ class flow_stats_request(stats_request):
             self.out_port = 0
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!H", self.stats_type))
-        packed.append(struct.pack("!H", self.flags))
-        packed.append(self.match.pack())
-        packed.append(struct.pack("!B", self.table_id))
-        packed.append('\x00' * 1)
-        packed.append(util.pack_port_no(self.out_port))
-        length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_BBHLHH, buf, offset, self.version, self.type, 0, self.xid, self.stats_type, self.flags)
+        offset = self.match.pack_into(buf, offset)
+        offset = loxi.generic_util.pack_struct_into(_struct_BxH, buf, offset, self.table_id, self.out_port)
+        length = offset - start
+        _struct_H.pack_into(buf, start + 2, length)
+        return offset
+
+    def wire_length(self):
+        return 16 + self.match.wire_length()
 
     @staticmethod
     def unpack(reader):
         obj = flow_stats_request()
-        _version = reader.read("!B")[0]
+        _version, _type, _length = reader.read_struct(_struct_BBH)
         assert(_version == 1)
-        _type = reader.read("!B")[0]
         assert(_type == 16)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        _stats_type = reader.read("!H")[0]
+        obj.xid, _stats_type, obj.flags = reader.read_struct(_struct_LHH)
         assert(_stats_type == 1)
-        obj.flags = reader.read("!H")[0]
         obj.match = ofp.match.unpack(reader)
-        obj.table_id = reader.read("!B")[0]
-        reader.skip(1)
-        obj.out_port = util.unpack_port_no(reader)
+        obj.table_id, obj.out_port = reader.read_struct(_struct_BxH)
         return obj
 
     def __eq__(self, other):
@@ -5742,6 +5261,7 @@ class flow_stats_request(stats_request):
 stats_request.subtypes[1] = flow_stats_request
 
 class get_config_reply(message):
+    __slots__ = ["flags", "miss_send_len"]
     version = 1
     type = 8
 
@@ -5760,31 +5280,25 @@ class get_config_reply(message):
             self.miss_send_len = 0
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!H", self.flags))
-        packed.append(struct.pack("!H", self.miss_send_len))
-        length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_BBHLHH, buf, offset, self.version, self.type, 0, self.xid, self.flags, self.miss_send_len)
+        length = offset - start
+        _struct_H.pack_into(buf, start + 2, length)
+        return offset
+
+    def wire_length(self):
+        return 12
 
     @staticmethod
     def unpack(reader):
         obj = get_config_reply()
-        _version = reader.read("!B")[0]
+        _version, _type, _length = reader.read_struct(_struct_BBH)
         assert(_version == 1)
-        _type = reader.read("!B")[0]
         assert(_type == 8)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        obj.flags = reader.read("!H")[0]
-        obj.miss_send_len = reader.read("!H")[0]
+        obj.xid, obj.flags, obj.miss_send_len = reader.read_struct(_struct_LHH)
         return obj
 
     def __eq__(self, other):
@@ -5816,6 +5330,7 @@ class get_config_reply(message):
 message.subtypes[8] = get_config_reply
 
 class get_config_request(message):
+    __slots__ = []
     version = 1
     type = 7
 
@@ -5826,24 +5341,22 @@ class get_config_request(message):
             self.xid = None
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_BBHL, buf, offset, self.version, self.type, 0, self.xid)
+        length = offset - start
+        _struct_H.pack_into(buf, start + 2, length)
+        return offset
+
+    def wire_length(self):
+        return 8
 
     @staticmethod
     def unpack(reader):
         obj = get_config_request()
-        _version = reader.read("!B")[0]
+        _version, _type, _length = reader.read_struct(_struct_BBH)
         assert(_version == 1)
-        _type = reader.read("!B")[0]
         assert(_type == 7)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
         obj.xid = reader.read("!L")[0]
@@ -5870,6 +5383,7 @@ class get_config_request(message):
 message.subtypes[7] = get_config_request
 
 class hello(message):
+    __slots__ = []
     version = 1
     type = 0
 
@@ -5880,24 +5394,22 @@ class hello(message):
             self.xid = None
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_BBHL, buf, offset, self.version, self.type, 0, self.xid)
+        length = offset - start
+        _struct_H.pack_into(buf, start + 2, length)
+        return offset
+
+    def wire_length(self):
+        return 8
 
     @staticmethod
     def unpack(reader):
         obj = hello()
-        _version = reader.read("!B")[0]
+        _version, _type, _length = reader.read_struct(_struct_BBH)
         assert(_version == 1)
-        _type = reader.read("!B")[0]
         assert(_type == 0)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
         obj.xid = reader.read("!L")[0]
@@ -5924,6 +5436,7 @@ class hello(message):
 message.subtypes[0] = hello
 
 class hello_failed_error_msg(error_msg):
+    __slots__ = ["code", "data"]
     version = 1
     type = 1
     err_type = 0
@@ -5943,34 +5456,28 @@ class hello_failed_error_msg(error_msg):
             self.data = ''
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!H", self.err_type))
-        packed.append(struct.pack("!H", self.code))
-        packed.append(self.data)
-        length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_BBHLHH, buf, offset, self.version, self.type, 0, self.xid, self.err_type, self.code)
+        offset = loxi.generic_util.pack_bytes_into(self.data, buf, offset)
+        length = offset - start
+        _struct_H.pack_into(buf, start + 2, length)
+        return offset
+
+    def wire_length(self):
+        return 12 + len(self.data)
 
     @staticmethod
     def unpack(reader):
         obj = hello_failed_error_msg()
-        _version = reader.read("!B")[0]
+        _version, _type, _length = reader.read_struct(_struct_BBH)
         assert(_version == 1)
-        _type = reader.read("!B")[0]
         assert(_type == 1)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        _err_type = reader.read("!H")[0]
+        obj.xid, _err_type, obj.code = reader.read_struct(_struct_LHH)
         assert(_err_type == 0)
-        obj.code = reader.read("!H")[0]
-        obj.data = str(reader.read_all())
+        obj.data = reader.read_all()
         return obj
 
     def __eq__(self, other):
@@ -6002,6 +5509,7 @@ class hello_failed_error_msg(error_msg):
 error_msg.subtypes[0] = hello_failed_error_msg
 
 class nicira_header(experimenter):
+    __slots__ = ["subtype"]
     subtypes = {}
 
     version = 1
@@ -6019,17 +5527,15 @@ class nicira_header(experimenter):
             self.subtype = 0
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!L", self.experimenter))
-        packed.append(struct.pack("!L", self.subtype))
-        length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_BBHLLL, buf, offset, self.version, self.type, 0, self.xid, self.experimenter, self.subtype)
+        length = offset - start
+        _struct_H.pack_into(buf, start + 2, length)
+        return offset
+
+    def wire_length(self):
+        return 16
 
     @staticmethod
     def unpack(reader):
@@ -6039,17 +5545,13 @@ class nicira_header(experimenter):
             return subclass.unpack(reader)
 
         obj = nicira_header()
-        _version = reader.read("!B")[0]
+        _version, _type, _length = reader.read_struct(_struct_BBH)
         assert(_version == 1)
-        _type = reader.read("!B")[0]
         assert(_type == 4)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        _experimenter = reader.read("!L")[0]
+        obj.xid, _experimenter, obj.subtype = reader.read_struct(_struct_LLL)
         assert(_experimenter == 8992)
-        obj.subtype = reader.read("!L")[0]
         return obj
 
     def __eq__(self, other):
@@ -6074,6 +5576,7 @@ class nicira_header(experimenter):
 experimenter.subtypes[8992] = nicira_header
 
 class nicira_controller_role_reply(nicira_header):
+    __slots__ = ["role"]
     version = 1
     type = 4
     experimenter = 8992
@@ -6090,35 +5593,27 @@ class nicira_controller_role_reply(nicira_header):
             self.role = 0
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!L", self.experimenter))
-        packed.append(struct.pack("!L", self.subtype))
-        packed.append(struct.pack("!L", self.role))
-        length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_BBHLLLL, buf, offset, self.version, self.type, 0, self.xid, self.experimenter, self.subtype, self.role)
+        length = offset - start
+        _struct_H.pack_into(buf, start + 2, length)
+        return offset
+
+    def wire_length(self):
+        return 20
 
     @staticmethod
     def unpack(reader):
         obj = nicira_controller_role_reply()
-        _version = reader.read("!B")[0]
+        _version, _type, _length = reader.read_struct(_struct_BBH)
         assert(_version == 1)
-        _type = reader.read("!B")[0]
         assert(_type == 4)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        _experimenter = reader.read("!L")[0]
+        obj.xid, _experimenter, _subtype, obj.role = reader.read_struct(_struct_LLLL)
         assert(_experimenter == 8992)
-        _subtype = reader.read("!L")[0]
         assert(_subtype == 11)
-        obj.role = reader.read("!L")[0]
         return obj
 
     def __eq__(self, other):
@@ -6146,6 +5641,7 @@ class nicira_controller_role_reply(nicira_header):
 nicira_header.subtypes[11] = nicira_controller_role_reply
 
 class nicira_controller_role_request(nicira_header):
+    __slots__ = ["role"]
     version = 1
     type = 4
     experimenter = 8992
@@ -6162,35 +5658,27 @@ class nicira_controller_role_request(nicira_header):
             self.role = 0
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!L", self.experimenter))
-        packed.append(struct.pack("!L", self.subtype))
-        packed.append(struct.pack("!L", self.role))
-        length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_BBHLLLL, buf, offset, self.version, self.type, 0, self.xid, self.experimenter, self.subtype, self.role)
+        length = offset - start
+        _struct_H.pack_into(buf, start + 2, length)
+        return offset
+
+    def wire_length(self):
+        return 20
 
     @staticmethod
     def unpack(reader):
         obj = nicira_controller_role_request()
-        _version = reader.read("!B")[0]
+        _version, _type, _length = reader.read_struct(_struct_BBH)
         assert(_version == 1)
-        _type = reader.read("!B")[0]
         assert(_type == 4)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        _experimenter = reader.read("!L")[0]
+        obj.xid, _experimenter, _subtype, obj.role = reader.read_struct(_struct_LLLL)
         assert(_experimenter == 8992)
-        _subtype = reader.read("!L")[0]
         assert(_subtype == 10)
-        obj.role = reader.read("!L")[0]
         return obj
 
     def __eq__(self, other):
@@ -6218,6 +5706,7 @@ class nicira_controller_role_request(nicira_header):
 nicira_header.subtypes[10] = nicira_controller_role_request
 
 class packet_in(message):
+    __slots__ = ["buffer_id", "data", "in_port", "reason", "total_len"]
     version = 1
     type = 10
 
@@ -6248,39 +5737,27 @@ class packet_in(message):
             self.data = ''
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!L", self.buffer_id))
-        packed.append(struct.pack("!H", self.total_len))
-        packed.append(util.pack_port_no(self.in_port))
-        packed.append(struct.pack("!B", self.reason))
-        packed.append('\x00' * 1)
-        packed.append(self.data)
-        length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_BBHLLHHBx, buf, offset, self.version, self.type, 0, self.xid, self.buffer_id, self.total_len, self.in_port, self.reason)
+        offset = loxi.generic_util.pack_bytes_into(self.data, buf, offset)
+        length = offset - start
+        _struct_H.pack_into(buf, start + 2, length)
+        return offset
+
+    def wire_length(self):
+        return 18 + len(self.data)
 
     @staticmethod
     def unpack(reader):
         obj = packet_in()
-        _version = reader.read("!B")[0]
+        _version, _type, _length = reader.read_struct(_struct_BBH)
         assert(_version == 1)
-        _type = reader.read("!B")[0]
         assert(_type == 10)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        obj.buffer_id = reader.read("!L")[0]
-        obj.total_len = reader.read("!H")[0]
-        obj.in_port = util.unpack_port_no(reader)
-        obj.reason = reader.read("!B")[0]
-        reader.skip(1)
-        obj.data = str(reader.read_all())
+        obj.xid, obj.buffer_id, obj.total_len, obj.in_port, obj.reason = reader.read_struct(_struct_LLHHBx)
+        obj.data = reader.read_all()
         return obj
 
     def __eq__(self, other):
@@ -6324,6 +5801,7 @@ class packet_in(message):
 message.subtypes[10] = packet_in
 
 class packet_out(message):
+    __slots__ = ["actions", "buffer_id", "data", "in_port"]
     version = 1
     type = 13
 
@@ -6350,38 +5828,31 @@ class packet_out(message):
             self.data = ''
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!L", self.buffer_id))
-        packed.append(util.pack_port_no(self.in_port))
-        packed.append(struct.pack("!H", 0)) # placeholder for actions_len at index 6
-        packed.append(loxi.generic_util.pack_list(self.actions))
-        packed[6] = struct.pack("!H", len(packed[-1]))
-        packed.append(self.data)
-        length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_BBHLLHH, buf, offset, self.version, self.type, 0, self.xid, self.buffer_id, self.in_port, 0)
+        mark = offset
+        offset = loxi.generic_util.pack_list_into(self.actions, buf, offset)
+        _struct_H.pack_into(buf, start + 14, offset - mark)
+        offset = loxi.generic_util.pack_bytes_into(self.data, buf, offset)
+        length = offset - start
+        _struct_H.pack_into(buf, start + 2, length)
+        return offset
+
+    def wire_length(self):
+        return 16 + loxi.generic_util.list_wire_length(self.actions) + len(self.data)
 
     @staticmethod
     def unpack(reader):
         obj = packet_out()
-        _version = reader.read("!B")[0]
+        _version, _type, _length = reader.read_struct(_struct_BBH)
         assert(_version == 1)
-        _type = reader.read("!B")[0]
         assert(_type == 13)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        obj.buffer_id = reader.read("!L")[0]
-        obj.in_port = util.unpack_port_no(reader)
-        _actions_len = reader.read("!H")[0]
+        obj.xid, obj.buffer_id, obj.in_port, _actions_len = reader.read_struct(_struct_LLHH)
         obj.actions = loxi.generic_util.unpack_list(reader.slice(_actions_len), ofp.action.action.unpack)
-        obj.data = str(reader.read_all())
+        obj.data = reader.read_all()
         return obj
 
     def __eq__(self, other):
@@ -6421,6 +5892,7 @@ class packet_out(message):
 message.subtypes[13] = packet_out
 
 class port_mod(message):
+    __slots__ = ["advertise", "config", "hw_addr", "mask", "port_no"]
     version = 1
     type = 15
 
@@ -6451,39 +5923,29 @@ class port_mod(message):
             self.advertise = 0
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(util.pack_port_no(self.port_no))
-        packed.append(struct.pack("!6B", *self.hw_addr))
-        packed.append(struct.pack("!L", self.config))
-        packed.append(struct.pack("!L", self.mask))
-        packed.append(struct.pack("!L", self.advertise))
-        packed.append('\x00' * 4)
-        length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_BBHLH, buf, offset, self.version, self.type, 0, self.xid, self.port_no)
+        offset = loxi.generic_util.pack_struct_into(_struct_6B, buf, offset, *self.hw_addr)
+        offset = loxi.generic_util.pack_struct_into(_struct_LLL4x, buf, offset, self.config, self.mask, self.advertise)
+        length = offset - start
+        _struct_H.pack_into(buf, start + 2, length)
+        return offset
+
+    def wire_length(self):
+        return 32
 
     @staticmethod
     def unpack(reader):
         obj = port_mod()
-        _version = reader.read("!B")[0]
+        _version, _type, _length = reader.read_struct(_struct_BBH)
         assert(_version == 1)
-        _type = reader.read("!B")[0]
         assert(_type == 15)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        obj.port_no = util.unpack_port_no(reader)
+        obj.xid, obj.port_no = reader.read_struct(_struct_LH)
         obj.hw_addr = list(reader.read('!6B'))
-        obj.config = reader.read("!L")[0]
-        obj.mask = reader.read("!L")[0]
-        obj.advertise = reader.read("!L")[0]
-        reader.skip(4)
+        obj.config, obj.mask, obj.advertise = reader.read_struct(_struct_LLL4x)
         return obj
 
     def __eq__(self, other):
@@ -6527,6 +5989,7 @@ class port_mod(message):
 message.subtypes[15] = port_mod
 
 class port_mod_failed_error_msg(error_msg):
+    __slots__ = ["code", "data"]
     version = 1
     type = 1
     err_type = 4
@@ -6546,34 +6009,28 @@ class port_mod_failed_error_msg(error_msg):
             self.data = ''
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!H", self.err_type))
-        packed.append(struct.pack("!H", self.code))
-        packed.append(self.data)
-        length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_BBHLHH, buf, offset, self.version, self.type, 0, self.xid, self.err_type, self.code)
+        offset = loxi.generic_util.pack_bytes_into(self.data, buf, offset)
+        length = offset - start
+        _struct_H.pack_into(buf, start + 2, length)
+        return offset
+
+    def wire_length(self):
+        return 12 + len(self.data)
 
     @staticmethod
     def unpack(reader):
         obj = port_mod_failed_error_msg()
-        _version = reader.read("!B")[0]
+        _version, _type, _length = reader.read_struct(_struct_BBH)
         assert(_version == 1)
-        _type = reader.read("!B")[0]
         assert(_type == 1)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        _err_type = reader.read("!H")[0]
+        obj.xid, _err_type, obj.code = reader.read_struct(_struct_LHH)
         assert(_err_type == 4)
-        obj.code = reader.read("!H")[0]
-        obj.data = str(reader.read_all())
+        obj.data = reader.read_all()
         return obj
 
     def __eq__(self, other):
@@ -6605,6 +6062,7 @@ class port_mod_failed_error_msg(error_msg):
 error_msg.subtypes[4] = port_mod_failed_error_msg
 
 class port_stats_reply(stats_reply):
+    __slots__ = ["entries"]
     version = 1
     type = 17
     stats_type = 4
@@ -6624,33 +6082,27 @@ class port_stats_reply(stats_reply):
             self.entries = []
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!H", self.stats_type))
-        packed.append(struct.pack("!H", self.flags))
-        packed.append(loxi.generic_util.pack_list(self.entries))
-        length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_BBHLHH, buf, offset, self.version, self.type, 0, self.xid, self.stats_type, self.flags)
+        offset = loxi.generic_util.pack_list_into(self.entries, buf, offset)
+        length = offset - start
+        _struct_H.pack_into(buf, start + 2, length)
+        return offset
+
+    def wire_length(self):
+        return 12 + loxi.generic_util.list_wire_length(self.entries)
 
     @staticmethod
     def unpack(reader):
         obj = port_stats_reply()
-        _version = reader.read("!B")[0]
+        _version, _type, _length = reader.read_struct(_struct_BBH)
         assert(_version == 1)
-        _type = reader.read("!B")[0]
         assert(_type == 17)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        _stats_type = reader.read("!H")[0]
+        obj.xid, _stats_type, obj.flags = reader.read_struct(_struct_LHH)
         assert(_stats_type == 4)
-        obj.flags = reader.read("!H")[0]
         obj.entries = loxi.generic_util.unpack_list(reader, ofp.common.port_stats_entry.unpack)
         return obj
 
@@ -6683,6 +6135,7 @@ class port_stats_reply(stats_reply):
 stats_reply.subtypes[4] = port_stats_reply
 
 class port_stats_request(stats_request):
+    __slots__ = ["port_no"]
     version = 1
     type = 16
     stats_type = 4
@@ -6702,36 +6155,26 @@ class port_stats_request(stats_request):
             self.port_no = 0
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!H", self.stats_type))
-        packed.append(struct.pack("!H", self.flags))
-        packed.append(util.pack_port_no(self.port_no))
-        packed.append('\x00' * 6)
-        length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_BBHLHHH6x, buf, offset, self.version, self.type, 0, self.xid, self.stats_type, self.flags, self.port_no)
+        length = offset - start
+        _struct_H.pack_into(buf, start + 2, length)
+        return offset
+
+    def wire_length(self):
+        return 20
 
     @staticmethod
     def unpack(reader):
         obj = port_stats_request()
-        _version = reader.read("!B")[0]
+        _version, _type, _length = reader.read_struct(_struct_BBH)
         assert(_version == 1)
-        _type = reader.read("!B")[0]
         assert(_type == 16)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        _stats_type = reader.read("!H")[0]
+        obj.xid, _stats_type, obj.flags, obj.port_no = reader.read_struct(_struct_LHHH6x)
         assert(_stats_type == 4)
-        obj.flags = reader.read("!H")[0]
-        obj.port_no = util.unpack_port_no(reader)
-        reader.skip(6)
         return obj
 
     def __eq__(self, other):
@@ -6763,6 +6206,7 @@ class port_stats_request(stats_request):
 stats_request.subtypes[4] = port_stats_request
 
 class port_status(message):
+    __slots__ = ["desc", "reason"]
     version = 1
     type = 12
 
@@ -6781,32 +6225,26 @@ class port_status(message):
             self.desc = ofp.port_desc()
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!B", self.reason))
-        packed.append('\x00' * 7)
-        packed.append(self.desc.pack())
-        length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_BBHLB7x, buf, offset, self.version, self.type, 0, self.xid, self.reason)
+        offset = self.desc.pack_into(buf, offset)
+        length = offset - start
+        _struct_H.pack_into(buf, start + 2, length)
+        return offset
+
+    def wire_length(self):
+        return 16 + self.desc.wire_length()
 
     @staticmethod
     def unpack(reader):
         obj = port_status()
-        _version = reader.read("!B")[0]
+        _version, _type, _length = reader.read_struct(_struct_BBH)
         assert(_version == 1)
-        _type = reader.read("!B")[0]
         assert(_type == 12)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        obj.reason = reader.read("!B")[0]
-        reader.skip(7)
+        obj.xid, obj.reason = reader.read_struct(_struct_LB7x)
         obj.desc = ofp.port_desc.unpack(reader)
         return obj
 
@@ -6839,6 +6277,7 @@ class port_status(message):
 message.subtypes[12] = port_status
 
 class queue_get_config_reply(message):
+    __slots__ = ["port", "queues"]
     version = 1
     type = 21
 
@@ -6857,32 +6296,26 @@ class queue_get_config_reply(message):
             self.queues = []
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(util.pack_port_no(self.port))
-        packed.append('\x00' * 6)
-        packed.append(loxi.generic_util.pack_list(self.queues))
-        length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_BBHLH6x, buf, offset, self.version, self.type, 0, self.xid, self.port)
+        offset = loxi.generic_util.pack_list_into(self.queues, buf, offset)
+        length = offset - start
+        _struct_H.pack_into(buf, start + 2, length)
+        return offset
+
+    def wire_length(self):
+        return 16 + loxi.generic_util.list_wire_length(self.queues)
 
     @staticmethod
     def unpack(reader):
         obj = queue_get_config_reply()
-        _version = reader.read("!B")[0]
+        _version, _type, _length = reader.read_struct(_struct_BBH)
         assert(_version == 1)
-        _type = reader.read("!B")[0]
         assert(_type == 21)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        obj.port = util.unpack_port_no(reader)
-        reader.skip(6)
+        obj.xid, obj.port = reader.read_struct(_struct_LH6x)
         obj.queues = loxi.generic_util.unpack_list(reader, ofp.common.packet_queue.unpack)
         return obj
 
@@ -6915,6 +6348,7 @@ class queue_get_config_reply(message):
 message.subtypes[21] = queue_get_config_reply
 
 class queue_get_config_request(message):
+    __slots__ = ["port"]
     version = 1
     type = 20
 
@@ -6929,31 +6363,25 @@ class queue_get_config_request(message):
             self.port = 0
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(util.pack_port_no(self.port))
-        packed.append('\x00' * 2)
-        length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_BBHLH2x, buf, offset, self.version, self.type, 0, self.xid, self.port)
+        length = offset - start
+        _struct_H.pack_into(buf, start + 2, length)
+        return offset
+
+    def wire_length(self):
+        return 12
 
     @staticmethod
     def unpack(reader):
         obj = queue_get_config_request()
-        _version = reader.read("!B")[0]
+        _version, _type, _length = reader.read_struct(_struct_BBH)
         assert(_version == 1)
-        _type = reader.read("!B")[0]
         assert(_type == 20)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        obj.port = util.unpack_port_no(reader)
-        reader.skip(2)
+        obj.xid, obj.port = reader.read_struct(_struct_LH2x)
         return obj
 
     def __eq__(self, other):
@@ -6981,6 +6409,7 @@ class queue_get_config_request(message):
 message.subtypes[20] = queue_get_config_request
 
 class queue_op_failed_error_msg(error_msg):
+    __slots__ = ["code", "data"]
     version = 1
     type = 1
     err_type = 5
@@ -7000,34 +6429,28 @@ class queue_op_failed_error_msg(error_msg):
             self.data = ''
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!H", self.err_type))
-        packed.append(struct.pack("!H", self.code))
-        packed.append(self.data)
-        length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_BBHLHH, buf, offset, self.version, self.type, 0, self.xid, self.err_type, self.code)
+        offset = loxi.generic_util.pack_bytes_into(self.data, buf, offset)
+        length = offset - start
+        _struct_H.pack_into(buf, start + 2, length)
+        return offset
+
+    def wire_length(self):
+        return 12 + len(self.data)
 
     @staticmethod
     def unpack(reader):
         obj = queue_op_failed_error_msg()
-        _version = reader.read("!B")[0]
+        _version, _type, _length = reader.read_struct(_struct_BBH)
         assert(_version == 1)
-        _type = reader.read("!B")[0]
         assert(_type == 1)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        _err_type = reader.read("!H")[0]
+        obj.xid, _err_type, obj.code = reader.read_struct(_struct_LHH)
         assert(_err_type == 5)
-        obj.code = reader.read("!H")[0]
-        obj.data = str(reader.read_all())
+        obj.data = reader.read_all()
         return obj
 
     def __eq__(self, other):
@@ -7059,6 +6482,7 @@ class queue_op_failed_error_msg(error_msg):
 error_msg.subtypes[5] = queue_op_failed_error_msg
 
 class queue_stats_reply(stats_reply):
+    __slots__ = ["entries"]
     version = 1
     type = 17
     stats_type = 5
@@ -7078,33 +6502,27 @@ class queue_stats_reply(stats_reply):
             self.entries = []
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!H", self.stats_type))
-        packed.append(struct.pack("!H", self.flags))
-        packed.append(loxi.generic_util.pack_list(self.entries))
-        length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_BBHLHH, buf, offset, self.version, self.type, 0, self.xid, self.stats_type, self.flags)
+        offset = loxi.generic_util.pack_list_into(self.entries, buf, offset)
+        length = offset - start
+        _struct_H.pack_into(buf, start + 2, length)
+        return offset
+
+    def wire_length(self):
+        return 12 + loxi.generic_util.list_wire_length(self.entries)
 
     @staticmethod
     def unpack(reader):
         obj = queue_stats_reply()
-        _version = reader.read("!B")[0]
+        _version, _type, _length = reader.read_struct(_struct_BBH)
         assert(_version == 1)
-        _type = reader.read("!B")[0]
         assert(_type == 17)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        _stats_type = reader.read("!H")[0]
+        obj.xid, _stats_type, obj.flags = reader.read_struct(_struct_LHH)
         assert(_stats_type == 5)
-        obj.flags = reader.read("!H")[0]
         obj.entries = loxi.generic_util.unpack_list(reader, ofp.common.queue_stats_entry.unpack)
         return obj
 
@@ -7137,6 +6555,7 @@ class queue_stats_reply(stats_reply):
 stats_reply.subtypes[5] = queue_stats_reply
 
 class queue_stats_request(stats_request):
+    __slots__ = ["port_no", "queue_id"]
     version = 1
     type = 16
     stats_type = 5
@@ -7160,38 +6579,26 @@ class queue_stats_request(stats_request):
             self.queue_id = 0
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!H", self.stats_type))
-        packed.append(struct.pack("!H", self.flags))
-        packed.append(util.pack_port_no(self.port_no))
-        packed.append('\x00' * 2)
-        packed.append(struct.pack("!L", self.queue_id))
-        length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_BBHLHHH2xL, buf, offset, self.version, self.type, 0, self.xid, self.stats_type, self.flags, self.port_no, self.queue_id)
+        length = offset - start
+        _struct_H.pack_into(buf, start + 2, length)
+        return offset
+
+    def wire_length(self):
+        return 20
 
     @staticmethod
     def unpack(reader):
         obj = queue_stats_request()
-        _version = reader.read("!B")[0]
+        _version, _type, _length = reader.read_struct(_struct_BBH)
         assert(_version == 1)
-        _type = reader.read("!B")[0]
         assert(_type == 16)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        _stats_type = reader.read("!H")[0]
+        obj.xid, _stats_type, obj.flags, obj.port_no, obj.queue_id = reader.read_struct(_struct_LHHH2xL)
         assert(_stats_type == 5)
-        obj.flags = reader.read("!H")[0]
-        obj.port_no = util.unpack_port_no(reader)
-        reader.skip(2)
-        obj.queue_id = reader.read("!L")[0]
         return obj
 
     def __eq__(self, other):
@@ -7227,6 +6634,7 @@ class queue_stats_request(stats_request):
 stats_request.subtypes[5] = queue_stats_request
 
 class set_config(message):
+    __slots__ = ["flags", "miss_send_len"]
     version = 1
     type = 9
 
@@ -7245,31 +6653,25 @@ class set_config(message):
             self.miss_send_len = 0
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!H", self.flags))
-        packed.append(struct.pack("!H", self.miss_send_len))
-        length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_BBHLHH, buf, offset, self.version, self.type, 0, self.xid, self.flags, self.miss_send_len)
+        length = offset - start
+        _struct_H.pack_into(buf, start + 2, length)
+        return offset
+
+    def wire_length(self):
+        return 12
 
     @staticmethod
     def unpack(reader):
         obj = set_config()
-        _version = reader.read("!B")[0]
+        _version, _type, _length = reader.read_struct(_struct_BBH)
         assert(_version == 1)
-        _type = reader.read("!B")[0]
         assert(_type == 9)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        obj.flags = reader.read("!H")[0]
-        obj.miss_send_len = reader.read("!H")[0]
+        obj.xid, obj.flags, obj.miss_send_len = reader.read_struct(_struct_LHH)
         return obj
 
     def __eq__(self, other):
@@ -7301,6 +6703,7 @@ class set_config(message):
 message.subtypes[9] = set_config
 
 class table_mod(message):
+    __slots__ = ["config", "table_id"]
     version = 1
     type = 22
 
@@ -7319,33 +6722,25 @@ class table_mod(message):
             self.config = 0
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!B", self.table_id))
-        packed.append('\x00' * 3)
-        packed.append(struct.pack("!L", self.config))
-        length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_BBHLB3xL, buf, offset, self.version, self.type, 0, self.xid, self.table_id, self.config)
+        length = offset - start
+        _struct_H.pack_into(buf, start + 2, length)
+        return offset
+
+    def wire_length(self):
+        return 16
 
     @staticmethod
     def unpack(reader):
         obj = table_mod()
-        _version = reader.read("!B")[0]
+        _version, _type, _length = reader.read_struct(_struct_BBH)
         assert(_version == 1)
-        _type = reader.read("!B")[0]
         assert(_type == 22)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        obj.table_id = reader.read("!B")[0]
-        reader.skip(3)
-        obj.config = reader.read("!L")[0]
+        obj.xid, obj.table_id, obj.config = reader.read_struct(_struct_LB3xL)
         return obj
 
     def __eq__(self, other):
@@ -7377,6 +6772,7 @@ class table_mod(message):
 message.subtypes[22] = table_mod
 
 class table_stats_reply(stats_reply):
+    __slots__ = ["entries"]
     version = 1
     type = 17
     stats_type = 3
@@ -7396,33 +6792,27 @@ class table_stats_reply(stats_reply):
             self.entries = []
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!H", self.stats_type))
-        packed.append(struct.pack("!H", self.flags))
-        packed.append(loxi.generic_util.pack_list(self.entries))
-        length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_BBHLHH, buf, offset, self.version, self.type, 0, self.xid, self.stats_type, self.flags)
+        offset = loxi.generic_util.pack_list_into(self.entries, buf, offset)
+        length = offset - start
+        _struct_H.pack_into(buf, start + 2, length)
+        return offset
+
+    def wire_length(self):
+        return 12 + loxi.generic_util.list_wire_length(self.entries)
 
     @staticmethod
     def unpack(reader):
         obj = table_stats_reply()
-        _version = reader.read("!B")[0]
+        _version, _type, _length = reader.read_struct(_struct_BBH)
         assert(_version == 1)
-        _type = reader.read("!B")[0]
         assert(_type == 17)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        _stats_type = reader.read("!H")[0]
+        obj.xid, _stats_type, obj.flags = reader.read_struct(_struct_LHH)
         assert(_stats_type == 3)
-        obj.flags = reader.read("!H")[0]
         obj.entries = loxi.generic_util.unpack_list(reader, ofp.common.table_stats_entry.unpack)
         return obj
 
@@ -7455,6 +6845,7 @@ class table_stats_reply(stats_reply):
 stats_reply.subtypes[3] = table_stats_reply
 
 class table_stats_request(stats_request):
+    __slots__ = []
     version = 1
     type = 16
     stats_type = 3
@@ -7470,32 +6861,26 @@ class table_stats_request(stats_request):
             self.flags = 0
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!H", self.stats_type))
-        packed.append(struct.pack("!H", self.flags))
-        length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_BBHLHH, buf, offset, self.version, self.type, 0, self.xid, self.stats_type, self.flags)
+        length = offset - start
+        _struct_H.pack_into(buf, start + 2, length)
+        return offset
+
+    def wire_length(self):
+        return 12
 
     @staticmethod
     def unpack(reader):
         obj = table_stats_request()
-        _version = reader.read("!B")[0]
+        _version, _type, _length = reader.read_struct(_struct_BBH)
         assert(_version == 1)
-        _type = reader.read("!B")[0]
         assert(_type == 16)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        _stats_type = reader.read("!H")[0]
+        obj.xid, _stats_type, obj.flags = reader.read_struct(_struct_LHH)
         assert(_stats_type == 3)
-        obj.flags = reader.read("!H")[0]
         return obj
 
     def __eq__(self, other):
@@ -7523,15 +6908,50 @@ class table_stats_request(stats_request):
 stats_request.subtypes[3] = table_stats_request
 
 
+# Field each message class with subtypes is dispatched on, as (struct, offset)
+_subtype_fields = {
+    message: (_struct_B, 1),
+    stats_reply: (_struct_H, 8),
+    stats_request: (_struct_H, 8),
+    error_msg: (_struct_H, 8),
+    experimenter: (_struct_L, 8),
+    bsn_header: (_struct_L, 12),
+    experimenter_stats_reply: (_struct_L, 12),
+    bsn_stats_reply: (_struct_L, 20),
+    experimenter_stats_request: (_struct_L, 12),
+    bsn_stats_request: (_struct_L, 20),
+    flow_mod: (_struct_H, 56),
+    nicira_header: (_struct_L, 12),
+}
+
+_dispatch_table = None
+
 def parse_header(buf):
     if len(buf) < 8:
         raise loxi.ProtocolError("too short to be an OpenFlow message")
     return struct.unpack_from("!BBHL", buf)
 
-def parse_message(buf):
+def parse_message(buf, lazy=False):
+    """
+    Deserialize a complete OpenFlow message.
+
+    If lazy is true, only the header is parsed and a LazyMessage is returned
+    which unpacks the rest of the message on first use.
+    """
     msg_ver, msg_type, msg_len, msg_xid = parse_header(buf)
     if msg_ver != ofp.OFP_VERSION and msg_type != ofp.OFPT_HELLO:
         raise loxi.ProtocolError("wrong OpenFlow version (expected %d, got %d)" % (ofp.OFP_VERSION, msg_ver))
     if len(buf) != msg_len:
         raise loxi.ProtocolError("incorrect message size")
-    return message.unpack(loxi.generic_util.OFReader(buf))
+    if lazy:
+        return loxi.generic_util.LazyMessage(buf, unpack_message)
+    return unpack_message(loxi.generic_util.OFReader(buf))
+
+def unpack_message(reader):
+    """
+    Unpack a message, going straight to the unpack() of its leaf class.
+    """
+    global _dispatch_table
+    if _dispatch_table is None:
+        _dispatch_table = loxi.generic_util.dispatch_table(message, _subtype_fields)
+    return loxi.generic_util.unpack_dispatched(reader, _dispatch_table)
@@ -18,3 +18,12 @@ import action_id
 from const import *
 from common import *
 from loxi import ProtocolError
+
+# Rarely used families, imported on first reference
+import loxi
+lazy_modules = (
+    "bsn_tlv",
+)
+for _name in lazy_modules:
+    globals()[_name] = loxi.LazyModule(__name__, _name)
+del _name
@@ -14,7 +14,26 @@ import loxi.generic_util
 import sys
 ofp = sys.modules['loxi.of13']
 
+# Precompiled layouts for the fixed-length parts of each pack_into() and unpack()
+_struct_H = struct.Struct("!H")
+_struct_HH = struct.Struct("!HH")
+_struct_HH4x = struct.Struct("!HH4x")
+_struct_HHB3x = struct.Struct("!HHB3x")
+_struct_HHH2x = struct.Struct("!HHH2x")
+_struct_HHL = struct.Struct("!HHL")
+_struct_HHLH6x = struct.Struct("!HHLH6x")
+_struct_HHLL = struct.Struct("!HHLL")
+_struct_HHLL4x = struct.Struct("!HHLL4x")
+_struct_HHLLL = struct.Struct("!HHLLL")
+_struct_HHLLLLB3x = struct.Struct("!HHLLLLB3x")
+_struct_LH6x = struct.Struct("!LH6x")
+_struct_LL = struct.Struct("!LL")
+_struct_LL4x = struct.Struct("!LL4x")
+_struct_LLL = struct.Struct("!LLL")
+_struct_LLLLB3x = struct.Struct("!LLLLB3x")
+
 class action(loxi.OFObject):
+    __slots__ = ["type"]
     subtypes = {}
 
 
@@ -25,14 +44,15 @@ class action(loxi.OFObject):
             self.type = 0
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!H", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for len at index 1
-        packed.append('\x00' * 4)
-        length = sum([len(x) for x in packed])
-        packed[1] = struct.pack("!H", length)
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_HH4x, buf, offset, self.type, 0)
+        length = offset - start
+        _struct_H.pack_into(buf, start + 2, length)
+        return offset
+
+    def wire_length(self):
+        return 8
 
     @staticmethod
     def unpack(reader):
@@ -42,8 +62,7 @@ class action(loxi.OFObject):
             return subclass.unpack(reader)
 
         obj = action()
-        obj.type = reader.read("!H")[0]
-        _len = reader.read("!H")[0]
+        obj.type, _len = reader.read_struct(_struct_HH)
         orig_reader = reader
         reader = orig_reader.slice(_len, 4)
         reader.skip(4)
@@ -64,6 +83,7 @@ class action(loxi.OFObject):
 
 
 class experimenter(action):
+    __slots__ = ["data", "experimenter"]
     subtypes = {}
 
     type = 65535
@@ -79,17 +99,21 @@ class experimenter(action):
             self.data = ''
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!H", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for len at index 1
-        packed.append(struct.pack("!L", self.experimenter))
-        packed.append(self.data)
-        length = sum([len(x) for x in packed])
-        packed.append(loxi.generic_util.pad_to(8, length))
-        length += len(packed[-1])
-        packed[1] = struct.pack("!H", length)
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_HHL, buf, offset, self.type, 0, self.experimenter)
+        offset = loxi.generic_util.pack_bytes_into(self.data, buf, offset)
+        length = offset - start
+        offset = loxi.generic_util.pack_pad_into(8, length, buf, offset)
+        length = offset - start
+        _struct_H.pack_into(buf, start + 2, length)
+        return offset
+
+    def wire_length(self):
+        length = 8
+        length += len(self.data)
+        length = (length + 7) / 8 * 8
+        return length
 
     @staticmethod
     def unpack(reader):
@@ -99,13 +123,12 @@ class experimenter(action):
             return subclass.unpack(reader)
 
         obj = experimenter()
-        _type = reader.read("!H")[0]
+        _type, _len = reader.read_struct(_struct_HH)
         assert(_type == 65535)
-        _len = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_len, 4)
         obj.experimenter = reader.read("!L")[0]
-        obj.data = str(reader.read_all())
+        obj.data = reader.read_all()
         return obj
 
     def __eq__(self, other):
@@ -127,6 +150,7 @@ class experimenter(action):
 action.subtypes[65535] = experimenter
 
 class bsn(experimenter):
+    __slots__ = ["subtype"]
     subtypes = {}
 
     type = 65535
@@ -139,16 +163,15 @@ class bsn(experimenter):
             self.subtype = 0
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!H", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for len at index 1
-        packed.append(struct.pack("!L", self.experimenter))
-        packed.append(struct.pack("!L", self.subtype))
-        packed.append('\x00' * 4)
-        length = sum([len(x) for x in packed])
-        packed[1] = struct.pack("!H", length)
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_HHLL4x, buf, offset, self.type, 0, self.experimenter, self.subtype)
+        length = offset - start
+        _struct_H.pack_into(buf, start + 2, length)
+        return offset
+
+    def wire_length(self):
+        return 16
 
     @staticmethod
     def unpack(reader):
@@ -158,15 +181,12 @@ class bsn(experimenter):
             return subclass.unpack(reader)
 
         obj = bsn()
-        _type = reader.read("!H")[0]
+        _type, _len = reader.read_struct(_struct_HH)
         assert(_type == 65535)
-        _len = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_len, 4)
-        _experimenter = reader.read("!L")[0]
+        _experimenter, obj.subtype = reader.read_struct(_struct_LL4x)
         assert(_experimenter == 6035143)
-        obj.subtype = reader.read("!L")[0]
-        reader.skip(4)
         return obj
 
     def __eq__(self, other):
@@ -185,6 +205,7 @@ class bsn(experimenter):
 experimenter.subtypes[6035143] = bsn
 
 class bsn_checksum(bsn):
+    __slots__ = ["checksum"]
     type = 65535
     experimenter = 6035143
     subtype = 4
@@ -196,28 +217,26 @@ class bsn_checksum(bsn):
             self.checksum = 0
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!H", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for len at index 1
-        packed.append(struct.pack("!L", self.experimenter))
-        packed.append(struct.pack("!L", self.subtype))
-        packed.append(util.pack_checksum_128(self.checksum))
-        length = sum([len(x) for x in packed])
-        packed[1] = struct.pack("!H", length)
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_HHLL, buf, offset, self.type, 0, self.experimenter, self.subtype)
+        offset = loxi.generic_util.pack_bytes_into(util.pack_checksum_128(self.checksum), buf, offset)
+        length = offset - start
+        _struct_H.pack_into(buf, start + 2, length)
+        return offset
+
+    def wire_length(self):
+        return 28
 
     @staticmethod
     def unpack(reader):
         obj = bsn_checksum()
-        _type = reader.read("!H")[0]
+        _type, _len = reader.read_struct(_struct_HH)
         assert(_type == 65535)
-        _len = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_len, 4)
-        _experimenter = reader.read("!L")[0]
+        _experimenter, _subtype = reader.read_struct(_struct_LL)
         assert(_experimenter == 6035143)
-        _subtype = reader.read("!L")[0]
         assert(_subtype == 4)
         obj.checksum = util.unpack_checksum_128(reader)
         return obj
@@ -240,6 +259,7 @@ class bsn_checksum(bsn):
 bsn.subtypes[4] = bsn_checksum
 
 class bsn_gentable(bsn):
+    __slots__ = ["key", "table_id"]
     type = 65535
     experimenter = 6035143
     subtype = 5
@@ -255,31 +275,27 @@ class bsn_gentable(bsn):
             self.key = []
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!H", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for len at index 1
-        packed.append(struct.pack("!L", self.experimenter))
-        packed.append(struct.pack("!L", self.subtype))
-        packed.append(struct.pack("!L", self.table_id))
-        packed.append(loxi.generic_util.pack_list(self.key))
-        length = sum([len(x) for x in packed])
-        packed[1] = struct.pack("!H", length)
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_HHLLL, buf, offset, self.type, 0, self.experimenter, self.subtype, self.table_id)
+        offset = loxi.generic_util.pack_list_into(self.key, buf, offset)
+        length = offset - start
+        _struct_H.pack_into(buf, start + 2, length)
+        return offset
+
+    def wire_length(self):
+        return 16 + loxi.generic_util.list_wire_length(self.key)
 
     @staticmethod
     def unpack(reader):
         obj = bsn_gentable()
-        _type = reader.read("!H")[0]
+        _type, _len = reader.read_struct(_struct_HH)
         assert(_type == 65535)
-        _len = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_len, 4)
-        _experimenter = reader.read("!L")[0]
+        _experimenter, _subtype, obj.table_id = reader.read_struct(_struct_LLL)
         assert(_experimenter == 6035143)
-        _subtype = reader.read("!L")[0]
         assert(_subtype == 5)
-        obj.table_id = reader.read("!L")[0]
         obj.key = loxi.generic_util.unpack_list(reader, ofp.bsn_tlv.bsn_tlv.unpack)
         return obj
 
@@ -305,6 +321,7 @@ class bsn_gentable(bsn):
 bsn.subtypes[5] = bsn_gentable
 
 class bsn_mirror(bsn):
+    __slots__ = ["copy_stage", "dest_port", "vlan_tag"]
     type = 65535
     experimenter = 6035143
     subtype = 1
@@ -324,36 +341,26 @@ class bsn_mirror(bsn):
             self.copy_stage = 0
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!H", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for len at index 1
-        packed.append(struct.pack("!L", self.experimenter))
-        packed.append(struct.pack("!L", self.subtype))
-        packed.append(struct.pack("!L", self.dest_port))
-        packed.append(struct.pack("!L", self.vlan_tag))
-        packed.append(struct.pack("!B", self.copy_stage))
-        packed.append('\x00' * 3)
-        length = sum([len(x) for x in packed])
-        packed[1] = struct.pack("!H", length)
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_HHLLLLB3x, buf, offset, self.type, 0, self.experimenter, self.subtype, self.dest_port, self.vlan_tag, self.copy_stage)
+        length = offset - start
+        _struct_H.pack_into(buf, start + 2, length)
+        return offset
+
+    def wire_length(self):
+        return 24
 
     @staticmethod
     def unpack(reader):
         obj = bsn_mirror()
-        _type = reader.read("!H")[0]
+        _type, _len = reader.read_struct(_struct_HH)
         assert(_type == 65535)
-        _len = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_len, 4)
-        _experimenter = reader.read("!L")[0]
+        _experimenter, _subtype, obj.dest_port, obj.vlan_tag, obj.copy_stage = reader.read_struct(_struct_LLLLB3x)
         assert(_experimenter == 6035143)
-        _subtype = reader.read("!L")[0]
         assert(_subtype == 1)
-        obj.dest_port = reader.read("!L")[0]
-        obj.vlan_tag = reader.read("!L")[0]
-        obj.copy_stage = reader.read("!B")[0]
-        reader.skip(3)
         return obj
 
     def __eq__(self, other):
@@ -382,6 +389,7 @@ class bsn_mirror(bsn):
 bsn.subtypes[1] = bsn_mirror
 
 class bsn_set_tunnel_dst(bsn):
+    __slots__ = ["dst"]
     type = 65535
     experimenter = 6035143
     subtype = 2
@@ -393,30 +401,26 @@ class bsn_set_tunnel_dst(bsn):
             self.dst = 0
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!H", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for len at index 1
-        packed.append(struct.pack("!L", self.experimenter))
-        packed.append(struct.pack("!L", self.subtype))
-        packed.append(struct.pack("!L", self.dst))
-        length = sum([len(x) for x in packed])
-        packed[1] = struct.pack("!H", length)
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_HHLLL, buf, offset, self.type, 0, self.experimenter, self.subtype, self.dst)
+        length = offset - start
+        _struct_H.pack_into(buf, start + 2, length)
+        return offset
+
+    def wire_length(self):
+        return 16
 
     @staticmethod
     def unpack(reader):
         obj = bsn_set_tunnel_dst()
-        _type = reader.read("!H")[0]
+        _type, _len = reader.read_struct(_struct_HH)
         assert(_type == 65535)
-        _len = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_len, 4)
-        _experimenter = reader.read("!L")[0]
+        _experimenter, _subtype, obj.dst = reader.read_struct(_struct_LLL)
         assert(_experimenter == 6035143)
-        _subtype = reader.read("!L")[0]
         assert(_subtype == 2)
-        obj.dst = reader.read("!L")[0]
         return obj
 
     def __eq__(self, other):
@@ -437,26 +441,27 @@ class bsn_set_tunnel_dst(bsn):
 bsn.subtypes[2] = bsn_set_tunnel_dst
 
 class copy_ttl_in(action):
+    __slots__ = []
     type = 12
 
     def __init__(self):
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!H", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for len at index 1
-        packed.append('\x00' * 4)
-        length = sum([len(x) for x in packed])
-        packed[1] = struct.pack("!H", length)
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_HH4x, buf, offset, self.type, 0)
+        length = offset - start
+        _struct_H.pack_into(buf, start + 2, length)
+        return offset
+
+    def wire_length(self):
+        return 8
 
     @staticmethod
     def unpack(reader):
         obj = copy_ttl_in()
-        _type = reader.read("!H")[0]
+        _type, _len = reader.read_struct(_struct_HH)
         assert(_type == 12)
-        _len = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_len, 4)
         reader.skip(4)
@@ -477,26 +482,27 @@ class copy_ttl_in(action):
 action.subtypes[12] = copy_ttl_in
 
 class copy_ttl_out(action):
+    __slots__ = []
     type = 11
 
     def __init__(self):
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!H", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for len at index 1
-        packed.append('\x00' * 4)
-        length = sum([len(x) for x in packed])
-        packed[1] = struct.pack("!H", length)
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_HH4x, buf, offset, self.type, 0)
+        length = offset - start
+        _struct_H.pack_into(buf, start + 2, length)
+        return offset
+
+    def wire_length(self):
+        return 8
 
     @staticmethod
     def unpack(reader):
         obj = copy_ttl_out()
-        _type = reader.read("!H")[0]
+        _type, _len = reader.read_struct(_struct_HH)
         assert(_type == 11)
-        _len = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_len, 4)
         reader.skip(4)
@@ -517,26 +523,27 @@ class copy_ttl_out(action):
 action.subtypes[11] = copy_ttl_out
 
 class dec_mpls_ttl(action):
+    __slots__ = []
     type = 16
 
     def __init__(self):
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!H", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for len at index 1
-        packed.append('\x00' * 4)
-        length = sum([len(x) for x in packed])
-        packed[1] = struct.pack("!H", length)
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_HH4x, buf, offset, self.type, 0)
+        length = offset - start
+        _struct_H.pack_into(buf, start + 2, length)
+        return offset
+
+    def wire_length(self):
+        return 8
 
     @staticmethod
     def unpack(reader):
         obj = dec_mpls_ttl()
-        _type = reader.read("!H")[0]
+        _type, _len = reader.read_struct(_struct_HH)
         assert(_type == 16)
-        _len = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_len, 4)
         reader.skip(4)
@@ -557,26 +564,27 @@ class dec_mpls_ttl(action):
 action.subtypes[16] = dec_mpls_ttl
 
 class dec_nw_ttl(action):
+    __slots__ = []
     type = 24
 
     def __init__(self):
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!H", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for len at index 1
-        packed.append('\x00' * 4)
-        length = sum([len(x) for x in packed])
-        packed[1] = struct.pack("!H", length)
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_HH4x, buf, offset, self.type, 0)
+        length = offset - start
+        _struct_H.pack_into(buf, start + 2, length)
+        return offset
+
+    def wire_length(self):
+        return 8
 
     @staticmethod
     def unpack(reader):
         obj = dec_nw_ttl()
-        _type = reader.read("!H")[0]
+        _type, _len = reader.read_struct(_struct_HH)
         assert(_type == 24)
-        _len = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_len, 4)
         reader.skip(4)
@@ -597,6 +605,7 @@ class dec_nw_ttl(action):
 action.subtypes[24] = dec_nw_ttl
 
 class group(action):
+    __slots__ = ["group_id"]
     type = 22
 
     def __init__(self, group_id=None):
@@ -606,21 +615,21 @@ class group(action):
             self.group_id = 0
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!H", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for len at index 1
-        packed.append(struct.pack("!L", self.group_id))
-        length = sum([len(x) for x in packed])
-        packed[1] = struct.pack("!H", length)
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_HHL, buf, offset, self.type, 0, self.group_id)
+        length = offset - start
+        _struct_H.pack_into(buf, start + 2, length)
+        return offset
+
+    def wire_length(self):
+        return 8
 
     @staticmethod
     def unpack(reader):
         obj = group()
-        _type = reader.read("!H")[0]
+        _type, _len = reader.read_struct(_struct_HH)
         assert(_type == 22)
-        _len = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_len, 4)
         obj.group_id = reader.read("!L")[0]
@@ -644,6 +653,7 @@ class group(action):
 action.subtypes[22] = group
 
 class nicira(experimenter):
+    __slots__ = ["subtype"]
     subtypes = {}
 
     type = 65535
@@ -656,17 +666,15 @@ class nicira(experimenter):
             self.subtype = 0
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!H", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for len at index 1
-        packed.append(struct.pack("!L", self.experimenter))
-        packed.append(struct.pack("!H", self.subtype))
-        packed.append('\x00' * 2)
-        packed.append('\x00' * 4)
-        length = sum([len(x) for x in packed])
-        packed[1] = struct.pack("!H", length)
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_HHLH6x, buf, offset, self.type, 0, self.experimenter, self.subtype)
+        length = offset - start
+        _struct_H.pack_into(buf, start + 2, length)
+        return offset
+
+    def wire_length(self):
+        return 16
 
     @staticmethod
     def unpack(reader):
@@ -676,16 +684,12 @@ class nicira(experimenter):
             return subclass.unpack(reader)
 
         obj = nicira()
-        _type = reader.read("!H")[0]
+        _type, _len = reader.read_struct(_struct_HH)
         assert(_type == 65535)
-        _len = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_len, 4)
-        _experimenter = reader.read("!L")[0]
+        _experimenter, obj.subtype = reader.read_struct(_struct_LH6x)
         assert(_experimenter == 8992)
-        obj.subtype = reader.read("!H")[0]
-        reader.skip(2)
-        reader.skip(4)
         return obj
 
     def __eq__(self, other):
@@ -704,6 +708,7 @@ class nicira(experimenter):
 experimenter.subtypes[8992] = nicira
 
 class nicira_dec_ttl(nicira):
+    __slots__ = []
     type = 65535
     experimenter = 8992
     subtype = 18
@@ -711,32 +716,26 @@ class nicira_dec_ttl(nicira):
     def __init__(self):
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!H", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for len at index 1
-        packed.append(struct.pack("!L", self.experimenter))
-        packed.append(struct.pack("!H", self.subtype))
-        packed.append('\x00' * 2)
-        packed.append('\x00' * 4)
-        length = sum([len(x) for x in packed])
-        packed[1] = struct.pack("!H", length)
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_HHLH6x, buf, offset, self.type, 0, self.experimenter, self.subtype)
+        length = offset - start
+        _struct_H.pack_into(buf, start + 2, length)
+        return offset
+
+    def wire_length(self):
+        return 16
 
     @staticmethod
     def unpack(reader):
         obj = nicira_dec_ttl()
-        _type = reader.read("!H")[0]
+        _type, _len = reader.read_struct(_struct_HH)
         assert(_type == 65535)
-        _len = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_len, 4)
-        _experimenter = reader.read("!L")[0]
+        _experimenter, _subtype = reader.read_struct(_struct_LH6x)
         assert(_experimenter == 8992)
-        _subtype = reader.read("!H")[0]
         assert(_subtype == 18)
-        reader.skip(2)
-        reader.skip(4)
         return obj
 
     def __eq__(self, other):
@@ -754,6 +753,7 @@ class nicira_dec_ttl(nicira):
 nicira.subtypes[18] = nicira_dec_ttl
 
 class output(action):
+    __slots__ = ["length", "max_len", "port"]
 
     def __init__(self, port=None, max_len=None, type=None, length=None):
         if port != None:
@@ -771,31 +771,27 @@ class output(action):
 	self.length = length
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!H", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for len at index 1
-        packed.append(util.pack_port_no(self.port))
-        packed.append(struct.pack("!H", self.max_len))
-        packed.append('\x00' * 6)
-	if self.length != None:
-	    packed[1] = struct.pack("!H", self.length) 
-	else:
-            length = sum([len(x) for x in packed])
-            packed[1] = struct.pack("!H", length)
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_HHLH6x, buf, offset, self.type, 0, self.port, self.max_len)
+        if self.length != None:
+            _struct_H.pack_into(buf, start + 2, self.length)
+        else:
+            length = offset - start
+            _struct_H.pack_into(buf, start + 2, length)
+        return offset
+
+    def wire_length(self):
+        return 16
 
     @staticmethod
     def unpack(reader):
         obj = output()
-        _type = reader.read("!H")[0]
+        _type, _len = reader.read_struct(_struct_HH)
         assert(_type == 0)
-        _len = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_len, 4)
-        obj.port = util.unpack_port_no(reader)
-        obj.max_len = reader.read("!H")[0]
-        reader.skip(6)
+        obj.port, obj.max_len = reader.read_struct(_struct_LH6x)
         return obj
 
     def __eq__(self, other):
@@ -820,6 +816,7 @@ class output(action):
 action.subtypes[0] = output
 
 class pop_mpls(action):
+    __slots__ = ["ethertype"]
     type = 20
 
     def __init__(self, ethertype=None):
@@ -829,22 +826,21 @@ class pop_mpls(action):
             self.ethertype = 0
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!H", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for len at index 1
-        packed.append(struct.pack("!H", self.ethertype))
-        packed.append('\x00' * 2)
-        length = sum([len(x) for x in packed])
-        packed[1] = struct.pack("!H", length)
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_HHH2x, buf, offset, self.type, 0, self.ethertype)
+        length = offset - start
+        _struct_H.pack_into(buf, start + 2, length)
+        return offset
+
+    def wire_length(self):
+        return 8
 
     @staticmethod
     def unpack(reader):
         obj = pop_mpls()
-        _type = reader.read("!H")[0]
+        _type, _len = reader.read_struct(_struct_HH)
         assert(_type == 20)
-        _len = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_len, 4)
         obj.ethertype = reader.read("!H")[0]
@@ -869,26 +865,27 @@ class pop_mpls(action):
 action.subtypes[20] = pop_mpls
 
 class pop_pbb(action):
+    __slots__ = []
     type = 27
 
     def __init__(self):
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!H", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for len at index 1
-        packed.append('\x00' * 4)
-        length = sum([len(x) for x in packed])
-        packed[1] = struct.pack("!H", length)
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_HH4x, buf, offset, self.type, 0)
+        length = offset - start
+        _struct_H.pack_into(buf, start + 2, length)
+        return offset
+
+    def wire_length(self):
+        return 8
 
     @staticmethod
     def unpack(reader):
         obj = pop_pbb()
-        _type = reader.read("!H")[0]
+        _type, _len = reader.read_struct(_struct_HH)
         assert(_type == 27)
-        _len = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_len, 4)
         reader.skip(4)
@@ -909,26 +906,27 @@ class pop_pbb(action):
 action.subtypes[27] = pop_pbb
 
 class pop_vlan(action):
+    __slots__ = []
     type = 18
 
     def __init__(self):
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!H", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for len at index 1
-        packed.append('\x00' * 4)
-        length = sum([len(x) for x in packed])
-        packed[1] = struct.pack("!H", length)
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_HH4x, buf, offset, self.type, 0)
+        length = offset - start
+        _struct_H.pack_into(buf, start + 2, length)
+        return offset
+
+    def wire_length(self):
+        return 8
 
     @staticmethod
     def unpack(reader):
         obj = pop_vlan()
-        _type = reader.read("!H")[0]
+        _type, _len = reader.read_struct(_struct_HH)
         assert(_type == 18)
-        _len = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_len, 4)
         reader.skip(4)
@@ -949,6 +947,7 @@ class pop_vlan(action):
 action.subtypes[18] = pop_vlan
 
 class push_mpls(action):
+    __slots__ = ["ethertype"]
     type = 19
 
     def __init__(self, ethertype=None):
@@ -958,22 +957,21 @@ class push_mpls(action):
             self.ethertype = 0
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!H", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for len at index 1
-        packed.append(struct.pack("!H", self.ethertype))
-        packed.append('\x00' * 2)
-        length = sum([len(x) for x in packed])
-        packed[1] = struct.pack("!H", length)
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_HHH2x, buf, offset, self.type, 0, self.ethertype)
+        length = offset - start
+        _struct_H.pack_into(buf, start + 2, length)
+        return offset
+
+    def wire_length(self):
+        return 8
 
     @staticmethod
     def unpack(reader):
         obj = push_mpls()
-        _type = reader.read("!H")[0]
+        _type, _len = reader.read_struct(_struct_HH)
         assert(_type == 19)
-        _len = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_len, 4)
         obj.ethertype = reader.read("!H")[0]
@@ -998,6 +996,7 @@ class push_mpls(action):
 action.subtypes[19] = push_mpls
 
 class push_pbb(action):
+    __slots__ = ["ethertype"]
     type = 26
 
     def __init__(self, ethertype=None):
@@ -1007,22 +1006,21 @@ class push_pbb(action):
             self.ethertype = 0
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!H", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for len at index 1
-        packed.append(struct.pack("!H", self.ethertype))
-        packed.append('\x00' * 2)
-        length = sum([len(x) for x in packed])
-        packed[1] = struct.pack("!H", length)
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_HHH2x, buf, offset, self.type, 0, self.ethertype)
+        length = offset - start
+        _struct_H.pack_into(buf, start + 2, length)
+        return offset
+
+    def wire_length(self):
+        return 8
 
     @staticmethod
     def unpack(reader):
         obj = push_pbb()
-        _type = reader.read("!H")[0]
+        _type, _len = reader.read_struct(_struct_HH)
         assert(_type == 26)
-        _len = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_len, 4)
         obj.ethertype = reader.read("!H")[0]
@@ -1047,6 +1045,7 @@ class push_pbb(action):
 action.subtypes[26] = push_pbb
 
 class push_vlan(action):
+    __slots__ = ["ethertype"]
     type = 17
 
     def __init__(self, ethertype=None):
@@ -1056,22 +1055,21 @@ class push_vlan(action):
             self.ethertype = 0
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!H", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for len at index 1
-        packed.append(struct.pack("!H", self.ethertype))
-        packed.append('\x00' * 2)
-        length = sum([len(x) for x in packed])
-        packed[1] = struct.pack("!H", length)
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_HHH2x, buf, offset, self.type, 0, self.ethertype)
+        length = offset - start
+        _struct_H.pack_into(buf, start + 2, length)
+        return offset
+
+    def wire_length(self):
+        return 8
 
     @staticmethod
     def unpack(reader):
         obj = push_vlan()
-        _type = reader.read("!H")[0]
+        _type, _len = reader.read_struct(_struct_HH)
         assert(_type == 17)
-        _len = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_len, 4)
         obj.ethertype = reader.read("!H")[0]
@@ -1096,6 +1094,7 @@ class push_vlan(action):
 action.subtypes[17] = push_vlan
 
 class set_field(action):
+    __slots__ = ["field"]
     type = 25
 
     def __init__(self, field=None):
@@ -1105,23 +1104,27 @@ class set_field(action):
             self.field = None
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!H", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for len at index 1
-        packed.append(self.field.pack())
-        length = sum([len(x) for x in packed])
-        packed.append(loxi.generic_util.pad_to(8, length))
-        length += len(packed[-1])
-        packed[1] = struct.pack("!H", length)
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_HH, buf, offset, self.type, 0)
+        offset = self.field.pack_into(buf, offset)
+        length = offset - start
+        offset = loxi.generic_util.pack_pad_into(8, length, buf, offset)
+        length = offset - start
+        _struct_H.pack_into(buf, start + 2, length)
+        return offset
+
+    def wire_length(self):
+        length = 4
+        length += self.field.wire_length()
+        length = (length + 7) / 8 * 8
+        return length
 
     @staticmethod
     def unpack(reader):
         obj = set_field()
-        _type = reader.read("!H")[0]
+        _type, _len = reader.read_struct(_struct_HH)
         assert(_type == 25)
-        _len = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_len, 4)
         obj.field = ofp.oxm.oxm.unpack(reader)
@@ -1145,6 +1148,7 @@ class set_field(action):
 action.subtypes[25] = set_field
 
 class set_mpls_ttl(action):
+    __slots__ = ["mpls_ttl"]
     type = 15
 
     def __init__(self, mpls_ttl=None):
@@ -1154,22 +1158,21 @@ class set_mpls_ttl(action):
             self.mpls_ttl = 0
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!H", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for len at index 1
-        packed.append(struct.pack("!B", self.mpls_ttl))
-        packed.append('\x00' * 3)
-        length = sum([len(x) for x in packed])
-        packed[1] = struct.pack("!H", length)
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_HHB3x, buf, offset, self.type, 0, self.mpls_ttl)
+        length = offset - start
+        _struct_H.pack_into(buf, start + 2, length)
+        return offset
+
+    def wire_length(self):
+        return 8
 
     @staticmethod
     def unpack(reader):
         obj = set_mpls_ttl()
-        _type = reader.read("!H")[0]
+        _type, _len = reader.read_struct(_struct_HH)
         assert(_type == 15)
-        _len = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_len, 4)
         obj.mpls_ttl = reader.read("!B")[0]
@@ -1194,6 +1197,7 @@ class set_mpls_ttl(action):
 action.subtypes[15] = set_mpls_ttl
 
 class set_nw_ttl(action):
+    __slots__ = ["nw_ttl"]
     type = 23
 
     def __init__(self, nw_ttl=None):
@@ -1203,22 +1207,21 @@ class set_nw_ttl(action):
             self.nw_ttl = 0
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!H", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for len at index 1
-        packed.append(struct.pack("!B", self.nw_ttl))
-        packed.append('\x00' * 3)
-        length = sum([len(x) for x in packed])
-        packed[1] = struct.pack("!H", length)
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_HHB3x, buf, offset, self.type, 0, self.nw_ttl)
+        length = offset - start
+        _struct_H.pack_into(buf, start + 2, length)
+        return offset
+
+    def wire_length(self):
+        return 8
 
     @staticmethod
     def unpack(reader):
         obj = set_nw_ttl()
-        _type = reader.read("!H")[0]
+        _type, _len = reader.read_struct(_struct_HH)
         assert(_type == 23)
-        _len = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_len, 4)
         obj.nw_ttl = reader.read("!B")[0]
@@ -1243,6 +1246,7 @@ class set_nw_ttl(action):
 action.subtypes[23] = set_nw_ttl
 
 class set_queue(action):
+    __slots__ = ["queue_id"]
     type = 21
 
     def __init__(self, queue_id=None):
@@ -1252,21 +1256,21 @@ class set_queue(action):
             self.queue_id = 0
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!H", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for len at index 1
-        packed.append(struct.pack("!L", self.queue_id))
-        length = sum([len(x) for x in packed])
-        packed[1] = struct.pack("!H", length)
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_HHL, buf, offset, self.type, 0, self.queue_id)
+        length = offset - start
+        _struct_H.pack_into(buf, start + 2, length)
+        return offset
+
+    def wire_length(self):
+        return 8
 
     @staticmethod
     def unpack(reader):
         obj = set_queue()
-        _type = reader.read("!H")[0]
+        _type, _len = reader.read_struct(_struct_HH)
         assert(_type == 21)
-        _len = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_len, 4)
         obj.queue_id = reader.read("!L")[0]
@@ -14,7 +14,17 @@ import loxi.generic_util
 import sys
 ofp = sys.modules['loxi.of13']
 
+# Precompiled layouts for the fixed-length parts of each pack_into() and unpack()
+_struct_H = struct.Struct("!H")
+_struct_HH = struct.Struct("!HH")
+_struct_HHL = struct.Struct("!HHL")
+_struct_HHLH = struct.Struct("!HHLH")
+_struct_HHLL = struct.Struct("!HHLL")
+_struct_LH = struct.Struct("!LH")
+_struct_LL = struct.Struct("!LL")
+
 class action_id(loxi.OFObject):
+    __slots__ = ["type"]
     subtypes = {}
 
 
@@ -25,13 +35,15 @@ class action_id(loxi.OFObject):
             self.type = 0
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!H", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for len at index 1
-        length = sum([len(x) for x in packed])
-        packed[1] = struct.pack("!H", length)
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_HH, buf, offset, self.type, 0)
+        length = offset - start
+        _struct_H.pack_into(buf, start + 2, length)
+        return offset
+
+    def wire_length(self):
+        return 4
 
     @staticmethod
     def unpack(reader):
@@ -41,8 +53,7 @@ class action_id(loxi.OFObject):
             return subclass.unpack(reader)
 
         obj = action_id()
-        obj.type = reader.read("!H")[0]
-        _len = reader.read("!H")[0]
+        obj.type, _len = reader.read_struct(_struct_HH)
         orig_reader = reader
         reader = orig_reader.slice(_len, 4)
         return obj
@@ -62,6 +73,7 @@ class action_id(loxi.OFObject):
 
 
 class experimenter(action_id):
+    __slots__ = ["experimenter"]
     subtypes = {}
 
     type = 65535
@@ -73,14 +85,15 @@ class experimenter(action_id):
             self.experimenter = 0
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!H", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for len at index 1
-        packed.append(struct.pack("!L", self.experimenter))
-        length = sum([len(x) for x in packed])
-        packed[1] = struct.pack("!H", length)
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_HHL, buf, offset, self.type, 0, self.experimenter)
+        length = offset - start
+        _struct_H.pack_into(buf, start + 2, length)
+        return offset
+
+    def wire_length(self):
+        return 8
 
     @staticmethod
     def unpack(reader):
@@ -90,9 +103,8 @@ class experimenter(action_id):
             return subclass.unpack(reader)
 
         obj = experimenter()
-        _type = reader.read("!H")[0]
+        _type, _len = reader.read_struct(_struct_HH)
         assert(_type == 65535)
-        _len = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_len, 4)
         obj.experimenter = reader.read("!L")[0]
@@ -114,6 +126,7 @@ class experimenter(action_id):
 action_id.subtypes[65535] = experimenter
 
 class bsn(experimenter):
+    __slots__ = ["subtype"]
     subtypes = {}
 
     type = 65535
@@ -126,15 +139,15 @@ class bsn(experimenter):
             self.subtype = 0
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!H", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for len at index 1
-        packed.append(struct.pack("!L", self.experimenter))
-        packed.append(struct.pack("!L", self.subtype))
-        length = sum([len(x) for x in packed])
-        packed[1] = struct.pack("!H", length)
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_HHLL, buf, offset, self.type, 0, self.experimenter, self.subtype)
+        length = offset - start
+        _struct_H.pack_into(buf, start + 2, length)
+        return offset
+
+    def wire_length(self):
+        return 12
 
     @staticmethod
     def unpack(reader):
@@ -144,14 +157,12 @@ class bsn(experimenter):
             return subclass.unpack(reader)
 
         obj = bsn()
-        _type = reader.read("!H")[0]
+        _type, _len = reader.read_struct(_struct_HH)
         assert(_type == 65535)
-        _len = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_len, 4)
-        _experimenter = reader.read("!L")[0]
+        _experimenter, obj.subtype = reader.read_struct(_struct_LL)
         assert(_experimenter == 6035143)
-        obj.subtype = reader.read("!L")[0]
         return obj
 
     def __eq__(self, other):
@@ -170,6 +181,7 @@ class bsn(experimenter):
 experimenter.subtypes[6035143] = bsn
 
 class bsn_checksum(bsn):
+    __slots__ = []
     type = 65535
     experimenter = 6035143
     subtype = 4
@@ -177,27 +189,25 @@ class bsn_checksum(bsn):
     def __init__(self):
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!H", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for len at index 1
-        packed.append(struct.pack("!L", self.experimenter))
-        packed.append(struct.pack("!L", self.subtype))
-        length = sum([len(x) for x in packed])
-        packed[1] = struct.pack("!H", length)
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_HHLL, buf, offset, self.type, 0, self.experimenter, self.subtype)
+        length = offset - start
+        _struct_H.pack_into(buf, start + 2, length)
+        return offset
+
+    def wire_length(self):
+        return 12
 
     @staticmethod
     def unpack(reader):
         obj = bsn_checksum()
-        _type = reader.read("!H")[0]
+        _type, _len = reader.read_struct(_struct_HH)
         assert(_type == 65535)
-        _len = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_len, 4)
-        _experimenter = reader.read("!L")[0]
+        _experimenter, _subtype = reader.read_struct(_struct_LL)
         assert(_experimenter == 6035143)
-        _subtype = reader.read("!L")[0]
         assert(_subtype == 4)
         return obj
 
@@ -216,6 +226,7 @@ class bsn_checksum(bsn):
 bsn.subtypes[4] = bsn_checksum
 
 class bsn_gentable(bsn):
+    __slots__ = []
     type = 65535
     experimenter = 6035143
     subtype = 5
@@ -223,27 +234,25 @@ class bsn_gentable(bsn):
     def __init__(self):
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!H", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for len at index 1
-        packed.append(struct.pack("!L", self.experimenter))
-        packed.append(struct.pack("!L", self.subtype))
-        length = sum([len(x) for x in packed])
-        packed[1] = struct.pack("!H", length)
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_HHLL, buf, offset, self.type, 0, self.experimenter, self.subtype)
+        length = offset - start
+        _struct_H.pack_into(buf, start + 2, length)
+        return offset
+
+    def wire_length(self):
+        return 12
 
     @staticmethod
     def unpack(reader):
         obj = bsn_gentable()
-        _type = reader.read("!H")[0]
+        _type, _len = reader.read_struct(_struct_HH)
         assert(_type == 65535)
-        _len = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_len, 4)
-        _experimenter = reader.read("!L")[0]
+        _experimenter, _subtype = reader.read_struct(_struct_LL)
         assert(_experimenter == 6035143)
-        _subtype = reader.read("!L")[0]
         assert(_subtype == 5)
         return obj
 
@@ -262,6 +271,7 @@ class bsn_gentable(bsn):
 bsn.subtypes[5] = bsn_gentable
 
 class bsn_mirror(bsn):
+    __slots__ = []
     type = 65535
     experimenter = 6035143
     subtype = 1
@@ -269,27 +279,25 @@ class bsn_mirror(bsn):
     def __init__(self):
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!H", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for len at index 1
-        packed.append(struct.pack("!L", self.experimenter))
-        packed.append(struct.pack("!L", self.subtype))
-        length = sum([len(x) for x in packed])
-        packed[1] = struct.pack("!H", length)
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_HHLL, buf, offset, self.type, 0, self.experimenter, self.subtype)
+        length = offset - start
+        _struct_H.pack_into(buf, start + 2, length)
+        return offset
+
+    def wire_length(self):
+        return 12
 
     @staticmethod
     def unpack(reader):
         obj = bsn_mirror()
-        _type = reader.read("!H")[0]
+        _type, _len = reader.read_struct(_struct_HH)
         assert(_type == 65535)
-        _len = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_len, 4)
-        _experimenter = reader.read("!L")[0]
+        _experimenter, _subtype = reader.read_struct(_struct_LL)
         assert(_experimenter == 6035143)
-        _subtype = reader.read("!L")[0]
         assert(_subtype == 1)
         return obj
 
@@ -308,6 +316,7 @@ class bsn_mirror(bsn):
 bsn.subtypes[1] = bsn_mirror
 
 class bsn_set_tunnel_dst(bsn):
+    __slots__ = []
     type = 65535
     experimenter = 6035143
     subtype = 2
@@ -315,27 +324,25 @@ class bsn_set_tunnel_dst(bsn):
     def __init__(self):
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!H", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for len at index 1
-        packed.append(struct.pack("!L", self.experimenter))
-        packed.append(struct.pack("!L", self.subtype))
-        length = sum([len(x) for x in packed])
-        packed[1] = struct.pack("!H", length)
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_HHLL, buf, offset, self.type, 0, self.experimenter, self.subtype)
+        length = offset - start
+        _struct_H.pack_into(buf, start + 2, length)
+        return offset
+
+    def wire_length(self):
+        return 12
 
     @staticmethod
     def unpack(reader):
         obj = bsn_set_tunnel_dst()
-        _type = reader.read("!H")[0]
+        _type, _len = reader.read_struct(_struct_HH)
         assert(_type == 65535)
-        _len = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_len, 4)
-        _experimenter = reader.read("!L")[0]
+        _experimenter, _subtype = reader.read_struct(_struct_LL)
         assert(_experimenter == 6035143)
-        _subtype = reader.read("!L")[0]
         assert(_subtype == 2)
         return obj
 
@@ -354,25 +361,27 @@ class bsn_set_tunnel_dst(bsn):
 bsn.subtypes[2] = bsn_set_tunnel_dst
 
 class copy_ttl_in(action_id):
+    __slots__ = []
     type = 12
 
     def __init__(self):
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!H", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for len at index 1
-        length = sum([len(x) for x in packed])
-        packed[1] = struct.pack("!H", length)
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_HH, buf, offset, self.type, 0)
+        length = offset - start
+        _struct_H.pack_into(buf, start + 2, length)
+        return offset
+
+    def wire_length(self):
+        return 4
 
     @staticmethod
     def unpack(reader):
         obj = copy_ttl_in()
-        _type = reader.read("!H")[0]
+        _type, _len = reader.read_struct(_struct_HH)
         assert(_type == 12)
-        _len = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_len, 4)
         return obj
@@ -392,25 +401,27 @@ class copy_ttl_in(action_id):
 action_id.subtypes[12] = copy_ttl_in
 
 class copy_ttl_out(action_id):
+    __slots__ = []
     type = 11
 
     def __init__(self):
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!H", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for len at index 1
-        length = sum([len(x) for x in packed])
-        packed[1] = struct.pack("!H", length)
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_HH, buf, offset, self.type, 0)
+        length = offset - start
+        _struct_H.pack_into(buf, start + 2, length)
+        return offset
+
+    def wire_length(self):
+        return 4
 
     @staticmethod
     def unpack(reader):
         obj = copy_ttl_out()
-        _type = reader.read("!H")[0]
+        _type, _len = reader.read_struct(_struct_HH)
         assert(_type == 11)
-        _len = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_len, 4)
         return obj
@@ -430,25 +441,27 @@ class copy_ttl_out(action_id):
 action_id.subtypes[11] = copy_ttl_out
 
 class dec_mpls_ttl(action_id):
+    __slots__ = []
     type = 16
 
     def __init__(self):
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!H", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for len at index 1
-        length = sum([len(x) for x in packed])
-        packed[1] = struct.pack("!H", length)
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_HH, buf, offset, self.type, 0)
+        length = offset - start
+        _struct_H.pack_into(buf, start + 2, length)
+        return offset
+
+    def wire_length(self):
+        return 4
 
     @staticmethod
     def unpack(reader):
         obj = dec_mpls_ttl()
-        _type = reader.read("!H")[0]
+        _type, _len = reader.read_struct(_struct_HH)
         assert(_type == 16)
-        _len = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_len, 4)
         return obj
@@ -468,25 +481,27 @@ class dec_mpls_ttl(action_id):
 action_id.subtypes[16] = dec_mpls_ttl
 
 class dec_nw_ttl(action_id):
+    __slots__ = []
     type = 24
 
     def __init__(self):
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!H", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for len at index 1
-        length = sum([len(x) for x in packed])
-        packed[1] = struct.pack("!H", length)
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_HH, buf, offset, self.type, 0)
+        length = offset - start
+        _struct_H.pack_into(buf, start + 2, length)
+        return offset
+
+    def wire_length(self):
+        return 4
 
     @staticmethod
     def unpack(reader):
         obj = dec_nw_ttl()
-        _type = reader.read("!H")[0]
+        _type, _len = reader.read_struct(_struct_HH)
         assert(_type == 24)
-        _len = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_len, 4)
         return obj
@@ -506,25 +521,27 @@ class dec_nw_ttl(action_id):
 action_id.subtypes[24] = dec_nw_ttl
 
 class group(action_id):
+    __slots__ = []
     type = 22
 
     def __init__(self):
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!H", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for len at index 1
-        length = sum([len(x) for x in packed])
-        packed[1] = struct.pack("!H", length)
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_HH, buf, offset, self.type, 0)
+        length = offset - start
+        _struct_H.pack_into(buf, start + 2, length)
+        return offset
+
+    def wire_length(self):
+        return 4
 
     @staticmethod
     def unpack(reader):
         obj = group()
-        _type = reader.read("!H")[0]
+        _type, _len = reader.read_struct(_struct_HH)
         assert(_type == 22)
-        _len = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_len, 4)
         return obj
@@ -544,6 +561,7 @@ class group(action_id):
 action_id.subtypes[22] = group
 
 class nicira(experimenter):
+    __slots__ = ["subtype"]
     subtypes = {}
 
     type = 65535
@@ -556,15 +574,15 @@ class nicira(experimenter):
             self.subtype = 0
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!H", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for len at index 1
-        packed.append(struct.pack("!L", self.experimenter))
-        packed.append(struct.pack("!H", self.subtype))
-        length = sum([len(x) for x in packed])
-        packed[1] = struct.pack("!H", length)
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_HHLH, buf, offset, self.type, 0, self.experimenter, self.subtype)
+        length = offset - start
+        _struct_H.pack_into(buf, start + 2, length)
+        return offset
+
+    def wire_length(self):
+        return 10
 
     @staticmethod
     def unpack(reader):
@@ -574,14 +592,12 @@ class nicira(experimenter):
             return subclass.unpack(reader)
 
         obj = nicira()
-        _type = reader.read("!H")[0]
+        _type, _len = reader.read_struct(_struct_HH)
         assert(_type == 65535)
-        _len = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_len, 4)
-        _experimenter = reader.read("!L")[0]
+        _experimenter, obj.subtype = reader.read_struct(_struct_LH)
         assert(_experimenter == 8992)
-        obj.subtype = reader.read("!H")[0]
         return obj
 
     def __eq__(self, other):
@@ -600,6 +616,7 @@ class nicira(experimenter):
 experimenter.subtypes[8992] = nicira
 
 class nicira_dec_ttl(nicira):
+    __slots__ = []
     type = 65535
     experimenter = 8992
     subtype = 18
@@ -607,27 +624,25 @@ class nicira_dec_ttl(nicira):
     def __init__(self):
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!H", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for len at index 1
-        packed.append(struct.pack("!L", self.experimenter))
-        packed.append(struct.pack("!H", self.subtype))
-        length = sum([len(x) for x in packed])
-        packed[1] = struct.pack("!H", length)
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_HHLH, buf, offset, self.type, 0, self.experimenter, self.subtype)
+        length = offset - start
+        _struct_H.pack_into(buf, start + 2, length)
+        return offset
+
+    def wire_length(self):
+        return 10
 
     @staticmethod
     def unpack(reader):
         obj = nicira_dec_ttl()
-        _type = reader.read("!H")[0]
+        _type, _len = reader.read_struct(_struct_HH)
         assert(_type == 65535)
-        _len = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_len, 4)
-        _experimenter = reader.read("!L")[0]
+        _experimenter, _subtype = reader.read_struct(_struct_LH)
         assert(_experimenter == 8992)
-        _subtype = reader.read("!H")[0]
         assert(_subtype == 18)
         return obj
 
@@ -646,25 +661,27 @@ class nicira_dec_ttl(nicira):
 nicira.subtypes[18] = nicira_dec_ttl
 
 class output(action_id):
+    __slots__ = []
     type = 0
 
     def __init__(self):
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!H", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for len at index 1
-        length = sum([len(x) for x in packed])
-        packed[1] = struct.pack("!H", length)
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_HH, buf, offset, self.type, 0)
+        length = offset - start
+        _struct_H.pack_into(buf, start + 2, length)
+        return offset
+
+    def wire_length(self):
+        return 4
 
     @staticmethod
     def unpack(reader):
         obj = output()
-        _type = reader.read("!H")[0]
+        _type, _len = reader.read_struct(_struct_HH)
         assert(_type == 0)
-        _len = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_len, 4)
         return obj
@@ -684,25 +701,27 @@ class output(action_id):
 action_id.subtypes[0] = output
 
 class pop_mpls(action_id):
+    __slots__ = []
     type = 20
 
     def __init__(self):
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!H", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for len at index 1
-        length = sum([len(x) for x in packed])
-        packed[1] = struct.pack("!H", length)
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_HH, buf, offset, self.type, 0)
+        length = offset - start
+        _struct_H.pack_into(buf, start + 2, length)
+        return offset
+
+    def wire_length(self):
+        return 4
 
     @staticmethod
     def unpack(reader):
         obj = pop_mpls()
-        _type = reader.read("!H")[0]
+        _type, _len = reader.read_struct(_struct_HH)
         assert(_type == 20)
-        _len = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_len, 4)
         return obj
@@ -722,25 +741,27 @@ class pop_mpls(action_id):
 action_id.subtypes[20] = pop_mpls
 
 class pop_pbb(action_id):
+    __slots__ = []
     type = 27
 
     def __init__(self):
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!H", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for len at index 1
-        length = sum([len(x) for x in packed])
-        packed[1] = struct.pack("!H", length)
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_HH, buf, offset, self.type, 0)
+        length = offset - start
+        _struct_H.pack_into(buf, start + 2, length)
+        return offset
+
+    def wire_length(self):
+        return 4
 
     @staticmethod
     def unpack(reader):
         obj = pop_pbb()
-        _type = reader.read("!H")[0]
+        _type, _len = reader.read_struct(_struct_HH)
         assert(_type == 27)
-        _len = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_len, 4)
         return obj
@@ -760,25 +781,27 @@ class pop_pbb(action_id):
 action_id.subtypes[27] = pop_pbb
 
 class pop_vlan(action_id):
+    __slots__ = []
     type = 18
 
     def __init__(self):
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!H", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for len at index 1
-        length = sum([len(x) for x in packed])
-        packed[1] = struct.pack("!H", length)
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_HH, buf, offset, self.type, 0)
+        length = offset - start
+        _struct_H.pack_into(buf, start + 2, length)
+        return offset
+
+    def wire_length(self):
+        return 4
 
     @staticmethod
     def unpack(reader):
         obj = pop_vlan()
-        _type = reader.read("!H")[0]
+        _type, _len = reader.read_struct(_struct_HH)
         assert(_type == 18)
-        _len = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_len, 4)
         return obj
@@ -798,25 +821,27 @@ class pop_vlan(action_id):
 action_id.subtypes[18] = pop_vlan
 
 class push_mpls(action_id):
+    __slots__ = []
     type = 19
 
     def __init__(self):
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!H", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for len at index 1
-        length = sum([len(x) for x in packed])
-        packed[1] = struct.pack("!H", length)
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_HH, buf, offset, self.type, 0)
+        length = offset - start
+        _struct_H.pack_into(buf, start + 2, length)
+        return offset
+
+    def wire_length(self):
+        return 4
 
     @staticmethod
     def unpack(reader):
         obj = push_mpls()
-        _type = reader.read("!H")[0]
+        _type, _len = reader.read_struct(_struct_HH)
         assert(_type == 19)
-        _len = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_len, 4)
         return obj
@@ -836,25 +861,27 @@ class push_mpls(action_id):
 action_id.subtypes[19] = push_mpls
 
 class push_pbb(action_id):
+    __slots__ = []
     type = 26
 
     def __init__(self):
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!H", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for len at index 1
-        length = sum([len(x) for x in packed])
-        packed[1] = struct.pack("!H", length)
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_HH, buf, offset, self.type, 0)
+        length = offset - start
+        _struct_H.pack_into(buf, start + 2, length)
+        return offset
+
+    def wire_length(self):
+        return 4
 
     @staticmethod
     def unpack(reader):
         obj = push_pbb()
-        _type = reader.read("!H")[0]
+        _type, _len = reader.read_struct(_struct_HH)
         assert(_type == 26)
-        _len = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_len, 4)
         return obj
@@ -874,25 +901,27 @@ class push_pbb(action_id):
 action_id.subtypes[26] = push_pbb
 
 class push_vlan(action_id):
+    __slots__ = []
     type = 17
 
     def __init__(self):
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!H", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for len at index 1
-        length = sum([len(x) for x in packed])
-        packed[1] = struct.pack("!H", length)
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_HH, buf, offset, self.type, 0)
+        length = offset - start
+        _struct_H.pack_into(buf, start + 2, length)
+        return offset
+
+    def wire_length(self):
+        return 4
 
     @staticmethod
     def unpack(reader):
         obj = push_vlan()
-        _type = reader.read("!H")[0]
+        _type, _len = reader.read_struct(_struct_HH)
         assert(_type == 17)
-        _len = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_len, 4)
         return obj
@@ -912,25 +941,27 @@ class push_vlan(action_id):
 action_id.subtypes[17] = push_vlan
 
 class set_field(action_id):
+    __slots__ = []
     type = 25
 
     def __init__(self):
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!H", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for len at index 1
-        length = sum([len(x) for x in packed])
-        packed[1] = struct.pack("!H", length)
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_HH, buf, offset, self.type, 0)
+        length = offset - start
+        _struct_H.pack_into(buf, start + 2, length)
+        return offset
+
+    def wire_length(self):
+        return 4
 
     @staticmethod
     def unpack(reader):
         obj = set_field()
-        _type = reader.read("!H")[0]
+        _type, _len = reader.read_struct(_struct_HH)
         assert(_type == 25)
-        _len = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_len, 4)
         return obj
@@ -950,25 +981,27 @@ class set_field(action_id):
 action_id.subtypes[25] = set_field
 
 class set_mpls_ttl(action_id):
+    __slots__ = []
     type = 15
 
     def __init__(self):
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!H", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for len at index 1
-        length = sum([len(x) for x in packed])
-        packed[1] = struct.pack("!H", length)
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_HH, buf, offset, self.type, 0)
+        length = offset - start
+        _struct_H.pack_into(buf, start + 2, length)
+        return offset
+
+    def wire_length(self):
+        return 4
 
     @staticmethod
     def unpack(reader):
         obj = set_mpls_ttl()
-        _type = reader.read("!H")[0]
+        _type, _len = reader.read_struct(_struct_HH)
         assert(_type == 15)
-        _len = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_len, 4)
         return obj
@@ -988,25 +1021,27 @@ class set_mpls_ttl(action_id):
 action_id.subtypes[15] = set_mpls_ttl
 
 class set_nw_ttl(action_id):
+    __slots__ = []
     type = 23
 
     def __init__(self):
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!H", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for len at index 1
-        length = sum([len(x) for x in packed])
-        packed[1] = struct.pack("!H", length)
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_HH, buf, offset, self.type, 0)
+        length = offset - start
+        _struct_H.pack_into(buf, start + 2, length)
+        return offset
+
+    def wire_length(self):
+        return 4
 
     @staticmethod
     def unpack(reader):
         obj = set_nw_ttl()
-        _type = reader.read("!H")[0]
+        _type, _len = reader.read_struct(_struct_HH)
         assert(_type == 23)
-        _len = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_len, 4)
         return obj
@@ -1026,25 +1061,27 @@ class set_nw_ttl(action_id):
 action_id.subtypes[23] = set_nw_ttl
 
 class set_queue(action_id):
+    __slots__ = []
     type = 21
 
     def __init__(self):
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!H", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for len at index 1
-        length = sum([len(x) for x in packed])
-        packed[1] = struct.pack("!H", length)
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_HH, buf, offset, self.type, 0)
+        length = offset - start
+        _struct_H.pack_into(buf, start + 2, length)
+        return offset
+
+    def wire_length(self):
+        return 4
 
     @staticmethod
     def unpack(reader):
         obj = set_queue()
-        _type = reader.read("!H")[0]
+        _type, _len = reader.read_struct(_struct_HH)
         assert(_type == 21)
-        _len = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_len, 4)
         return obj
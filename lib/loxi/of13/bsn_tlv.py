@@ -14,7 +14,17 @@ import loxi.generic_util
 import sys
 ofp = sys.modules['loxi.of13']
 
+# Precompiled layouts for the fixed-length parts of each pack_into() and unpack()
+_struct_6B = struct.Struct("!6B")
+_struct_H = struct.Struct("!H")
+_struct_HH = struct.Struct("!HH")
+_struct_HHB = struct.Struct("!HHB")
+_struct_HHH = struct.Struct("!HHH")
+_struct_HHL = struct.Struct("!HHL")
+_struct_HHQ = struct.Struct("!HHQ")
+
 class bsn_tlv(loxi.OFObject):
+    __slots__ = ["type"]
     subtypes = {}
 
 
@@ -25,13 +35,15 @@ class bsn_tlv(loxi.OFObject):
             self.type = 0
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!H", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
-        length = sum([len(x) for x in packed])
-        packed[1] = struct.pack("!H", length)
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_HH, buf, offset, self.type, 0)
+        length = offset - start
+        _struct_H.pack_into(buf, start + 2, length)
+        return offset
+
+    def wire_length(self):
+        return 4
 
     @staticmethod
     def unpack(reader):
@@ -41,8 +53,7 @@ class bsn_tlv(loxi.OFObject):
             return subclass.unpack(reader)
 
         obj = bsn_tlv()
-        obj.type = reader.read("!H")[0]
-        _length = reader.read("!H")[0]
+        obj.type, _length = reader.read_struct(_struct_HH)
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
         return obj
@@ -62,6 +73,7 @@ class bsn_tlv(loxi.OFObject):
 
 
 class actor_key(bsn_tlv):
+    __slots__ = ["value"]
     type = 44
 
     def __init__(self, value=None):
@@ -71,21 +83,21 @@ class actor_key(bsn_tlv):
             self.value = 0
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!H", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
-        packed.append(struct.pack("!H", self.value))
-        length = sum([len(x) for x in packed])
-        packed[1] = struct.pack("!H", length)
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_HHH, buf, offset, self.type, 0, self.value)
+        length = offset - start
+        _struct_H.pack_into(buf, start + 2, length)
+        return offset
+
+    def wire_length(self):
+        return 6
 
     @staticmethod
     def unpack(reader):
         obj = actor_key()
-        _type = reader.read("!H")[0]
+        _type, _length = reader.read_struct(_struct_HH)
         assert(_type == 44)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
         obj.value = reader.read("!H")[0]
@@ -109,6 +121,7 @@ class actor_key(bsn_tlv):
 bsn_tlv.subtypes[44] = actor_key
 
 class actor_port_num(bsn_tlv):
+    __slots__ = ["value"]
     type = 43
 
     def __init__(self, value=None):
@@ -118,21 +131,21 @@ class actor_port_num(bsn_tlv):
             self.value = 0
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!H", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
-        packed.append(struct.pack("!H", self.value))
-        length = sum([len(x) for x in packed])
-        packed[1] = struct.pack("!H", length)
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_HHH, buf, offset, self.type, 0, self.value)
+        length = offset - start
+        _struct_H.pack_into(buf, start + 2, length)
+        return offset
+
+    def wire_length(self):
+        return 6
 
     @staticmethod
     def unpack(reader):
         obj = actor_port_num()
-        _type = reader.read("!H")[0]
+        _type, _length = reader.read_struct(_struct_HH)
         assert(_type == 43)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
         obj.value = reader.read("!H")[0]
@@ -156,6 +169,7 @@ class actor_port_num(bsn_tlv):
 bsn_tlv.subtypes[43] = actor_port_num
 
 class actor_port_priority(bsn_tlv):
+    __slots__ = ["value"]
     type = 42
 
     def __init__(self, value=None):
@@ -165,21 +179,21 @@ class actor_port_priority(bsn_tlv):
             self.value = 0
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!H", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
-        packed.append(struct.pack("!H", self.value))
-        length = sum([len(x) for x in packed])
-        packed[1] = struct.pack("!H", length)
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_HHH, buf, offset, self.type, 0, self.value)
+        length = offset - start
+        _struct_H.pack_into(buf, start + 2, length)
+        return offset
+
+    def wire_length(self):
+        return 6
 
     @staticmethod
     def unpack(reader):
         obj = actor_port_priority()
-        _type = reader.read("!H")[0]
+        _type, _length = reader.read_struct(_struct_HH)
         assert(_type == 42)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
         obj.value = reader.read("!H")[0]
@@ -203,6 +217,7 @@ class actor_port_priority(bsn_tlv):
 bsn_tlv.subtypes[42] = actor_port_priority
 
 class actor_state(bsn_tlv):
+    __slots__ = ["value"]
     type = 53
 
     def __init__(self, value=None):
@@ -212,21 +227,21 @@ class actor_state(bsn_tlv):
             self.value = 0
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!H", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
-        packed.append(struct.pack("!B", self.value))
-        length = sum([len(x) for x in packed])
-        packed[1] = struct.pack("!H", length)
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_HHB, buf, offset, self.type, 0, self.value)
+        length = offset - start
+        _struct_H.pack_into(buf, start + 2, length)
+        return offset
+
+    def wire_length(self):
+        return 5
 
     @staticmethod
     def unpack(reader):
         obj = actor_state()
-        _type = reader.read("!H")[0]
+        _type, _length = reader.read_struct(_struct_HH)
         assert(_type == 53)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
         obj.value = reader.read("!B")[0]
@@ -250,6 +265,7 @@ class actor_state(bsn_tlv):
 bsn_tlv.subtypes[53] = actor_state
 
 class actor_system_mac(bsn_tlv):
+    __slots__ = ["value"]
     type = 41
 
     def __init__(self, value=None):
@@ -259,21 +275,22 @@ class actor_system_mac(bsn_tlv):
             self.value = [0,0,0,0,0,0]
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!H", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
-        packed.append(struct.pack("!6B", *self.value))
-        length = sum([len(x) for x in packed])
-        packed[1] = struct.pack("!H", length)
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_HH, buf, offset, self.type, 0)
+        offset = loxi.generic_util.pack_struct_into(_struct_6B, buf, offset, *self.value)
+        length = offset - start
+        _struct_H.pack_into(buf, start + 2, length)
+        return offset
+
+    def wire_length(self):
+        return 10
 
     @staticmethod
     def unpack(reader):
         obj = actor_system_mac()
-        _type = reader.read("!H")[0]
+        _type, _length = reader.read_struct(_struct_HH)
         assert(_type == 41)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
         obj.value = list(reader.read('!6B'))
@@ -297,6 +314,7 @@ class actor_system_mac(bsn_tlv):
 bsn_tlv.subtypes[41] = actor_system_mac
 
 class actor_system_priority(bsn_tlv):
+    __slots__ = ["value"]
     type = 40
 
     def __init__(self, value=None):
@@ -306,21 +324,21 @@ class actor_system_priority(bsn_tlv):
             self.value = 0
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!H", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
-        packed.append(struct.pack("!H", self.value))
-        length = sum([len(x) for x in packed])
-        packed[1] = struct.pack("!H", length)
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_HHH, buf, offset, self.type, 0, self.value)
+        length = offset - start
+        _struct_H.pack_into(buf, start + 2, length)
+        return offset
+
+    def wire_length(self):
+        return 6
 
     @staticmethod
     def unpack(reader):
         obj = actor_system_priority()
-        _type = reader.read("!H")[0]
+        _type, _length = reader.read_struct(_struct_HH)
         assert(_type == 40)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
         obj.value = reader.read("!H")[0]
@@ -344,6 +362,7 @@ class actor_system_priority(bsn_tlv):
 bsn_tlv.subtypes[40] = actor_system_priority
 
 class broadcast_query_timeout(bsn_tlv):
+    __slots__ = ["value"]
     type = 10
 
     def __init__(self, value=None):
@@ -353,21 +372,21 @@ class broadcast_query_timeout(bsn_tlv):
             self.value = 0
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!H", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
-        packed.append(struct.pack("!L", self.value))
-        length = sum([len(x) for x in packed])
-        packed[1] = struct.pack("!H", length)
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_HHL, buf, offset, self.type, 0, self.value)
+        length = offset - start
+        _struct_H.pack_into(buf, start + 2, length)
+        return offset
+
+    def wire_length(self):
+        return 8
 
     @staticmethod
     def unpack(reader):
         obj = broadcast_query_timeout()
-        _type = reader.read("!H")[0]
+        _type, _length = reader.read_struct(_struct_HH)
         assert(_type == 10)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
         obj.value = reader.read("!L")[0]
@@ -391,6 +410,7 @@ class broadcast_query_timeout(bsn_tlv):
 bsn_tlv.subtypes[10] = broadcast_query_timeout
 
 class bucket(bsn_tlv):
+    __slots__ = ["value"]
     type = 64
 
     def __init__(self, value=None):
@@ -400,21 +420,22 @@ class bucket(bsn_tlv):
             self.value = []
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!H", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
-        packed.append(loxi.generic_util.pack_list(self.value))
-        length = sum([len(x) for x in packed])
-        packed[1] = struct.pack("!H", length)
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_HH, buf, offset, self.type, 0)
+        offset = loxi.generic_util.pack_list_into(self.value, buf, offset)
+        length = offset - start
+        _struct_H.pack_into(buf, start + 2, length)
+        return offset
+
+    def wire_length(self):
+        return 4 + loxi.generic_util.list_wire_length(self.value)
 
     @staticmethod
     def unpack(reader):
         obj = bucket()
-        _type = reader.read("!H")[0]
+        _type, _length = reader.read_struct(_struct_HH)
         assert(_type == 64)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
         obj.value = loxi.generic_util.unpack_list(reader, ofp.bsn_tlv.bsn_tlv.unpack)
@@ -438,6 +459,7 @@ class bucket(bsn_tlv):
 bsn_tlv.subtypes[64] = bucket
 
 class circuit_id(bsn_tlv):
+    __slots__ = ["value"]
     type = 14
 
     def __init__(self, value=None):
@@ -447,24 +469,25 @@ class circuit_id(bsn_tlv):
             self.value = ''
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!H", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
-        packed.append(self.value)
-        length = sum([len(x) for x in packed])
-        packed[1] = struct.pack("!H", length)
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_HH, buf, offset, self.type, 0)
+        offset = loxi.generic_util.pack_bytes_into(self.value, buf, offset)
+        length = offset - start
+        _struct_H.pack_into(buf, start + 2, length)
+        return offset
+
+    def wire_length(self):
+        return 4 + len(self.value)
 
     @staticmethod
     def unpack(reader):
         obj = circuit_id()
-        _type = reader.read("!H")[0]
+        _type, _length = reader.read_struct(_struct_HH)
         assert(_type == 14)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.value = str(reader.read_all())
+        obj.value = reader.read_all()
         return obj
 
     def __eq__(self, other):
@@ -485,6 +508,7 @@ class circuit_id(bsn_tlv):
 bsn_tlv.subtypes[14] = circuit_id
 
 class convergence_status(bsn_tlv):
+    __slots__ = ["value"]
     type = 45
 
     def __init__(self, value=None):
@@ -494,21 +518,21 @@ class convergence_status(bsn_tlv):
             self.value = 0
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!H", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
-        packed.append(struct.pack("!B", self.value))
-        length = sum([len(x) for x in packed])
-        packed[1] = struct.pack("!H", length)
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_HHB, buf, offset, self.type, 0, self.value)
+        length = offset - start
+        _struct_H.pack_into(buf, start + 2, length)
+        return offset
+
+    def wire_length(self):
+        return 5
 
     @staticmethod
     def unpack(reader):
         obj = convergence_status()
-        _type = reader.read("!H")[0]
+        _type, _length = reader.read_struct(_struct_HH)
         assert(_type == 45)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
         obj.value = reader.read("!B")[0]
@@ -532,6 +556,7 @@ class convergence_status(bsn_tlv):
 bsn_tlv.subtypes[45] = convergence_status
 
 class crc_enabled(bsn_tlv):
+    __slots__ = ["value"]
     type = 22
 
     def __init__(self, value=None):
@@ -541,21 +566,21 @@ class crc_enabled(bsn_tlv):
             self.value = 0
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!H", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
-        packed.append(struct.pack("!B", self.value))
-        length = sum([len(x) for x in packed])
-        packed[1] = struct.pack("!H", length)
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_HHB, buf, offset, self.type, 0, self.value)
+        length = offset - start
+        _struct_H.pack_into(buf, start + 2, length)
+        return offset
+
+    def wire_length(self):
+        return 5
 
     @staticmethod
     def unpack(reader):
         obj = crc_enabled()
-        _type = reader.read("!H")[0]
+        _type, _length = reader.read_struct(_struct_HH)
         assert(_type == 22)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
         obj.value = reader.read("!B")[0]
@@ -579,6 +604,7 @@ class crc_enabled(bsn_tlv):
 bsn_tlv.subtypes[22] = crc_enabled
 
 class data(bsn_tlv):
+    __slots__ = ["value"]
     type = 55
 
     def __init__(self, value=None):
@@ -588,24 +614,25 @@ class data(bsn_tlv):
             self.value = ''
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!H", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
-        packed.append(self.value)
-        length = sum([len(x) for x in packed])
-        packed[1] = struct.pack("!H", length)
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_HH, buf, offset, self.type, 0)
+        offset = loxi.generic_util.pack_bytes_into(self.value, buf, offset)
+        length = offset - start
+        _struct_H.pack_into(buf, start + 2, length)
+        return offset
+
+    def wire_length(self):
+        return 4 + len(self.value)
 
     @staticmethod
     def unpack(reader):
         obj = data()
-        _type = reader.read("!H")[0]
+        _type, _length = reader.read_struct(_struct_HH)
         assert(_type == 55)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.value = str(reader.read_all())
+        obj.value = reader.read_all()
         return obj
 
     def __eq__(self, other):
@@ -626,6 +653,7 @@ class data(bsn_tlv):
 bsn_tlv.subtypes[55] = data
 
 class eth_dst(bsn_tlv):
+    __slots__ = ["value"]
     type = 33
 
     def __init__(self, value=None):
@@ -635,21 +663,22 @@ class eth_dst(bsn_tlv):
             self.value = [0,0,0,0,0,0]
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!H", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
-        packed.append(struct.pack("!6B", *self.value))
-        length = sum([len(x) for x in packed])
-        packed[1] = struct.pack("!H", length)
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_HH, buf, offset, self.type, 0)
+        offset = loxi.generic_util.pack_struct_into(_struct_6B, buf, offset, *self.value)
+        length = offset - start
+        _struct_H.pack_into(buf, start + 2, length)
+        return offset
+
+    def wire_length(self):
+        return 10
 
     @staticmethod
     def unpack(reader):
         obj = eth_dst()
-        _type = reader.read("!H")[0]
+        _type, _length = reader.read_struct(_struct_HH)
         assert(_type == 33)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
         obj.value = list(reader.read('!6B'))
@@ -673,6 +702,7 @@ class eth_dst(bsn_tlv):
 bsn_tlv.subtypes[33] = eth_dst
 
 class eth_src(bsn_tlv):
+    __slots__ = ["value"]
     type = 32
 
     def __init__(self, value=None):
@@ -682,21 +712,22 @@ class eth_src(bsn_tlv):
             self.value = [0,0,0,0,0,0]
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!H", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
-        packed.append(struct.pack("!6B", *self.value))
-        length = sum([len(x) for x in packed])
-        packed[1] = struct.pack("!H", length)
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_HH, buf, offset, self.type, 0)
+        offset = loxi.generic_util.pack_struct_into(_struct_6B, buf, offset, *self.value)
+        length = offset - start
+        _struct_H.pack_into(buf, start + 2, length)
+        return offset
+
+    def wire_length(self):
+        return 10
 
     @staticmethod
     def unpack(reader):
         obj = eth_src()
-        _type = reader.read("!H")[0]
+        _type, _length = reader.read_struct(_struct_HH)
         assert(_type == 32)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
         obj.value = list(reader.read('!6B'))
@@ -720,6 +751,7 @@ class eth_src(bsn_tlv):
 bsn_tlv.subtypes[32] = eth_src
 
 class external_gateway_ip(bsn_tlv):
+    __slots__ = ["value"]
     type = 26
 
     def __init__(self, value=None):
@@ -729,21 +761,21 @@ class external_gateway_ip(bsn_tlv):
             self.value = 0
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!H", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
-        packed.append(struct.pack("!L", self.value))
-        length = sum([len(x) for x in packed])
-        packed[1] = struct.pack("!H", length)
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_HHL, buf, offset, self.type, 0, self.value)
+        length = offset - start
+        _struct_H.pack_into(buf, start + 2, length)
+        return offset
+
+    def wire_length(self):
+        return 8
 
     @staticmethod
     def unpack(reader):
         obj = external_gateway_ip()
-        _type = reader.read("!H")[0]
+        _type, _length = reader.read_struct(_struct_HH)
         assert(_type == 26)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
         obj.value = reader.read("!L")[0]
@@ -767,6 +799,7 @@ class external_gateway_ip(bsn_tlv):
 bsn_tlv.subtypes[26] = external_gateway_ip
 
 class external_gateway_mac(bsn_tlv):
+    __slots__ = ["value"]
     type = 29
 
     def __init__(self, value=None):
@@ -776,21 +809,22 @@ class external_gateway_mac(bsn_tlv):
             self.value = [0,0,0,0,0,0]
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!H", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
-        packed.append(struct.pack("!6B", *self.value))
-        length = sum([len(x) for x in packed])
-        packed[1] = struct.pack("!H", length)
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_HH, buf, offset, self.type, 0)
+        offset = loxi.generic_util.pack_struct_into(_struct_6B, buf, offset, *self.value)
+        length = offset - start
+        _struct_H.pack_into(buf, start + 2, length)
+        return offset
+
+    def wire_length(self):
+        return 10
 
     @staticmethod
     def unpack(reader):
         obj = external_gateway_mac()
-        _type = reader.read("!H")[0]
+        _type, _length = reader.read_struct(_struct_HH)
         assert(_type == 29)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
         obj.value = list(reader.read('!6B'))
@@ -814,6 +848,7 @@ class external_gateway_mac(bsn_tlv):
 bsn_tlv.subtypes[29] = external_gateway_mac
 
 class external_ip(bsn_tlv):
+    __slots__ = ["value"]
     type = 23
 
     def __init__(self, value=None):
@@ -823,21 +858,21 @@ class external_ip(bsn_tlv):
             self.value = 0
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!H", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
-        packed.append(struct.pack("!L", self.value))
-        length = sum([len(x) for x in packed])
-        packed[1] = struct.pack("!H", length)
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_HHL, buf, offset, self.type, 0, self.value)
+        length = offset - start
+        _struct_H.pack_into(buf, start + 2, length)
+        return offset
+
+    def wire_length(self):
+        return 8
 
     @staticmethod
     def unpack(reader):
         obj = external_ip()
-        _type = reader.read("!H")[0]
+        _type, _length = reader.read_struct(_struct_HH)
         assert(_type == 23)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
         obj.value = reader.read("!L")[0]
@@ -861,6 +896,7 @@ class external_ip(bsn_tlv):
 bsn_tlv.subtypes[23] = external_ip
 
 class external_mac(bsn_tlv):
+    __slots__ = ["value"]
     type = 24
 
     def __init__(self, value=None):
@@ -870,21 +906,22 @@ class external_mac(bsn_tlv):
             self.value = [0,0,0,0,0,0]
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!H", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
-        packed.append(struct.pack("!6B", *self.value))
-        length = sum([len(x) for x in packed])
-        packed[1] = struct.pack("!H", length)
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_HH, buf, offset, self.type, 0)
+        offset = loxi.generic_util.pack_struct_into(_struct_6B, buf, offset, *self.value)
+        length = offset - start
+        _struct_H.pack_into(buf, start + 2, length)
+        return offset
+
+    def wire_length(self):
+        return 10
 
     @staticmethod
     def unpack(reader):
         obj = external_mac()
-        _type = reader.read("!H")[0]
+        _type, _length = reader.read_struct(_struct_HH)
         assert(_type == 24)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
         obj.value = list(reader.read('!6B'))
@@ -908,6 +945,7 @@ class external_mac(bsn_tlv):
 bsn_tlv.subtypes[24] = external_mac
 
 class external_netmask(bsn_tlv):
+    __slots__ = ["value"]
     type = 25
 
     def __init__(self, value=None):
@@ -917,21 +955,21 @@ class external_netmask(bsn_tlv):
             self.value = 0
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!H", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
-        packed.append(struct.pack("!L", self.value))
-        length = sum([len(x) for x in packed])
-        packed[1] = struct.pack("!H", length)
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_HHL, buf, offset, self.type, 0, self.value)
+        length = offset - start
+        _struct_H.pack_into(buf, start + 2, length)
+        return offset
+
+    def wire_length(self):
+        return 8
 
     @staticmethod
     def unpack(reader):
         obj = external_netmask()
-        _type = reader.read("!H")[0]
+        _type, _length = reader.read_struct(_struct_HH)
         assert(_type == 25)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
         obj.value = reader.read("!L")[0]
@@ -955,6 +993,7 @@ class external_netmask(bsn_tlv):
 bsn_tlv.subtypes[25] = external_netmask
 
 class header_size(bsn_tlv):
+    __slots__ = ["value"]
     type = 31
 
     def __init__(self, value=None):
@@ -964,21 +1003,21 @@ class header_size(bsn_tlv):
             self.value = 0
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!H", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
-        packed.append(struct.pack("!L", self.value))
-        length = sum([len(x) for x in packed])
-        packed[1] = struct.pack("!H", length)
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_HHL, buf, offset, self.type, 0, self.value)
+        length = offset - start
+        _struct_H.pack_into(buf, start + 2, length)
+        return offset
+
+    def wire_length(self):
+        return 8
 
     @staticmethod
     def unpack(reader):
         obj = header_size()
-        _type = reader.read("!H")[0]
+        _type, _length = reader.read_struct(_struct_HH)
         assert(_type == 31)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
         obj.value = reader.read("!L")[0]
@@ -1002,6 +1041,7 @@ class header_size(bsn_tlv):
 bsn_tlv.subtypes[31] = header_size
 
 class icmp_code(bsn_tlv):
+    __slots__ = ["value"]
     type = 69
 
     def __init__(self, value=None):
@@ -1011,21 +1051,21 @@ class icmp_code(bsn_tlv):
             self.value = 0
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!H", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
-        packed.append(struct.pack("!B", self.value))
-        length = sum([len(x) for x in packed])
-        packed[1] = struct.pack("!H", length)
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_HHB, buf, offset, self.type, 0, self.value)
+        length = offset - start
+        _struct_H.pack_into(buf, start + 2, length)
+        return offset
+
+    def wire_length(self):
+        return 5
 
     @staticmethod
     def unpack(reader):
         obj = icmp_code()
-        _type = reader.read("!H")[0]
+        _type, _length = reader.read_struct(_struct_HH)
         assert(_type == 69)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
         obj.value = reader.read("!B")[0]
@@ -1049,6 +1089,7 @@ class icmp_code(bsn_tlv):
 bsn_tlv.subtypes[69] = icmp_code
 
 class icmp_id(bsn_tlv):
+    __slots__ = ["value"]
     type = 70
 
     def __init__(self, value=None):
@@ -1058,21 +1099,21 @@ class icmp_id(bsn_tlv):
             self.value = 0
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!H", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
-        packed.append(struct.pack("!H", self.value))
-        length = sum([len(x) for x in packed])
-        packed[1] = struct.pack("!H", length)
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_HHH, buf, offset, self.type, 0, self.value)
+        length = offset - start
+        _struct_H.pack_into(buf, start + 2, length)
+        return offset
+
+    def wire_length(self):
+        return 6
 
     @staticmethod
     def unpack(reader):
         obj = icmp_id()
-        _type = reader.read("!H")[0]
+        _type, _length = reader.read_struct(_struct_HH)
         assert(_type == 70)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
         obj.value = reader.read("!H")[0]
@@ -1096,6 +1137,7 @@ class icmp_id(bsn_tlv):
 bsn_tlv.subtypes[70] = icmp_id
 
 class icmp_type(bsn_tlv):
+    __slots__ = ["value"]
     type = 68
 
     def __init__(self, value=None):
@@ -1105,21 +1147,21 @@ class icmp_type(bsn_tlv):
             self.value = 0
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!H", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
-        packed.append(struct.pack("!B", self.value))
-        length = sum([len(x) for x in packed])
-        packed[1] = struct.pack("!H", length)
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_HHB, buf, offset, self.type, 0, self.value)
+        length = offset - start
+        _struct_H.pack_into(buf, start + 2, length)
+        return offset
+
+    def wire_length(self):
+        return 5
 
     @staticmethod
     def unpack(reader):
         obj = icmp_type()
-        _type = reader.read("!H")[0]
+        _type, _length = reader.read_struct(_struct_HH)
         assert(_type == 68)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
         obj.value = reader.read("!B")[0]
@@ -1143,25 +1185,27 @@ class icmp_type(bsn_tlv):
 bsn_tlv.subtypes[68] = icmp_type
 
 class idle_notification(bsn_tlv):
+    __slots__ = []
     type = 7
 
     def __init__(self):
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!H", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
-        length = sum([len(x) for x in packed])
-        packed[1] = struct.pack("!H", length)
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_HH, buf, offset, self.type, 0)
+        length = offset - start
+        _struct_H.pack_into(buf, start + 2, length)
+        return offset
+
+    def wire_length(self):
+        return 4
 
     @staticmethod
     def unpack(reader):
         obj = idle_notification()
-        _type = reader.read("!H")[0]
+        _type, _length = reader.read_struct(_struct_HH)
         assert(_type == 7)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
         return obj
@@ -1181,6 +1225,7 @@ class idle_notification(bsn_tlv):
 bsn_tlv.subtypes[7] = idle_notification
 
 class idle_time(bsn_tlv):
+    __slots__ = ["value"]
     type = 5
 
     def __init__(self, value=None):
@@ -1190,21 +1235,21 @@ class idle_time(bsn_tlv):
             self.value = 0
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!H", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
-        packed.append(struct.pack("!Q", self.value))
-        length = sum([len(x) for x in packed])
-        packed[1] = struct.pack("!H", length)
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_HHQ, buf, offset, self.type, 0, self.value)
+        length = offset - start
+        _struct_H.pack_into(buf, start + 2, length)
+        return offset
+
+    def wire_length(self):
+        return 12
 
     @staticmethod
     def unpack(reader):
         obj = idle_time()
-        _type = reader.read("!H")[0]
+        _type, _length = reader.read_struct(_struct_HH)
         assert(_type == 5)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
         obj.value = reader.read("!Q")[0]
@@ -1228,6 +1273,7 @@ class idle_time(bsn_tlv):
 bsn_tlv.subtypes[5] = idle_time
 
 class idle_timeout(bsn_tlv):
+    __slots__ = ["value"]
     type = 8
 
     def __init__(self, value=None):
@@ -1237,21 +1283,21 @@ class idle_timeout(bsn_tlv):
             self.value = 0
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!H", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
-        packed.append(struct.pack("!L", self.value))
-        length = sum([len(x) for x in packed])
-        packed[1] = struct.pack("!H", length)
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_HHL, buf, offset, self.type, 0, self.value)
+        length = offset - start
+        _struct_H.pack_into(buf, start + 2, length)
+        return offset
+
+    def wire_length(self):
+        return 8
 
     @staticmethod
     def unpack(reader):
         obj = idle_timeout()
-        _type = reader.read("!H")[0]
+        _type, _length = reader.read_struct(_struct_HH)
         assert(_type == 8)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
         obj.value = reader.read("!L")[0]
@@ -1275,6 +1321,7 @@ class idle_timeout(bsn_tlv):
 bsn_tlv.subtypes[8] = idle_timeout
 
 class internal_gateway_mac(bsn_tlv):
+    __slots__ = ["value"]
     type = 28
 
     def __init__(self, value=None):
@@ -1284,21 +1331,22 @@ class internal_gateway_mac(bsn_tlv):
             self.value = [0,0,0,0,0,0]
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!H", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
-        packed.append(struct.pack("!6B", *self.value))
-        length = sum([len(x) for x in packed])
-        packed[1] = struct.pack("!H", length)
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_HH, buf, offset, self.type, 0)
+        offset = loxi.generic_util.pack_struct_into(_struct_6B, buf, offset, *self.value)
+        length = offset - start
+        _struct_H.pack_into(buf, start + 2, length)
+        return offset
+
+    def wire_length(self):
+        return 10
 
     @staticmethod
     def unpack(reader):
         obj = internal_gateway_mac()
-        _type = reader.read("!H")[0]
+        _type, _length = reader.read_struct(_struct_HH)
         assert(_type == 28)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
         obj.value = list(reader.read('!6B'))
@@ -1322,6 +1370,7 @@ class internal_gateway_mac(bsn_tlv):
 bsn_tlv.subtypes[28] = internal_gateway_mac
 
 class internal_mac(bsn_tlv):
+    __slots__ = ["value"]
     type = 27
 
     def __init__(self, value=None):
@@ -1331,21 +1380,22 @@ class internal_mac(bsn_tlv):
             self.value = [0,0,0,0,0,0]
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!H", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
-        packed.append(struct.pack("!6B", *self.value))
-        length = sum([len(x) for x in packed])
-        packed[1] = struct.pack("!H", length)
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_HH, buf, offset, self.type, 0)
+        offset = loxi.generic_util.pack_struct_into(_struct_6B, buf, offset, *self.value)
+        length = offset - start
+        _struct_H.pack_into(buf, start + 2, length)
+        return offset
+
+    def wire_length(self):
+        return 10
 
     @staticmethod
     def unpack(reader):
         obj = internal_mac()
-        _type = reader.read("!H")[0]
+        _type, _length = reader.read_struct(_struct_HH)
         assert(_type == 27)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
         obj.value = list(reader.read('!6B'))
@@ -1369,6 +1419,7 @@ class internal_mac(bsn_tlv):
 bsn_tlv.subtypes[27] = internal_mac
 
 class interval(bsn_tlv):
+    __slots__ = ["value"]
     type = 58
 
     def __init__(self, value=None):
@@ -1378,21 +1429,21 @@ class interval(bsn_tlv):
             self.value = 0
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!H", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
-        packed.append(struct.pack("!L", self.value))
-        length = sum([len(x) for x in packed])
-        packed[1] = struct.pack("!H", length)
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_HHL, buf, offset, self.type, 0, self.value)
+        length = offset - start
+        _struct_H.pack_into(buf, start + 2, length)
+        return offset
+
+    def wire_length(self):
+        return 8
 
     @staticmethod
     def unpack(reader):
         obj = interval()
-        _type = reader.read("!H")[0]
+        _type, _length = reader.read_struct(_struct_HH)
         assert(_type == 58)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
         obj.value = reader.read("!L")[0]
@@ -1416,6 +1467,7 @@ class interval(bsn_tlv):
 bsn_tlv.subtypes[58] = interval
 
 class ip_proto(bsn_tlv):
+    __slots__ = ["value"]
     type = 67
 
     def __init__(self, value=None):
@@ -1425,21 +1477,21 @@ class ip_proto(bsn_tlv):
             self.value = 0
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!H", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
-        packed.append(struct.pack("!B", self.value))
-        length = sum([len(x) for x in packed])
-        packed[1] = struct.pack("!H", length)
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_HHB, buf, offset, self.type, 0, self.value)
+        length = offset - start
+        _struct_H.pack_into(buf, start + 2, length)
+        return offset
+
+    def wire_length(self):
+        return 5
 
     @staticmethod
     def unpack(reader):
         obj = ip_proto()
-        _type = reader.read("!H")[0]
+        _type, _length = reader.read_struct(_struct_HH)
         assert(_type == 67)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
         obj.value = reader.read("!B")[0]
@@ -1463,6 +1515,7 @@ class ip_proto(bsn_tlv):
 bsn_tlv.subtypes[67] = ip_proto
 
 class ipv4(bsn_tlv):
+    __slots__ = ["value"]
     type = 4
 
     def __init__(self, value=None):
@@ -1472,21 +1525,21 @@ class ipv4(bsn_tlv):
             self.value = 0
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!H", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
-        packed.append(struct.pack("!L", self.value))
-        length = sum([len(x) for x in packed])
-        packed[1] = struct.pack("!H", length)
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_HHL, buf, offset, self.type, 0, self.value)
+        length = offset - start
+        _struct_H.pack_into(buf, start + 2, length)
+        return offset
+
+    def wire_length(self):
+        return 8
 
     @staticmethod
     def unpack(reader):
         obj = ipv4()
-        _type = reader.read("!H")[0]
+        _type, _length = reader.read_struct(_struct_HH)
         assert(_type == 4)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
         obj.value = reader.read("!L")[0]
@@ -1510,6 +1563,7 @@ class ipv4(bsn_tlv):
 bsn_tlv.subtypes[4] = ipv4
 
 class ipv4_dst(bsn_tlv):
+    __slots__ = ["value"]
     type = 35
 
     def __init__(self, value=None):
@@ -1519,21 +1573,21 @@ class ipv4_dst(bsn_tlv):
             self.value = 0
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!H", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
-        packed.append(struct.pack("!L", self.value))
-        length = sum([len(x) for x in packed])
-        packed[1] = struct.pack("!H", length)
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_HHL, buf, offset, self.type, 0, self.value)
+        length = offset - start
+        _struct_H.pack_into(buf, start + 2, length)
+        return offset
+
+    def wire_length(self):
+        return 8
 
     @staticmethod
     def unpack(reader):
         obj = ipv4_dst()
-        _type = reader.read("!H")[0]
+        _type, _length = reader.read_struct(_struct_HH)
         assert(_type == 35)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
         obj.value = reader.read("!L")[0]
@@ -1557,6 +1611,7 @@ class ipv4_dst(bsn_tlv):
 bsn_tlv.subtypes[35] = ipv4_dst
 
 class ipv4_netmask(bsn_tlv):
+    __slots__ = ["value"]
     type = 60
 
     def __init__(self, value=None):
@@ -1566,21 +1621,21 @@ class ipv4_netmask(bsn_tlv):
             self.value = 0
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!H", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
-        packed.append(struct.pack("!L", self.value))
-        length = sum([len(x) for x in packed])
-        packed[1] = struct.pack("!H", length)
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_HHL, buf, offset, self.type, 0, self.value)
+        length = offset - start
+        _struct_H.pack_into(buf, start + 2, length)
+        return offset
+
+    def wire_length(self):
+        return 8
 
     @staticmethod
     def unpack(reader):
         obj = ipv4_netmask()
-        _type = reader.read("!H")[0]
+        _type, _length = reader.read_struct(_struct_HH)
         assert(_type == 60)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
         obj.value = reader.read("!L")[0]
@@ -1604,6 +1659,7 @@ class ipv4_netmask(bsn_tlv):
 bsn_tlv.subtypes[60] = ipv4_netmask
 
 class ipv4_src(bsn_tlv):
+    __slots__ = ["value"]
     type = 34
 
     def __init__(self, value=None):
@@ -1613,21 +1669,21 @@ class ipv4_src(bsn_tlv):
             self.value = 0
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!H", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
-        packed.append(struct.pack("!L", self.value))
-        length = sum([len(x) for x in packed])
-        packed[1] = struct.pack("!H", length)
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_HHL, buf, offset, self.type, 0, self.value)
+        length = offset - start
+        _struct_H.pack_into(buf, start + 2, length)
+        return offset
+
+    def wire_length(self):
+        return 8
 
     @staticmethod
     def unpack(reader):
         obj = ipv4_src()
-        _type = reader.read("!H")[0]
+        _type, _length = reader.read_struct(_struct_HH)
         assert(_type == 34)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
         obj.value = reader.read("!L")[0]
@@ -1651,6 +1707,7 @@ class ipv4_src(bsn_tlv):
 bsn_tlv.subtypes[34] = ipv4_src
 
 class mac(bsn_tlv):
+    __slots__ = ["value"]
     type = 1
 
     def __init__(self, value=None):
@@ -1660,21 +1717,22 @@ class mac(bsn_tlv):
             self.value = [0,0,0,0,0,0]
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!H", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
-        packed.append(struct.pack("!6B", *self.value))
-        length = sum([len(x) for x in packed])
-        packed[1] = struct.pack("!H", length)
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_HH, buf, offset, self.type, 0)
+        offset = loxi.generic_util.pack_struct_into(_struct_6B, buf, offset, *self.value)
+        length = offset - start
+        _struct_H.pack_into(buf, start + 2, length)
+        return offset
+
+    def wire_length(self):
+        return 10
 
     @staticmethod
     def unpack(reader):
         obj = mac()
-        _type = reader.read("!H")[0]
+        _type, _length = reader.read_struct(_struct_HH)
         assert(_type == 1)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
         obj.value = list(reader.read('!6B'))
@@ -1698,6 +1756,7 @@ class mac(bsn_tlv):
 bsn_tlv.subtypes[1] = mac
 
 class mac_mask(bsn_tlv):
+    __slots__ = ["value"]
     type = 56
 
     def __init__(self, value=None):
@@ -1707,21 +1766,22 @@ class mac_mask(bsn_tlv):
             self.value = [0,0,0,0,0,0]
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!H", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
-        packed.append(struct.pack("!6B", *self.value))
-        length = sum([len(x) for x in packed])
-        packed[1] = struct.pack("!H", length)
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_HH, buf, offset, self.type, 0)
+        offset = loxi.generic_util.pack_struct_into(_struct_6B, buf, offset, *self.value)
+        length = offset - start
+        _struct_H.pack_into(buf, start + 2, length)
+        return offset
+
+    def wire_length(self):
+        return 10
 
     @staticmethod
     def unpack(reader):
         obj = mac_mask()
-        _type = reader.read("!H")[0]
+        _type, _length = reader.read_struct(_struct_HH)
         assert(_type == 56)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
         obj.value = list(reader.read('!6B'))
@@ -1745,6 +1805,7 @@ class mac_mask(bsn_tlv):
 bsn_tlv.subtypes[56] = mac_mask
 
 class miss_packets(bsn_tlv):
+    __slots__ = ["value"]
     type = 13
 
     def __init__(self, value=None):
@@ -1754,21 +1815,21 @@ class miss_packets(bsn_tlv):
             self.value = 0
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!H", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
-        packed.append(struct.pack("!Q", self.value))
-        length = sum([len(x) for x in packed])
-        packed[1] = struct.pack("!H", length)
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_HHQ, buf, offset, self.type, 0, self.value)
+        length = offset - start
+        _struct_H.pack_into(buf, start + 2, length)
+        return offset
+
+    def wire_length(self):
+        return 12
 
     @staticmethod
     def unpack(reader):
         obj = miss_packets()
-        _type = reader.read("!H")[0]
+        _type, _length = reader.read_struct(_struct_HH)
         assert(_type == 13)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
         obj.value = reader.read("!Q")[0]
@@ -1792,6 +1853,7 @@ class miss_packets(bsn_tlv):
 bsn_tlv.subtypes[13] = miss_packets
 
 class mpls_control_word(bsn_tlv):
+    __slots__ = ["value"]
     type = 62
 
     def __init__(self, value=None):
@@ -1801,21 +1863,21 @@ class mpls_control_word(bsn_tlv):
             self.value = 0
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!H", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
-        packed.append(struct.pack("!B", self.value))
-        length = sum([len(x) for x in packed])
-        packed[1] = struct.pack("!H", length)
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_HHB, buf, offset, self.type, 0, self.value)
+        length = offset - start
+        _struct_H.pack_into(buf, start + 2, length)
+        return offset
+
+    def wire_length(self):
+        return 5
 
     @staticmethod
     def unpack(reader):
         obj = mpls_control_word()
-        _type = reader.read("!H")[0]
+        _type, _length = reader.read_struct(_struct_HH)
         assert(_type == 62)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
         obj.value = reader.read("!B")[0]
@@ -1839,6 +1901,7 @@ class mpls_control_word(bsn_tlv):
 bsn_tlv.subtypes[62] = mpls_control_word
 
 class mpls_label(bsn_tlv):
+    __slots__ = ["value"]
     type = 61
 
     def __init__(self, value=None):
@@ -1848,21 +1911,21 @@ class mpls_label(bsn_tlv):
             self.value = 0
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!H", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
-        packed.append(struct.pack("!L", self.value))
-        length = sum([len(x) for x in packed])
-        packed[1] = struct.pack("!H", length)
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_HHL, buf, offset, self.type, 0, self.value)
+        length = offset - start
+        _struct_H.pack_into(buf, start + 2, length)
+        return offset
+
+    def wire_length(self):
+        return 8
 
     @staticmethod
     def unpack(reader):
         obj = mpls_label()
-        _type = reader.read("!H")[0]
+        _type, _length = reader.read_struct(_struct_HH)
         assert(_type == 61)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
         obj.value = reader.read("!L")[0]
@@ -1886,6 +1949,7 @@ class mpls_label(bsn_tlv):
 bsn_tlv.subtypes[61] = mpls_label
 
 class mpls_sequenced(bsn_tlv):
+    __slots__ = ["value"]
     type = 63
 
     def __init__(self, value=None):
@@ -1895,21 +1959,21 @@ class mpls_sequenced(bsn_tlv):
             self.value = 0
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!H", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
-        packed.append(struct.pack("!B", self.value))
-        length = sum([len(x) for x in packed])
-        packed[1] = struct.pack("!H", length)
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_HHB, buf, offset, self.type, 0, self.value)
+        length = offset - start
+        _struct_H.pack_into(buf, start + 2, length)
+        return offset
+
+    def wire_length(self):
+        return 5
 
     @staticmethod
     def unpack(reader):
         obj = mpls_sequenced()
-        _type = reader.read("!H")[0]
+        _type, _length = reader.read_struct(_struct_HH)
         assert(_type == 63)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
         obj.value = reader.read("!B")[0]
@@ -1933,6 +1997,7 @@ class mpls_sequenced(bsn_tlv):
 bsn_tlv.subtypes[63] = mpls_sequenced
 
 class name(bsn_tlv):
+    __slots__ = ["value"]
     type = 52
 
     def __init__(self, value=None):
@@ -1942,24 +2007,25 @@ class name(bsn_tlv):
             self.value = ''
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!H", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
-        packed.append(self.value)
-        length = sum([len(x) for x in packed])
-        packed[1] = struct.pack("!H", length)
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_HH, buf, offset, self.type, 0)
+        offset = loxi.generic_util.pack_bytes_into(self.value, buf, offset)
+        length = offset - start
+        _struct_H.pack_into(buf, start + 2, length)
+        return offset
+
+    def wire_length(self):
+        return 4 + len(self.value)
 
     @staticmethod
     def unpack(reader):
         obj = name()
-        _type = reader.read("!H")[0]
+        _type, _length = reader.read_struct(_struct_HH)
         assert(_type == 52)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.value = str(reader.read_all())
+        obj.value = reader.read_all()
         return obj
 
     def __eq__(self, other):
@@ -1980,6 +2046,7 @@ class name(bsn_tlv):
 bsn_tlv.subtypes[52] = name
 
 class partner_key(bsn_tlv):
+    __slots__ = ["value"]
     type = 51
 
     def __init__(self, value=None):
@@ -1989,21 +2056,21 @@ class partner_key(bsn_tlv):
             self.value = 0
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!H", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
-        packed.append(struct.pack("!H", self.value))
-        length = sum([len(x) for x in packed])
-        packed[1] = struct.pack("!H", length)
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_HHH, buf, offset, self.type, 0, self.value)
+        length = offset - start
+        _struct_H.pack_into(buf, start + 2, length)
+        return offset
+
+    def wire_length(self):
+        return 6
 
     @staticmethod
     def unpack(reader):
         obj = partner_key()
-        _type = reader.read("!H")[0]
+        _type, _length = reader.read_struct(_struct_HH)
         assert(_type == 51)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
         obj.value = reader.read("!H")[0]
@@ -2027,6 +2094,7 @@ class partner_key(bsn_tlv):
 bsn_tlv.subtypes[51] = partner_key
 
 class partner_port_num(bsn_tlv):
+    __slots__ = ["value"]
     type = 50
 
     def __init__(self, value=None):
@@ -2036,21 +2104,21 @@ class partner_port_num(bsn_tlv):
             self.value = 0
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!H", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
-        packed.append(struct.pack("!H", self.value))
-        length = sum([len(x) for x in packed])
-        packed[1] = struct.pack("!H", length)
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_HHH, buf, offset, self.type, 0, self.value)
+        length = offset - start
+        _struct_H.pack_into(buf, start + 2, length)
+        return offset
+
+    def wire_length(self):
+        return 6
 
     @staticmethod
     def unpack(reader):
         obj = partner_port_num()
-        _type = reader.read("!H")[0]
+        _type, _length = reader.read_struct(_struct_HH)
         assert(_type == 50)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
         obj.value = reader.read("!H")[0]
@@ -2074,6 +2142,7 @@ class partner_port_num(bsn_tlv):
 bsn_tlv.subtypes[50] = partner_port_num
 
 class partner_port_priority(bsn_tlv):
+    __slots__ = ["value"]
     type = 49
 
     def __init__(self, value=None):
@@ -2083,21 +2152,21 @@ class partner_port_priority(bsn_tlv):
             self.value = 0
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!H", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
-        packed.append(struct.pack("!H", self.value))
-        length = sum([len(x) for x in packed])
-        packed[1] = struct.pack("!H", length)
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_HHH, buf, offset, self.type, 0, self.value)
+        length = offset - start
+        _struct_H.pack_into(buf, start + 2, length)
+        return offset
+
+    def wire_length(self):
+        return 6
 
     @staticmethod
     def unpack(reader):
         obj = partner_port_priority()
-        _type = reader.read("!H")[0]
+        _type, _length = reader.read_struct(_struct_HH)
         assert(_type == 49)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
         obj.value = reader.read("!H")[0]
@@ -2121,6 +2190,7 @@ class partner_port_priority(bsn_tlv):
 bsn_tlv.subtypes[49] = partner_port_priority
 
 class partner_state(bsn_tlv):
+    __slots__ = ["value"]
     type = 54
 
     def __init__(self, value=None):
@@ -2130,21 +2200,21 @@ class partner_state(bsn_tlv):
             self.value = 0
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!H", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
-        packed.append(struct.pack("!B", self.value))
-        length = sum([len(x) for x in packed])
-        packed[1] = struct.pack("!H", length)
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_HHB, buf, offset, self.type, 0, self.value)
+        length = offset - start
+        _struct_H.pack_into(buf, start + 2, length)
+        return offset
+
+    def wire_length(self):
+        return 5
 
     @staticmethod
     def unpack(reader):
         obj = partner_state()
-        _type = reader.read("!H")[0]
+        _type, _length = reader.read_struct(_struct_HH)
         assert(_type == 54)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
         obj.value = reader.read("!B")[0]
@@ -2168,6 +2238,7 @@ class partner_state(bsn_tlv):
 bsn_tlv.subtypes[54] = partner_state
 
 class partner_system_mac(bsn_tlv):
+    __slots__ = ["value"]
     type = 48
 
     def __init__(self, value=None):
@@ -2177,21 +2248,22 @@ class partner_system_mac(bsn_tlv):
             self.value = [0,0,0,0,0,0]
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!H", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
-        packed.append(struct.pack("!6B", *self.value))
-        length = sum([len(x) for x in packed])
-        packed[1] = struct.pack("!H", length)
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_HH, buf, offset, self.type, 0)
+        offset = loxi.generic_util.pack_struct_into(_struct_6B, buf, offset, *self.value)
+        length = offset - start
+        _struct_H.pack_into(buf, start + 2, length)
+        return offset
+
+    def wire_length(self):
+        return 10
 
     @staticmethod
     def unpack(reader):
         obj = partner_system_mac()
-        _type = reader.read("!H")[0]
+        _type, _length = reader.read_struct(_struct_HH)
         assert(_type == 48)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
         obj.value = list(reader.read('!6B'))
@@ -2215,6 +2287,7 @@ class partner_system_mac(bsn_tlv):
 bsn_tlv.subtypes[48] = partner_system_mac
 
 class partner_system_priority(bsn_tlv):
+    __slots__ = ["value"]
     type = 47
 
     def __init__(self, value=None):
@@ -2224,21 +2297,21 @@ class partner_system_priority(bsn_tlv):
             self.value = 0
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!H", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
-        packed.append(struct.pack("!H", self.value))
-        length = sum([len(x) for x in packed])
-        packed[1] = struct.pack("!H", length)
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_HHH, buf, offset, self.type, 0, self.value)
+        length = offset - start
+        _struct_H.pack_into(buf, start + 2, length)
+        return offset
+
+    def wire_length(self):
+        return 6
 
     @staticmethod
     def unpack(reader):
         obj = partner_system_priority()
-        _type = reader.read("!H")[0]
+        _type, _length = reader.read_struct(_struct_HH)
         assert(_type == 47)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
         obj.value = reader.read("!H")[0]
@@ -2262,6 +2335,7 @@ class partner_system_priority(bsn_tlv):
 bsn_tlv.subtypes[47] = partner_system_priority
 
 class port(bsn_tlv):
+    __slots__ = ["value"]
     type = 0
 
     def __init__(self, value=None):
@@ -2271,21 +2345,21 @@ class port(bsn_tlv):
             self.value = 0
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!H", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
-        packed.append(util.pack_port_no(self.value))
-        length = sum([len(x) for x in packed])
-        packed[1] = struct.pack("!H", length)
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_HHL, buf, offset, self.type, 0, self.value)
+        length = offset - start
+        _struct_H.pack_into(buf, start + 2, length)
+        return offset
+
+    def wire_length(self):
+        return 8
 
     @staticmethod
     def unpack(reader):
         obj = port()
-        _type = reader.read("!H")[0]
+        _type, _length = reader.read_struct(_struct_HH)
         assert(_type == 0)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
         obj.value = util.unpack_port_no(reader)
@@ -2309,6 +2383,7 @@ class port(bsn_tlv):
 bsn_tlv.subtypes[0] = port
 
 class priority(bsn_tlv):
+    __slots__ = ["value"]
     type = 57
 
     def __init__(self, value=None):
@@ -2318,21 +2393,21 @@ class priority(bsn_tlv):
             self.value = 0
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!H", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
-        packed.append(struct.pack("!L", self.value))
-        length = sum([len(x) for x in packed])
-        packed[1] = struct.pack("!H", length)
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_HHL, buf, offset, self.type, 0, self.value)
+        length = offset - start
+        _struct_H.pack_into(buf, start + 2, length)
+        return offset
+
+    def wire_length(self):
+        return 8
 
     @staticmethod
     def unpack(reader):
         obj = priority()
-        _type = reader.read("!H")[0]
+        _type, _length = reader.read_struct(_struct_HH)
         assert(_type == 57)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
         obj.value = reader.read("!L")[0]
@@ -2356,6 +2431,7 @@ class priority(bsn_tlv):
 bsn_tlv.subtypes[57] = priority
 
 class queue_id(bsn_tlv):
+    __slots__ = ["value"]
     type = 20
 
     def __init__(self, value=None):
@@ -2365,21 +2441,21 @@ class queue_id(bsn_tlv):
             self.value = 0
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!H", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
-        packed.append(struct.pack("!L", self.value))
-        length = sum([len(x) for x in packed])
-        packed[1] = struct.pack("!H", length)
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_HHL, buf, offset, self.type, 0, self.value)
+        length = offset - start
+        _struct_H.pack_into(buf, start + 2, length)
+        return offset
+
+    def wire_length(self):
+        return 8
 
     @staticmethod
     def unpack(reader):
         obj = queue_id()
-        _type = reader.read("!H")[0]
+        _type, _length = reader.read_struct(_struct_HH)
         assert(_type == 20)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
         obj.value = reader.read("!L")[0]
@@ -2403,6 +2479,7 @@ class queue_id(bsn_tlv):
 bsn_tlv.subtypes[20] = queue_id
 
 class queue_weight(bsn_tlv):
+    __slots__ = ["value"]
     type = 21
 
     def __init__(self, value=None):
@@ -2412,21 +2489,21 @@ class queue_weight(bsn_tlv):
             self.value = 0
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!H", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
-        packed.append(struct.pack("!L", self.value))
-        length = sum([len(x) for x in packed])
-        packed[1] = struct.pack("!H", length)
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_HHL, buf, offset, self.type, 0, self.value)
+        length = offset - start
+        _struct_H.pack_into(buf, start + 2, length)
+        return offset
+
+    def wire_length(self):
+        return 8
 
     @staticmethod
     def unpack(reader):
         obj = queue_weight()
-        _type = reader.read("!H")[0]
+        _type, _length = reader.read_struct(_struct_HH)
         assert(_type == 21)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
         obj.value = reader.read("!L")[0]
@@ -2450,6 +2527,7 @@ class queue_weight(bsn_tlv):
 bsn_tlv.subtypes[21] = queue_weight
 
 class reference(bsn_tlv):
+    __slots__ = ["key", "table_id"]
     type = 59
 
     def __init__(self, table_id=None, key=None):
@@ -2463,22 +2541,22 @@ class reference(bsn_tlv):
             self.key = []
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!H", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
-        packed.append(struct.pack("!H", self.table_id))
-        packed.append(loxi.generic_util.pack_list(self.key))
-        length = sum([len(x) for x in packed])
-        packed[1] = struct.pack("!H", length)
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_HHH, buf, offset, self.type, 0, self.table_id)
+        offset = loxi.generic_util.pack_list_into(self.key, buf, offset)
+        length = offset - start
+        _struct_H.pack_into(buf, start + 2, length)
+        return offset
+
+    def wire_length(self):
+        return 6 + loxi.generic_util.list_wire_length(self.key)
 
     @staticmethod
     def unpack(reader):
         obj = reference()
-        _type = reader.read("!H")[0]
+        _type, _length = reader.read_struct(_struct_HH)
         assert(_type == 59)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
         obj.table_id = reader.read("!H")[0]
@@ -2507,6 +2585,7 @@ class reference(bsn_tlv):
 bsn_tlv.subtypes[59] = reference
 
 class reply_packets(bsn_tlv):
+    __slots__ = ["value"]
     type = 12
 
     def __init__(self, value=None):
@@ -2516,21 +2595,21 @@ class reply_packets(bsn_tlv):
             self.value = 0
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!H", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
-        packed.append(struct.pack("!Q", self.value))
-        length = sum([len(x) for x in packed])
-        packed[1] = struct.pack("!H", length)
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_HHQ, buf, offset, self.type, 0, self.value)
+        length = offset - start
+        _struct_H.pack_into(buf, start + 2, length)
+        return offset
+
+    def wire_length(self):
+        return 12
 
     @staticmethod
     def unpack(reader):
         obj = reply_packets()
-        _type = reader.read("!H")[0]
+        _type, _length = reader.read_struct(_struct_HH)
         assert(_type == 12)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
         obj.value = reader.read("!Q")[0]
@@ -2554,6 +2633,7 @@ class reply_packets(bsn_tlv):
 bsn_tlv.subtypes[12] = reply_packets
 
 class request_packets(bsn_tlv):
+    __slots__ = ["value"]
     type = 11
 
     def __init__(self, value=None):
@@ -2563,21 +2643,21 @@ class request_packets(bsn_tlv):
             self.value = 0
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!H", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
-        packed.append(struct.pack("!Q", self.value))
-        length = sum([len(x) for x in packed])
-        packed[1] = struct.pack("!H", length)
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_HHQ, buf, offset, self.type, 0, self.value)
+        length = offset - start
+        _struct_H.pack_into(buf, start + 2, length)
+        return offset
+
+    def wire_length(self):
+        return 12
 
     @staticmethod
     def unpack(reader):
         obj = request_packets()
-        _type = reader.read("!H")[0]
+        _type, _length = reader.read_struct(_struct_HH)
         assert(_type == 11)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
         obj.value = reader.read("!Q")[0]
@@ -2601,6 +2681,7 @@ class request_packets(bsn_tlv):
 bsn_tlv.subtypes[11] = request_packets
 
 class rx_bytes(bsn_tlv):
+    __slots__ = ["value"]
     type = 71
 
     def __init__(self, value=None):
@@ -2610,21 +2691,21 @@ class rx_bytes(bsn_tlv):
             self.value = 0
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!H", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
-        packed.append(struct.pack("!Q", self.value))
-        length = sum([len(x) for x in packed])
-        packed[1] = struct.pack("!H", length)
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_HHQ, buf, offset, self.type, 0, self.value)
+        length = offset - start
+        _struct_H.pack_into(buf, start + 2, length)
+        return offset
+
+    def wire_length(self):
+        return 12
 
     @staticmethod
     def unpack(reader):
         obj = rx_bytes()
-        _type = reader.read("!H")[0]
+        _type, _length = reader.read_struct(_struct_HH)
         assert(_type == 71)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
         obj.value = reader.read("!Q")[0]
@@ -2648,6 +2729,7 @@ class rx_bytes(bsn_tlv):
 bsn_tlv.subtypes[71] = rx_bytes
 
 class rx_packets(bsn_tlv):
+    __slots__ = ["value"]
     type = 2
 
     def __init__(self, value=None):
@@ -2657,21 +2739,21 @@ class rx_packets(bsn_tlv):
             self.value = 0
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!H", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
-        packed.append(struct.pack("!Q", self.value))
-        length = sum([len(x) for x in packed])
-        packed[1] = struct.pack("!H", length)
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_HHQ, buf, offset, self.type, 0, self.value)
+        length = offset - start
+        _struct_H.pack_into(buf, start + 2, length)
+        return offset
+
+    def wire_length(self):
+        return 12
 
     @staticmethod
     def unpack(reader):
         obj = rx_packets()
-        _type = reader.read("!H")[0]
+        _type, _length = reader.read_struct(_struct_HH)
         assert(_type == 2)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
         obj.value = reader.read("!Q")[0]
@@ -2695,6 +2777,7 @@ class rx_packets(bsn_tlv):
 bsn_tlv.subtypes[2] = rx_packets
 
 class sampling_rate(bsn_tlv):
+    __slots__ = ["value"]
     type = 30
 
     def __init__(self, value=None):
@@ -2704,21 +2787,21 @@ class sampling_rate(bsn_tlv):
             self.value = 0
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!H", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
-        packed.append(struct.pack("!L", self.value))
-        length = sum([len(x) for x in packed])
-        packed[1] = struct.pack("!H", length)
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_HHL, buf, offset, self.type, 0, self.value)
+        length = offset - start
+        _struct_H.pack_into(buf, start + 2, length)
+        return offset
+
+    def wire_length(self):
+        return 8
 
     @staticmethod
     def unpack(reader):
         obj = sampling_rate()
-        _type = reader.read("!H")[0]
+        _type, _length = reader.read_struct(_struct_HH)
         assert(_type == 30)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
         obj.value = reader.read("!L")[0]
@@ -2742,25 +2825,27 @@ class sampling_rate(bsn_tlv):
 bsn_tlv.subtypes[30] = sampling_rate
 
 class set_loopback_mode(bsn_tlv):
+    __slots__ = []
     type = 74
 
     def __init__(self):
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!H", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
-        length = sum([len(x) for x in packed])
-        packed[1] = struct.pack("!H", length)
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_HH, buf, offset, self.type, 0)
+        length = offset - start
+        _struct_H.pack_into(buf, start + 2, length)
+        return offset
+
+    def wire_length(self):
+        return 4
 
     @staticmethod
     def unpack(reader):
         obj = set_loopback_mode()
-        _type = reader.read("!H")[0]
+        _type, _length = reader.read_struct(_struct_HH)
         assert(_type == 74)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
         return obj
@@ -2780,25 +2865,27 @@ class set_loopback_mode(bsn_tlv):
 bsn_tlv.subtypes[74] = set_loopback_mode
 
 class strip_mpls_l2_on_ingress(bsn_tlv):
+    __slots__ = []
     type = 75
 
     def __init__(self):
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!H", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
-        length = sum([len(x) for x in packed])
-        packed[1] = struct.pack("!H", length)
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_HH, buf, offset, self.type, 0)
+        length = offset - start
+        _struct_H.pack_into(buf, start + 2, length)
+        return offset
+
+    def wire_length(self):
+        return 4
 
     @staticmethod
     def unpack(reader):
         obj = strip_mpls_l2_on_ingress()
-        _type = reader.read("!H")[0]
+        _type, _length = reader.read_struct(_struct_HH)
         assert(_type == 75)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
         return obj
@@ -2818,25 +2905,27 @@ class strip_mpls_l2_on_ingress(bsn_tlv):
 bsn_tlv.subtypes[75] = strip_mpls_l2_on_ingress
 
 class strip_mpls_l3_on_ingress(bsn_tlv):
+    __slots__ = []
     type = 76
 
     def __init__(self):
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!H", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
-        length = sum([len(x) for x in packed])
-        packed[1] = struct.pack("!H", length)
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_HH, buf, offset, self.type, 0)
+        length = offset - start
+        _struct_H.pack_into(buf, start + 2, length)
+        return offset
+
+    def wire_length(self):
+        return 4
 
     @staticmethod
     def unpack(reader):
         obj = strip_mpls_l3_on_ingress()
-        _type = reader.read("!H")[0]
+        _type, _length = reader.read_struct(_struct_HH)
         assert(_type == 76)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
         return obj
@@ -2856,25 +2945,27 @@ class strip_mpls_l3_on_ingress(bsn_tlv):
 bsn_tlv.subtypes[76] = strip_mpls_l3_on_ingress
 
 class strip_vlan_on_egress(bsn_tlv):
+    __slots__ = []
     type = 73
 
     def __init__(self):
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!H", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
-        length = sum([len(x) for x in packed])
-        packed[1] = struct.pack("!H", length)
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_HH, buf, offset, self.type, 0)
+        length = offset - start
+        _struct_H.pack_into(buf, start + 2, length)
+        return offset
+
+    def wire_length(self):
+        return 4
 
     @staticmethod
     def unpack(reader):
         obj = strip_vlan_on_egress()
-        _type = reader.read("!H")[0]
+        _type, _length = reader.read_struct(_struct_HH)
         assert(_type == 73)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
         return obj
@@ -2894,6 +2985,7 @@ class strip_vlan_on_egress(bsn_tlv):
 bsn_tlv.subtypes[73] = strip_vlan_on_egress
 
 class sub_agent_id(bsn_tlv):
+    __slots__ = ["value"]
     type = 38
 
     def __init__(self, value=None):
@@ -2903,21 +2995,21 @@ class sub_agent_id(bsn_tlv):
             self.value = 0
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!H", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
-        packed.append(struct.pack("!L", self.value))
-        length = sum([len(x) for x in packed])
-        packed[1] = struct.pack("!H", length)
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_HHL, buf, offset, self.type, 0, self.value)
+        length = offset - start
+        _struct_H.pack_into(buf, start + 2, length)
+        return offset
+
+    def wire_length(self):
+        return 8
 
     @staticmethod
     def unpack(reader):
         obj = sub_agent_id()
-        _type = reader.read("!H")[0]
+        _type, _length = reader.read_struct(_struct_HH)
         assert(_type == 38)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
         obj.value = reader.read("!L")[0]
@@ -2941,6 +3033,7 @@ class sub_agent_id(bsn_tlv):
 bsn_tlv.subtypes[38] = sub_agent_id
 
 class tcp_dst(bsn_tlv):
+    __slots__ = ["value"]
     type = 66
 
     def __init__(self, value=None):
@@ -2950,21 +3043,21 @@ class tcp_dst(bsn_tlv):
             self.value = 0
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!H", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
-        packed.append(struct.pack("!H", self.value))
-        length = sum([len(x) for x in packed])
-        packed[1] = struct.pack("!H", length)
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_HHH, buf, offset, self.type, 0, self.value)
+        length = offset - start
+        _struct_H.pack_into(buf, start + 2, length)
+        return offset
+
+    def wire_length(self):
+        return 6
 
     @staticmethod
     def unpack(reader):
         obj = tcp_dst()
-        _type = reader.read("!H")[0]
+        _type, _length = reader.read_struct(_struct_HH)
         assert(_type == 66)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
         obj.value = reader.read("!H")[0]
@@ -2988,6 +3081,7 @@ class tcp_dst(bsn_tlv):
 bsn_tlv.subtypes[66] = tcp_dst
 
 class tcp_src(bsn_tlv):
+    __slots__ = ["value"]
     type = 65
 
     def __init__(self, value=None):
@@ -2997,21 +3091,21 @@ class tcp_src(bsn_tlv):
             self.value = 0
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!H", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
-        packed.append(struct.pack("!H", self.value))
-        length = sum([len(x) for x in packed])
-        packed[1] = struct.pack("!H", length)
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_HHH, buf, offset, self.type, 0, self.value)
+        length = offset - start
+        _struct_H.pack_into(buf, start + 2, length)
+        return offset
+
+    def wire_length(self):
+        return 6
 
     @staticmethod
     def unpack(reader):
         obj = tcp_src()
-        _type = reader.read("!H")[0]
+        _type, _length = reader.read_struct(_struct_HH)
         assert(_type == 65)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
         obj.value = reader.read("!H")[0]
@@ -3035,6 +3129,7 @@ class tcp_src(bsn_tlv):
 bsn_tlv.subtypes[65] = tcp_src
 
 class tx_bytes(bsn_tlv):
+    __slots__ = ["value"]
     type = 39
 
     def __init__(self, value=None):
@@ -3044,21 +3139,21 @@ class tx_bytes(bsn_tlv):
             self.value = 0
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!H", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
-        packed.append(struct.pack("!Q", self.value))
-        length = sum([len(x) for x in packed])
-        packed[1] = struct.pack("!H", length)
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_HHQ, buf, offset, self.type, 0, self.value)
+        length = offset - start
+        _struct_H.pack_into(buf, start + 2, length)
+        return offset
+
+    def wire_length(self):
+        return 12
 
     @staticmethod
     def unpack(reader):
         obj = tx_bytes()
-        _type = reader.read("!H")[0]
+        _type, _length = reader.read_struct(_struct_HH)
         assert(_type == 39)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
         obj.value = reader.read("!Q")[0]
@@ -3082,6 +3177,7 @@ class tx_bytes(bsn_tlv):
 bsn_tlv.subtypes[39] = tx_bytes
 
 class tx_packets(bsn_tlv):
+    __slots__ = ["value"]
     type = 3
 
     def __init__(self, value=None):
@@ -3091,21 +3187,21 @@ class tx_packets(bsn_tlv):
             self.value = 0
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!H", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
-        packed.append(struct.pack("!Q", self.value))
-        length = sum([len(x) for x in packed])
-        packed[1] = struct.pack("!H", length)
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_HHQ, buf, offset, self.type, 0, self.value)
+        length = offset - start
+        _struct_H.pack_into(buf, start + 2, length)
+        return offset
+
+    def wire_length(self):
+        return 12
 
     @staticmethod
     def unpack(reader):
         obj = tx_packets()
-        _type = reader.read("!H")[0]
+        _type, _length = reader.read_struct(_struct_HH)
         assert(_type == 3)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
         obj.value = reader.read("!Q")[0]
@@ -3129,6 +3225,7 @@ class tx_packets(bsn_tlv):
 bsn_tlv.subtypes[3] = tx_packets
 
 class udf_anchor(bsn_tlv):
+    __slots__ = ["value"]
     type = 16
 
     def __init__(self, value=None):
@@ -3138,21 +3235,21 @@ class udf_anchor(bsn_tlv):
             self.value = 0
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!H", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
-        packed.append(struct.pack("!H", self.value))
-        length = sum([len(x) for x in packed])
-        packed[1] = struct.pack("!H", length)
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_HHH, buf, offset, self.type, 0, self.value)
+        length = offset - start
+        _struct_H.pack_into(buf, start + 2, length)
+        return offset
+
+    def wire_length(self):
+        return 6
 
     @staticmethod
     def unpack(reader):
         obj = udf_anchor()
-        _type = reader.read("!H")[0]
+        _type, _length = reader.read_struct(_struct_HH)
         assert(_type == 16)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
         obj.value = reader.read("!H")[0]
@@ -3176,6 +3273,7 @@ class udf_anchor(bsn_tlv):
 bsn_tlv.subtypes[16] = udf_anchor
 
 class udf_id(bsn_tlv):
+    __slots__ = ["value"]
     type = 15
 
     def __init__(self, value=None):
@@ -3185,21 +3283,21 @@ class udf_id(bsn_tlv):
             self.value = 0
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!H", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
-        packed.append(struct.pack("!H", self.value))
-        length = sum([len(x) for x in packed])
-        packed[1] = struct.pack("!H", length)
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_HHH, buf, offset, self.type, 0, self.value)
+        length = offset - start
+        _struct_H.pack_into(buf, start + 2, length)
+        return offset
+
+    def wire_length(self):
+        return 6
 
     @staticmethod
     def unpack(reader):
         obj = udf_id()
-        _type = reader.read("!H")[0]
+        _type, _length = reader.read_struct(_struct_HH)
         assert(_type == 15)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
         obj.value = reader.read("!H")[0]
@@ -3223,6 +3321,7 @@ class udf_id(bsn_tlv):
 bsn_tlv.subtypes[15] = udf_id
 
 class udf_length(bsn_tlv):
+    __slots__ = ["value"]
     type = 18
 
     def __init__(self, value=None):
@@ -3232,21 +3331,21 @@ class udf_length(bsn_tlv):
             self.value = 0
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!H", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
-        packed.append(struct.pack("!H", self.value))
-        length = sum([len(x) for x in packed])
-        packed[1] = struct.pack("!H", length)
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_HHH, buf, offset, self.type, 0, self.value)
+        length = offset - start
+        _struct_H.pack_into(buf, start + 2, length)
+        return offset
+
+    def wire_length(self):
+        return 6
 
     @staticmethod
     def unpack(reader):
         obj = udf_length()
-        _type = reader.read("!H")[0]
+        _type, _length = reader.read_struct(_struct_HH)
         assert(_type == 18)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
         obj.value = reader.read("!H")[0]
@@ -3270,6 +3369,7 @@ class udf_length(bsn_tlv):
 bsn_tlv.subtypes[18] = udf_length
 
 class udf_offset(bsn_tlv):
+    __slots__ = ["value"]
     type = 17
 
     def __init__(self, value=None):
@@ -3279,21 +3379,21 @@ class udf_offset(bsn_tlv):
             self.value = 0
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!H", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
-        packed.append(struct.pack("!H", self.value))
-        length = sum([len(x) for x in packed])
-        packed[1] = struct.pack("!H", length)
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_HHH, buf, offset, self.type, 0, self.value)
+        length = offset - start
+        _struct_H.pack_into(buf, start + 2, length)
+        return offset
+
+    def wire_length(self):
+        return 6
 
     @staticmethod
     def unpack(reader):
         obj = udf_offset()
-        _type = reader.read("!H")[0]
+        _type, _length = reader.read_struct(_struct_HH)
         assert(_type == 17)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
         obj.value = reader.read("!H")[0]
@@ -3317,6 +3417,7 @@ class udf_offset(bsn_tlv):
 bsn_tlv.subtypes[17] = udf_offset
 
 class udp_dst(bsn_tlv):
+    __slots__ = ["value"]
     type = 37
 
     def __init__(self, value=None):
@@ -3326,21 +3427,21 @@ class udp_dst(bsn_tlv):
             self.value = 0
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!H", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
-        packed.append(struct.pack("!H", self.value))
-        length = sum([len(x) for x in packed])
-        packed[1] = struct.pack("!H", length)
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_HHH, buf, offset, self.type, 0, self.value)
+        length = offset - start
+        _struct_H.pack_into(buf, start + 2, length)
+        return offset
+
+    def wire_length(self):
+        return 6
 
     @staticmethod
     def unpack(reader):
         obj = udp_dst()
-        _type = reader.read("!H")[0]
+        _type, _length = reader.read_struct(_struct_HH)
         assert(_type == 37)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
         obj.value = reader.read("!H")[0]
@@ -3364,6 +3465,7 @@ class udp_dst(bsn_tlv):
 bsn_tlv.subtypes[37] = udp_dst
 
 class udp_src(bsn_tlv):
+    __slots__ = ["value"]
     type = 36
 
     def __init__(self, value=None):
@@ -3373,21 +3475,21 @@ class udp_src(bsn_tlv):
             self.value = 0
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!H", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
-        packed.append(struct.pack("!H", self.value))
-        length = sum([len(x) for x in packed])
-        packed[1] = struct.pack("!H", length)
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_HHH, buf, offset, self.type, 0, self.value)
+        length = offset - start
+        _struct_H.pack_into(buf, start + 2, length)
+        return offset
+
+    def wire_length(self):
+        return 6
 
     @staticmethod
     def unpack(reader):
         obj = udp_src()
-        _type = reader.read("!H")[0]
+        _type, _length = reader.read_struct(_struct_HH)
         assert(_type == 36)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
         obj.value = reader.read("!H")[0]
@@ -3411,6 +3513,7 @@ class udp_src(bsn_tlv):
 bsn_tlv.subtypes[36] = udp_src
 
 class unicast_query_timeout(bsn_tlv):
+    __slots__ = ["value"]
     type = 9
 
     def __init__(self, value=None):
@@ -3420,21 +3523,21 @@ class unicast_query_timeout(bsn_tlv):
             self.value = 0
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!H", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
-        packed.append(struct.pack("!L", self.value))
-        length = sum([len(x) for x in packed])
-        packed[1] = struct.pack("!H", length)
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_HHL, buf, offset, self.type, 0, self.value)
+        length = offset - start
+        _struct_H.pack_into(buf, start + 2, length)
+        return offset
+
+    def wire_length(self):
+        return 8
 
     @staticmethod
     def unpack(reader):
         obj = unicast_query_timeout()
-        _type = reader.read("!H")[0]
+        _type, _length = reader.read_struct(_struct_HH)
         assert(_type == 9)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
         obj.value = reader.read("!L")[0]
@@ -3458,6 +3561,7 @@ class unicast_query_timeout(bsn_tlv):
 bsn_tlv.subtypes[9] = unicast_query_timeout
 
 class vlan_pcp(bsn_tlv):
+    __slots__ = ["value"]
     type = 72
 
     def __init__(self, value=None):
@@ -3467,21 +3571,21 @@ class vlan_pcp(bsn_tlv):
             self.value = 0
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!H", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
-        packed.append(struct.pack("!B", self.value))
-        length = sum([len(x) for x in packed])
-        packed[1] = struct.pack("!H", length)
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_HHB, buf, offset, self.type, 0, self.value)
+        length = offset - start
+        _struct_H.pack_into(buf, start + 2, length)
+        return offset
+
+    def wire_length(self):
+        return 5
 
     @staticmethod
     def unpack(reader):
         obj = vlan_pcp()
-        _type = reader.read("!H")[0]
+        _type, _length = reader.read_struct(_struct_HH)
         assert(_type == 72)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
         obj.value = reader.read("!B")[0]
@@ -3505,6 +3609,7 @@ class vlan_pcp(bsn_tlv):
 bsn_tlv.subtypes[72] = vlan_pcp
 
 class vlan_vid(bsn_tlv):
+    __slots__ = ["value"]
     type = 6
 
     def __init__(self, value=None):
@@ -3514,21 +3619,21 @@ class vlan_vid(bsn_tlv):
             self.value = 0
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!H", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
-        packed.append(struct.pack("!H", self.value))
-        length = sum([len(x) for x in packed])
-        packed[1] = struct.pack("!H", length)
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_HHH, buf, offset, self.type, 0, self.value)
+        length = offset - start
+        _struct_H.pack_into(buf, start + 2, length)
+        return offset
+
+    def wire_length(self):
+        return 6
 
     @staticmethod
     def unpack(reader):
         obj = vlan_vid()
-        _type = reader.read("!H")[0]
+        _type, _length = reader.read_struct(_struct_HH)
         assert(_type == 6)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
         obj.value = reader.read("!H")[0]
@@ -3552,6 +3657,7 @@ class vlan_vid(bsn_tlv):
 bsn_tlv.subtypes[6] = vlan_vid
 
 class vrf(bsn_tlv):
+    __slots__ = ["value"]
     type = 19
 
     def __init__(self, value=None):
@@ -3561,21 +3667,21 @@ class vrf(bsn_tlv):
             self.value = 0
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!H", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
-        packed.append(struct.pack("!L", self.value))
-        length = sum([len(x) for x in packed])
-        packed[1] = struct.pack("!H", length)
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_HHL, buf, offset, self.type, 0, self.value)
+        length = offset - start
+        _struct_H.pack_into(buf, start + 2, length)
+        return offset
+
+    def wire_length(self):
+        return 8
 
     @staticmethod
     def unpack(reader):
         obj = vrf()
-        _type = reader.read("!H")[0]
+        _type, _length = reader.read_struct(_struct_HH)
         assert(_type == 19)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
         obj.value = reader.read("!L")[0]
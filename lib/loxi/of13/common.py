@@ -14,7 +14,62 @@ import loxi.generic_util
 import sys
 ofp = sys.modules['loxi.of13']
 
+# Precompiled layouts for the fixed-length parts of each pack_into() and unpack()
+_struct_16sLL = struct.Struct("!16sLL")
+_struct_16sLLLLLLLL = struct.Struct("!16sLLLLLLLL")
+_struct_256s = struct.Struct("!256s")
+_struct_2x16sLL = struct.Struct("!2x16sLL")
+_struct_2x16sLLLLLLLL = struct.Struct("!2x16sLLLLLLLL")
+_struct_6B = struct.Struct("!6B")
+_struct_B = struct.Struct("!B")
+_struct_B3xLQQ = struct.Struct("!B3xLQQ")
+_struct_B5x32sQQLL = struct.Struct("!B5x32sQQLL")
+_struct_BB2xL256s = struct.Struct("!BB2xL256s")
+_struct_BQ = struct.Struct("!BQ")
+_struct_BxL = struct.Struct("!BxL")
+_struct_BxLLHHHH4xQQQ = struct.Struct("!BxLLHHHH4xQQQ")
+_struct_H = struct.Struct("!H")
+_struct_H2xL = struct.Struct("!H2xL")
+_struct_H2xLL4xQQLL = struct.Struct("!H2xLL4xQQLL")
+_struct_H32sLL4x = struct.Struct("!H32sLL4x")
+_struct_HB5x32sQQLL = struct.Struct("!HB5x32sQQLL")
+_struct_HBxL = struct.Struct("!HBxL")
+_struct_HBxLLHHHH4xQQQ = struct.Struct("!HBxLLHHHH4xQQQ")
+_struct_HH = struct.Struct("!HH")
+_struct_HH32sLL4x = struct.Struct("!HH32sLL4x")
+_struct_HH4x = struct.Struct("!HH4x")
+_struct_HH4xH6x = struct.Struct("!HH4xH6x")
+_struct_HH4xL4x = struct.Struct("!HH4xL4x")
+_struct_HHH2x = struct.Struct("!HHH2x")
+_struct_HHHBxH = struct.Struct("!HHHBxH")
+_struct_HHL = struct.Struct("!HHL")
+_struct_HHLHHHH16s = struct.Struct("!HHLHHHH16s")
+_struct_HHLL = struct.Struct("!HHLL")
+_struct_HHLL4x = struct.Struct("!HHLL4x")
+_struct_HHLLL = struct.Struct("!HHLLL")
+_struct_HL = struct.Struct("!HL")
+_struct_HLL4x = struct.Struct("!HLL4x")
+_struct_L = struct.Struct("!L")
+_struct_L4x = struct.Struct("!L4x")
+_struct_L4xQQQQQQQQQQQQLL = struct.Struct("!L4xQQQQQQQQQQQQLL")
+_struct_LH = struct.Struct("!LH")
+_struct_LH6xLQQLL = struct.Struct("!LH6xLQQLL")
+_struct_LHHHH16s = struct.Struct("!LHHHH16s")
+_struct_LL = struct.Struct("!LL")
+_struct_LL4xQQLL = struct.Struct("!LL4xQQLL")
+_struct_LLBB2xLL16s = struct.Struct("!LLBB2xLL16s")
+_struct_LLH = struct.Struct("!LLH")
+_struct_LLH6x = struct.Struct("!LLH6x")
+_struct_LLL = struct.Struct("!LLL")
+_struct_LLLBB2x = struct.Struct("!LLLBB2x")
+_struct_LLQQQLL = struct.Struct("!LLQQQLL")
+_struct_LQQLL = struct.Struct("!LQQLL")
+_struct_Q = struct.Struct("!Q")
+_struct_Q64s256s = struct.Struct("!Q64s256s")
+_struct_QQ = struct.Struct("!QQ")
+
 class bsn_controller_connection(loxi.OFObject):
+    __slots__ = ["auxiliary_id", "role", "state", "uri"]
 
     def __init__(self, state=None, auxiliary_id=None, role=None, uri=None):
         if state != None:
@@ -35,23 +90,19 @@ class bsn_controller_connection(loxi.OFObject):
             self.uri = ""
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!B", self.state))
-        packed.append(struct.pack("!B", self.auxiliary_id))
-        packed.append('\x00' * 2)
-        packed.append(struct.pack("!L", self.role))
-        packed.append(struct.pack("!256s", self.uri))
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_BB2xL256s, buf, offset, self.state, self.auxiliary_id, self.role, self.uri)
+        return offset
+
+    def wire_length(self):
+        return 264
 
     @staticmethod
     def unpack(reader):
         obj = bsn_controller_connection()
-        obj.state = reader.read("!B")[0]
-        obj.auxiliary_id = reader.read("!B")[0]
-        reader.skip(2)
-        obj.role = reader.read("!L")[0]
-        obj.uri = reader.read("!256s")[0].rstrip("\x00")
+        obj.state, obj.auxiliary_id, obj.role, obj.uri = reader.read_struct(_struct_BB2xL256s)
+        obj.uri = obj.uri.rstrip("\x00")
         return obj
 
     def __eq__(self, other):
@@ -83,6 +134,7 @@ class bsn_controller_connection(loxi.OFObject):
 
 
 class bsn_debug_counter_desc_stats_entry(loxi.OFObject):
+    __slots__ = ["counter_id", "description", "name"]
 
     def __init__(self, counter_id=None, name=None, description=None):
         if counter_id != None:
@@ -99,19 +151,20 @@ class bsn_debug_counter_desc_stats_entry(loxi.OFObject):
             self.description = ""
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!Q", self.counter_id))
-        packed.append(struct.pack("!64s", self.name))
-        packed.append(struct.pack("!256s", self.description))
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_Q64s256s, buf, offset, self.counter_id, self.name, self.description)
+        return offset
+
+    def wire_length(self):
+        return 328
 
     @staticmethod
     def unpack(reader):
         obj = bsn_debug_counter_desc_stats_entry()
-        obj.counter_id = reader.read("!Q")[0]
-        obj.name = reader.read("!64s")[0].rstrip("\x00")
-        obj.description = reader.read("!256s")[0].rstrip("\x00")
+        obj.counter_id, obj.name, obj.description = reader.read_struct(_struct_Q64s256s)
+        obj.name = obj.name.rstrip("\x00")
+        obj.description = obj.description.rstrip("\x00")
         return obj
 
     def __eq__(self, other):
@@ -139,6 +192,7 @@ class bsn_debug_counter_desc_stats_entry(loxi.OFObject):
 
 
 class bsn_debug_counter_stats_entry(loxi.OFObject):
+    __slots__ = ["counter_id", "value"]
 
     def __init__(self, counter_id=None, value=None):
         if counter_id != None:
@@ -151,17 +205,18 @@ class bsn_debug_counter_stats_entry(loxi.OFObject):
             self.value = 0
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!Q", self.counter_id))
-        packed.append(struct.pack("!Q", self.value))
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_QQ, buf, offset, self.counter_id, self.value)
+        return offset
+
+    def wire_length(self):
+        return 16
 
     @staticmethod
     def unpack(reader):
         obj = bsn_debug_counter_stats_entry()
-        obj.counter_id = reader.read("!Q")[0]
-        obj.value = reader.read("!Q")[0]
+        obj.counter_id, obj.value = reader.read_struct(_struct_QQ)
         return obj
 
     def __eq__(self, other):
@@ -185,6 +240,7 @@ class bsn_debug_counter_stats_entry(loxi.OFObject):
 
 
 class bsn_flow_checksum_bucket_stats_entry(loxi.OFObject):
+    __slots__ = ["checksum"]
 
     def __init__(self, checksum=None):
         if checksum != None:
@@ -193,10 +249,13 @@ class bsn_flow_checksum_bucket_stats_entry(loxi.OFObject):
             self.checksum = 0
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!Q", self.checksum))
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_Q, buf, offset, self.checksum)
+        return offset
+
+    def wire_length(self):
+        return 8
 
     @staticmethod
     def unpack(reader):
@@ -221,6 +280,7 @@ class bsn_flow_checksum_bucket_stats_entry(loxi.OFObject):
 
 
 class bsn_generic_stats_entry(loxi.OFObject):
+    __slots__ = ["tlvs"]
 
     def __init__(self, tlvs=None):
         if tlvs != None:
@@ -229,13 +289,16 @@ class bsn_generic_stats_entry(loxi.OFObject):
             self.tlvs = []
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 0
-        packed.append(loxi.generic_util.pack_list(self.tlvs))
-        length = sum([len(x) for x in packed])
-        packed[0] = struct.pack("!H", length)
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_H, buf, offset, 0)
+        offset = loxi.generic_util.pack_list_into(self.tlvs, buf, offset)
+        length = offset - start
+        _struct_H.pack_into(buf, start + 0, length)
+        return offset
+
+    def wire_length(self):
+        return 2 + loxi.generic_util.list_wire_length(self.tlvs)
 
     @staticmethod
     def unpack(reader):
@@ -263,6 +326,7 @@ class bsn_generic_stats_entry(loxi.OFObject):
 
 
 class bsn_gentable_bucket_stats_entry(loxi.OFObject):
+    __slots__ = ["checksum"]
 
     def __init__(self, checksum=None):
         if checksum != None:
@@ -271,10 +335,13 @@ class bsn_gentable_bucket_stats_entry(loxi.OFObject):
             self.checksum = 0
         return
 
-    def pack(self):
-        packed = []
-        packed.append(util.pack_checksum_128(self.checksum))
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_bytes_into(util.pack_checksum_128(self.checksum), buf, offset)
+        return offset
+
+    def wire_length(self):
+        return 16
 
     @staticmethod
     def unpack(reader):
@@ -299,6 +366,7 @@ class bsn_gentable_bucket_stats_entry(loxi.OFObject):
 
 
 class bsn_gentable_desc_stats_entry(loxi.OFObject):
+    __slots__ = ["buckets_size", "max_entries", "name", "table_id"]
 
     def __init__(self, table_id=None, name=None, buckets_size=None, max_entries=None):
         if table_id != None:
@@ -319,17 +387,15 @@ class bsn_gentable_desc_stats_entry(loxi.OFObject):
             self.max_entries = 0
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 0
-        packed.append(struct.pack("!H", self.table_id))
-        packed.append(struct.pack("!32s", self.name))
-        packed.append(struct.pack("!L", self.buckets_size))
-        packed.append(struct.pack("!L", self.max_entries))
-        packed.append('\x00' * 4)
-        length = sum([len(x) for x in packed])
-        packed[0] = struct.pack("!H", length)
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_HH32sLL4x, buf, offset, 0, self.table_id, self.name, self.buckets_size, self.max_entries)
+        length = offset - start
+        _struct_H.pack_into(buf, start + 0, length)
+        return offset
+
+    def wire_length(self):
+        return 48
 
     @staticmethod
     def unpack(reader):
@@ -337,11 +403,8 @@ class bsn_gentable_desc_stats_entry(loxi.OFObject):
         _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 2)
-        obj.table_id = reader.read("!H")[0]
-        obj.name = reader.read("!32s")[0].rstrip("\x00")
-        obj.buckets_size = reader.read("!L")[0]
-        obj.max_entries = reader.read("!L")[0]
-        reader.skip(4)
+        obj.table_id, obj.name, obj.buckets_size, obj.max_entries = reader.read_struct(_struct_H32sLL4x)
+        obj.name = obj.name.rstrip("\x00")
         return obj
 
     def __eq__(self, other):
@@ -373,6 +436,7 @@ class bsn_gentable_desc_stats_entry(loxi.OFObject):
 
 
 class bsn_gentable_entry_desc_stats_entry(loxi.OFObject):
+    __slots__ = ["checksum", "key", "value"]
 
     def __init__(self, checksum=None, key=None, value=None):
         if checksum != None:
@@ -389,17 +453,20 @@ class bsn_gentable_entry_desc_stats_entry(loxi.OFObject):
             self.value = []
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 0
-        packed.append(struct.pack("!H", 0)) # placeholder for key_length at index 1
-        packed.append(util.pack_checksum_128(self.checksum))
-        packed.append(loxi.generic_util.pack_list(self.key))
-        packed[1] = struct.pack("!H", len(packed[-1]))
-        packed.append(loxi.generic_util.pack_list(self.value))
-        length = sum([len(x) for x in packed])
-        packed[0] = struct.pack("!H", length)
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_HH, buf, offset, 0, 0)
+        offset = loxi.generic_util.pack_bytes_into(util.pack_checksum_128(self.checksum), buf, offset)
+        mark = offset
+        offset = loxi.generic_util.pack_list_into(self.key, buf, offset)
+        _struct_H.pack_into(buf, start + 2, offset - mark)
+        offset = loxi.generic_util.pack_list_into(self.value, buf, offset)
+        length = offset - start
+        _struct_H.pack_into(buf, start + 0, length)
+        return offset
+
+    def wire_length(self):
+        return 20 + loxi.generic_util.list_wire_length(self.key) + loxi.generic_util.list_wire_length(self.value)
 
     @staticmethod
     def unpack(reader):
@@ -438,6 +505,7 @@ class bsn_gentable_entry_desc_stats_entry(loxi.OFObject):
 
 
 class bsn_gentable_entry_stats_entry(loxi.OFObject):
+    __slots__ = ["key", "stats"]
 
     def __init__(self, key=None, stats=None):
         if key != None:
@@ -450,16 +518,19 @@ class bsn_gentable_entry_stats_entry(loxi.OFObject):
             self.stats = []
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 0
-        packed.append(struct.pack("!H", 0)) # placeholder for key_length at index 1
-        packed.append(loxi.generic_util.pack_list(self.key))
-        packed[1] = struct.pack("!H", len(packed[-1]))
-        packed.append(loxi.generic_util.pack_list(self.stats))
-        length = sum([len(x) for x in packed])
-        packed[0] = struct.pack("!H", length)
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_HH, buf, offset, 0, 0)
+        mark = offset
+        offset = loxi.generic_util.pack_list_into(self.key, buf, offset)
+        _struct_H.pack_into(buf, start + 2, offset - mark)
+        offset = loxi.generic_util.pack_list_into(self.stats, buf, offset)
+        length = offset - start
+        _struct_H.pack_into(buf, start + 0, length)
+        return offset
+
+    def wire_length(self):
+        return 4 + loxi.generic_util.list_wire_length(self.key) + loxi.generic_util.list_wire_length(self.stats)
 
     @staticmethod
     def unpack(reader):
@@ -493,6 +564,7 @@ class bsn_gentable_entry_stats_entry(loxi.OFObject):
 
 
 class bsn_gentable_stats_entry(loxi.OFObject):
+    __slots__ = ["checksum", "entry_count", "table_id"]
 
     def __init__(self, table_id=None, entry_count=None, checksum=None):
         if table_id != None:
@@ -509,20 +581,19 @@ class bsn_gentable_stats_entry(loxi.OFObject):
             self.checksum = 0
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!H", self.table_id))
-        packed.append('\x00' * 2)
-        packed.append(struct.pack("!L", self.entry_count))
-        packed.append(util.pack_checksum_128(self.checksum))
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_H2xL, buf, offset, self.table_id, self.entry_count)
+        offset = loxi.generic_util.pack_bytes_into(util.pack_checksum_128(self.checksum), buf, offset)
+        return offset
+
+    def wire_length(self):
+        return 24
 
     @staticmethod
     def unpack(reader):
         obj = bsn_gentable_stats_entry()
-        obj.table_id = reader.read("!H")[0]
-        reader.skip(2)
-        obj.entry_count = reader.read("!L")[0]
+        obj.table_id, obj.entry_count = reader.read_struct(_struct_H2xL)
         obj.checksum = util.unpack_checksum_128(reader)
         return obj
 
@@ -551,6 +622,7 @@ class bsn_gentable_stats_entry(loxi.OFObject):
 
 
 class bsn_interface(loxi.OFObject):
+    __slots__ = ["hw_addr", "ipv4_addr", "ipv4_netmask", "name"]
 
     def __init__(self, hw_addr=None, name=None, ipv4_addr=None, ipv4_netmask=None):
         if hw_addr != None:
@@ -571,23 +643,22 @@ class bsn_interface(loxi.OFObject):
             self.ipv4_netmask = 0
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!6B", *self.hw_addr))
-        packed.append('\x00' * 2)
-        packed.append(struct.pack("!16s", self.name))
-        packed.append(struct.pack("!L", self.ipv4_addr))
-        packed.append(struct.pack("!L", self.ipv4_netmask))
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_6B, buf, offset, *self.hw_addr)
+        offset = loxi.generic_util.pack_struct_into(_struct_2x16sLL, buf, offset, self.name, self.ipv4_addr, self.ipv4_netmask)
+        return offset
+
+    def wire_length(self):
+        return 32
 
     @staticmethod
     def unpack(reader):
         obj = bsn_interface()
         obj.hw_addr = list(reader.read('!6B'))
         reader.skip(2)
-        obj.name = reader.read("!16s")[0].rstrip("\x00")
-        obj.ipv4_addr = reader.read("!L")[0]
-        obj.ipv4_netmask = reader.read("!L")[0]
+        obj.name, obj.ipv4_addr, obj.ipv4_netmask = reader.read_struct(_struct_16sLL)
+        obj.name = obj.name.rstrip("\x00")
         return obj
 
     def __eq__(self, other):
@@ -619,6 +690,7 @@ class bsn_interface(loxi.OFObject):
 
 
 class bsn_lacp_stats_entry(loxi.OFObject):
+    __slots__ = ["actor_key", "actor_port_num", "actor_port_priority", "actor_sys_mac", "actor_sys_priority", "convergence_status", "partner_key", "partner_port_num", "partner_port_priority", "partner_sys_mac", "partner_sys_priority", "port_no"]
 
     def __init__(self, port_no=None, actor_sys_priority=None, actor_sys_mac=None, actor_port_priority=None, actor_port_num=None, actor_key=None, convergence_status=None, partner_sys_priority=None, partner_sys_mac=None, partner_port_priority=None, partner_port_num=None, partner_key=None):
         if port_no != None:
@@ -671,41 +743,26 @@ class bsn_lacp_stats_entry(loxi.OFObject):
             self.partner_key = 0
         return
 
-    def pack(self):
-        packed = []
-        packed.append(util.pack_port_no(self.port_no))
-        packed.append(struct.pack("!H", self.actor_sys_priority))
-        packed.append(struct.pack("!6B", *self.actor_sys_mac))
-        packed.append(struct.pack("!H", self.actor_port_priority))
-        packed.append(struct.pack("!H", self.actor_port_num))
-        packed.append(struct.pack("!H", self.actor_key))
-        packed.append(struct.pack("!B", self.convergence_status))
-        packed.append('\x00' * 1)
-        packed.append(struct.pack("!H", self.partner_sys_priority))
-        packed.append(struct.pack("!6B", *self.partner_sys_mac))
-        packed.append(struct.pack("!H", self.partner_port_priority))
-        packed.append(struct.pack("!H", self.partner_port_num))
-        packed.append(struct.pack("!H", self.partner_key))
-        packed.append('\x00' * 2)
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_LH, buf, offset, self.port_no, self.actor_sys_priority)
+        offset = loxi.generic_util.pack_struct_into(_struct_6B, buf, offset, *self.actor_sys_mac)
+        offset = loxi.generic_util.pack_struct_into(_struct_HHHBxH, buf, offset, self.actor_port_priority, self.actor_port_num, self.actor_key, self.convergence_status, self.partner_sys_priority)
+        offset = loxi.generic_util.pack_struct_into(_struct_6B, buf, offset, *self.partner_sys_mac)
+        offset = loxi.generic_util.pack_struct_into(_struct_HHH2x, buf, offset, self.partner_port_priority, self.partner_port_num, self.partner_key)
+        return offset
+
+    def wire_length(self):
+        return 36
 
     @staticmethod
     def unpack(reader):
         obj = bsn_lacp_stats_entry()
-        obj.port_no = util.unpack_port_no(reader)
-        obj.actor_sys_priority = reader.read("!H")[0]
+        obj.port_no, obj.actor_sys_priority = reader.read_struct(_struct_LH)
         obj.actor_sys_mac = list(reader.read('!6B'))
-        obj.actor_port_priority = reader.read("!H")[0]
-        obj.actor_port_num = reader.read("!H")[0]
-        obj.actor_key = reader.read("!H")[0]
-        obj.convergence_status = reader.read("!B")[0]
-        reader.skip(1)
-        obj.partner_sys_priority = reader.read("!H")[0]
+        obj.actor_port_priority, obj.actor_port_num, obj.actor_key, obj.convergence_status, obj.partner_sys_priority = reader.read_struct(_struct_HHHBxH)
         obj.partner_sys_mac = list(reader.read('!6B'))
-        obj.partner_port_priority = reader.read("!H")[0]
-        obj.partner_port_num = reader.read("!H")[0]
-        obj.partner_key = reader.read("!H")[0]
-        reader.skip(2)
+        obj.partner_port_priority, obj.partner_port_num, obj.partner_key = reader.read_struct(_struct_HHH2x)
         return obj
 
     def __eq__(self, other):
@@ -769,6 +826,7 @@ class bsn_lacp_stats_entry(loxi.OFObject):
 
 
 class bsn_port_counter_stats_entry(loxi.OFObject):
+    __slots__ = ["port_no", "values"]
 
     def __init__(self, port_no=None, values=None):
         if port_no != None:
@@ -781,15 +839,16 @@ class bsn_port_counter_stats_entry(loxi.OFObject):
             self.values = []
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 0
-        packed.append('\x00' * 2)
-        packed.append(util.pack_port_no(self.port_no))
-        packed.append(loxi.generic_util.pack_list(self.values))
-        length = sum([len(x) for x in packed])
-        packed[0] = struct.pack("!H", length)
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_H2xL, buf, offset, 0, self.port_no)
+        offset = loxi.generic_util.pack_list_into(self.values, buf, offset)
+        length = offset - start
+        _struct_H.pack_into(buf, start + 0, length)
+        return offset
+
+    def wire_length(self):
+        return 8 + loxi.generic_util.list_wire_length(self.values)
 
     @staticmethod
     def unpack(reader):
@@ -823,6 +882,7 @@ class bsn_port_counter_stats_entry(loxi.OFObject):
 
 
 class bsn_switch_pipeline_stats_entry(loxi.OFObject):
+    __slots__ = ["pipeline"]
 
     def __init__(self, pipeline=None):
         if pipeline != None:
@@ -831,10 +891,13 @@ class bsn_switch_pipeline_stats_entry(loxi.OFObject):
             self.pipeline = ""
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!256s", self.pipeline))
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_256s, buf, offset, self.pipeline)
+        return offset
+
+    def wire_length(self):
+        return 256
 
     @staticmethod
     def unpack(reader):
@@ -859,6 +922,7 @@ class bsn_switch_pipeline_stats_entry(loxi.OFObject):
 
 
 class bsn_table_checksum_stats_entry(loxi.OFObject):
+    __slots__ = ["checksum", "table_id"]
 
     def __init__(self, table_id=None, checksum=None):
         if table_id != None:
@@ -871,17 +935,18 @@ class bsn_table_checksum_stats_entry(loxi.OFObject):
             self.checksum = 0
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!B", self.table_id))
-        packed.append(struct.pack("!Q", self.checksum))
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_BQ, buf, offset, self.table_id, self.checksum)
+        return offset
+
+    def wire_length(self):
+        return 9
 
     @staticmethod
     def unpack(reader):
         obj = bsn_table_checksum_stats_entry()
-        obj.table_id = reader.read("!B")[0]
-        obj.checksum = reader.read("!Q")[0]
+        obj.table_id, obj.checksum = reader.read_struct(_struct_BQ)
         return obj
 
     def __eq__(self, other):
@@ -905,6 +970,7 @@ class bsn_table_checksum_stats_entry(loxi.OFObject):
 
 
 class bsn_vport(loxi.OFObject):
+    __slots__ = ["type"]
     subtypes = {}
 
 
@@ -915,13 +981,15 @@ class bsn_vport(loxi.OFObject):
             self.type = 0
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!H", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
-        length = sum([len(x) for x in packed])
-        packed[1] = struct.pack("!H", length)
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_HH, buf, offset, self.type, 0)
+        length = offset - start
+        _struct_H.pack_into(buf, start + 2, length)
+        return offset
+
+    def wire_length(self):
+        return 4
 
     @staticmethod
     def unpack(reader):
@@ -931,8 +999,7 @@ class bsn_vport(loxi.OFObject):
             return subclass.unpack(reader)
 
         obj = bsn_vport()
-        obj.type = reader.read("!H")[0]
-        _length = reader.read("!H")[0]
+        obj.type, _length = reader.read_struct(_struct_HH)
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
         return obj
@@ -952,6 +1019,7 @@ class bsn_vport(loxi.OFObject):
 
 
 class bsn_vlan_counter_stats_entry(loxi.OFObject):
+    __slots__ = ["values", "vlan_vid"]
 
     def __init__(self, vlan_vid=None, values=None):
         if vlan_vid != None:
@@ -964,15 +1032,16 @@ class bsn_vlan_counter_stats_entry(loxi.OFObject):
             self.values = []
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 0
-        packed.append(struct.pack("!H", self.vlan_vid))
-        packed.append('\x00' * 4)
-        packed.append(loxi.generic_util.pack_list(self.values))
-        length = sum([len(x) for x in packed])
-        packed[0] = struct.pack("!H", length)
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_HH4x, buf, offset, 0, self.vlan_vid)
+        offset = loxi.generic_util.pack_list_into(self.values, buf, offset)
+        length = offset - start
+        _struct_H.pack_into(buf, start + 0, length)
+        return offset
+
+    def wire_length(self):
+        return 8 + loxi.generic_util.list_wire_length(self.values)
 
     @staticmethod
     def unpack(reader):
@@ -1006,6 +1075,7 @@ class bsn_vlan_counter_stats_entry(loxi.OFObject):
 
 
 class bsn_vport_l2gre(bsn_vport):
+    __slots__ = ["dscp", "dst_ip", "flags", "if_name", "local_mac", "loopback_port_no", "nh_mac", "port_no", "rate_limit", "src_ip", "ttl", "vpn"]
     type = 1
 
     def __init__(self, flags=None, port_no=None, loopback_port_no=None, local_mac=None, nh_mac=None, src_ip=None, dst_ip=None, dscp=None, ttl=None, vpn=None, rate_limit=None, if_name=None):
@@ -1059,48 +1129,31 @@ class bsn_vport_l2gre(bsn_vport):
             self.if_name = ""
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!H", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
-        packed.append(struct.pack("!L", self.flags))
-        packed.append(util.pack_port_no(self.port_no))
-        packed.append(util.pack_port_no(self.loopback_port_no))
-        packed.append(struct.pack("!6B", *self.local_mac))
-        packed.append(struct.pack("!6B", *self.nh_mac))
-        packed.append(struct.pack("!L", self.src_ip))
-        packed.append(struct.pack("!L", self.dst_ip))
-        packed.append(struct.pack("!B", self.dscp))
-        packed.append(struct.pack("!B", self.ttl))
-        packed.append('\x00' * 2)
-        packed.append(struct.pack("!L", self.vpn))
-        packed.append(struct.pack("!L", self.rate_limit))
-        packed.append(struct.pack("!16s", self.if_name))
-        length = sum([len(x) for x in packed])
-        packed[1] = struct.pack("!H", length)
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_HHLLL, buf, offset, self.type, 0, self.flags, self.port_no, self.loopback_port_no)
+        offset = loxi.generic_util.pack_struct_into(_struct_6B, buf, offset, *self.local_mac)
+        offset = loxi.generic_util.pack_struct_into(_struct_6B, buf, offset, *self.nh_mac)
+        offset = loxi.generic_util.pack_struct_into(_struct_LLBB2xLL16s, buf, offset, self.src_ip, self.dst_ip, self.dscp, self.ttl, self.vpn, self.rate_limit, self.if_name)
+        length = offset - start
+        _struct_H.pack_into(buf, start + 2, length)
+        return offset
+
+    def wire_length(self):
+        return 64
 
     @staticmethod
     def unpack(reader):
         obj = bsn_vport_l2gre()
-        _type = reader.read("!H")[0]
+        _type, _length = reader.read_struct(_struct_HH)
         assert(_type == 1)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.flags = reader.read("!L")[0]
-        obj.port_no = util.unpack_port_no(reader)
-        obj.loopback_port_no = util.unpack_port_no(reader)
+        obj.flags, obj.port_no, obj.loopback_port_no = reader.read_struct(_struct_LLL)
         obj.local_mac = list(reader.read('!6B'))
         obj.nh_mac = list(reader.read('!6B'))
-        obj.src_ip = reader.read("!L")[0]
-        obj.dst_ip = reader.read("!L")[0]
-        obj.dscp = reader.read("!B")[0]
-        obj.ttl = reader.read("!B")[0]
-        reader.skip(2)
-        obj.vpn = reader.read("!L")[0]
-        obj.rate_limit = reader.read("!L")[0]
-        obj.if_name = reader.read("!16s")[0].rstrip("\x00")
+        obj.src_ip, obj.dst_ip, obj.dscp, obj.ttl, obj.vpn, obj.rate_limit, obj.if_name = reader.read_struct(_struct_LLBB2xLL16s)
+        obj.if_name = obj.if_name.rstrip("\x00")
         return obj
 
     def __eq__(self, other):
@@ -1165,6 +1218,7 @@ class bsn_vport_l2gre(bsn_vport):
 bsn_vport.subtypes[1] = bsn_vport_l2gre
 
 class bsn_vport_q_in_q(bsn_vport):
+    __slots__ = ["egress_tpid", "egress_vlan_id", "if_name", "ingress_tpid", "ingress_vlan_id", "port_no"]
     type = 0
 
     def __init__(self, port_no=None, ingress_tpid=None, ingress_vlan_id=None, egress_tpid=None, egress_vlan_id=None, if_name=None):
@@ -1194,34 +1248,25 @@ class bsn_vport_q_in_q(bsn_vport):
             self.if_name = ""
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!H", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
-        packed.append(struct.pack("!L", self.port_no))
-        packed.append(struct.pack("!H", self.ingress_tpid))
-        packed.append(struct.pack("!H", self.ingress_vlan_id))
-        packed.append(struct.pack("!H", self.egress_tpid))
-        packed.append(struct.pack("!H", self.egress_vlan_id))
-        packed.append(struct.pack("!16s", self.if_name))
-        length = sum([len(x) for x in packed])
-        packed[1] = struct.pack("!H", length)
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_HHLHHHH16s, buf, offset, self.type, 0, self.port_no, self.ingress_tpid, self.ingress_vlan_id, self.egress_tpid, self.egress_vlan_id, self.if_name)
+        length = offset - start
+        _struct_H.pack_into(buf, start + 2, length)
+        return offset
+
+    def wire_length(self):
+        return 32
 
     @staticmethod
     def unpack(reader):
         obj = bsn_vport_q_in_q()
-        _type = reader.read("!H")[0]
+        _type, _length = reader.read_struct(_struct_HH)
         assert(_type == 0)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.port_no = reader.read("!L")[0]
-        obj.ingress_tpid = reader.read("!H")[0]
-        obj.ingress_vlan_id = reader.read("!H")[0]
-        obj.egress_tpid = reader.read("!H")[0]
-        obj.egress_vlan_id = reader.read("!H")[0]
-        obj.if_name = reader.read("!16s")[0].rstrip("\x00")
+        obj.port_no, obj.ingress_tpid, obj.ingress_vlan_id, obj.egress_tpid, obj.egress_vlan_id, obj.if_name = reader.read_struct(_struct_LHHHH16s)
+        obj.if_name = obj.if_name.rstrip("\x00")
         return obj
 
     def __eq__(self, other):
@@ -1262,6 +1307,7 @@ class bsn_vport_q_in_q(bsn_vport):
 bsn_vport.subtypes[0] = bsn_vport_q_in_q
 
 class bsn_vrf_counter_stats_entry(loxi.OFObject):
+    __slots__ = ["values", "vrf"]
 
     def __init__(self, vrf=None, values=None):
         if vrf != None:
@@ -1274,15 +1320,16 @@ class bsn_vrf_counter_stats_entry(loxi.OFObject):
             self.values = []
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 0
-        packed.append('\x00' * 2)
-        packed.append(struct.pack("!L", self.vrf))
-        packed.append(loxi.generic_util.pack_list(self.values))
-        length = sum([len(x) for x in packed])
-        packed[0] = struct.pack("!H", length)
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_H2xL, buf, offset, 0, self.vrf)
+        offset = loxi.generic_util.pack_list_into(self.values, buf, offset)
+        length = offset - start
+        _struct_H.pack_into(buf, start + 0, length)
+        return offset
+
+    def wire_length(self):
+        return 8 + loxi.generic_util.list_wire_length(self.values)
 
     @staticmethod
     def unpack(reader):
@@ -1316,6 +1363,7 @@ class bsn_vrf_counter_stats_entry(loxi.OFObject):
 
 
 class bucket(loxi.OFObject):
+    __slots__ = ["actions", "watch_group", "watch_port", "weight"]
 
     def __init__(self, weight=None, watch_port=None, watch_group=None, actions=None):
         if weight != None:
@@ -1336,17 +1384,16 @@ class bucket(loxi.OFObject):
             self.actions = []
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!H", 0)) # placeholder for len at index 0
-        packed.append(struct.pack("!H", self.weight))
-        packed.append(util.pack_port_no(self.watch_port))
-        packed.append(struct.pack("!L", self.watch_group))
-        packed.append('\x00' * 4)
-        packed.append(loxi.generic_util.pack_list(self.actions))
-        length = sum([len(x) for x in packed])
-        packed[0] = struct.pack("!H", length)
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_HHLL4x, buf, offset, 0, self.weight, self.watch_port, self.watch_group)
+        offset = loxi.generic_util.pack_list_into(self.actions, buf, offset)
+        length = offset - start
+        _struct_H.pack_into(buf, start + 0, length)
+        return offset
+
+    def wire_length(self):
+        return 16 + loxi.generic_util.list_wire_length(self.actions)
 
     @staticmethod
     def unpack(reader):
@@ -1354,10 +1401,7 @@ class bucket(loxi.OFObject):
         _len = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_len, 2)
-        obj.weight = reader.read("!H")[0]
-        obj.watch_port = util.unpack_port_no(reader)
-        obj.watch_group = reader.read("!L")[0]
-        reader.skip(4)
+        obj.weight, obj.watch_port, obj.watch_group = reader.read_struct(_struct_HLL4x)
         obj.actions = loxi.generic_util.unpack_list(reader, ofp.action.action.unpack)
         return obj
 
@@ -1390,6 +1434,7 @@ class bucket(loxi.OFObject):
 
 
 class bucket_counter(loxi.OFObject):
+    __slots__ = ["byte_count", "packet_count"]
 
     def __init__(self, packet_count=None, byte_count=None):
         if packet_count != None:
@@ -1402,17 +1447,18 @@ class bucket_counter(loxi.OFObject):
             self.byte_count = 0
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!Q", self.packet_count))
-        packed.append(struct.pack("!Q", self.byte_count))
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_QQ, buf, offset, self.packet_count, self.byte_count)
+        return offset
+
+    def wire_length(self):
+        return 16
 
     @staticmethod
     def unpack(reader):
         obj = bucket_counter()
-        obj.packet_count = reader.read("!Q")[0]
-        obj.byte_count = reader.read("!Q")[0]
+        obj.packet_count, obj.byte_count = reader.read_struct(_struct_QQ)
         return obj
 
     def __eq__(self, other):
@@ -1436,6 +1482,7 @@ class bucket_counter(loxi.OFObject):
 
 
 class flow_stats_entry(loxi.OFObject):
+    __slots__ = ["byte_count", "cookie", "duration_nsec", "duration_sec", "flags", "hard_timeout", "idle_timeout", "instructions", "match", "packet_count", "priority", "table_id"]
 
     def __init__(self, table_id=None, duration_sec=None, duration_nsec=None, priority=None, idle_timeout=None, hard_timeout=None, flags=None, cookie=None, packet_count=None, byte_count=None, match=None, instructions=None):
         if table_id != None:
@@ -1488,26 +1535,17 @@ class flow_stats_entry(loxi.OFObject):
             self.instructions = []
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 0
-        packed.append(struct.pack("!B", self.table_id))
-        packed.append('\x00' * 1)
-        packed.append(struct.pack("!L", self.duration_sec))
-        packed.append(struct.pack("!L", self.duration_nsec))
-        packed.append(struct.pack("!H", self.priority))
-        packed.append(struct.pack("!H", self.idle_timeout))
-        packed.append(struct.pack("!H", self.hard_timeout))
-        packed.append(struct.pack("!H", self.flags))
-        packed.append('\x00' * 4)
-        packed.append(struct.pack("!Q", self.cookie))
-        packed.append(struct.pack("!Q", self.packet_count))
-        packed.append(struct.pack("!Q", self.byte_count))
-        packed.append(self.match.pack())
-        packed.append(loxi.generic_util.pack_list(self.instructions))
-        length = sum([len(x) for x in packed])
-        packed[0] = struct.pack("!H", length)
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_HBxLLHHHH4xQQQ, buf, offset, 0, self.table_id, self.duration_sec, self.duration_nsec, self.priority, self.idle_timeout, self.hard_timeout, self.flags, self.cookie, self.packet_count, self.byte_count)
+        offset = self.match.pack_into(buf, offset)
+        offset = loxi.generic_util.pack_list_into(self.instructions, buf, offset)
+        length = offset - start
+        _struct_H.pack_into(buf, start + 0, length)
+        return offset
+
+    def wire_length(self):
+        return 48 + self.match.wire_length() + loxi.generic_util.list_wire_length(self.instructions)
 
     @staticmethod
     def unpack(reader):
@@ -1515,18 +1553,7 @@ class flow_stats_entry(loxi.OFObject):
         _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 2)
-        obj.table_id = reader.read("!B")[0]
-        reader.skip(1)
-        obj.duration_sec = reader.read("!L")[0]
-        obj.duration_nsec = reader.read("!L")[0]
-        obj.priority = reader.read("!H")[0]
-        obj.idle_timeout = reader.read("!H")[0]
-        obj.hard_timeout = reader.read("!H")[0]
-        obj.flags = reader.read("!H")[0]
-        reader.skip(4)
-        obj.cookie = reader.read("!Q")[0]
-        obj.packet_count = reader.read("!Q")[0]
-        obj.byte_count = reader.read("!Q")[0]
+        obj.table_id, obj.duration_sec, obj.duration_nsec, obj.priority, obj.idle_timeout, obj.hard_timeout, obj.flags, obj.cookie, obj.packet_count, obj.byte_count = reader.read_struct(_struct_BxLLHHHH4xQQQ)
         obj.match = ofp.match.unpack(reader)
         obj.instructions = loxi.generic_util.unpack_list(reader, ofp.instruction.instruction.unpack)
         return obj
@@ -1592,6 +1619,7 @@ class flow_stats_entry(loxi.OFObject):
 
 
 class group_desc_stats_entry(loxi.OFObject):
+    __slots__ = ["buckets", "group_id", "group_type"]
 
     def __init__(self, group_type=None, group_id=None, buckets=None):
         if group_type != None:
@@ -1608,16 +1636,16 @@ class group_desc_stats_entry(loxi.OFObject):
             self.buckets = []
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 0
-        packed.append(struct.pack("!B", self.group_type))
-        packed.append('\x00' * 1)
-        packed.append(struct.pack("!L", self.group_id))
-        packed.append(loxi.generic_util.pack_list(self.buckets))
-        length = sum([len(x) for x in packed])
-        packed[0] = struct.pack("!H", length)
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_HBxL, buf, offset, 0, self.group_type, self.group_id)
+        offset = loxi.generic_util.pack_list_into(self.buckets, buf, offset)
+        length = offset - start
+        _struct_H.pack_into(buf, start + 0, length)
+        return offset
+
+    def wire_length(self):
+        return 8 + loxi.generic_util.list_wire_length(self.buckets)
 
     @staticmethod
     def unpack(reader):
@@ -1625,9 +1653,7 @@ class group_desc_stats_entry(loxi.OFObject):
         _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 2)
-        obj.group_type = reader.read("!B")[0]
-        reader.skip(1)
-        obj.group_id = reader.read("!L")[0]
+        obj.group_type, obj.group_id = reader.read_struct(_struct_BxL)
         obj.buckets = loxi.generic_util.unpack_list(reader, ofp.common.bucket.unpack)
         return obj
 
@@ -1656,6 +1682,7 @@ class group_desc_stats_entry(loxi.OFObject):
 
 
 class group_stats_entry(loxi.OFObject):
+    __slots__ = ["bucket_stats", "byte_count", "duration_nsec", "duration_sec", "group_id", "packet_count", "ref_count"]
 
     def __init__(self, group_id=None, ref_count=None, packet_count=None, byte_count=None, duration_sec=None, duration_nsec=None, bucket_stats=None):
         if group_id != None:
@@ -1688,21 +1715,16 @@ class group_stats_entry(loxi.OFObject):
             self.bucket_stats = []
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 0
-        packed.append('\x00' * 2)
-        packed.append(struct.pack("!L", self.group_id))
-        packed.append(struct.pack("!L", self.ref_count))
-        packed.append('\x00' * 4)
-        packed.append(struct.pack("!Q", self.packet_count))
-        packed.append(struct.pack("!Q", self.byte_count))
-        packed.append(struct.pack("!L", self.duration_sec))
-        packed.append(struct.pack("!L", self.duration_nsec))
-        packed.append(loxi.generic_util.pack_list(self.bucket_stats))
-        length = sum([len(x) for x in packed])
-        packed[0] = struct.pack("!H", length)
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_H2xLL4xQQLL, buf, offset, 0, self.group_id, self.ref_count, self.packet_count, self.byte_count, self.duration_sec, self.duration_nsec)
+        offset = loxi.generic_util.pack_list_into(self.bucket_stats, buf, offset)
+        length = offset - start
+        _struct_H.pack_into(buf, start + 0, length)
+        return offset
+
+    def wire_length(self):
+        return 40 + loxi.generic_util.list_wire_length(self.bucket_stats)
 
     @staticmethod
     def unpack(reader):
@@ -1711,13 +1733,7 @@ class group_stats_entry(loxi.OFObject):
         orig_reader = reader
         reader = orig_reader.slice(_length, 2)
         reader.skip(2)
-        obj.group_id = reader.read("!L")[0]
-        obj.ref_count = reader.read("!L")[0]
-        reader.skip(4)
-        obj.packet_count = reader.read("!Q")[0]
-        obj.byte_count = reader.read("!Q")[0]
-        obj.duration_sec = reader.read("!L")[0]
-        obj.duration_nsec = reader.read("!L")[0]
+        obj.group_id, obj.ref_count, obj.packet_count, obj.byte_count, obj.duration_sec, obj.duration_nsec = reader.read_struct(_struct_LL4xQQLL)
         obj.bucket_stats = loxi.generic_util.unpack_list(reader, ofp.common.bucket_counter.unpack)
         return obj
 
@@ -1762,6 +1778,7 @@ class group_stats_entry(loxi.OFObject):
 
 
 class hello_elem(loxi.OFObject):
+    __slots__ = ["type"]
     subtypes = {}
 
 
@@ -1772,13 +1789,15 @@ class hello_elem(loxi.OFObject):
             self.type = 0
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!H", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
-        length = sum([len(x) for x in packed])
-        packed[1] = struct.pack("!H", length)
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_HH, buf, offset, self.type, 0)
+        length = offset - start
+        _struct_H.pack_into(buf, start + 2, length)
+        return offset
+
+    def wire_length(self):
+        return 4
 
     @staticmethod
     def unpack(reader):
@@ -1788,8 +1807,7 @@ class hello_elem(loxi.OFObject):
             return subclass.unpack(reader)
 
         obj = hello_elem()
-        obj.type = reader.read("!H")[0]
-        _length = reader.read("!H")[0]
+        obj.type, _length = reader.read_struct(_struct_HH)
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
         return obj
@@ -1809,6 +1827,7 @@ class hello_elem(loxi.OFObject):
 
 
 class hello_elem_versionbitmap(hello_elem):
+    __slots__ = ["bitmaps"]
     type = 1
 
     def __init__(self, bitmaps=None):
@@ -1818,21 +1837,22 @@ class hello_elem_versionbitmap(hello_elem):
             self.bitmaps = []
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!H", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
-        packed.append(loxi.generic_util.pack_list(self.bitmaps))
-        length = sum([len(x) for x in packed])
-        packed[1] = struct.pack("!H", length)
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_HH, buf, offset, self.type, 0)
+        offset = loxi.generic_util.pack_list_into(self.bitmaps, buf, offset)
+        length = offset - start
+        _struct_H.pack_into(buf, start + 2, length)
+        return offset
+
+    def wire_length(self):
+        return 4 + loxi.generic_util.list_wire_length(self.bitmaps)
 
     @staticmethod
     def unpack(reader):
         obj = hello_elem_versionbitmap()
-        _type = reader.read("!H")[0]
+        _type, _length = reader.read_struct(_struct_HH)
         assert(_type == 1)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
         obj.bitmaps = loxi.generic_util.unpack_list(reader, ofp.common.uint32.unpack)
@@ -1856,6 +1876,7 @@ class hello_elem_versionbitmap(hello_elem):
 hello_elem.subtypes[1] = hello_elem_versionbitmap
 
 class match_v3(loxi.OFObject):
+    __slots__ = ["oxm_list"]
     type = 1
 
     def __init__(self, oxm_list=None):
@@ -1865,25 +1886,29 @@ class match_v3(loxi.OFObject):
             self.oxm_list = []
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!H", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
-        packed.append(loxi.generic_util.pack_list(self.oxm_list))
-        length = sum([len(x) for x in packed])
-        packed[1] = struct.pack("!H", length)
-        packed.append(loxi.generic_util.pad_to(8, length))
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_HH, buf, offset, self.type, 0)
+        offset = ofp.oxm.pack_list_into(self.oxm_list, buf, offset)
+        length = offset - start
+        _struct_H.pack_into(buf, start + 2, length)
+        offset = loxi.generic_util.pack_pad_into(8, length, buf, offset)
+        return offset
+
+    def wire_length(self):
+        length = 4
+        length += loxi.generic_util.list_wire_length(self.oxm_list)
+        length = (length + 7) / 8 * 8
+        return length
 
     @staticmethod
     def unpack(reader):
         obj = match_v3()
-        _type = reader.read("!H")[0]
+        _type, _length = reader.read_struct(_struct_HH)
         assert(_type == 1)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.oxm_list = loxi.generic_util.unpack_list(reader, ofp.oxm.oxm.unpack)
+        obj.oxm_list = ofp.oxm.unpack_list(reader)
         orig_reader.skip_align()
         return obj
 
@@ -1904,6 +1929,7 @@ class match_v3(loxi.OFObject):
 
 
 class meter_band_stats(loxi.OFObject):
+    __slots__ = ["byte_band_count", "packet_band_count"]
 
     def __init__(self, packet_band_count=None, byte_band_count=None):
         if packet_band_count != None:
@@ -1916,17 +1942,18 @@ class meter_band_stats(loxi.OFObject):
             self.byte_band_count = 0
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!Q", self.packet_band_count))
-        packed.append(struct.pack("!Q", self.byte_band_count))
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_QQ, buf, offset, self.packet_band_count, self.byte_band_count)
+        return offset
+
+    def wire_length(self):
+        return 16
 
     @staticmethod
     def unpack(reader):
         obj = meter_band_stats()
-        obj.packet_band_count = reader.read("!Q")[0]
-        obj.byte_band_count = reader.read("!Q")[0]
+        obj.packet_band_count, obj.byte_band_count = reader.read_struct(_struct_QQ)
         return obj
 
     def __eq__(self, other):
@@ -1950,6 +1977,7 @@ class meter_band_stats(loxi.OFObject):
 
 
 class meter_config(loxi.OFObject):
+    __slots__ = ["entries", "flags", "meter_id"]
 
     def __init__(self, flags=None, meter_id=None, entries=None):
         if flags != None:
@@ -1966,15 +1994,16 @@ class meter_config(loxi.OFObject):
             self.entries = []
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 0
-        packed.append(struct.pack("!H", self.flags))
-        packed.append(struct.pack("!L", self.meter_id))
-        packed.append(loxi.generic_util.pack_list(self.entries))
-        length = sum([len(x) for x in packed])
-        packed[0] = struct.pack("!H", length)
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_HHL, buf, offset, 0, self.flags, self.meter_id)
+        offset = loxi.generic_util.pack_list_into(self.entries, buf, offset)
+        length = offset - start
+        _struct_H.pack_into(buf, start + 0, length)
+        return offset
+
+    def wire_length(self):
+        return 8 + loxi.generic_util.list_wire_length(self.entries)
 
     @staticmethod
     def unpack(reader):
@@ -1982,8 +2011,7 @@ class meter_config(loxi.OFObject):
         _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 2)
-        obj.flags = reader.read("!H")[0]
-        obj.meter_id = reader.read("!L")[0]
+        obj.flags, obj.meter_id = reader.read_struct(_struct_HL)
         obj.entries = loxi.generic_util.unpack_list(reader, ofp.meter_band.meter_band.unpack)
         return obj
 
@@ -2012,6 +2040,7 @@ class meter_config(loxi.OFObject):
 
 
 class meter_features(loxi.OFObject):
+    __slots__ = ["band_types", "capabilities", "max_bands", "max_color", "max_meter"]
 
     def __init__(self, max_meter=None, band_types=None, capabilities=None, max_bands=None, max_color=None):
         if max_meter != None:
@@ -2036,25 +2065,18 @@ class meter_features(loxi.OFObject):
             self.max_color = 0
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!L", self.max_meter))
-        packed.append(struct.pack("!L", self.band_types))
-        packed.append(struct.pack("!L", self.capabilities))
-        packed.append(struct.pack("!B", self.max_bands))
-        packed.append(struct.pack("!B", self.max_color))
-        packed.append('\x00' * 2)
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_LLLBB2x, buf, offset, self.max_meter, self.band_types, self.capabilities, self.max_bands, self.max_color)
+        return offset
+
+    def wire_length(self):
+        return 16
 
     @staticmethod
     def unpack(reader):
         obj = meter_features()
-        obj.max_meter = reader.read("!L")[0]
-        obj.band_types = reader.read("!L")[0]
-        obj.capabilities = reader.read("!L")[0]
-        obj.max_bands = reader.read("!B")[0]
-        obj.max_color = reader.read("!B")[0]
-        reader.skip(2)
+        obj.max_meter, obj.band_types, obj.capabilities, obj.max_bands, obj.max_color = reader.read_struct(_struct_LLLBB2x)
         return obj
 
     def __eq__(self, other):
@@ -2090,6 +2112,7 @@ class meter_features(loxi.OFObject):
 
 
 class meter_stats(loxi.OFObject):
+    __slots__ = ["band_stats", "byte_in_count", "duration_nsec", "duration_sec", "flow_count", "meter_id", "packet_in_count"]
 
     def __init__(self, meter_id=None, flow_count=None, packet_in_count=None, byte_in_count=None, duration_sec=None, duration_nsec=None, band_stats=None):
         if meter_id != None:
@@ -2122,34 +2145,25 @@ class meter_stats(loxi.OFObject):
             self.band_stats = []
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!L", self.meter_id))
-        packed.append(struct.pack("!H", 0)) # placeholder for len at index 1
-        packed.append('\x00' * 6)
-        packed.append(struct.pack("!L", self.flow_count))
-        packed.append(struct.pack("!Q", self.packet_in_count))
-        packed.append(struct.pack("!Q", self.byte_in_count))
-        packed.append(struct.pack("!L", self.duration_sec))
-        packed.append(struct.pack("!L", self.duration_nsec))
-        packed.append(loxi.generic_util.pack_list(self.band_stats))
-        length = sum([len(x) for x in packed])
-        packed[1] = struct.pack("!H", length)
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_LH6xLQQLL, buf, offset, self.meter_id, 0, self.flow_count, self.packet_in_count, self.byte_in_count, self.duration_sec, self.duration_nsec)
+        offset = loxi.generic_util.pack_list_into(self.band_stats, buf, offset)
+        length = offset - start
+        _struct_H.pack_into(buf, start + 4, length)
+        return offset
+
+    def wire_length(self):
+        return 40 + loxi.generic_util.list_wire_length(self.band_stats)
 
     @staticmethod
     def unpack(reader):
         obj = meter_stats()
-        obj.meter_id = reader.read("!L")[0]
-        _len = reader.read("!H")[0]
+        obj.meter_id, _len = reader.read_struct(_struct_LH)
         orig_reader = reader
         reader = orig_reader.slice(_len, 6)
         reader.skip(6)
-        obj.flow_count = reader.read("!L")[0]
-        obj.packet_in_count = reader.read("!Q")[0]
-        obj.byte_in_count = reader.read("!Q")[0]
-        obj.duration_sec = reader.read("!L")[0]
-        obj.duration_nsec = reader.read("!L")[0]
+        obj.flow_count, obj.packet_in_count, obj.byte_in_count, obj.duration_sec, obj.duration_nsec = reader.read_struct(_struct_LQQLL)
         obj.band_stats = loxi.generic_util.unpack_list(reader, ofp.common.meter_band_stats.unpack)
         return obj
 
@@ -2194,6 +2208,7 @@ class meter_stats(loxi.OFObject):
 
 
 class packet_queue(loxi.OFObject):
+    __slots__ = ["port", "properties", "queue_id"]
 
     def __init__(self, queue_id=None, port=None, properties=None):
         if queue_id != None:
@@ -2210,23 +2225,21 @@ class packet_queue(loxi.OFObject):
             self.properties = []
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!L", self.queue_id))
-        packed.append(util.pack_port_no(self.port))
-        packed.append(struct.pack("!H", 0)) # placeholder for len at index 2
-        packed.append('\x00' * 6)
-        packed.append(loxi.generic_util.pack_list(self.properties))
-        length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_LLH6x, buf, offset, self.queue_id, self.port, 0)
+        offset = loxi.generic_util.pack_list_into(self.properties, buf, offset)
+        length = offset - start
+        _struct_H.pack_into(buf, start + 8, length)
+        return offset
+
+    def wire_length(self):
+        return 16 + loxi.generic_util.list_wire_length(self.properties)
 
     @staticmethod
     def unpack(reader):
         obj = packet_queue()
-        obj.queue_id = reader.read("!L")[0]
-        obj.port = util.unpack_port_no(reader)
-        _len = reader.read("!H")[0]
+        obj.queue_id, obj.port, _len = reader.read_struct(_struct_LLH)
         orig_reader = reader
         reader = orig_reader.slice(_len, 10)
         reader.skip(6)
@@ -2258,6 +2271,7 @@ class packet_queue(loxi.OFObject):
 
 
 class port_desc(loxi.OFObject):
+    __slots__ = ["advertised", "config", "curr", "curr_speed", "hw_addr", "max_speed", "name", "peer", "port_no", "state", "supported"]
 
     def __init__(self, port_no=None, hw_addr=None, name=None, config=None, state=None, curr=None, advertised=None, supported=None, peer=None, curr_speed=None, max_speed=None):
         if port_no != None:
@@ -2306,22 +2320,15 @@ class port_desc(loxi.OFObject):
             self.max_speed = 0
         return
 
-    def pack(self):
-        packed = []
-        packed.append(util.pack_port_no(self.port_no))
-        packed.append('\x00' * 4)
-        packed.append(struct.pack("!6B", *self.hw_addr))
-        packed.append('\x00' * 2)
-        packed.append(struct.pack("!16s", self.name))
-        packed.append(struct.pack("!L", self.config))
-        packed.append(struct.pack("!L", self.state))
-        packed.append(struct.pack("!L", self.curr))
-        packed.append(struct.pack("!L", self.advertised))
-        packed.append(struct.pack("!L", self.supported))
-        packed.append(struct.pack("!L", self.peer))
-        packed.append(struct.pack("!L", self.curr_speed))
-        packed.append(struct.pack("!L", self.max_speed))
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_L4x, buf, offset, self.port_no)
+        offset = loxi.generic_util.pack_struct_into(_struct_6B, buf, offset, *self.hw_addr)
+        offset = loxi.generic_util.pack_struct_into(_struct_2x16sLLLLLLLL, buf, offset, self.name, self.config, self.state, self.curr, self.advertised, self.supported, self.peer, self.curr_speed, self.max_speed)
+        return offset
+
+    def wire_length(self):
+        return 64
 
     @staticmethod
     def unpack(reader):
@@ -2330,15 +2337,8 @@ class port_desc(loxi.OFObject):
         reader.skip(4)
         obj.hw_addr = list(reader.read('!6B'))
         reader.skip(2)
-        obj.name = reader.read("!16s")[0].rstrip("\x00")
-        obj.config = reader.read("!L")[0]
-        obj.state = reader.read("!L")[0]
-        obj.curr = reader.read("!L")[0]
-        obj.advertised = reader.read("!L")[0]
-        obj.supported = reader.read("!L")[0]
-        obj.peer = reader.read("!L")[0]
-        obj.curr_speed = reader.read("!L")[0]
-        obj.max_speed = reader.read("!L")[0]
+        obj.name, obj.config, obj.state, obj.curr, obj.advertised, obj.supported, obj.peer, obj.curr_speed, obj.max_speed = reader.read_struct(_struct_16sLLLLLLLL)
+        obj.name = obj.name.rstrip("\x00")
         return obj
 
     def __eq__(self, other):
@@ -2398,6 +2398,7 @@ class port_desc(loxi.OFObject):
 
 
 class port_stats_entry(loxi.OFObject):
+    __slots__ = ["collisions", "duration_nsec", "duration_sec", "port_no", "rx_bytes", "rx_crc_err", "rx_dropped", "rx_errors", "rx_frame_err", "rx_over_err", "rx_packets", "tx_bytes", "tx_dropped", "tx_errors", "tx_packets"]
 
     def __init__(self, port_no=None, rx_packets=None, tx_packets=None, rx_bytes=None, tx_bytes=None, rx_dropped=None, tx_dropped=None, rx_errors=None, tx_errors=None, rx_frame_err=None, rx_over_err=None, rx_crc_err=None, collisions=None, duration_sec=None, duration_nsec=None):
         if port_no != None:
@@ -2462,45 +2463,18 @@ class port_stats_entry(loxi.OFObject):
             self.duration_nsec = 0
         return
 
-    def pack(self):
-        packed = []
-        packed.append(util.pack_port_no(self.port_no))
-        packed.append('\x00' * 4)
-        packed.append(struct.pack("!Q", self.rx_packets))
-        packed.append(struct.pack("!Q", self.tx_packets))
-        packed.append(struct.pack("!Q", self.rx_bytes))
-        packed.append(struct.pack("!Q", self.tx_bytes))
-        packed.append(struct.pack("!Q", self.rx_dropped))
-        packed.append(struct.pack("!Q", self.tx_dropped))
-        packed.append(struct.pack("!Q", self.rx_errors))
-        packed.append(struct.pack("!Q", self.tx_errors))
-        packed.append(struct.pack("!Q", self.rx_frame_err))
-        packed.append(struct.pack("!Q", self.rx_over_err))
-        packed.append(struct.pack("!Q", self.rx_crc_err))
-        packed.append(struct.pack("!Q", self.collisions))
-        packed.append(struct.pack("!L", self.duration_sec))
-        packed.append(struct.pack("!L", self.duration_nsec))
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_L4xQQQQQQQQQQQQLL, buf, offset, self.port_no, self.rx_packets, self.tx_packets, self.rx_bytes, self.tx_bytes, self.rx_dropped, self.tx_dropped, self.rx_errors, self.tx_errors, self.rx_frame_err, self.rx_over_err, self.rx_crc_err, self.collisions, self.duration_sec, self.duration_nsec)
+        return offset
+
+    def wire_length(self):
+        return 112
 
     @staticmethod
     def unpack(reader):
         obj = port_stats_entry()
-        obj.port_no = util.unpack_port_no(reader)
-        reader.skip(4)
-        obj.rx_packets = reader.read("!Q")[0]
-        obj.tx_packets = reader.read("!Q")[0]
-        obj.rx_bytes = reader.read("!Q")[0]
-        obj.tx_bytes = reader.read("!Q")[0]
-        obj.rx_dropped = reader.read("!Q")[0]
-        obj.tx_dropped = reader.read("!Q")[0]
-        obj.rx_errors = reader.read("!Q")[0]
-        obj.tx_errors = reader.read("!Q")[0]
-        obj.rx_frame_err = reader.read("!Q")[0]
-        obj.rx_over_err = reader.read("!Q")[0]
-        obj.rx_crc_err = reader.read("!Q")[0]
-        obj.collisions = reader.read("!Q")[0]
-        obj.duration_sec = reader.read("!L")[0]
-        obj.duration_nsec = reader.read("!L")[0]
+        obj.port_no, obj.rx_packets, obj.tx_packets, obj.rx_bytes, obj.tx_bytes, obj.rx_dropped, obj.tx_dropped, obj.rx_errors, obj.tx_errors, obj.rx_frame_err, obj.rx_over_err, obj.rx_crc_err, obj.collisions, obj.duration_sec, obj.duration_nsec = reader.read_struct(_struct_L4xQQQQQQQQQQQQLL)
         return obj
 
     def __eq__(self, other):
@@ -2576,6 +2550,7 @@ class port_stats_entry(loxi.OFObject):
 
 
 class queue_prop(loxi.OFObject):
+    __slots__ = ["type"]
     subtypes = {}
 
 
@@ -2586,14 +2561,15 @@ class queue_prop(loxi.OFObject):
             self.type = 0
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!H", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for len at index 1
-        packed.append('\x00' * 4)
-        length = sum([len(x) for x in packed])
-        packed[1] = struct.pack("!H", length)
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_HH4x, buf, offset, self.type, 0)
+        length = offset - start
+        _struct_H.pack_into(buf, start + 2, length)
+        return offset
+
+    def wire_length(self):
+        return 8
 
     @staticmethod
     def unpack(reader):
@@ -2603,8 +2579,7 @@ class queue_prop(loxi.OFObject):
             return subclass.unpack(reader)
 
         obj = queue_prop()
-        obj.type = reader.read("!H")[0]
-        _len = reader.read("!H")[0]
+        obj.type, _len = reader.read_struct(_struct_HH)
         orig_reader = reader
         reader = orig_reader.slice(_len, 4)
         reader.skip(4)
@@ -2625,6 +2600,7 @@ class queue_prop(loxi.OFObject):
 
 
 class queue_prop_experimenter(queue_prop):
+    __slots__ = ["data", "experimenter"]
     subtypes = {}
 
     type = 65535
@@ -2640,17 +2616,16 @@ class queue_prop_experimenter(queue_prop):
             self.data = ''
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!H", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for len at index 1
-        packed.append('\x00' * 4)
-        packed.append(struct.pack("!L", self.experimenter))
-        packed.append('\x00' * 4)
-        packed.append(self.data)
-        length = sum([len(x) for x in packed])
-        packed[1] = struct.pack("!H", length)
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_HH4xL4x, buf, offset, self.type, 0, self.experimenter)
+        offset = loxi.generic_util.pack_bytes_into(self.data, buf, offset)
+        length = offset - start
+        _struct_H.pack_into(buf, start + 2, length)
+        return offset
+
+    def wire_length(self):
+        return 16 + len(self.data)
 
     @staticmethod
     def unpack(reader):
@@ -2660,15 +2635,14 @@ class queue_prop_experimenter(queue_prop):
             return subclass.unpack(reader)
 
         obj = queue_prop_experimenter()
-        _type = reader.read("!H")[0]
+        _type, _len = reader.read_struct(_struct_HH)
         assert(_type == 65535)
-        _len = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_len, 4)
         reader.skip(4)
         obj.experimenter = reader.read("!L")[0]
         reader.skip(4)
-        obj.data = str(reader.read_all())
+        obj.data = reader.read_all()
         return obj
 
     def __eq__(self, other):
@@ -2690,6 +2664,7 @@ class queue_prop_experimenter(queue_prop):
 queue_prop.subtypes[65535] = queue_prop_experimenter
 
 class queue_prop_max_rate(queue_prop):
+    __slots__ = ["rate"]
     type = 2
 
     def __init__(self, rate=None):
@@ -2699,23 +2674,21 @@ class queue_prop_max_rate(queue_prop):
             self.rate = 0
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!H", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for len at index 1
-        packed.append('\x00' * 4)
-        packed.append(struct.pack("!H", self.rate))
-        packed.append('\x00' * 6)
-        length = sum([len(x) for x in packed])
-        packed[1] = struct.pack("!H", length)
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_HH4xH6x, buf, offset, self.type, 0, self.rate)
+        length = offset - start
+        _struct_H.pack_into(buf, start + 2, length)
+        return offset
+
+    def wire_length(self):
+        return 16
 
     @staticmethod
     def unpack(reader):
         obj = queue_prop_max_rate()
-        _type = reader.read("!H")[0]
+        _type, _len = reader.read_struct(_struct_HH)
         assert(_type == 2)
-        _len = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_len, 4)
         reader.skip(4)
@@ -2741,6 +2714,7 @@ class queue_prop_max_rate(queue_prop):
 queue_prop.subtypes[2] = queue_prop_max_rate
 
 class queue_prop_min_rate(queue_prop):
+    __slots__ = ["rate"]
     type = 1
 
     def __init__(self, rate=None):
@@ -2750,23 +2724,21 @@ class queue_prop_min_rate(queue_prop):
             self.rate = 0
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!H", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for len at index 1
-        packed.append('\x00' * 4)
-        packed.append(struct.pack("!H", self.rate))
-        packed.append('\x00' * 6)
-        length = sum([len(x) for x in packed])
-        packed[1] = struct.pack("!H", length)
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_HH4xH6x, buf, offset, self.type, 0, self.rate)
+        length = offset - start
+        _struct_H.pack_into(buf, start + 2, length)
+        return offset
+
+    def wire_length(self):
+        return 16
 
     @staticmethod
     def unpack(reader):
         obj = queue_prop_min_rate()
-        _type = reader.read("!H")[0]
+        _type, _len = reader.read_struct(_struct_HH)
         assert(_type == 1)
-        _len = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_len, 4)
         reader.skip(4)
@@ -2792,6 +2764,7 @@ class queue_prop_min_rate(queue_prop):
 queue_prop.subtypes[1] = queue_prop_min_rate
 
 class queue_stats_entry(loxi.OFObject):
+    __slots__ = ["duration_nsec", "duration_sec", "port_no", "queue_id", "tx_bytes", "tx_errors", "tx_packets"]
 
     def __init__(self, port_no=None, queue_id=None, tx_bytes=None, tx_packets=None, tx_errors=None, duration_sec=None, duration_nsec=None):
         if port_no != None:
@@ -2824,27 +2797,18 @@ class queue_stats_entry(loxi.OFObject):
             self.duration_nsec = 0
         return
 
-    def pack(self):
-        packed = []
-        packed.append(util.pack_port_no(self.port_no))
-        packed.append(struct.pack("!L", self.queue_id))
-        packed.append(struct.pack("!Q", self.tx_bytes))
-        packed.append(struct.pack("!Q", self.tx_packets))
-        packed.append(struct.pack("!Q", self.tx_errors))
-        packed.append(struct.pack("!L", self.duration_sec))
-        packed.append(struct.pack("!L", self.duration_nsec))
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_LLQQQLL, buf, offset, self.port_no, self.queue_id, self.tx_bytes, self.tx_packets, self.tx_errors, self.duration_sec, self.duration_nsec)
+        return offset
+
+    def wire_length(self):
+        return 40
 
     @staticmethod
     def unpack(reader):
         obj = queue_stats_entry()
-        obj.port_no = util.unpack_port_no(reader)
-        obj.queue_id = reader.read("!L")[0]
-        obj.tx_bytes = reader.read("!Q")[0]
-        obj.tx_packets = reader.read("!Q")[0]
-        obj.tx_errors = reader.read("!Q")[0]
-        obj.duration_sec = reader.read("!L")[0]
-        obj.duration_nsec = reader.read("!L")[0]
+        obj.port_no, obj.queue_id, obj.tx_bytes, obj.tx_packets, obj.tx_errors, obj.duration_sec, obj.duration_nsec = reader.read_struct(_struct_LLQQQLL)
         return obj
 
     def __eq__(self, other):
@@ -2888,6 +2852,7 @@ class queue_stats_entry(loxi.OFObject):
 
 
 class table_feature_prop(loxi.OFObject):
+    __slots__ = ["type"]
     subtypes = {}
 
 
@@ -2898,13 +2863,15 @@ class table_feature_prop(loxi.OFObject):
             self.type = 0
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!H", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
-        length = sum([len(x) for x in packed])
-        packed[1] = struct.pack("!H", length)
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_HH, buf, offset, self.type, 0)
+        length = offset - start
+        _struct_H.pack_into(buf, start + 2, length)
+        return offset
+
+    def wire_length(self):
+        return 4
 
     @staticmethod
     def unpack(reader):
@@ -2914,8 +2881,7 @@ class table_feature_prop(loxi.OFObject):
             return subclass.unpack(reader)
 
         obj = table_feature_prop()
-        obj.type = reader.read("!H")[0]
-        _length = reader.read("!H")[0]
+        obj.type, _length = reader.read_struct(_struct_HH)
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
         return obj
@@ -2935,6 +2901,7 @@ class table_feature_prop(loxi.OFObject):
 
 
 class table_feature_prop_apply_actions(table_feature_prop):
+    __slots__ = ["action_ids"]
     type = 6
 
     def __init__(self, action_ids=None):
@@ -2944,21 +2911,22 @@ class table_feature_prop_apply_actions(table_feature_prop):
             self.action_ids = []
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!H", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
-        packed.append(loxi.generic_util.pack_list(self.action_ids))
-        length = sum([len(x) for x in packed])
-        packed[1] = struct.pack("!H", length)
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_HH, buf, offset, self.type, 0)
+        offset = loxi.generic_util.pack_list_into(self.action_ids, buf, offset)
+        length = offset - start
+        _struct_H.pack_into(buf, start + 2, length)
+        return offset
+
+    def wire_length(self):
+        return 4 + loxi.generic_util.list_wire_length(self.action_ids)
 
     @staticmethod
     def unpack(reader):
         obj = table_feature_prop_apply_actions()
-        _type = reader.read("!H")[0]
+        _type, _length = reader.read_struct(_struct_HH)
         assert(_type == 6)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
         obj.action_ids = loxi.generic_util.unpack_list(reader, ofp.action_id.action_id.unpack)
@@ -2982,6 +2950,7 @@ class table_feature_prop_apply_actions(table_feature_prop):
 table_feature_prop.subtypes[6] = table_feature_prop_apply_actions
 
 class table_feature_prop_apply_actions_miss(table_feature_prop):
+    __slots__ = ["action_ids"]
     type = 7
 
     def __init__(self, action_ids=None):
@@ -2991,21 +2960,22 @@ class table_feature_prop_apply_actions_miss(table_feature_prop):
             self.action_ids = []
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!H", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
-        packed.append(loxi.generic_util.pack_list(self.action_ids))
-        length = sum([len(x) for x in packed])
-        packed[1] = struct.pack("!H", length)
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_HH, buf, offset, self.type, 0)
+        offset = loxi.generic_util.pack_list_into(self.action_ids, buf, offset)
+        length = offset - start
+        _struct_H.pack_into(buf, start + 2, length)
+        return offset
+
+    def wire_length(self):
+        return 4 + loxi.generic_util.list_wire_length(self.action_ids)
 
     @staticmethod
     def unpack(reader):
         obj = table_feature_prop_apply_actions_miss()
-        _type = reader.read("!H")[0]
+        _type, _length = reader.read_struct(_struct_HH)
         assert(_type == 7)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
         obj.action_ids = loxi.generic_util.unpack_list(reader, ofp.action_id.action_id.unpack)
@@ -3029,6 +2999,7 @@ class table_feature_prop_apply_actions_miss(table_feature_prop):
 table_feature_prop.subtypes[7] = table_feature_prop_apply_actions_miss
 
 class table_feature_prop_apply_setfield(table_feature_prop):
+    __slots__ = ["oxm_ids"]
     type = 14
 
     def __init__(self, oxm_ids=None):
@@ -3038,21 +3009,22 @@ class table_feature_prop_apply_setfield(table_feature_prop):
             self.oxm_ids = []
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!H", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
-        packed.append(loxi.generic_util.pack_list(self.oxm_ids))
-        length = sum([len(x) for x in packed])
-        packed[1] = struct.pack("!H", length)
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_HH, buf, offset, self.type, 0)
+        offset = loxi.generic_util.pack_list_into(self.oxm_ids, buf, offset)
+        length = offset - start
+        _struct_H.pack_into(buf, start + 2, length)
+        return offset
+
+    def wire_length(self):
+        return 4 + loxi.generic_util.list_wire_length(self.oxm_ids)
 
     @staticmethod
     def unpack(reader):
         obj = table_feature_prop_apply_setfield()
-        _type = reader.read("!H")[0]
+        _type, _length = reader.read_struct(_struct_HH)
         assert(_type == 14)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
         obj.oxm_ids = loxi.generic_util.unpack_list(reader, ofp.common.uint32.unpack)
@@ -3076,6 +3048,7 @@ class table_feature_prop_apply_setfield(table_feature_prop):
 table_feature_prop.subtypes[14] = table_feature_prop_apply_setfield
 
 class table_feature_prop_apply_setfield_miss(table_feature_prop):
+    __slots__ = ["oxm_ids"]
     type = 15
 
     def __init__(self, oxm_ids=None):
@@ -3085,21 +3058,22 @@ class table_feature_prop_apply_setfield_miss(table_feature_prop):
             self.oxm_ids = []
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!H", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
-        packed.append(loxi.generic_util.pack_list(self.oxm_ids))
-        length = sum([len(x) for x in packed])
-        packed[1] = struct.pack("!H", length)
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_HH, buf, offset, self.type, 0)
+        offset = loxi.generic_util.pack_list_into(self.oxm_ids, buf, offset)
+        length = offset - start
+        _struct_H.pack_into(buf, start + 2, length)
+        return offset
+
+    def wire_length(self):
+        return 4 + loxi.generic_util.list_wire_length(self.oxm_ids)
 
     @staticmethod
     def unpack(reader):
         obj = table_feature_prop_apply_setfield_miss()
-        _type = reader.read("!H")[0]
+        _type, _length = reader.read_struct(_struct_HH)
         assert(_type == 15)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
         obj.oxm_ids = loxi.generic_util.unpack_list(reader, ofp.common.uint32.unpack)
@@ -3123,6 +3097,7 @@ class table_feature_prop_apply_setfield_miss(table_feature_prop):
 table_feature_prop.subtypes[15] = table_feature_prop_apply_setfield_miss
 
 class table_feature_prop_experimenter(table_feature_prop):
+    __slots__ = ["experimenter", "experimenter_data", "subtype"]
     subtypes = {}
 
     type = 65534
@@ -3142,16 +3117,16 @@ class table_feature_prop_experimenter(table_feature_prop):
             self.experimenter_data = ''
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!H", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
-        packed.append(struct.pack("!L", self.experimenter))
-        packed.append(struct.pack("!L", self.subtype))
-        packed.append(self.experimenter_data)
-        length = sum([len(x) for x in packed])
-        packed[1] = struct.pack("!H", length)
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_HHLL, buf, offset, self.type, 0, self.experimenter, self.subtype)
+        offset = loxi.generic_util.pack_bytes_into(self.experimenter_data, buf, offset)
+        length = offset - start
+        _struct_H.pack_into(buf, start + 2, length)
+        return offset
+
+    def wire_length(self):
+        return 12 + len(self.experimenter_data)
 
     @staticmethod
     def unpack(reader):
@@ -3161,14 +3136,12 @@ class table_feature_prop_experimenter(table_feature_prop):
             return subclass.unpack(reader)
 
         obj = table_feature_prop_experimenter()
-        _type = reader.read("!H")[0]
+        _type, _length = reader.read_struct(_struct_HH)
         assert(_type == 65534)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.experimenter = reader.read("!L")[0]
-        obj.subtype = reader.read("!L")[0]
-        obj.experimenter_data = str(reader.read_all())
+        obj.experimenter, obj.subtype = reader.read_struct(_struct_LL)
+        obj.experimenter_data = reader.read_all()
         return obj
 
     def __eq__(self, other):
@@ -3194,6 +3167,7 @@ class table_feature_prop_experimenter(table_feature_prop):
 table_feature_prop.subtypes[65534] = table_feature_prop_experimenter
 
 class table_feature_prop_experimenter_miss(table_feature_prop):
+    __slots__ = ["experimenter", "experimenter_data", "subtype"]
     subtypes = {}
 
     type = 65535
@@ -3213,16 +3187,16 @@ class table_feature_prop_experimenter_miss(table_feature_prop):
             self.experimenter_data = ''
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!H", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
-        packed.append(struct.pack("!L", self.experimenter))
-        packed.append(struct.pack("!L", self.subtype))
-        packed.append(self.experimenter_data)
-        length = sum([len(x) for x in packed])
-        packed[1] = struct.pack("!H", length)
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_HHLL, buf, offset, self.type, 0, self.experimenter, self.subtype)
+        offset = loxi.generic_util.pack_bytes_into(self.experimenter_data, buf, offset)
+        length = offset - start
+        _struct_H.pack_into(buf, start + 2, length)
+        return offset
+
+    def wire_length(self):
+        return 12 + len(self.experimenter_data)
 
     @staticmethod
     def unpack(reader):
@@ -3232,14 +3206,12 @@ class table_feature_prop_experimenter_miss(table_feature_prop):
             return subclass.unpack(reader)
 
         obj = table_feature_prop_experimenter_miss()
-        _type = reader.read("!H")[0]
+        _type, _length = reader.read_struct(_struct_HH)
         assert(_type == 65535)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.experimenter = reader.read("!L")[0]
-        obj.subtype = reader.read("!L")[0]
-        obj.experimenter_data = str(reader.read_all())
+        obj.experimenter, obj.subtype = reader.read_struct(_struct_LL)
+        obj.experimenter_data = reader.read_all()
         return obj
 
     def __eq__(self, other):
@@ -3265,6 +3237,7 @@ class table_feature_prop_experimenter_miss(table_feature_prop):
 table_feature_prop.subtypes[65535] = table_feature_prop_experimenter_miss
 
 class table_feature_prop_instructions(table_feature_prop):
+    __slots__ = ["instruction_ids"]
     type = 0
 
     def __init__(self, instruction_ids=None):
@@ -3274,21 +3247,22 @@ class table_feature_prop_instructions(table_feature_prop):
             self.instruction_ids = []
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!H", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
-        packed.append(loxi.generic_util.pack_list(self.instruction_ids))
-        length = sum([len(x) for x in packed])
-        packed[1] = struct.pack("!H", length)
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_HH, buf, offset, self.type, 0)
+        offset = loxi.generic_util.pack_list_into(self.instruction_ids, buf, offset)
+        length = offset - start
+        _struct_H.pack_into(buf, start + 2, length)
+        return offset
+
+    def wire_length(self):
+        return 4 + loxi.generic_util.list_wire_length(self.instruction_ids)
 
     @staticmethod
     def unpack(reader):
         obj = table_feature_prop_instructions()
-        _type = reader.read("!H")[0]
+        _type, _length = reader.read_struct(_struct_HH)
         assert(_type == 0)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
         obj.instruction_ids = loxi.generic_util.unpack_list(reader, ofp.instruction_id.instruction_id.unpack)
@@ -3312,6 +3286,7 @@ class table_feature_prop_instructions(table_feature_prop):
 table_feature_prop.subtypes[0] = table_feature_prop_instructions
 
 class table_feature_prop_instructions_miss(table_feature_prop):
+    __slots__ = ["instruction_ids"]
     type = 1
 
     def __init__(self, instruction_ids=None):
@@ -3321,21 +3296,22 @@ class table_feature_prop_instructions_miss(table_feature_prop):
             self.instruction_ids = []
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!H", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
-        packed.append(loxi.generic_util.pack_list(self.instruction_ids))
-        length = sum([len(x) for x in packed])
-        packed[1] = struct.pack("!H", length)
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_HH, buf, offset, self.type, 0)
+        offset = loxi.generic_util.pack_list_into(self.instruction_ids, buf, offset)
+        length = offset - start
+        _struct_H.pack_into(buf, start + 2, length)
+        return offset
+
+    def wire_length(self):
+        return 4 + loxi.generic_util.list_wire_length(self.instruction_ids)
 
     @staticmethod
     def unpack(reader):
         obj = table_feature_prop_instructions_miss()
-        _type = reader.read("!H")[0]
+        _type, _length = reader.read_struct(_struct_HH)
         assert(_type == 1)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
         obj.instruction_ids = loxi.generic_util.unpack_list(reader, ofp.instruction_id.instruction_id.unpack)
@@ -3359,6 +3335,7 @@ class table_feature_prop_instructions_miss(table_feature_prop):
 table_feature_prop.subtypes[1] = table_feature_prop_instructions_miss
 
 class table_feature_prop_match(table_feature_prop):
+    __slots__ = ["oxm_ids"]
     type = 8
 
     def __init__(self, oxm_ids=None):
@@ -3368,21 +3345,22 @@ class table_feature_prop_match(table_feature_prop):
             self.oxm_ids = []
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!H", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
-        packed.append(loxi.generic_util.pack_list(self.oxm_ids))
-        length = sum([len(x) for x in packed])
-        packed[1] = struct.pack("!H", length)
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_HH, buf, offset, self.type, 0)
+        offset = loxi.generic_util.pack_list_into(self.oxm_ids, buf, offset)
+        length = offset - start
+        _struct_H.pack_into(buf, start + 2, length)
+        return offset
+
+    def wire_length(self):
+        return 4 + loxi.generic_util.list_wire_length(self.oxm_ids)
 
     @staticmethod
     def unpack(reader):
         obj = table_feature_prop_match()
-        _type = reader.read("!H")[0]
+        _type, _length = reader.read_struct(_struct_HH)
         assert(_type == 8)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
         obj.oxm_ids = loxi.generic_util.unpack_list(reader, ofp.common.uint32.unpack)
@@ -3406,6 +3384,7 @@ class table_feature_prop_match(table_feature_prop):
 table_feature_prop.subtypes[8] = table_feature_prop_match
 
 class table_feature_prop_next_tables(table_feature_prop):
+    __slots__ = ["next_table_ids"]
     type = 2
 
     def __init__(self, next_table_ids=None):
@@ -3415,21 +3394,22 @@ class table_feature_prop_next_tables(table_feature_prop):
             self.next_table_ids = []
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!H", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
-        packed.append(loxi.generic_util.pack_list(self.next_table_ids))
-        length = sum([len(x) for x in packed])
-        packed[1] = struct.pack("!H", length)
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_HH, buf, offset, self.type, 0)
+        offset = loxi.generic_util.pack_list_into(self.next_table_ids, buf, offset)
+        length = offset - start
+        _struct_H.pack_into(buf, start + 2, length)
+        return offset
+
+    def wire_length(self):
+        return 4 + loxi.generic_util.list_wire_length(self.next_table_ids)
 
     @staticmethod
     def unpack(reader):
         obj = table_feature_prop_next_tables()
-        _type = reader.read("!H")[0]
+        _type, _length = reader.read_struct(_struct_HH)
         assert(_type == 2)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
         obj.next_table_ids = loxi.generic_util.unpack_list(reader, ofp.common.uint8.unpack)
@@ -3453,6 +3433,7 @@ class table_feature_prop_next_tables(table_feature_prop):
 table_feature_prop.subtypes[2] = table_feature_prop_next_tables
 
 class table_feature_prop_next_tables_miss(table_feature_prop):
+    __slots__ = ["next_table_ids"]
     type = 3
 
     def __init__(self, next_table_ids=None):
@@ -3462,21 +3443,22 @@ class table_feature_prop_next_tables_miss(table_feature_prop):
             self.next_table_ids = []
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!H", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
-        packed.append(loxi.generic_util.pack_list(self.next_table_ids))
-        length = sum([len(x) for x in packed])
-        packed[1] = struct.pack("!H", length)
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_HH, buf, offset, self.type, 0)
+        offset = loxi.generic_util.pack_list_into(self.next_table_ids, buf, offset)
+        length = offset - start
+        _struct_H.pack_into(buf, start + 2, length)
+        return offset
+
+    def wire_length(self):
+        return 4 + loxi.generic_util.list_wire_length(self.next_table_ids)
 
     @staticmethod
     def unpack(reader):
         obj = table_feature_prop_next_tables_miss()
-        _type = reader.read("!H")[0]
+        _type, _length = reader.read_struct(_struct_HH)
         assert(_type == 3)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
         obj.next_table_ids = loxi.generic_util.unpack_list(reader, ofp.common.uint8.unpack)
@@ -3500,6 +3482,7 @@ class table_feature_prop_next_tables_miss(table_feature_prop):
 table_feature_prop.subtypes[3] = table_feature_prop_next_tables_miss
 
 class table_feature_prop_wildcards(table_feature_prop):
+    __slots__ = ["oxm_ids"]
     type = 10
 
     def __init__(self, oxm_ids=None):
@@ -3509,21 +3492,22 @@ class table_feature_prop_wildcards(table_feature_prop):
             self.oxm_ids = []
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!H", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
-        packed.append(loxi.generic_util.pack_list(self.oxm_ids))
-        length = sum([len(x) for x in packed])
-        packed[1] = struct.pack("!H", length)
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_HH, buf, offset, self.type, 0)
+        offset = loxi.generic_util.pack_list_into(self.oxm_ids, buf, offset)
+        length = offset - start
+        _struct_H.pack_into(buf, start + 2, length)
+        return offset
+
+    def wire_length(self):
+        return 4 + loxi.generic_util.list_wire_length(self.oxm_ids)
 
     @staticmethod
     def unpack(reader):
         obj = table_feature_prop_wildcards()
-        _type = reader.read("!H")[0]
+        _type, _length = reader.read_struct(_struct_HH)
         assert(_type == 10)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
         obj.oxm_ids = loxi.generic_util.unpack_list(reader, ofp.common.uint32.unpack)
@@ -3547,6 +3531,7 @@ class table_feature_prop_wildcards(table_feature_prop):
 table_feature_prop.subtypes[10] = table_feature_prop_wildcards
 
 class table_feature_prop_write_actions(table_feature_prop):
+    __slots__ = ["action_ids"]
     type = 4
 
     def __init__(self, action_ids=None):
@@ -3556,21 +3541,22 @@ class table_feature_prop_write_actions(table_feature_prop):
             self.action_ids = []
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!H", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
-        packed.append(loxi.generic_util.pack_list(self.action_ids))
-        length = sum([len(x) for x in packed])
-        packed[1] = struct.pack("!H", length)
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_HH, buf, offset, self.type, 0)
+        offset = loxi.generic_util.pack_list_into(self.action_ids, buf, offset)
+        length = offset - start
+        _struct_H.pack_into(buf, start + 2, length)
+        return offset
+
+    def wire_length(self):
+        return 4 + loxi.generic_util.list_wire_length(self.action_ids)
 
     @staticmethod
     def unpack(reader):
         obj = table_feature_prop_write_actions()
-        _type = reader.read("!H")[0]
+        _type, _length = reader.read_struct(_struct_HH)
         assert(_type == 4)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
         obj.action_ids = loxi.generic_util.unpack_list(reader, ofp.action_id.action_id.unpack)
@@ -3594,6 +3580,7 @@ class table_feature_prop_write_actions(table_feature_prop):
 table_feature_prop.subtypes[4] = table_feature_prop_write_actions
 
 class table_feature_prop_write_actions_miss(table_feature_prop):
+    __slots__ = ["action_ids"]
     type = 5
 
     def __init__(self, action_ids=None):
@@ -3603,21 +3590,22 @@ class table_feature_prop_write_actions_miss(table_feature_prop):
             self.action_ids = []
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!H", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
-        packed.append(loxi.generic_util.pack_list(self.action_ids))
-        length = sum([len(x) for x in packed])
-        packed[1] = struct.pack("!H", length)
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_HH, buf, offset, self.type, 0)
+        offset = loxi.generic_util.pack_list_into(self.action_ids, buf, offset)
+        length = offset - start
+        _struct_H.pack_into(buf, start + 2, length)
+        return offset
+
+    def wire_length(self):
+        return 4 + loxi.generic_util.list_wire_length(self.action_ids)
 
     @staticmethod
     def unpack(reader):
         obj = table_feature_prop_write_actions_miss()
-        _type = reader.read("!H")[0]
+        _type, _length = reader.read_struct(_struct_HH)
         assert(_type == 5)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
         obj.action_ids = loxi.generic_util.unpack_list(reader, ofp.action_id.action_id.unpack)
@@ -3641,6 +3629,7 @@ class table_feature_prop_write_actions_miss(table_feature_prop):
 table_feature_prop.subtypes[5] = table_feature_prop_write_actions_miss
 
 class table_feature_prop_write_setfield(table_feature_prop):
+    __slots__ = ["oxm_ids"]
     type = 12
 
     def __init__(self, oxm_ids=None):
@@ -3650,21 +3639,22 @@ class table_feature_prop_write_setfield(table_feature_prop):
             self.oxm_ids = []
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!H", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
-        packed.append(loxi.generic_util.pack_list(self.oxm_ids))
-        length = sum([len(x) for x in packed])
-        packed[1] = struct.pack("!H", length)
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_HH, buf, offset, self.type, 0)
+        offset = loxi.generic_util.pack_list_into(self.oxm_ids, buf, offset)
+        length = offset - start
+        _struct_H.pack_into(buf, start + 2, length)
+        return offset
+
+    def wire_length(self):
+        return 4 + loxi.generic_util.list_wire_length(self.oxm_ids)
 
     @staticmethod
     def unpack(reader):
         obj = table_feature_prop_write_setfield()
-        _type = reader.read("!H")[0]
+        _type, _length = reader.read_struct(_struct_HH)
         assert(_type == 12)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
         obj.oxm_ids = loxi.generic_util.unpack_list(reader, ofp.common.uint32.unpack)
@@ -3688,6 +3678,7 @@ class table_feature_prop_write_setfield(table_feature_prop):
 table_feature_prop.subtypes[12] = table_feature_prop_write_setfield
 
 class table_feature_prop_write_setfield_miss(table_feature_prop):
+    __slots__ = ["oxm_ids"]
     type = 13
 
     def __init__(self, oxm_ids=None):
@@ -3697,21 +3688,22 @@ class table_feature_prop_write_setfield_miss(table_feature_prop):
             self.oxm_ids = []
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!H", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
-        packed.append(loxi.generic_util.pack_list(self.oxm_ids))
-        length = sum([len(x) for x in packed])
-        packed[1] = struct.pack("!H", length)
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_HH, buf, offset, self.type, 0)
+        offset = loxi.generic_util.pack_list_into(self.oxm_ids, buf, offset)
+        length = offset - start
+        _struct_H.pack_into(buf, start + 2, length)
+        return offset
+
+    def wire_length(self):
+        return 4 + loxi.generic_util.list_wire_length(self.oxm_ids)
 
     @staticmethod
     def unpack(reader):
         obj = table_feature_prop_write_setfield_miss()
-        _type = reader.read("!H")[0]
+        _type, _length = reader.read_struct(_struct_HH)
         assert(_type == 13)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
         obj.oxm_ids = loxi.generic_util.unpack_list(reader, ofp.common.uint32.unpack)
@@ -3735,6 +3727,7 @@ class table_feature_prop_write_setfield_miss(table_feature_prop):
 table_feature_prop.subtypes[13] = table_feature_prop_write_setfield_miss
 
 class table_features(loxi.OFObject):
+    __slots__ = ["config", "max_entries", "metadata_match", "metadata_write", "name", "properties", "table_id"]
 
     def __init__(self, table_id=None, name=None, metadata_match=None, metadata_write=None, config=None, max_entries=None, properties=None):
         if table_id != None:
@@ -3767,20 +3760,16 @@ class table_features(loxi.OFObject):
             self.properties = []
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 0
-        packed.append(struct.pack("!B", self.table_id))
-        packed.append('\x00' * 5)
-        packed.append(struct.pack("!32s", self.name))
-        packed.append(struct.pack("!Q", self.metadata_match))
-        packed.append(struct.pack("!Q", self.metadata_write))
-        packed.append(struct.pack("!L", self.config))
-        packed.append(struct.pack("!L", self.max_entries))
-        packed.append(loxi.generic_util.pack_list(self.properties))
-        length = sum([len(x) for x in packed])
-        packed[0] = struct.pack("!H", length)
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_HB5x32sQQLL, buf, offset, 0, self.table_id, self.name, self.metadata_match, self.metadata_write, self.config, self.max_entries)
+        offset = loxi.generic_util.pack_list_into(self.properties, buf, offset)
+        length = offset - start
+        _struct_H.pack_into(buf, start + 0, length)
+        return offset
+
+    def wire_length(self):
+        return 64 + loxi.generic_util.list_wire_length(self.properties)
 
     @staticmethod
     def unpack(reader):
@@ -3788,13 +3777,8 @@ class table_features(loxi.OFObject):
         _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 2)
-        obj.table_id = reader.read("!B")[0]
-        reader.skip(5)
-        obj.name = reader.read("!32s")[0].rstrip("\x00")
-        obj.metadata_match = reader.read("!Q")[0]
-        obj.metadata_write = reader.read("!Q")[0]
-        obj.config = reader.read("!L")[0]
-        obj.max_entries = reader.read("!L")[0]
+        obj.table_id, obj.name, obj.metadata_match, obj.metadata_write, obj.config, obj.max_entries = reader.read_struct(_struct_B5x32sQQLL)
+        obj.name = obj.name.rstrip("\x00")
         obj.properties = loxi.generic_util.unpack_list(reader, ofp.common.table_feature_prop.unpack)
         return obj
 
@@ -3839,6 +3823,7 @@ class table_features(loxi.OFObject):
 
 
 class table_stats_entry(loxi.OFObject):
+    __slots__ = ["active_count", "lookup_count", "matched_count", "table_id"]
 
     def __init__(self, table_id=None, active_count=None, lookup_count=None, matched_count=None):
         if table_id != None:
@@ -3859,23 +3844,18 @@ class table_stats_entry(loxi.OFObject):
             self.matched_count = 0
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!B", self.table_id))
-        packed.append('\x00' * 3)
-        packed.append(struct.pack("!L", self.active_count))
-        packed.append(struct.pack("!Q", self.lookup_count))
-        packed.append(struct.pack("!Q", self.matched_count))
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_B3xLQQ, buf, offset, self.table_id, self.active_count, self.lookup_count, self.matched_count)
+        return offset
+
+    def wire_length(self):
+        return 24
 
     @staticmethod
     def unpack(reader):
         obj = table_stats_entry()
-        obj.table_id = reader.read("!B")[0]
-        reader.skip(3)
-        obj.active_count = reader.read("!L")[0]
-        obj.lookup_count = reader.read("!Q")[0]
-        obj.matched_count = reader.read("!Q")[0]
+        obj.table_id, obj.active_count, obj.lookup_count, obj.matched_count = reader.read_struct(_struct_B3xLQQ)
         return obj
 
     def __eq__(self, other):
@@ -3907,6 +3887,7 @@ class table_stats_entry(loxi.OFObject):
 
 
 class uint32(loxi.OFObject):
+    __slots__ = ["value"]
 
     def __init__(self, value=None):
         if value != None:
@@ -3915,10 +3896,13 @@ class uint32(loxi.OFObject):
             self.value = 0
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!L", self.value))
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_L, buf, offset, self.value)
+        return offset
+
+    def wire_length(self):
+        return 4
 
     @staticmethod
     def unpack(reader):
@@ -3943,6 +3927,7 @@ class uint32(loxi.OFObject):
 
 
 class uint64(loxi.OFObject):
+    __slots__ = ["value"]
 
     def __init__(self, value=None):
         if value != None:
@@ -3951,10 +3936,13 @@ class uint64(loxi.OFObject):
             self.value = 0
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!Q", self.value))
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_Q, buf, offset, self.value)
+        return offset
+
+    def wire_length(self):
+        return 8
 
     @staticmethod
     def unpack(reader):
@@ -3979,6 +3967,7 @@ class uint64(loxi.OFObject):
 
 
 class uint8(loxi.OFObject):
+    __slots__ = ["value"]
 
     def __init__(self, value=None):
         if value != None:
@@ -3987,10 +3976,13 @@ class uint8(loxi.OFObject):
             self.value = 0
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!B", self.value))
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_B, buf, offset, self.value)
+        return offset
+
+    def wire_length(self):
+        return 1
 
     @staticmethod
     def unpack(reader):
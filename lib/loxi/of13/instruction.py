@@ -14,7 +14,21 @@ import loxi.generic_util
 import sys
 ofp = sys.modules['loxi.of13']
 
+# Precompiled layouts for the fixed-length parts of each pack_into() and unpack()
+_struct_H = struct.Struct("!H")
+_struct_HH = struct.Struct("!HH")
+_struct_HH4x = struct.Struct("!HH4x")
+_struct_HH4xQQ = struct.Struct("!HH4xQQ")
+_struct_HHB3x = struct.Struct("!HHB3x")
+_struct_HHL = struct.Struct("!HHL")
+_struct_HHLL4x = struct.Struct("!HHLL4x")
+_struct_HHLLL = struct.Struct("!HHLLL")
+_struct_LL4x = struct.Struct("!LL4x")
+_struct_LLL = struct.Struct("!LLL")
+_struct_QQ = struct.Struct("!QQ")
+
 class instruction(loxi.OFObject):
+    __slots__ = ["type"]
     subtypes = {}
 
 
@@ -25,13 +39,15 @@ class instruction(loxi.OFObject):
             self.type = 0
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!H", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for len at index 1
-        length = sum([len(x) for x in packed])
-        packed[1] = struct.pack("!H", length)
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_HH, buf, offset, self.type, 0)
+        length = offset - start
+        _struct_H.pack_into(buf, start + 2, length)
+        return offset
+
+    def wire_length(self):
+        return 4
 
     @staticmethod
     def unpack(reader):
@@ -41,8 +57,7 @@ class instruction(loxi.OFObject):
             return subclass.unpack(reader)
 
         obj = instruction()
-        obj.type = reader.read("!H")[0]
-        _len = reader.read("!H")[0]
+        obj.type, _len = reader.read_struct(_struct_HH)
         orig_reader = reader
         reader = orig_reader.slice(_len, 4)
         return obj
@@ -62,6 +77,7 @@ class instruction(loxi.OFObject):
 
 
 class apply_actions(instruction):
+    __slots__ = ["actions"]
 
     def __init__(self, actions=None, type=None):
         if actions != None:
@@ -74,22 +90,22 @@ class apply_actions(instruction):
 	    self.type = 4
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!H", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for len at index 1
-        packed.append('\x00' * 4)
-        packed.append(loxi.generic_util.pack_list(self.actions))
-        length = sum([len(x) for x in packed])
-        packed[1] = struct.pack("!H", length)
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_HH4x, buf, offset, self.type, 0)
+        offset = loxi.generic_util.pack_list_into(self.actions, buf, offset)
+        length = offset - start
+        _struct_H.pack_into(buf, start + 2, length)
+        return offset
+
+    def wire_length(self):
+        return 8 + loxi.generic_util.list_wire_length(self.actions)
 
     @staticmethod
     def unpack(reader):
         obj = apply_actions()
-        _type = reader.read("!H")[0]
+        _type, _len = reader.read_struct(_struct_HH)
         assert(_type == 4)
-        _len = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_len, 4)
         reader.skip(4)
@@ -114,6 +130,7 @@ class apply_actions(instruction):
 instruction.subtypes[4] = apply_actions
 
 class experimenter(instruction):
+    __slots__ = ["data", "experimenter"]
     subtypes = {}
 
     type = 65535
@@ -129,15 +146,16 @@ class experimenter(instruction):
             self.data = ''
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!H", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for len at index 1
-        packed.append(struct.pack("!L", self.experimenter))
-        packed.append(self.data)
-        length = sum([len(x) for x in packed])
-        packed[1] = struct.pack("!H", length)
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_HHL, buf, offset, self.type, 0, self.experimenter)
+        offset = loxi.generic_util.pack_bytes_into(self.data, buf, offset)
+        length = offset - start
+        _struct_H.pack_into(buf, start + 2, length)
+        return offset
+
+    def wire_length(self):
+        return 8 + len(self.data)
 
     @staticmethod
     def unpack(reader):
@@ -147,13 +165,12 @@ class experimenter(instruction):
             return subclass.unpack(reader)
 
         obj = experimenter()
-        _type = reader.read("!H")[0]
+        _type, _len = reader.read_struct(_struct_HH)
         assert(_type == 65535)
-        _len = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_len, 4)
         obj.experimenter = reader.read("!L")[0]
-        obj.data = str(reader.read_all())
+        obj.data = reader.read_all()
         return obj
 
     def __eq__(self, other):
@@ -175,6 +192,7 @@ class experimenter(instruction):
 instruction.subtypes[65535] = experimenter
 
 class bsn(experimenter):
+    __slots__ = ["subtype"]
     subtypes = {}
 
     type = 65535
@@ -187,16 +205,15 @@ class bsn(experimenter):
             self.subtype = 0
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!H", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for len at index 1
-        packed.append(struct.pack("!L", self.experimenter))
-        packed.append(struct.pack("!L", self.subtype))
-        packed.append('\x00' * 4)
-        length = sum([len(x) for x in packed])
-        packed[1] = struct.pack("!H", length)
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_HHLL4x, buf, offset, self.type, 0, self.experimenter, self.subtype)
+        length = offset - start
+        _struct_H.pack_into(buf, start + 2, length)
+        return offset
+
+    def wire_length(self):
+        return 16
 
     @staticmethod
     def unpack(reader):
@@ -206,15 +223,12 @@ class bsn(experimenter):
             return subclass.unpack(reader)
 
         obj = bsn()
-        _type = reader.read("!H")[0]
+        _type, _len = reader.read_struct(_struct_HH)
         assert(_type == 65535)
-        _len = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_len, 4)
-        _experimenter = reader.read("!L")[0]
+        _experimenter, obj.subtype = reader.read_struct(_struct_LL4x)
         assert(_experimenter == 6035143)
-        obj.subtype = reader.read("!L")[0]
-        reader.skip(4)
         return obj
 
     def __eq__(self, other):
@@ -233,6 +247,7 @@ class bsn(experimenter):
 experimenter.subtypes[6035143] = bsn
 
 class bsn_arp_offload(bsn):
+    __slots__ = []
     type = 65535
     experimenter = 6035143
     subtype = 1
@@ -240,30 +255,26 @@ class bsn_arp_offload(bsn):
     def __init__(self):
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!H", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for len at index 1
-        packed.append(struct.pack("!L", self.experimenter))
-        packed.append(struct.pack("!L", self.subtype))
-        packed.append('\x00' * 4)
-        length = sum([len(x) for x in packed])
-        packed[1] = struct.pack("!H", length)
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_HHLL4x, buf, offset, self.type, 0, self.experimenter, self.subtype)
+        length = offset - start
+        _struct_H.pack_into(buf, start + 2, length)
+        return offset
+
+    def wire_length(self):
+        return 16
 
     @staticmethod
     def unpack(reader):
         obj = bsn_arp_offload()
-        _type = reader.read("!H")[0]
+        _type, _len = reader.read_struct(_struct_HH)
         assert(_type == 65535)
-        _len = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_len, 4)
-        _experimenter = reader.read("!L")[0]
+        _experimenter, _subtype = reader.read_struct(_struct_LL4x)
         assert(_experimenter == 6035143)
-        _subtype = reader.read("!L")[0]
         assert(_subtype == 1)
-        reader.skip(4)
         return obj
 
     def __eq__(self, other):
@@ -281,6 +292,7 @@ class bsn_arp_offload(bsn):
 bsn.subtypes[1] = bsn_arp_offload
 
 class bsn_auto_negotiation(bsn):
+    __slots__ = []
     type = 65535
     experimenter = 6035143
     subtype = 11
@@ -288,30 +300,26 @@ class bsn_auto_negotiation(bsn):
     def __init__(self):
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!H", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for len at index 1
-        packed.append(struct.pack("!L", self.experimenter))
-        packed.append(struct.pack("!L", self.subtype))
-        packed.append('\x00' * 4)
-        length = sum([len(x) for x in packed])
-        packed[1] = struct.pack("!H", length)
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_HHLL4x, buf, offset, self.type, 0, self.experimenter, self.subtype)
+        length = offset - start
+        _struct_H.pack_into(buf, start + 2, length)
+        return offset
+
+    def wire_length(self):
+        return 16
 
     @staticmethod
     def unpack(reader):
         obj = bsn_auto_negotiation()
-        _type = reader.read("!H")[0]
+        _type, _len = reader.read_struct(_struct_HH)
         assert(_type == 65535)
-        _len = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_len, 4)
-        _experimenter = reader.read("!L")[0]
+        _experimenter, _subtype = reader.read_struct(_struct_LL4x)
         assert(_experimenter == 6035143)
-        _subtype = reader.read("!L")[0]
         assert(_subtype == 11)
-        reader.skip(4)
         return obj
 
     def __eq__(self, other):
@@ -329,6 +337,7 @@ class bsn_auto_negotiation(bsn):
 bsn.subtypes[11] = bsn_auto_negotiation
 
 class bsn_deny(bsn):
+    __slots__ = []
     type = 65535
     experimenter = 6035143
     subtype = 5
@@ -336,30 +345,26 @@ class bsn_deny(bsn):
     def __init__(self):
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!H", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for len at index 1
-        packed.append(struct.pack("!L", self.experimenter))
-        packed.append(struct.pack("!L", self.subtype))
-        packed.append('\x00' * 4)
-        length = sum([len(x) for x in packed])
-        packed[1] = struct.pack("!H", length)
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_HHLL4x, buf, offset, self.type, 0, self.experimenter, self.subtype)
+        length = offset - start
+        _struct_H.pack_into(buf, start + 2, length)
+        return offset
+
+    def wire_length(self):
+        return 16
 
     @staticmethod
     def unpack(reader):
         obj = bsn_deny()
-        _type = reader.read("!H")[0]
+        _type, _len = reader.read_struct(_struct_HH)
         assert(_type == 65535)
-        _len = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_len, 4)
-        _experimenter = reader.read("!L")[0]
+        _experimenter, _subtype = reader.read_struct(_struct_LL4x)
         assert(_experimenter == 6035143)
-        _subtype = reader.read("!L")[0]
         assert(_subtype == 5)
-        reader.skip(4)
         return obj
 
     def __eq__(self, other):
@@ -377,6 +382,7 @@ class bsn_deny(bsn):
 bsn.subtypes[5] = bsn_deny
 
 class bsn_dhcp_offload(bsn):
+    __slots__ = []
     type = 65535
     experimenter = 6035143
     subtype = 2
@@ -384,30 +390,26 @@ class bsn_dhcp_offload(bsn):
     def __init__(self):
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!H", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for len at index 1
-        packed.append(struct.pack("!L", self.experimenter))
-        packed.append(struct.pack("!L", self.subtype))
-        packed.append('\x00' * 4)
-        length = sum([len(x) for x in packed])
-        packed[1] = struct.pack("!H", length)
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_HHLL4x, buf, offset, self.type, 0, self.experimenter, self.subtype)
+        length = offset - start
+        _struct_H.pack_into(buf, start + 2, length)
+        return offset
+
+    def wire_length(self):
+        return 16
 
     @staticmethod
     def unpack(reader):
         obj = bsn_dhcp_offload()
-        _type = reader.read("!H")[0]
+        _type, _len = reader.read_struct(_struct_HH)
         assert(_type == 65535)
-        _len = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_len, 4)
-        _experimenter = reader.read("!L")[0]
+        _experimenter, _subtype = reader.read_struct(_struct_LL4x)
         assert(_experimenter == 6035143)
-        _subtype = reader.read("!L")[0]
         assert(_subtype == 2)
-        reader.skip(4)
         return obj
 
     def __eq__(self, other):
@@ -425,6 +427,7 @@ class bsn_dhcp_offload(bsn):
 bsn.subtypes[2] = bsn_dhcp_offload
 
 class bsn_disable_l3(bsn):
+    __slots__ = []
     type = 65535
     experimenter = 6035143
     subtype = 13
@@ -432,30 +435,26 @@ class bsn_disable_l3(bsn):
     def __init__(self):
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!H", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for len at index 1
-        packed.append(struct.pack("!L", self.experimenter))
-        packed.append(struct.pack("!L", self.subtype))
-        packed.append('\x00' * 4)
-        length = sum([len(x) for x in packed])
-        packed[1] = struct.pack("!H", length)
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_HHLL4x, buf, offset, self.type, 0, self.experimenter, self.subtype)
+        length = offset - start
+        _struct_H.pack_into(buf, start + 2, length)
+        return offset
+
+    def wire_length(self):
+        return 16
 
     @staticmethod
     def unpack(reader):
         obj = bsn_disable_l3()
-        _type = reader.read("!H")[0]
+        _type, _len = reader.read_struct(_struct_HH)
         assert(_type == 65535)
-        _len = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_len, 4)
-        _experimenter = reader.read("!L")[0]
+        _experimenter, _subtype = reader.read_struct(_struct_LL4x)
         assert(_experimenter == 6035143)
-        _subtype = reader.read("!L")[0]
         assert(_subtype == 13)
-        reader.skip(4)
         return obj
 
     def __eq__(self, other):
@@ -473,6 +472,7 @@ class bsn_disable_l3(bsn):
 bsn.subtypes[13] = bsn_disable_l3
 
 class bsn_disable_split_horizon_check(bsn):
+    __slots__ = []
     type = 65535
     experimenter = 6035143
     subtype = 3
@@ -480,30 +480,26 @@ class bsn_disable_split_horizon_check(bsn):
     def __init__(self):
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!H", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for len at index 1
-        packed.append(struct.pack("!L", self.experimenter))
-        packed.append(struct.pack("!L", self.subtype))
-        packed.append('\x00' * 4)
-        length = sum([len(x) for x in packed])
-        packed[1] = struct.pack("!H", length)
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_HHLL4x, buf, offset, self.type, 0, self.experimenter, self.subtype)
+        length = offset - start
+        _struct_H.pack_into(buf, start + 2, length)
+        return offset
+
+    def wire_length(self):
+        return 16
 
     @staticmethod
     def unpack(reader):
         obj = bsn_disable_split_horizon_check()
-        _type = reader.read("!H")[0]
+        _type, _len = reader.read_struct(_struct_HH)
         assert(_type == 65535)
-        _len = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_len, 4)
-        _experimenter = reader.read("!L")[0]
+        _experimenter, _subtype = reader.read_struct(_struct_LL4x)
         assert(_experimenter == 6035143)
-        _subtype = reader.read("!L")[0]
         assert(_subtype == 3)
-        reader.skip(4)
         return obj
 
     def __eq__(self, other):
@@ -521,6 +517,7 @@ class bsn_disable_split_horizon_check(bsn):
 bsn.subtypes[3] = bsn_disable_split_horizon_check
 
 class bsn_disable_src_mac_check(bsn):
+    __slots__ = []
     type = 65535
     experimenter = 6035143
     subtype = 0
@@ -528,30 +525,26 @@ class bsn_disable_src_mac_check(bsn):
     def __init__(self):
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!H", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for len at index 1
-        packed.append(struct.pack("!L", self.experimenter))
-        packed.append(struct.pack("!L", self.subtype))
-        packed.append('\x00' * 4)
-        length = sum([len(x) for x in packed])
-        packed[1] = struct.pack("!H", length)
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_HHLL4x, buf, offset, self.type, 0, self.experimenter, self.subtype)
+        length = offset - start
+        _struct_H.pack_into(buf, start + 2, length)
+        return offset
+
+    def wire_length(self):
+        return 16
 
     @staticmethod
     def unpack(reader):
         obj = bsn_disable_src_mac_check()
-        _type = reader.read("!H")[0]
+        _type, _len = reader.read_struct(_struct_HH)
         assert(_type == 65535)
-        _len = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_len, 4)
-        _experimenter = reader.read("!L")[0]
+        _experimenter, _subtype = reader.read_struct(_struct_LL4x)
         assert(_experimenter == 6035143)
-        _subtype = reader.read("!L")[0]
         assert(_subtype == 0)
-        reader.skip(4)
         return obj
 
     def __eq__(self, other):
@@ -569,6 +562,7 @@ class bsn_disable_src_mac_check(bsn):
 bsn.subtypes[0] = bsn_disable_src_mac_check
 
 class bsn_disable_vlan_counters(bsn):
+    __slots__ = []
     type = 65535
     experimenter = 6035143
     subtype = 9
@@ -576,30 +570,26 @@ class bsn_disable_vlan_counters(bsn):
     def __init__(self):
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!H", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for len at index 1
-        packed.append(struct.pack("!L", self.experimenter))
-        packed.append(struct.pack("!L", self.subtype))
-        packed.append('\x00' * 4)
-        length = sum([len(x) for x in packed])
-        packed[1] = struct.pack("!H", length)
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_HHLL4x, buf, offset, self.type, 0, self.experimenter, self.subtype)
+        length = offset - start
+        _struct_H.pack_into(buf, start + 2, length)
+        return offset
+
+    def wire_length(self):
+        return 16
 
     @staticmethod
     def unpack(reader):
         obj = bsn_disable_vlan_counters()
-        _type = reader.read("!H")[0]
+        _type, _len = reader.read_struct(_struct_HH)
         assert(_type == 65535)
-        _len = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_len, 4)
-        _experimenter = reader.read("!L")[0]
+        _experimenter, _subtype = reader.read_struct(_struct_LL4x)
         assert(_experimenter == 6035143)
-        _subtype = reader.read("!L")[0]
         assert(_subtype == 9)
-        reader.skip(4)
         return obj
 
     def __eq__(self, other):
@@ -617,6 +607,7 @@ class bsn_disable_vlan_counters(bsn):
 bsn.subtypes[9] = bsn_disable_vlan_counters
 
 class bsn_internal_priority(bsn):
+    __slots__ = ["value"]
     type = 65535
     experimenter = 6035143
     subtype = 12
@@ -628,30 +619,26 @@ class bsn_internal_priority(bsn):
             self.value = 0
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!H", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for len at index 1
-        packed.append(struct.pack("!L", self.experimenter))
-        packed.append(struct.pack("!L", self.subtype))
-        packed.append(struct.pack("!L", self.value))
-        length = sum([len(x) for x in packed])
-        packed[1] = struct.pack("!H", length)
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_HHLLL, buf, offset, self.type, 0, self.experimenter, self.subtype, self.value)
+        length = offset - start
+        _struct_H.pack_into(buf, start + 2, length)
+        return offset
+
+    def wire_length(self):
+        return 16
 
     @staticmethod
     def unpack(reader):
         obj = bsn_internal_priority()
-        _type = reader.read("!H")[0]
+        _type, _len = reader.read_struct(_struct_HH)
         assert(_type == 65535)
-        _len = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_len, 4)
-        _experimenter = reader.read("!L")[0]
+        _experimenter, _subtype, obj.value = reader.read_struct(_struct_LLL)
         assert(_experimenter == 6035143)
-        _subtype = reader.read("!L")[0]
         assert(_subtype == 12)
-        obj.value = reader.read("!L")[0]
         return obj
 
     def __eq__(self, other):
@@ -672,6 +659,7 @@ class bsn_internal_priority(bsn):
 bsn.subtypes[12] = bsn_internal_priority
 
 class bsn_packet_of_death(bsn):
+    __slots__ = []
     type = 65535
     experimenter = 6035143
     subtype = 6
@@ -679,30 +667,26 @@ class bsn_packet_of_death(bsn):
     def __init__(self):
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!H", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for len at index 1
-        packed.append(struct.pack("!L", self.experimenter))
-        packed.append(struct.pack("!L", self.subtype))
-        packed.append('\x00' * 4)
-        length = sum([len(x) for x in packed])
-        packed[1] = struct.pack("!H", length)
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_HHLL4x, buf, offset, self.type, 0, self.experimenter, self.subtype)
+        length = offset - start
+        _struct_H.pack_into(buf, start + 2, length)
+        return offset
+
+    def wire_length(self):
+        return 16
 
     @staticmethod
     def unpack(reader):
         obj = bsn_packet_of_death()
-        _type = reader.read("!H")[0]
+        _type, _len = reader.read_struct(_struct_HH)
         assert(_type == 65535)
-        _len = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_len, 4)
-        _experimenter = reader.read("!L")[0]
+        _experimenter, _subtype = reader.read_struct(_struct_LL4x)
         assert(_experimenter == 6035143)
-        _subtype = reader.read("!L")[0]
         assert(_subtype == 6)
-        reader.skip(4)
         return obj
 
     def __eq__(self, other):
@@ -720,6 +704,7 @@ class bsn_packet_of_death(bsn):
 bsn.subtypes[6] = bsn_packet_of_death
 
 class bsn_permit(bsn):
+    __slots__ = []
     type = 65535
     experimenter = 6035143
     subtype = 4
@@ -727,30 +712,26 @@ class bsn_permit(bsn):
     def __init__(self):
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!H", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for len at index 1
-        packed.append(struct.pack("!L", self.experimenter))
-        packed.append(struct.pack("!L", self.subtype))
-        packed.append('\x00' * 4)
-        length = sum([len(x) for x in packed])
-        packed[1] = struct.pack("!H", length)
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_HHLL4x, buf, offset, self.type, 0, self.experimenter, self.subtype)
+        length = offset - start
+        _struct_H.pack_into(buf, start + 2, length)
+        return offset
+
+    def wire_length(self):
+        return 16
 
     @staticmethod
     def unpack(reader):
         obj = bsn_permit()
-        _type = reader.read("!H")[0]
+        _type, _len = reader.read_struct(_struct_HH)
         assert(_type == 65535)
-        _len = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_len, 4)
-        _experimenter = reader.read("!L")[0]
+        _experimenter, _subtype = reader.read_struct(_struct_LL4x)
         assert(_experimenter == 6035143)
-        _subtype = reader.read("!L")[0]
         assert(_subtype == 4)
-        reader.skip(4)
         return obj
 
     def __eq__(self, other):
@@ -768,6 +749,7 @@ class bsn_permit(bsn):
 bsn.subtypes[4] = bsn_permit
 
 class bsn_prioritize_pdus(bsn):
+    __slots__ = []
     type = 65535
     experimenter = 6035143
     subtype = 7
@@ -775,30 +757,26 @@ class bsn_prioritize_pdus(bsn):
     def __init__(self):
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!H", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for len at index 1
-        packed.append(struct.pack("!L", self.experimenter))
-        packed.append(struct.pack("!L", self.subtype))
-        packed.append('\x00' * 4)
-        length = sum([len(x) for x in packed])
-        packed[1] = struct.pack("!H", length)
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_HHLL4x, buf, offset, self.type, 0, self.experimenter, self.subtype)
+        length = offset - start
+        _struct_H.pack_into(buf, start + 2, length)
+        return offset
+
+    def wire_length(self):
+        return 16
 
     @staticmethod
     def unpack(reader):
         obj = bsn_prioritize_pdus()
-        _type = reader.read("!H")[0]
+        _type, _len = reader.read_struct(_struct_HH)
         assert(_type == 65535)
-        _len = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_len, 4)
-        _experimenter = reader.read("!L")[0]
+        _experimenter, _subtype = reader.read_struct(_struct_LL4x)
         assert(_experimenter == 6035143)
-        _subtype = reader.read("!L")[0]
         assert(_subtype == 7)
-        reader.skip(4)
         return obj
 
     def __eq__(self, other):
@@ -816,6 +794,7 @@ class bsn_prioritize_pdus(bsn):
 bsn.subtypes[7] = bsn_prioritize_pdus
 
 class bsn_require_vlan_xlate(bsn):
+    __slots__ = []
     type = 65535
     experimenter = 6035143
     subtype = 8
@@ -823,30 +802,26 @@ class bsn_require_vlan_xlate(bsn):
     def __init__(self):
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!H", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for len at index 1
-        packed.append(struct.pack("!L", self.experimenter))
-        packed.append(struct.pack("!L", self.subtype))
-        packed.append('\x00' * 4)
-        length = sum([len(x) for x in packed])
-        packed[1] = struct.pack("!H", length)
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_HHLL4x, buf, offset, self.type, 0, self.experimenter, self.subtype)
+        length = offset - start
+        _struct_H.pack_into(buf, start + 2, length)
+        return offset
+
+    def wire_length(self):
+        return 16
 
     @staticmethod
     def unpack(reader):
         obj = bsn_require_vlan_xlate()
-        _type = reader.read("!H")[0]
+        _type, _len = reader.read_struct(_struct_HH)
         assert(_type == 65535)
-        _len = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_len, 4)
-        _experimenter = reader.read("!L")[0]
+        _experimenter, _subtype = reader.read_struct(_struct_LL4x)
         assert(_experimenter == 6035143)
-        _subtype = reader.read("!L")[0]
         assert(_subtype == 8)
-        reader.skip(4)
         return obj
 
     def __eq__(self, other):
@@ -864,6 +839,7 @@ class bsn_require_vlan_xlate(bsn):
 bsn.subtypes[8] = bsn_require_vlan_xlate
 
 class bsn_span_destination(bsn):
+    __slots__ = []
     type = 65535
     experimenter = 6035143
     subtype = 10
@@ -871,30 +847,26 @@ class bsn_span_destination(bsn):
     def __init__(self):
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!H", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for len at index 1
-        packed.append(struct.pack("!L", self.experimenter))
-        packed.append(struct.pack("!L", self.subtype))
-        packed.append('\x00' * 4)
-        length = sum([len(x) for x in packed])
-        packed[1] = struct.pack("!H", length)
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_HHLL4x, buf, offset, self.type, 0, self.experimenter, self.subtype)
+        length = offset - start
+        _struct_H.pack_into(buf, start + 2, length)
+        return offset
+
+    def wire_length(self):
+        return 16
 
     @staticmethod
     def unpack(reader):
         obj = bsn_span_destination()
-        _type = reader.read("!H")[0]
+        _type, _len = reader.read_struct(_struct_HH)
         assert(_type == 65535)
-        _len = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_len, 4)
-        _experimenter = reader.read("!L")[0]
+        _experimenter, _subtype = reader.read_struct(_struct_LL4x)
         assert(_experimenter == 6035143)
-        _subtype = reader.read("!L")[0]
         assert(_subtype == 10)
-        reader.skip(4)
         return obj
 
     def __eq__(self, other):
@@ -912,26 +884,27 @@ class bsn_span_destination(bsn):
 bsn.subtypes[10] = bsn_span_destination
 
 class clear_actions(instruction):
+    __slots__ = []
     type = 5
 
     def __init__(self):
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!H", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for len at index 1
-        packed.append('\x00' * 4)
-        length = sum([len(x) for x in packed])
-        packed[1] = struct.pack("!H", length)
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_HH4x, buf, offset, self.type, 0)
+        length = offset - start
+        _struct_H.pack_into(buf, start + 2, length)
+        return offset
+
+    def wire_length(self):
+        return 8
 
     @staticmethod
     def unpack(reader):
         obj = clear_actions()
-        _type = reader.read("!H")[0]
+        _type, _len = reader.read_struct(_struct_HH)
         assert(_type == 5)
-        _len = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_len, 4)
         reader.skip(4)
@@ -952,6 +925,7 @@ class clear_actions(instruction):
 instruction.subtypes[5] = clear_actions
 
 class goto_table(instruction):
+    __slots__ = ["table_id"]
     type = 1
 
     def __init__(self, table_id=None):
@@ -961,22 +935,21 @@ class goto_table(instruction):
             self.table_id = 0
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!H", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for len at index 1
-        packed.append(struct.pack("!B", self.table_id))
-        packed.append('\x00' * 3)
-        length = sum([len(x) for x in packed])
-        packed[1] = struct.pack("!H", length)
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_HHB3x, buf, offset, self.type, 0, self.table_id)
+        length = offset - start
+        _struct_H.pack_into(buf, start + 2, length)
+        return offset
+
+    def wire_length(self):
+        return 8
 
     @staticmethod
     def unpack(reader):
         obj = goto_table()
-        _type = reader.read("!H")[0]
+        _type, _len = reader.read_struct(_struct_HH)
         assert(_type == 1)
-        _len = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_len, 4)
         obj.table_id = reader.read("!B")[0]
@@ -1001,6 +974,7 @@ class goto_table(instruction):
 instruction.subtypes[1] = goto_table
 
 class meter(instruction):
+    __slots__ = ["meter_id"]
     type = 6
 
     def __init__(self, meter_id=None):
@@ -1010,21 +984,21 @@ class meter(instruction):
             self.meter_id = 0
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!H", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for len at index 1
-        packed.append(struct.pack("!L", self.meter_id))
-        length = sum([len(x) for x in packed])
-        packed[1] = struct.pack("!H", length)
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_HHL, buf, offset, self.type, 0, self.meter_id)
+        length = offset - start
+        _struct_H.pack_into(buf, start + 2, length)
+        return offset
+
+    def wire_length(self):
+        return 8
 
     @staticmethod
     def unpack(reader):
         obj = meter()
-        _type = reader.read("!H")[0]
+        _type, _len = reader.read_struct(_struct_HH)
         assert(_type == 6)
-        _len = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_len, 4)
         obj.meter_id = reader.read("!L")[0]
@@ -1048,6 +1022,7 @@ class meter(instruction):
 instruction.subtypes[6] = meter
 
 class write_actions(instruction):
+    __slots__ = ["actions"]
     type = 3
 
     def __init__(self, actions=None):
@@ -1057,22 +1032,22 @@ class write_actions(instruction):
             self.actions = []
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!H", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for len at index 1
-        packed.append('\x00' * 4)
-        packed.append(loxi.generic_util.pack_list(self.actions))
-        length = sum([len(x) for x in packed])
-        packed[1] = struct.pack("!H", length)
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_HH4x, buf, offset, self.type, 0)
+        offset = loxi.generic_util.pack_list_into(self.actions, buf, offset)
+        length = offset - start
+        _struct_H.pack_into(buf, start + 2, length)
+        return offset
+
+    def wire_length(self):
+        return 8 + loxi.generic_util.list_wire_length(self.actions)
 
     @staticmethod
     def unpack(reader):
         obj = write_actions()
-        _type = reader.read("!H")[0]
+        _type, _len = reader.read_struct(_struct_HH)
         assert(_type == 3)
-        _len = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_len, 4)
         reader.skip(4)
@@ -1097,6 +1072,7 @@ class write_actions(instruction):
 instruction.subtypes[3] = write_actions
 
 class write_metadata(instruction):
+    __slots__ = ["metadata", "metadata_mask"]
     type = 2
 
     def __init__(self, metadata=None, metadata_mask=None):
@@ -1110,28 +1086,25 @@ class write_metadata(instruction):
             self.metadata_mask = 0
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!H", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for len at index 1
-        packed.append('\x00' * 4)
-        packed.append(struct.pack("!Q", self.metadata))
-        packed.append(struct.pack("!Q", self.metadata_mask))
-        length = sum([len(x) for x in packed])
-        packed[1] = struct.pack("!H", length)
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_HH4xQQ, buf, offset, self.type, 0, self.metadata, self.metadata_mask)
+        length = offset - start
+        _struct_H.pack_into(buf, start + 2, length)
+        return offset
+
+    def wire_length(self):
+        return 24
 
     @staticmethod
     def unpack(reader):
         obj = write_metadata()
-        _type = reader.read("!H")[0]
+        _type, _len = reader.read_struct(_struct_HH)
         assert(_type == 2)
-        _len = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_len, 4)
         reader.skip(4)
-        obj.metadata = reader.read("!Q")[0]
-        obj.metadata_mask = reader.read("!Q")[0]
+        obj.metadata, obj.metadata_mask = reader.read_struct(_struct_QQ)
         return obj
 
     def __eq__(self, other):
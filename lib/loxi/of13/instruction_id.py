@@ -14,7 +14,15 @@ import loxi.generic_util
 import sys
 ofp = sys.modules['loxi.of13']
 
+# Precompiled layouts for the fixed-length parts of each pack_into() and unpack()
+_struct_H = struct.Struct("!H")
+_struct_HH = struct.Struct("!HH")
+_struct_HHL = struct.Struct("!HHL")
+_struct_HHLL = struct.Struct("!HHLL")
+_struct_LL = struct.Struct("!LL")
+
 class instruction_id(loxi.OFObject):
+    __slots__ = ["type"]
     subtypes = {}
 
 
@@ -25,13 +33,15 @@ class instruction_id(loxi.OFObject):
             self.type = 0
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!H", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for len at index 1
-        length = sum([len(x) for x in packed])
-        packed[1] = struct.pack("!H", length)
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_HH, buf, offset, self.type, 0)
+        length = offset - start
+        _struct_H.pack_into(buf, start + 2, length)
+        return offset
+
+    def wire_length(self):
+        return 4
 
     @staticmethod
     def unpack(reader):
@@ -41,8 +51,7 @@ class instruction_id(loxi.OFObject):
             return subclass.unpack(reader)
 
         obj = instruction_id()
-        obj.type = reader.read("!H")[0]
-        _len = reader.read("!H")[0]
+        obj.type, _len = reader.read_struct(_struct_HH)
         orig_reader = reader
         reader = orig_reader.slice(_len, 4)
         return obj
@@ -62,25 +71,27 @@ class instruction_id(loxi.OFObject):
 
 
 class apply_actions(instruction_id):
+    __slots__ = []
     type = 4
 
     def __init__(self):
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!H", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for len at index 1
-        length = sum([len(x) for x in packed])
-        packed[1] = struct.pack("!H", length)
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_HH, buf, offset, self.type, 0)
+        length = offset - start
+        _struct_H.pack_into(buf, start + 2, length)
+        return offset
+
+    def wire_length(self):
+        return 4
 
     @staticmethod
     def unpack(reader):
         obj = apply_actions()
-        _type = reader.read("!H")[0]
+        _type, _len = reader.read_struct(_struct_HH)
         assert(_type == 4)
-        _len = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_len, 4)
         return obj
@@ -100,6 +111,7 @@ class apply_actions(instruction_id):
 instruction_id.subtypes[4] = apply_actions
 
 class experimenter(instruction_id):
+    __slots__ = ["experimenter"]
     subtypes = {}
 
     type = 65535
@@ -111,14 +123,15 @@ class experimenter(instruction_id):
             self.experimenter = 0
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!H", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for len at index 1
-        packed.append(struct.pack("!L", self.experimenter))
-        length = sum([len(x) for x in packed])
-        packed[1] = struct.pack("!H", length)
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_HHL, buf, offset, self.type, 0, self.experimenter)
+        length = offset - start
+        _struct_H.pack_into(buf, start + 2, length)
+        return offset
+
+    def wire_length(self):
+        return 8
 
     @staticmethod
     def unpack(reader):
@@ -128,9 +141,8 @@ class experimenter(instruction_id):
             return subclass.unpack(reader)
 
         obj = experimenter()
-        _type = reader.read("!H")[0]
+        _type, _len = reader.read_struct(_struct_HH)
         assert(_type == 65535)
-        _len = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_len, 4)
         obj.experimenter = reader.read("!L")[0]
@@ -152,6 +164,7 @@ class experimenter(instruction_id):
 instruction_id.subtypes[65535] = experimenter
 
 class bsn(experimenter):
+    __slots__ = ["subtype"]
     subtypes = {}
 
     type = 65535
@@ -164,15 +177,15 @@ class bsn(experimenter):
             self.subtype = 0
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!H", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for len at index 1
-        packed.append(struct.pack("!L", self.experimenter))
-        packed.append(struct.pack("!L", self.subtype))
-        length = sum([len(x) for x in packed])
-        packed[1] = struct.pack("!H", length)
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_HHLL, buf, offset, self.type, 0, self.experimenter, self.subtype)
+        length = offset - start
+        _struct_H.pack_into(buf, start + 2, length)
+        return offset
+
+    def wire_length(self):
+        return 12
 
     @staticmethod
     def unpack(reader):
@@ -182,14 +195,12 @@ class bsn(experimenter):
             return subclass.unpack(reader)
 
         obj = bsn()
-        _type = reader.read("!H")[0]
+        _type, _len = reader.read_struct(_struct_HH)
         assert(_type == 65535)
-        _len = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_len, 4)
-        _experimenter = reader.read("!L")[0]
+        _experimenter, obj.subtype = reader.read_struct(_struct_LL)
         assert(_experimenter == 6035143)
-        obj.subtype = reader.read("!L")[0]
         return obj
 
     def __eq__(self, other):
@@ -208,6 +219,7 @@ class bsn(experimenter):
 experimenter.subtypes[6035143] = bsn
 
 class bsn_arp_offload(bsn):
+    __slots__ = []
     type = 65535
     experimenter = 6035143
     subtype = 1
@@ -215,27 +227,25 @@ class bsn_arp_offload(bsn):
     def __init__(self):
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!H", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for len at index 1
-        packed.append(struct.pack("!L", self.experimenter))
-        packed.append(struct.pack("!L", self.subtype))
-        length = sum([len(x) for x in packed])
-        packed[1] = struct.pack("!H", length)
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_HHLL, buf, offset, self.type, 0, self.experimenter, self.subtype)
+        length = offset - start
+        _struct_H.pack_into(buf, start + 2, length)
+        return offset
+
+    def wire_length(self):
+        return 12
 
     @staticmethod
     def unpack(reader):
         obj = bsn_arp_offload()
-        _type = reader.read("!H")[0]
+        _type, _len = reader.read_struct(_struct_HH)
         assert(_type == 65535)
-        _len = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_len, 4)
-        _experimenter = reader.read("!L")[0]
+        _experimenter, _subtype = reader.read_struct(_struct_LL)
         assert(_experimenter == 6035143)
-        _subtype = reader.read("!L")[0]
         assert(_subtype == 1)
         return obj
 
@@ -254,6 +264,7 @@ class bsn_arp_offload(bsn):
 bsn.subtypes[1] = bsn_arp_offload
 
 class bsn_auto_negotiation(bsn):
+    __slots__ = []
     type = 65535
     experimenter = 6035143
     subtype = 11
@@ -261,27 +272,25 @@ class bsn_auto_negotiation(bsn):
     def __init__(self):
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!H", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for len at index 1
-        packed.append(struct.pack("!L", self.experimenter))
-        packed.append(struct.pack("!L", self.subtype))
-        length = sum([len(x) for x in packed])
-        packed[1] = struct.pack("!H", length)
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_HHLL, buf, offset, self.type, 0, self.experimenter, self.subtype)
+        length = offset - start
+        _struct_H.pack_into(buf, start + 2, length)
+        return offset
+
+    def wire_length(self):
+        return 12
 
     @staticmethod
     def unpack(reader):
         obj = bsn_auto_negotiation()
-        _type = reader.read("!H")[0]
+        _type, _len = reader.read_struct(_struct_HH)
         assert(_type == 65535)
-        _len = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_len, 4)
-        _experimenter = reader.read("!L")[0]
+        _experimenter, _subtype = reader.read_struct(_struct_LL)
         assert(_experimenter == 6035143)
-        _subtype = reader.read("!L")[0]
         assert(_subtype == 11)
         return obj
 
@@ -300,6 +309,7 @@ class bsn_auto_negotiation(bsn):
 bsn.subtypes[11] = bsn_auto_negotiation
 
 class bsn_deny(bsn):
+    __slots__ = []
     type = 65535
     experimenter = 6035143
     subtype = 5
@@ -307,27 +317,25 @@ class bsn_deny(bsn):
     def __init__(self):
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!H", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for len at index 1
-        packed.append(struct.pack("!L", self.experimenter))
-        packed.append(struct.pack("!L", self.subtype))
-        length = sum([len(x) for x in packed])
-        packed[1] = struct.pack("!H", length)
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_HHLL, buf, offset, self.type, 0, self.experimenter, self.subtype)
+        length = offset - start
+        _struct_H.pack_into(buf, start + 2, length)
+        return offset
+
+    def wire_length(self):
+        return 12
 
     @staticmethod
     def unpack(reader):
         obj = bsn_deny()
-        _type = reader.read("!H")[0]
+        _type, _len = reader.read_struct(_struct_HH)
         assert(_type == 65535)
-        _len = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_len, 4)
-        _experimenter = reader.read("!L")[0]
+        _experimenter, _subtype = reader.read_struct(_struct_LL)
         assert(_experimenter == 6035143)
-        _subtype = reader.read("!L")[0]
         assert(_subtype == 5)
         return obj
 
@@ -346,6 +354,7 @@ class bsn_deny(bsn):
 bsn.subtypes[5] = bsn_deny
 
 class bsn_dhcp_offload(bsn):
+    __slots__ = []
     type = 65535
     experimenter = 6035143
     subtype = 2
@@ -353,27 +362,25 @@ class bsn_dhcp_offload(bsn):
     def __init__(self):
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!H", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for len at index 1
-        packed.append(struct.pack("!L", self.experimenter))
-        packed.append(struct.pack("!L", self.subtype))
-        length = sum([len(x) for x in packed])
-        packed[1] = struct.pack("!H", length)
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_HHLL, buf, offset, self.type, 0, self.experimenter, self.subtype)
+        length = offset - start
+        _struct_H.pack_into(buf, start + 2, length)
+        return offset
+
+    def wire_length(self):
+        return 12
 
     @staticmethod
     def unpack(reader):
         obj = bsn_dhcp_offload()
-        _type = reader.read("!H")[0]
+        _type, _len = reader.read_struct(_struct_HH)
         assert(_type == 65535)
-        _len = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_len, 4)
-        _experimenter = reader.read("!L")[0]
+        _experimenter, _subtype = reader.read_struct(_struct_LL)
         assert(_experimenter == 6035143)
-        _subtype = reader.read("!L")[0]
         assert(_subtype == 2)
         return obj
 
@@ -392,6 +399,7 @@ class bsn_dhcp_offload(bsn):
 bsn.subtypes[2] = bsn_dhcp_offload
 
 class bsn_disable_l3(bsn):
+    __slots__ = []
     type = 65535
     experimenter = 6035143
     subtype = 13
@@ -399,27 +407,25 @@ class bsn_disable_l3(bsn):
     def __init__(self):
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!H", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for len at index 1
-        packed.append(struct.pack("!L", self.experimenter))
-        packed.append(struct.pack("!L", self.subtype))
-        length = sum([len(x) for x in packed])
-        packed[1] = struct.pack("!H", length)
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_HHLL, buf, offset, self.type, 0, self.experimenter, self.subtype)
+        length = offset - start
+        _struct_H.pack_into(buf, start + 2, length)
+        return offset
+
+    def wire_length(self):
+        return 12
 
     @staticmethod
     def unpack(reader):
         obj = bsn_disable_l3()
-        _type = reader.read("!H")[0]
+        _type, _len = reader.read_struct(_struct_HH)
         assert(_type == 65535)
-        _len = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_len, 4)
-        _experimenter = reader.read("!L")[0]
+        _experimenter, _subtype = reader.read_struct(_struct_LL)
         assert(_experimenter == 6035143)
-        _subtype = reader.read("!L")[0]
         assert(_subtype == 13)
         return obj
 
@@ -438,6 +444,7 @@ class bsn_disable_l3(bsn):
 bsn.subtypes[13] = bsn_disable_l3
 
 class bsn_disable_split_horizon_check(bsn):
+    __slots__ = []
     type = 65535
     experimenter = 6035143
     subtype = 3
@@ -445,27 +452,25 @@ class bsn_disable_split_horizon_check(bsn):
     def __init__(self):
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!H", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for len at index 1
-        packed.append(struct.pack("!L", self.experimenter))
-        packed.append(struct.pack("!L", self.subtype))
-        length = sum([len(x) for x in packed])
-        packed[1] = struct.pack("!H", length)
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_HHLL, buf, offset, self.type, 0, self.experimenter, self.subtype)
+        length = offset - start
+        _struct_H.pack_into(buf, start + 2, length)
+        return offset
+
+    def wire_length(self):
+        return 12
 
     @staticmethod
     def unpack(reader):
         obj = bsn_disable_split_horizon_check()
-        _type = reader.read("!H")[0]
+        _type, _len = reader.read_struct(_struct_HH)
         assert(_type == 65535)
-        _len = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_len, 4)
-        _experimenter = reader.read("!L")[0]
+        _experimenter, _subtype = reader.read_struct(_struct_LL)
         assert(_experimenter == 6035143)
-        _subtype = reader.read("!L")[0]
         assert(_subtype == 3)
         return obj
 
@@ -484,6 +489,7 @@ class bsn_disable_split_horizon_check(bsn):
 bsn.subtypes[3] = bsn_disable_split_horizon_check
 
 class bsn_disable_src_mac_check(bsn):
+    __slots__ = []
     type = 65535
     experimenter = 6035143
     subtype = 0
@@ -491,27 +497,25 @@ class bsn_disable_src_mac_check(bsn):
     def __init__(self):
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!H", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for len at index 1
-        packed.append(struct.pack("!L", self.experimenter))
-        packed.append(struct.pack("!L", self.subtype))
-        length = sum([len(x) for x in packed])
-        packed[1] = struct.pack("!H", length)
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_HHLL, buf, offset, self.type, 0, self.experimenter, self.subtype)
+        length = offset - start
+        _struct_H.pack_into(buf, start + 2, length)
+        return offset
+
+    def wire_length(self):
+        return 12
 
     @staticmethod
     def unpack(reader):
         obj = bsn_disable_src_mac_check()
-        _type = reader.read("!H")[0]
+        _type, _len = reader.read_struct(_struct_HH)
         assert(_type == 65535)
-        _len = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_len, 4)
-        _experimenter = reader.read("!L")[0]
+        _experimenter, _subtype = reader.read_struct(_struct_LL)
         assert(_experimenter == 6035143)
-        _subtype = reader.read("!L")[0]
         assert(_subtype == 0)
         return obj
 
@@ -530,6 +534,7 @@ class bsn_disable_src_mac_check(bsn):
 bsn.subtypes[0] = bsn_disable_src_mac_check
 
 class bsn_disable_vlan_counters(bsn):
+    __slots__ = []
     type = 65535
     experimenter = 6035143
     subtype = 9
@@ -537,27 +542,25 @@ class bsn_disable_vlan_counters(bsn):
     def __init__(self):
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!H", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for len at index 1
-        packed.append(struct.pack("!L", self.experimenter))
-        packed.append(struct.pack("!L", self.subtype))
-        length = sum([len(x) for x in packed])
-        packed[1] = struct.pack("!H", length)
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_HHLL, buf, offset, self.type, 0, self.experimenter, self.subtype)
+        length = offset - start
+        _struct_H.pack_into(buf, start + 2, length)
+        return offset
+
+    def wire_length(self):
+        return 12
 
     @staticmethod
     def unpack(reader):
         obj = bsn_disable_vlan_counters()
-        _type = reader.read("!H")[0]
+        _type, _len = reader.read_struct(_struct_HH)
         assert(_type == 65535)
-        _len = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_len, 4)
-        _experimenter = reader.read("!L")[0]
+        _experimenter, _subtype = reader.read_struct(_struct_LL)
         assert(_experimenter == 6035143)
-        _subtype = reader.read("!L")[0]
         assert(_subtype == 9)
         return obj
 
@@ -576,6 +579,7 @@ class bsn_disable_vlan_counters(bsn):
 bsn.subtypes[9] = bsn_disable_vlan_counters
 
 class bsn_internal_priority(bsn):
+    __slots__ = []
     type = 65535
     experimenter = 6035143
     subtype = 12
@@ -583,27 +587,25 @@ class bsn_internal_priority(bsn):
     def __init__(self):
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!H", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for len at index 1
-        packed.append(struct.pack("!L", self.experimenter))
-        packed.append(struct.pack("!L", self.subtype))
-        length = sum([len(x) for x in packed])
-        packed[1] = struct.pack("!H", length)
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_HHLL, buf, offset, self.type, 0, self.experimenter, self.subtype)
+        length = offset - start
+        _struct_H.pack_into(buf, start + 2, length)
+        return offset
+
+    def wire_length(self):
+        return 12
 
     @staticmethod
     def unpack(reader):
         obj = bsn_internal_priority()
-        _type = reader.read("!H")[0]
+        _type, _len = reader.read_struct(_struct_HH)
         assert(_type == 65535)
-        _len = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_len, 4)
-        _experimenter = reader.read("!L")[0]
+        _experimenter, _subtype = reader.read_struct(_struct_LL)
         assert(_experimenter == 6035143)
-        _subtype = reader.read("!L")[0]
         assert(_subtype == 12)
         return obj
 
@@ -622,6 +624,7 @@ class bsn_internal_priority(bsn):
 bsn.subtypes[12] = bsn_internal_priority
 
 class bsn_packet_of_death(bsn):
+    __slots__ = []
     type = 65535
     experimenter = 6035143
     subtype = 6
@@ -629,27 +632,25 @@ class bsn_packet_of_death(bsn):
     def __init__(self):
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!H", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for len at index 1
-        packed.append(struct.pack("!L", self.experimenter))
-        packed.append(struct.pack("!L", self.subtype))
-        length = sum([len(x) for x in packed])
-        packed[1] = struct.pack("!H", length)
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_HHLL, buf, offset, self.type, 0, self.experimenter, self.subtype)
+        length = offset - start
+        _struct_H.pack_into(buf, start + 2, length)
+        return offset
+
+    def wire_length(self):
+        return 12
 
     @staticmethod
     def unpack(reader):
         obj = bsn_packet_of_death()
-        _type = reader.read("!H")[0]
+        _type, _len = reader.read_struct(_struct_HH)
         assert(_type == 65535)
-        _len = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_len, 4)
-        _experimenter = reader.read("!L")[0]
+        _experimenter, _subtype = reader.read_struct(_struct_LL)
         assert(_experimenter == 6035143)
-        _subtype = reader.read("!L")[0]
         assert(_subtype == 6)
         return obj
 
@@ -668,6 +669,7 @@ class bsn_packet_of_death(bsn):
 bsn.subtypes[6] = bsn_packet_of_death
 
 class bsn_permit(bsn):
+    __slots__ = []
     type = 65535
     experimenter = 6035143
     subtype = 4
@@ -675,27 +677,25 @@ class bsn_permit(bsn):
     def __init__(self):
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!H", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for len at index 1
-        packed.append(struct.pack("!L", self.experimenter))
-        packed.append(struct.pack("!L", self.subtype))
-        length = sum([len(x) for x in packed])
-        packed[1] = struct.pack("!H", length)
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_HHLL, buf, offset, self.type, 0, self.experimenter, self.subtype)
+        length = offset - start
+        _struct_H.pack_into(buf, start + 2, length)
+        return offset
+
+    def wire_length(self):
+        return 12
 
     @staticmethod
     def unpack(reader):
         obj = bsn_permit()
-        _type = reader.read("!H")[0]
+        _type, _len = reader.read_struct(_struct_HH)
         assert(_type == 65535)
-        _len = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_len, 4)
-        _experimenter = reader.read("!L")[0]
+        _experimenter, _subtype = reader.read_struct(_struct_LL)
         assert(_experimenter == 6035143)
-        _subtype = reader.read("!L")[0]
         assert(_subtype == 4)
         return obj
 
@@ -714,6 +714,7 @@ class bsn_permit(bsn):
 bsn.subtypes[4] = bsn_permit
 
 class bsn_prioritize_pdus(bsn):
+    __slots__ = []
     type = 65535
     experimenter = 6035143
     subtype = 7
@@ -721,27 +722,25 @@ class bsn_prioritize_pdus(bsn):
     def __init__(self):
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!H", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for len at index 1
-        packed.append(struct.pack("!L", self.experimenter))
-        packed.append(struct.pack("!L", self.subtype))
-        length = sum([len(x) for x in packed])
-        packed[1] = struct.pack("!H", length)
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_HHLL, buf, offset, self.type, 0, self.experimenter, self.subtype)
+        length = offset - start
+        _struct_H.pack_into(buf, start + 2, length)
+        return offset
+
+    def wire_length(self):
+        return 12
 
     @staticmethod
     def unpack(reader):
         obj = bsn_prioritize_pdus()
-        _type = reader.read("!H")[0]
+        _type, _len = reader.read_struct(_struct_HH)
         assert(_type == 65535)
-        _len = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_len, 4)
-        _experimenter = reader.read("!L")[0]
+        _experimenter, _subtype = reader.read_struct(_struct_LL)
         assert(_experimenter == 6035143)
-        _subtype = reader.read("!L")[0]
         assert(_subtype == 7)
         return obj
 
@@ -760,6 +759,7 @@ class bsn_prioritize_pdus(bsn):
 bsn.subtypes[7] = bsn_prioritize_pdus
 
 class bsn_require_vlan_xlate(bsn):
+    __slots__ = []
     type = 65535
     experimenter = 6035143
     subtype = 8
@@ -767,27 +767,25 @@ class bsn_require_vlan_xlate(bsn):
     def __init__(self):
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!H", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for len at index 1
-        packed.append(struct.pack("!L", self.experimenter))
-        packed.append(struct.pack("!L", self.subtype))
-        length = sum([len(x) for x in packed])
-        packed[1] = struct.pack("!H", length)
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_HHLL, buf, offset, self.type, 0, self.experimenter, self.subtype)
+        length = offset - start
+        _struct_H.pack_into(buf, start + 2, length)
+        return offset
+
+    def wire_length(self):
+        return 12
 
     @staticmethod
     def unpack(reader):
         obj = bsn_require_vlan_xlate()
-        _type = reader.read("!H")[0]
+        _type, _len = reader.read_struct(_struct_HH)
         assert(_type == 65535)
-        _len = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_len, 4)
-        _experimenter = reader.read("!L")[0]
+        _experimenter, _subtype = reader.read_struct(_struct_LL)
         assert(_experimenter == 6035143)
-        _subtype = reader.read("!L")[0]
         assert(_subtype == 8)
         return obj
 
@@ -806,6 +804,7 @@ class bsn_require_vlan_xlate(bsn):
 bsn.subtypes[8] = bsn_require_vlan_xlate
 
 class bsn_span_destination(bsn):
+    __slots__ = []
     type = 65535
     experimenter = 6035143
     subtype = 10
@@ -813,27 +812,25 @@ class bsn_span_destination(bsn):
     def __init__(self):
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!H", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for len at index 1
-        packed.append(struct.pack("!L", self.experimenter))
-        packed.append(struct.pack("!L", self.subtype))
-        length = sum([len(x) for x in packed])
-        packed[1] = struct.pack("!H", length)
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_HHLL, buf, offset, self.type, 0, self.experimenter, self.subtype)
+        length = offset - start
+        _struct_H.pack_into(buf, start + 2, length)
+        return offset
+
+    def wire_length(self):
+        return 12
 
     @staticmethod
     def unpack(reader):
         obj = bsn_span_destination()
-        _type = reader.read("!H")[0]
+        _type, _len = reader.read_struct(_struct_HH)
         assert(_type == 65535)
-        _len = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_len, 4)
-        _experimenter = reader.read("!L")[0]
+        _experimenter, _subtype = reader.read_struct(_struct_LL)
         assert(_experimenter == 6035143)
-        _subtype = reader.read("!L")[0]
         assert(_subtype == 10)
         return obj
 
@@ -852,25 +849,27 @@ class bsn_span_destination(bsn):
 bsn.subtypes[10] = bsn_span_destination
 
 class clear_actions(instruction_id):
+    __slots__ = []
     type = 5
 
     def __init__(self):
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!H", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for len at index 1
-        length = sum([len(x) for x in packed])
-        packed[1] = struct.pack("!H", length)
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_HH, buf, offset, self.type, 0)
+        length = offset - start
+        _struct_H.pack_into(buf, start + 2, length)
+        return offset
+
+    def wire_length(self):
+        return 4
 
     @staticmethod
     def unpack(reader):
         obj = clear_actions()
-        _type = reader.read("!H")[0]
+        _type, _len = reader.read_struct(_struct_HH)
         assert(_type == 5)
-        _len = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_len, 4)
         return obj
@@ -890,25 +889,27 @@ class clear_actions(instruction_id):
 instruction_id.subtypes[5] = clear_actions
 
 class goto_table(instruction_id):
+    __slots__ = []
     type = 1
 
     def __init__(self):
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!H", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for len at index 1
-        length = sum([len(x) for x in packed])
-        packed[1] = struct.pack("!H", length)
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_HH, buf, offset, self.type, 0)
+        length = offset - start
+        _struct_H.pack_into(buf, start + 2, length)
+        return offset
+
+    def wire_length(self):
+        return 4
 
     @staticmethod
     def unpack(reader):
         obj = goto_table()
-        _type = reader.read("!H")[0]
+        _type, _len = reader.read_struct(_struct_HH)
         assert(_type == 1)
-        _len = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_len, 4)
         return obj
@@ -928,25 +929,27 @@ class goto_table(instruction_id):
 instruction_id.subtypes[1] = goto_table
 
 class meter(instruction_id):
+    __slots__ = []
     type = 6
 
     def __init__(self):
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!H", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for len at index 1
-        length = sum([len(x) for x in packed])
-        packed[1] = struct.pack("!H", length)
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_HH, buf, offset, self.type, 0)
+        length = offset - start
+        _struct_H.pack_into(buf, start + 2, length)
+        return offset
+
+    def wire_length(self):
+        return 4
 
     @staticmethod
     def unpack(reader):
         obj = meter()
-        _type = reader.read("!H")[0]
+        _type, _len = reader.read_struct(_struct_HH)
         assert(_type == 6)
-        _len = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_len, 4)
         return obj
@@ -966,25 +969,27 @@ class meter(instruction_id):
 instruction_id.subtypes[6] = meter
 
 class write_actions(instruction_id):
+    __slots__ = []
     type = 3
 
     def __init__(self):
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!H", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for len at index 1
-        length = sum([len(x) for x in packed])
-        packed[1] = struct.pack("!H", length)
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_HH, buf, offset, self.type, 0)
+        length = offset - start
+        _struct_H.pack_into(buf, start + 2, length)
+        return offset
+
+    def wire_length(self):
+        return 4
 
     @staticmethod
     def unpack(reader):
         obj = write_actions()
-        _type = reader.read("!H")[0]
+        _type, _len = reader.read_struct(_struct_HH)
         assert(_type == 3)
-        _len = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_len, 4)
         return obj
@@ -1004,25 +1009,27 @@ class write_actions(instruction_id):
 instruction_id.subtypes[3] = write_actions
 
 class write_metadata(instruction_id):
+    __slots__ = []
     type = 2
 
     def __init__(self):
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!H", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for len at index 1
-        length = sum([len(x) for x in packed])
-        packed[1] = struct.pack("!H", length)
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_HH, buf, offset, self.type, 0)
+        length = offset - start
+        _struct_H.pack_into(buf, start + 2, length)
+        return offset
+
+    def wire_length(self):
+        return 4
 
     @staticmethod
     def unpack(reader):
         obj = write_metadata()
-        _type = reader.read("!H")[0]
+        _type, _len = reader.read_struct(_struct_HH)
         assert(_type == 2)
-        _len = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_len, 4)
         return obj
@@ -14,7 +14,117 @@ import loxi.generic_util
 import sys
 ofp = sys.modules['loxi.of13']
 
+# Precompiled layouts for the fixed-length parts of each pack_into() and unpack()
+_struct_2x = struct.Struct("!2x")
+_struct_2xLLL4x = struct.Struct("!2xLLL4x")
+_struct_6B = struct.Struct("!6B")
+_struct_B = struct.Struct("!B")
+_struct_BBH = struct.Struct("!BBH")
+_struct_BBHL = struct.Struct("!BBHL")
+_struct_BBHLB3xL = struct.Struct("!BBHLB3xL")
+_struct_BBHLB7x = struct.Struct("!BBHLB7x")
+_struct_BBHLH = struct.Struct("!BBHLH")
+_struct_BBHLHBxL = struct.Struct("!BBHLHBxL")
+_struct_BBHLHH = struct.Struct("!BBHLHH")
+_struct_BBHLHH4x = struct.Struct("!BBHLHH4x")
+_struct_BBHLHH4x256s256s256s32s256s = struct.Struct("!BBHLHH4x256s256s256s32s256s")
+_struct_BBHLHH4xB3xLL4xQQ = struct.Struct("!BBHLHH4xB3xLL4xQQ")
+_struct_BBHLHH4xL4x = struct.Struct("!BBHLHH4xL4x")
+_struct_BBHLHH4xLL = struct.Struct("!BBHLHH4xLL")
+_struct_BBHLHH4xLL256s256s = struct.Struct("!BBHLHH4xLL256s256s")
+_struct_BBHLHH4xLL64s = struct.Struct("!BBHLHH4xLL64s")
+_struct_BBHLHH4xLLB = struct.Struct("!BBHLHH4xLLB")
+_struct_BBHLHH4xLLH = struct.Struct("!BBHLHH4xLLH")
+_struct_BBHLHH4xLLH2x = struct.Struct("!BBHLHH4xLLH2x")
+_struct_BBHLHH4xLLL = struct.Struct("!BBHLHH4xLLL")
+_struct_BBHLHH4xLLLLLLLLLL = struct.Struct("!BBHLHH4xLLLLLLLLLL")
+_struct_BBHLHH4xQQL4x = struct.Struct("!BBHLHH4xQQL4x")
+_struct_BBHLHHL = struct.Struct("!BBHLHHL")
+_struct_BBHLL4x = struct.Struct("!BBHLL4x")
+_struct_BBHLL4xQ = struct.Struct("!BBHLL4xQ")
+_struct_BBHLLHBBQ = struct.Struct("!BBHLLHBBQ")
+_struct_BBHLLL = struct.Struct("!BBHLLL")
+_struct_BBHLLL256s = struct.Struct("!BBHLLL256s")
+_struct_BBHLLLB = struct.Struct("!BBHLLLB")
+_struct_BBHLLLB3x = struct.Struct("!BBHLLLB3x")
+_struct_BBHLLLB3xLH = struct.Struct("!BBHLLLB3xLH")
+_struct_BBHLLLBxHHHQ = struct.Struct("!BBHLLLBxHHHQ")
+_struct_BBHLLLH = struct.Struct("!BBHLLLH")
+_struct_BBHLLLH2x = struct.Struct("!BBHLLLH2x")
+_struct_BBHLLLH2xL = struct.Struct("!BBHLLLH2xL")
+_struct_BBHLLLH2xLL = struct.Struct("!BBHLLLH2xLL")
+_struct_BBHLLLH64s = struct.Struct("!BBHLLLH64s")
+_struct_BBHLLLH6x = struct.Struct("!BBHLLLH6x")
+_struct_BBHLLLHH = struct.Struct("!BBHLLLHH")
+_struct_BBHLLLL = struct.Struct("!BBHLLLL")
+_struct_BBHLLLLB = struct.Struct("!BBHLLLLB")
+_struct_BBHLLLLB3xQ = struct.Struct("!BBHLLLLB3xQ")
+_struct_BBHLLLLL = struct.Struct("!BBHLLLLL")
+_struct_BBHLLLLLB = struct.Struct("!BBHLLLLLB")
+_struct_BBHLLLLLB3x = struct.Struct("!BBHLLLLLB3x")
+_struct_BBHLLLLLLL = struct.Struct("!BBHLLLLLLL")
+_struct_BBHLLLQ = struct.Struct("!BBHLLLQ")
+_struct_BBHLLLQHB5x = struct.Struct("!BBHLLLQHB5x")
+_struct_BBHLLLxB2xL = struct.Struct("!BBHLLLxB2xL")
+_struct_BBHLQHBBLLHHQQ = struct.Struct("!BBHLQHBBLLHHQQ")
+_struct_BBHLQLBB2xLL = struct.Struct("!BBHLQLBB2xLL")
+_struct_BBHLQQBBHHHLLLH2x = struct.Struct("!BBHLQQBBHHHLLLH2x")
+_struct_H = struct.Struct("!H")
+_struct_HHH = struct.Struct("!HHH")
+_struct_HHHH = struct.Struct("!HHHH")
+_struct_L = struct.Struct("!L")
+_struct_LB3xL = struct.Struct("!LB3xL")
+_struct_LB7x = struct.Struct("!LB7x")
+_struct_LH = struct.Struct("!LH")
+_struct_LHBxL = struct.Struct("!LHBxL")
+_struct_LHH = struct.Struct("!LHH")
+_struct_LHH4x = struct.Struct("!LHH4x")
+_struct_LHH4x256s256s256s32s256s = struct.Struct("!LHH4x256s256s256s32s256s")
+_struct_LHH4xB3xLL4xQQ = struct.Struct("!LHH4xB3xLL4xQQ")
+_struct_LHH4xL4x = struct.Struct("!LHH4xL4x")
+_struct_LHH4xLL = struct.Struct("!LHH4xLL")
+_struct_LHH4xLL256s256s = struct.Struct("!LHH4xLL256s256s")
+_struct_LHH4xLL64s = struct.Struct("!LHH4xLL64s")
+_struct_LHH4xLLB = struct.Struct("!LHH4xLLB")
+_struct_LHH4xLLH = struct.Struct("!LHH4xLLH")
+_struct_LHH4xLLH2x = struct.Struct("!LHH4xLLH2x")
+_struct_LHH4xLLL = struct.Struct("!LHH4xLLL")
+_struct_LHH4xLLLLLLLLLL = struct.Struct("!LHH4xLLLLLLLLLL")
+_struct_LHH4xQQL4x = struct.Struct("!LHH4xQQL4x")
+_struct_LHHL = struct.Struct("!LHHL")
+_struct_LL4x = struct.Struct("!LL4x")
+_struct_LL4xQ = struct.Struct("!LL4xQ")
+_struct_LLHBBQ = struct.Struct("!LLHBBQ")
+_struct_LLL = struct.Struct("!LLL")
+_struct_LLL256s = struct.Struct("!LLL256s")
+_struct_LLL4x = struct.Struct("!LLL4x")
+_struct_LLLB = struct.Struct("!LLLB")
+_struct_LLLB3x = struct.Struct("!LLLB3x")
+_struct_LLLB3xLH = struct.Struct("!LLLB3xLH")
+_struct_LLLBxHHHQ = struct.Struct("!LLLBxHHHQ")
+_struct_LLLH = struct.Struct("!LLLH")
+_struct_LLLH2x = struct.Struct("!LLLH2x")
+_struct_LLLH2xL = struct.Struct("!LLLH2xL")
+_struct_LLLH2xLL = struct.Struct("!LLLH2xLL")
+_struct_LLLH64s = struct.Struct("!LLLH64s")
+_struct_LLLH6x = struct.Struct("!LLLH6x")
+_struct_LLLHH = struct.Struct("!LLLHH")
+_struct_LLLL = struct.Struct("!LLLL")
+_struct_LLLLB = struct.Struct("!LLLLB")
+_struct_LLLLB3xQ = struct.Struct("!LLLLB3xQ")
+_struct_LLLLL = struct.Struct("!LLLLL")
+_struct_LLLLLB = struct.Struct("!LLLLLB")
+_struct_LLLLLB3x = struct.Struct("!LLLLLB3x")
+_struct_LLLLLLL = struct.Struct("!LLLLLLL")
+_struct_LLLQ = struct.Struct("!LLLQ")
+_struct_LLLQHB5x = struct.Struct("!LLLQHB5x")
+_struct_LLLxB2xL = struct.Struct("!LLLxB2xL")
+_struct_LQHBBLLHHQQ = struct.Struct("!LQHBBLLHHQQ")
+_struct_LQLBB2xLL = struct.Struct("!LQLBB2xLL")
+_struct_LQQBBHHHLLLH2x = struct.Struct("!LQQBBHHHLLLH2x")
+
 class message(loxi.OFObject):
+    __slots__ = ["type", "xid"]
     subtypes = {}
 
     version = 4
@@ -30,15 +140,15 @@ class message(loxi.OFObject):
             self.xid = None
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_BBHL, buf, offset, self.version, self.type, 0, self.xid)
+        length = offset - start
+        _struct_H.pack_into(buf, start + 2, length)
+        return offset
+
+    def wire_length(self):
+        return 8
 
     @staticmethod
     def unpack(reader):
@@ -48,10 +158,8 @@ class message(loxi.OFObject):
             return subclass.unpack(reader)
 
         obj = message()
-        _version = reader.read("!B")[0]
+        _version, obj.type, _length = reader.read_struct(_struct_BBH)
         assert(_version == 4)
-        obj.type = reader.read("!B")[0]
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
         obj.xid = reader.read("!L")[0]
@@ -78,6 +186,7 @@ class message(loxi.OFObject):
 
 
 class stats_reply(message):
+    __slots__ = ["flags", "stats_type"]
     subtypes = {}
 
     version = 4
@@ -98,18 +207,15 @@ class stats_reply(message):
             self.flags = 0
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!H", self.stats_type))
-        packed.append(struct.pack("!H", self.flags))
-        packed.append('\x00' * 4)
-        length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_BBHLHH4x, buf, offset, self.version, self.type, 0, self.xid, self.stats_type, self.flags)
+        length = offset - start
+        _struct_H.pack_into(buf, start + 2, length)
+        return offset
+
+    def wire_length(self):
+        return 16
 
     @staticmethod
     def unpack(reader):
@@ -119,17 +225,12 @@ class stats_reply(message):
             return subclass.unpack(reader)
 
         obj = stats_reply()
-        _version = reader.read("!B")[0]
+        _version, _type, _length = reader.read_struct(_struct_BBH)
         assert(_version == 4)
-        _type = reader.read("!B")[0]
         assert(_type == 19)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        obj.stats_type = reader.read("!H")[0]
-        obj.flags = reader.read("!H")[0]
-        reader.skip(4)
+        obj.xid, obj.stats_type, obj.flags = reader.read_struct(_struct_LHH4x)
         return obj
 
     def __eq__(self, other):
@@ -158,6 +259,7 @@ class stats_reply(message):
 message.subtypes[19] = stats_reply
 
 class aggregate_stats_reply(stats_reply):
+    __slots__ = ["byte_count", "flow_count", "packet_count"]
     version = 4
     type = 19
     stats_type = 2
@@ -185,42 +287,26 @@ class aggregate_stats_reply(stats_reply):
             self.flow_count = 0
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!H", self.stats_type))
-        packed.append(struct.pack("!H", self.flags))
-        packed.append('\x00' * 4)
-        packed.append(struct.pack("!Q", self.packet_count))
-        packed.append(struct.pack("!Q", self.byte_count))
-        packed.append(struct.pack("!L", self.flow_count))
-        packed.append('\x00' * 4)
-        length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_BBHLHH4xQQL4x, buf, offset, self.version, self.type, 0, self.xid, self.stats_type, self.flags, self.packet_count, self.byte_count, self.flow_count)
+        length = offset - start
+        _struct_H.pack_into(buf, start + 2, length)
+        return offset
+
+    def wire_length(self):
+        return 40
 
     @staticmethod
     def unpack(reader):
         obj = aggregate_stats_reply()
-        _version = reader.read("!B")[0]
+        _version, _type, _length = reader.read_struct(_struct_BBH)
         assert(_version == 4)
-        _type = reader.read("!B")[0]
         assert(_type == 19)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        _stats_type = reader.read("!H")[0]
+        obj.xid, _stats_type, obj.flags, obj.packet_count, obj.byte_count, obj.flow_count = reader.read_struct(_struct_LHH4xQQL4x)
         assert(_stats_type == 2)
-        obj.flags = reader.read("!H")[0]
-        reader.skip(4)
-        obj.packet_count = reader.read("!Q")[0]
-        obj.byte_count = reader.read("!Q")[0]
-        obj.flow_count = reader.read("!L")[0]
-        reader.skip(4)
         return obj
 
     def __eq__(self, other):
@@ -260,6 +346,7 @@ class aggregate_stats_reply(stats_reply):
 stats_reply.subtypes[2] = aggregate_stats_reply
 
 class stats_request(message):
+    __slots__ = ["flags", "stats_type"]
     subtypes = {}
 
     version = 4
@@ -280,18 +367,15 @@ class stats_request(message):
             self.flags = 0
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!H", self.stats_type))
-        packed.append(struct.pack("!H", self.flags))
-        packed.append('\x00' * 4)
-        length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_BBHLHH4x, buf, offset, self.version, self.type, 0, self.xid, self.stats_type, self.flags)
+        length = offset - start
+        _struct_H.pack_into(buf, start + 2, length)
+        return offset
+
+    def wire_length(self):
+        return 16
 
     @staticmethod
     def unpack(reader):
@@ -301,17 +385,12 @@ class stats_request(message):
             return subclass.unpack(reader)
 
         obj = stats_request()
-        _version = reader.read("!B")[0]
+        _version, _type, _length = reader.read_struct(_struct_BBH)
         assert(_version == 4)
-        _type = reader.read("!B")[0]
         assert(_type == 18)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        obj.stats_type = reader.read("!H")[0]
-        obj.flags = reader.read("!H")[0]
-        reader.skip(4)
+        obj.xid, obj.stats_type, obj.flags = reader.read_struct(_struct_LHH4x)
         return obj
 
     def __eq__(self, other):
@@ -340,6 +419,7 @@ class stats_request(message):
 message.subtypes[18] = stats_request
 
 class aggregate_stats_request(stats_request):
+    __slots__ = ["cookie", "cookie_mask", "match", "out_group", "out_port", "table_id"]
     version = 4
     type = 18
     stats_type = 2
@@ -379,49 +459,27 @@ class aggregate_stats_request(stats_request):
             self.match = ofp.match()
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!H", self.stats_type))
-        packed.append(struct.pack("!H", self.flags))
-        packed.append('\x00' * 4)
-        packed.append(struct.pack("!B", self.table_id))
-        packed.append('\x00' * 3)
-        packed.append(util.pack_port_no(self.out_port))
-        packed.append(struct.pack("!L", self.out_group))
-        packed.append('\x00' * 4)
-        packed.append(struct.pack("!Q", self.cookie))
-        packed.append(struct.pack("!Q", self.cookie_mask))
-        packed.append(self.match.pack())
-        length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_BBHLHH4xB3xLL4xQQ, buf, offset, self.version, self.type, 0, self.xid, self.stats_type, self.flags, self.table_id, self.out_port, self.out_group, self.cookie, self.cookie_mask)
+        offset = self.match.pack_into(buf, offset)
+        length = offset - start
+        _struct_H.pack_into(buf, start + 2, length)
+        return offset
+
+    def wire_length(self):
+        return 48 + self.match.wire_length()
 
     @staticmethod
     def unpack(reader):
         obj = aggregate_stats_request()
-        _version = reader.read("!B")[0]
+        _version, _type, _length = reader.read_struct(_struct_BBH)
         assert(_version == 4)
-        _type = reader.read("!B")[0]
         assert(_type == 18)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        _stats_type = reader.read("!H")[0]
+        obj.xid, _stats_type, obj.flags, obj.table_id, obj.out_port, obj.out_group, obj.cookie, obj.cookie_mask = reader.read_struct(_struct_LHH4xB3xLL4xQQ)
         assert(_stats_type == 2)
-        obj.flags = reader.read("!H")[0]
-        reader.skip(4)
-        obj.table_id = reader.read("!B")[0]
-        reader.skip(3)
-        obj.out_port = util.unpack_port_no(reader)
-        obj.out_group = reader.read("!L")[0]
-        reader.skip(4)
-        obj.cookie = reader.read("!Q")[0]
-        obj.cookie_mask = reader.read("!Q")[0]
         obj.match = ofp.match.unpack(reader)
         return obj
 
@@ -474,6 +532,7 @@ class aggregate_stats_request(stats_request):
 stats_request.subtypes[2] = aggregate_stats_request
 
 class async_get_reply(message):
+    __slots__ = ["flow_removed_mask_equal_master", "flow_removed_mask_slave", "packet_in_mask_equal_master", "packet_in_mask_slave", "port_status_mask_equal_master", "port_status_mask_slave"]
     version = 4
     type = 27
 
@@ -508,39 +567,25 @@ class async_get_reply(message):
             self.flow_removed_mask_slave = 0
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!L", self.packet_in_mask_equal_master))
-        packed.append(struct.pack("!L", self.packet_in_mask_slave))
-        packed.append(struct.pack("!L", self.port_status_mask_equal_master))
-        packed.append(struct.pack("!L", self.port_status_mask_slave))
-        packed.append(struct.pack("!L", self.flow_removed_mask_equal_master))
-        packed.append(struct.pack("!L", self.flow_removed_mask_slave))
-        length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_BBHLLLLLLL, buf, offset, self.version, self.type, 0, self.xid, self.packet_in_mask_equal_master, self.packet_in_mask_slave, self.port_status_mask_equal_master, self.port_status_mask_slave, self.flow_removed_mask_equal_master, self.flow_removed_mask_slave)
+        length = offset - start
+        _struct_H.pack_into(buf, start + 2, length)
+        return offset
+
+    def wire_length(self):
+        return 32
 
     @staticmethod
     def unpack(reader):
         obj = async_get_reply()
-        _version = reader.read("!B")[0]
+        _version, _type, _length = reader.read_struct(_struct_BBH)
         assert(_version == 4)
-        _type = reader.read("!B")[0]
         assert(_type == 27)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        obj.packet_in_mask_equal_master = reader.read("!L")[0]
-        obj.packet_in_mask_slave = reader.read("!L")[0]
-        obj.port_status_mask_equal_master = reader.read("!L")[0]
-        obj.port_status_mask_slave = reader.read("!L")[0]
-        obj.flow_removed_mask_equal_master = reader.read("!L")[0]
-        obj.flow_removed_mask_slave = reader.read("!L")[0]
+        obj.xid, obj.packet_in_mask_equal_master, obj.packet_in_mask_slave, obj.port_status_mask_equal_master, obj.port_status_mask_slave, obj.flow_removed_mask_equal_master, obj.flow_removed_mask_slave = reader.read_struct(_struct_LLLLLLL)
         return obj
 
     def __eq__(self, other):
@@ -588,6 +633,7 @@ class async_get_reply(message):
 message.subtypes[27] = async_get_reply
 
 class async_get_request(message):
+    __slots__ = ["flow_removed_mask_equal_master", "flow_removed_mask_slave", "packet_in_mask_equal_master", "packet_in_mask_slave", "port_status_mask_equal_master", "port_status_mask_slave"]
     version = 4
     type = 26
 
@@ -622,39 +668,25 @@ class async_get_request(message):
             self.flow_removed_mask_slave = 0
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!L", self.packet_in_mask_equal_master))
-        packed.append(struct.pack("!L", self.packet_in_mask_slave))
-        packed.append(struct.pack("!L", self.port_status_mask_equal_master))
-        packed.append(struct.pack("!L", self.port_status_mask_slave))
-        packed.append(struct.pack("!L", self.flow_removed_mask_equal_master))
-        packed.append(struct.pack("!L", self.flow_removed_mask_slave))
-        length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_BBHLLLLLLL, buf, offset, self.version, self.type, 0, self.xid, self.packet_in_mask_equal_master, self.packet_in_mask_slave, self.port_status_mask_equal_master, self.port_status_mask_slave, self.flow_removed_mask_equal_master, self.flow_removed_mask_slave)
+        length = offset - start
+        _struct_H.pack_into(buf, start + 2, length)
+        return offset
+
+    def wire_length(self):
+        return 32
 
     @staticmethod
     def unpack(reader):
         obj = async_get_request()
-        _version = reader.read("!B")[0]
+        _version, _type, _length = reader.read_struct(_struct_BBH)
         assert(_version == 4)
-        _type = reader.read("!B")[0]
         assert(_type == 26)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        obj.packet_in_mask_equal_master = reader.read("!L")[0]
-        obj.packet_in_mask_slave = reader.read("!L")[0]
-        obj.port_status_mask_equal_master = reader.read("!L")[0]
-        obj.port_status_mask_slave = reader.read("!L")[0]
-        obj.flow_removed_mask_equal_master = reader.read("!L")[0]
-        obj.flow_removed_mask_slave = reader.read("!L")[0]
+        obj.xid, obj.packet_in_mask_equal_master, obj.packet_in_mask_slave, obj.port_status_mask_equal_master, obj.port_status_mask_slave, obj.flow_removed_mask_equal_master, obj.flow_removed_mask_slave = reader.read_struct(_struct_LLLLLLL)
         return obj
 
     def __eq__(self, other):
@@ -702,6 +734,7 @@ class async_get_request(message):
 message.subtypes[26] = async_get_request
 
 class async_set(message):
+    __slots__ = ["flow_removed_mask_equal_master", "flow_removed_mask_slave", "packet_in_mask_equal_master", "packet_in_mask_slave", "port_status_mask_equal_master", "port_status_mask_slave"]
     version = 4
     type = 28
 
@@ -736,39 +769,25 @@ class async_set(message):
             self.flow_removed_mask_slave = 0
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!L", self.packet_in_mask_equal_master))
-        packed.append(struct.pack("!L", self.packet_in_mask_slave))
-        packed.append(struct.pack("!L", self.port_status_mask_equal_master))
-        packed.append(struct.pack("!L", self.port_status_mask_slave))
-        packed.append(struct.pack("!L", self.flow_removed_mask_equal_master))
-        packed.append(struct.pack("!L", self.flow_removed_mask_slave))
-        length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_BBHLLLLLLL, buf, offset, self.version, self.type, 0, self.xid, self.packet_in_mask_equal_master, self.packet_in_mask_slave, self.port_status_mask_equal_master, self.port_status_mask_slave, self.flow_removed_mask_equal_master, self.flow_removed_mask_slave)
+        length = offset - start
+        _struct_H.pack_into(buf, start + 2, length)
+        return offset
+
+    def wire_length(self):
+        return 32
 
     @staticmethod
     def unpack(reader):
         obj = async_set()
-        _version = reader.read("!B")[0]
+        _version, _type, _length = reader.read_struct(_struct_BBH)
         assert(_version == 4)
-        _type = reader.read("!B")[0]
         assert(_type == 28)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        obj.packet_in_mask_equal_master = reader.read("!L")[0]
-        obj.packet_in_mask_slave = reader.read("!L")[0]
-        obj.port_status_mask_equal_master = reader.read("!L")[0]
-        obj.port_status_mask_slave = reader.read("!L")[0]
-        obj.flow_removed_mask_equal_master = reader.read("!L")[0]
-        obj.flow_removed_mask_slave = reader.read("!L")[0]
+        obj.xid, obj.packet_in_mask_equal_master, obj.packet_in_mask_slave, obj.port_status_mask_equal_master, obj.port_status_mask_slave, obj.flow_removed_mask_equal_master, obj.flow_removed_mask_slave = reader.read_struct(_struct_LLLLLLL)
         return obj
 
     def __eq__(self, other):
@@ -816,6 +835,7 @@ class async_set(message):
 message.subtypes[28] = async_set
 
 class error_msg(message):
+    __slots__ = ["err_type"]
     subtypes = {}
 
     version = 4
@@ -832,16 +852,15 @@ class error_msg(message):
             self.err_type = 0
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!H", self.err_type))
-        length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_BBHLH, buf, offset, self.version, self.type, 0, self.xid, self.err_type)
+        length = offset - start
+        _struct_H.pack_into(buf, start + 2, length)
+        return offset
+
+    def wire_length(self):
+        return 10
 
     @staticmethod
     def unpack(reader):
@@ -851,15 +870,12 @@ class error_msg(message):
             return subclass.unpack(reader)
 
         obj = error_msg()
-        _version = reader.read("!B")[0]
+        _version, _type, _length = reader.read_struct(_struct_BBH)
         assert(_version == 4)
-        _type = reader.read("!B")[0]
         assert(_type == 1)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        obj.err_type = reader.read("!H")[0]
+        obj.xid, obj.err_type = reader.read_struct(_struct_LH)
         return obj
 
     def __eq__(self, other):
@@ -884,6 +900,7 @@ class error_msg(message):
 message.subtypes[1] = error_msg
 
 class bad_action_error_msg(error_msg):
+    __slots__ = ["code", "data"]
     version = 4
     type = 1
     err_type = 2
@@ -903,34 +920,28 @@ class bad_action_error_msg(error_msg):
             self.data = ''
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!H", self.err_type))
-        packed.append(struct.pack("!H", self.code))
-        packed.append(self.data)
-        length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_BBHLHH, buf, offset, self.version, self.type, 0, self.xid, self.err_type, self.code)
+        offset = loxi.generic_util.pack_bytes_into(self.data, buf, offset)
+        length = offset - start
+        _struct_H.pack_into(buf, start + 2, length)
+        return offset
+
+    def wire_length(self):
+        return 12 + len(self.data)
 
     @staticmethod
     def unpack(reader):
         obj = bad_action_error_msg()
-        _version = reader.read("!B")[0]
+        _version, _type, _length = reader.read_struct(_struct_BBH)
         assert(_version == 4)
-        _type = reader.read("!B")[0]
         assert(_type == 1)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        _err_type = reader.read("!H")[0]
+        obj.xid, _err_type, obj.code = reader.read_struct(_struct_LHH)
         assert(_err_type == 2)
-        obj.code = reader.read("!H")[0]
-        obj.data = str(reader.read_all())
+        obj.data = reader.read_all()
         return obj
 
     def __eq__(self, other):
@@ -962,6 +973,7 @@ class bad_action_error_msg(error_msg):
 error_msg.subtypes[2] = bad_action_error_msg
 
 class bad_instruction_error_msg(error_msg):
+    __slots__ = ["code", "data"]
     version = 4
     type = 1
     err_type = 3
@@ -981,34 +993,28 @@ class bad_instruction_error_msg(error_msg):
             self.data = ''
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!H", self.err_type))
-        packed.append(struct.pack("!H", self.code))
-        packed.append(self.data)
-        length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_BBHLHH, buf, offset, self.version, self.type, 0, self.xid, self.err_type, self.code)
+        offset = loxi.generic_util.pack_bytes_into(self.data, buf, offset)
+        length = offset - start
+        _struct_H.pack_into(buf, start + 2, length)
+        return offset
+
+    def wire_length(self):
+        return 12 + len(self.data)
 
     @staticmethod
     def unpack(reader):
         obj = bad_instruction_error_msg()
-        _version = reader.read("!B")[0]
+        _version, _type, _length = reader.read_struct(_struct_BBH)
         assert(_version == 4)
-        _type = reader.read("!B")[0]
         assert(_type == 1)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        _err_type = reader.read("!H")[0]
+        obj.xid, _err_type, obj.code = reader.read_struct(_struct_LHH)
         assert(_err_type == 3)
-        obj.code = reader.read("!H")[0]
-        obj.data = str(reader.read_all())
+        obj.data = reader.read_all()
         return obj
 
     def __eq__(self, other):
@@ -1040,6 +1046,7 @@ class bad_instruction_error_msg(error_msg):
 error_msg.subtypes[3] = bad_instruction_error_msg
 
 class bad_match_error_msg(error_msg):
+    __slots__ = ["code", "data"]
     version = 4
     type = 1
     err_type = 4
@@ -1059,34 +1066,28 @@ class bad_match_error_msg(error_msg):
             self.data = ''
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!H", self.err_type))
-        packed.append(struct.pack("!H", self.code))
-        packed.append(self.data)
-        length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_BBHLHH, buf, offset, self.version, self.type, 0, self.xid, self.err_type, self.code)
+        offset = loxi.generic_util.pack_bytes_into(self.data, buf, offset)
+        length = offset - start
+        _struct_H.pack_into(buf, start + 2, length)
+        return offset
+
+    def wire_length(self):
+        return 12 + len(self.data)
 
     @staticmethod
     def unpack(reader):
         obj = bad_match_error_msg()
-        _version = reader.read("!B")[0]
+        _version, _type, _length = reader.read_struct(_struct_BBH)
         assert(_version == 4)
-        _type = reader.read("!B")[0]
         assert(_type == 1)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        _err_type = reader.read("!H")[0]
+        obj.xid, _err_type, obj.code = reader.read_struct(_struct_LHH)
         assert(_err_type == 4)
-        obj.code = reader.read("!H")[0]
-        obj.data = str(reader.read_all())
+        obj.data = reader.read_all()
         return obj
 
     def __eq__(self, other):
@@ -1118,6 +1119,7 @@ class bad_match_error_msg(error_msg):
 error_msg.subtypes[4] = bad_match_error_msg
 
 class bad_request_error_msg(error_msg):
+    __slots__ = ["code", "data"]
     version = 4
     type = 1
     err_type = 1
@@ -1137,34 +1139,28 @@ class bad_request_error_msg(error_msg):
             self.data = ''
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!H", self.err_type))
-        packed.append(struct.pack("!H", self.code))
-        packed.append(self.data)
-        length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_BBHLHH, buf, offset, self.version, self.type, 0, self.xid, self.err_type, self.code)
+        offset = loxi.generic_util.pack_bytes_into(self.data, buf, offset)
+        length = offset - start
+        _struct_H.pack_into(buf, start + 2, length)
+        return offset
+
+    def wire_length(self):
+        return 12 + len(self.data)
 
     @staticmethod
     def unpack(reader):
         obj = bad_request_error_msg()
-        _version = reader.read("!B")[0]
+        _version, _type, _length = reader.read_struct(_struct_BBH)
         assert(_version == 4)
-        _type = reader.read("!B")[0]
         assert(_type == 1)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        _err_type = reader.read("!H")[0]
+        obj.xid, _err_type, obj.code = reader.read_struct(_struct_LHH)
         assert(_err_type == 1)
-        obj.code = reader.read("!H")[0]
-        obj.data = str(reader.read_all())
+        obj.data = reader.read_all()
         return obj
 
     def __eq__(self, other):
@@ -1196,6 +1192,7 @@ class bad_request_error_msg(error_msg):
 error_msg.subtypes[1] = bad_request_error_msg
 
 class barrier_reply(message):
+    __slots__ = []
     version = 4
     type = 21
 
@@ -1206,24 +1203,22 @@ class barrier_reply(message):
             self.xid = None
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_BBHL, buf, offset, self.version, self.type, 0, self.xid)
+        length = offset - start
+        _struct_H.pack_into(buf, start + 2, length)
+        return offset
+
+    def wire_length(self):
+        return 8
 
     @staticmethod
     def unpack(reader):
         obj = barrier_reply()
-        _version = reader.read("!B")[0]
+        _version, _type, _length = reader.read_struct(_struct_BBH)
         assert(_version == 4)
-        _type = reader.read("!B")[0]
         assert(_type == 21)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
         obj.xid = reader.read("!L")[0]
@@ -1250,6 +1245,7 @@ class barrier_reply(message):
 message.subtypes[21] = barrier_reply
 
 class barrier_request(message):
+    __slots__ = []
     version = 4
     type = 20
 
@@ -1260,24 +1256,22 @@ class barrier_request(message):
             self.xid = None
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_BBHL, buf, offset, self.version, self.type, 0, self.xid)
+        length = offset - start
+        _struct_H.pack_into(buf, start + 2, length)
+        return offset
+
+    def wire_length(self):
+        return 8
 
     @staticmethod
     def unpack(reader):
         obj = barrier_request()
-        _version = reader.read("!B")[0]
+        _version, _type, _length = reader.read_struct(_struct_BBH)
         assert(_version == 4)
-        _type = reader.read("!B")[0]
         assert(_type == 20)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
         obj.xid = reader.read("!L")[0]
@@ -1304,6 +1298,7 @@ class barrier_request(message):
 message.subtypes[20] = barrier_request
 
 class experimenter(message):
+    __slots__ = ["data", "experimenter", "subtype"]
     subtypes = {}
 
     version = 4
@@ -1328,18 +1323,16 @@ class experimenter(message):
             self.data = ''
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!L", self.experimenter))
-        packed.append(struct.pack("!L", self.subtype))
-        packed.append(self.data)
-        length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_BBHLLL, buf, offset, self.version, self.type, 0, self.xid, self.experimenter, self.subtype)
+        offset = loxi.generic_util.pack_bytes_into(self.data, buf, offset)
+        length = offset - start
+        _struct_H.pack_into(buf, start + 2, length)
+        return offset
+
+    def wire_length(self):
+        return 16 + len(self.data)
 
     @staticmethod
     def unpack(reader):
@@ -1349,17 +1342,13 @@ class experimenter(message):
             return subclass.unpack(reader)
 
         obj = experimenter()
-        _version = reader.read("!B")[0]
+        _version, _type, _length = reader.read_struct(_struct_BBH)
         assert(_version == 4)
-        _type = reader.read("!B")[0]
         assert(_type == 4)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        obj.experimenter = reader.read("!L")[0]
-        obj.subtype = reader.read("!L")[0]
-        obj.data = str(reader.read_all())
+        obj.xid, obj.experimenter, obj.subtype = reader.read_struct(_struct_LLL)
+        obj.data = reader.read_all()
         return obj
 
     def __eq__(self, other):
@@ -1392,6 +1381,7 @@ class experimenter(message):
 message.subtypes[4] = experimenter
 
 class bsn_header(experimenter):
+    __slots__ = []
     subtypes = {}
 
     version = 4
@@ -1409,17 +1399,15 @@ class bsn_header(experimenter):
             self.subtype = 0
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!L", self.experimenter))
-        packed.append(struct.pack("!L", self.subtype))
-        length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_BBHLLL, buf, offset, self.version, self.type, 0, self.xid, self.experimenter, self.subtype)
+        length = offset - start
+        _struct_H.pack_into(buf, start + 2, length)
+        return offset
+
+    def wire_length(self):
+        return 16
 
     @staticmethod
     def unpack(reader):
@@ -1429,17 +1417,13 @@ class bsn_header(experimenter):
             return subclass.unpack(reader)
 
         obj = bsn_header()
-        _version = reader.read("!B")[0]
+        _version, _type, _length = reader.read_struct(_struct_BBH)
         assert(_version == 4)
-        _type = reader.read("!B")[0]
         assert(_type == 4)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        _experimenter = reader.read("!L")[0]
+        obj.xid, _experimenter, obj.subtype = reader.read_struct(_struct_LLL)
         assert(_experimenter == 6035143)
-        obj.subtype = reader.read("!L")[0]
         return obj
 
     def __eq__(self, other):
@@ -1464,6 +1448,7 @@ class bsn_header(experimenter):
 experimenter.subtypes[6035143] = bsn_header
 
 class bsn_arp_idle(bsn_header):
+    __slots__ = ["ipv4_addr", "vlan_vid"]
     version = 4
     type = 4
     experimenter = 6035143
@@ -1484,39 +1469,27 @@ class bsn_arp_idle(bsn_header):
             self.ipv4_addr = 0
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!L", self.experimenter))
-        packed.append(struct.pack("!L", self.subtype))
-        packed.append(struct.pack("!H", self.vlan_vid))
-        packed.append('\x00' * 2)
-        packed.append(struct.pack("!L", self.ipv4_addr))
-        length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_BBHLLLH2xL, buf, offset, self.version, self.type, 0, self.xid, self.experimenter, self.subtype, self.vlan_vid, self.ipv4_addr)
+        length = offset - start
+        _struct_H.pack_into(buf, start + 2, length)
+        return offset
+
+    def wire_length(self):
+        return 24
 
     @staticmethod
     def unpack(reader):
         obj = bsn_arp_idle()
-        _version = reader.read("!B")[0]
+        _version, _type, _length = reader.read_struct(_struct_BBH)
         assert(_version == 4)
-        _type = reader.read("!B")[0]
         assert(_type == 4)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        _experimenter = reader.read("!L")[0]
+        obj.xid, _experimenter, _subtype, obj.vlan_vid, obj.ipv4_addr = reader.read_struct(_struct_LLLH2xL)
         assert(_experimenter == 6035143)
-        _subtype = reader.read("!L")[0]
         assert(_subtype == 60)
-        obj.vlan_vid = reader.read("!H")[0]
-        reader.skip(2)
-        obj.ipv4_addr = reader.read("!L")[0]
         return obj
 
     def __eq__(self, other):
@@ -1548,6 +1521,7 @@ class bsn_arp_idle(bsn_header):
 bsn_header.subtypes[60] = bsn_arp_idle
 
 class bsn_bw_clear_data_reply(bsn_header):
+    __slots__ = ["status"]
     version = 4
     type = 4
     experimenter = 6035143
@@ -1564,35 +1538,27 @@ class bsn_bw_clear_data_reply(bsn_header):
             self.status = 0
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!L", self.experimenter))
-        packed.append(struct.pack("!L", self.subtype))
-        packed.append(struct.pack("!L", self.status))
-        length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_BBHLLLL, buf, offset, self.version, self.type, 0, self.xid, self.experimenter, self.subtype, self.status)
+        length = offset - start
+        _struct_H.pack_into(buf, start + 2, length)
+        return offset
+
+    def wire_length(self):
+        return 20
 
     @staticmethod
     def unpack(reader):
         obj = bsn_bw_clear_data_reply()
-        _version = reader.read("!B")[0]
+        _version, _type, _length = reader.read_struct(_struct_BBH)
         assert(_version == 4)
-        _type = reader.read("!B")[0]
         assert(_type == 4)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        _experimenter = reader.read("!L")[0]
+        obj.xid, _experimenter, _subtype, obj.status = reader.read_struct(_struct_LLLL)
         assert(_experimenter == 6035143)
-        _subtype = reader.read("!L")[0]
         assert(_subtype == 22)
-        obj.status = reader.read("!L")[0]
         return obj
 
     def __eq__(self, other):
@@ -1620,6 +1586,7 @@ class bsn_bw_clear_data_reply(bsn_header):
 bsn_header.subtypes[22] = bsn_bw_clear_data_reply
 
 class bsn_bw_clear_data_request(bsn_header):
+    __slots__ = []
     version = 4
     type = 4
     experimenter = 6035143
@@ -1632,32 +1599,26 @@ class bsn_bw_clear_data_request(bsn_header):
             self.xid = None
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!L", self.experimenter))
-        packed.append(struct.pack("!L", self.subtype))
-        length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_BBHLLL, buf, offset, self.version, self.type, 0, self.xid, self.experimenter, self.subtype)
+        length = offset - start
+        _struct_H.pack_into(buf, start + 2, length)
+        return offset
+
+    def wire_length(self):
+        return 16
 
     @staticmethod
     def unpack(reader):
         obj = bsn_bw_clear_data_request()
-        _version = reader.read("!B")[0]
+        _version, _type, _length = reader.read_struct(_struct_BBH)
         assert(_version == 4)
-        _type = reader.read("!B")[0]
         assert(_type == 4)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        _experimenter = reader.read("!L")[0]
+        obj.xid, _experimenter, _subtype = reader.read_struct(_struct_LLL)
         assert(_experimenter == 6035143)
-        _subtype = reader.read("!L")[0]
         assert(_subtype == 21)
         return obj
 
@@ -1682,6 +1643,7 @@ class bsn_bw_clear_data_request(bsn_header):
 bsn_header.subtypes[21] = bsn_bw_clear_data_request
 
 class bsn_bw_enable_get_reply(bsn_header):
+    __slots__ = ["enabled"]
     version = 4
     type = 4
     experimenter = 6035143
@@ -1698,35 +1660,27 @@ class bsn_bw_enable_get_reply(bsn_header):
             self.enabled = 0
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!L", self.experimenter))
-        packed.append(struct.pack("!L", self.subtype))
-        packed.append(struct.pack("!L", self.enabled))
-        length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_BBHLLLL, buf, offset, self.version, self.type, 0, self.xid, self.experimenter, self.subtype, self.enabled)
+        length = offset - start
+        _struct_H.pack_into(buf, start + 2, length)
+        return offset
+
+    def wire_length(self):
+        return 20
 
     @staticmethod
     def unpack(reader):
         obj = bsn_bw_enable_get_reply()
-        _version = reader.read("!B")[0]
+        _version, _type, _length = reader.read_struct(_struct_BBH)
         assert(_version == 4)
-        _type = reader.read("!B")[0]
         assert(_type == 4)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        _experimenter = reader.read("!L")[0]
+        obj.xid, _experimenter, _subtype, obj.enabled = reader.read_struct(_struct_LLLL)
         assert(_experimenter == 6035143)
-        _subtype = reader.read("!L")[0]
         assert(_subtype == 20)
-        obj.enabled = reader.read("!L")[0]
         return obj
 
     def __eq__(self, other):
@@ -1754,6 +1708,7 @@ class bsn_bw_enable_get_reply(bsn_header):
 bsn_header.subtypes[20] = bsn_bw_enable_get_reply
 
 class bsn_bw_enable_get_request(bsn_header):
+    __slots__ = []
     version = 4
     type = 4
     experimenter = 6035143
@@ -1766,32 +1721,26 @@ class bsn_bw_enable_get_request(bsn_header):
             self.xid = None
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!L", self.experimenter))
-        packed.append(struct.pack("!L", self.subtype))
-        length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_BBHLLL, buf, offset, self.version, self.type, 0, self.xid, self.experimenter, self.subtype)
+        length = offset - start
+        _struct_H.pack_into(buf, start + 2, length)
+        return offset
+
+    def wire_length(self):
+        return 16
 
     @staticmethod
     def unpack(reader):
         obj = bsn_bw_enable_get_request()
-        _version = reader.read("!B")[0]
+        _version, _type, _length = reader.read_struct(_struct_BBH)
         assert(_version == 4)
-        _type = reader.read("!B")[0]
         assert(_type == 4)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        _experimenter = reader.read("!L")[0]
+        obj.xid, _experimenter, _subtype = reader.read_struct(_struct_LLL)
         assert(_experimenter == 6035143)
-        _subtype = reader.read("!L")[0]
         assert(_subtype == 19)
         return obj
 
@@ -1816,6 +1765,7 @@ class bsn_bw_enable_get_request(bsn_header):
 bsn_header.subtypes[19] = bsn_bw_enable_get_request
 
 class bsn_bw_enable_set_reply(bsn_header):
+    __slots__ = ["enable", "status"]
     version = 4
     type = 4
     experimenter = 6035143
@@ -1836,37 +1786,27 @@ class bsn_bw_enable_set_reply(bsn_header):
             self.status = 0
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!L", self.experimenter))
-        packed.append(struct.pack("!L", self.subtype))
-        packed.append(struct.pack("!L", self.enable))
-        packed.append(struct.pack("!L", self.status))
-        length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_BBHLLLLL, buf, offset, self.version, self.type, 0, self.xid, self.experimenter, self.subtype, self.enable, self.status)
+        length = offset - start
+        _struct_H.pack_into(buf, start + 2, length)
+        return offset
+
+    def wire_length(self):
+        return 24
 
     @staticmethod
     def unpack(reader):
         obj = bsn_bw_enable_set_reply()
-        _version = reader.read("!B")[0]
+        _version, _type, _length = reader.read_struct(_struct_BBH)
         assert(_version == 4)
-        _type = reader.read("!B")[0]
         assert(_type == 4)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        _experimenter = reader.read("!L")[0]
+        obj.xid, _experimenter, _subtype, obj.enable, obj.status = reader.read_struct(_struct_LLLLL)
         assert(_experimenter == 6035143)
-        _subtype = reader.read("!L")[0]
         assert(_subtype == 23)
-        obj.enable = reader.read("!L")[0]
-        obj.status = reader.read("!L")[0]
         return obj
 
     def __eq__(self, other):
@@ -1898,6 +1838,7 @@ class bsn_bw_enable_set_reply(bsn_header):
 bsn_header.subtypes[23] = bsn_bw_enable_set_reply
 
 class bsn_bw_enable_set_request(bsn_header):
+    __slots__ = ["enable"]
     version = 4
     type = 4
     experimenter = 6035143
@@ -1914,35 +1855,27 @@ class bsn_bw_enable_set_request(bsn_header):
             self.enable = 0
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!L", self.experimenter))
-        packed.append(struct.pack("!L", self.subtype))
-        packed.append(struct.pack("!L", self.enable))
-        length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_BBHLLLL, buf, offset, self.version, self.type, 0, self.xid, self.experimenter, self.subtype, self.enable)
+        length = offset - start
+        _struct_H.pack_into(buf, start + 2, length)
+        return offset
+
+    def wire_length(self):
+        return 20
 
     @staticmethod
     def unpack(reader):
         obj = bsn_bw_enable_set_request()
-        _version = reader.read("!B")[0]
+        _version, _type, _length = reader.read_struct(_struct_BBH)
         assert(_version == 4)
-        _type = reader.read("!B")[0]
         assert(_type == 4)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        _experimenter = reader.read("!L")[0]
+        obj.xid, _experimenter, _subtype, obj.enable = reader.read_struct(_struct_LLLL)
         assert(_experimenter == 6035143)
-        _subtype = reader.read("!L")[0]
         assert(_subtype == 18)
-        obj.enable = reader.read("!L")[0]
         return obj
 
     def __eq__(self, other):
@@ -1970,6 +1903,7 @@ class bsn_bw_enable_set_request(bsn_header):
 bsn_header.subtypes[18] = bsn_bw_enable_set_request
 
 class bsn_controller_connections_reply(bsn_header):
+    __slots__ = ["connections"]
     version = 4
     type = 4
     experimenter = 6035143
@@ -1986,33 +1920,27 @@ class bsn_controller_connections_reply(bsn_header):
             self.connections = []
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!L", self.experimenter))
-        packed.append(struct.pack("!L", self.subtype))
-        packed.append(loxi.generic_util.pack_list(self.connections))
-        length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_BBHLLL, buf, offset, self.version, self.type, 0, self.xid, self.experimenter, self.subtype)
+        offset = loxi.generic_util.pack_list_into(self.connections, buf, offset)
+        length = offset - start
+        _struct_H.pack_into(buf, start + 2, length)
+        return offset
+
+    def wire_length(self):
+        return 16 + loxi.generic_util.list_wire_length(self.connections)
 
     @staticmethod
     def unpack(reader):
         obj = bsn_controller_connections_reply()
-        _version = reader.read("!B")[0]
+        _version, _type, _length = reader.read_struct(_struct_BBH)
         assert(_version == 4)
-        _type = reader.read("!B")[0]
         assert(_type == 4)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        _experimenter = reader.read("!L")[0]
+        obj.xid, _experimenter, _subtype = reader.read_struct(_struct_LLL)
         assert(_experimenter == 6035143)
-        _subtype = reader.read("!L")[0]
         assert(_subtype == 57)
         obj.connections = loxi.generic_util.unpack_list(reader, ofp.common.bsn_controller_connection.unpack)
         return obj
@@ -2042,6 +1970,7 @@ class bsn_controller_connections_reply(bsn_header):
 bsn_header.subtypes[57] = bsn_controller_connections_reply
 
 class bsn_controller_connections_request(bsn_header):
+    __slots__ = []
     version = 4
     type = 4
     experimenter = 6035143
@@ -2054,32 +1983,26 @@ class bsn_controller_connections_request(bsn_header):
             self.xid = None
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!L", self.experimenter))
-        packed.append(struct.pack("!L", self.subtype))
-        length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_BBHLLL, buf, offset, self.version, self.type, 0, self.xid, self.experimenter, self.subtype)
+        length = offset - start
+        _struct_H.pack_into(buf, start + 2, length)
+        return offset
+
+    def wire_length(self):
+        return 16
 
     @staticmethod
     def unpack(reader):
         obj = bsn_controller_connections_request()
-        _version = reader.read("!B")[0]
+        _version, _type, _length = reader.read_struct(_struct_BBH)
         assert(_version == 4)
-        _type = reader.read("!B")[0]
         assert(_type == 4)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        _experimenter = reader.read("!L")[0]
+        obj.xid, _experimenter, _subtype = reader.read_struct(_struct_LLL)
         assert(_experimenter == 6035143)
-        _subtype = reader.read("!L")[0]
         assert(_subtype == 56)
         return obj
 
@@ -2104,6 +2027,7 @@ class bsn_controller_connections_request(bsn_header):
 bsn_header.subtypes[56] = bsn_controller_connections_request
 
 class experimenter_stats_reply(stats_reply):
+    __slots__ = ["experimenter", "subtype"]
     subtypes = {}
 
     version = 4
@@ -2129,20 +2053,15 @@ class experimenter_stats_reply(stats_reply):
             self.subtype = 0
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!H", self.stats_type))
-        packed.append(struct.pack("!H", self.flags))
-        packed.append('\x00' * 4)
-        packed.append(struct.pack("!L", self.experimenter))
-        packed.append(struct.pack("!L", self.subtype))
-        length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_BBHLHH4xLL, buf, offset, self.version, self.type, 0, self.xid, self.stats_type, self.flags, self.experimenter, self.subtype)
+        length = offset - start
+        _struct_H.pack_into(buf, start + 2, length)
+        return offset
+
+    def wire_length(self):
+        return 24
 
     @staticmethod
     def unpack(reader):
@@ -2152,20 +2071,13 @@ class experimenter_stats_reply(stats_reply):
             return subclass.unpack(reader)
 
         obj = experimenter_stats_reply()
-        _version = reader.read("!B")[0]
+        _version, _type, _length = reader.read_struct(_struct_BBH)
         assert(_version == 4)
-        _type = reader.read("!B")[0]
         assert(_type == 19)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        _stats_type = reader.read("!H")[0]
+        obj.xid, _stats_type, obj.flags, obj.experimenter, obj.subtype = reader.read_struct(_struct_LHH4xLL)
         assert(_stats_type == 65535)
-        obj.flags = reader.read("!H")[0]
-        reader.skip(4)
-        obj.experimenter = reader.read("!L")[0]
-        obj.subtype = reader.read("!L")[0]
         return obj
 
     def __eq__(self, other):
@@ -2198,6 +2110,7 @@ class experimenter_stats_reply(stats_reply):
 stats_reply.subtypes[65535] = experimenter_stats_reply
 
 class bsn_stats_reply(experimenter_stats_reply):
+    __slots__ = []
     subtypes = {}
 
     version = 4
@@ -2220,20 +2133,15 @@ class bsn_stats_reply(experimenter_stats_reply):
             self.subtype = 0
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!H", self.stats_type))
-        packed.append(struct.pack("!H", self.flags))
-        packed.append('\x00' * 4)
-        packed.append(struct.pack("!L", self.experimenter))
-        packed.append(struct.pack("!L", self.subtype))
-        length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_BBHLHH4xLL, buf, offset, self.version, self.type, 0, self.xid, self.stats_type, self.flags, self.experimenter, self.subtype)
+        length = offset - start
+        _struct_H.pack_into(buf, start + 2, length)
+        return offset
+
+    def wire_length(self):
+        return 24
 
     @staticmethod
     def unpack(reader):
@@ -2243,21 +2151,14 @@ class bsn_stats_reply(experimenter_stats_reply):
             return subclass.unpack(reader)
 
         obj = bsn_stats_reply()
-        _version = reader.read("!B")[0]
+        _version, _type, _length = reader.read_struct(_struct_BBH)
         assert(_version == 4)
-        _type = reader.read("!B")[0]
         assert(_type == 19)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        _stats_type = reader.read("!H")[0]
+        obj.xid, _stats_type, obj.flags, _experimenter, obj.subtype = reader.read_struct(_struct_LHH4xLL)
         assert(_stats_type == 65535)
-        obj.flags = reader.read("!H")[0]
-        reader.skip(4)
-        _experimenter = reader.read("!L")[0]
         assert(_experimenter == 6035143)
-        obj.subtype = reader.read("!L")[0]
         return obj
 
     def __eq__(self, other):
@@ -2286,6 +2187,7 @@ class bsn_stats_reply(experimenter_stats_reply):
 experimenter_stats_reply.subtypes[6035143] = bsn_stats_reply
 
 class bsn_debug_counter_desc_stats_reply(bsn_stats_reply):
+    __slots__ = ["entries"]
     version = 4
     type = 19
     stats_type = 65535
@@ -2307,40 +2209,28 @@ class bsn_debug_counter_desc_stats_reply(bsn_stats_reply):
             self.entries = []
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!H", self.stats_type))
-        packed.append(struct.pack("!H", self.flags))
-        packed.append('\x00' * 4)
-        packed.append(struct.pack("!L", self.experimenter))
-        packed.append(struct.pack("!L", self.subtype))
-        packed.append(loxi.generic_util.pack_list(self.entries))
-        length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_BBHLHH4xLL, buf, offset, self.version, self.type, 0, self.xid, self.stats_type, self.flags, self.experimenter, self.subtype)
+        offset = loxi.generic_util.pack_list_into(self.entries, buf, offset)
+        length = offset - start
+        _struct_H.pack_into(buf, start + 2, length)
+        return offset
+
+    def wire_length(self):
+        return 24 + loxi.generic_util.list_wire_length(self.entries)
 
     @staticmethod
     def unpack(reader):
         obj = bsn_debug_counter_desc_stats_reply()
-        _version = reader.read("!B")[0]
+        _version, _type, _length = reader.read_struct(_struct_BBH)
         assert(_version == 4)
-        _type = reader.read("!B")[0]
         assert(_type == 19)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        _stats_type = reader.read("!H")[0]
+        obj.xid, _stats_type, obj.flags, _experimenter, _subtype = reader.read_struct(_struct_LHH4xLL)
         assert(_stats_type == 65535)
-        obj.flags = reader.read("!H")[0]
-        reader.skip(4)
-        _experimenter = reader.read("!L")[0]
         assert(_experimenter == 6035143)
-        _subtype = reader.read("!L")[0]
         assert(_subtype == 13)
         obj.entries = loxi.generic_util.unpack_list(reader, ofp.common.bsn_debug_counter_desc_stats_entry.unpack)
         return obj
@@ -2374,6 +2264,7 @@ class bsn_debug_counter_desc_stats_reply(bsn_stats_reply):
 bsn_stats_reply.subtypes[13] = bsn_debug_counter_desc_stats_reply
 
 class experimenter_stats_request(stats_request):
+    __slots__ = ["experimenter", "subtype"]
     subtypes = {}
 
     version = 4
@@ -2399,20 +2290,15 @@ class experimenter_stats_request(stats_request):
             self.subtype = 0
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!H", self.stats_type))
-        packed.append(struct.pack("!H", self.flags))
-        packed.append('\x00' * 4)
-        packed.append(struct.pack("!L", self.experimenter))
-        packed.append(struct.pack("!L", self.subtype))
-        length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_BBHLHH4xLL, buf, offset, self.version, self.type, 0, self.xid, self.stats_type, self.flags, self.experimenter, self.subtype)
+        length = offset - start
+        _struct_H.pack_into(buf, start + 2, length)
+        return offset
+
+    def wire_length(self):
+        return 24
 
     @staticmethod
     def unpack(reader):
@@ -2422,20 +2308,13 @@ class experimenter_stats_request(stats_request):
             return subclass.unpack(reader)
 
         obj = experimenter_stats_request()
-        _version = reader.read("!B")[0]
+        _version, _type, _length = reader.read_struct(_struct_BBH)
         assert(_version == 4)
-        _type = reader.read("!B")[0]
         assert(_type == 18)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        _stats_type = reader.read("!H")[0]
+        obj.xid, _stats_type, obj.flags, obj.experimenter, obj.subtype = reader.read_struct(_struct_LHH4xLL)
         assert(_stats_type == 65535)
-        obj.flags = reader.read("!H")[0]
-        reader.skip(4)
-        obj.experimenter = reader.read("!L")[0]
-        obj.subtype = reader.read("!L")[0]
         return obj
 
     def __eq__(self, other):
@@ -2468,6 +2347,7 @@ class experimenter_stats_request(stats_request):
 stats_request.subtypes[65535] = experimenter_stats_request
 
 class bsn_stats_request(experimenter_stats_request):
+    __slots__ = []
     subtypes = {}
 
     version = 4
@@ -2490,20 +2370,15 @@ class bsn_stats_request(experimenter_stats_request):
             self.subtype = 0
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!H", self.stats_type))
-        packed.append(struct.pack("!H", self.flags))
-        packed.append('\x00' * 4)
-        packed.append(struct.pack("!L", self.experimenter))
-        packed.append(struct.pack("!L", self.subtype))
-        length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_BBHLHH4xLL, buf, offset, self.version, self.type, 0, self.xid, self.stats_type, self.flags, self.experimenter, self.subtype)
+        length = offset - start
+        _struct_H.pack_into(buf, start + 2, length)
+        return offset
+
+    def wire_length(self):
+        return 24
 
     @staticmethod
     def unpack(reader):
@@ -2513,21 +2388,14 @@ class bsn_stats_request(experimenter_stats_request):
             return subclass.unpack(reader)
 
         obj = bsn_stats_request()
-        _version = reader.read("!B")[0]
+        _version, _type, _length = reader.read_struct(_struct_BBH)
         assert(_version == 4)
-        _type = reader.read("!B")[0]
         assert(_type == 18)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        _stats_type = reader.read("!H")[0]
+        obj.xid, _stats_type, obj.flags, _experimenter, obj.subtype = reader.read_struct(_struct_LHH4xLL)
         assert(_stats_type == 65535)
-        obj.flags = reader.read("!H")[0]
-        reader.skip(4)
-        _experimenter = reader.read("!L")[0]
         assert(_experimenter == 6035143)
-        obj.subtype = reader.read("!L")[0]
         return obj
 
     def __eq__(self, other):
@@ -2556,6 +2424,7 @@ class bsn_stats_request(experimenter_stats_request):
 experimenter_stats_request.subtypes[6035143] = bsn_stats_request
 
 class bsn_debug_counter_desc_stats_request(bsn_stats_request):
+    __slots__ = []
     version = 4
     type = 18
     stats_type = 65535
@@ -2573,39 +2442,27 @@ class bsn_debug_counter_desc_stats_request(bsn_stats_request):
             self.flags = 0
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!H", self.stats_type))
-        packed.append(struct.pack("!H", self.flags))
-        packed.append('\x00' * 4)
-        packed.append(struct.pack("!L", self.experimenter))
-        packed.append(struct.pack("!L", self.subtype))
-        length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_BBHLHH4xLL, buf, offset, self.version, self.type, 0, self.xid, self.stats_type, self.flags, self.experimenter, self.subtype)
+        length = offset - start
+        _struct_H.pack_into(buf, start + 2, length)
+        return offset
+
+    def wire_length(self):
+        return 24
 
     @staticmethod
     def unpack(reader):
         obj = bsn_debug_counter_desc_stats_request()
-        _version = reader.read("!B")[0]
+        _version, _type, _length = reader.read_struct(_struct_BBH)
         assert(_version == 4)
-        _type = reader.read("!B")[0]
         assert(_type == 18)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        _stats_type = reader.read("!H")[0]
+        obj.xid, _stats_type, obj.flags, _experimenter, _subtype = reader.read_struct(_struct_LHH4xLL)
         assert(_stats_type == 65535)
-        obj.flags = reader.read("!H")[0]
-        reader.skip(4)
-        _experimenter = reader.read("!L")[0]
         assert(_experimenter == 6035143)
-        _subtype = reader.read("!L")[0]
         assert(_subtype == 13)
         return obj
 
@@ -2634,6 +2491,7 @@ class bsn_debug_counter_desc_stats_request(bsn_stats_request):
 bsn_stats_request.subtypes[13] = bsn_debug_counter_desc_stats_request
 
 class bsn_debug_counter_stats_reply(bsn_stats_reply):
+    __slots__ = ["entries"]
     version = 4
     type = 19
     stats_type = 65535
@@ -2655,40 +2513,28 @@ class bsn_debug_counter_stats_reply(bsn_stats_reply):
             self.entries = []
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!H", self.stats_type))
-        packed.append(struct.pack("!H", self.flags))
-        packed.append('\x00' * 4)
-        packed.append(struct.pack("!L", self.experimenter))
-        packed.append(struct.pack("!L", self.subtype))
-        packed.append(loxi.generic_util.pack_list(self.entries))
-        length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_BBHLHH4xLL, buf, offset, self.version, self.type, 0, self.xid, self.stats_type, self.flags, self.experimenter, self.subtype)
+        offset = loxi.generic_util.pack_list_into(self.entries, buf, offset)
+        length = offset - start
+        _struct_H.pack_into(buf, start + 2, length)
+        return offset
+
+    def wire_length(self):
+        return 24 + loxi.generic_util.list_wire_length(self.entries)
 
     @staticmethod
     def unpack(reader):
         obj = bsn_debug_counter_stats_reply()
-        _version = reader.read("!B")[0]
+        _version, _type, _length = reader.read_struct(_struct_BBH)
         assert(_version == 4)
-        _type = reader.read("!B")[0]
         assert(_type == 19)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        _stats_type = reader.read("!H")[0]
+        obj.xid, _stats_type, obj.flags, _experimenter, _subtype = reader.read_struct(_struct_LHH4xLL)
         assert(_stats_type == 65535)
-        obj.flags = reader.read("!H")[0]
-        reader.skip(4)
-        _experimenter = reader.read("!L")[0]
         assert(_experimenter == 6035143)
-        _subtype = reader.read("!L")[0]
         assert(_subtype == 12)
         obj.entries = loxi.generic_util.unpack_list(reader, ofp.common.bsn_debug_counter_stats_entry.unpack)
         return obj
@@ -2722,6 +2568,7 @@ class bsn_debug_counter_stats_reply(bsn_stats_reply):
 bsn_stats_reply.subtypes[12] = bsn_debug_counter_stats_reply
 
 class bsn_debug_counter_stats_request(bsn_stats_request):
+    __slots__ = []
     version = 4
     type = 18
     stats_type = 65535
@@ -2739,39 +2586,27 @@ class bsn_debug_counter_stats_request(bsn_stats_request):
             self.flags = 0
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!H", self.stats_type))
-        packed.append(struct.pack("!H", self.flags))
-        packed.append('\x00' * 4)
-        packed.append(struct.pack("!L", self.experimenter))
-        packed.append(struct.pack("!L", self.subtype))
-        length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_BBHLHH4xLL, buf, offset, self.version, self.type, 0, self.xid, self.stats_type, self.flags, self.experimenter, self.subtype)
+        length = offset - start
+        _struct_H.pack_into(buf, start + 2, length)
+        return offset
+
+    def wire_length(self):
+        return 24
 
     @staticmethod
     def unpack(reader):
         obj = bsn_debug_counter_stats_request()
-        _version = reader.read("!B")[0]
+        _version, _type, _length = reader.read_struct(_struct_BBH)
         assert(_version == 4)
-        _type = reader.read("!B")[0]
         assert(_type == 18)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        _stats_type = reader.read("!H")[0]
+        obj.xid, _stats_type, obj.flags, _experimenter, _subtype = reader.read_struct(_struct_LHH4xLL)
         assert(_stats_type == 65535)
-        obj.flags = reader.read("!H")[0]
-        reader.skip(4)
-        _experimenter = reader.read("!L")[0]
         assert(_experimenter == 6035143)
-        _subtype = reader.read("!L")[0]
         assert(_subtype == 12)
         return obj
 
@@ -2800,6 +2635,7 @@ class bsn_debug_counter_stats_request(bsn_stats_request):
 bsn_stats_request.subtypes[12] = bsn_debug_counter_stats_request
 
 class bsn_flow_checksum_bucket_stats_reply(bsn_stats_reply):
+    __slots__ = ["entries"]
     version = 4
     type = 19
     stats_type = 65535
@@ -2821,40 +2657,28 @@ class bsn_flow_checksum_bucket_stats_reply(bsn_stats_reply):
             self.entries = []
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!H", self.stats_type))
-        packed.append(struct.pack("!H", self.flags))
-        packed.append('\x00' * 4)
-        packed.append(struct.pack("!L", self.experimenter))
-        packed.append(struct.pack("!L", self.subtype))
-        packed.append(loxi.generic_util.pack_list(self.entries))
-        length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_BBHLHH4xLL, buf, offset, self.version, self.type, 0, self.xid, self.stats_type, self.flags, self.experimenter, self.subtype)
+        offset = loxi.generic_util.pack_list_into(self.entries, buf, offset)
+        length = offset - start
+        _struct_H.pack_into(buf, start + 2, length)
+        return offset
+
+    def wire_length(self):
+        return 24 + loxi.generic_util.list_wire_length(self.entries)
 
     @staticmethod
     def unpack(reader):
         obj = bsn_flow_checksum_bucket_stats_reply()
-        _version = reader.read("!B")[0]
+        _version, _type, _length = reader.read_struct(_struct_BBH)
         assert(_version == 4)
-        _type = reader.read("!B")[0]
         assert(_type == 19)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        _stats_type = reader.read("!H")[0]
+        obj.xid, _stats_type, obj.flags, _experimenter, _subtype = reader.read_struct(_struct_LHH4xLL)
         assert(_stats_type == 65535)
-        obj.flags = reader.read("!H")[0]
-        reader.skip(4)
-        _experimenter = reader.read("!L")[0]
         assert(_experimenter == 6035143)
-        _subtype = reader.read("!L")[0]
         assert(_subtype == 10)
         obj.entries = loxi.generic_util.unpack_list(reader, ofp.common.bsn_flow_checksum_bucket_stats_entry.unpack)
         return obj
@@ -2888,6 +2712,7 @@ class bsn_flow_checksum_bucket_stats_reply(bsn_stats_reply):
 bsn_stats_reply.subtypes[10] = bsn_flow_checksum_bucket_stats_reply
 
 class bsn_flow_checksum_bucket_stats_request(bsn_stats_request):
+    __slots__ = ["table_id"]
     version = 4
     type = 18
     stats_type = 65535
@@ -2909,42 +2734,28 @@ class bsn_flow_checksum_bucket_stats_request(bsn_stats_request):
             self.table_id = 0
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!H", self.stats_type))
-        packed.append(struct.pack("!H", self.flags))
-        packed.append('\x00' * 4)
-        packed.append(struct.pack("!L", self.experimenter))
-        packed.append(struct.pack("!L", self.subtype))
-        packed.append(struct.pack("!B", self.table_id))
-        length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_BBHLHH4xLLB, buf, offset, self.version, self.type, 0, self.xid, self.stats_type, self.flags, self.experimenter, self.subtype, self.table_id)
+        length = offset - start
+        _struct_H.pack_into(buf, start + 2, length)
+        return offset
+
+    def wire_length(self):
+        return 25
 
     @staticmethod
     def unpack(reader):
         obj = bsn_flow_checksum_bucket_stats_request()
-        _version = reader.read("!B")[0]
+        _version, _type, _length = reader.read_struct(_struct_BBH)
         assert(_version == 4)
-        _type = reader.read("!B")[0]
         assert(_type == 18)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        _stats_type = reader.read("!H")[0]
+        obj.xid, _stats_type, obj.flags, _experimenter, _subtype, obj.table_id = reader.read_struct(_struct_LHH4xLLB)
         assert(_stats_type == 65535)
-        obj.flags = reader.read("!H")[0]
-        reader.skip(4)
-        _experimenter = reader.read("!L")[0]
         assert(_experimenter == 6035143)
-        _subtype = reader.read("!L")[0]
         assert(_subtype == 10)
-        obj.table_id = reader.read("!B")[0]
         return obj
 
     def __eq__(self, other):
@@ -2976,6 +2787,7 @@ class bsn_flow_checksum_bucket_stats_request(bsn_stats_request):
 bsn_stats_request.subtypes[10] = bsn_flow_checksum_bucket_stats_request
 
 class bsn_flow_idle(bsn_header):
+    __slots__ = ["cookie", "match", "priority", "table_id"]
     version = 4
     type = 4
     experimenter = 6035143
@@ -3004,42 +2816,28 @@ class bsn_flow_idle(bsn_header):
             self.match = ofp.match()
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!L", self.experimenter))
-        packed.append(struct.pack("!L", self.subtype))
-        packed.append(struct.pack("!Q", self.cookie))
-        packed.append(struct.pack("!H", self.priority))
-        packed.append(struct.pack("!B", self.table_id))
-        packed.append('\x00' * 5)
-        packed.append(self.match.pack())
-        length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_BBHLLLQHB5x, buf, offset, self.version, self.type, 0, self.xid, self.experimenter, self.subtype, self.cookie, self.priority, self.table_id)
+        offset = self.match.pack_into(buf, offset)
+        length = offset - start
+        _struct_H.pack_into(buf, start + 2, length)
+        return offset
+
+    def wire_length(self):
+        return 32 + self.match.wire_length()
 
     @staticmethod
     def unpack(reader):
         obj = bsn_flow_idle()
-        _version = reader.read("!B")[0]
+        _version, _type, _length = reader.read_struct(_struct_BBH)
         assert(_version == 4)
-        _type = reader.read("!B")[0]
         assert(_type == 4)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        _experimenter = reader.read("!L")[0]
+        obj.xid, _experimenter, _subtype, obj.cookie, obj.priority, obj.table_id = reader.read_struct(_struct_LLLQHB5x)
         assert(_experimenter == 6035143)
-        _subtype = reader.read("!L")[0]
         assert(_subtype == 40)
-        obj.cookie = reader.read("!Q")[0]
-        obj.priority = reader.read("!H")[0]
-        obj.table_id = reader.read("!B")[0]
-        reader.skip(5)
         obj.match = ofp.match.unpack(reader)
         return obj
 
@@ -3080,6 +2878,7 @@ class bsn_flow_idle(bsn_header):
 bsn_header.subtypes[40] = bsn_flow_idle
 
 class bsn_flow_idle_enable_get_reply(bsn_header):
+    __slots__ = ["enabled"]
     version = 4
     type = 4
     experimenter = 6035143
@@ -3096,35 +2895,27 @@ class bsn_flow_idle_enable_get_reply(bsn_header):
             self.enabled = 0
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!L", self.experimenter))
-        packed.append(struct.pack("!L", self.subtype))
-        packed.append(struct.pack("!L", self.enabled))
-        length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_BBHLLLL, buf, offset, self.version, self.type, 0, self.xid, self.experimenter, self.subtype, self.enabled)
+        length = offset - start
+        _struct_H.pack_into(buf, start + 2, length)
+        return offset
+
+    def wire_length(self):
+        return 20
 
     @staticmethod
     def unpack(reader):
         obj = bsn_flow_idle_enable_get_reply()
-        _version = reader.read("!B")[0]
+        _version, _type, _length = reader.read_struct(_struct_BBH)
         assert(_version == 4)
-        _type = reader.read("!B")[0]
         assert(_type == 4)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        _experimenter = reader.read("!L")[0]
+        obj.xid, _experimenter, _subtype, obj.enabled = reader.read_struct(_struct_LLLL)
         assert(_experimenter == 6035143)
-        _subtype = reader.read("!L")[0]
         assert(_subtype == 39)
-        obj.enabled = reader.read("!L")[0]
         return obj
 
     def __eq__(self, other):
@@ -3152,6 +2943,7 @@ class bsn_flow_idle_enable_get_reply(bsn_header):
 bsn_header.subtypes[39] = bsn_flow_idle_enable_get_reply
 
 class bsn_flow_idle_enable_get_request(bsn_header):
+    __slots__ = []
     version = 4
     type = 4
     experimenter = 6035143
@@ -3164,32 +2956,26 @@ class bsn_flow_idle_enable_get_request(bsn_header):
             self.xid = None
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!L", self.experimenter))
-        packed.append(struct.pack("!L", self.subtype))
-        length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_BBHLLL, buf, offset, self.version, self.type, 0, self.xid, self.experimenter, self.subtype)
+        length = offset - start
+        _struct_H.pack_into(buf, start + 2, length)
+        return offset
+
+    def wire_length(self):
+        return 16
 
     @staticmethod
     def unpack(reader):
         obj = bsn_flow_idle_enable_get_request()
-        _version = reader.read("!B")[0]
+        _version, _type, _length = reader.read_struct(_struct_BBH)
         assert(_version == 4)
-        _type = reader.read("!B")[0]
         assert(_type == 4)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        _experimenter = reader.read("!L")[0]
+        obj.xid, _experimenter, _subtype = reader.read_struct(_struct_LLL)
         assert(_experimenter == 6035143)
-        _subtype = reader.read("!L")[0]
         assert(_subtype == 38)
         return obj
 
@@ -3214,6 +3000,7 @@ class bsn_flow_idle_enable_get_request(bsn_header):
 bsn_header.subtypes[38] = bsn_flow_idle_enable_get_request
 
 class bsn_flow_idle_enable_set_reply(bsn_header):
+    __slots__ = ["enable", "status"]
     version = 4
     type = 4
     experimenter = 6035143
@@ -3234,37 +3021,27 @@ class bsn_flow_idle_enable_set_reply(bsn_header):
             self.status = 0
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!L", self.experimenter))
-        packed.append(struct.pack("!L", self.subtype))
-        packed.append(struct.pack("!L", self.enable))
-        packed.append(struct.pack("!L", self.status))
-        length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_BBHLLLLL, buf, offset, self.version, self.type, 0, self.xid, self.experimenter, self.subtype, self.enable, self.status)
+        length = offset - start
+        _struct_H.pack_into(buf, start + 2, length)
+        return offset
+
+    def wire_length(self):
+        return 24
 
     @staticmethod
     def unpack(reader):
         obj = bsn_flow_idle_enable_set_reply()
-        _version = reader.read("!B")[0]
+        _version, _type, _length = reader.read_struct(_struct_BBH)
         assert(_version == 4)
-        _type = reader.read("!B")[0]
         assert(_type == 4)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        _experimenter = reader.read("!L")[0]
+        obj.xid, _experimenter, _subtype, obj.enable, obj.status = reader.read_struct(_struct_LLLLL)
         assert(_experimenter == 6035143)
-        _subtype = reader.read("!L")[0]
         assert(_subtype == 37)
-        obj.enable = reader.read("!L")[0]
-        obj.status = reader.read("!L")[0]
         return obj
 
     def __eq__(self, other):
@@ -3296,6 +3073,7 @@ class bsn_flow_idle_enable_set_reply(bsn_header):
 bsn_header.subtypes[37] = bsn_flow_idle_enable_set_reply
 
 class bsn_flow_idle_enable_set_request(bsn_header):
+    __slots__ = ["enable"]
     version = 4
     type = 4
     experimenter = 6035143
@@ -3312,35 +3090,27 @@ class bsn_flow_idle_enable_set_request(bsn_header):
             self.enable = 0
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!L", self.experimenter))
-        packed.append(struct.pack("!L", self.subtype))
-        packed.append(struct.pack("!L", self.enable))
-        length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_BBHLLLL, buf, offset, self.version, self.type, 0, self.xid, self.experimenter, self.subtype, self.enable)
+        length = offset - start
+        _struct_H.pack_into(buf, start + 2, length)
+        return offset
+
+    def wire_length(self):
+        return 20
 
     @staticmethod
     def unpack(reader):
         obj = bsn_flow_idle_enable_set_request()
-        _version = reader.read("!B")[0]
+        _version, _type, _length = reader.read_struct(_struct_BBH)
         assert(_version == 4)
-        _type = reader.read("!B")[0]
         assert(_type == 4)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        _experimenter = reader.read("!L")[0]
+        obj.xid, _experimenter, _subtype, obj.enable = reader.read_struct(_struct_LLLL)
         assert(_experimenter == 6035143)
-        _subtype = reader.read("!L")[0]
         assert(_subtype == 36)
-        obj.enable = reader.read("!L")[0]
         return obj
 
     def __eq__(self, other):
@@ -3368,6 +3138,7 @@ class bsn_flow_idle_enable_set_request(bsn_header):
 bsn_header.subtypes[36] = bsn_flow_idle_enable_set_request
 
 class bsn_generic_stats_reply(bsn_stats_reply):
+    __slots__ = ["entries"]
     version = 4
     type = 19
     stats_type = 65535
@@ -3389,40 +3160,28 @@ class bsn_generic_stats_reply(bsn_stats_reply):
             self.entries = []
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!H", self.stats_type))
-        packed.append(struct.pack("!H", self.flags))
-        packed.append('\x00' * 4)
-        packed.append(struct.pack("!L", self.experimenter))
-        packed.append(struct.pack("!L", self.subtype))
-        packed.append(loxi.generic_util.pack_list(self.entries))
-        length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_BBHLHH4xLL, buf, offset, self.version, self.type, 0, self.xid, self.stats_type, self.flags, self.experimenter, self.subtype)
+        offset = loxi.generic_util.pack_list_into(self.entries, buf, offset)
+        length = offset - start
+        _struct_H.pack_into(buf, start + 2, length)
+        return offset
+
+    def wire_length(self):
+        return 24 + loxi.generic_util.list_wire_length(self.entries)
 
     @staticmethod
     def unpack(reader):
         obj = bsn_generic_stats_reply()
-        _version = reader.read("!B")[0]
+        _version, _type, _length = reader.read_struct(_struct_BBH)
         assert(_version == 4)
-        _type = reader.read("!B")[0]
         assert(_type == 19)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        _stats_type = reader.read("!H")[0]
+        obj.xid, _stats_type, obj.flags, _experimenter, _subtype = reader.read_struct(_struct_LHH4xLL)
         assert(_stats_type == 65535)
-        obj.flags = reader.read("!H")[0]
-        reader.skip(4)
-        _experimenter = reader.read("!L")[0]
         assert(_experimenter == 6035143)
-        _subtype = reader.read("!L")[0]
         assert(_subtype == 16)
         obj.entries = loxi.generic_util.unpack_list(reader, ofp.common.bsn_generic_stats_entry.unpack)
         return obj
@@ -3456,6 +3215,7 @@ class bsn_generic_stats_reply(bsn_stats_reply):
 bsn_stats_reply.subtypes[16] = bsn_generic_stats_reply
 
 class bsn_generic_stats_request(bsn_stats_request):
+    __slots__ = ["name", "tlvs"]
     version = 4
     type = 18
     stats_type = 65535
@@ -3481,43 +3241,30 @@ class bsn_generic_stats_request(bsn_stats_request):
             self.tlvs = []
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!H", self.stats_type))
-        packed.append(struct.pack("!H", self.flags))
-        packed.append('\x00' * 4)
-        packed.append(struct.pack("!L", self.experimenter))
-        packed.append(struct.pack("!L", self.subtype))
-        packed.append(struct.pack("!64s", self.name))
-        packed.append(loxi.generic_util.pack_list(self.tlvs))
-        length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_BBHLHH4xLL64s, buf, offset, self.version, self.type, 0, self.xid, self.stats_type, self.flags, self.experimenter, self.subtype, self.name)
+        offset = loxi.generic_util.pack_list_into(self.tlvs, buf, offset)
+        length = offset - start
+        _struct_H.pack_into(buf, start + 2, length)
+        return offset
+
+    def wire_length(self):
+        return 88 + loxi.generic_util.list_wire_length(self.tlvs)
 
     @staticmethod
     def unpack(reader):
         obj = bsn_generic_stats_request()
-        _version = reader.read("!B")[0]
+        _version, _type, _length = reader.read_struct(_struct_BBH)
         assert(_version == 4)
-        _type = reader.read("!B")[0]
         assert(_type == 18)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        _stats_type = reader.read("!H")[0]
+        obj.xid, _stats_type, obj.flags, _experimenter, _subtype, obj.name = reader.read_struct(_struct_LHH4xLL64s)
         assert(_stats_type == 65535)
-        obj.flags = reader.read("!H")[0]
-        reader.skip(4)
-        _experimenter = reader.read("!L")[0]
         assert(_experimenter == 6035143)
-        _subtype = reader.read("!L")[0]
         assert(_subtype == 16)
-        obj.name = reader.read("!64s")[0].rstrip("\x00")
+        obj.name = obj.name.rstrip("\x00")
         obj.tlvs = loxi.generic_util.unpack_list(reader, ofp.bsn_tlv.bsn_tlv.unpack)
         return obj
 
@@ -3554,6 +3301,7 @@ class bsn_generic_stats_request(bsn_stats_request):
 bsn_stats_request.subtypes[16] = bsn_generic_stats_request
 
 class bsn_gentable_bucket_stats_reply(bsn_stats_reply):
+    __slots__ = ["entries"]
     version = 4
     type = 19
     stats_type = 65535
@@ -3575,40 +3323,28 @@ class bsn_gentable_bucket_stats_reply(bsn_stats_reply):
             self.entries = []
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!H", self.stats_type))
-        packed.append(struct.pack("!H", self.flags))
-        packed.append('\x00' * 4)
-        packed.append(struct.pack("!L", self.experimenter))
-        packed.append(struct.pack("!L", self.subtype))
-        packed.append(loxi.generic_util.pack_list(self.entries))
-        length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_BBHLHH4xLL, buf, offset, self.version, self.type, 0, self.xid, self.stats_type, self.flags, self.experimenter, self.subtype)
+        offset = loxi.generic_util.pack_list_into(self.entries, buf, offset)
+        length = offset - start
+        _struct_H.pack_into(buf, start + 2, length)
+        return offset
+
+    def wire_length(self):
+        return 24 + loxi.generic_util.list_wire_length(self.entries)
 
     @staticmethod
     def unpack(reader):
         obj = bsn_gentable_bucket_stats_reply()
-        _version = reader.read("!B")[0]
+        _version, _type, _length = reader.read_struct(_struct_BBH)
         assert(_version == 4)
-        _type = reader.read("!B")[0]
         assert(_type == 19)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        _stats_type = reader.read("!H")[0]
+        obj.xid, _stats_type, obj.flags, _experimenter, _subtype = reader.read_struct(_struct_LHH4xLL)
         assert(_stats_type == 65535)
-        obj.flags = reader.read("!H")[0]
-        reader.skip(4)
-        _experimenter = reader.read("!L")[0]
         assert(_experimenter == 6035143)
-        _subtype = reader.read("!L")[0]
         assert(_subtype == 5)
         obj.entries = loxi.generic_util.unpack_list(reader, ofp.common.bsn_gentable_bucket_stats_entry.unpack)
         return obj
@@ -3642,6 +3378,7 @@ class bsn_gentable_bucket_stats_reply(bsn_stats_reply):
 bsn_stats_reply.subtypes[5] = bsn_gentable_bucket_stats_reply
 
 class bsn_gentable_bucket_stats_request(bsn_stats_request):
+    __slots__ = ["table_id"]
     version = 4
     type = 18
     stats_type = 65535
@@ -3663,42 +3400,28 @@ class bsn_gentable_bucket_stats_request(bsn_stats_request):
             self.table_id = 0
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!H", self.stats_type))
-        packed.append(struct.pack("!H", self.flags))
-        packed.append('\x00' * 4)
-        packed.append(struct.pack("!L", self.experimenter))
-        packed.append(struct.pack("!L", self.subtype))
-        packed.append(struct.pack("!H", self.table_id))
-        length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_BBHLHH4xLLH, buf, offset, self.version, self.type, 0, self.xid, self.stats_type, self.flags, self.experimenter, self.subtype, self.table_id)
+        length = offset - start
+        _struct_H.pack_into(buf, start + 2, length)
+        return offset
+
+    def wire_length(self):
+        return 26
 
     @staticmethod
     def unpack(reader):
         obj = bsn_gentable_bucket_stats_request()
-        _version = reader.read("!B")[0]
+        _version, _type, _length = reader.read_struct(_struct_BBH)
         assert(_version == 4)
-        _type = reader.read("!B")[0]
         assert(_type == 18)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        _stats_type = reader.read("!H")[0]
+        obj.xid, _stats_type, obj.flags, _experimenter, _subtype, obj.table_id = reader.read_struct(_struct_LHH4xLLH)
         assert(_stats_type == 65535)
-        obj.flags = reader.read("!H")[0]
-        reader.skip(4)
-        _experimenter = reader.read("!L")[0]
         assert(_experimenter == 6035143)
-        _subtype = reader.read("!L")[0]
         assert(_subtype == 5)
-        obj.table_id = reader.read("!H")[0]
         return obj
 
     def __eq__(self, other):
@@ -3730,6 +3453,7 @@ class bsn_gentable_bucket_stats_request(bsn_stats_request):
 bsn_stats_request.subtypes[5] = bsn_gentable_bucket_stats_request
 
 class bsn_gentable_clear_reply(bsn_header):
+    __slots__ = ["deleted_count", "error_count", "table_id"]
     version = 4
     type = 4
     experimenter = 6035143
@@ -3754,41 +3478,27 @@ class bsn_gentable_clear_reply(bsn_header):
             self.error_count = 0
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!L", self.experimenter))
-        packed.append(struct.pack("!L", self.subtype))
-        packed.append(struct.pack("!H", self.table_id))
-        packed.append('\x00' * 2)
-        packed.append(struct.pack("!L", self.deleted_count))
-        packed.append(struct.pack("!L", self.error_count))
-        length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_BBHLLLH2xLL, buf, offset, self.version, self.type, 0, self.xid, self.experimenter, self.subtype, self.table_id, self.deleted_count, self.error_count)
+        length = offset - start
+        _struct_H.pack_into(buf, start + 2, length)
+        return offset
+
+    def wire_length(self):
+        return 28
 
     @staticmethod
     def unpack(reader):
         obj = bsn_gentable_clear_reply()
-        _version = reader.read("!B")[0]
+        _version, _type, _length = reader.read_struct(_struct_BBH)
         assert(_version == 4)
-        _type = reader.read("!B")[0]
         assert(_type == 4)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        _experimenter = reader.read("!L")[0]
+        obj.xid, _experimenter, _subtype, obj.table_id, obj.deleted_count, obj.error_count = reader.read_struct(_struct_LLLH2xLL)
         assert(_experimenter == 6035143)
-        _subtype = reader.read("!L")[0]
         assert(_subtype == 49)
-        obj.table_id = reader.read("!H")[0]
-        reader.skip(2)
-        obj.deleted_count = reader.read("!L")[0]
-        obj.error_count = reader.read("!L")[0]
         return obj
 
     def __eq__(self, other):
@@ -3824,6 +3534,7 @@ class bsn_gentable_clear_reply(bsn_header):
 bsn_header.subtypes[49] = bsn_gentable_clear_reply
 
 class bsn_gentable_clear_request(bsn_header):
+    __slots__ = ["checksum", "checksum_mask", "table_id"]
     version = 4
     type = 4
     experimenter = 6035143
@@ -3848,39 +3559,29 @@ class bsn_gentable_clear_request(bsn_header):
             self.checksum_mask = 0
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!L", self.experimenter))
-        packed.append(struct.pack("!L", self.subtype))
-        packed.append(struct.pack("!H", self.table_id))
-        packed.append('\x00' * 2)
-        packed.append(util.pack_checksum_128(self.checksum))
-        packed.append(util.pack_checksum_128(self.checksum_mask))
-        length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_BBHLLLH2x, buf, offset, self.version, self.type, 0, self.xid, self.experimenter, self.subtype, self.table_id)
+        offset = loxi.generic_util.pack_bytes_into(util.pack_checksum_128(self.checksum), buf, offset)
+        offset = loxi.generic_util.pack_bytes_into(util.pack_checksum_128(self.checksum_mask), buf, offset)
+        length = offset - start
+        _struct_H.pack_into(buf, start + 2, length)
+        return offset
+
+    def wire_length(self):
+        return 52
 
     @staticmethod
     def unpack(reader):
         obj = bsn_gentable_clear_request()
-        _version = reader.read("!B")[0]
+        _version, _type, _length = reader.read_struct(_struct_BBH)
         assert(_version == 4)
-        _type = reader.read("!B")[0]
         assert(_type == 4)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        _experimenter = reader.read("!L")[0]
+        obj.xid, _experimenter, _subtype, obj.table_id = reader.read_struct(_struct_LLLH2x)
         assert(_experimenter == 6035143)
-        _subtype = reader.read("!L")[0]
         assert(_subtype == 48)
-        obj.table_id = reader.read("!H")[0]
-        reader.skip(2)
         obj.checksum = util.unpack_checksum_128(reader)
         obj.checksum_mask = util.unpack_checksum_128(reader)
         return obj
@@ -3918,6 +3619,7 @@ class bsn_gentable_clear_request(bsn_header):
 bsn_header.subtypes[48] = bsn_gentable_clear_request
 
 class bsn_gentable_desc_stats_reply(bsn_stats_reply):
+    __slots__ = ["entries"]
     version = 4
     type = 19
     stats_type = 65535
@@ -3939,40 +3641,28 @@ class bsn_gentable_desc_stats_reply(bsn_stats_reply):
             self.entries = []
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!H", self.stats_type))
-        packed.append(struct.pack("!H", self.flags))
-        packed.append('\x00' * 4)
-        packed.append(struct.pack("!L", self.experimenter))
-        packed.append(struct.pack("!L", self.subtype))
-        packed.append(loxi.generic_util.pack_list(self.entries))
-        length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_BBHLHH4xLL, buf, offset, self.version, self.type, 0, self.xid, self.stats_type, self.flags, self.experimenter, self.subtype)
+        offset = loxi.generic_util.pack_list_into(self.entries, buf, offset)
+        length = offset - start
+        _struct_H.pack_into(buf, start + 2, length)
+        return offset
+
+    def wire_length(self):
+        return 24 + loxi.generic_util.list_wire_length(self.entries)
 
     @staticmethod
     def unpack(reader):
         obj = bsn_gentable_desc_stats_reply()
-        _version = reader.read("!B")[0]
+        _version, _type, _length = reader.read_struct(_struct_BBH)
         assert(_version == 4)
-        _type = reader.read("!B")[0]
         assert(_type == 19)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        _stats_type = reader.read("!H")[0]
+        obj.xid, _stats_type, obj.flags, _experimenter, _subtype = reader.read_struct(_struct_LHH4xLL)
         assert(_stats_type == 65535)
-        obj.flags = reader.read("!H")[0]
-        reader.skip(4)
-        _experimenter = reader.read("!L")[0]
         assert(_experimenter == 6035143)
-        _subtype = reader.read("!L")[0]
         assert(_subtype == 4)
         obj.entries = loxi.generic_util.unpack_list(reader, ofp.common.bsn_gentable_desc_stats_entry.unpack)
         return obj
@@ -4006,6 +3696,7 @@ class bsn_gentable_desc_stats_reply(bsn_stats_reply):
 bsn_stats_reply.subtypes[4] = bsn_gentable_desc_stats_reply
 
 class bsn_gentable_desc_stats_request(bsn_stats_request):
+    __slots__ = []
     version = 4
     type = 18
     stats_type = 65535
@@ -4023,39 +3714,27 @@ class bsn_gentable_desc_stats_request(bsn_stats_request):
             self.flags = 0
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!H", self.stats_type))
-        packed.append(struct.pack("!H", self.flags))
-        packed.append('\x00' * 4)
-        packed.append(struct.pack("!L", self.experimenter))
-        packed.append(struct.pack("!L", self.subtype))
-        length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_BBHLHH4xLL, buf, offset, self.version, self.type, 0, self.xid, self.stats_type, self.flags, self.experimenter, self.subtype)
+        length = offset - start
+        _struct_H.pack_into(buf, start + 2, length)
+        return offset
+
+    def wire_length(self):
+        return 24
 
     @staticmethod
     def unpack(reader):
         obj = bsn_gentable_desc_stats_request()
-        _version = reader.read("!B")[0]
+        _version, _type, _length = reader.read_struct(_struct_BBH)
         assert(_version == 4)
-        _type = reader.read("!B")[0]
         assert(_type == 18)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        _stats_type = reader.read("!H")[0]
+        obj.xid, _stats_type, obj.flags, _experimenter, _subtype = reader.read_struct(_struct_LHH4xLL)
         assert(_stats_type == 65535)
-        obj.flags = reader.read("!H")[0]
-        reader.skip(4)
-        _experimenter = reader.read("!L")[0]
         assert(_experimenter == 6035143)
-        _subtype = reader.read("!L")[0]
         assert(_subtype == 4)
         return obj
 
@@ -4084,6 +3763,7 @@ class bsn_gentable_desc_stats_request(bsn_stats_request):
 bsn_stats_request.subtypes[4] = bsn_gentable_desc_stats_request
 
 class bsn_gentable_entry_add(bsn_header):
+    __slots__ = ["checksum", "key", "table_id", "value"]
     version = 4
     type = 4
     experimenter = 6035143
@@ -4112,41 +3792,32 @@ class bsn_gentable_entry_add(bsn_header):
             self.value = []
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!L", self.experimenter))
-        packed.append(struct.pack("!L", self.subtype))
-        packed.append(struct.pack("!H", self.table_id))
-        packed.append(struct.pack("!H", 0)) # placeholder for key_length at index 7
-        packed.append(util.pack_checksum_128(self.checksum))
-        packed.append(loxi.generic_util.pack_list(self.key))
-        packed[7] = struct.pack("!H", len(packed[-1]))
-        packed.append(loxi.generic_util.pack_list(self.value))
-        length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_BBHLLLHH, buf, offset, self.version, self.type, 0, self.xid, self.experimenter, self.subtype, self.table_id, 0)
+        offset = loxi.generic_util.pack_bytes_into(util.pack_checksum_128(self.checksum), buf, offset)
+        mark = offset
+        offset = loxi.generic_util.pack_list_into(self.key, buf, offset)
+        _struct_H.pack_into(buf, start + 18, offset - mark)
+        offset = loxi.generic_util.pack_list_into(self.value, buf, offset)
+        length = offset - start
+        _struct_H.pack_into(buf, start + 2, length)
+        return offset
+
+    def wire_length(self):
+        return 36 + loxi.generic_util.list_wire_length(self.key) + loxi.generic_util.list_wire_length(self.value)
 
     @staticmethod
     def unpack(reader):
         obj = bsn_gentable_entry_add()
-        _version = reader.read("!B")[0]
+        _version, _type, _length = reader.read_struct(_struct_BBH)
         assert(_version == 4)
-        _type = reader.read("!B")[0]
         assert(_type == 4)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        _experimenter = reader.read("!L")[0]
+        obj.xid, _experimenter, _subtype, obj.table_id, _key_length = reader.read_struct(_struct_LLLHH)
         assert(_experimenter == 6035143)
-        _subtype = reader.read("!L")[0]
         assert(_subtype == 46)
-        obj.table_id = reader.read("!H")[0]
-        _key_length = reader.read("!H")[0]
         obj.checksum = util.unpack_checksum_128(reader)
         obj.key = loxi.generic_util.unpack_list(reader.slice(_key_length), ofp.bsn_tlv.bsn_tlv.unpack)
         obj.value = loxi.generic_util.unpack_list(reader, ofp.bsn_tlv.bsn_tlv.unpack)
@@ -4189,6 +3860,7 @@ class bsn_gentable_entry_add(bsn_header):
 bsn_header.subtypes[46] = bsn_gentable_entry_add
 
 class bsn_gentable_entry_delete(bsn_header):
+    __slots__ = ["key", "table_id"]
     version = 4
     type = 4
     experimenter = 6035143
@@ -4209,36 +3881,28 @@ class bsn_gentable_entry_delete(bsn_header):
             self.key = []
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!L", self.experimenter))
-        packed.append(struct.pack("!L", self.subtype))
-        packed.append(struct.pack("!H", self.table_id))
-        packed.append(loxi.generic_util.pack_list(self.key))
-        length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_BBHLLLH, buf, offset, self.version, self.type, 0, self.xid, self.experimenter, self.subtype, self.table_id)
+        offset = loxi.generic_util.pack_list_into(self.key, buf, offset)
+        length = offset - start
+        _struct_H.pack_into(buf, start + 2, length)
+        return offset
+
+    def wire_length(self):
+        return 18 + loxi.generic_util.list_wire_length(self.key)
 
     @staticmethod
     def unpack(reader):
         obj = bsn_gentable_entry_delete()
-        _version = reader.read("!B")[0]
+        _version, _type, _length = reader.read_struct(_struct_BBH)
         assert(_version == 4)
-        _type = reader.read("!B")[0]
         assert(_type == 4)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        _experimenter = reader.read("!L")[0]
+        obj.xid, _experimenter, _subtype, obj.table_id = reader.read_struct(_struct_LLLH)
         assert(_experimenter == 6035143)
-        _subtype = reader.read("!L")[0]
         assert(_subtype == 47)
-        obj.table_id = reader.read("!H")[0]
         obj.key = loxi.generic_util.unpack_list(reader, ofp.bsn_tlv.bsn_tlv.unpack)
         return obj
 
@@ -4271,6 +3935,7 @@ class bsn_gentable_entry_delete(bsn_header):
 bsn_header.subtypes[47] = bsn_gentable_entry_delete
 
 class bsn_gentable_entry_desc_stats_reply(bsn_stats_reply):
+    __slots__ = ["entries"]
     version = 4
     type = 19
     stats_type = 65535
@@ -4292,40 +3957,28 @@ class bsn_gentable_entry_desc_stats_reply(bsn_stats_reply):
             self.entries = []
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!H", self.stats_type))
-        packed.append(struct.pack("!H", self.flags))
-        packed.append('\x00' * 4)
-        packed.append(struct.pack("!L", self.experimenter))
-        packed.append(struct.pack("!L", self.subtype))
-        packed.append(loxi.generic_util.pack_list(self.entries))
-        length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_BBHLHH4xLL, buf, offset, self.version, self.type, 0, self.xid, self.stats_type, self.flags, self.experimenter, self.subtype)
+        offset = loxi.generic_util.pack_list_into(self.entries, buf, offset)
+        length = offset - start
+        _struct_H.pack_into(buf, start + 2, length)
+        return offset
+
+    def wire_length(self):
+        return 24 + loxi.generic_util.list_wire_length(self.entries)
 
     @staticmethod
     def unpack(reader):
         obj = bsn_gentable_entry_desc_stats_reply()
-        _version = reader.read("!B")[0]
+        _version, _type, _length = reader.read_struct(_struct_BBH)
         assert(_version == 4)
-        _type = reader.read("!B")[0]
         assert(_type == 19)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        _stats_type = reader.read("!H")[0]
+        obj.xid, _stats_type, obj.flags, _experimenter, _subtype = reader.read_struct(_struct_LHH4xLL)
         assert(_stats_type == 65535)
-        obj.flags = reader.read("!H")[0]
-        reader.skip(4)
-        _experimenter = reader.read("!L")[0]
         assert(_experimenter == 6035143)
-        _subtype = reader.read("!L")[0]
         assert(_subtype == 2)
         obj.entries = loxi.generic_util.unpack_list(reader, ofp.common.bsn_gentable_entry_desc_stats_entry.unpack)
         return obj
@@ -4359,6 +4012,7 @@ class bsn_gentable_entry_desc_stats_reply(bsn_stats_reply):
 bsn_stats_reply.subtypes[2] = bsn_gentable_entry_desc_stats_reply
 
 class bsn_gentable_entry_desc_stats_request(bsn_stats_request):
+    __slots__ = ["checksum", "checksum_mask", "table_id"]
     version = 4
     type = 18
     stats_type = 65535
@@ -4388,46 +4042,30 @@ class bsn_gentable_entry_desc_stats_request(bsn_stats_request):
             self.checksum_mask = 0
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!H", self.stats_type))
-        packed.append(struct.pack("!H", self.flags))
-        packed.append('\x00' * 4)
-        packed.append(struct.pack("!L", self.experimenter))
-        packed.append(struct.pack("!L", self.subtype))
-        packed.append(struct.pack("!H", self.table_id))
-        packed.append('\x00' * 2)
-        packed.append(util.pack_checksum_128(self.checksum))
-        packed.append(util.pack_checksum_128(self.checksum_mask))
-        length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_BBHLHH4xLLH2x, buf, offset, self.version, self.type, 0, self.xid, self.stats_type, self.flags, self.experimenter, self.subtype, self.table_id)
+        offset = loxi.generic_util.pack_bytes_into(util.pack_checksum_128(self.checksum), buf, offset)
+        offset = loxi.generic_util.pack_bytes_into(util.pack_checksum_128(self.checksum_mask), buf, offset)
+        length = offset - start
+        _struct_H.pack_into(buf, start + 2, length)
+        return offset
+
+    def wire_length(self):
+        return 60
 
     @staticmethod
     def unpack(reader):
         obj = bsn_gentable_entry_desc_stats_request()
-        _version = reader.read("!B")[0]
+        _version, _type, _length = reader.read_struct(_struct_BBH)
         assert(_version == 4)
-        _type = reader.read("!B")[0]
         assert(_type == 18)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        _stats_type = reader.read("!H")[0]
+        obj.xid, _stats_type, obj.flags, _experimenter, _subtype, obj.table_id = reader.read_struct(_struct_LHH4xLLH2x)
         assert(_stats_type == 65535)
-        obj.flags = reader.read("!H")[0]
-        reader.skip(4)
-        _experimenter = reader.read("!L")[0]
         assert(_experimenter == 6035143)
-        _subtype = reader.read("!L")[0]
         assert(_subtype == 2)
-        obj.table_id = reader.read("!H")[0]
-        reader.skip(2)
         obj.checksum = util.unpack_checksum_128(reader)
         obj.checksum_mask = util.unpack_checksum_128(reader)
         return obj
@@ -4469,6 +4107,7 @@ class bsn_gentable_entry_desc_stats_request(bsn_stats_request):
 bsn_stats_request.subtypes[2] = bsn_gentable_entry_desc_stats_request
 
 class bsn_gentable_entry_stats_reply(bsn_stats_reply):
+    __slots__ = ["entries"]
     version = 4
     type = 19
     stats_type = 65535
@@ -4490,40 +4129,28 @@ class bsn_gentable_entry_stats_reply(bsn_stats_reply):
             self.entries = []
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!H", self.stats_type))
-        packed.append(struct.pack("!H", self.flags))
-        packed.append('\x00' * 4)
-        packed.append(struct.pack("!L", self.experimenter))
-        packed.append(struct.pack("!L", self.subtype))
-        packed.append(loxi.generic_util.pack_list(self.entries))
-        length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_BBHLHH4xLL, buf, offset, self.version, self.type, 0, self.xid, self.stats_type, self.flags, self.experimenter, self.subtype)
+        offset = loxi.generic_util.pack_list_into(self.entries, buf, offset)
+        length = offset - start
+        _struct_H.pack_into(buf, start + 2, length)
+        return offset
+
+    def wire_length(self):
+        return 24 + loxi.generic_util.list_wire_length(self.entries)
 
     @staticmethod
     def unpack(reader):
         obj = bsn_gentable_entry_stats_reply()
-        _version = reader.read("!B")[0]
+        _version, _type, _length = reader.read_struct(_struct_BBH)
         assert(_version == 4)
-        _type = reader.read("!B")[0]
         assert(_type == 19)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        _stats_type = reader.read("!H")[0]
+        obj.xid, _stats_type, obj.flags, _experimenter, _subtype = reader.read_struct(_struct_LHH4xLL)
         assert(_stats_type == 65535)
-        obj.flags = reader.read("!H")[0]
-        reader.skip(4)
-        _experimenter = reader.read("!L")[0]
         assert(_experimenter == 6035143)
-        _subtype = reader.read("!L")[0]
         assert(_subtype == 3)
         obj.entries = loxi.generic_util.unpack_list(reader, ofp.common.bsn_gentable_entry_stats_entry.unpack)
         return obj
@@ -4557,6 +4184,7 @@ class bsn_gentable_entry_stats_reply(bsn_stats_reply):
 bsn_stats_reply.subtypes[3] = bsn_gentable_entry_stats_reply
 
 class bsn_gentable_entry_stats_request(bsn_stats_request):
+    __slots__ = ["checksum", "checksum_mask", "table_id"]
     version = 4
     type = 18
     stats_type = 65535
@@ -4586,46 +4214,30 @@ class bsn_gentable_entry_stats_request(bsn_stats_request):
             self.checksum_mask = 0
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!H", self.stats_type))
-        packed.append(struct.pack("!H", self.flags))
-        packed.append('\x00' * 4)
-        packed.append(struct.pack("!L", self.experimenter))
-        packed.append(struct.pack("!L", self.subtype))
-        packed.append(struct.pack("!H", self.table_id))
-        packed.append('\x00' * 2)
-        packed.append(util.pack_checksum_128(self.checksum))
-        packed.append(util.pack_checksum_128(self.checksum_mask))
-        length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_BBHLHH4xLLH2x, buf, offset, self.version, self.type, 0, self.xid, self.stats_type, self.flags, self.experimenter, self.subtype, self.table_id)
+        offset = loxi.generic_util.pack_bytes_into(util.pack_checksum_128(self.checksum), buf, offset)
+        offset = loxi.generic_util.pack_bytes_into(util.pack_checksum_128(self.checksum_mask), buf, offset)
+        length = offset - start
+        _struct_H.pack_into(buf, start + 2, length)
+        return offset
+
+    def wire_length(self):
+        return 60
 
     @staticmethod
     def unpack(reader):
         obj = bsn_gentable_entry_stats_request()
-        _version = reader.read("!B")[0]
+        _version, _type, _length = reader.read_struct(_struct_BBH)
         assert(_version == 4)
-        _type = reader.read("!B")[0]
         assert(_type == 18)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        _stats_type = reader.read("!H")[0]
+        obj.xid, _stats_type, obj.flags, _experimenter, _subtype, obj.table_id = reader.read_struct(_struct_LHH4xLLH2x)
         assert(_stats_type == 65535)
-        obj.flags = reader.read("!H")[0]
-        reader.skip(4)
-        _experimenter = reader.read("!L")[0]
         assert(_experimenter == 6035143)
-        _subtype = reader.read("!L")[0]
         assert(_subtype == 3)
-        obj.table_id = reader.read("!H")[0]
-        reader.skip(2)
         obj.checksum = util.unpack_checksum_128(reader)
         obj.checksum_mask = util.unpack_checksum_128(reader)
         return obj
@@ -4667,6 +4279,7 @@ class bsn_gentable_entry_stats_request(bsn_stats_request):
 bsn_stats_request.subtypes[3] = bsn_gentable_entry_stats_request
 
 class bsn_gentable_set_buckets_size(bsn_header):
+    __slots__ = ["buckets_size", "table_id"]
     version = 4
     type = 4
     experimenter = 6035143
@@ -4687,39 +4300,27 @@ class bsn_gentable_set_buckets_size(bsn_header):
             self.buckets_size = 0
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!L", self.experimenter))
-        packed.append(struct.pack("!L", self.subtype))
-        packed.append(struct.pack("!H", self.table_id))
-        packed.append('\x00' * 2)
-        packed.append(struct.pack("!L", self.buckets_size))
-        length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_BBHLLLH2xL, buf, offset, self.version, self.type, 0, self.xid, self.experimenter, self.subtype, self.table_id, self.buckets_size)
+        length = offset - start
+        _struct_H.pack_into(buf, start + 2, length)
+        return offset
+
+    def wire_length(self):
+        return 24
 
     @staticmethod
     def unpack(reader):
         obj = bsn_gentable_set_buckets_size()
-        _version = reader.read("!B")[0]
+        _version, _type, _length = reader.read_struct(_struct_BBH)
         assert(_version == 4)
-        _type = reader.read("!B")[0]
         assert(_type == 4)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        _experimenter = reader.read("!L")[0]
+        obj.xid, _experimenter, _subtype, obj.table_id, obj.buckets_size = reader.read_struct(_struct_LLLH2xL)
         assert(_experimenter == 6035143)
-        _subtype = reader.read("!L")[0]
         assert(_subtype == 50)
-        obj.table_id = reader.read("!H")[0]
-        reader.skip(2)
-        obj.buckets_size = reader.read("!L")[0]
         return obj
 
     def __eq__(self, other):
@@ -4751,6 +4352,7 @@ class bsn_gentable_set_buckets_size(bsn_header):
 bsn_header.subtypes[50] = bsn_gentable_set_buckets_size
 
 class bsn_gentable_stats_reply(bsn_stats_reply):
+    __slots__ = ["entries"]
     version = 4
     type = 19
     stats_type = 65535
@@ -4772,40 +4374,28 @@ class bsn_gentable_stats_reply(bsn_stats_reply):
             self.entries = []
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!H", self.stats_type))
-        packed.append(struct.pack("!H", self.flags))
-        packed.append('\x00' * 4)
-        packed.append(struct.pack("!L", self.experimenter))
-        packed.append(struct.pack("!L", self.subtype))
-        packed.append(loxi.generic_util.pack_list(self.entries))
-        length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_BBHLHH4xLL, buf, offset, self.version, self.type, 0, self.xid, self.stats_type, self.flags, self.experimenter, self.subtype)
+        offset = loxi.generic_util.pack_list_into(self.entries, buf, offset)
+        length = offset - start
+        _struct_H.pack_into(buf, start + 2, length)
+        return offset
+
+    def wire_length(self):
+        return 24 + loxi.generic_util.list_wire_length(self.entries)
 
     @staticmethod
     def unpack(reader):
         obj = bsn_gentable_stats_reply()
-        _version = reader.read("!B")[0]
+        _version, _type, _length = reader.read_struct(_struct_BBH)
         assert(_version == 4)
-        _type = reader.read("!B")[0]
         assert(_type == 19)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        _stats_type = reader.read("!H")[0]
+        obj.xid, _stats_type, obj.flags, _experimenter, _subtype = reader.read_struct(_struct_LHH4xLL)
         assert(_stats_type == 65535)
-        obj.flags = reader.read("!H")[0]
-        reader.skip(4)
-        _experimenter = reader.read("!L")[0]
         assert(_experimenter == 6035143)
-        _subtype = reader.read("!L")[0]
         assert(_subtype == 7)
         obj.entries = loxi.generic_util.unpack_list(reader, ofp.common.bsn_gentable_stats_entry.unpack)
         return obj
@@ -4839,6 +4429,7 @@ class bsn_gentable_stats_reply(bsn_stats_reply):
 bsn_stats_reply.subtypes[7] = bsn_gentable_stats_reply
 
 class bsn_gentable_stats_request(bsn_stats_request):
+    __slots__ = []
     version = 4
     type = 18
     stats_type = 65535
@@ -4856,39 +4447,27 @@ class bsn_gentable_stats_request(bsn_stats_request):
             self.flags = 0
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!H", self.stats_type))
-        packed.append(struct.pack("!H", self.flags))
-        packed.append('\x00' * 4)
-        packed.append(struct.pack("!L", self.experimenter))
-        packed.append(struct.pack("!L", self.subtype))
-        length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_BBHLHH4xLL, buf, offset, self.version, self.type, 0, self.xid, self.stats_type, self.flags, self.experimenter, self.subtype)
+        length = offset - start
+        _struct_H.pack_into(buf, start + 2, length)
+        return offset
+
+    def wire_length(self):
+        return 24
 
     @staticmethod
     def unpack(reader):
         obj = bsn_gentable_stats_request()
-        _version = reader.read("!B")[0]
+        _version, _type, _length = reader.read_struct(_struct_BBH)
         assert(_version == 4)
-        _type = reader.read("!B")[0]
         assert(_type == 18)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        _stats_type = reader.read("!H")[0]
+        obj.xid, _stats_type, obj.flags, _experimenter, _subtype = reader.read_struct(_struct_LHH4xLL)
         assert(_stats_type == 65535)
-        obj.flags = reader.read("!H")[0]
-        reader.skip(4)
-        _experimenter = reader.read("!L")[0]
         assert(_experimenter == 6035143)
-        _subtype = reader.read("!L")[0]
         assert(_subtype == 7)
         return obj
 
@@ -4917,6 +4496,7 @@ class bsn_gentable_stats_request(bsn_stats_request):
 bsn_stats_request.subtypes[7] = bsn_gentable_stats_request
 
 class bsn_get_interfaces_reply(bsn_header):
+    __slots__ = ["interfaces"]
     version = 4
     type = 4
     experimenter = 6035143
@@ -4933,33 +4513,27 @@ class bsn_get_interfaces_reply(bsn_header):
             self.interfaces = []
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!L", self.experimenter))
-        packed.append(struct.pack("!L", self.subtype))
-        packed.append(loxi.generic_util.pack_list(self.interfaces))
-        length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_BBHLLL, buf, offset, self.version, self.type, 0, self.xid, self.experimenter, self.subtype)
+        offset = loxi.generic_util.pack_list_into(self.interfaces, buf, offset)
+        length = offset - start
+        _struct_H.pack_into(buf, start + 2, length)
+        return offset
+
+    def wire_length(self):
+        return 16 + loxi.generic_util.list_wire_length(self.interfaces)
 
     @staticmethod
     def unpack(reader):
         obj = bsn_get_interfaces_reply()
-        _version = reader.read("!B")[0]
+        _version, _type, _length = reader.read_struct(_struct_BBH)
         assert(_version == 4)
-        _type = reader.read("!B")[0]
         assert(_type == 4)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        _experimenter = reader.read("!L")[0]
+        obj.xid, _experimenter, _subtype = reader.read_struct(_struct_LLL)
         assert(_experimenter == 6035143)
-        _subtype = reader.read("!L")[0]
         assert(_subtype == 10)
         obj.interfaces = loxi.generic_util.unpack_list(reader, ofp.common.bsn_interface.unpack)
         return obj
@@ -4989,6 +4563,7 @@ class bsn_get_interfaces_reply(bsn_header):
 bsn_header.subtypes[10] = bsn_get_interfaces_reply
 
 class bsn_get_interfaces_request(bsn_header):
+    __slots__ = []
     version = 4
     type = 4
     experimenter = 6035143
@@ -5001,32 +4576,26 @@ class bsn_get_interfaces_request(bsn_header):
             self.xid = None
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!L", self.experimenter))
-        packed.append(struct.pack("!L", self.subtype))
-        length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_BBHLLL, buf, offset, self.version, self.type, 0, self.xid, self.experimenter, self.subtype)
+        length = offset - start
+        _struct_H.pack_into(buf, start + 2, length)
+        return offset
+
+    def wire_length(self):
+        return 16
 
     @staticmethod
     def unpack(reader):
         obj = bsn_get_interfaces_request()
-        _version = reader.read("!B")[0]
+        _version, _type, _length = reader.read_struct(_struct_BBH)
         assert(_version == 4)
-        _type = reader.read("!B")[0]
         assert(_type == 4)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        _experimenter = reader.read("!L")[0]
+        obj.xid, _experimenter, _subtype = reader.read_struct(_struct_LLL)
         assert(_experimenter == 6035143)
-        _subtype = reader.read("!L")[0]
         assert(_subtype == 9)
         return obj
 
@@ -5051,6 +4620,7 @@ class bsn_get_interfaces_request(bsn_header):
 bsn_header.subtypes[9] = bsn_get_interfaces_request
 
 class bsn_get_mirroring_reply(bsn_header):
+    __slots__ = ["report_mirror_ports"]
     version = 4
     type = 4
     experimenter = 6035143
@@ -5067,37 +4637,27 @@ class bsn_get_mirroring_reply(bsn_header):
             self.report_mirror_ports = 0
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!L", self.experimenter))
-        packed.append(struct.pack("!L", self.subtype))
-        packed.append(struct.pack("!B", self.report_mirror_ports))
-        packed.append('\x00' * 3)
-        length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_BBHLLLB3x, buf, offset, self.version, self.type, 0, self.xid, self.experimenter, self.subtype, self.report_mirror_ports)
+        length = offset - start
+        _struct_H.pack_into(buf, start + 2, length)
+        return offset
+
+    def wire_length(self):
+        return 20
 
     @staticmethod
     def unpack(reader):
         obj = bsn_get_mirroring_reply()
-        _version = reader.read("!B")[0]
+        _version, _type, _length = reader.read_struct(_struct_BBH)
         assert(_version == 4)
-        _type = reader.read("!B")[0]
         assert(_type == 4)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        _experimenter = reader.read("!L")[0]
+        obj.xid, _experimenter, _subtype, obj.report_mirror_ports = reader.read_struct(_struct_LLLB3x)
         assert(_experimenter == 6035143)
-        _subtype = reader.read("!L")[0]
         assert(_subtype == 5)
-        obj.report_mirror_ports = reader.read("!B")[0]
-        reader.skip(3)
         return obj
 
     def __eq__(self, other):
@@ -5125,6 +4685,7 @@ class bsn_get_mirroring_reply(bsn_header):
 bsn_header.subtypes[5] = bsn_get_mirroring_reply
 
 class bsn_get_mirroring_request(bsn_header):
+    __slots__ = ["report_mirror_ports"]
     version = 4
     type = 4
     experimenter = 6035143
@@ -5141,37 +4702,27 @@ class bsn_get_mirroring_request(bsn_header):
             self.report_mirror_ports = 0
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!L", self.experimenter))
-        packed.append(struct.pack("!L", self.subtype))
-        packed.append(struct.pack("!B", self.report_mirror_ports))
-        packed.append('\x00' * 3)
-        length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_BBHLLLB3x, buf, offset, self.version, self.type, 0, self.xid, self.experimenter, self.subtype, self.report_mirror_ports)
+        length = offset - start
+        _struct_H.pack_into(buf, start + 2, length)
+        return offset
+
+    def wire_length(self):
+        return 20
 
     @staticmethod
     def unpack(reader):
         obj = bsn_get_mirroring_request()
-        _version = reader.read("!B")[0]
+        _version, _type, _length = reader.read_struct(_struct_BBH)
         assert(_version == 4)
-        _type = reader.read("!B")[0]
         assert(_type == 4)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        _experimenter = reader.read("!L")[0]
+        obj.xid, _experimenter, _subtype, obj.report_mirror_ports = reader.read_struct(_struct_LLLB3x)
         assert(_experimenter == 6035143)
-        _subtype = reader.read("!L")[0]
         assert(_subtype == 4)
-        obj.report_mirror_ports = reader.read("!B")[0]
-        reader.skip(3)
         return obj
 
     def __eq__(self, other):
@@ -5199,6 +4750,7 @@ class bsn_get_mirroring_request(bsn_header):
 bsn_header.subtypes[4] = bsn_get_mirroring_request
 
 class bsn_get_switch_pipeline_reply(bsn_header):
+    __slots__ = ["pipeline"]
     version = 4
     type = 4
     experimenter = 6035143
@@ -5215,35 +4767,28 @@ class bsn_get_switch_pipeline_reply(bsn_header):
             self.pipeline = ""
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!L", self.experimenter))
-        packed.append(struct.pack("!L", self.subtype))
-        packed.append(struct.pack("!256s", self.pipeline))
-        length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_BBHLLL256s, buf, offset, self.version, self.type, 0, self.xid, self.experimenter, self.subtype, self.pipeline)
+        length = offset - start
+        _struct_H.pack_into(buf, start + 2, length)
+        return offset
+
+    def wire_length(self):
+        return 272
 
     @staticmethod
     def unpack(reader):
         obj = bsn_get_switch_pipeline_reply()
-        _version = reader.read("!B")[0]
+        _version, _type, _length = reader.read_struct(_struct_BBH)
         assert(_version == 4)
-        _type = reader.read("!B")[0]
         assert(_type == 4)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        _experimenter = reader.read("!L")[0]
+        obj.xid, _experimenter, _subtype, obj.pipeline = reader.read_struct(_struct_LLL256s)
         assert(_experimenter == 6035143)
-        _subtype = reader.read("!L")[0]
         assert(_subtype == 52)
-        obj.pipeline = reader.read("!256s")[0].rstrip("\x00")
+        obj.pipeline = obj.pipeline.rstrip("\x00")
         return obj
 
     def __eq__(self, other):
@@ -5271,6 +4816,7 @@ class bsn_get_switch_pipeline_reply(bsn_header):
 bsn_header.subtypes[52] = bsn_get_switch_pipeline_reply
 
 class bsn_get_switch_pipeline_request(bsn_header):
+    __slots__ = []
     version = 4
     type = 4
     experimenter = 6035143
@@ -5283,32 +4829,26 @@ class bsn_get_switch_pipeline_request(bsn_header):
             self.xid = None
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!L", self.experimenter))
-        packed.append(struct.pack("!L", self.subtype))
-        length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_BBHLLL, buf, offset, self.version, self.type, 0, self.xid, self.experimenter, self.subtype)
+        length = offset - start
+        _struct_H.pack_into(buf, start + 2, length)
+        return offset
+
+    def wire_length(self):
+        return 16
 
     @staticmethod
     def unpack(reader):
         obj = bsn_get_switch_pipeline_request()
-        _version = reader.read("!B")[0]
+        _version, _type, _length = reader.read_struct(_struct_BBH)
         assert(_version == 4)
-        _type = reader.read("!B")[0]
         assert(_type == 4)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        _experimenter = reader.read("!L")[0]
+        obj.xid, _experimenter, _subtype = reader.read_struct(_struct_LLL)
         assert(_experimenter == 6035143)
-        _subtype = reader.read("!L")[0]
         assert(_subtype == 51)
         return obj
 
@@ -5333,6 +4873,7 @@ class bsn_get_switch_pipeline_request(bsn_header):
 bsn_header.subtypes[51] = bsn_get_switch_pipeline_request
 
 class bsn_image_desc_stats_reply(bsn_stats_reply):
+    __slots__ = ["image_checksum", "startup_config_checksum"]
     version = 4
     type = 19
     stats_type = 65535
@@ -5358,44 +4899,30 @@ class bsn_image_desc_stats_reply(bsn_stats_reply):
             self.startup_config_checksum = ""
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!H", self.stats_type))
-        packed.append(struct.pack("!H", self.flags))
-        packed.append('\x00' * 4)
-        packed.append(struct.pack("!L", self.experimenter))
-        packed.append(struct.pack("!L", self.subtype))
-        packed.append(struct.pack("!256s", self.image_checksum))
-        packed.append(struct.pack("!256s", self.startup_config_checksum))
-        length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_BBHLHH4xLL256s256s, buf, offset, self.version, self.type, 0, self.xid, self.stats_type, self.flags, self.experimenter, self.subtype, self.image_checksum, self.startup_config_checksum)
+        length = offset - start
+        _struct_H.pack_into(buf, start + 2, length)
+        return offset
+
+    def wire_length(self):
+        return 536
 
     @staticmethod
     def unpack(reader):
         obj = bsn_image_desc_stats_reply()
-        _version = reader.read("!B")[0]
+        _version, _type, _length = reader.read_struct(_struct_BBH)
         assert(_version == 4)
-        _type = reader.read("!B")[0]
         assert(_type == 19)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        _stats_type = reader.read("!H")[0]
+        obj.xid, _stats_type, obj.flags, _experimenter, _subtype, obj.image_checksum, obj.startup_config_checksum = reader.read_struct(_struct_LHH4xLL256s256s)
         assert(_stats_type == 65535)
-        obj.flags = reader.read("!H")[0]
-        reader.skip(4)
-        _experimenter = reader.read("!L")[0]
         assert(_experimenter == 6035143)
-        _subtype = reader.read("!L")[0]
         assert(_subtype == 14)
-        obj.image_checksum = reader.read("!256s")[0].rstrip("\x00")
-        obj.startup_config_checksum = reader.read("!256s")[0].rstrip("\x00")
+        obj.image_checksum = obj.image_checksum.rstrip("\x00")
+        obj.startup_config_checksum = obj.startup_config_checksum.rstrip("\x00")
         return obj
 
     def __eq__(self, other):
@@ -5431,6 +4958,7 @@ class bsn_image_desc_stats_reply(bsn_stats_reply):
 bsn_stats_reply.subtypes[14] = bsn_image_desc_stats_reply
 
 class bsn_image_desc_stats_request(bsn_stats_request):
+    __slots__ = []
     version = 4
     type = 18
     stats_type = 65535
@@ -5448,39 +4976,27 @@ class bsn_image_desc_stats_request(bsn_stats_request):
             self.flags = 0
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!H", self.stats_type))
-        packed.append(struct.pack("!H", self.flags))
-        packed.append('\x00' * 4)
-        packed.append(struct.pack("!L", self.experimenter))
-        packed.append(struct.pack("!L", self.subtype))
-        length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_BBHLHH4xLL, buf, offset, self.version, self.type, 0, self.xid, self.stats_type, self.flags, self.experimenter, self.subtype)
+        length = offset - start
+        _struct_H.pack_into(buf, start + 2, length)
+        return offset
+
+    def wire_length(self):
+        return 24
 
     @staticmethod
     def unpack(reader):
         obj = bsn_image_desc_stats_request()
-        _version = reader.read("!B")[0]
+        _version, _type, _length = reader.read_struct(_struct_BBH)
         assert(_version == 4)
-        _type = reader.read("!B")[0]
         assert(_type == 18)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        _stats_type = reader.read("!H")[0]
+        obj.xid, _stats_type, obj.flags, _experimenter, _subtype = reader.read_struct(_struct_LHH4xLL)
         assert(_stats_type == 65535)
-        obj.flags = reader.read("!H")[0]
-        reader.skip(4)
-        _experimenter = reader.read("!L")[0]
         assert(_experimenter == 6035143)
-        _subtype = reader.read("!L")[0]
         assert(_subtype == 14)
         return obj
 
@@ -5509,6 +5025,7 @@ class bsn_image_desc_stats_request(bsn_stats_request):
 bsn_stats_request.subtypes[14] = bsn_image_desc_stats_request
 
 class bsn_lacp_convergence_notif(bsn_header):
+    __slots__ = ["actor_key", "actor_port_num", "actor_port_priority", "actor_sys_mac", "actor_sys_priority", "convergence_status", "partner_key", "partner_port_num", "partner_port_priority", "partner_sys_mac", "partner_sys_priority", "port_no"]
     version = 4
     type = 4
     experimenter = 6035143
@@ -5569,59 +5086,35 @@ class bsn_lacp_convergence_notif(bsn_header):
             self.partner_key = 0
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!L", self.experimenter))
-        packed.append(struct.pack("!L", self.subtype))
-        packed.append(struct.pack("!B", self.convergence_status))
-        packed.append('\x00' * 3)
-        packed.append(util.pack_port_no(self.port_no))
-        packed.append(struct.pack("!H", self.actor_sys_priority))
-        packed.append(struct.pack("!6B", *self.actor_sys_mac))
-        packed.append(struct.pack("!H", self.actor_port_priority))
-        packed.append(struct.pack("!H", self.actor_port_num))
-        packed.append(struct.pack("!H", self.actor_key))
-        packed.append(struct.pack("!H", self.partner_sys_priority))
-        packed.append(struct.pack("!6B", *self.partner_sys_mac))
-        packed.append(struct.pack("!H", self.partner_port_priority))
-        packed.append(struct.pack("!H", self.partner_port_num))
-        packed.append(struct.pack("!H", self.partner_key))
-        length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_BBHLLLB3xLH, buf, offset, self.version, self.type, 0, self.xid, self.experimenter, self.subtype, self.convergence_status, self.port_no, self.actor_sys_priority)
+        offset = loxi.generic_util.pack_struct_into(_struct_6B, buf, offset, *self.actor_sys_mac)
+        offset = loxi.generic_util.pack_struct_into(_struct_HHHH, buf, offset, self.actor_port_priority, self.actor_port_num, self.actor_key, self.partner_sys_priority)
+        offset = loxi.generic_util.pack_struct_into(_struct_6B, buf, offset, *self.partner_sys_mac)
+        offset = loxi.generic_util.pack_struct_into(_struct_HHH, buf, offset, self.partner_port_priority, self.partner_port_num, self.partner_key)
+        length = offset - start
+        _struct_H.pack_into(buf, start + 2, length)
+        return offset
+
+    def wire_length(self):
+        return 52
 
     @staticmethod
     def unpack(reader):
         obj = bsn_lacp_convergence_notif()
-        _version = reader.read("!B")[0]
+        _version, _type, _length = reader.read_struct(_struct_BBH)
         assert(_version == 4)
-        _type = reader.read("!B")[0]
         assert(_type == 4)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        _experimenter = reader.read("!L")[0]
+        obj.xid, _experimenter, _subtype, obj.convergence_status, obj.port_no, obj.actor_sys_priority = reader.read_struct(_struct_LLLB3xLH)
         assert(_experimenter == 6035143)
-        _subtype = reader.read("!L")[0]
         assert(_subtype == 43)
-        obj.convergence_status = reader.read("!B")[0]
-        reader.skip(3)
-        obj.port_no = util.unpack_port_no(reader)
-        obj.actor_sys_priority = reader.read("!H")[0]
         obj.actor_sys_mac = list(reader.read('!6B'))
-        obj.actor_port_priority = reader.read("!H")[0]
-        obj.actor_port_num = reader.read("!H")[0]
-        obj.actor_key = reader.read("!H")[0]
-        obj.partner_sys_priority = reader.read("!H")[0]
+        obj.actor_port_priority, obj.actor_port_num, obj.actor_key, obj.partner_sys_priority = reader.read_struct(_struct_HHHH)
         obj.partner_sys_mac = list(reader.read('!6B'))
-        obj.partner_port_priority = reader.read("!H")[0]
-        obj.partner_port_num = reader.read("!H")[0]
-        obj.partner_key = reader.read("!H")[0]
+        obj.partner_port_priority, obj.partner_port_num, obj.partner_key = reader.read_struct(_struct_HHH)
         return obj
 
     def __eq__(self, other):
@@ -5693,6 +5186,7 @@ class bsn_lacp_convergence_notif(bsn_header):
 bsn_header.subtypes[43] = bsn_lacp_convergence_notif
 
 class bsn_lacp_stats_reply(bsn_stats_reply):
+    __slots__ = ["entries"]
     version = 4
     type = 19
     stats_type = 65535
@@ -5714,40 +5208,28 @@ class bsn_lacp_stats_reply(bsn_stats_reply):
             self.entries = []
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!H", self.stats_type))
-        packed.append(struct.pack("!H", self.flags))
-        packed.append('\x00' * 4)
-        packed.append(struct.pack("!L", self.experimenter))
-        packed.append(struct.pack("!L", self.subtype))
-        packed.append(loxi.generic_util.pack_list(self.entries))
-        length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_BBHLHH4xLL, buf, offset, self.version, self.type, 0, self.xid, self.stats_type, self.flags, self.experimenter, self.subtype)
+        offset = loxi.generic_util.pack_list_into(self.entries, buf, offset)
+        length = offset - start
+        _struct_H.pack_into(buf, start + 2, length)
+        return offset
+
+    def wire_length(self):
+        return 24 + loxi.generic_util.list_wire_length(self.entries)
 
     @staticmethod
     def unpack(reader):
         obj = bsn_lacp_stats_reply()
-        _version = reader.read("!B")[0]
+        _version, _type, _length = reader.read_struct(_struct_BBH)
         assert(_version == 4)
-        _type = reader.read("!B")[0]
         assert(_type == 19)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        _stats_type = reader.read("!H")[0]
+        obj.xid, _stats_type, obj.flags, _experimenter, _subtype = reader.read_struct(_struct_LHH4xLL)
         assert(_stats_type == 65535)
-        obj.flags = reader.read("!H")[0]
-        reader.skip(4)
-        _experimenter = reader.read("!L")[0]
         assert(_experimenter == 6035143)
-        _subtype = reader.read("!L")[0]
         assert(_subtype == 1)
         obj.entries = loxi.generic_util.unpack_list(reader, ofp.common.bsn_lacp_stats_entry.unpack)
         return obj
@@ -5781,6 +5263,7 @@ class bsn_lacp_stats_reply(bsn_stats_reply):
 bsn_stats_reply.subtypes[1] = bsn_lacp_stats_reply
 
 class bsn_lacp_stats_request(bsn_stats_request):
+    __slots__ = []
     version = 4
     type = 18
     stats_type = 65535
@@ -5798,39 +5281,27 @@ class bsn_lacp_stats_request(bsn_stats_request):
             self.flags = 0
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!H", self.stats_type))
-        packed.append(struct.pack("!H", self.flags))
-        packed.append('\x00' * 4)
-        packed.append(struct.pack("!L", self.experimenter))
-        packed.append(struct.pack("!L", self.subtype))
-        length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_BBHLHH4xLL, buf, offset, self.version, self.type, 0, self.xid, self.stats_type, self.flags, self.experimenter, self.subtype)
+        length = offset - start
+        _struct_H.pack_into(buf, start + 2, length)
+        return offset
+
+    def wire_length(self):
+        return 24
 
     @staticmethod
     def unpack(reader):
         obj = bsn_lacp_stats_request()
-        _version = reader.read("!B")[0]
+        _version, _type, _length = reader.read_struct(_struct_BBH)
         assert(_version == 4)
-        _type = reader.read("!B")[0]
         assert(_type == 18)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        _stats_type = reader.read("!H")[0]
+        obj.xid, _stats_type, obj.flags, _experimenter, _subtype = reader.read_struct(_struct_LHH4xLL)
         assert(_stats_type == 65535)
-        obj.flags = reader.read("!H")[0]
-        reader.skip(4)
-        _experimenter = reader.read("!L")[0]
         assert(_experimenter == 6035143)
-        _subtype = reader.read("!L")[0]
         assert(_subtype == 1)
         return obj
 
@@ -5859,6 +5330,7 @@ class bsn_lacp_stats_request(bsn_stats_request):
 bsn_stats_request.subtypes[1] = bsn_lacp_stats_request
 
 class bsn_log(bsn_header):
+    __slots__ = ["loglevel"]
     version = 4
     type = 4
     experimenter = 6035143
@@ -5879,37 +5351,29 @@ class bsn_log(bsn_header):
             self.data = ''
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!L", self.experimenter))
-        packed.append(struct.pack("!L", self.subtype))
-        packed.append(struct.pack("!B", self.loglevel))
-        packed.append(self.data)
-        length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_BBHLLLB, buf, offset, self.version, self.type, 0, self.xid, self.experimenter, self.subtype, self.loglevel)
+        offset = loxi.generic_util.pack_bytes_into(self.data, buf, offset)
+        length = offset - start
+        _struct_H.pack_into(buf, start + 2, length)
+        return offset
+
+    def wire_length(self):
+        return 17 + len(self.data)
 
     @staticmethod
     def unpack(reader):
         obj = bsn_log()
-        _version = reader.read("!B")[0]
+        _version, _type, _length = reader.read_struct(_struct_BBH)
         assert(_version == 4)
-        _type = reader.read("!B")[0]
         assert(_type == 4)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        _experimenter = reader.read("!L")[0]
+        obj.xid, _experimenter, _subtype, obj.loglevel = reader.read_struct(_struct_LLLB)
         assert(_experimenter == 6035143)
-        _subtype = reader.read("!L")[0]
         assert(_subtype == 63)
-        obj.loglevel = reader.read("!B")[0]
-        obj.data = str(reader.read_all())
+        obj.data = reader.read_all()
         return obj
 
     def __eq__(self, other):
@@ -5941,6 +5405,7 @@ class bsn_log(bsn_header):
 bsn_header.subtypes[63] = bsn_log
 
 class bsn_lua_command_reply(bsn_header):
+    __slots__ = []
     version = 4
     type = 4
     experimenter = 6035143
@@ -5957,35 +5422,29 @@ class bsn_lua_command_reply(bsn_header):
             self.data = ''
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!L", self.experimenter))
-        packed.append(struct.pack("!L", self.subtype))
-        packed.append(self.data)
-        length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_BBHLLL, buf, offset, self.version, self.type, 0, self.xid, self.experimenter, self.subtype)
+        offset = loxi.generic_util.pack_bytes_into(self.data, buf, offset)
+        length = offset - start
+        _struct_H.pack_into(buf, start + 2, length)
+        return offset
+
+    def wire_length(self):
+        return 16 + len(self.data)
 
     @staticmethod
     def unpack(reader):
         obj = bsn_lua_command_reply()
-        _version = reader.read("!B")[0]
+        _version, _type, _length = reader.read_struct(_struct_BBH)
         assert(_version == 4)
-        _type = reader.read("!B")[0]
         assert(_type == 4)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        _experimenter = reader.read("!L")[0]
+        obj.xid, _experimenter, _subtype = reader.read_struct(_struct_LLL)
         assert(_experimenter == 6035143)
-        _subtype = reader.read("!L")[0]
         assert(_subtype == 66)
-        obj.data = str(reader.read_all())
+        obj.data = reader.read_all()
         return obj
 
     def __eq__(self, other):
@@ -6013,6 +5472,7 @@ class bsn_lua_command_reply(bsn_header):
 bsn_header.subtypes[66] = bsn_lua_command_reply
 
 class bsn_lua_command_request(bsn_header):
+    __slots__ = []
     version = 4
     type = 4
     experimenter = 6035143
@@ -6029,35 +5489,29 @@ class bsn_lua_command_request(bsn_header):
             self.data = ''
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!L", self.experimenter))
-        packed.append(struct.pack("!L", self.subtype))
-        packed.append(self.data)
-        length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_BBHLLL, buf, offset, self.version, self.type, 0, self.xid, self.experimenter, self.subtype)
+        offset = loxi.generic_util.pack_bytes_into(self.data, buf, offset)
+        length = offset - start
+        _struct_H.pack_into(buf, start + 2, length)
+        return offset
+
+    def wire_length(self):
+        return 16 + len(self.data)
 
     @staticmethod
     def unpack(reader):
         obj = bsn_lua_command_request()
-        _version = reader.read("!B")[0]
+        _version, _type, _length = reader.read_struct(_struct_BBH)
         assert(_version == 4)
-        _type = reader.read("!B")[0]
         assert(_type == 4)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        _experimenter = reader.read("!L")[0]
+        obj.xid, _experimenter, _subtype = reader.read_struct(_struct_LLL)
         assert(_experimenter == 6035143)
-        _subtype = reader.read("!L")[0]
         assert(_subtype == 65)
-        obj.data = str(reader.read_all())
+        obj.data = reader.read_all()
         return obj
 
     def __eq__(self, other):
@@ -6085,6 +5539,7 @@ class bsn_lua_command_request(bsn_header):
 bsn_header.subtypes[65] = bsn_lua_command_request
 
 class bsn_lua_notification(bsn_header):
+    __slots__ = []
     version = 4
     type = 4
     experimenter = 6035143
@@ -6101,35 +5556,29 @@ class bsn_lua_notification(bsn_header):
             self.data = ''
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!L", self.experimenter))
-        packed.append(struct.pack("!L", self.subtype))
-        packed.append(self.data)
-        length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_BBHLLL, buf, offset, self.version, self.type, 0, self.xid, self.experimenter, self.subtype)
+        offset = loxi.generic_util.pack_bytes_into(self.data, buf, offset)
+        length = offset - start
+        _struct_H.pack_into(buf, start + 2, length)
+        return offset
+
+    def wire_length(self):
+        return 16 + len(self.data)
 
     @staticmethod
     def unpack(reader):
         obj = bsn_lua_notification()
-        _version = reader.read("!B")[0]
+        _version, _type, _length = reader.read_struct(_struct_BBH)
         assert(_version == 4)
-        _type = reader.read("!B")[0]
         assert(_type == 4)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        _experimenter = reader.read("!L")[0]
+        obj.xid, _experimenter, _subtype = reader.read_struct(_struct_LLL)
         assert(_experimenter == 6035143)
-        _subtype = reader.read("!L")[0]
         assert(_subtype == 67)
-        obj.data = str(reader.read_all())
+        obj.data = reader.read_all()
         return obj
 
     def __eq__(self, other):
@@ -6157,6 +5606,7 @@ class bsn_lua_notification(bsn_header):
 bsn_header.subtypes[67] = bsn_lua_notification
 
 class bsn_lua_upload(bsn_header):
+    __slots__ = ["filename", "flags"]
     version = 4
     type = 4
     experimenter = 6035143
@@ -6181,39 +5631,30 @@ class bsn_lua_upload(bsn_header):
             self.data = ''
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!L", self.experimenter))
-        packed.append(struct.pack("!L", self.subtype))
-        packed.append(struct.pack("!H", self.flags))
-        packed.append(struct.pack("!64s", self.filename))
-        packed.append(self.data)
-        length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_BBHLLLH64s, buf, offset, self.version, self.type, 0, self.xid, self.experimenter, self.subtype, self.flags, self.filename)
+        offset = loxi.generic_util.pack_bytes_into(self.data, buf, offset)
+        length = offset - start
+        _struct_H.pack_into(buf, start + 2, length)
+        return offset
+
+    def wire_length(self):
+        return 82 + len(self.data)
 
     @staticmethod
     def unpack(reader):
         obj = bsn_lua_upload()
-        _version = reader.read("!B")[0]
+        _version, _type, _length = reader.read_struct(_struct_BBH)
         assert(_version == 4)
-        _type = reader.read("!B")[0]
         assert(_type == 4)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        _experimenter = reader.read("!L")[0]
+        obj.xid, _experimenter, _subtype, obj.flags, obj.filename = reader.read_struct(_struct_LLLH64s)
         assert(_experimenter == 6035143)
-        _subtype = reader.read("!L")[0]
         assert(_subtype == 64)
-        obj.flags = reader.read("!H")[0]
-        obj.filename = reader.read("!64s")[0].rstrip("\x00")
-        obj.data = str(reader.read_all())
+        obj.filename = obj.filename.rstrip("\x00")
+        obj.data = reader.read_all()
         return obj
 
     def __eq__(self, other):
@@ -6249,6 +5690,7 @@ class bsn_lua_upload(bsn_header):
 bsn_header.subtypes[64] = bsn_lua_upload
 
 class bsn_pdu_rx_reply(bsn_header):
+    __slots__ = ["port_no", "slot_num", "status"]
     version = 4
     type = 4
     experimenter = 6035143
@@ -6273,39 +5715,27 @@ class bsn_pdu_rx_reply(bsn_header):
             self.slot_num = 0
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!L", self.experimenter))
-        packed.append(struct.pack("!L", self.subtype))
-        packed.append(struct.pack("!L", self.status))
-        packed.append(util.pack_port_no(self.port_no))
-        packed.append(struct.pack("!B", self.slot_num))
-        length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_BBHLLLLLB, buf, offset, self.version, self.type, 0, self.xid, self.experimenter, self.subtype, self.status, self.port_no, self.slot_num)
+        length = offset - start
+        _struct_H.pack_into(buf, start + 2, length)
+        return offset
+
+    def wire_length(self):
+        return 25
 
     @staticmethod
     def unpack(reader):
         obj = bsn_pdu_rx_reply()
-        _version = reader.read("!B")[0]
+        _version, _type, _length = reader.read_struct(_struct_BBH)
         assert(_version == 4)
-        _type = reader.read("!B")[0]
         assert(_type == 4)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        _experimenter = reader.read("!L")[0]
+        obj.xid, _experimenter, _subtype, obj.status, obj.port_no, obj.slot_num = reader.read_struct(_struct_LLLLLB)
         assert(_experimenter == 6035143)
-        _subtype = reader.read("!L")[0]
         assert(_subtype == 34)
-        obj.status = reader.read("!L")[0]
-        obj.port_no = util.unpack_port_no(reader)
-        obj.slot_num = reader.read("!B")[0]
         return obj
 
     def __eq__(self, other):
@@ -6341,6 +5771,7 @@ class bsn_pdu_rx_reply(bsn_header):
 bsn_header.subtypes[34] = bsn_pdu_rx_reply
 
 class bsn_pdu_rx_request(bsn_header):
+    __slots__ = ["port_no", "slot_num", "timeout_ms"]
     version = 4
     type = 4
     experimenter = 6035143
@@ -6369,43 +5800,29 @@ class bsn_pdu_rx_request(bsn_header):
             self.data = ''
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!L", self.experimenter))
-        packed.append(struct.pack("!L", self.subtype))
-        packed.append(struct.pack("!L", self.timeout_ms))
-        packed.append(util.pack_port_no(self.port_no))
-        packed.append(struct.pack("!B", self.slot_num))
-        packed.append('\x00' * 3)
-        packed.append(self.data)
-        length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_BBHLLLLLB3x, buf, offset, self.version, self.type, 0, self.xid, self.experimenter, self.subtype, self.timeout_ms, self.port_no, self.slot_num)
+        offset = loxi.generic_util.pack_bytes_into(self.data, buf, offset)
+        length = offset - start
+        _struct_H.pack_into(buf, start + 2, length)
+        return offset
+
+    def wire_length(self):
+        return 28 + len(self.data)
 
     @staticmethod
     def unpack(reader):
         obj = bsn_pdu_rx_request()
-        _version = reader.read("!B")[0]
+        _version, _type, _length = reader.read_struct(_struct_BBH)
         assert(_version == 4)
-        _type = reader.read("!B")[0]
         assert(_type == 4)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        _experimenter = reader.read("!L")[0]
+        obj.xid, _experimenter, _subtype, obj.timeout_ms, obj.port_no, obj.slot_num = reader.read_struct(_struct_LLLLLB3x)
         assert(_experimenter == 6035143)
-        _subtype = reader.read("!L")[0]
         assert(_subtype == 33)
-        obj.timeout_ms = reader.read("!L")[0]
-        obj.port_no = util.unpack_port_no(reader)
-        obj.slot_num = reader.read("!B")[0]
-        reader.skip(3)
-        obj.data = str(reader.read_all())
+        obj.data = reader.read_all()
         return obj
 
     def __eq__(self, other):
@@ -6445,6 +5862,7 @@ class bsn_pdu_rx_request(bsn_header):
 bsn_header.subtypes[33] = bsn_pdu_rx_request
 
 class bsn_pdu_rx_timeout(bsn_header):
+    __slots__ = ["port_no", "slot_num"]
     version = 4
     type = 4
     experimenter = 6035143
@@ -6465,37 +5883,27 @@ class bsn_pdu_rx_timeout(bsn_header):
             self.slot_num = 0
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!L", self.experimenter))
-        packed.append(struct.pack("!L", self.subtype))
-        packed.append(util.pack_port_no(self.port_no))
-        packed.append(struct.pack("!B", self.slot_num))
-        length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_BBHLLLLB, buf, offset, self.version, self.type, 0, self.xid, self.experimenter, self.subtype, self.port_no, self.slot_num)
+        length = offset - start
+        _struct_H.pack_into(buf, start + 2, length)
+        return offset
+
+    def wire_length(self):
+        return 21
 
     @staticmethod
     def unpack(reader):
         obj = bsn_pdu_rx_timeout()
-        _version = reader.read("!B")[0]
+        _version, _type, _length = reader.read_struct(_struct_BBH)
         assert(_version == 4)
-        _type = reader.read("!B")[0]
         assert(_type == 4)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        _experimenter = reader.read("!L")[0]
+        obj.xid, _experimenter, _subtype, obj.port_no, obj.slot_num = reader.read_struct(_struct_LLLLB)
         assert(_experimenter == 6035143)
-        _subtype = reader.read("!L")[0]
         assert(_subtype == 35)
-        obj.port_no = util.unpack_port_no(reader)
-        obj.slot_num = reader.read("!B")[0]
         return obj
 
     def __eq__(self, other):
@@ -6527,6 +5935,7 @@ class bsn_pdu_rx_timeout(bsn_header):
 bsn_header.subtypes[35] = bsn_pdu_rx_timeout
 
 class bsn_pdu_tx_reply(bsn_header):
+    __slots__ = ["port_no", "slot_num", "status"]
     version = 4
     type = 4
     experimenter = 6035143
@@ -6551,39 +5960,27 @@ class bsn_pdu_tx_reply(bsn_header):
             self.slot_num = 0
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!L", self.experimenter))
-        packed.append(struct.pack("!L", self.subtype))
-        packed.append(struct.pack("!L", self.status))
-        packed.append(util.pack_port_no(self.port_no))
-        packed.append(struct.pack("!B", self.slot_num))
-        length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_BBHLLLLLB, buf, offset, self.version, self.type, 0, self.xid, self.experimenter, self.subtype, self.status, self.port_no, self.slot_num)
+        length = offset - start
+        _struct_H.pack_into(buf, start + 2, length)
+        return offset
+
+    def wire_length(self):
+        return 25
 
     @staticmethod
     def unpack(reader):
         obj = bsn_pdu_tx_reply()
-        _version = reader.read("!B")[0]
+        _version, _type, _length = reader.read_struct(_struct_BBH)
         assert(_version == 4)
-        _type = reader.read("!B")[0]
         assert(_type == 4)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        _experimenter = reader.read("!L")[0]
+        obj.xid, _experimenter, _subtype, obj.status, obj.port_no, obj.slot_num = reader.read_struct(_struct_LLLLLB)
         assert(_experimenter == 6035143)
-        _subtype = reader.read("!L")[0]
         assert(_subtype == 32)
-        obj.status = reader.read("!L")[0]
-        obj.port_no = util.unpack_port_no(reader)
-        obj.slot_num = reader.read("!B")[0]
         return obj
 
     def __eq__(self, other):
@@ -6619,6 +6016,7 @@ class bsn_pdu_tx_reply(bsn_header):
 bsn_header.subtypes[32] = bsn_pdu_tx_reply
 
 class bsn_pdu_tx_request(bsn_header):
+    __slots__ = ["port_no", "slot_num", "tx_interval_ms"]
     version = 4
     type = 4
     experimenter = 6035143
@@ -6647,43 +6045,29 @@ class bsn_pdu_tx_request(bsn_header):
             self.data = ''
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!L", self.experimenter))
-        packed.append(struct.pack("!L", self.subtype))
-        packed.append(struct.pack("!L", self.tx_interval_ms))
-        packed.append(util.pack_port_no(self.port_no))
-        packed.append(struct.pack("!B", self.slot_num))
-        packed.append('\x00' * 3)
-        packed.append(self.data)
-        length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_BBHLLLLLB3x, buf, offset, self.version, self.type, 0, self.xid, self.experimenter, self.subtype, self.tx_interval_ms, self.port_no, self.slot_num)
+        offset = loxi.generic_util.pack_bytes_into(self.data, buf, offset)
+        length = offset - start
+        _struct_H.pack_into(buf, start + 2, length)
+        return offset
+
+    def wire_length(self):
+        return 28 + len(self.data)
 
     @staticmethod
     def unpack(reader):
         obj = bsn_pdu_tx_request()
-        _version = reader.read("!B")[0]
+        _version, _type, _length = reader.read_struct(_struct_BBH)
         assert(_version == 4)
-        _type = reader.read("!B")[0]
         assert(_type == 4)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        _experimenter = reader.read("!L")[0]
+        obj.xid, _experimenter, _subtype, obj.tx_interval_ms, obj.port_no, obj.slot_num = reader.read_struct(_struct_LLLLLB3x)
         assert(_experimenter == 6035143)
-        _subtype = reader.read("!L")[0]
         assert(_subtype == 31)
-        obj.tx_interval_ms = reader.read("!L")[0]
-        obj.port_no = util.unpack_port_no(reader)
-        obj.slot_num = reader.read("!B")[0]
-        reader.skip(3)
-        obj.data = str(reader.read_all())
+        obj.data = reader.read_all()
         return obj
 
     def __eq__(self, other):
@@ -6723,6 +6107,7 @@ class bsn_pdu_tx_request(bsn_header):
 bsn_header.subtypes[31] = bsn_pdu_tx_request
 
 class bsn_port_counter_stats_reply(bsn_stats_reply):
+    __slots__ = ["entries"]
     version = 4
     type = 19
     stats_type = 65535
@@ -6744,40 +6129,28 @@ class bsn_port_counter_stats_reply(bsn_stats_reply):
             self.entries = []
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!H", self.stats_type))
-        packed.append(struct.pack("!H", self.flags))
-        packed.append('\x00' * 4)
-        packed.append(struct.pack("!L", self.experimenter))
-        packed.append(struct.pack("!L", self.subtype))
-        packed.append(loxi.generic_util.pack_list(self.entries))
-        length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_BBHLHH4xLL, buf, offset, self.version, self.type, 0, self.xid, self.stats_type, self.flags, self.experimenter, self.subtype)
+        offset = loxi.generic_util.pack_list_into(self.entries, buf, offset)
+        length = offset - start
+        _struct_H.pack_into(buf, start + 2, length)
+        return offset
+
+    def wire_length(self):
+        return 24 + loxi.generic_util.list_wire_length(self.entries)
 
     @staticmethod
     def unpack(reader):
         obj = bsn_port_counter_stats_reply()
-        _version = reader.read("!B")[0]
+        _version, _type, _length = reader.read_struct(_struct_BBH)
         assert(_version == 4)
-        _type = reader.read("!B")[0]
         assert(_type == 19)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        _stats_type = reader.read("!H")[0]
+        obj.xid, _stats_type, obj.flags, _experimenter, _subtype = reader.read_struct(_struct_LHH4xLL)
         assert(_stats_type == 65535)
-        obj.flags = reader.read("!H")[0]
-        reader.skip(4)
-        _experimenter = reader.read("!L")[0]
         assert(_experimenter == 6035143)
-        _subtype = reader.read("!L")[0]
         assert(_subtype == 8)
         obj.entries = loxi.generic_util.unpack_list(reader, ofp.common.bsn_port_counter_stats_entry.unpack)
         return obj
@@ -6811,6 +6184,7 @@ class bsn_port_counter_stats_reply(bsn_stats_reply):
 bsn_stats_reply.subtypes[8] = bsn_port_counter_stats_reply
 
 class bsn_port_counter_stats_request(bsn_stats_request):
+    __slots__ = ["port_no"]
     version = 4
     type = 18
     stats_type = 65535
@@ -6832,42 +6206,28 @@ class bsn_port_counter_stats_request(bsn_stats_request):
             self.port_no = 0
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!H", self.stats_type))
-        packed.append(struct.pack("!H", self.flags))
-        packed.append('\x00' * 4)
-        packed.append(struct.pack("!L", self.experimenter))
-        packed.append(struct.pack("!L", self.subtype))
-        packed.append(util.pack_port_no(self.port_no))
-        length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_BBHLHH4xLLL, buf, offset, self.version, self.type, 0, self.xid, self.stats_type, self.flags, self.experimenter, self.subtype, self.port_no)
+        length = offset - start
+        _struct_H.pack_into(buf, start + 2, length)
+        return offset
+
+    def wire_length(self):
+        return 28
 
     @staticmethod
     def unpack(reader):
         obj = bsn_port_counter_stats_request()
-        _version = reader.read("!B")[0]
+        _version, _type, _length = reader.read_struct(_struct_BBH)
         assert(_version == 4)
-        _type = reader.read("!B")[0]
         assert(_type == 18)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        _stats_type = reader.read("!H")[0]
+        obj.xid, _stats_type, obj.flags, _experimenter, _subtype, obj.port_no = reader.read_struct(_struct_LHH4xLLL)
         assert(_stats_type == 65535)
-        obj.flags = reader.read("!H")[0]
-        reader.skip(4)
-        _experimenter = reader.read("!L")[0]
         assert(_experimenter == 6035143)
-        _subtype = reader.read("!L")[0]
         assert(_subtype == 8)
-        obj.port_no = util.unpack_port_no(reader)
         return obj
 
     def __eq__(self, other):
@@ -6899,6 +6259,7 @@ class bsn_port_counter_stats_request(bsn_stats_request):
 bsn_stats_request.subtypes[8] = bsn_port_counter_stats_request
 
 class bsn_role_status(bsn_header):
+    __slots__ = ["generation_id", "reason", "role"]
     version = 4
     type = 4
     experimenter = 6035143
@@ -6923,41 +6284,27 @@ class bsn_role_status(bsn_header):
             self.generation_id = 0
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!L", self.experimenter))
-        packed.append(struct.pack("!L", self.subtype))
-        packed.append(struct.pack("!L", self.role))
-        packed.append(struct.pack("!B", self.reason))
-        packed.append('\x00' * 3)
-        packed.append(struct.pack("!Q", self.generation_id))
-        length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_BBHLLLLB3xQ, buf, offset, self.version, self.type, 0, self.xid, self.experimenter, self.subtype, self.role, self.reason, self.generation_id)
+        length = offset - start
+        _struct_H.pack_into(buf, start + 2, length)
+        return offset
+
+    def wire_length(self):
+        return 32
 
     @staticmethod
     def unpack(reader):
         obj = bsn_role_status()
-        _version = reader.read("!B")[0]
+        _version, _type, _length = reader.read_struct(_struct_BBH)
         assert(_version == 4)
-        _type = reader.read("!B")[0]
         assert(_type == 4)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        _experimenter = reader.read("!L")[0]
+        obj.xid, _experimenter, _subtype, obj.role, obj.reason, obj.generation_id = reader.read_struct(_struct_LLLLB3xQ)
         assert(_experimenter == 6035143)
-        _subtype = reader.read("!L")[0]
         assert(_subtype == 55)
-        obj.role = reader.read("!L")[0]
-        obj.reason = reader.read("!B")[0]
-        reader.skip(3)
-        obj.generation_id = reader.read("!Q")[0]
         return obj
 
     def __eq__(self, other):
@@ -6993,6 +6340,7 @@ class bsn_role_status(bsn_header):
 bsn_header.subtypes[55] = bsn_role_status
 
 class bsn_set_aux_cxns_reply(bsn_header):
+    __slots__ = ["num_aux", "status"]
     version = 4
     type = 4
     experimenter = 6035143
@@ -7013,37 +6361,27 @@ class bsn_set_aux_cxns_reply(bsn_header):
             self.status = 0
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!L", self.experimenter))
-        packed.append(struct.pack("!L", self.subtype))
-        packed.append(struct.pack("!L", self.num_aux))
-        packed.append(struct.pack("!L", self.status))
-        length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_BBHLLLLL, buf, offset, self.version, self.type, 0, self.xid, self.experimenter, self.subtype, self.num_aux, self.status)
+        length = offset - start
+        _struct_H.pack_into(buf, start + 2, length)
+        return offset
+
+    def wire_length(self):
+        return 24
 
     @staticmethod
     def unpack(reader):
         obj = bsn_set_aux_cxns_reply()
-        _version = reader.read("!B")[0]
+        _version, _type, _length = reader.read_struct(_struct_BBH)
         assert(_version == 4)
-        _type = reader.read("!B")[0]
         assert(_type == 4)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        _experimenter = reader.read("!L")[0]
+        obj.xid, _experimenter, _subtype, obj.num_aux, obj.status = reader.read_struct(_struct_LLLLL)
         assert(_experimenter == 6035143)
-        _subtype = reader.read("!L")[0]
         assert(_subtype == 59)
-        obj.num_aux = reader.read("!L")[0]
-        obj.status = reader.read("!L")[0]
         return obj
 
     def __eq__(self, other):
@@ -7075,6 +6413,7 @@ class bsn_set_aux_cxns_reply(bsn_header):
 bsn_header.subtypes[59] = bsn_set_aux_cxns_reply
 
 class bsn_set_aux_cxns_request(bsn_header):
+    __slots__ = ["num_aux"]
     version = 4
     type = 4
     experimenter = 6035143
@@ -7091,35 +6430,27 @@ class bsn_set_aux_cxns_request(bsn_header):
             self.num_aux = 0
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!L", self.experimenter))
-        packed.append(struct.pack("!L", self.subtype))
-        packed.append(struct.pack("!L", self.num_aux))
-        length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_BBHLLLL, buf, offset, self.version, self.type, 0, self.xid, self.experimenter, self.subtype, self.num_aux)
+        length = offset - start
+        _struct_H.pack_into(buf, start + 2, length)
+        return offset
+
+    def wire_length(self):
+        return 20
 
     @staticmethod
     def unpack(reader):
         obj = bsn_set_aux_cxns_request()
-        _version = reader.read("!B")[0]
+        _version, _type, _length = reader.read_struct(_struct_BBH)
         assert(_version == 4)
-        _type = reader.read("!B")[0]
         assert(_type == 4)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        _experimenter = reader.read("!L")[0]
+        obj.xid, _experimenter, _subtype, obj.num_aux = reader.read_struct(_struct_LLLL)
         assert(_experimenter == 6035143)
-        _subtype = reader.read("!L")[0]
         assert(_subtype == 58)
-        obj.num_aux = reader.read("!L")[0]
         return obj
 
     def __eq__(self, other):
@@ -7147,6 +6478,7 @@ class bsn_set_aux_cxns_request(bsn_header):
 bsn_header.subtypes[58] = bsn_set_aux_cxns_request
 
 class bsn_set_lacp_reply(bsn_header):
+    __slots__ = ["port_no", "status"]
     version = 4
     type = 4
     experimenter = 6035143
@@ -7167,37 +6499,27 @@ class bsn_set_lacp_reply(bsn_header):
             self.port_no = 0
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!L", self.experimenter))
-        packed.append(struct.pack("!L", self.subtype))
-        packed.append(struct.pack("!L", self.status))
-        packed.append(util.pack_port_no(self.port_no))
-        length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_BBHLLLLL, buf, offset, self.version, self.type, 0, self.xid, self.experimenter, self.subtype, self.status, self.port_no)
+        length = offset - start
+        _struct_H.pack_into(buf, start + 2, length)
+        return offset
+
+    def wire_length(self):
+        return 24
 
     @staticmethod
     def unpack(reader):
         obj = bsn_set_lacp_reply()
-        _version = reader.read("!B")[0]
+        _version, _type, _length = reader.read_struct(_struct_BBH)
         assert(_version == 4)
-        _type = reader.read("!B")[0]
         assert(_type == 4)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        _experimenter = reader.read("!L")[0]
+        obj.xid, _experimenter, _subtype, obj.status, obj.port_no = reader.read_struct(_struct_LLLLL)
         assert(_experimenter == 6035143)
-        _subtype = reader.read("!L")[0]
         assert(_subtype == 42)
-        obj.status = reader.read("!L")[0]
-        obj.port_no = util.unpack_port_no(reader)
         return obj
 
     def __eq__(self, other):
@@ -7229,6 +6551,7 @@ class bsn_set_lacp_reply(bsn_header):
 bsn_header.subtypes[42] = bsn_set_lacp_reply
 
 class bsn_set_lacp_request(bsn_header):
+    __slots__ = ["actor_key", "actor_port_num", "actor_port_priority", "actor_sys_mac", "actor_sys_priority", "enabled", "port_no"]
     version = 4
     type = 4
     experimenter = 6035143
@@ -7269,49 +6592,31 @@ class bsn_set_lacp_request(bsn_header):
             self.actor_key = 0
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!L", self.experimenter))
-        packed.append(struct.pack("!L", self.subtype))
-        packed.append(struct.pack("!B", self.enabled))
-        packed.append('\x00' * 3)
-        packed.append(util.pack_port_no(self.port_no))
-        packed.append(struct.pack("!H", self.actor_sys_priority))
-        packed.append(struct.pack("!6B", *self.actor_sys_mac))
-        packed.append(struct.pack("!H", self.actor_port_priority))
-        packed.append(struct.pack("!H", self.actor_port_num))
-        packed.append(struct.pack("!H", self.actor_key))
-        length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_BBHLLLB3xLH, buf, offset, self.version, self.type, 0, self.xid, self.experimenter, self.subtype, self.enabled, self.port_no, self.actor_sys_priority)
+        offset = loxi.generic_util.pack_struct_into(_struct_6B, buf, offset, *self.actor_sys_mac)
+        offset = loxi.generic_util.pack_struct_into(_struct_HHH, buf, offset, self.actor_port_priority, self.actor_port_num, self.actor_key)
+        length = offset - start
+        _struct_H.pack_into(buf, start + 2, length)
+        return offset
+
+    def wire_length(self):
+        return 38
 
     @staticmethod
     def unpack(reader):
         obj = bsn_set_lacp_request()
-        _version = reader.read("!B")[0]
+        _version, _type, _length = reader.read_struct(_struct_BBH)
         assert(_version == 4)
-        _type = reader.read("!B")[0]
         assert(_type == 4)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        _experimenter = reader.read("!L")[0]
+        obj.xid, _experimenter, _subtype, obj.enabled, obj.port_no, obj.actor_sys_priority = reader.read_struct(_struct_LLLB3xLH)
         assert(_experimenter == 6035143)
-        _subtype = reader.read("!L")[0]
         assert(_subtype == 41)
-        obj.enabled = reader.read("!B")[0]
-        reader.skip(3)
-        obj.port_no = util.unpack_port_no(reader)
-        obj.actor_sys_priority = reader.read("!H")[0]
         obj.actor_sys_mac = list(reader.read('!6B'))
-        obj.actor_port_priority = reader.read("!H")[0]
-        obj.actor_port_num = reader.read("!H")[0]
-        obj.actor_key = reader.read("!H")[0]
+        obj.actor_port_priority, obj.actor_port_num, obj.actor_key = reader.read_struct(_struct_HHH)
         return obj
 
     def __eq__(self, other):
@@ -7363,6 +6668,7 @@ class bsn_set_lacp_request(bsn_header):
 bsn_header.subtypes[41] = bsn_set_lacp_request
 
 class bsn_set_mirroring(bsn_header):
+    __slots__ = ["report_mirror_ports"]
     version = 4
     type = 4
     experimenter = 6035143
@@ -7379,37 +6685,27 @@ class bsn_set_mirroring(bsn_header):
             self.report_mirror_ports = 0
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!L", self.experimenter))
-        packed.append(struct.pack("!L", self.subtype))
-        packed.append(struct.pack("!B", self.report_mirror_ports))
-        packed.append('\x00' * 3)
-        length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_BBHLLLB3x, buf, offset, self.version, self.type, 0, self.xid, self.experimenter, self.subtype, self.report_mirror_ports)
+        length = offset - start
+        _struct_H.pack_into(buf, start + 2, length)
+        return offset
+
+    def wire_length(self):
+        return 20
 
     @staticmethod
     def unpack(reader):
         obj = bsn_set_mirroring()
-        _version = reader.read("!B")[0]
+        _version, _type, _length = reader.read_struct(_struct_BBH)
         assert(_version == 4)
-        _type = reader.read("!B")[0]
         assert(_type == 4)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        _experimenter = reader.read("!L")[0]
+        obj.xid, _experimenter, _subtype, obj.report_mirror_ports = reader.read_struct(_struct_LLLB3x)
         assert(_experimenter == 6035143)
-        _subtype = reader.read("!L")[0]
         assert(_subtype == 3)
-        obj.report_mirror_ports = reader.read("!B")[0]
-        reader.skip(3)
         return obj
 
     def __eq__(self, other):
@@ -7437,6 +6733,7 @@ class bsn_set_mirroring(bsn_header):
 bsn_header.subtypes[3] = bsn_set_mirroring
 
 class bsn_set_pktin_suppression_reply(bsn_header):
+    __slots__ = ["status"]
     version = 4
     type = 4
     experimenter = 6035143
@@ -7453,35 +6750,27 @@ class bsn_set_pktin_suppression_reply(bsn_header):
             self.status = 0
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!L", self.experimenter))
-        packed.append(struct.pack("!L", self.subtype))
-        packed.append(struct.pack("!L", self.status))
-        length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_BBHLLLL, buf, offset, self.version, self.type, 0, self.xid, self.experimenter, self.subtype, self.status)
+        length = offset - start
+        _struct_H.pack_into(buf, start + 2, length)
+        return offset
+
+    def wire_length(self):
+        return 20
 
     @staticmethod
     def unpack(reader):
         obj = bsn_set_pktin_suppression_reply()
-        _version = reader.read("!B")[0]
+        _version, _type, _length = reader.read_struct(_struct_BBH)
         assert(_version == 4)
-        _type = reader.read("!B")[0]
         assert(_type == 4)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        _experimenter = reader.read("!L")[0]
+        obj.xid, _experimenter, _subtype, obj.status = reader.read_struct(_struct_LLLL)
         assert(_experimenter == 6035143)
-        _subtype = reader.read("!L")[0]
         assert(_subtype == 25)
-        obj.status = reader.read("!L")[0]
         return obj
 
     def __eq__(self, other):
@@ -7509,6 +6798,7 @@ class bsn_set_pktin_suppression_reply(bsn_header):
 bsn_header.subtypes[25] = bsn_set_pktin_suppression_reply
 
 class bsn_set_pktin_suppression_request(bsn_header):
+    __slots__ = ["cookie", "enabled", "hard_timeout", "idle_timeout", "priority"]
     version = 4
     type = 4
     experimenter = 6035143
@@ -7541,45 +6831,27 @@ class bsn_set_pktin_suppression_request(bsn_header):
             self.cookie = 0
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!L", self.experimenter))
-        packed.append(struct.pack("!L", self.subtype))
-        packed.append(struct.pack("!B", self.enabled))
-        packed.append('\x00' * 1)
-        packed.append(struct.pack("!H", self.idle_timeout))
-        packed.append(struct.pack("!H", self.hard_timeout))
-        packed.append(struct.pack("!H", self.priority))
-        packed.append(struct.pack("!Q", self.cookie))
-        length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_BBHLLLBxHHHQ, buf, offset, self.version, self.type, 0, self.xid, self.experimenter, self.subtype, self.enabled, self.idle_timeout, self.hard_timeout, self.priority, self.cookie)
+        length = offset - start
+        _struct_H.pack_into(buf, start + 2, length)
+        return offset
+
+    def wire_length(self):
+        return 32
 
     @staticmethod
     def unpack(reader):
         obj = bsn_set_pktin_suppression_request()
-        _version = reader.read("!B")[0]
+        _version, _type, _length = reader.read_struct(_struct_BBH)
         assert(_version == 4)
-        _type = reader.read("!B")[0]
         assert(_type == 4)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        _experimenter = reader.read("!L")[0]
+        obj.xid, _experimenter, _subtype, obj.enabled, obj.idle_timeout, obj.hard_timeout, obj.priority, obj.cookie = reader.read_struct(_struct_LLLBxHHHQ)
         assert(_experimenter == 6035143)
-        _subtype = reader.read("!L")[0]
         assert(_subtype == 11)
-        obj.enabled = reader.read("!B")[0]
-        reader.skip(1)
-        obj.idle_timeout = reader.read("!H")[0]
-        obj.hard_timeout = reader.read("!H")[0]
-        obj.priority = reader.read("!H")[0]
-        obj.cookie = reader.read("!Q")[0]
         return obj
 
     def __eq__(self, other):
@@ -7623,6 +6895,7 @@ class bsn_set_pktin_suppression_request(bsn_header):
 bsn_header.subtypes[11] = bsn_set_pktin_suppression_request
 
 class bsn_set_switch_pipeline_reply(bsn_header):
+    __slots__ = ["status"]
     version = 4
     type = 4
     experimenter = 6035143
@@ -7639,35 +6912,27 @@ class bsn_set_switch_pipeline_reply(bsn_header):
             self.status = 0
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!L", self.experimenter))
-        packed.append(struct.pack("!L", self.subtype))
-        packed.append(struct.pack("!L", self.status))
-        length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_BBHLLLL, buf, offset, self.version, self.type, 0, self.xid, self.experimenter, self.subtype, self.status)
+        length = offset - start
+        _struct_H.pack_into(buf, start + 2, length)
+        return offset
+
+    def wire_length(self):
+        return 20
 
     @staticmethod
     def unpack(reader):
         obj = bsn_set_switch_pipeline_reply()
-        _version = reader.read("!B")[0]
+        _version, _type, _length = reader.read_struct(_struct_BBH)
         assert(_version == 4)
-        _type = reader.read("!B")[0]
         assert(_type == 4)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        _experimenter = reader.read("!L")[0]
+        obj.xid, _experimenter, _subtype, obj.status = reader.read_struct(_struct_LLLL)
         assert(_experimenter == 6035143)
-        _subtype = reader.read("!L")[0]
         assert(_subtype == 54)
-        obj.status = reader.read("!L")[0]
         return obj
 
     def __eq__(self, other):
@@ -7695,6 +6960,7 @@ class bsn_set_switch_pipeline_reply(bsn_header):
 bsn_header.subtypes[54] = bsn_set_switch_pipeline_reply
 
 class bsn_set_switch_pipeline_request(bsn_header):
+    __slots__ = ["pipeline"]
     version = 4
     type = 4
     experimenter = 6035143
@@ -7711,35 +6977,28 @@ class bsn_set_switch_pipeline_request(bsn_header):
             self.pipeline = ""
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!L", self.experimenter))
-        packed.append(struct.pack("!L", self.subtype))
-        packed.append(struct.pack("!256s", self.pipeline))
-        length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_BBHLLL256s, buf, offset, self.version, self.type, 0, self.xid, self.experimenter, self.subtype, self.pipeline)
+        length = offset - start
+        _struct_H.pack_into(buf, start + 2, length)
+        return offset
+
+    def wire_length(self):
+        return 272
 
     @staticmethod
     def unpack(reader):
         obj = bsn_set_switch_pipeline_request()
-        _version = reader.read("!B")[0]
+        _version, _type, _length = reader.read_struct(_struct_BBH)
         assert(_version == 4)
-        _type = reader.read("!B")[0]
         assert(_type == 4)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        _experimenter = reader.read("!L")[0]
+        obj.xid, _experimenter, _subtype, obj.pipeline = reader.read_struct(_struct_LLL256s)
         assert(_experimenter == 6035143)
-        _subtype = reader.read("!L")[0]
         assert(_subtype == 53)
-        obj.pipeline = reader.read("!256s")[0].rstrip("\x00")
+        obj.pipeline = obj.pipeline.rstrip("\x00")
         return obj
 
     def __eq__(self, other):
@@ -7767,6 +7026,7 @@ class bsn_set_switch_pipeline_request(bsn_header):
 bsn_header.subtypes[53] = bsn_set_switch_pipeline_request
 
 class bsn_switch_pipeline_stats_reply(bsn_stats_reply):
+    __slots__ = ["entries"]
     version = 4
     type = 19
     stats_type = 65535
@@ -7788,40 +7048,28 @@ class bsn_switch_pipeline_stats_reply(bsn_stats_reply):
             self.entries = []
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!H", self.stats_type))
-        packed.append(struct.pack("!H", self.flags))
-        packed.append('\x00' * 4)
-        packed.append(struct.pack("!L", self.experimenter))
-        packed.append(struct.pack("!L", self.subtype))
-        packed.append(loxi.generic_util.pack_list(self.entries))
-        length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_BBHLHH4xLL, buf, offset, self.version, self.type, 0, self.xid, self.stats_type, self.flags, self.experimenter, self.subtype)
+        offset = loxi.generic_util.pack_list_into(self.entries, buf, offset)
+        length = offset - start
+        _struct_H.pack_into(buf, start + 2, length)
+        return offset
+
+    def wire_length(self):
+        return 24 + loxi.generic_util.list_wire_length(self.entries)
 
     @staticmethod
     def unpack(reader):
         obj = bsn_switch_pipeline_stats_reply()
-        _version = reader.read("!B")[0]
+        _version, _type, _length = reader.read_struct(_struct_BBH)
         assert(_version == 4)
-        _type = reader.read("!B")[0]
         assert(_type == 19)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        _stats_type = reader.read("!H")[0]
+        obj.xid, _stats_type, obj.flags, _experimenter, _subtype = reader.read_struct(_struct_LHH4xLL)
         assert(_stats_type == 65535)
-        obj.flags = reader.read("!H")[0]
-        reader.skip(4)
-        _experimenter = reader.read("!L")[0]
         assert(_experimenter == 6035143)
-        _subtype = reader.read("!L")[0]
         assert(_subtype == 6)
         obj.entries = loxi.generic_util.unpack_list(reader, ofp.common.bsn_switch_pipeline_stats_entry.unpack)
         return obj
@@ -7855,6 +7103,7 @@ class bsn_switch_pipeline_stats_reply(bsn_stats_reply):
 bsn_stats_reply.subtypes[6] = bsn_switch_pipeline_stats_reply
 
 class bsn_switch_pipeline_stats_request(bsn_stats_request):
+    __slots__ = []
     version = 4
     type = 18
     stats_type = 65535
@@ -7872,39 +7121,27 @@ class bsn_switch_pipeline_stats_request(bsn_stats_request):
             self.flags = 0
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!H", self.stats_type))
-        packed.append(struct.pack("!H", self.flags))
-        packed.append('\x00' * 4)
-        packed.append(struct.pack("!L", self.experimenter))
-        packed.append(struct.pack("!L", self.subtype))
-        length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_BBHLHH4xLL, buf, offset, self.version, self.type, 0, self.xid, self.stats_type, self.flags, self.experimenter, self.subtype)
+        length = offset - start
+        _struct_H.pack_into(buf, start + 2, length)
+        return offset
+
+    def wire_length(self):
+        return 24
 
     @staticmethod
     def unpack(reader):
         obj = bsn_switch_pipeline_stats_request()
-        _version = reader.read("!B")[0]
+        _version, _type, _length = reader.read_struct(_struct_BBH)
         assert(_version == 4)
-        _type = reader.read("!B")[0]
         assert(_type == 18)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        _stats_type = reader.read("!H")[0]
+        obj.xid, _stats_type, obj.flags, _experimenter, _subtype = reader.read_struct(_struct_LHH4xLL)
         assert(_stats_type == 65535)
-        obj.flags = reader.read("!H")[0]
-        reader.skip(4)
-        _experimenter = reader.read("!L")[0]
         assert(_experimenter == 6035143)
-        _subtype = reader.read("!L")[0]
         assert(_subtype == 6)
         return obj
 
@@ -7933,6 +7170,7 @@ class bsn_switch_pipeline_stats_request(bsn_stats_request):
 bsn_stats_request.subtypes[6] = bsn_switch_pipeline_stats_request
 
 class bsn_table_checksum_stats_reply(bsn_stats_reply):
+    __slots__ = ["entries"]
     version = 4
     type = 19
     stats_type = 65535
@@ -7954,40 +7192,28 @@ class bsn_table_checksum_stats_reply(bsn_stats_reply):
             self.entries = []
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!H", self.stats_type))
-        packed.append(struct.pack("!H", self.flags))
-        packed.append('\x00' * 4)
-        packed.append(struct.pack("!L", self.experimenter))
-        packed.append(struct.pack("!L", self.subtype))
-        packed.append(loxi.generic_util.pack_list(self.entries))
-        length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_BBHLHH4xLL, buf, offset, self.version, self.type, 0, self.xid, self.stats_type, self.flags, self.experimenter, self.subtype)
+        offset = loxi.generic_util.pack_list_into(self.entries, buf, offset)
+        length = offset - start
+        _struct_H.pack_into(buf, start + 2, length)
+        return offset
+
+    def wire_length(self):
+        return 24 + loxi.generic_util.list_wire_length(self.entries)
 
     @staticmethod
     def unpack(reader):
         obj = bsn_table_checksum_stats_reply()
-        _version = reader.read("!B")[0]
+        _version, _type, _length = reader.read_struct(_struct_BBH)
         assert(_version == 4)
-        _type = reader.read("!B")[0]
         assert(_type == 19)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        _stats_type = reader.read("!H")[0]
+        obj.xid, _stats_type, obj.flags, _experimenter, _subtype = reader.read_struct(_struct_LHH4xLL)
         assert(_stats_type == 65535)
-        obj.flags = reader.read("!H")[0]
-        reader.skip(4)
-        _experimenter = reader.read("!L")[0]
         assert(_experimenter == 6035143)
-        _subtype = reader.read("!L")[0]
         assert(_subtype == 11)
         obj.entries = loxi.generic_util.unpack_list(reader, ofp.common.bsn_table_checksum_stats_entry.unpack)
         return obj
@@ -8021,6 +7247,7 @@ class bsn_table_checksum_stats_reply(bsn_stats_reply):
 bsn_stats_reply.subtypes[11] = bsn_table_checksum_stats_reply
 
 class bsn_table_checksum_stats_request(bsn_stats_request):
+    __slots__ = []
     version = 4
     type = 18
     stats_type = 65535
@@ -8038,39 +7265,27 @@ class bsn_table_checksum_stats_request(bsn_stats_request):
             self.flags = 0
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!H", self.stats_type))
-        packed.append(struct.pack("!H", self.flags))
-        packed.append('\x00' * 4)
-        packed.append(struct.pack("!L", self.experimenter))
-        packed.append(struct.pack("!L", self.subtype))
-        length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_BBHLHH4xLL, buf, offset, self.version, self.type, 0, self.xid, self.stats_type, self.flags, self.experimenter, self.subtype)
+        length = offset - start
+        _struct_H.pack_into(buf, start + 2, length)
+        return offset
+
+    def wire_length(self):
+        return 24
 
     @staticmethod
     def unpack(reader):
         obj = bsn_table_checksum_stats_request()
-        _version = reader.read("!B")[0]
+        _version, _type, _length = reader.read_struct(_struct_BBH)
         assert(_version == 4)
-        _type = reader.read("!B")[0]
         assert(_type == 18)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        _stats_type = reader.read("!H")[0]
+        obj.xid, _stats_type, obj.flags, _experimenter, _subtype = reader.read_struct(_struct_LHH4xLL)
         assert(_stats_type == 65535)
-        obj.flags = reader.read("!H")[0]
-        reader.skip(4)
-        _experimenter = reader.read("!L")[0]
         assert(_experimenter == 6035143)
-        _subtype = reader.read("!L")[0]
         assert(_subtype == 11)
         return obj
 
@@ -8099,6 +7314,7 @@ class bsn_table_checksum_stats_request(bsn_stats_request):
 bsn_stats_request.subtypes[11] = bsn_table_checksum_stats_request
 
 class bsn_table_set_buckets_size(bsn_header):
+    __slots__ = ["buckets_size", "table_id"]
     version = 4
     type = 4
     experimenter = 6035143
@@ -8119,41 +7335,27 @@ class bsn_table_set_buckets_size(bsn_header):
             self.buckets_size = 0
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!L", self.experimenter))
-        packed.append(struct.pack("!L", self.subtype))
-        packed.append('\x00' * 1)
-        packed.append(struct.pack("!B", self.table_id))
-        packed.append('\x00' * 2)
-        packed.append(struct.pack("!L", self.buckets_size))
-        length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_BBHLLLxB2xL, buf, offset, self.version, self.type, 0, self.xid, self.experimenter, self.subtype, self.table_id, self.buckets_size)
+        length = offset - start
+        _struct_H.pack_into(buf, start + 2, length)
+        return offset
+
+    def wire_length(self):
+        return 24
 
     @staticmethod
     def unpack(reader):
         obj = bsn_table_set_buckets_size()
-        _version = reader.read("!B")[0]
+        _version, _type, _length = reader.read_struct(_struct_BBH)
         assert(_version == 4)
-        _type = reader.read("!B")[0]
         assert(_type == 4)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        _experimenter = reader.read("!L")[0]
+        obj.xid, _experimenter, _subtype, obj.table_id, obj.buckets_size = reader.read_struct(_struct_LLLxB2xL)
         assert(_experimenter == 6035143)
-        _subtype = reader.read("!L")[0]
         assert(_subtype == 61)
-        reader.skip(1)
-        obj.table_id = reader.read("!B")[0]
-        reader.skip(2)
-        obj.buckets_size = reader.read("!L")[0]
         return obj
 
     def __eq__(self, other):
@@ -8185,6 +7387,7 @@ class bsn_table_set_buckets_size(bsn_header):
 bsn_header.subtypes[61] = bsn_table_set_buckets_size
 
 class bsn_time_reply(bsn_header):
+    __slots__ = ["time_ms"]
     version = 4
     type = 4
     experimenter = 6035143
@@ -8201,35 +7404,27 @@ class bsn_time_reply(bsn_header):
             self.time_ms = 0
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!L", self.experimenter))
-        packed.append(struct.pack("!L", self.subtype))
-        packed.append(struct.pack("!Q", self.time_ms))
-        length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_BBHLLLQ, buf, offset, self.version, self.type, 0, self.xid, self.experimenter, self.subtype, self.time_ms)
+        length = offset - start
+        _struct_H.pack_into(buf, start + 2, length)
+        return offset
+
+    def wire_length(self):
+        return 24
 
     @staticmethod
     def unpack(reader):
         obj = bsn_time_reply()
-        _version = reader.read("!B")[0]
+        _version, _type, _length = reader.read_struct(_struct_BBH)
         assert(_version == 4)
-        _type = reader.read("!B")[0]
         assert(_type == 4)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        _experimenter = reader.read("!L")[0]
+        obj.xid, _experimenter, _subtype, obj.time_ms = reader.read_struct(_struct_LLLQ)
         assert(_experimenter == 6035143)
-        _subtype = reader.read("!L")[0]
         assert(_subtype == 45)
-        obj.time_ms = reader.read("!Q")[0]
         return obj
 
     def __eq__(self, other):
@@ -8257,6 +7452,7 @@ class bsn_time_reply(bsn_header):
 bsn_header.subtypes[45] = bsn_time_reply
 
 class bsn_time_request(bsn_header):
+    __slots__ = []
     version = 4
     type = 4
     experimenter = 6035143
@@ -8269,32 +7465,26 @@ class bsn_time_request(bsn_header):
             self.xid = None
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!L", self.experimenter))
-        packed.append(struct.pack("!L", self.subtype))
-        length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_BBHLLL, buf, offset, self.version, self.type, 0, self.xid, self.experimenter, self.subtype)
+        length = offset - start
+        _struct_H.pack_into(buf, start + 2, length)
+        return offset
+
+    def wire_length(self):
+        return 16
 
     @staticmethod
     def unpack(reader):
         obj = bsn_time_request()
-        _version = reader.read("!B")[0]
+        _version, _type, _length = reader.read_struct(_struct_BBH)
         assert(_version == 4)
-        _type = reader.read("!B")[0]
         assert(_type == 4)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        _experimenter = reader.read("!L")[0]
+        obj.xid, _experimenter, _subtype = reader.read_struct(_struct_LLL)
         assert(_experimenter == 6035143)
-        _subtype = reader.read("!L")[0]
         assert(_subtype == 44)
         return obj
 
@@ -8319,6 +7509,7 @@ class bsn_time_request(bsn_header):
 bsn_header.subtypes[44] = bsn_time_request
 
 class bsn_virtual_port_create_reply(bsn_header):
+    __slots__ = ["status", "vport_no"]
     version = 4
     type = 4
     experimenter = 6035143
@@ -8339,37 +7530,27 @@ class bsn_virtual_port_create_reply(bsn_header):
             self.vport_no = 0
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!L", self.experimenter))
-        packed.append(struct.pack("!L", self.subtype))
-        packed.append(struct.pack("!L", self.status))
-        packed.append(struct.pack("!L", self.vport_no))
-        length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_BBHLLLLL, buf, offset, self.version, self.type, 0, self.xid, self.experimenter, self.subtype, self.status, self.vport_no)
+        length = offset - start
+        _struct_H.pack_into(buf, start + 2, length)
+        return offset
+
+    def wire_length(self):
+        return 24
 
     @staticmethod
     def unpack(reader):
         obj = bsn_virtual_port_create_reply()
-        _version = reader.read("!B")[0]
+        _version, _type, _length = reader.read_struct(_struct_BBH)
         assert(_version == 4)
-        _type = reader.read("!B")[0]
         assert(_type == 4)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        _experimenter = reader.read("!L")[0]
+        obj.xid, _experimenter, _subtype, obj.status, obj.vport_no = reader.read_struct(_struct_LLLLL)
         assert(_experimenter == 6035143)
-        _subtype = reader.read("!L")[0]
         assert(_subtype == 16)
-        obj.status = reader.read("!L")[0]
-        obj.vport_no = reader.read("!L")[0]
         return obj
 
     def __eq__(self, other):
@@ -8401,6 +7582,7 @@ class bsn_virtual_port_create_reply(bsn_header):
 bsn_header.subtypes[16] = bsn_virtual_port_create_reply
 
 class bsn_virtual_port_create_request(bsn_header):
+    __slots__ = ["vport"]
     version = 4
     type = 4
     experimenter = 6035143
@@ -8417,33 +7599,27 @@ class bsn_virtual_port_create_request(bsn_header):
             self.vport = ofp.bsn_vport()
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!L", self.experimenter))
-        packed.append(struct.pack("!L", self.subtype))
-        packed.append(self.vport.pack())
-        length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_BBHLLL, buf, offset, self.version, self.type, 0, self.xid, self.experimenter, self.subtype)
+        offset = self.vport.pack_into(buf, offset)
+        length = offset - start
+        _struct_H.pack_into(buf, start + 2, length)
+        return offset
+
+    def wire_length(self):
+        return 16 + self.vport.wire_length()
 
     @staticmethod
     def unpack(reader):
         obj = bsn_virtual_port_create_request()
-        _version = reader.read("!B")[0]
+        _version, _type, _length = reader.read_struct(_struct_BBH)
         assert(_version == 4)
-        _type = reader.read("!B")[0]
         assert(_type == 4)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        _experimenter = reader.read("!L")[0]
+        obj.xid, _experimenter, _subtype = reader.read_struct(_struct_LLL)
         assert(_experimenter == 6035143)
-        _subtype = reader.read("!L")[0]
         assert(_subtype == 15)
         obj.vport = ofp.bsn_vport.unpack(reader)
         return obj
@@ -8473,6 +7649,7 @@ class bsn_virtual_port_create_request(bsn_header):
 bsn_header.subtypes[15] = bsn_virtual_port_create_request
 
 class bsn_virtual_port_remove_reply(bsn_header):
+    __slots__ = ["status"]
     version = 4
     type = 4
     experimenter = 6035143
@@ -8489,35 +7666,27 @@ class bsn_virtual_port_remove_reply(bsn_header):
             self.status = 0
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!L", self.experimenter))
-        packed.append(struct.pack("!L", self.subtype))
-        packed.append(struct.pack("!L", self.status))
-        length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_BBHLLLL, buf, offset, self.version, self.type, 0, self.xid, self.experimenter, self.subtype, self.status)
+        length = offset - start
+        _struct_H.pack_into(buf, start + 2, length)
+        return offset
+
+    def wire_length(self):
+        return 20
 
     @staticmethod
     def unpack(reader):
         obj = bsn_virtual_port_remove_reply()
-        _version = reader.read("!B")[0]
+        _version, _type, _length = reader.read_struct(_struct_BBH)
         assert(_version == 4)
-        _type = reader.read("!B")[0]
         assert(_type == 4)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        _experimenter = reader.read("!L")[0]
+        obj.xid, _experimenter, _subtype, obj.status = reader.read_struct(_struct_LLLL)
         assert(_experimenter == 6035143)
-        _subtype = reader.read("!L")[0]
         assert(_subtype == 26)
-        obj.status = reader.read("!L")[0]
         return obj
 
     def __eq__(self, other):
@@ -8545,6 +7714,7 @@ class bsn_virtual_port_remove_reply(bsn_header):
 bsn_header.subtypes[26] = bsn_virtual_port_remove_reply
 
 class bsn_virtual_port_remove_request(bsn_header):
+    __slots__ = ["vport_no"]
     version = 4
     type = 4
     experimenter = 6035143
@@ -8561,35 +7731,27 @@ class bsn_virtual_port_remove_request(bsn_header):
             self.vport_no = 0
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!L", self.experimenter))
-        packed.append(struct.pack("!L", self.subtype))
-        packed.append(struct.pack("!L", self.vport_no))
-        length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_BBHLLLL, buf, offset, self.version, self.type, 0, self.xid, self.experimenter, self.subtype, self.vport_no)
+        length = offset - start
+        _struct_H.pack_into(buf, start + 2, length)
+        return offset
+
+    def wire_length(self):
+        return 20
 
     @staticmethod
     def unpack(reader):
         obj = bsn_virtual_port_remove_request()
-        _version = reader.read("!B")[0]
+        _version, _type, _length = reader.read_struct(_struct_BBH)
         assert(_version == 4)
-        _type = reader.read("!B")[0]
         assert(_type == 4)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        _experimenter = reader.read("!L")[0]
+        obj.xid, _experimenter, _subtype, obj.vport_no = reader.read_struct(_struct_LLLL)
         assert(_experimenter == 6035143)
-        _subtype = reader.read("!L")[0]
         assert(_subtype == 17)
-        obj.vport_no = reader.read("!L")[0]
         return obj
 
     def __eq__(self, other):
@@ -8617,6 +7779,7 @@ class bsn_virtual_port_remove_request(bsn_header):
 bsn_header.subtypes[17] = bsn_virtual_port_remove_request
 
 class bsn_vlan_counter_stats_reply(bsn_stats_reply):
+    __slots__ = ["entries"]
     version = 4
     type = 19
     stats_type = 65535
@@ -8638,40 +7801,28 @@ class bsn_vlan_counter_stats_reply(bsn_stats_reply):
             self.entries = []
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!H", self.stats_type))
-        packed.append(struct.pack("!H", self.flags))
-        packed.append('\x00' * 4)
-        packed.append(struct.pack("!L", self.experimenter))
-        packed.append(struct.pack("!L", self.subtype))
-        packed.append(loxi.generic_util.pack_list(self.entries))
-        length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_BBHLHH4xLL, buf, offset, self.version, self.type, 0, self.xid, self.stats_type, self.flags, self.experimenter, self.subtype)
+        offset = loxi.generic_util.pack_list_into(self.entries, buf, offset)
+        length = offset - start
+        _struct_H.pack_into(buf, start + 2, length)
+        return offset
+
+    def wire_length(self):
+        return 24 + loxi.generic_util.list_wire_length(self.entries)
 
     @staticmethod
     def unpack(reader):
         obj = bsn_vlan_counter_stats_reply()
-        _version = reader.read("!B")[0]
+        _version, _type, _length = reader.read_struct(_struct_BBH)
         assert(_version == 4)
-        _type = reader.read("!B")[0]
         assert(_type == 19)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        _stats_type = reader.read("!H")[0]
+        obj.xid, _stats_type, obj.flags, _experimenter, _subtype = reader.read_struct(_struct_LHH4xLL)
         assert(_stats_type == 65535)
-        obj.flags = reader.read("!H")[0]
-        reader.skip(4)
-        _experimenter = reader.read("!L")[0]
         assert(_experimenter == 6035143)
-        _subtype = reader.read("!L")[0]
         assert(_subtype == 9)
         obj.entries = loxi.generic_util.unpack_list(reader, ofp.common.bsn_vlan_counter_stats_entry.unpack)
         return obj
@@ -8705,6 +7856,7 @@ class bsn_vlan_counter_stats_reply(bsn_stats_reply):
 bsn_stats_reply.subtypes[9] = bsn_vlan_counter_stats_reply
 
 class bsn_vlan_counter_stats_request(bsn_stats_request):
+    __slots__ = ["vlan_vid"]
     version = 4
     type = 18
     stats_type = 65535
@@ -8726,42 +7878,28 @@ class bsn_vlan_counter_stats_request(bsn_stats_request):
             self.vlan_vid = 0
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!H", self.stats_type))
-        packed.append(struct.pack("!H", self.flags))
-        packed.append('\x00' * 4)
-        packed.append(struct.pack("!L", self.experimenter))
-        packed.append(struct.pack("!L", self.subtype))
-        packed.append(struct.pack("!H", self.vlan_vid))
-        length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_BBHLHH4xLLH, buf, offset, self.version, self.type, 0, self.xid, self.stats_type, self.flags, self.experimenter, self.subtype, self.vlan_vid)
+        length = offset - start
+        _struct_H.pack_into(buf, start + 2, length)
+        return offset
+
+    def wire_length(self):
+        return 26
 
     @staticmethod
     def unpack(reader):
         obj = bsn_vlan_counter_stats_request()
-        _version = reader.read("!B")[0]
+        _version, _type, _length = reader.read_struct(_struct_BBH)
         assert(_version == 4)
-        _type = reader.read("!B")[0]
         assert(_type == 18)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        _stats_type = reader.read("!H")[0]
+        obj.xid, _stats_type, obj.flags, _experimenter, _subtype, obj.vlan_vid = reader.read_struct(_struct_LHH4xLLH)
         assert(_stats_type == 65535)
-        obj.flags = reader.read("!H")[0]
-        reader.skip(4)
-        _experimenter = reader.read("!L")[0]
         assert(_experimenter == 6035143)
-        _subtype = reader.read("!L")[0]
         assert(_subtype == 9)
-        obj.vlan_vid = reader.read("!H")[0]
         return obj
 
     def __eq__(self, other):
@@ -8793,6 +7931,7 @@ class bsn_vlan_counter_stats_request(bsn_stats_request):
 bsn_stats_request.subtypes[9] = bsn_vlan_counter_stats_request
 
 class bsn_vrf_counter_stats_reply(bsn_stats_reply):
+    __slots__ = ["entries"]
     version = 4
     type = 19
     stats_type = 65535
@@ -8814,40 +7953,28 @@ class bsn_vrf_counter_stats_reply(bsn_stats_reply):
             self.entries = []
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!H", self.stats_type))
-        packed.append(struct.pack("!H", self.flags))
-        packed.append('\x00' * 4)
-        packed.append(struct.pack("!L", self.experimenter))
-        packed.append(struct.pack("!L", self.subtype))
-        packed.append(loxi.generic_util.pack_list(self.entries))
-        length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_BBHLHH4xLL, buf, offset, self.version, self.type, 0, self.xid, self.stats_type, self.flags, self.experimenter, self.subtype)
+        offset = loxi.generic_util.pack_list_into(self.entries, buf, offset)
+        length = offset - start
+        _struct_H.pack_into(buf, start + 2, length)
+        return offset
+
+    def wire_length(self):
+        return 24 + loxi.generic_util.list_wire_length(self.entries)
 
     @staticmethod
     def unpack(reader):
         obj = bsn_vrf_counter_stats_reply()
-        _version = reader.read("!B")[0]
+        _version, _type, _length = reader.read_struct(_struct_BBH)
         assert(_version == 4)
-        _type = reader.read("!B")[0]
         assert(_type == 19)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        _stats_type = reader.read("!H")[0]
+        obj.xid, _stats_type, obj.flags, _experimenter, _subtype = reader.read_struct(_struct_LHH4xLL)
         assert(_stats_type == 65535)
-        obj.flags = reader.read("!H")[0]
-        reader.skip(4)
-        _experimenter = reader.read("!L")[0]
         assert(_experimenter == 6035143)
-        _subtype = reader.read("!L")[0]
         assert(_subtype == 15)
         obj.entries = loxi.generic_util.unpack_list(reader, ofp.common.bsn_vrf_counter_stats_entry.unpack)
         return obj
@@ -8881,6 +8008,7 @@ class bsn_vrf_counter_stats_reply(bsn_stats_reply):
 bsn_stats_reply.subtypes[15] = bsn_vrf_counter_stats_reply
 
 class bsn_vrf_counter_stats_request(bsn_stats_request):
+    __slots__ = ["vrf"]
     version = 4
     type = 18
     stats_type = 65535
@@ -8902,42 +8030,28 @@ class bsn_vrf_counter_stats_request(bsn_stats_request):
             self.vrf = 0
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!H", self.stats_type))
-        packed.append(struct.pack("!H", self.flags))
-        packed.append('\x00' * 4)
-        packed.append(struct.pack("!L", self.experimenter))
-        packed.append(struct.pack("!L", self.subtype))
-        packed.append(struct.pack("!L", self.vrf))
-        length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_BBHLHH4xLLL, buf, offset, self.version, self.type, 0, self.xid, self.stats_type, self.flags, self.experimenter, self.subtype, self.vrf)
+        length = offset - start
+        _struct_H.pack_into(buf, start + 2, length)
+        return offset
+
+    def wire_length(self):
+        return 28
 
     @staticmethod
     def unpack(reader):
         obj = bsn_vrf_counter_stats_request()
-        _version = reader.read("!B")[0]
+        _version, _type, _length = reader.read_struct(_struct_BBH)
         assert(_version == 4)
-        _type = reader.read("!B")[0]
         assert(_type == 18)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        _stats_type = reader.read("!H")[0]
+        obj.xid, _stats_type, obj.flags, _experimenter, _subtype, obj.vrf = reader.read_struct(_struct_LHH4xLLL)
         assert(_stats_type == 65535)
-        obj.flags = reader.read("!H")[0]
-        reader.skip(4)
-        _experimenter = reader.read("!L")[0]
         assert(_experimenter == 6035143)
-        _subtype = reader.read("!L")[0]
         assert(_subtype == 15)
-        obj.vrf = reader.read("!L")[0]
         return obj
 
     def __eq__(self, other):
@@ -8969,6 +8083,7 @@ class bsn_vrf_counter_stats_request(bsn_stats_request):
 bsn_stats_request.subtypes[15] = bsn_vrf_counter_stats_request
 
 class desc_stats_reply(stats_reply):
+    __slots__ = ["dp_desc", "hw_desc", "mfr_desc", "serial_num", "sw_desc"]
     version = 4
     type = 19
     stats_type = 0
@@ -9004,44 +8119,31 @@ class desc_stats_reply(stats_reply):
             self.dp_desc = ""
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!H", self.stats_type))
-        packed.append(struct.pack("!H", self.flags))
-        packed.append('\x00' * 4)
-        packed.append(struct.pack("!256s", self.mfr_desc))
-        packed.append(struct.pack("!256s", self.hw_desc))
-        packed.append(struct.pack("!256s", self.sw_desc))
-        packed.append(struct.pack("!32s", self.serial_num))
-        packed.append(struct.pack("!256s", self.dp_desc))
-        length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_BBHLHH4x256s256s256s32s256s, buf, offset, self.version, self.type, 0, self.xid, self.stats_type, self.flags, self.mfr_desc, self.hw_desc, self.sw_desc, self.serial_num, self.dp_desc)
+        length = offset - start
+        _struct_H.pack_into(buf, start + 2, length)
+        return offset
+
+    def wire_length(self):
+        return 1072
 
     @staticmethod
     def unpack(reader):
         obj = desc_stats_reply()
-        _version = reader.read("!B")[0]
+        _version, _type, _length = reader.read_struct(_struct_BBH)
         assert(_version == 4)
-        _type = reader.read("!B")[0]
         assert(_type == 19)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        _stats_type = reader.read("!H")[0]
+        obj.xid, _stats_type, obj.flags, obj.mfr_desc, obj.hw_desc, obj.sw_desc, obj.serial_num, obj.dp_desc = reader.read_struct(_struct_LHH4x256s256s256s32s256s)
         assert(_stats_type == 0)
-        obj.flags = reader.read("!H")[0]
-        reader.skip(4)
-        obj.mfr_desc = reader.read("!256s")[0].rstrip("\x00")
-        obj.hw_desc = reader.read("!256s")[0].rstrip("\x00")
-        obj.sw_desc = reader.read("!256s")[0].rstrip("\x00")
-        obj.serial_num = reader.read("!32s")[0].rstrip("\x00")
-        obj.dp_desc = reader.read("!256s")[0].rstrip("\x00")
+        obj.mfr_desc = obj.mfr_desc.rstrip("\x00")
+        obj.hw_desc = obj.hw_desc.rstrip("\x00")
+        obj.sw_desc = obj.sw_desc.rstrip("\x00")
+        obj.serial_num = obj.serial_num.rstrip("\x00")
+        obj.dp_desc = obj.dp_desc.rstrip("\x00")
         return obj
 
     def __eq__(self, other):
@@ -9089,6 +8191,7 @@ class desc_stats_reply(stats_reply):
 stats_reply.subtypes[0] = desc_stats_reply
 
 class desc_stats_request(stats_request):
+    __slots__ = []
     version = 4
     type = 18
     stats_type = 0
@@ -9104,34 +8207,26 @@ class desc_stats_request(stats_request):
             self.flags = 0
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!H", self.stats_type))
-        packed.append(struct.pack("!H", self.flags))
-        packed.append('\x00' * 4)
-        length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_BBHLHH4x, buf, offset, self.version, self.type, 0, self.xid, self.stats_type, self.flags)
+        length = offset - start
+        _struct_H.pack_into(buf, start + 2, length)
+        return offset
+
+    def wire_length(self):
+        return 16
 
     @staticmethod
     def unpack(reader):
         obj = desc_stats_request()
-        _version = reader.read("!B")[0]
+        _version, _type, _length = reader.read_struct(_struct_BBH)
         assert(_version == 4)
-        _type = reader.read("!B")[0]
         assert(_type == 18)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        _stats_type = reader.read("!H")[0]
+        obj.xid, _stats_type, obj.flags = reader.read_struct(_struct_LHH4x)
         assert(_stats_type == 0)
-        obj.flags = reader.read("!H")[0]
-        reader.skip(4)
         return obj
 
     def __eq__(self, other):
@@ -9159,6 +8254,7 @@ class desc_stats_request(stats_request):
 stats_request.subtypes[0] = desc_stats_request
 
 class echo_reply(message):
+    __slots__ = ["data"]
     version = 4
     type = 3
 
@@ -9173,29 +8269,27 @@ class echo_reply(message):
             self.data = ''
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(self.data)
-        length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_BBHL, buf, offset, self.version, self.type, 0, self.xid)
+        offset = loxi.generic_util.pack_bytes_into(self.data, buf, offset)
+        length = offset - start
+        _struct_H.pack_into(buf, start + 2, length)
+        return offset
+
+    def wire_length(self):
+        return 8 + len(self.data)
 
     @staticmethod
     def unpack(reader):
         obj = echo_reply()
-        _version = reader.read("!B")[0]
+        _version, _type, _length = reader.read_struct(_struct_BBH)
         assert(_version == 4)
-        _type = reader.read("!B")[0]
         assert(_type == 3)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
         obj.xid = reader.read("!L")[0]
-        obj.data = str(reader.read_all())
+        obj.data = reader.read_all()
         return obj
 
     def __eq__(self, other):
@@ -9223,6 +8317,7 @@ class echo_reply(message):
 message.subtypes[3] = echo_reply
 
 class echo_request(message):
+    __slots__ = ["data"]
     version = 4
     type = 2
 
@@ -9237,29 +8332,27 @@ class echo_request(message):
             self.data = ''
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(self.data)
-        length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_BBHL, buf, offset, self.version, self.type, 0, self.xid)
+        offset = loxi.generic_util.pack_bytes_into(self.data, buf, offset)
+        length = offset - start
+        _struct_H.pack_into(buf, start + 2, length)
+        return offset
+
+    def wire_length(self):
+        return 8 + len(self.data)
 
     @staticmethod
     def unpack(reader):
         obj = echo_request()
-        _version = reader.read("!B")[0]
+        _version, _type, _length = reader.read_struct(_struct_BBH)
         assert(_version == 4)
-        _type = reader.read("!B")[0]
         assert(_type == 2)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
         obj.xid = reader.read("!L")[0]
-        obj.data = str(reader.read_all())
+        obj.data = reader.read_all()
         return obj
 
     def __eq__(self, other):
@@ -9287,6 +8380,7 @@ class echo_request(message):
 message.subtypes[2] = echo_request
 
 class experimenter_error_msg(error_msg):
+    __slots__ = ["data", "experimenter", "subtype"]
     version = 4
     type = 4
     err_type = 65535
@@ -9310,36 +8404,28 @@ class experimenter_error_msg(error_msg):
             self.data = ''
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!H", self.err_type))
-        packed.append(struct.pack("!H", self.subtype))
-        packed.append(struct.pack("!L", self.experimenter))
-        packed.append(self.data)
-        length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_BBHLHHL, buf, offset, self.version, self.type, 0, self.xid, self.err_type, self.subtype, self.experimenter)
+        offset = loxi.generic_util.pack_bytes_into(self.data, buf, offset)
+        length = offset - start
+        _struct_H.pack_into(buf, start + 2, length)
+        return offset
+
+    def wire_length(self):
+        return 16 + len(self.data)
 
     @staticmethod
     def unpack(reader):
         obj = experimenter_error_msg()
-        _version = reader.read("!B")[0]
+        _version, _type, _length = reader.read_struct(_struct_BBH)
         assert(_version == 4)
-        _type = reader.read("!B")[0]
         assert(_type == 1)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        _err_type = reader.read("!H")[0]
+        obj.xid, _err_type, obj.subtype, obj.experimenter = reader.read_struct(_struct_LHHL)
         assert(_err_type == 65535)
-        obj.subtype = reader.read("!H")[0]
-        obj.experimenter = reader.read("!L")[0]
-        obj.data = str(reader.read_all())
+        obj.data = reader.read_all()
         return obj
 
     def __eq__(self, other):
@@ -9375,6 +8461,7 @@ class experimenter_error_msg(error_msg):
 error_msg.subtypes[65535] = experimenter_error_msg
 
 class features_reply(message):
+    __slots__ = ["auxiliary_id", "capabilities", "datapath_id", "n_buffers", "n_tables", "reserved"]
     version = 4
     type = 6
 
@@ -9409,41 +8496,25 @@ class features_reply(message):
             self.reserved = 0
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!Q", self.datapath_id))
-        packed.append(struct.pack("!L", self.n_buffers))
-        packed.append(struct.pack("!B", self.n_tables))
-        packed.append(struct.pack("!B", self.auxiliary_id))
-        packed.append('\x00' * 2)
-        packed.append(struct.pack("!L", self.capabilities))
-        packed.append(struct.pack("!L", self.reserved))
-        length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_BBHLQLBB2xLL, buf, offset, self.version, self.type, 0, self.xid, self.datapath_id, self.n_buffers, self.n_tables, self.auxiliary_id, self.capabilities, self.reserved)
+        length = offset - start
+        _struct_H.pack_into(buf, start + 2, length)
+        return offset
+
+    def wire_length(self):
+        return 32
 
     @staticmethod
     def unpack(reader):
         obj = features_reply()
-        _version = reader.read("!B")[0]
+        _version, _type, _length = reader.read_struct(_struct_BBH)
         assert(_version == 4)
-        _type = reader.read("!B")[0]
         assert(_type == 6)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        obj.datapath_id = reader.read("!Q")[0]
-        obj.n_buffers = reader.read("!L")[0]
-        obj.n_tables = reader.read("!B")[0]
-        obj.auxiliary_id = reader.read("!B")[0]
-        reader.skip(2)
-        obj.capabilities = reader.read("!L")[0]
-        obj.reserved = reader.read("!L")[0]
+        obj.xid, obj.datapath_id, obj.n_buffers, obj.n_tables, obj.auxiliary_id, obj.capabilities, obj.reserved = reader.read_struct(_struct_LQLBB2xLL)
         return obj
 
     def __eq__(self, other):
@@ -9491,6 +8562,7 @@ class features_reply(message):
 message.subtypes[6] = features_reply
 
 class features_request(message):
+    __slots__ = []
     version = 4
     type = 5
 
@@ -9501,24 +8573,22 @@ class features_request(message):
             self.xid = None
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_BBHL, buf, offset, self.version, self.type, 0, self.xid)
+        length = offset - start
+        _struct_H.pack_into(buf, start + 2, length)
+        return offset
+
+    def wire_length(self):
+        return 8
 
     @staticmethod
     def unpack(reader):
         obj = features_request()
-        _version = reader.read("!B")[0]
+        _version, _type, _length = reader.read_struct(_struct_BBH)
         assert(_version == 4)
-        _type = reader.read("!B")[0]
         assert(_type == 5)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
         obj.xid = reader.read("!L")[0]
@@ -9545,6 +8615,7 @@ class features_request(message):
 message.subtypes[5] = features_request
 
 class flow_mod(message):
+    __slots__ = ["_command", "buffer_id", "cookie", "cookie_mask", "flags", "hard_timeout", "idle_timeout", "instructions", "match", "out_group", "out_port", "priority", "table_id"]
     subtypes = {}
 
     version = 4
@@ -9609,29 +8680,17 @@ class flow_mod(message):
             self.instructions = []
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!Q", self.cookie))
-        packed.append(struct.pack("!Q", self.cookie_mask))
-        packed.append(struct.pack("!B", self.table_id))
-        packed.append(util.pack_fm_cmd(self._command))
-        packed.append(struct.pack("!H", self.idle_timeout))
-        packed.append(struct.pack("!H", self.hard_timeout))
-        packed.append(struct.pack("!H", self.priority))
-        packed.append(struct.pack("!L", self.buffer_id))
-        packed.append(util.pack_port_no(self.out_port))
-        packed.append(struct.pack("!L", self.out_group))
-        packed.append(struct.pack("!H", self.flags))
-        packed.append('\x00' * 2)
-        packed.append(self.match.pack())
-        packed.append(loxi.generic_util.pack_list(self.instructions))
-        length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_BBHLQQBBHHHLLLH2x, buf, offset, self.version, self.type, 0, self.xid, self.cookie, self.cookie_mask, self.table_id, self._command, self.idle_timeout, self.hard_timeout, self.priority, self.buffer_id, self.out_port, self.out_group, self.flags)
+        offset = self.match.pack_into(buf, offset)
+        offset = loxi.generic_util.pack_list_into(self.instructions, buf, offset)
+        length = offset - start
+        _struct_H.pack_into(buf, start + 2, length)
+        return offset
+
+    def wire_length(self):
+        return 48 + self.match.wire_length() + loxi.generic_util.list_wire_length(self.instructions)
 
     @staticmethod
     def unpack(reader):
@@ -9641,26 +8700,12 @@ class flow_mod(message):
             return subclass.unpack(reader)
 
         obj = flow_mod()
-        _version = reader.read("!B")[0]
+        _version, _type, _length = reader.read_struct(_struct_BBH)
         assert(_version == 4)
-        _type = reader.read("!B")[0]
         assert(_type == 14)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        obj.cookie = reader.read("!Q")[0]
-        obj.cookie_mask = reader.read("!Q")[0]
-        obj.table_id = reader.read("!B")[0]
-        obj._command = util.unpack_fm_cmd(reader)
-        obj.idle_timeout = reader.read("!H")[0]
-        obj.hard_timeout = reader.read("!H")[0]
-        obj.priority = reader.read("!H")[0]
-        obj.buffer_id = reader.read("!L")[0]
-        obj.out_port = util.unpack_port_no(reader)
-        obj.out_group = reader.read("!L")[0]
-        obj.flags = reader.read("!H")[0]
-        reader.skip(2)
+        obj.xid, obj.cookie, obj.cookie_mask, obj.table_id, obj._command, obj.idle_timeout, obj.hard_timeout, obj.priority, obj.buffer_id, obj.out_port, obj.out_group, obj.flags = reader.read_struct(_struct_LQQBBHHHLLLH2x)
         obj.match = ofp.match.unpack(reader)
         obj.instructions = loxi.generic_util.unpack_list(reader, ofp.instruction.instruction.unpack)
         return obj
@@ -9735,6 +8780,7 @@ class flow_mod(message):
 message.subtypes[14] = flow_mod
 
 class flow_add(flow_mod):
+    __slots__ = ["length", "type"]
     version = 4
     #type = 14
     #_command = 0
@@ -9803,57 +8849,31 @@ class flow_add(flow_mod):
 	self.length = length
 	return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!Q", self.cookie))
-        packed.append(struct.pack("!Q", self.cookie_mask))
-        packed.append(struct.pack("!B", self.table_id))
-        packed.append(util.pack_fm_cmd(self._command))
-        packed.append(struct.pack("!H", self.idle_timeout))
-        packed.append(struct.pack("!H", self.hard_timeout))
-        packed.append(struct.pack("!H", self.priority))
-        packed.append(struct.pack("!L", self.buffer_id))
-        packed.append(util.pack_port_no(self.out_port))
-        packed.append(struct.pack("!L", self.out_group))
-        packed.append(struct.pack("!H", self.flags))
-        packed.append('\x00' * 2)
-        packed.append(self.match.pack())
-        packed.append(loxi.generic_util.pack_list(self.instructions))
-	if self.length != None:
-	    packed[2] = struct.pack("!H", self.length)
-	else:
-            total_length = sum([len(x) for x in packed])
-            packed[2] = struct.pack("!H", total_length)
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_BBHLQQBBHHHLLLH2x, buf, offset, self.version, self.type, 0, self.xid, self.cookie, self.cookie_mask, self.table_id, self._command, self.idle_timeout, self.hard_timeout, self.priority, self.buffer_id, self.out_port, self.out_group, self.flags)
+        offset = self.match.pack_into(buf, offset)
+        offset = loxi.generic_util.pack_list_into(self.instructions, buf, offset)
+        if self.length != None:
+            _struct_H.pack_into(buf, start + 2, self.length)
+        else:
+            total_length = offset - start
+            _struct_H.pack_into(buf, start + 2, total_length)
+        return offset
+
+    def wire_length(self):
+        return 48 + self.match.wire_length() + loxi.generic_util.list_wire_length(self.instructions)
 
     @staticmethod
     def unpack(reader):
         obj = flow_add()
-        _version = reader.read("!B")[0]
+        _version, _type, _length = reader.read_struct(_struct_BBH)
         assert(_version == 4)
-        _type = reader.read("!B")[0]
         assert(_type == 14)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        obj.cookie = reader.read("!Q")[0]
-        obj.cookie_mask = reader.read("!Q")[0]
-        obj.table_id = reader.read("!B")[0]
-        __command = util.unpack_fm_cmd(reader)
+        obj.xid, obj.cookie, obj.cookie_mask, obj.table_id, __command, obj.idle_timeout, obj.hard_timeout, obj.priority, obj.buffer_id, obj.out_port, obj.out_group, obj.flags = reader.read_struct(_struct_LQQBBHHHLLLH2x)
         assert(__command == 0)
-        obj.idle_timeout = reader.read("!H")[0]
-        obj.hard_timeout = reader.read("!H")[0]
-        obj.priority = reader.read("!H")[0]
-        obj.buffer_id = reader.read("!L")[0]
-        obj.out_port = util.unpack_port_no(reader)
-        obj.out_group = reader.read("!L")[0]
-        obj.flags = reader.read("!H")[0]
-        reader.skip(2)
         obj.match = ofp.match.unpack(reader)
         obj.instructions = loxi.generic_util.unpack_list(reader, ofp.instruction.instruction.unpack)
         return obj
@@ -9927,6 +8947,7 @@ class flow_add(flow_mod):
 flow_mod.subtypes[0] = flow_add
 
 class flow_delete(flow_mod):
+    __slots__ = []
     version = 4
     type = 14
     _command = 3
@@ -9986,54 +9007,28 @@ class flow_delete(flow_mod):
             self.instructions = []
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!Q", self.cookie))
-        packed.append(struct.pack("!Q", self.cookie_mask))
-        packed.append(struct.pack("!B", self.table_id))
-        packed.append(util.pack_fm_cmd(self._command))
-        packed.append(struct.pack("!H", self.idle_timeout))
-        packed.append(struct.pack("!H", self.hard_timeout))
-        packed.append(struct.pack("!H", self.priority))
-        packed.append(struct.pack("!L", self.buffer_id))
-        packed.append(util.pack_port_no(self.out_port))
-        packed.append(struct.pack("!L", self.out_group))
-        packed.append(struct.pack("!H", self.flags))
-        packed.append('\x00' * 2)
-        packed.append(self.match.pack())
-        packed.append(loxi.generic_util.pack_list(self.instructions))
-        length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_BBHLQQBBHHHLLLH2x, buf, offset, self.version, self.type, 0, self.xid, self.cookie, self.cookie_mask, self.table_id, self._command, self.idle_timeout, self.hard_timeout, self.priority, self.buffer_id, self.out_port, self.out_group, self.flags)
+        offset = self.match.pack_into(buf, offset)
+        offset = loxi.generic_util.pack_list_into(self.instructions, buf, offset)
+        length = offset - start
+        _struct_H.pack_into(buf, start + 2, length)
+        return offset
+
+    def wire_length(self):
+        return 48 + self.match.wire_length() + loxi.generic_util.list_wire_length(self.instructions)
 
     @staticmethod
     def unpack(reader):
         obj = flow_delete()
-        _version = reader.read("!B")[0]
+        _version, _type, _length = reader.read_struct(_struct_BBH)
         assert(_version == 4)
-        _type = reader.read("!B")[0]
         assert(_type == 14)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        obj.cookie = reader.read("!Q")[0]
-        obj.cookie_mask = reader.read("!Q")[0]
-        obj.table_id = reader.read("!B")[0]
-        __command = util.unpack_fm_cmd(reader)
+        obj.xid, obj.cookie, obj.cookie_mask, obj.table_id, __command, obj.idle_timeout, obj.hard_timeout, obj.priority, obj.buffer_id, obj.out_port, obj.out_group, obj.flags = reader.read_struct(_struct_LQQBBHHHLLLH2x)
         assert(__command == 3)
-        obj.idle_timeout = reader.read("!H")[0]
-        obj.hard_timeout = reader.read("!H")[0]
-        obj.priority = reader.read("!H")[0]
-        obj.buffer_id = reader.read("!L")[0]
-        obj.out_port = util.unpack_port_no(reader)
-        obj.out_group = reader.read("!L")[0]
-        obj.flags = reader.read("!H")[0]
-        reader.skip(2)
         obj.match = ofp.match.unpack(reader)
         obj.instructions = loxi.generic_util.unpack_list(reader, ofp.instruction.instruction.unpack)
         return obj
@@ -10107,6 +9102,7 @@ class flow_delete(flow_mod):
 flow_mod.subtypes[3] = flow_delete
 
 class flow_delete_strict(flow_mod):
+    __slots__ = []
     version = 4
     type = 14
     _command = 4
@@ -10166,54 +9162,28 @@ class flow_delete_strict(flow_mod):
             self.instructions = []
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!Q", self.cookie))
-        packed.append(struct.pack("!Q", self.cookie_mask))
-        packed.append(struct.pack("!B", self.table_id))
-        packed.append(util.pack_fm_cmd(self._command))
-        packed.append(struct.pack("!H", self.idle_timeout))
-        packed.append(struct.pack("!H", self.hard_timeout))
-        packed.append(struct.pack("!H", self.priority))
-        packed.append(struct.pack("!L", self.buffer_id))
-        packed.append(util.pack_port_no(self.out_port))
-        packed.append(struct.pack("!L", self.out_group))
-        packed.append(struct.pack("!H", self.flags))
-        packed.append('\x00' * 2)
-        packed.append(self.match.pack())
-        packed.append(loxi.generic_util.pack_list(self.instructions))
-        length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_BBHLQQBBHHHLLLH2x, buf, offset, self.version, self.type, 0, self.xid, self.cookie, self.cookie_mask, self.table_id, self._command, self.idle_timeout, self.hard_timeout, self.priority, self.buffer_id, self.out_port, self.out_group, self.flags)
+        offset = self.match.pack_into(buf, offset)
+        offset = loxi.generic_util.pack_list_into(self.instructions, buf, offset)
+        length = offset - start
+        _struct_H.pack_into(buf, start + 2, length)
+        return offset
+
+    def wire_length(self):
+        return 48 + self.match.wire_length() + loxi.generic_util.list_wire_length(self.instructions)
 
     @staticmethod
     def unpack(reader):
         obj = flow_delete_strict()
-        _version = reader.read("!B")[0]
+        _version, _type, _length = reader.read_struct(_struct_BBH)
         assert(_version == 4)
-        _type = reader.read("!B")[0]
         assert(_type == 14)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        obj.cookie = reader.read("!Q")[0]
-        obj.cookie_mask = reader.read("!Q")[0]
-        obj.table_id = reader.read("!B")[0]
-        __command = util.unpack_fm_cmd(reader)
+        obj.xid, obj.cookie, obj.cookie_mask, obj.table_id, __command, obj.idle_timeout, obj.hard_timeout, obj.priority, obj.buffer_id, obj.out_port, obj.out_group, obj.flags = reader.read_struct(_struct_LQQBBHHHLLLH2x)
         assert(__command == 4)
-        obj.idle_timeout = reader.read("!H")[0]
-        obj.hard_timeout = reader.read("!H")[0]
-        obj.priority = reader.read("!H")[0]
-        obj.buffer_id = reader.read("!L")[0]
-        obj.out_port = util.unpack_port_no(reader)
-        obj.out_group = reader.read("!L")[0]
-        obj.flags = reader.read("!H")[0]
-        reader.skip(2)
         obj.match = ofp.match.unpack(reader)
         obj.instructions = loxi.generic_util.unpack_list(reader, ofp.instruction.instruction.unpack)
         return obj
@@ -10287,6 +9257,7 @@ class flow_delete_strict(flow_mod):
 flow_mod.subtypes[4] = flow_delete_strict
 
 class flow_mod_failed_error_msg(error_msg):
+    __slots__ = ["code", "data"]
     version = 4
     type = 1
     err_type = 5
@@ -10306,34 +9277,28 @@ class flow_mod_failed_error_msg(error_msg):
             self.data = ''
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!H", self.err_type))
-        packed.append(struct.pack("!H", self.code))
-        packed.append(self.data)
-        length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_BBHLHH, buf, offset, self.version, self.type, 0, self.xid, self.err_type, self.code)
+        offset = loxi.generic_util.pack_bytes_into(self.data, buf, offset)
+        length = offset - start
+        _struct_H.pack_into(buf, start + 2, length)
+        return offset
+
+    def wire_length(self):
+        return 12 + len(self.data)
 
     @staticmethod
     def unpack(reader):
         obj = flow_mod_failed_error_msg()
-        _version = reader.read("!B")[0]
+        _version, _type, _length = reader.read_struct(_struct_BBH)
         assert(_version == 4)
-        _type = reader.read("!B")[0]
         assert(_type == 1)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        _err_type = reader.read("!H")[0]
+        obj.xid, _err_type, obj.code = reader.read_struct(_struct_LHH)
         assert(_err_type == 5)
-        obj.code = reader.read("!H")[0]
-        obj.data = str(reader.read_all())
+        obj.data = reader.read_all()
         return obj
 
     def __eq__(self, other):
@@ -10365,6 +9330,7 @@ class flow_mod_failed_error_msg(error_msg):
 error_msg.subtypes[5] = flow_mod_failed_error_msg
 
 class flow_modify(flow_mod):
+    __slots__ = []
     version = 4
     type = 14
     _command = 1
@@ -10424,54 +9390,28 @@ class flow_modify(flow_mod):
             self.instructions = []
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!Q", self.cookie))
-        packed.append(struct.pack("!Q", self.cookie_mask))
-        packed.append(struct.pack("!B", self.table_id))
-        packed.append(util.pack_fm_cmd(self._command))
-        packed.append(struct.pack("!H", self.idle_timeout))
-        packed.append(struct.pack("!H", self.hard_timeout))
-        packed.append(struct.pack("!H", self.priority))
-        packed.append(struct.pack("!L", self.buffer_id))
-        packed.append(util.pack_port_no(self.out_port))
-        packed.append(struct.pack("!L", self.out_group))
-        packed.append(struct.pack("!H", self.flags))
-        packed.append('\x00' * 2)
-        packed.append(self.match.pack())
-        packed.append(loxi.generic_util.pack_list(self.instructions))
-        length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_BBHLQQBBHHHLLLH2x, buf, offset, self.version, self.type, 0, self.xid, self.cookie, self.cookie_mask, self.table_id, self._command, self.idle_timeout, self.hard_timeout, self.priority, self.buffer_id, self.out_port, self.out_group, self.flags)
+        offset = self.match.pack_into(buf, offset)
+        offset = loxi.generic_util.pack_list_into(self.instructions, buf, offset)
+        length = offset - start
+        _struct_H.pack_into(buf, start + 2, length)
+        return offset
+
+    def wire_length(self):
+        return 48 + self.match.wire_length() + loxi.generic_util.list_wire_length(self.instructions)
 
     @staticmethod
     def unpack(reader):
         obj = flow_modify()
-        _version = reader.read("!B")[0]
+        _version, _type, _length = reader.read_struct(_struct_BBH)
         assert(_version == 4)
-        _type = reader.read("!B")[0]
         assert(_type == 14)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        obj.cookie = reader.read("!Q")[0]
-        obj.cookie_mask = reader.read("!Q")[0]
-        obj.table_id = reader.read("!B")[0]
-        __command = util.unpack_fm_cmd(reader)
+        obj.xid, obj.cookie, obj.cookie_mask, obj.table_id, __command, obj.idle_timeout, obj.hard_timeout, obj.priority, obj.buffer_id, obj.out_port, obj.out_group, obj.flags = reader.read_struct(_struct_LQQBBHHHLLLH2x)
         assert(__command == 1)
-        obj.idle_timeout = reader.read("!H")[0]
-        obj.hard_timeout = reader.read("!H")[0]
-        obj.priority = reader.read("!H")[0]
-        obj.buffer_id = reader.read("!L")[0]
-        obj.out_port = util.unpack_port_no(reader)
-        obj.out_group = reader.read("!L")[0]
-        obj.flags = reader.read("!H")[0]
-        reader.skip(2)
         obj.match = ofp.match.unpack(reader)
         obj.instructions = loxi.generic_util.unpack_list(reader, ofp.instruction.instruction.unpack)
         return obj
@@ -10545,6 +9485,7 @@ class flow_modify(flow_mod):
 flow_mod.subtypes[1] = flow_modify
 
 class flow_modify_strict(flow_mod):
+    __slots__ = []
     version = 4
     type = 14
     _command = 2
@@ -10604,54 +9545,28 @@ class flow_modify_strict(flow_mod):
             self.instructions = []
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!Q", self.cookie))
-        packed.append(struct.pack("!Q", self.cookie_mask))
-        packed.append(struct.pack("!B", self.table_id))
-        packed.append(util.pack_fm_cmd(self._command))
-        packed.append(struct.pack("!H", self.idle_timeout))
-        packed.append(struct.pack("!H", self.hard_timeout))
-        packed.append(struct.pack("!H", self.priority))
-        packed.append(struct.pack("!L", self.buffer_id))
-        packed.append(util.pack_port_no(self.out_port))
-        packed.append(struct.pack("!L", self.out_group))
-        packed.append(struct.pack("!H", self.flags))
-        packed.append('\x00' * 2)
-        packed.append(self.match.pack())
-        packed.append(loxi.generic_util.pack_list(self.instructions))
-        length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_BBHLQQBBHHHLLLH2x, buf, offset, self.version, self.type, 0, self.xid, self.cookie, self.cookie_mask, self.table_id, self._command, self.idle_timeout, self.hard_timeout, self.priority, self.buffer_id, self.out_port, self.out_group, self.flags)
+        offset = self.match.pack_into(buf, offset)
+        offset = loxi.generic_util.pack_list_into(self.instructions, buf, offset)
+        length = offset - start
+        _struct_H.pack_into(buf, start + 2, length)
+        return offset
+
+    def wire_length(self):
+        return 48 + self.match.wire_length() + loxi.generic_util.list_wire_length(self.instructions)
 
     @staticmethod
     def unpack(reader):
         obj = flow_modify_strict()
-        _version = reader.read("!B")[0]
+        _version, _type, _length = reader.read_struct(_struct_BBH)
         assert(_version == 4)
-        _type = reader.read("!B")[0]
         assert(_type == 14)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        obj.cookie = reader.read("!Q")[0]
-        obj.cookie_mask = reader.read("!Q")[0]
-        obj.table_id = reader.read("!B")[0]
-        __command = util.unpack_fm_cmd(reader)
+        obj.xid, obj.cookie, obj.cookie_mask, obj.table_id, __command, obj.idle_timeout, obj.hard_timeout, obj.priority, obj.buffer_id, obj.out_port, obj.out_group, obj.flags = reader.read_struct(_struct_LQQBBHHHLLLH2x)
         assert(__command == 2)
-        obj.idle_timeout = reader.read("!H")[0]
-        obj.hard_timeout = reader.read("!H")[0]
-        obj.priority = reader.read("!H")[0]
-        obj.buffer_id = reader.read("!L")[0]
-        obj.out_port = util.unpack_port_no(reader)
-        obj.out_group = reader.read("!L")[0]
-        obj.flags = reader.read("!H")[0]
-        reader.skip(2)
         obj.match = ofp.match.unpack(reader)
         obj.instructions = loxi.generic_util.unpack_list(reader, ofp.instruction.instruction.unpack)
         return obj
@@ -10725,6 +9640,7 @@ class flow_modify_strict(flow_mod):
 flow_mod.subtypes[2] = flow_modify_strict
 
 class flow_removed(message):
+    __slots__ = ["byte_count", "cookie", "duration_nsec", "duration_sec", "hard_timeout", "idle_timeout", "match", "packet_count", "priority", "reason", "table_id"]
     version = 4
     type = 11
 
@@ -10779,48 +9695,26 @@ class flow_removed(message):
             self.match = ofp.match()
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!Q", self.cookie))
-        packed.append(struct.pack("!H", self.priority))
-        packed.append(struct.pack("!B", self.reason))
-        packed.append(struct.pack("!B", self.table_id))
-        packed.append(struct.pack("!L", self.duration_sec))
-        packed.append(struct.pack("!L", self.duration_nsec))
-        packed.append(struct.pack("!H", self.idle_timeout))
-        packed.append(struct.pack("!H", self.hard_timeout))
-        packed.append(struct.pack("!Q", self.packet_count))
-        packed.append(struct.pack("!Q", self.byte_count))
-        packed.append(self.match.pack())
-        length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_BBHLQHBBLLHHQQ, buf, offset, self.version, self.type, 0, self.xid, self.cookie, self.priority, self.reason, self.table_id, self.duration_sec, self.duration_nsec, self.idle_timeout, self.hard_timeout, self.packet_count, self.byte_count)
+        offset = self.match.pack_into(buf, offset)
+        length = offset - start
+        _struct_H.pack_into(buf, start + 2, length)
+        return offset
+
+    def wire_length(self):
+        return 48 + self.match.wire_length()
 
     @staticmethod
     def unpack(reader):
         obj = flow_removed()
-        _version = reader.read("!B")[0]
+        _version, _type, _length = reader.read_struct(_struct_BBH)
         assert(_version == 4)
-        _type = reader.read("!B")[0]
         assert(_type == 11)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        obj.cookie = reader.read("!Q")[0]
-        obj.priority = reader.read("!H")[0]
-        obj.reason = reader.read("!B")[0]
-        obj.table_id = reader.read("!B")[0]
-        obj.duration_sec = reader.read("!L")[0]
-        obj.duration_nsec = reader.read("!L")[0]
-        obj.idle_timeout = reader.read("!H")[0]
-        obj.hard_timeout = reader.read("!H")[0]
-        obj.packet_count = reader.read("!Q")[0]
-        obj.byte_count = reader.read("!Q")[0]
+        obj.xid, obj.cookie, obj.priority, obj.reason, obj.table_id, obj.duration_sec, obj.duration_nsec, obj.idle_timeout, obj.hard_timeout, obj.packet_count, obj.byte_count = reader.read_struct(_struct_LQHBBLLHHQQ)
         obj.match = ofp.match.unpack(reader)
         return obj
 
@@ -10889,6 +9783,7 @@ class flow_removed(message):
 message.subtypes[11] = flow_removed
 
 class flow_stats_reply(stats_reply):
+    __slots__ = ["entries"]
     version = 4
     type = 19
     stats_type = 1
@@ -10908,35 +9803,27 @@ class flow_stats_reply(stats_reply):
             self.entries = []
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!H", self.stats_type))
-        packed.append(struct.pack("!H", self.flags))
-        packed.append('\x00' * 4)
-        packed.append(loxi.generic_util.pack_list(self.entries))
-        length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_BBHLHH4x, buf, offset, self.version, self.type, 0, self.xid, self.stats_type, self.flags)
+        offset = loxi.generic_util.pack_list_into(self.entries, buf, offset)
+        length = offset - start
+        _struct_H.pack_into(buf, start + 2, length)
+        return offset
+
+    def wire_length(self):
+        return 16 + loxi.generic_util.list_wire_length(self.entries)
 
     @staticmethod
     def unpack(reader):
         obj = flow_stats_reply()
-        _version = reader.read("!B")[0]
+        _version, _type, _length = reader.read_struct(_struct_BBH)
         assert(_version == 4)
-        _type = reader.read("!B")[0]
         assert(_type == 19)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        _stats_type = reader.read("!H")[0]
+        obj.xid, _stats_type, obj.flags = reader.read_struct(_struct_LHH4x)
         assert(_stats_type == 1)
-        obj.flags = reader.read("!H")[0]
-        reader.skip(4)
         obj.entries = loxi.generic_util.unpack_list(reader, ofp.common.flow_stats_entry.unpack)
         return obj
 
@@ -10969,6 +9856,7 @@ class flow_stats_reply(stats_reply):
 stats_reply.subtypes[1] = flow_stats_reply
 
 class flow_stats_request(stats_request):
+    __slots__ = ["cookie", "cookie_mask", "match", "out_group", "out_port", "table_id"]
     version = 4
     type = 18
     stats_type = 1
@@ -11008,49 +9896,27 @@ class flow_stats_request(stats_request):
             self.match = ofp.match()
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!H", self.stats_type))
-        packed.append(struct.pack("!H", self.flags))
-        packed.append('\x00' * 4)
-        packed.append(struct.pack("!B", self.table_id))
-        packed.append('\x00' * 3)
-        packed.append(util.pack_port_no(self.out_port))
-        packed.append(struct.pack("!L", self.out_group))
-        packed.append('\x00' * 4)
-        packed.append(struct.pack("!Q", self.cookie))
-        packed.append(struct.pack("!Q", self.cookie_mask))
-        packed.append(self.match.pack())
-        length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_BBHLHH4xB3xLL4xQQ, buf, offset, self.version, self.type, 0, self.xid, self.stats_type, self.flags, self.table_id, self.out_port, self.out_group, self.cookie, self.cookie_mask)
+        offset = self.match.pack_into(buf, offset)
+        length = offset - start
+        _struct_H.pack_into(buf, start + 2, length)
+        return offset
+
+    def wire_length(self):
+        return 48 + self.match.wire_length()
 
     @staticmethod
     def unpack(reader):
         obj = flow_stats_request()
-        _version = reader.read("!B")[0]
+        _version, _type, _length = reader.read_struct(_struct_BBH)
         assert(_version == 4)
-        _type = reader.read("!B")[0]
         assert(_type == 18)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        _stats_type = reader.read("!H")[0]
+        obj.xid, _stats_type, obj.flags, obj.table_id, obj.out_port, obj.out_group, obj.cookie, obj.cookie_mask = reader.read_struct(_struct_LHH4xB3xLL4xQQ)
         assert(_stats_type == 1)
-        obj.flags = reader.read("!H")[0]
-        reader.skip(4)
-        obj.table_id = reader.read("!B")[0]
-        reader.skip(3)
-        obj.out_port = util.unpack_port_no(reader)
-        obj.out_group = reader.read("!L")[0]
-        reader.skip(4)
-        obj.cookie = reader.read("!Q")[0]
-        obj.cookie_mask = reader.read("!Q")[0]
         obj.match = ofp.match.unpack(reader)
         return obj
 
@@ -11103,6 +9969,7 @@ class flow_stats_request(stats_request):
 stats_request.subtypes[1] = flow_stats_request
 
 class get_config_reply(message):
+    __slots__ = ["flags", "miss_send_len"]
     version = 4
     type = 8
 
@@ -11121,31 +9988,25 @@ class get_config_reply(message):
             self.miss_send_len = 0
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!H", self.flags))
-        packed.append(struct.pack("!H", self.miss_send_len))
-        length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_BBHLHH, buf, offset, self.version, self.type, 0, self.xid, self.flags, self.miss_send_len)
+        length = offset - start
+        _struct_H.pack_into(buf, start + 2, length)
+        return offset
+
+    def wire_length(self):
+        return 12
 
     @staticmethod
     def unpack(reader):
         obj = get_config_reply()
-        _version = reader.read("!B")[0]
+        _version, _type, _length = reader.read_struct(_struct_BBH)
         assert(_version == 4)
-        _type = reader.read("!B")[0]
         assert(_type == 8)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        obj.flags = reader.read("!H")[0]
-        obj.miss_send_len = reader.read("!H")[0]
+        obj.xid, obj.flags, obj.miss_send_len = reader.read_struct(_struct_LHH)
         return obj
 
     def __eq__(self, other):
@@ -11177,6 +10038,7 @@ class get_config_reply(message):
 message.subtypes[8] = get_config_reply
 
 class get_config_request(message):
+    __slots__ = []
     version = 4
     type = 7
 
@@ -11187,24 +10049,22 @@ class get_config_request(message):
             self.xid = None
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_BBHL, buf, offset, self.version, self.type, 0, self.xid)
+        length = offset - start
+        _struct_H.pack_into(buf, start + 2, length)
+        return offset
+
+    def wire_length(self):
+        return 8
 
     @staticmethod
     def unpack(reader):
         obj = get_config_request()
-        _version = reader.read("!B")[0]
+        _version, _type, _length = reader.read_struct(_struct_BBH)
         assert(_version == 4)
-        _type = reader.read("!B")[0]
         assert(_type == 7)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
         obj.xid = reader.read("!L")[0]
@@ -11231,6 +10091,7 @@ class get_config_request(message):
 message.subtypes[7] = get_config_request
 
 class group_mod(message):
+    __slots__ = ["buckets", "command", "group_id", "group_type"]
     subtypes = {}
 
     version = 4
@@ -11259,20 +10120,16 @@ class group_mod(message):
             self.buckets = []
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!H", self.command))
-        packed.append(struct.pack("!B", self.group_type))
-        packed.append('\x00' * 1)
-        packed.append(struct.pack("!L", self.group_id))
-        packed.append(loxi.generic_util.pack_list(self.buckets))
-        length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_BBHLHBxL, buf, offset, self.version, self.type, 0, self.xid, self.command, self.group_type, self.group_id)
+        offset = loxi.generic_util.pack_list_into(self.buckets, buf, offset)
+        length = offset - start
+        _struct_H.pack_into(buf, start + 2, length)
+        return offset
+
+    def wire_length(self):
+        return 16 + loxi.generic_util.list_wire_length(self.buckets)
 
     @staticmethod
     def unpack(reader):
@@ -11282,18 +10139,12 @@ class group_mod(message):
             return subclass.unpack(reader)
 
         obj = group_mod()
-        _version = reader.read("!B")[0]
+        _version, _type, _length = reader.read_struct(_struct_BBH)
         assert(_version == 4)
-        _type = reader.read("!B")[0]
         assert(_type == 15)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        obj.command = reader.read("!H")[0]
-        obj.group_type = reader.read("!B")[0]
-        reader.skip(1)
-        obj.group_id = reader.read("!L")[0]
+        obj.xid, obj.command, obj.group_type, obj.group_id = reader.read_struct(_struct_LHBxL)
         obj.buckets = loxi.generic_util.unpack_list(reader, ofp.common.bucket.unpack)
         return obj
 
@@ -11331,6 +10182,7 @@ class group_mod(message):
 message.subtypes[15] = group_mod
 
 class group_add(group_mod):
+    __slots__ = []
     version = 4
     type = 15
     command = 0
@@ -11354,37 +10206,27 @@ class group_add(group_mod):
             self.buckets = []
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!H", self.command))
-        packed.append(struct.pack("!B", self.group_type))
-        packed.append('\x00' * 1)
-        packed.append(struct.pack("!L", self.group_id))
-        packed.append(loxi.generic_util.pack_list(self.buckets))
-        length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_BBHLHBxL, buf, offset, self.version, self.type, 0, self.xid, self.command, self.group_type, self.group_id)
+        offset = loxi.generic_util.pack_list_into(self.buckets, buf, offset)
+        length = offset - start
+        _struct_H.pack_into(buf, start + 2, length)
+        return offset
+
+    def wire_length(self):
+        return 16 + loxi.generic_util.list_wire_length(self.buckets)
 
     @staticmethod
     def unpack(reader):
         obj = group_add()
-        _version = reader.read("!B")[0]
+        _version, _type, _length = reader.read_struct(_struct_BBH)
         assert(_version == 4)
-        _type = reader.read("!B")[0]
         assert(_type == 15)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        _command = reader.read("!H")[0]
+        obj.xid, _command, obj.group_type, obj.group_id = reader.read_struct(_struct_LHBxL)
         assert(_command == 0)
-        obj.group_type = reader.read("!B")[0]
-        reader.skip(1)
-        obj.group_id = reader.read("!L")[0]
         obj.buckets = loxi.generic_util.unpack_list(reader, ofp.common.bucket.unpack)
         return obj
 
@@ -11421,6 +10263,7 @@ class group_add(group_mod):
 group_mod.subtypes[0] = group_add
 
 class group_delete(group_mod):
+    __slots__ = []
     version = 4
     type = 15
     command = 2
@@ -11444,37 +10287,27 @@ class group_delete(group_mod):
             self.buckets = []
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!H", self.command))
-        packed.append(struct.pack("!B", self.group_type))
-        packed.append('\x00' * 1)
-        packed.append(struct.pack("!L", self.group_id))
-        packed.append(loxi.generic_util.pack_list(self.buckets))
-        length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_BBHLHBxL, buf, offset, self.version, self.type, 0, self.xid, self.command, self.group_type, self.group_id)
+        offset = loxi.generic_util.pack_list_into(self.buckets, buf, offset)
+        length = offset - start
+        _struct_H.pack_into(buf, start + 2, length)
+        return offset
+
+    def wire_length(self):
+        return 16 + loxi.generic_util.list_wire_length(self.buckets)
 
     @staticmethod
     def unpack(reader):
         obj = group_delete()
-        _version = reader.read("!B")[0]
+        _version, _type, _length = reader.read_struct(_struct_BBH)
         assert(_version == 4)
-        _type = reader.read("!B")[0]
         assert(_type == 15)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        _command = reader.read("!H")[0]
+        obj.xid, _command, obj.group_type, obj.group_id = reader.read_struct(_struct_LHBxL)
         assert(_command == 2)
-        obj.group_type = reader.read("!B")[0]
-        reader.skip(1)
-        obj.group_id = reader.read("!L")[0]
         obj.buckets = loxi.generic_util.unpack_list(reader, ofp.common.bucket.unpack)
         return obj
 
@@ -11511,6 +10344,7 @@ class group_delete(group_mod):
 group_mod.subtypes[2] = group_delete
 
 class group_desc_stats_reply(stats_reply):
+    __slots__ = ["entries"]
     version = 4
     type = 19
     stats_type = 7
@@ -11530,35 +10364,27 @@ class group_desc_stats_reply(stats_reply):
             self.entries = []
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!H", self.stats_type))
-        packed.append(struct.pack("!H", self.flags))
-        packed.append('\x00' * 4)
-        packed.append(loxi.generic_util.pack_list(self.entries))
-        length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_BBHLHH4x, buf, offset, self.version, self.type, 0, self.xid, self.stats_type, self.flags)
+        offset = loxi.generic_util.pack_list_into(self.entries, buf, offset)
+        length = offset - start
+        _struct_H.pack_into(buf, start + 2, length)
+        return offset
+
+    def wire_length(self):
+        return 16 + loxi.generic_util.list_wire_length(self.entries)
 
     @staticmethod
     def unpack(reader):
         obj = group_desc_stats_reply()
-        _version = reader.read("!B")[0]
+        _version, _type, _length = reader.read_struct(_struct_BBH)
         assert(_version == 4)
-        _type = reader.read("!B")[0]
         assert(_type == 19)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        _stats_type = reader.read("!H")[0]
+        obj.xid, _stats_type, obj.flags = reader.read_struct(_struct_LHH4x)
         assert(_stats_type == 7)
-        obj.flags = reader.read("!H")[0]
-        reader.skip(4)
         obj.entries = loxi.generic_util.unpack_list(reader, ofp.common.group_desc_stats_entry.unpack)
         return obj
 
@@ -11591,6 +10417,7 @@ class group_desc_stats_reply(stats_reply):
 stats_reply.subtypes[7] = group_desc_stats_reply
 
 class group_desc_stats_request(stats_request):
+    __slots__ = []
     version = 4
     type = 18
     stats_type = 7
@@ -11606,34 +10433,26 @@ class group_desc_stats_request(stats_request):
             self.flags = 0
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!H", self.stats_type))
-        packed.append(struct.pack("!H", self.flags))
-        packed.append('\x00' * 4)
-        length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_BBHLHH4x, buf, offset, self.version, self.type, 0, self.xid, self.stats_type, self.flags)
+        length = offset - start
+        _struct_H.pack_into(buf, start + 2, length)
+        return offset
+
+    def wire_length(self):
+        return 16
 
     @staticmethod
     def unpack(reader):
         obj = group_desc_stats_request()
-        _version = reader.read("!B")[0]
+        _version, _type, _length = reader.read_struct(_struct_BBH)
         assert(_version == 4)
-        _type = reader.read("!B")[0]
         assert(_type == 18)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        _stats_type = reader.read("!H")[0]
+        obj.xid, _stats_type, obj.flags = reader.read_struct(_struct_LHH4x)
         assert(_stats_type == 7)
-        obj.flags = reader.read("!H")[0]
-        reader.skip(4)
         return obj
 
     def __eq__(self, other):
@@ -11661,6 +10480,7 @@ class group_desc_stats_request(stats_request):
 stats_request.subtypes[7] = group_desc_stats_request
 
 class group_features_stats_reply(stats_reply):
+    __slots__ = ["actions_all", "actions_ff", "actions_indirect", "actions_select", "capabilities", "max_groups_all", "max_groups_ff", "max_groups_indirect", "max_groups_select", "types"]
     version = 4
     type = 19
     stats_type = 8
@@ -11716,54 +10536,26 @@ class group_features_stats_reply(stats_reply):
             self.actions_ff = 0
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!H", self.stats_type))
-        packed.append(struct.pack("!H", self.flags))
-        packed.append('\x00' * 4)
-        packed.append(struct.pack("!L", self.types))
-        packed.append(struct.pack("!L", self.capabilities))
-        packed.append(struct.pack("!L", self.max_groups_all))
-        packed.append(struct.pack("!L", self.max_groups_select))
-        packed.append(struct.pack("!L", self.max_groups_indirect))
-        packed.append(struct.pack("!L", self.max_groups_ff))
-        packed.append(struct.pack("!L", self.actions_all))
-        packed.append(struct.pack("!L", self.actions_select))
-        packed.append(struct.pack("!L", self.actions_indirect))
-        packed.append(struct.pack("!L", self.actions_ff))
-        length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_BBHLHH4xLLLLLLLLLL, buf, offset, self.version, self.type, 0, self.xid, self.stats_type, self.flags, self.types, self.capabilities, self.max_groups_all, self.max_groups_select, self.max_groups_indirect, self.max_groups_ff, self.actions_all, self.actions_select, self.actions_indirect, self.actions_ff)
+        length = offset - start
+        _struct_H.pack_into(buf, start + 2, length)
+        return offset
+
+    def wire_length(self):
+        return 56
 
     @staticmethod
     def unpack(reader):
         obj = group_features_stats_reply()
-        _version = reader.read("!B")[0]
+        _version, _type, _length = reader.read_struct(_struct_BBH)
         assert(_version == 4)
-        _type = reader.read("!B")[0]
         assert(_type == 19)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        _stats_type = reader.read("!H")[0]
+        obj.xid, _stats_type, obj.flags, obj.types, obj.capabilities, obj.max_groups_all, obj.max_groups_select, obj.max_groups_indirect, obj.max_groups_ff, obj.actions_all, obj.actions_select, obj.actions_indirect, obj.actions_ff = reader.read_struct(_struct_LHH4xLLLLLLLLLL)
         assert(_stats_type == 8)
-        obj.flags = reader.read("!H")[0]
-        reader.skip(4)
-        obj.types = reader.read("!L")[0]
-        obj.capabilities = reader.read("!L")[0]
-        obj.max_groups_all = reader.read("!L")[0]
-        obj.max_groups_select = reader.read("!L")[0]
-        obj.max_groups_indirect = reader.read("!L")[0]
-        obj.max_groups_ff = reader.read("!L")[0]
-        obj.actions_all = reader.read("!L")[0]
-        obj.actions_select = reader.read("!L")[0]
-        obj.actions_indirect = reader.read("!L")[0]
-        obj.actions_ff = reader.read("!L")[0]
         return obj
 
     def __eq__(self, other):
@@ -11831,6 +10623,7 @@ class group_features_stats_reply(stats_reply):
 stats_reply.subtypes[8] = group_features_stats_reply
 
 class group_features_stats_request(stats_request):
+    __slots__ = []
     version = 4
     type = 18
     stats_type = 8
@@ -11846,34 +10639,26 @@ class group_features_stats_request(stats_request):
             self.flags = 0
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!H", self.stats_type))
-        packed.append(struct.pack("!H", self.flags))
-        packed.append('\x00' * 4)
-        length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_BBHLHH4x, buf, offset, self.version, self.type, 0, self.xid, self.stats_type, self.flags)
+        length = offset - start
+        _struct_H.pack_into(buf, start + 2, length)
+        return offset
+
+    def wire_length(self):
+        return 16
 
     @staticmethod
     def unpack(reader):
         obj = group_features_stats_request()
-        _version = reader.read("!B")[0]
+        _version, _type, _length = reader.read_struct(_struct_BBH)
         assert(_version == 4)
-        _type = reader.read("!B")[0]
         assert(_type == 18)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        _stats_type = reader.read("!H")[0]
+        obj.xid, _stats_type, obj.flags = reader.read_struct(_struct_LHH4x)
         assert(_stats_type == 8)
-        obj.flags = reader.read("!H")[0]
-        reader.skip(4)
         return obj
 
     def __eq__(self, other):
@@ -11901,6 +10686,7 @@ class group_features_stats_request(stats_request):
 stats_request.subtypes[8] = group_features_stats_request
 
 class group_mod_failed_error_msg(error_msg):
+    __slots__ = ["code", "data"]
     version = 4
     type = 1
     err_type = 6
@@ -11920,34 +10706,28 @@ class group_mod_failed_error_msg(error_msg):
             self.data = ''
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!H", self.err_type))
-        packed.append(struct.pack("!H", self.code))
-        packed.append(self.data)
-        length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_BBHLHH, buf, offset, self.version, self.type, 0, self.xid, self.err_type, self.code)
+        offset = loxi.generic_util.pack_bytes_into(self.data, buf, offset)
+        length = offset - start
+        _struct_H.pack_into(buf, start + 2, length)
+        return offset
+
+    def wire_length(self):
+        return 12 + len(self.data)
 
     @staticmethod
     def unpack(reader):
         obj = group_mod_failed_error_msg()
-        _version = reader.read("!B")[0]
+        _version, _type, _length = reader.read_struct(_struct_BBH)
         assert(_version == 4)
-        _type = reader.read("!B")[0]
         assert(_type == 1)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        _err_type = reader.read("!H")[0]
+        obj.xid, _err_type, obj.code = reader.read_struct(_struct_LHH)
         assert(_err_type == 6)
-        obj.code = reader.read("!H")[0]
-        obj.data = str(reader.read_all())
+        obj.data = reader.read_all()
         return obj
 
     def __eq__(self, other):
@@ -11979,6 +10759,7 @@ class group_mod_failed_error_msg(error_msg):
 error_msg.subtypes[6] = group_mod_failed_error_msg
 
 class group_modify(group_mod):
+    __slots__ = []
     version = 4
     type = 15
     command = 1
@@ -12002,37 +10783,27 @@ class group_modify(group_mod):
             self.buckets = []
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!H", self.command))
-        packed.append(struct.pack("!B", self.group_type))
-        packed.append('\x00' * 1)
-        packed.append(struct.pack("!L", self.group_id))
-        packed.append(loxi.generic_util.pack_list(self.buckets))
-        length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_BBHLHBxL, buf, offset, self.version, self.type, 0, self.xid, self.command, self.group_type, self.group_id)
+        offset = loxi.generic_util.pack_list_into(self.buckets, buf, offset)
+        length = offset - start
+        _struct_H.pack_into(buf, start + 2, length)
+        return offset
+
+    def wire_length(self):
+        return 16 + loxi.generic_util.list_wire_length(self.buckets)
 
     @staticmethod
     def unpack(reader):
         obj = group_modify()
-        _version = reader.read("!B")[0]
+        _version, _type, _length = reader.read_struct(_struct_BBH)
         assert(_version == 4)
-        _type = reader.read("!B")[0]
         assert(_type == 15)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        _command = reader.read("!H")[0]
+        obj.xid, _command, obj.group_type, obj.group_id = reader.read_struct(_struct_LHBxL)
         assert(_command == 1)
-        obj.group_type = reader.read("!B")[0]
-        reader.skip(1)
-        obj.group_id = reader.read("!L")[0]
         obj.buckets = loxi.generic_util.unpack_list(reader, ofp.common.bucket.unpack)
         return obj
 
@@ -12069,6 +10840,7 @@ class group_modify(group_mod):
 group_mod.subtypes[1] = group_modify
 
 class group_stats_reply(stats_reply):
+    __slots__ = ["entries"]
     version = 4
     type = 19
     stats_type = 6
@@ -12088,35 +10860,27 @@ class group_stats_reply(stats_reply):
             self.entries = []
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!H", self.stats_type))
-        packed.append(struct.pack("!H", self.flags))
-        packed.append('\x00' * 4)
-        packed.append(loxi.generic_util.pack_list(self.entries))
-        length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_BBHLHH4x, buf, offset, self.version, self.type, 0, self.xid, self.stats_type, self.flags)
+        offset = loxi.generic_util.pack_list_into(self.entries, buf, offset)
+        length = offset - start
+        _struct_H.pack_into(buf, start + 2, length)
+        return offset
+
+    def wire_length(self):
+        return 16 + loxi.generic_util.list_wire_length(self.entries)
 
     @staticmethod
     def unpack(reader):
         obj = group_stats_reply()
-        _version = reader.read("!B")[0]
+        _version, _type, _length = reader.read_struct(_struct_BBH)
         assert(_version == 4)
-        _type = reader.read("!B")[0]
         assert(_type == 19)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        _stats_type = reader.read("!H")[0]
+        obj.xid, _stats_type, obj.flags = reader.read_struct(_struct_LHH4x)
         assert(_stats_type == 6)
-        obj.flags = reader.read("!H")[0]
-        reader.skip(4)
         obj.entries = loxi.generic_util.unpack_list(reader, ofp.common.group_stats_entry.unpack)
         return obj
 
@@ -12149,6 +10913,7 @@ class group_stats_reply(stats_reply):
 stats_reply.subtypes[6] = group_stats_reply
 
 class group_stats_request(stats_request):
+    __slots__ = ["group_id"]
     version = 4
     type = 18
     stats_type = 6
@@ -12168,38 +10933,26 @@ class group_stats_request(stats_request):
             self.group_id = 0
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!H", self.stats_type))
-        packed.append(struct.pack("!H", self.flags))
-        packed.append('\x00' * 4)
-        packed.append(struct.pack("!L", self.group_id))
-        packed.append('\x00' * 4)
-        length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_BBHLHH4xL4x, buf, offset, self.version, self.type, 0, self.xid, self.stats_type, self.flags, self.group_id)
+        length = offset - start
+        _struct_H.pack_into(buf, start + 2, length)
+        return offset
+
+    def wire_length(self):
+        return 24
 
     @staticmethod
     def unpack(reader):
         obj = group_stats_request()
-        _version = reader.read("!B")[0]
+        _version, _type, _length = reader.read_struct(_struct_BBH)
         assert(_version == 4)
-        _type = reader.read("!B")[0]
         assert(_type == 18)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        _stats_type = reader.read("!H")[0]
+        obj.xid, _stats_type, obj.flags, obj.group_id = reader.read_struct(_struct_LHH4xL4x)
         assert(_stats_type == 6)
-        obj.flags = reader.read("!H")[0]
-        reader.skip(4)
-        obj.group_id = reader.read("!L")[0]
-        reader.skip(4)
         return obj
 
     def __eq__(self, other):
@@ -12231,6 +10984,7 @@ class group_stats_request(stats_request):
 stats_request.subtypes[6] = group_stats_request
 
 class hello(message):
+    __slots__ = ["elements"]
     version = 4
     type = 0
 
@@ -12245,25 +10999,23 @@ class hello(message):
             self.elements = []
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(loxi.generic_util.pack_list(self.elements))
-        length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_BBHL, buf, offset, self.version, self.type, 0, self.xid)
+        offset = loxi.generic_util.pack_list_into(self.elements, buf, offset)
+        length = offset - start
+        _struct_H.pack_into(buf, start + 2, length)
+        return offset
+
+    def wire_length(self):
+        return 8 + loxi.generic_util.list_wire_length(self.elements)
 
     @staticmethod
     def unpack(reader):
         obj = hello()
-        _version = reader.read("!B")[0]
+        _version, _type, _length = reader.read_struct(_struct_BBH)
         assert(_version == 4)
-        _type = reader.read("!B")[0]
         assert(_type == 0)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
         obj.xid = reader.read("!L")[0]
@@ -12295,6 +11047,7 @@ class hello(message):
 message.subtypes[0] = hello
 
 class hello_failed_error_msg(error_msg):
+    __slots__ = ["code", "data"]
     version = 4
     type = 1
     err_type = 0
@@ -12314,34 +11067,28 @@ class hello_failed_error_msg(error_msg):
             self.data = ''
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!H", self.err_type))
-        packed.append(struct.pack("!H", self.code))
-        packed.append(self.data)
-        length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_BBHLHH, buf, offset, self.version, self.type, 0, self.xid, self.err_type, self.code)
+        offset = loxi.generic_util.pack_bytes_into(self.data, buf, offset)
+        length = offset - start
+        _struct_H.pack_into(buf, start + 2, length)
+        return offset
+
+    def wire_length(self):
+        return 12 + len(self.data)
 
     @staticmethod
     def unpack(reader):
         obj = hello_failed_error_msg()
-        _version = reader.read("!B")[0]
+        _version, _type, _length = reader.read_struct(_struct_BBH)
         assert(_version == 4)
-        _type = reader.read("!B")[0]
         assert(_type == 1)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        _err_type = reader.read("!H")[0]
+        obj.xid, _err_type, obj.code = reader.read_struct(_struct_LHH)
         assert(_err_type == 0)
-        obj.code = reader.read("!H")[0]
-        obj.data = str(reader.read_all())
+        obj.data = reader.read_all()
         return obj
 
     def __eq__(self, other):
@@ -12373,6 +11120,7 @@ class hello_failed_error_msg(error_msg):
 error_msg.subtypes[0] = hello_failed_error_msg
 
 class meter_config_stats_reply(stats_reply):
+    __slots__ = ["entries"]
     version = 4
     type = 19
     stats_type = 10
@@ -12392,35 +11140,27 @@ class meter_config_stats_reply(stats_reply):
             self.entries = []
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!H", self.stats_type))
-        packed.append(struct.pack("!H", self.flags))
-        packed.append('\x00' * 4)
-        packed.append(loxi.generic_util.pack_list(self.entries))
-        length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_BBHLHH4x, buf, offset, self.version, self.type, 0, self.xid, self.stats_type, self.flags)
+        offset = loxi.generic_util.pack_list_into(self.entries, buf, offset)
+        length = offset - start
+        _struct_H.pack_into(buf, start + 2, length)
+        return offset
+
+    def wire_length(self):
+        return 16 + loxi.generic_util.list_wire_length(self.entries)
 
     @staticmethod
     def unpack(reader):
         obj = meter_config_stats_reply()
-        _version = reader.read("!B")[0]
+        _version, _type, _length = reader.read_struct(_struct_BBH)
         assert(_version == 4)
-        _type = reader.read("!B")[0]
         assert(_type == 19)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        _stats_type = reader.read("!H")[0]
+        obj.xid, _stats_type, obj.flags = reader.read_struct(_struct_LHH4x)
         assert(_stats_type == 10)
-        obj.flags = reader.read("!H")[0]
-        reader.skip(4)
         obj.entries = loxi.generic_util.unpack_list(reader, ofp.meter_band.meter_band.unpack)
         return obj
 
@@ -12453,6 +11193,7 @@ class meter_config_stats_reply(stats_reply):
 stats_reply.subtypes[10] = meter_config_stats_reply
 
 class meter_config_stats_request(stats_request):
+    __slots__ = ["meter_id"]
     version = 4
     type = 18
     stats_type = 10
@@ -12472,38 +11213,26 @@ class meter_config_stats_request(stats_request):
             self.meter_id = 0
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!H", self.stats_type))
-        packed.append(struct.pack("!H", self.flags))
-        packed.append('\x00' * 4)
-        packed.append(struct.pack("!L", self.meter_id))
-        packed.append('\x00' * 4)
-        length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_BBHLHH4xL4x, buf, offset, self.version, self.type, 0, self.xid, self.stats_type, self.flags, self.meter_id)
+        length = offset - start
+        _struct_H.pack_into(buf, start + 2, length)
+        return offset
+
+    def wire_length(self):
+        return 24
 
     @staticmethod
     def unpack(reader):
         obj = meter_config_stats_request()
-        _version = reader.read("!B")[0]
+        _version, _type, _length = reader.read_struct(_struct_BBH)
         assert(_version == 4)
-        _type = reader.read("!B")[0]
         assert(_type == 18)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        _stats_type = reader.read("!H")[0]
+        obj.xid, _stats_type, obj.flags, obj.meter_id = reader.read_struct(_struct_LHH4xL4x)
         assert(_stats_type == 10)
-        obj.flags = reader.read("!H")[0]
-        reader.skip(4)
-        obj.meter_id = reader.read("!L")[0]
-        reader.skip(4)
         return obj
 
     def __eq__(self, other):
@@ -12535,6 +11264,7 @@ class meter_config_stats_request(stats_request):
 stats_request.subtypes[10] = meter_config_stats_request
 
 class meter_features_stats_reply(stats_reply):
+    __slots__ = ["features"]
     version = 4
     type = 19
     stats_type = 11
@@ -12554,35 +11284,27 @@ class meter_features_stats_reply(stats_reply):
             self.features = ofp.meter_features()
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!H", self.stats_type))
-        packed.append(struct.pack("!H", self.flags))
-        packed.append('\x00' * 4)
-        packed.append(self.features.pack())
-        length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_BBHLHH4x, buf, offset, self.version, self.type, 0, self.xid, self.stats_type, self.flags)
+        offset = self.features.pack_into(buf, offset)
+        length = offset - start
+        _struct_H.pack_into(buf, start + 2, length)
+        return offset
+
+    def wire_length(self):
+        return 16 + self.features.wire_length()
 
     @staticmethod
     def unpack(reader):
         obj = meter_features_stats_reply()
-        _version = reader.read("!B")[0]
+        _version, _type, _length = reader.read_struct(_struct_BBH)
         assert(_version == 4)
-        _type = reader.read("!B")[0]
         assert(_type == 19)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        _stats_type = reader.read("!H")[0]
+        obj.xid, _stats_type, obj.flags = reader.read_struct(_struct_LHH4x)
         assert(_stats_type == 11)
-        obj.flags = reader.read("!H")[0]
-        reader.skip(4)
         obj.features = ofp.meter_features.unpack(reader)
         return obj
 
@@ -12615,6 +11337,7 @@ class meter_features_stats_reply(stats_reply):
 stats_reply.subtypes[11] = meter_features_stats_reply
 
 class meter_features_stats_request(stats_request):
+    __slots__ = []
     version = 4
     type = 18
     stats_type = 11
@@ -12630,34 +11353,26 @@ class meter_features_stats_request(stats_request):
             self.flags = 0
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!H", self.stats_type))
-        packed.append(struct.pack("!H", self.flags))
-        packed.append('\x00' * 4)
-        length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_BBHLHH4x, buf, offset, self.version, self.type, 0, self.xid, self.stats_type, self.flags)
+        length = offset - start
+        _struct_H.pack_into(buf, start + 2, length)
+        return offset
+
+    def wire_length(self):
+        return 16
 
     @staticmethod
     def unpack(reader):
         obj = meter_features_stats_request()
-        _version = reader.read("!B")[0]
+        _version, _type, _length = reader.read_struct(_struct_BBH)
         assert(_version == 4)
-        _type = reader.read("!B")[0]
         assert(_type == 18)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        _stats_type = reader.read("!H")[0]
+        obj.xid, _stats_type, obj.flags = reader.read_struct(_struct_LHH4x)
         assert(_stats_type == 11)
-        obj.flags = reader.read("!H")[0]
-        reader.skip(4)
         return obj
 
     def __eq__(self, other):
@@ -12685,6 +11400,7 @@ class meter_features_stats_request(stats_request):
 stats_request.subtypes[11] = meter_features_stats_request
 
 class meter_mod(message):
+    __slots__ = ["command", "flags", "meter_id", "meters"]
     version = 4
     type = 29
 
@@ -12711,34 +11427,26 @@ class meter_mod(message):
             self.meters = []
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!H", self.command))
-        packed.append(struct.pack("!H", self.flags))
-        packed.append(struct.pack("!L", self.meter_id))
-        packed.append(loxi.generic_util.pack_list(self.meters))
-        length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_BBHLHHL, buf, offset, self.version, self.type, 0, self.xid, self.command, self.flags, self.meter_id)
+        offset = loxi.generic_util.pack_list_into(self.meters, buf, offset)
+        length = offset - start
+        _struct_H.pack_into(buf, start + 2, length)
+        return offset
+
+    def wire_length(self):
+        return 16 + loxi.generic_util.list_wire_length(self.meters)
 
     @staticmethod
     def unpack(reader):
         obj = meter_mod()
-        _version = reader.read("!B")[0]
+        _version, _type, _length = reader.read_struct(_struct_BBH)
         assert(_version == 4)
-        _type = reader.read("!B")[0]
         assert(_type == 29)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        obj.command = reader.read("!H")[0]
-        obj.flags = reader.read("!H")[0]
-        obj.meter_id = reader.read("!L")[0]
+        obj.xid, obj.command, obj.flags, obj.meter_id = reader.read_struct(_struct_LHHL)
         obj.meters = loxi.generic_util.unpack_list(reader, ofp.meter_band.meter_band.unpack)
         return obj
 
@@ -12779,6 +11487,7 @@ class meter_mod(message):
 message.subtypes[29] = meter_mod
 
 class meter_mod_failed_error_msg(error_msg):
+    __slots__ = ["code", "data"]
     version = 4
     type = 1
     err_type = 12
@@ -12798,34 +11507,28 @@ class meter_mod_failed_error_msg(error_msg):
             self.data = ''
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!H", self.err_type))
-        packed.append(struct.pack("!H", self.code))
-        packed.append(self.data)
-        length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_BBHLHH, buf, offset, self.version, self.type, 0, self.xid, self.err_type, self.code)
+        offset = loxi.generic_util.pack_bytes_into(self.data, buf, offset)
+        length = offset - start
+        _struct_H.pack_into(buf, start + 2, length)
+        return offset
+
+    def wire_length(self):
+        return 12 + len(self.data)
 
     @staticmethod
     def unpack(reader):
         obj = meter_mod_failed_error_msg()
-        _version = reader.read("!B")[0]
+        _version, _type, _length = reader.read_struct(_struct_BBH)
         assert(_version == 4)
-        _type = reader.read("!B")[0]
         assert(_type == 1)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        _err_type = reader.read("!H")[0]
+        obj.xid, _err_type, obj.code = reader.read_struct(_struct_LHH)
         assert(_err_type == 12)
-        obj.code = reader.read("!H")[0]
-        obj.data = str(reader.read_all())
+        obj.data = reader.read_all()
         return obj
 
     def __eq__(self, other):
@@ -12857,6 +11560,7 @@ class meter_mod_failed_error_msg(error_msg):
 error_msg.subtypes[12] = meter_mod_failed_error_msg
 
 class meter_stats_reply(stats_reply):
+    __slots__ = ["entries"]
     version = 4
     type = 19
     stats_type = 9
@@ -12876,35 +11580,27 @@ class meter_stats_reply(stats_reply):
             self.entries = []
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!H", self.stats_type))
-        packed.append(struct.pack("!H", self.flags))
-        packed.append('\x00' * 4)
-        packed.append(loxi.generic_util.pack_list(self.entries))
-        length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_BBHLHH4x, buf, offset, self.version, self.type, 0, self.xid, self.stats_type, self.flags)
+        offset = loxi.generic_util.pack_list_into(self.entries, buf, offset)
+        length = offset - start
+        _struct_H.pack_into(buf, start + 2, length)
+        return offset
+
+    def wire_length(self):
+        return 16 + loxi.generic_util.list_wire_length(self.entries)
 
     @staticmethod
     def unpack(reader):
         obj = meter_stats_reply()
-        _version = reader.read("!B")[0]
+        _version, _type, _length = reader.read_struct(_struct_BBH)
         assert(_version == 4)
-        _type = reader.read("!B")[0]
         assert(_type == 19)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        _stats_type = reader.read("!H")[0]
+        obj.xid, _stats_type, obj.flags = reader.read_struct(_struct_LHH4x)
         assert(_stats_type == 9)
-        obj.flags = reader.read("!H")[0]
-        reader.skip(4)
         obj.entries = loxi.generic_util.unpack_list(reader, ofp.common.meter_stats.unpack)
         return obj
 
@@ -12937,6 +11633,7 @@ class meter_stats_reply(stats_reply):
 stats_reply.subtypes[9] = meter_stats_reply
 
 class meter_stats_request(stats_request):
+    __slots__ = ["meter_id"]
     version = 4
     type = 18
     stats_type = 9
@@ -12956,38 +11653,26 @@ class meter_stats_request(stats_request):
             self.meter_id = 0
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!H", self.stats_type))
-        packed.append(struct.pack("!H", self.flags))
-        packed.append('\x00' * 4)
-        packed.append(struct.pack("!L", self.meter_id))
-        packed.append('\x00' * 4)
-        length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_BBHLHH4xL4x, buf, offset, self.version, self.type, 0, self.xid, self.stats_type, self.flags, self.meter_id)
+        length = offset - start
+        _struct_H.pack_into(buf, start + 2, length)
+        return offset
+
+    def wire_length(self):
+        return 24
 
     @staticmethod
     def unpack(reader):
         obj = meter_stats_request()
-        _version = reader.read("!B")[0]
+        _version, _type, _length = reader.read_struct(_struct_BBH)
         assert(_version == 4)
-        _type = reader.read("!B")[0]
         assert(_type == 18)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        _stats_type = reader.read("!H")[0]
+        obj.xid, _stats_type, obj.flags, obj.meter_id = reader.read_struct(_struct_LHH4xL4x)
         assert(_stats_type == 9)
-        obj.flags = reader.read("!H")[0]
-        reader.skip(4)
-        obj.meter_id = reader.read("!L")[0]
-        reader.skip(4)
         return obj
 
     def __eq__(self, other):
@@ -13019,6 +11704,7 @@ class meter_stats_request(stats_request):
 stats_request.subtypes[9] = meter_stats_request
 
 class nicira_header(experimenter):
+    __slots__ = []
     subtypes = {}
 
     version = 4
@@ -13036,17 +11722,15 @@ class nicira_header(experimenter):
             self.subtype = 0
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!L", self.experimenter))
-        packed.append(struct.pack("!L", self.subtype))
-        length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_BBHLLL, buf, offset, self.version, self.type, 0, self.xid, self.experimenter, self.subtype)
+        length = offset - start
+        _struct_H.pack_into(buf, start + 2, length)
+        return offset
+
+    def wire_length(self):
+        return 16
 
     @staticmethod
     def unpack(reader):
@@ -13056,17 +11740,13 @@ class nicira_header(experimenter):
             return subclass.unpack(reader)
 
         obj = nicira_header()
-        _version = reader.read("!B")[0]
+        _version, _type, _length = reader.read_struct(_struct_BBH)
         assert(_version == 4)
-        _type = reader.read("!B")[0]
         assert(_type == 4)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        _experimenter = reader.read("!L")[0]
+        obj.xid, _experimenter, obj.subtype = reader.read_struct(_struct_LLL)
         assert(_experimenter == 8992)
-        obj.subtype = reader.read("!L")[0]
         return obj
 
     def __eq__(self, other):
@@ -13091,6 +11771,7 @@ class nicira_header(experimenter):
 experimenter.subtypes[8992] = nicira_header
 
 class packet_in(message):
+    __slots__ = ["buffer_id", "cookie", "data", "match", "reason", "table_id", "total_len"]
     version = 4
     type = 10
 
@@ -13129,43 +11810,31 @@ class packet_in(message):
             self.data = ''
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!L", self.buffer_id))
-        packed.append(struct.pack("!H", self.total_len))
-        packed.append(struct.pack("!B", self.reason))
-        packed.append(struct.pack("!B", self.table_id))
-        packed.append(struct.pack("!Q", self.cookie))
-        packed.append(self.match.pack())
-        packed.append('\x00' * 2)
-        packed.append(self.data)
-        length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_BBHLLHBBQ, buf, offset, self.version, self.type, 0, self.xid, self.buffer_id, self.total_len, self.reason, self.table_id, self.cookie)
+        offset = self.match.pack_into(buf, offset)
+        offset = loxi.generic_util.pack_struct_into(_struct_2x, buf, offset, )
+        offset = loxi.generic_util.pack_bytes_into(self.data, buf, offset)
+        length = offset - start
+        _struct_H.pack_into(buf, start + 2, length)
+        return offset
+
+    def wire_length(self):
+        return 26 + self.match.wire_length() + len(self.data)
 
     @staticmethod
     def unpack(reader):
         obj = packet_in()
-        _version = reader.read("!B")[0]
+        _version, _type, _length = reader.read_struct(_struct_BBH)
         assert(_version == 4)
-        _type = reader.read("!B")[0]
         assert(_type == 10)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        obj.buffer_id = reader.read("!L")[0]
-        obj.total_len = reader.read("!H")[0]
-        obj.reason = reader.read("!B")[0]
-        obj.table_id = reader.read("!B")[0]
-        obj.cookie = reader.read("!Q")[0]
+        obj.xid, obj.buffer_id, obj.total_len, obj.reason, obj.table_id, obj.cookie = reader.read_struct(_struct_LLHBBQ)
         obj.match = ofp.match.unpack(reader)
         reader.skip(2)
-        obj.data = str(reader.read_all())
+        obj.data = reader.read_all()
         return obj
 
     def __eq__(self, other):
@@ -13217,6 +11886,7 @@ class packet_in(message):
 message.subtypes[10] = packet_in
 
 class packet_out(message):
+    __slots__ = ["actions", "buffer_id", "data", "in_port"]
     version = 4
     type = 13
 
@@ -13243,40 +11913,31 @@ class packet_out(message):
             self.data = ''
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!L", self.buffer_id))
-        packed.append(util.pack_port_no(self.in_port))
-        packed.append(struct.pack("!H", 0)) # placeholder for actions_len at index 6
-        packed.append('\x00' * 6)
-        packed.append(loxi.generic_util.pack_list(self.actions))
-        packed[6] = struct.pack("!H", len(packed[-1]))
-        packed.append(self.data)
-        length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_BBHLLLH6x, buf, offset, self.version, self.type, 0, self.xid, self.buffer_id, self.in_port, 0)
+        mark = offset
+        offset = loxi.generic_util.pack_list_into(self.actions, buf, offset)
+        _struct_H.pack_into(buf, start + 16, offset - mark)
+        offset = loxi.generic_util.pack_bytes_into(self.data, buf, offset)
+        length = offset - start
+        _struct_H.pack_into(buf, start + 2, length)
+        return offset
+
+    def wire_length(self):
+        return 24 + loxi.generic_util.list_wire_length(self.actions) + len(self.data)
 
     @staticmethod
     def unpack(reader):
         obj = packet_out()
-        _version = reader.read("!B")[0]
+        _version, _type, _length = reader.read_struct(_struct_BBH)
         assert(_version == 4)
-        _type = reader.read("!B")[0]
         assert(_type == 13)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        obj.buffer_id = reader.read("!L")[0]
-        obj.in_port = util.unpack_port_no(reader)
-        _actions_len = reader.read("!H")[0]
-        reader.skip(6)
+        obj.xid, obj.buffer_id, obj.in_port, _actions_len = reader.read_struct(_struct_LLLH6x)
         obj.actions = loxi.generic_util.unpack_list(reader.slice(_actions_len), ofp.action.action.unpack)
-        obj.data = str(reader.read_all())
+        obj.data = reader.read_all()
         return obj
 
     def __eq__(self, other):
@@ -13316,6 +11977,7 @@ class packet_out(message):
 message.subtypes[13] = packet_out
 
 class port_desc_stats_reply(stats_reply):
+    __slots__ = ["entries"]
     version = 4
     type = 19
     stats_type = 13
@@ -13335,35 +11997,27 @@ class port_desc_stats_reply(stats_reply):
             self.entries = []
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!H", self.stats_type))
-        packed.append(struct.pack("!H", self.flags))
-        packed.append('\x00' * 4)
-        packed.append(loxi.generic_util.pack_list(self.entries))
-        length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_BBHLHH4x, buf, offset, self.version, self.type, 0, self.xid, self.stats_type, self.flags)
+        offset = loxi.generic_util.pack_list_into(self.entries, buf, offset)
+        length = offset - start
+        _struct_H.pack_into(buf, start + 2, length)
+        return offset
+
+    def wire_length(self):
+        return 16 + loxi.generic_util.list_wire_length(self.entries)
 
     @staticmethod
     def unpack(reader):
         obj = port_desc_stats_reply()
-        _version = reader.read("!B")[0]
+        _version, _type, _length = reader.read_struct(_struct_BBH)
         assert(_version == 4)
-        _type = reader.read("!B")[0]
         assert(_type == 19)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        _stats_type = reader.read("!H")[0]
+        obj.xid, _stats_type, obj.flags = reader.read_struct(_struct_LHH4x)
         assert(_stats_type == 13)
-        obj.flags = reader.read("!H")[0]
-        reader.skip(4)
         obj.entries = loxi.generic_util.unpack_list(reader, ofp.common.port_desc.unpack)
         return obj
 
@@ -13396,6 +12050,7 @@ class port_desc_stats_reply(stats_reply):
 stats_reply.subtypes[13] = port_desc_stats_reply
 
 class port_desc_stats_request(stats_request):
+    __slots__ = []
     version = 4
     type = 18
     stats_type = 13
@@ -13411,34 +12066,26 @@ class port_desc_stats_request(stats_request):
             self.flags = 0
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!H", self.stats_type))
-        packed.append(struct.pack("!H", self.flags))
-        packed.append('\x00' * 4)
-        length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_BBHLHH4x, buf, offset, self.version, self.type, 0, self.xid, self.stats_type, self.flags)
+        length = offset - start
+        _struct_H.pack_into(buf, start + 2, length)
+        return offset
+
+    def wire_length(self):
+        return 16
 
     @staticmethod
     def unpack(reader):
         obj = port_desc_stats_request()
-        _version = reader.read("!B")[0]
+        _version, _type, _length = reader.read_struct(_struct_BBH)
         assert(_version == 4)
-        _type = reader.read("!B")[0]
         assert(_type == 18)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        _stats_type = reader.read("!H")[0]
+        obj.xid, _stats_type, obj.flags = reader.read_struct(_struct_LHH4x)
         assert(_stats_type == 13)
-        obj.flags = reader.read("!H")[0]
-        reader.skip(4)
         return obj
 
     def __eq__(self, other):
@@ -13466,6 +12113,7 @@ class port_desc_stats_request(stats_request):
 stats_request.subtypes[13] = port_desc_stats_request
 
 class port_mod(message):
+    __slots__ = ["advertise", "config", "hw_addr", "mask", "port_no"]
     version = 4
     type = 16
 
@@ -13496,43 +12144,30 @@ class port_mod(message):
             self.advertise = 0
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(util.pack_port_no(self.port_no))
-        packed.append('\x00' * 4)
-        packed.append(struct.pack("!6B", *self.hw_addr))
-        packed.append('\x00' * 2)
-        packed.append(struct.pack("!L", self.config))
-        packed.append(struct.pack("!L", self.mask))
-        packed.append(struct.pack("!L", self.advertise))
-        packed.append('\x00' * 4)
-        length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_BBHLL4x, buf, offset, self.version, self.type, 0, self.xid, self.port_no)
+        offset = loxi.generic_util.pack_struct_into(_struct_6B, buf, offset, *self.hw_addr)
+        offset = loxi.generic_util.pack_struct_into(_struct_2xLLL4x, buf, offset, self.config, self.mask, self.advertise)
+        length = offset - start
+        _struct_H.pack_into(buf, start + 2, length)
+        return offset
+
+    def wire_length(self):
+        return 40
 
     @staticmethod
     def unpack(reader):
         obj = port_mod()
-        _version = reader.read("!B")[0]
+        _version, _type, _length = reader.read_struct(_struct_BBH)
         assert(_version == 4)
-        _type = reader.read("!B")[0]
         assert(_type == 16)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        obj.port_no = util.unpack_port_no(reader)
-        reader.skip(4)
+        obj.xid, obj.port_no = reader.read_struct(_struct_LL4x)
         obj.hw_addr = list(reader.read('!6B'))
         reader.skip(2)
-        obj.config = reader.read("!L")[0]
-        obj.mask = reader.read("!L")[0]
-        obj.advertise = reader.read("!L")[0]
-        reader.skip(4)
+        obj.config, obj.mask, obj.advertise = reader.read_struct(_struct_LLL4x)
         return obj
 
     def __eq__(self, other):
@@ -13576,6 +12211,7 @@ class port_mod(message):
 message.subtypes[16] = port_mod
 
 class port_mod_failed_error_msg(error_msg):
+    __slots__ = ["code", "data"]
     version = 4
     type = 1
     err_type = 7
@@ -13595,34 +12231,28 @@ class port_mod_failed_error_msg(error_msg):
             self.data = ''
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!H", self.err_type))
-        packed.append(struct.pack("!H", self.code))
-        packed.append(self.data)
-        length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_BBHLHH, buf, offset, self.version, self.type, 0, self.xid, self.err_type, self.code)
+        offset = loxi.generic_util.pack_bytes_into(self.data, buf, offset)
+        length = offset - start
+        _struct_H.pack_into(buf, start + 2, length)
+        return offset
+
+    def wire_length(self):
+        return 12 + len(self.data)
 
     @staticmethod
     def unpack(reader):
         obj = port_mod_failed_error_msg()
-        _version = reader.read("!B")[0]
+        _version, _type, _length = reader.read_struct(_struct_BBH)
         assert(_version == 4)
-        _type = reader.read("!B")[0]
         assert(_type == 1)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        _err_type = reader.read("!H")[0]
+        obj.xid, _err_type, obj.code = reader.read_struct(_struct_LHH)
         assert(_err_type == 7)
-        obj.code = reader.read("!H")[0]
-        obj.data = str(reader.read_all())
+        obj.data = reader.read_all()
         return obj
 
     def __eq__(self, other):
@@ -13654,6 +12284,7 @@ class port_mod_failed_error_msg(error_msg):
 error_msg.subtypes[7] = port_mod_failed_error_msg
 
 class port_stats_reply(stats_reply):
+    __slots__ = ["entries"]
     version = 4
     type = 19
     stats_type = 4
@@ -13673,35 +12304,27 @@ class port_stats_reply(stats_reply):
             self.entries = []
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!H", self.stats_type))
-        packed.append(struct.pack("!H", self.flags))
-        packed.append('\x00' * 4)
-        packed.append(loxi.generic_util.pack_list(self.entries))
-        length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_BBHLHH4x, buf, offset, self.version, self.type, 0, self.xid, self.stats_type, self.flags)
+        offset = loxi.generic_util.pack_list_into(self.entries, buf, offset)
+        length = offset - start
+        _struct_H.pack_into(buf, start + 2, length)
+        return offset
+
+    def wire_length(self):
+        return 16 + loxi.generic_util.list_wire_length(self.entries)
 
     @staticmethod
     def unpack(reader):
         obj = port_stats_reply()
-        _version = reader.read("!B")[0]
+        _version, _type, _length = reader.read_struct(_struct_BBH)
         assert(_version == 4)
-        _type = reader.read("!B")[0]
         assert(_type == 19)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        _stats_type = reader.read("!H")[0]
+        obj.xid, _stats_type, obj.flags = reader.read_struct(_struct_LHH4x)
         assert(_stats_type == 4)
-        obj.flags = reader.read("!H")[0]
-        reader.skip(4)
         obj.entries = loxi.generic_util.unpack_list(reader, ofp.common.port_stats_entry.unpack)
         return obj
 
@@ -13734,6 +12357,7 @@ class port_stats_reply(stats_reply):
 stats_reply.subtypes[4] = port_stats_reply
 
 class port_stats_request(stats_request):
+    __slots__ = ["port_no"]
     version = 4
     type = 18
     stats_type = 4
@@ -13753,38 +12377,26 @@ class port_stats_request(stats_request):
             self.port_no = 0
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!H", self.stats_type))
-        packed.append(struct.pack("!H", self.flags))
-        packed.append('\x00' * 4)
-        packed.append(util.pack_port_no(self.port_no))
-        packed.append('\x00' * 4)
-        length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_BBHLHH4xL4x, buf, offset, self.version, self.type, 0, self.xid, self.stats_type, self.flags, self.port_no)
+        length = offset - start
+        _struct_H.pack_into(buf, start + 2, length)
+        return offset
+
+    def wire_length(self):
+        return 24
 
     @staticmethod
     def unpack(reader):
         obj = port_stats_request()
-        _version = reader.read("!B")[0]
+        _version, _type, _length = reader.read_struct(_struct_BBH)
         assert(_version == 4)
-        _type = reader.read("!B")[0]
         assert(_type == 18)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        _stats_type = reader.read("!H")[0]
+        obj.xid, _stats_type, obj.flags, obj.port_no = reader.read_struct(_struct_LHH4xL4x)
         assert(_stats_type == 4)
-        obj.flags = reader.read("!H")[0]
-        reader.skip(4)
-        obj.port_no = util.unpack_port_no(reader)
-        reader.skip(4)
         return obj
 
     def __eq__(self, other):
@@ -13816,6 +12428,7 @@ class port_stats_request(stats_request):
 stats_request.subtypes[4] = port_stats_request
 
 class port_status(message):
+    __slots__ = ["desc", "reason"]
     version = 4
     type = 12
 
@@ -13834,32 +12447,26 @@ class port_status(message):
             self.desc = ofp.port_desc()
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!B", self.reason))
-        packed.append('\x00' * 7)
-        packed.append(self.desc.pack())
-        length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_BBHLB7x, buf, offset, self.version, self.type, 0, self.xid, self.reason)
+        offset = self.desc.pack_into(buf, offset)
+        length = offset - start
+        _struct_H.pack_into(buf, start + 2, length)
+        return offset
+
+    def wire_length(self):
+        return 16 + self.desc.wire_length()
 
     @staticmethod
     def unpack(reader):
         obj = port_status()
-        _version = reader.read("!B")[0]
+        _version, _type, _length = reader.read_struct(_struct_BBH)
         assert(_version == 4)
-        _type = reader.read("!B")[0]
         assert(_type == 12)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        obj.reason = reader.read("!B")[0]
-        reader.skip(7)
+        obj.xid, obj.reason = reader.read_struct(_struct_LB7x)
         obj.desc = ofp.port_desc.unpack(reader)
         return obj
 
@@ -13892,6 +12499,7 @@ class port_status(message):
 message.subtypes[12] = port_status
 
 class queue_get_config_reply(message):
+    __slots__ = ["port", "queues"]
     version = 4
     type = 23
 
@@ -13910,32 +12518,26 @@ class queue_get_config_reply(message):
             self.queues = []
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(util.pack_port_no(self.port))
-        packed.append('\x00' * 4)
-        packed.append(loxi.generic_util.pack_list(self.queues))
-        length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_BBHLL4x, buf, offset, self.version, self.type, 0, self.xid, self.port)
+        offset = loxi.generic_util.pack_list_into(self.queues, buf, offset)
+        length = offset - start
+        _struct_H.pack_into(buf, start + 2, length)
+        return offset
+
+    def wire_length(self):
+        return 16 + loxi.generic_util.list_wire_length(self.queues)
 
     @staticmethod
     def unpack(reader):
         obj = queue_get_config_reply()
-        _version = reader.read("!B")[0]
+        _version, _type, _length = reader.read_struct(_struct_BBH)
         assert(_version == 4)
-        _type = reader.read("!B")[0]
         assert(_type == 23)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        obj.port = util.unpack_port_no(reader)
-        reader.skip(4)
+        obj.xid, obj.port = reader.read_struct(_struct_LL4x)
         obj.queues = loxi.generic_util.unpack_list(reader, ofp.common.packet_queue.unpack)
         return obj
 
@@ -13968,6 +12570,7 @@ class queue_get_config_reply(message):
 message.subtypes[23] = queue_get_config_reply
 
 class queue_get_config_request(message):
+    __slots__ = ["port"]
     version = 4
     type = 22
 
@@ -13982,31 +12585,25 @@ class queue_get_config_request(message):
             self.port = 0
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(util.pack_port_no(self.port))
-        packed.append('\x00' * 4)
-        length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_BBHLL4x, buf, offset, self.version, self.type, 0, self.xid, self.port)
+        length = offset - start
+        _struct_H.pack_into(buf, start + 2, length)
+        return offset
+
+    def wire_length(self):
+        return 16
 
     @staticmethod
     def unpack(reader):
         obj = queue_get_config_request()
-        _version = reader.read("!B")[0]
+        _version, _type, _length = reader.read_struct(_struct_BBH)
         assert(_version == 4)
-        _type = reader.read("!B")[0]
         assert(_type == 22)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        obj.port = util.unpack_port_no(reader)
-        reader.skip(4)
+        obj.xid, obj.port = reader.read_struct(_struct_LL4x)
         return obj
 
     def __eq__(self, other):
@@ -14034,6 +12631,7 @@ class queue_get_config_request(message):
 message.subtypes[22] = queue_get_config_request
 
 class queue_op_failed_error_msg(error_msg):
+    __slots__ = ["code", "data"]
     version = 4
     type = 1
     err_type = 9
@@ -14053,34 +12651,28 @@ class queue_op_failed_error_msg(error_msg):
             self.data = ''
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!H", self.err_type))
-        packed.append(struct.pack("!H", self.code))
-        packed.append(self.data)
-        length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_BBHLHH, buf, offset, self.version, self.type, 0, self.xid, self.err_type, self.code)
+        offset = loxi.generic_util.pack_bytes_into(self.data, buf, offset)
+        length = offset - start
+        _struct_H.pack_into(buf, start + 2, length)
+        return offset
+
+    def wire_length(self):
+        return 12 + len(self.data)
 
     @staticmethod
     def unpack(reader):
         obj = queue_op_failed_error_msg()
-        _version = reader.read("!B")[0]
+        _version, _type, _length = reader.read_struct(_struct_BBH)
         assert(_version == 4)
-        _type = reader.read("!B")[0]
         assert(_type == 1)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        _err_type = reader.read("!H")[0]
+        obj.xid, _err_type, obj.code = reader.read_struct(_struct_LHH)
         assert(_err_type == 9)
-        obj.code = reader.read("!H")[0]
-        obj.data = str(reader.read_all())
+        obj.data = reader.read_all()
         return obj
 
     def __eq__(self, other):
@@ -14112,6 +12704,7 @@ class queue_op_failed_error_msg(error_msg):
 error_msg.subtypes[9] = queue_op_failed_error_msg
 
 class queue_stats_reply(stats_reply):
+    __slots__ = ["entries"]
     version = 4
     type = 19
     stats_type = 5
@@ -14131,35 +12724,27 @@ class queue_stats_reply(stats_reply):
             self.entries = []
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!H", self.stats_type))
-        packed.append(struct.pack("!H", self.flags))
-        packed.append('\x00' * 4)
-        packed.append(loxi.generic_util.pack_list(self.entries))
-        length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_BBHLHH4x, buf, offset, self.version, self.type, 0, self.xid, self.stats_type, self.flags)
+        offset = loxi.generic_util.pack_list_into(self.entries, buf, offset)
+        length = offset - start
+        _struct_H.pack_into(buf, start + 2, length)
+        return offset
+
+    def wire_length(self):
+        return 16 + loxi.generic_util.list_wire_length(self.entries)
 
     @staticmethod
     def unpack(reader):
         obj = queue_stats_reply()
-        _version = reader.read("!B")[0]
+        _version, _type, _length = reader.read_struct(_struct_BBH)
         assert(_version == 4)
-        _type = reader.read("!B")[0]
         assert(_type == 19)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        _stats_type = reader.read("!H")[0]
+        obj.xid, _stats_type, obj.flags = reader.read_struct(_struct_LHH4x)
         assert(_stats_type == 5)
-        obj.flags = reader.read("!H")[0]
-        reader.skip(4)
         obj.entries = loxi.generic_util.unpack_list(reader, ofp.common.queue_stats_entry.unpack)
         return obj
 
@@ -14192,6 +12777,7 @@ class queue_stats_reply(stats_reply):
 stats_reply.subtypes[5] = queue_stats_reply
 
 class queue_stats_request(stats_request):
+    __slots__ = ["port_no", "queue_id"]
     version = 4
     type = 18
     stats_type = 5
@@ -14215,38 +12801,26 @@ class queue_stats_request(stats_request):
             self.queue_id = 0
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!H", self.stats_type))
-        packed.append(struct.pack("!H", self.flags))
-        packed.append('\x00' * 4)
-        packed.append(util.pack_port_no(self.port_no))
-        packed.append(struct.pack("!L", self.queue_id))
-        length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_BBHLHH4xLL, buf, offset, self.version, self.type, 0, self.xid, self.stats_type, self.flags, self.port_no, self.queue_id)
+        length = offset - start
+        _struct_H.pack_into(buf, start + 2, length)
+        return offset
+
+    def wire_length(self):
+        return 24
 
     @staticmethod
     def unpack(reader):
         obj = queue_stats_request()
-        _version = reader.read("!B")[0]
+        _version, _type, _length = reader.read_struct(_struct_BBH)
         assert(_version == 4)
-        _type = reader.read("!B")[0]
         assert(_type == 18)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        _stats_type = reader.read("!H")[0]
+        obj.xid, _stats_type, obj.flags, obj.port_no, obj.queue_id = reader.read_struct(_struct_LHH4xLL)
         assert(_stats_type == 5)
-        obj.flags = reader.read("!H")[0]
-        reader.skip(4)
-        obj.port_no = util.unpack_port_no(reader)
-        obj.queue_id = reader.read("!L")[0]
         return obj
 
     def __eq__(self, other):
@@ -14282,6 +12856,7 @@ class queue_stats_request(stats_request):
 stats_request.subtypes[5] = queue_stats_request
 
 class role_reply(message):
+    __slots__ = ["generation_id", "role"]
     version = 4
     type = 25
 
@@ -14300,33 +12875,25 @@ class role_reply(message):
             self.generation_id = 0
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!L", self.role))
-        packed.append('\x00' * 4)
-        packed.append(struct.pack("!Q", self.generation_id))
-        length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_BBHLL4xQ, buf, offset, self.version, self.type, 0, self.xid, self.role, self.generation_id)
+        length = offset - start
+        _struct_H.pack_into(buf, start + 2, length)
+        return offset
+
+    def wire_length(self):
+        return 24
 
     @staticmethod
     def unpack(reader):
         obj = role_reply()
-        _version = reader.read("!B")[0]
+        _version, _type, _length = reader.read_struct(_struct_BBH)
         assert(_version == 4)
-        _type = reader.read("!B")[0]
         assert(_type == 25)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        obj.role = reader.read("!L")[0]
-        reader.skip(4)
-        obj.generation_id = reader.read("!Q")[0]
+        obj.xid, obj.role, obj.generation_id = reader.read_struct(_struct_LL4xQ)
         return obj
 
     def __eq__(self, other):
@@ -14358,6 +12925,7 @@ class role_reply(message):
 message.subtypes[25] = role_reply
 
 class role_request(message):
+    __slots__ = ["generation_id", "role"]
     version = 4
     type = 24
 
@@ -14376,33 +12944,25 @@ class role_request(message):
             self.generation_id = 0
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!L", self.role))
-        packed.append('\x00' * 4)
-        packed.append(struct.pack("!Q", self.generation_id))
-        length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_BBHLL4xQ, buf, offset, self.version, self.type, 0, self.xid, self.role, self.generation_id)
+        length = offset - start
+        _struct_H.pack_into(buf, start + 2, length)
+        return offset
+
+    def wire_length(self):
+        return 24
 
     @staticmethod
     def unpack(reader):
         obj = role_request()
-        _version = reader.read("!B")[0]
+        _version, _type, _length = reader.read_struct(_struct_BBH)
         assert(_version == 4)
-        _type = reader.read("!B")[0]
         assert(_type == 24)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        obj.role = reader.read("!L")[0]
-        reader.skip(4)
-        obj.generation_id = reader.read("!Q")[0]
+        obj.xid, obj.role, obj.generation_id = reader.read_struct(_struct_LL4xQ)
         return obj
 
     def __eq__(self, other):
@@ -14434,6 +12994,7 @@ class role_request(message):
 message.subtypes[24] = role_request
 
 class role_request_failed_error_msg(error_msg):
+    __slots__ = ["code", "data"]
     version = 4
     type = 1
     err_type = 11
@@ -14453,34 +13014,28 @@ class role_request_failed_error_msg(error_msg):
             self.data = ''
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!H", self.err_type))
-        packed.append(struct.pack("!H", self.code))
-        packed.append(self.data)
-        length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_BBHLHH, buf, offset, self.version, self.type, 0, self.xid, self.err_type, self.code)
+        offset = loxi.generic_util.pack_bytes_into(self.data, buf, offset)
+        length = offset - start
+        _struct_H.pack_into(buf, start + 2, length)
+        return offset
+
+    def wire_length(self):
+        return 12 + len(self.data)
 
     @staticmethod
     def unpack(reader):
         obj = role_request_failed_error_msg()
-        _version = reader.read("!B")[0]
+        _version, _type, _length = reader.read_struct(_struct_BBH)
         assert(_version == 4)
-        _type = reader.read("!B")[0]
         assert(_type == 1)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        _err_type = reader.read("!H")[0]
+        obj.xid, _err_type, obj.code = reader.read_struct(_struct_LHH)
         assert(_err_type == 11)
-        obj.code = reader.read("!H")[0]
-        obj.data = str(reader.read_all())
+        obj.data = reader.read_all()
         return obj
 
     def __eq__(self, other):
@@ -14512,6 +13067,7 @@ class role_request_failed_error_msg(error_msg):
 error_msg.subtypes[11] = role_request_failed_error_msg
 
 class set_config(message):
+    __slots__ = ["flags", "miss_send_len"]
     version = 4
     type = 9
 
@@ -14530,31 +13086,25 @@ class set_config(message):
             self.miss_send_len = 0
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!H", self.flags))
-        packed.append(struct.pack("!H", self.miss_send_len))
-        length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_BBHLHH, buf, offset, self.version, self.type, 0, self.xid, self.flags, self.miss_send_len)
+        length = offset - start
+        _struct_H.pack_into(buf, start + 2, length)
+        return offset
+
+    def wire_length(self):
+        return 12
 
     @staticmethod
     def unpack(reader):
         obj = set_config()
-        _version = reader.read("!B")[0]
+        _version, _type, _length = reader.read_struct(_struct_BBH)
         assert(_version == 4)
-        _type = reader.read("!B")[0]
         assert(_type == 9)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        obj.flags = reader.read("!H")[0]
-        obj.miss_send_len = reader.read("!H")[0]
+        obj.xid, obj.flags, obj.miss_send_len = reader.read_struct(_struct_LHH)
         return obj
 
     def __eq__(self, other):
@@ -14586,6 +13136,7 @@ class set_config(message):
 message.subtypes[9] = set_config
 
 class switch_config_failed_error_msg(error_msg):
+    __slots__ = ["code", "data"]
     version = 4
     type = 1
     err_type = 10
@@ -14605,34 +13156,28 @@ class switch_config_failed_error_msg(error_msg):
             self.data = ''
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!H", self.err_type))
-        packed.append(struct.pack("!H", self.code))
-        packed.append(self.data)
-        length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_BBHLHH, buf, offset, self.version, self.type, 0, self.xid, self.err_type, self.code)
+        offset = loxi.generic_util.pack_bytes_into(self.data, buf, offset)
+        length = offset - start
+        _struct_H.pack_into(buf, start + 2, length)
+        return offset
+
+    def wire_length(self):
+        return 12 + len(self.data)
 
     @staticmethod
     def unpack(reader):
         obj = switch_config_failed_error_msg()
-        _version = reader.read("!B")[0]
+        _version, _type, _length = reader.read_struct(_struct_BBH)
         assert(_version == 4)
-        _type = reader.read("!B")[0]
         assert(_type == 1)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        _err_type = reader.read("!H")[0]
+        obj.xid, _err_type, obj.code = reader.read_struct(_struct_LHH)
         assert(_err_type == 10)
-        obj.code = reader.read("!H")[0]
-        obj.data = str(reader.read_all())
+        obj.data = reader.read_all()
         return obj
 
     def __eq__(self, other):
@@ -14664,6 +13209,7 @@ class switch_config_failed_error_msg(error_msg):
 error_msg.subtypes[10] = switch_config_failed_error_msg
 
 class table_features_failed_error_msg(error_msg):
+    __slots__ = ["code", "data"]
     version = 4
     type = 1
     err_type = 13
@@ -14683,34 +13229,28 @@ class table_features_failed_error_msg(error_msg):
             self.data = ''
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!H", self.err_type))
-        packed.append(struct.pack("!H", self.code))
-        packed.append(self.data)
-        length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_BBHLHH, buf, offset, self.version, self.type, 0, self.xid, self.err_type, self.code)
+        offset = loxi.generic_util.pack_bytes_into(self.data, buf, offset)
+        length = offset - start
+        _struct_H.pack_into(buf, start + 2, length)
+        return offset
+
+    def wire_length(self):
+        return 12 + len(self.data)
 
     @staticmethod
     def unpack(reader):
         obj = table_features_failed_error_msg()
-        _version = reader.read("!B")[0]
+        _version, _type, _length = reader.read_struct(_struct_BBH)
         assert(_version == 4)
-        _type = reader.read("!B")[0]
         assert(_type == 1)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        _err_type = reader.read("!H")[0]
+        obj.xid, _err_type, obj.code = reader.read_struct(_struct_LHH)
         assert(_err_type == 13)
-        obj.code = reader.read("!H")[0]
-        obj.data = str(reader.read_all())
+        obj.data = reader.read_all()
         return obj
 
     def __eq__(self, other):
@@ -14742,6 +13282,7 @@ class table_features_failed_error_msg(error_msg):
 error_msg.subtypes[13] = table_features_failed_error_msg
 
 class table_features_stats_reply(stats_reply):
+    __slots__ = ["entries"]
     version = 4
     type = 19
     stats_type = 12
@@ -14761,35 +13302,27 @@ class table_features_stats_reply(stats_reply):
             self.entries = []
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!H", self.stats_type))
-        packed.append(struct.pack("!H", self.flags))
-        packed.append('\x00' * 4)
-        packed.append(loxi.generic_util.pack_list(self.entries))
-        length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_BBHLHH4x, buf, offset, self.version, self.type, 0, self.xid, self.stats_type, self.flags)
+        offset = loxi.generic_util.pack_list_into(self.entries, buf, offset)
+        length = offset - start
+        _struct_H.pack_into(buf, start + 2, length)
+        return offset
+
+    def wire_length(self):
+        return 16 + loxi.generic_util.list_wire_length(self.entries)
 
     @staticmethod
     def unpack(reader):
         obj = table_features_stats_reply()
-        _version = reader.read("!B")[0]
+        _version, _type, _length = reader.read_struct(_struct_BBH)
         assert(_version == 4)
-        _type = reader.read("!B")[0]
         assert(_type == 19)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        _stats_type = reader.read("!H")[0]
+        obj.xid, _stats_type, obj.flags = reader.read_struct(_struct_LHH4x)
         assert(_stats_type == 12)
-        obj.flags = reader.read("!H")[0]
-        reader.skip(4)
         obj.entries = loxi.generic_util.unpack_list(reader, ofp.common.table_features.unpack)
         return obj
 
@@ -14822,6 +13355,7 @@ class table_features_stats_reply(stats_reply):
 stats_reply.subtypes[12] = table_features_stats_reply
 
 class table_features_stats_request(stats_request):
+    __slots__ = ["entries"]
     version = 4
     type = 18
     stats_type = 12
@@ -14841,35 +13375,27 @@ class table_features_stats_request(stats_request):
             self.entries = []
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!H", self.stats_type))
-        packed.append(struct.pack("!H", self.flags))
-        packed.append('\x00' * 4)
-        packed.append(loxi.generic_util.pack_list(self.entries))
-        length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_BBHLHH4x, buf, offset, self.version, self.type, 0, self.xid, self.stats_type, self.flags)
+        offset = loxi.generic_util.pack_list_into(self.entries, buf, offset)
+        length = offset - start
+        _struct_H.pack_into(buf, start + 2, length)
+        return offset
+
+    def wire_length(self):
+        return 16 + loxi.generic_util.list_wire_length(self.entries)
 
     @staticmethod
     def unpack(reader):
         obj = table_features_stats_request()
-        _version = reader.read("!B")[0]
+        _version, _type, _length = reader.read_struct(_struct_BBH)
         assert(_version == 4)
-        _type = reader.read("!B")[0]
         assert(_type == 18)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        _stats_type = reader.read("!H")[0]
+        obj.xid, _stats_type, obj.flags = reader.read_struct(_struct_LHH4x)
         assert(_stats_type == 12)
-        obj.flags = reader.read("!H")[0]
-        reader.skip(4)
         obj.entries = loxi.generic_util.unpack_list(reader, ofp.common.table_features.unpack)
         return obj
 
@@ -14902,6 +13428,7 @@ class table_features_stats_request(stats_request):
 stats_request.subtypes[12] = table_features_stats_request
 
 class table_mod(message):
+    __slots__ = ["config", "table_id"]
     version = 4
     type = 17
 
@@ -14920,33 +13447,25 @@ class table_mod(message):
             self.config = 0
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!B", self.table_id))
-        packed.append('\x00' * 3)
-        packed.append(struct.pack("!L", self.config))
-        length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_BBHLB3xL, buf, offset, self.version, self.type, 0, self.xid, self.table_id, self.config)
+        length = offset - start
+        _struct_H.pack_into(buf, start + 2, length)
+        return offset
+
+    def wire_length(self):
+        return 16
 
     @staticmethod
     def unpack(reader):
         obj = table_mod()
-        _version = reader.read("!B")[0]
+        _version, _type, _length = reader.read_struct(_struct_BBH)
         assert(_version == 4)
-        _type = reader.read("!B")[0]
         assert(_type == 17)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        obj.table_id = reader.read("!B")[0]
-        reader.skip(3)
-        obj.config = reader.read("!L")[0]
+        obj.xid, obj.table_id, obj.config = reader.read_struct(_struct_LB3xL)
         return obj
 
     def __eq__(self, other):
@@ -14978,6 +13497,7 @@ class table_mod(message):
 message.subtypes[17] = table_mod
 
 class table_mod_failed_error_msg(error_msg):
+    __slots__ = ["code", "data"]
     version = 4
     type = 1
     err_type = 8
@@ -14997,34 +13517,28 @@ class table_mod_failed_error_msg(error_msg):
             self.data = ''
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!H", self.err_type))
-        packed.append(struct.pack("!H", self.code))
-        packed.append(self.data)
-        length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_BBHLHH, buf, offset, self.version, self.type, 0, self.xid, self.err_type, self.code)
+        offset = loxi.generic_util.pack_bytes_into(self.data, buf, offset)
+        length = offset - start
+        _struct_H.pack_into(buf, start + 2, length)
+        return offset
+
+    def wire_length(self):
+        return 12 + len(self.data)
 
     @staticmethod
     def unpack(reader):
         obj = table_mod_failed_error_msg()
-        _version = reader.read("!B")[0]
+        _version, _type, _length = reader.read_struct(_struct_BBH)
         assert(_version == 4)
-        _type = reader.read("!B")[0]
         assert(_type == 1)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        _err_type = reader.read("!H")[0]
+        obj.xid, _err_type, obj.code = reader.read_struct(_struct_LHH)
         assert(_err_type == 8)
-        obj.code = reader.read("!H")[0]
-        obj.data = str(reader.read_all())
+        obj.data = reader.read_all()
         return obj
 
     def __eq__(self, other):
@@ -15056,6 +13570,7 @@ class table_mod_failed_error_msg(error_msg):
 error_msg.subtypes[8] = table_mod_failed_error_msg
 
 class table_stats_reply(stats_reply):
+    __slots__ = ["entries"]
     version = 4
     type = 19
     stats_type = 3
@@ -15075,35 +13590,27 @@ class table_stats_reply(stats_reply):
             self.entries = []
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!H", self.stats_type))
-        packed.append(struct.pack("!H", self.flags))
-        packed.append('\x00' * 4)
-        packed.append(loxi.generic_util.pack_list(self.entries))
-        length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_BBHLHH4x, buf, offset, self.version, self.type, 0, self.xid, self.stats_type, self.flags)
+        offset = loxi.generic_util.pack_list_into(self.entries, buf, offset)
+        length = offset - start
+        _struct_H.pack_into(buf, start + 2, length)
+        return offset
+
+    def wire_length(self):
+        return 16 + loxi.generic_util.list_wire_length(self.entries)
 
     @staticmethod
     def unpack(reader):
         obj = table_stats_reply()
-        _version = reader.read("!B")[0]
+        _version, _type, _length = reader.read_struct(_struct_BBH)
         assert(_version == 4)
-        _type = reader.read("!B")[0]
         assert(_type == 19)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        _stats_type = reader.read("!H")[0]
+        obj.xid, _stats_type, obj.flags = reader.read_struct(_struct_LHH4x)
         assert(_stats_type == 3)
-        obj.flags = reader.read("!H")[0]
-        reader.skip(4)
         obj.entries = loxi.generic_util.unpack_list(reader, ofp.common.table_stats_entry.unpack)
         return obj
 
@@ -15136,6 +13643,7 @@ class table_stats_reply(stats_reply):
 stats_reply.subtypes[3] = table_stats_reply
 
 class table_stats_request(stats_request):
+    __slots__ = []
     version = 4
     type = 18
     stats_type = 3
@@ -15151,34 +13659,26 @@ class table_stats_request(stats_request):
             self.flags = 0
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!H", self.stats_type))
-        packed.append(struct.pack("!H", self.flags))
-        packed.append('\x00' * 4)
-        length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_BBHLHH4x, buf, offset, self.version, self.type, 0, self.xid, self.stats_type, self.flags)
+        length = offset - start
+        _struct_H.pack_into(buf, start + 2, length)
+        return offset
+
+    def wire_length(self):
+        return 16
 
     @staticmethod
     def unpack(reader):
         obj = table_stats_request()
-        _version = reader.read("!B")[0]
+        _version, _type, _length = reader.read_struct(_struct_BBH)
         assert(_version == 4)
-        _type = reader.read("!B")[0]
         assert(_type == 18)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        _stats_type = reader.read("!H")[0]
+        obj.xid, _stats_type, obj.flags = reader.read_struct(_struct_LHH4x)
         assert(_stats_type == 3)
-        obj.flags = reader.read("!H")[0]
-        reader.skip(4)
         return obj
 
     def __eq__(self, other):
@@ -15206,15 +13706,51 @@ class table_stats_request(stats_request):
 stats_request.subtypes[3] = table_stats_request
 
 
+# Field each message class with subtypes is dispatched on, as (struct, offset)
+_subtype_fields = {
+    message: (_struct_B, 1),
+    stats_reply: (_struct_H, 8),
+    stats_request: (_struct_H, 8),
+    error_msg: (_struct_H, 8),
+    experimenter: (_struct_L, 8),
+    bsn_header: (_struct_L, 12),
+    experimenter_stats_reply: (_struct_L, 16),
+    bsn_stats_reply: (_struct_L, 20),
+    experimenter_stats_request: (_struct_L, 16),
+    bsn_stats_request: (_struct_L, 20),
+    flow_mod: (_struct_B, 25),
+    group_mod: (_struct_H, 8),
+    nicira_header: (_struct_L, 12),
+}
+
+_dispatch_table = None
+
 def parse_header(buf):
     if len(buf) < 8:
         raise loxi.ProtocolError("too short to be an OpenFlow message")
     return struct.unpack_from("!BBHL", buf)
 
-def parse_message(buf):
+def parse_message(buf, lazy=False):
+    """
+    Deserialize a complete OpenFlow message.
+
+    If lazy is true, only the header is parsed and a LazyMessage is returned
+    which unpacks the rest of the message on first use.
+    """
     msg_ver, msg_type, msg_len, msg_xid = parse_header(buf)
     if msg_ver != ofp.OFP_VERSION and msg_type != ofp.OFPT_HELLO:
         raise loxi.ProtocolError("wrong OpenFlow version (expected %d, got %d)" % (ofp.OFP_VERSION, msg_ver))
     if len(buf) != msg_len:
         raise loxi.ProtocolError("incorrect message size")
-    return message.unpack(loxi.generic_util.OFReader(buf))
+    if lazy:
+        return loxi.generic_util.LazyMessage(buf, unpack_message)
+    return unpack_message(loxi.generic_util.OFReader(buf))
+
+def unpack_message(reader):
+    """
+    Unpack a message, going straight to the unpack() of its leaf class.
+    """
+    global _dispatch_table
+    if _dispatch_table is None:
+        _dispatch_table = loxi.generic_util.dispatch_table(message, _subtype_fields)
+    return loxi.generic_util.unpack_dispatched(reader, _dispatch_table)
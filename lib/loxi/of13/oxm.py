@@ -14,7 +14,24 @@ import loxi.generic_util
 import sys
 ofp = sys.modules['loxi.of13']
 
+# Precompiled layouts for the fixed-length parts of each pack_into() and unpack()
+_struct_6B = struct.Struct("!6B")
+_struct_L = struct.Struct("!L")
+_struct_L16s = struct.Struct("!L16s")
+_struct_L16s16s = struct.Struct("!L16s16s")
+_struct_L6B = struct.Struct("!L6B")
+_struct_L6B6B = struct.Struct("!L6B6B")
+_struct_LB = struct.Struct("!LB")
+_struct_LBB = struct.Struct("!LBB")
+_struct_LH = struct.Struct("!LH")
+_struct_LHH = struct.Struct("!LHH")
+_struct_LL = struct.Struct("!LL")
+_struct_LLL = struct.Struct("!LLL")
+_struct_LQ = struct.Struct("!LQ")
+_struct_LQQ = struct.Struct("!LQQ")
+
 class oxm(loxi.OFObject):
+    __slots__ = ["type_len"]
     subtypes = {}
 
 
@@ -25,10 +42,13 @@ class oxm(loxi.OFObject):
             self.type_len = 0
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!L", self.type_len))
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_L, buf, offset, self.type_len)
+        return offset
+
+    def wire_length(self):
+        return 4
 
     @staticmethod
     def unpack(reader):
@@ -56,6 +76,7 @@ class oxm(loxi.OFObject):
 
 
 class arp_op(oxm):
+    __slots__ = ["value"]
     type_len = 2147494402
 
     def __init__(self, value=None):
@@ -65,18 +86,19 @@ class arp_op(oxm):
             self.value = 0
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!L", self.type_len))
-        packed.append(struct.pack("!H", self.value))
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_LH, buf, offset, self.type_len, self.value)
+        return offset
+
+    def wire_length(self):
+        return 6
 
     @staticmethod
     def unpack(reader):
         obj = arp_op()
-        _type_len = reader.read("!L")[0]
+        _type_len, obj.value = reader.read_struct(_struct_LH)
         assert(_type_len == 2147494402)
-        obj.value = reader.read("!H")[0]
         return obj
 
     def __eq__(self, other):
@@ -97,6 +119,7 @@ class arp_op(oxm):
 oxm.subtypes[2147494402] = arp_op
 
 class arp_op_masked(oxm):
+    __slots__ = ["value", "value_mask"]
     type_len = 2147494660
 
     def __init__(self, value=None, value_mask=None):
@@ -110,20 +133,19 @@ class arp_op_masked(oxm):
             self.value_mask = 0
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!L", self.type_len))
-        packed.append(struct.pack("!H", self.value))
-        packed.append(struct.pack("!H", self.value_mask))
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_LHH, buf, offset, self.type_len, self.value, self.value_mask)
+        return offset
+
+    def wire_length(self):
+        return 8
 
     @staticmethod
     def unpack(reader):
         obj = arp_op_masked()
-        _type_len = reader.read("!L")[0]
+        _type_len, obj.value, obj.value_mask = reader.read_struct(_struct_LHH)
         assert(_type_len == 2147494660)
-        obj.value = reader.read("!H")[0]
-        obj.value_mask = reader.read("!H")[0]
         return obj
 
     def __eq__(self, other):
@@ -148,6 +170,7 @@ class arp_op_masked(oxm):
 oxm.subtypes[2147494660] = arp_op_masked
 
 class arp_sha(oxm):
+    __slots__ = ["value"]
     type_len = 2147495942
 
     def __init__(self, value=None):
@@ -157,11 +180,14 @@ class arp_sha(oxm):
             self.value = [0,0,0,0,0,0]
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!L", self.type_len))
-        packed.append(struct.pack("!6B", *self.value))
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_L, buf, offset, self.type_len)
+        offset = loxi.generic_util.pack_struct_into(_struct_6B, buf, offset, *self.value)
+        return offset
+
+    def wire_length(self):
+        return 10
 
     @staticmethod
     def unpack(reader):
@@ -189,6 +215,7 @@ class arp_sha(oxm):
 oxm.subtypes[2147495942] = arp_sha
 
 class arp_sha_masked(oxm):
+    __slots__ = ["value", "value_mask"]
     type_len = 2147496204
 
     def __init__(self, value=None, value_mask=None):
@@ -202,12 +229,15 @@ class arp_sha_masked(oxm):
             self.value_mask = [0,0,0,0,0,0]
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!L", self.type_len))
-        packed.append(struct.pack("!6B", *self.value))
-        packed.append(struct.pack("!6B", *self.value_mask))
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_L, buf, offset, self.type_len)
+        offset = loxi.generic_util.pack_struct_into(_struct_6B, buf, offset, *self.value)
+        offset = loxi.generic_util.pack_struct_into(_struct_6B, buf, offset, *self.value_mask)
+        return offset
+
+    def wire_length(self):
+        return 16
 
     @staticmethod
     def unpack(reader):
@@ -240,6 +270,7 @@ class arp_sha_masked(oxm):
 oxm.subtypes[2147496204] = arp_sha_masked
 
 class arp_spa(oxm):
+    __slots__ = ["value"]
     type_len = 2147494916
 
     def __init__(self, value=None):
@@ -249,18 +280,19 @@ class arp_spa(oxm):
             self.value = 0
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!L", self.type_len))
-        packed.append(struct.pack("!L", self.value))
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_LL, buf, offset, self.type_len, self.value)
+        return offset
+
+    def wire_length(self):
+        return 8
 
     @staticmethod
     def unpack(reader):
         obj = arp_spa()
-        _type_len = reader.read("!L")[0]
+        _type_len, obj.value = reader.read_struct(_struct_LL)
         assert(_type_len == 2147494916)
-        obj.value = reader.read("!L")[0]
         return obj
 
     def __eq__(self, other):
@@ -281,6 +313,7 @@ class arp_spa(oxm):
 oxm.subtypes[2147494916] = arp_spa
 
 class arp_spa_masked(oxm):
+    __slots__ = ["value", "value_mask"]
     type_len = 2147495176
 
     def __init__(self, value=None, value_mask=None):
@@ -294,20 +327,19 @@ class arp_spa_masked(oxm):
             self.value_mask = 0
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!L", self.type_len))
-        packed.append(struct.pack("!L", self.value))
-        packed.append(struct.pack("!L", self.value_mask))
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_LLL, buf, offset, self.type_len, self.value, self.value_mask)
+        return offset
+
+    def wire_length(self):
+        return 12
 
     @staticmethod
     def unpack(reader):
         obj = arp_spa_masked()
-        _type_len = reader.read("!L")[0]
+        _type_len, obj.value, obj.value_mask = reader.read_struct(_struct_LLL)
         assert(_type_len == 2147495176)
-        obj.value = reader.read("!L")[0]
-        obj.value_mask = reader.read("!L")[0]
         return obj
 
     def __eq__(self, other):
@@ -332,6 +364,7 @@ class arp_spa_masked(oxm):
 oxm.subtypes[2147495176] = arp_spa_masked
 
 class arp_tha(oxm):
+    __slots__ = ["value"]
     type_len = 2147496454
 
     def __init__(self, value=None):
@@ -341,11 +374,14 @@ class arp_tha(oxm):
             self.value = [0,0,0,0,0,0]
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!L", self.type_len))
-        packed.append(struct.pack("!6B", *self.value))
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_L, buf, offset, self.type_len)
+        offset = loxi.generic_util.pack_struct_into(_struct_6B, buf, offset, *self.value)
+        return offset
+
+    def wire_length(self):
+        return 10
 
     @staticmethod
     def unpack(reader):
@@ -373,6 +409,7 @@ class arp_tha(oxm):
 oxm.subtypes[2147496454] = arp_tha
 
 class arp_tha_masked(oxm):
+    __slots__ = ["value", "value_mask"]
     type_len = 2147496716
 
     def __init__(self, value=None, value_mask=None):
@@ -386,12 +423,15 @@ class arp_tha_masked(oxm):
             self.value_mask = [0,0,0,0,0,0]
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!L", self.type_len))
-        packed.append(struct.pack("!6B", *self.value))
-        packed.append(struct.pack("!6B", *self.value_mask))
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_L, buf, offset, self.type_len)
+        offset = loxi.generic_util.pack_struct_into(_struct_6B, buf, offset, *self.value)
+        offset = loxi.generic_util.pack_struct_into(_struct_6B, buf, offset, *self.value_mask)
+        return offset
+
+    def wire_length(self):
+        return 16
 
     @staticmethod
     def unpack(reader):
@@ -424,6 +464,7 @@ class arp_tha_masked(oxm):
 oxm.subtypes[2147496716] = arp_tha_masked
 
 class arp_tpa(oxm):
+    __slots__ = ["value"]
     type_len = 2147495428
 
     def __init__(self, value=None):
@@ -433,18 +474,19 @@ class arp_tpa(oxm):
             self.value = 0
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!L", self.type_len))
-        packed.append(struct.pack("!L", self.value))
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_LL, buf, offset, self.type_len, self.value)
+        return offset
+
+    def wire_length(self):
+        return 8
 
     @staticmethod
     def unpack(reader):
         obj = arp_tpa()
-        _type_len = reader.read("!L")[0]
+        _type_len, obj.value = reader.read_struct(_struct_LL)
         assert(_type_len == 2147495428)
-        obj.value = reader.read("!L")[0]
         return obj
 
     def __eq__(self, other):
@@ -465,6 +507,7 @@ class arp_tpa(oxm):
 oxm.subtypes[2147495428] = arp_tpa
 
 class arp_tpa_masked(oxm):
+    __slots__ = ["value", "value_mask"]
     type_len = 2147495688
 
     def __init__(self, value=None, value_mask=None):
@@ -478,20 +521,19 @@ class arp_tpa_masked(oxm):
             self.value_mask = 0
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!L", self.type_len))
-        packed.append(struct.pack("!L", self.value))
-        packed.append(struct.pack("!L", self.value_mask))
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_LLL, buf, offset, self.type_len, self.value, self.value_mask)
+        return offset
+
+    def wire_length(self):
+        return 12
 
     @staticmethod
     def unpack(reader):
         obj = arp_tpa_masked()
-        _type_len = reader.read("!L")[0]
+        _type_len, obj.value, obj.value_mask = reader.read_struct(_struct_LLL)
         assert(_type_len == 2147495688)
-        obj.value = reader.read("!L")[0]
-        obj.value_mask = reader.read("!L")[0]
         return obj
 
     def __eq__(self, other):
@@ -516,6 +558,7 @@ class arp_tpa_masked(oxm):
 oxm.subtypes[2147495688] = arp_tpa_masked
 
 class bsn_egr_port_group_id(oxm):
+    __slots__ = ["value"]
     type_len = 200196
 
     def __init__(self, value=None):
@@ -525,18 +568,19 @@ class bsn_egr_port_group_id(oxm):
             self.value = 0
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!L", self.type_len))
-        packed.append(struct.pack("!L", self.value))
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_LL, buf, offset, self.type_len, self.value)
+        return offset
+
+    def wire_length(self):
+        return 8
 
     @staticmethod
     def unpack(reader):
         obj = bsn_egr_port_group_id()
-        _type_len = reader.read("!L")[0]
+        _type_len, obj.value = reader.read_struct(_struct_LL)
         assert(_type_len == 200196)
-        obj.value = reader.read("!L")[0]
         return obj
 
     def __eq__(self, other):
@@ -557,6 +601,7 @@ class bsn_egr_port_group_id(oxm):
 oxm.subtypes[200196] = bsn_egr_port_group_id
 
 class bsn_egr_port_group_id_masked(oxm):
+    __slots__ = ["value", "value_mask"]
     type_len = 200456
 
     def __init__(self, value=None, value_mask=None):
@@ -570,20 +615,19 @@ class bsn_egr_port_group_id_masked(oxm):
             self.value_mask = 0
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!L", self.type_len))
-        packed.append(struct.pack("!L", self.value))
-        packed.append(struct.pack("!L", self.value_mask))
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_LLL, buf, offset, self.type_len, self.value, self.value_mask)
+        return offset
+
+    def wire_length(self):
+        return 12
 
     @staticmethod
     def unpack(reader):
         obj = bsn_egr_port_group_id_masked()
-        _type_len = reader.read("!L")[0]
+        _type_len, obj.value, obj.value_mask = reader.read_struct(_struct_LLL)
         assert(_type_len == 200456)
-        obj.value = reader.read("!L")[0]
-        obj.value_mask = reader.read("!L")[0]
         return obj
 
     def __eq__(self, other):
@@ -608,6 +652,7 @@ class bsn_egr_port_group_id_masked(oxm):
 oxm.subtypes[200456] = bsn_egr_port_group_id_masked
 
 class bsn_global_vrf_allowed(oxm):
+    __slots__ = ["value"]
     type_len = 198145
 
     def __init__(self, value=None):
@@ -617,18 +662,19 @@ class bsn_global_vrf_allowed(oxm):
             self.value = 0
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!L", self.type_len))
-        packed.append(struct.pack("!B", self.value))
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_LB, buf, offset, self.type_len, self.value)
+        return offset
+
+    def wire_length(self):
+        return 5
 
     @staticmethod
     def unpack(reader):
         obj = bsn_global_vrf_allowed()
-        _type_len = reader.read("!L")[0]
+        _type_len, obj.value = reader.read_struct(_struct_LB)
         assert(_type_len == 198145)
-        obj.value = reader.read("!B")[0]
         return obj
 
     def __eq__(self, other):
@@ -649,6 +695,7 @@ class bsn_global_vrf_allowed(oxm):
 oxm.subtypes[198145] = bsn_global_vrf_allowed
 
 class bsn_global_vrf_allowed_masked(oxm):
+    __slots__ = ["value", "value_mask"]
     type_len = 198402
 
     def __init__(self, value=None, value_mask=None):
@@ -662,20 +709,19 @@ class bsn_global_vrf_allowed_masked(oxm):
             self.value_mask = 0
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!L", self.type_len))
-        packed.append(struct.pack("!B", self.value))
-        packed.append(struct.pack("!B", self.value_mask))
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_LBB, buf, offset, self.type_len, self.value, self.value_mask)
+        return offset
+
+    def wire_length(self):
+        return 6
 
     @staticmethod
     def unpack(reader):
         obj = bsn_global_vrf_allowed_masked()
-        _type_len = reader.read("!L")[0]
+        _type_len, obj.value, obj.value_mask = reader.read_struct(_struct_LBB)
         assert(_type_len == 198402)
-        obj.value = reader.read("!B")[0]
-        obj.value_mask = reader.read("!B")[0]
         return obj
 
     def __eq__(self, other):
@@ -700,6 +746,7 @@ class bsn_global_vrf_allowed_masked(oxm):
 oxm.subtypes[198402] = bsn_global_vrf_allowed_masked
 
 class bsn_in_ports_128(oxm):
+    __slots__ = ["value"]
     type_len = 196624
 
     def __init__(self, value=None):
@@ -709,11 +756,14 @@ class bsn_in_ports_128(oxm):
             self.value = set()
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!L", self.type_len))
-        packed.append(util.pack_bitmap_128(self.value))
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_L, buf, offset, self.type_len)
+        offset = loxi.generic_util.pack_bytes_into(util.pack_bitmap_128(self.value), buf, offset)
+        return offset
+
+    def wire_length(self):
+        return 20
 
     @staticmethod
     def unpack(reader):
@@ -741,6 +791,7 @@ class bsn_in_ports_128(oxm):
 oxm.subtypes[196624] = bsn_in_ports_128
 
 class bsn_in_ports_128_masked(oxm):
+    __slots__ = ["value", "value_mask"]
     type_len = 196896
 
     def __init__(self, value=None, value_mask=None):
@@ -754,12 +805,15 @@ class bsn_in_ports_128_masked(oxm):
             self.value_mask = set()
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!L", self.type_len))
-        packed.append(util.pack_bitmap_128(self.value))
-        packed.append(util.pack_bitmap_128(self.value_mask))
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_L, buf, offset, self.type_len)
+        offset = loxi.generic_util.pack_bytes_into(util.pack_bitmap_128(self.value), buf, offset)
+        offset = loxi.generic_util.pack_bytes_into(util.pack_bitmap_128(self.value_mask), buf, offset)
+        return offset
+
+    def wire_length(self):
+        return 36
 
     @staticmethod
     def unpack(reader):
@@ -792,6 +846,7 @@ class bsn_in_ports_128_masked(oxm):
 oxm.subtypes[196896] = bsn_in_ports_128_masked
 
 class bsn_in_ports_512(oxm):
+    __slots__ = ["value"]
     type_len = 206400
 
     def __init__(self, value=None):
@@ -801,11 +856,14 @@ class bsn_in_ports_512(oxm):
             self.value = set()
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!L", self.type_len))
-        packed.append(util.pack_bitmap_512(self.value))
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_L, buf, offset, self.type_len)
+        offset = loxi.generic_util.pack_bytes_into(util.pack_bitmap_512(self.value), buf, offset)
+        return offset
+
+    def wire_length(self):
+        return 68
 
     @staticmethod
     def unpack(reader):
@@ -833,6 +891,7 @@ class bsn_in_ports_512(oxm):
 oxm.subtypes[206400] = bsn_in_ports_512
 
 class bsn_in_ports_512_masked(oxm):
+    __slots__ = ["value", "value_mask"]
     type_len = 206720
 
     def __init__(self, value=None, value_mask=None):
@@ -846,12 +905,15 @@ class bsn_in_ports_512_masked(oxm):
             self.value_mask = set()
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!L", self.type_len))
-        packed.append(util.pack_bitmap_512(self.value))
-        packed.append(util.pack_bitmap_512(self.value_mask))
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_L, buf, offset, self.type_len)
+        offset = loxi.generic_util.pack_bytes_into(util.pack_bitmap_512(self.value), buf, offset)
+        offset = loxi.generic_util.pack_bytes_into(util.pack_bitmap_512(self.value_mask), buf, offset)
+        return offset
+
+    def wire_length(self):
+        return 132
 
     @staticmethod
     def unpack(reader):
@@ -884,6 +946,7 @@ class bsn_in_ports_512_masked(oxm):
 oxm.subtypes[206720] = bsn_in_ports_512_masked
 
 class bsn_ingress_port_group_id(oxm):
+    __slots__ = ["value"]
     type_len = 206852
 
     def __init__(self, value=None):
@@ -893,18 +956,19 @@ class bsn_ingress_port_group_id(oxm):
             self.value = 0
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!L", self.type_len))
-        packed.append(struct.pack("!L", self.value))
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_LL, buf, offset, self.type_len, self.value)
+        return offset
+
+    def wire_length(self):
+        return 8
 
     @staticmethod
     def unpack(reader):
         obj = bsn_ingress_port_group_id()
-        _type_len = reader.read("!L")[0]
+        _type_len, obj.value = reader.read_struct(_struct_LL)
         assert(_type_len == 206852)
-        obj.value = reader.read("!L")[0]
         return obj
 
     def __eq__(self, other):
@@ -925,6 +989,7 @@ class bsn_ingress_port_group_id(oxm):
 oxm.subtypes[206852] = bsn_ingress_port_group_id
 
 class bsn_ingress_port_group_id_masked(oxm):
+    __slots__ = ["value", "value_mask"]
     type_len = 207112
 
     def __init__(self, value=None, value_mask=None):
@@ -938,20 +1003,19 @@ class bsn_ingress_port_group_id_masked(oxm):
             self.value_mask = 0
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!L", self.type_len))
-        packed.append(struct.pack("!L", self.value))
-        packed.append(struct.pack("!L", self.value_mask))
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_LLL, buf, offset, self.type_len, self.value, self.value_mask)
+        return offset
+
+    def wire_length(self):
+        return 12
 
     @staticmethod
     def unpack(reader):
         obj = bsn_ingress_port_group_id_masked()
-        _type_len = reader.read("!L")[0]
+        _type_len, obj.value, obj.value_mask = reader.read_struct(_struct_LLL)
         assert(_type_len == 207112)
-        obj.value = reader.read("!L")[0]
-        obj.value_mask = reader.read("!L")[0]
         return obj
 
     def __eq__(self, other):
@@ -976,6 +1040,7 @@ class bsn_ingress_port_group_id_masked(oxm):
 oxm.subtypes[207112] = bsn_ingress_port_group_id_masked
 
 class bsn_l2_cache_hit(oxm):
+    __slots__ = ["value"]
     type_len = 205825
 
     def __init__(self, value=None):
@@ -985,18 +1050,19 @@ class bsn_l2_cache_hit(oxm):
             self.value = 0
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!L", self.type_len))
-        packed.append(struct.pack("!B", self.value))
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_LB, buf, offset, self.type_len, self.value)
+        return offset
+
+    def wire_length(self):
+        return 5
 
     @staticmethod
     def unpack(reader):
         obj = bsn_l2_cache_hit()
-        _type_len = reader.read("!L")[0]
+        _type_len, obj.value = reader.read_struct(_struct_LB)
         assert(_type_len == 205825)
-        obj.value = reader.read("!B")[0]
         return obj
 
     def __eq__(self, other):
@@ -1017,6 +1083,7 @@ class bsn_l2_cache_hit(oxm):
 oxm.subtypes[205825] = bsn_l2_cache_hit
 
 class bsn_l2_cache_hit_masked(oxm):
+    __slots__ = ["value", "value_mask"]
     type_len = 206082
 
     def __init__(self, value=None, value_mask=None):
@@ -1030,20 +1097,19 @@ class bsn_l2_cache_hit_masked(oxm):
             self.value_mask = 0
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!L", self.type_len))
-        packed.append(struct.pack("!B", self.value))
-        packed.append(struct.pack("!B", self.value_mask))
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_LBB, buf, offset, self.type_len, self.value, self.value_mask)
+        return offset
+
+    def wire_length(self):
+        return 6
 
     @staticmethod
     def unpack(reader):
         obj = bsn_l2_cache_hit_masked()
-        _type_len = reader.read("!L")[0]
+        _type_len, obj.value, obj.value_mask = reader.read_struct(_struct_LBB)
         assert(_type_len == 206082)
-        obj.value = reader.read("!B")[0]
-        obj.value_mask = reader.read("!B")[0]
         return obj
 
     def __eq__(self, other):
@@ -1068,6 +1134,7 @@ class bsn_l2_cache_hit_masked(oxm):
 oxm.subtypes[206082] = bsn_l2_cache_hit_masked
 
 class bsn_l3_dst_class_id(oxm):
+    __slots__ = ["value"]
     type_len = 199684
 
     def __init__(self, value=None):
@@ -1077,18 +1144,19 @@ class bsn_l3_dst_class_id(oxm):
             self.value = 0
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!L", self.type_len))
-        packed.append(struct.pack("!L", self.value))
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_LL, buf, offset, self.type_len, self.value)
+        return offset
+
+    def wire_length(self):
+        return 8
 
     @staticmethod
     def unpack(reader):
         obj = bsn_l3_dst_class_id()
-        _type_len = reader.read("!L")[0]
+        _type_len, obj.value = reader.read_struct(_struct_LL)
         assert(_type_len == 199684)
-        obj.value = reader.read("!L")[0]
         return obj
 
     def __eq__(self, other):
@@ -1109,6 +1177,7 @@ class bsn_l3_dst_class_id(oxm):
 oxm.subtypes[199684] = bsn_l3_dst_class_id
 
 class bsn_l3_dst_class_id_masked(oxm):
+    __slots__ = ["value", "value_mask"]
     type_len = 199944
 
     def __init__(self, value=None, value_mask=None):
@@ -1122,20 +1191,19 @@ class bsn_l3_dst_class_id_masked(oxm):
             self.value_mask = 0
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!L", self.type_len))
-        packed.append(struct.pack("!L", self.value))
-        packed.append(struct.pack("!L", self.value_mask))
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_LLL, buf, offset, self.type_len, self.value, self.value_mask)
+        return offset
+
+    def wire_length(self):
+        return 12
 
     @staticmethod
     def unpack(reader):
         obj = bsn_l3_dst_class_id_masked()
-        _type_len = reader.read("!L")[0]
+        _type_len, obj.value, obj.value_mask = reader.read_struct(_struct_LLL)
         assert(_type_len == 199944)
-        obj.value = reader.read("!L")[0]
-        obj.value_mask = reader.read("!L")[0]
         return obj
 
     def __eq__(self, other):
@@ -1160,6 +1228,7 @@ class bsn_l3_dst_class_id_masked(oxm):
 oxm.subtypes[199944] = bsn_l3_dst_class_id_masked
 
 class bsn_l3_interface_class_id(oxm):
+    __slots__ = ["value"]
     type_len = 198660
 
     def __init__(self, value=None):
@@ -1169,18 +1238,19 @@ class bsn_l3_interface_class_id(oxm):
             self.value = 0
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!L", self.type_len))
-        packed.append(struct.pack("!L", self.value))
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_LL, buf, offset, self.type_len, self.value)
+        return offset
+
+    def wire_length(self):
+        return 8
 
     @staticmethod
     def unpack(reader):
         obj = bsn_l3_interface_class_id()
-        _type_len = reader.read("!L")[0]
+        _type_len, obj.value = reader.read_struct(_struct_LL)
         assert(_type_len == 198660)
-        obj.value = reader.read("!L")[0]
         return obj
 
     def __eq__(self, other):
@@ -1201,6 +1271,7 @@ class bsn_l3_interface_class_id(oxm):
 oxm.subtypes[198660] = bsn_l3_interface_class_id
 
 class bsn_l3_interface_class_id_masked(oxm):
+    __slots__ = ["value", "value_mask"]
     type_len = 198920
 
     def __init__(self, value=None, value_mask=None):
@@ -1214,20 +1285,19 @@ class bsn_l3_interface_class_id_masked(oxm):
             self.value_mask = 0
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!L", self.type_len))
-        packed.append(struct.pack("!L", self.value))
-        packed.append(struct.pack("!L", self.value_mask))
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_LLL, buf, offset, self.type_len, self.value, self.value_mask)
+        return offset
+
+    def wire_length(self):
+        return 12
 
     @staticmethod
     def unpack(reader):
         obj = bsn_l3_interface_class_id_masked()
-        _type_len = reader.read("!L")[0]
+        _type_len, obj.value, obj.value_mask = reader.read_struct(_struct_LLL)
         assert(_type_len == 198920)
-        obj.value = reader.read("!L")[0]
-        obj.value_mask = reader.read("!L")[0]
         return obj
 
     def __eq__(self, other):
@@ -1252,6 +1322,7 @@ class bsn_l3_interface_class_id_masked(oxm):
 oxm.subtypes[198920] = bsn_l3_interface_class_id_masked
 
 class bsn_l3_src_class_id(oxm):
+    __slots__ = ["value"]
     type_len = 199172
 
     def __init__(self, value=None):
@@ -1261,18 +1332,19 @@ class bsn_l3_src_class_id(oxm):
             self.value = 0
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!L", self.type_len))
-        packed.append(struct.pack("!L", self.value))
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_LL, buf, offset, self.type_len, self.value)
+        return offset
+
+    def wire_length(self):
+        return 8
 
     @staticmethod
     def unpack(reader):
         obj = bsn_l3_src_class_id()
-        _type_len = reader.read("!L")[0]
+        _type_len, obj.value = reader.read_struct(_struct_LL)
         assert(_type_len == 199172)
-        obj.value = reader.read("!L")[0]
         return obj
 
     def __eq__(self, other):
@@ -1293,6 +1365,7 @@ class bsn_l3_src_class_id(oxm):
 oxm.subtypes[199172] = bsn_l3_src_class_id
 
 class bsn_l3_src_class_id_masked(oxm):
+    __slots__ = ["value", "value_mask"]
     type_len = 199432
 
     def __init__(self, value=None, value_mask=None):
@@ -1306,20 +1379,19 @@ class bsn_l3_src_class_id_masked(oxm):
             self.value_mask = 0
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!L", self.type_len))
-        packed.append(struct.pack("!L", self.value))
-        packed.append(struct.pack("!L", self.value_mask))
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_LLL, buf, offset, self.type_len, self.value, self.value_mask)
+        return offset
+
+    def wire_length(self):
+        return 12
 
     @staticmethod
     def unpack(reader):
         obj = bsn_l3_src_class_id_masked()
-        _type_len = reader.read("!L")[0]
+        _type_len, obj.value, obj.value_mask = reader.read_struct(_struct_LLL)
         assert(_type_len == 199432)
-        obj.value = reader.read("!L")[0]
-        obj.value_mask = reader.read("!L")[0]
         return obj
 
     def __eq__(self, other):
@@ -1344,6 +1416,7 @@ class bsn_l3_src_class_id_masked(oxm):
 oxm.subtypes[199432] = bsn_l3_src_class_id_masked
 
 class bsn_lag_id(oxm):
+    __slots__ = ["value"]
     type_len = 197124
 
     def __init__(self, value=None):
@@ -1353,18 +1426,19 @@ class bsn_lag_id(oxm):
             self.value = 0
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!L", self.type_len))
-        packed.append(struct.pack("!L", self.value))
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_LL, buf, offset, self.type_len, self.value)
+        return offset
+
+    def wire_length(self):
+        return 8
 
     @staticmethod
     def unpack(reader):
         obj = bsn_lag_id()
-        _type_len = reader.read("!L")[0]
+        _type_len, obj.value = reader.read_struct(_struct_LL)
         assert(_type_len == 197124)
-        obj.value = reader.read("!L")[0]
         return obj
 
     def __eq__(self, other):
@@ -1385,6 +1459,7 @@ class bsn_lag_id(oxm):
 oxm.subtypes[197124] = bsn_lag_id
 
 class bsn_lag_id_masked(oxm):
+    __slots__ = ["value", "value_mask"]
     type_len = 197384
 
     def __init__(self, value=None, value_mask=None):
@@ -1398,20 +1473,19 @@ class bsn_lag_id_masked(oxm):
             self.value_mask = 0
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!L", self.type_len))
-        packed.append(struct.pack("!L", self.value))
-        packed.append(struct.pack("!L", self.value_mask))
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_LLL, buf, offset, self.type_len, self.value, self.value_mask)
+        return offset
+
+    def wire_length(self):
+        return 12
 
     @staticmethod
     def unpack(reader):
         obj = bsn_lag_id_masked()
-        _type_len = reader.read("!L")[0]
+        _type_len, obj.value, obj.value_mask = reader.read_struct(_struct_LLL)
         assert(_type_len == 197384)
-        obj.value = reader.read("!L")[0]
-        obj.value_mask = reader.read("!L")[0]
         return obj
 
     def __eq__(self, other):
@@ -1436,6 +1510,7 @@ class bsn_lag_id_masked(oxm):
 oxm.subtypes[197384] = bsn_lag_id_masked
 
 class bsn_tcp_flags(oxm):
+    __slots__ = ["value"]
     type_len = 204802
 
     def __init__(self, value=None):
@@ -1445,18 +1520,19 @@ class bsn_tcp_flags(oxm):
             self.value = 0
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!L", self.type_len))
-        packed.append(struct.pack("!H", self.value))
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_LH, buf, offset, self.type_len, self.value)
+        return offset
+
+    def wire_length(self):
+        return 6
 
     @staticmethod
     def unpack(reader):
         obj = bsn_tcp_flags()
-        _type_len = reader.read("!L")[0]
+        _type_len, obj.value = reader.read_struct(_struct_LH)
         assert(_type_len == 204802)
-        obj.value = reader.read("!H")[0]
         return obj
 
     def __eq__(self, other):
@@ -1477,6 +1553,7 @@ class bsn_tcp_flags(oxm):
 oxm.subtypes[204802] = bsn_tcp_flags
 
 class bsn_tcp_flags_masked(oxm):
+    __slots__ = ["value", "value_mask"]
     type_len = 205060
 
     def __init__(self, value=None, value_mask=None):
@@ -1490,20 +1567,19 @@ class bsn_tcp_flags_masked(oxm):
             self.value_mask = 0
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!L", self.type_len))
-        packed.append(struct.pack("!H", self.value))
-        packed.append(struct.pack("!H", self.value_mask))
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_LHH, buf, offset, self.type_len, self.value, self.value_mask)
+        return offset
+
+    def wire_length(self):
+        return 8
 
     @staticmethod
     def unpack(reader):
         obj = bsn_tcp_flags_masked()
-        _type_len = reader.read("!L")[0]
+        _type_len, obj.value, obj.value_mask = reader.read_struct(_struct_LHH)
         assert(_type_len == 205060)
-        obj.value = reader.read("!H")[0]
-        obj.value_mask = reader.read("!H")[0]
         return obj
 
     def __eq__(self, other):
@@ -1528,6 +1604,7 @@ class bsn_tcp_flags_masked(oxm):
 oxm.subtypes[205060] = bsn_tcp_flags_masked
 
 class bsn_udf0(oxm):
+    __slots__ = ["value"]
     type_len = 200708
 
     def __init__(self, value=None):
@@ -1537,18 +1614,19 @@ class bsn_udf0(oxm):
             self.value = 0
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!L", self.type_len))
-        packed.append(struct.pack("!L", self.value))
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_LL, buf, offset, self.type_len, self.value)
+        return offset
+
+    def wire_length(self):
+        return 8
 
     @staticmethod
     def unpack(reader):
         obj = bsn_udf0()
-        _type_len = reader.read("!L")[0]
+        _type_len, obj.value = reader.read_struct(_struct_LL)
         assert(_type_len == 200708)
-        obj.value = reader.read("!L")[0]
         return obj
 
     def __eq__(self, other):
@@ -1569,6 +1647,7 @@ class bsn_udf0(oxm):
 oxm.subtypes[200708] = bsn_udf0
 
 class bsn_udf0_masked(oxm):
+    __slots__ = ["value", "value_mask"]
     type_len = 200968
 
     def __init__(self, value=None, value_mask=None):
@@ -1582,20 +1661,19 @@ class bsn_udf0_masked(oxm):
             self.value_mask = 0
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!L", self.type_len))
-        packed.append(struct.pack("!L", self.value))
-        packed.append(struct.pack("!L", self.value_mask))
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_LLL, buf, offset, self.type_len, self.value, self.value_mask)
+        return offset
+
+    def wire_length(self):
+        return 12
 
     @staticmethod
     def unpack(reader):
         obj = bsn_udf0_masked()
-        _type_len = reader.read("!L")[0]
+        _type_len, obj.value, obj.value_mask = reader.read_struct(_struct_LLL)
         assert(_type_len == 200968)
-        obj.value = reader.read("!L")[0]
-        obj.value_mask = reader.read("!L")[0]
         return obj
 
     def __eq__(self, other):
@@ -1620,6 +1698,7 @@ class bsn_udf0_masked(oxm):
 oxm.subtypes[200968] = bsn_udf0_masked
 
 class bsn_udf1(oxm):
+    __slots__ = ["value"]
     type_len = 201220
 
     def __init__(self, value=None):
@@ -1629,18 +1708,19 @@ class bsn_udf1(oxm):
             self.value = 0
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!L", self.type_len))
-        packed.append(struct.pack("!L", self.value))
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_LL, buf, offset, self.type_len, self.value)
+        return offset
+
+    def wire_length(self):
+        return 8
 
     @staticmethod
     def unpack(reader):
         obj = bsn_udf1()
-        _type_len = reader.read("!L")[0]
+        _type_len, obj.value = reader.read_struct(_struct_LL)
         assert(_type_len == 201220)
-        obj.value = reader.read("!L")[0]
         return obj
 
     def __eq__(self, other):
@@ -1661,6 +1741,7 @@ class bsn_udf1(oxm):
 oxm.subtypes[201220] = bsn_udf1
 
 class bsn_udf1_masked(oxm):
+    __slots__ = ["value", "value_mask"]
     type_len = 201480
 
     def __init__(self, value=None, value_mask=None):
@@ -1674,20 +1755,19 @@ class bsn_udf1_masked(oxm):
             self.value_mask = 0
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!L", self.type_len))
-        packed.append(struct.pack("!L", self.value))
-        packed.append(struct.pack("!L", self.value_mask))
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_LLL, buf, offset, self.type_len, self.value, self.value_mask)
+        return offset
+
+    def wire_length(self):
+        return 12
 
     @staticmethod
     def unpack(reader):
         obj = bsn_udf1_masked()
-        _type_len = reader.read("!L")[0]
+        _type_len, obj.value, obj.value_mask = reader.read_struct(_struct_LLL)
         assert(_type_len == 201480)
-        obj.value = reader.read("!L")[0]
-        obj.value_mask = reader.read("!L")[0]
         return obj
 
     def __eq__(self, other):
@@ -1712,6 +1792,7 @@ class bsn_udf1_masked(oxm):
 oxm.subtypes[201480] = bsn_udf1_masked
 
 class bsn_udf2(oxm):
+    __slots__ = ["value"]
     type_len = 201732
 
     def __init__(self, value=None):
@@ -1721,18 +1802,19 @@ class bsn_udf2(oxm):
             self.value = 0
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!L", self.type_len))
-        packed.append(struct.pack("!L", self.value))
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_LL, buf, offset, self.type_len, self.value)
+        return offset
+
+    def wire_length(self):
+        return 8
 
     @staticmethod
     def unpack(reader):
         obj = bsn_udf2()
-        _type_len = reader.read("!L")[0]
+        _type_len, obj.value = reader.read_struct(_struct_LL)
         assert(_type_len == 201732)
-        obj.value = reader.read("!L")[0]
         return obj
 
     def __eq__(self, other):
@@ -1753,6 +1835,7 @@ class bsn_udf2(oxm):
 oxm.subtypes[201732] = bsn_udf2
 
 class bsn_udf2_masked(oxm):
+    __slots__ = ["value", "value_mask"]
     type_len = 201992
 
     def __init__(self, value=None, value_mask=None):
@@ -1766,20 +1849,19 @@ class bsn_udf2_masked(oxm):
             self.value_mask = 0
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!L", self.type_len))
-        packed.append(struct.pack("!L", self.value))
-        packed.append(struct.pack("!L", self.value_mask))
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_LLL, buf, offset, self.type_len, self.value, self.value_mask)
+        return offset
+
+    def wire_length(self):
+        return 12
 
     @staticmethod
     def unpack(reader):
         obj = bsn_udf2_masked()
-        _type_len = reader.read("!L")[0]
+        _type_len, obj.value, obj.value_mask = reader.read_struct(_struct_LLL)
         assert(_type_len == 201992)
-        obj.value = reader.read("!L")[0]
-        obj.value_mask = reader.read("!L")[0]
         return obj
 
     def __eq__(self, other):
@@ -1804,6 +1886,7 @@ class bsn_udf2_masked(oxm):
 oxm.subtypes[201992] = bsn_udf2_masked
 
 class bsn_udf3(oxm):
+    __slots__ = ["value"]
     type_len = 202244
 
     def __init__(self, value=None):
@@ -1813,18 +1896,19 @@ class bsn_udf3(oxm):
             self.value = 0
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!L", self.type_len))
-        packed.append(struct.pack("!L", self.value))
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_LL, buf, offset, self.type_len, self.value)
+        return offset
+
+    def wire_length(self):
+        return 8
 
     @staticmethod
     def unpack(reader):
         obj = bsn_udf3()
-        _type_len = reader.read("!L")[0]
+        _type_len, obj.value = reader.read_struct(_struct_LL)
         assert(_type_len == 202244)
-        obj.value = reader.read("!L")[0]
         return obj
 
     def __eq__(self, other):
@@ -1845,6 +1929,7 @@ class bsn_udf3(oxm):
 oxm.subtypes[202244] = bsn_udf3
 
 class bsn_udf3_masked(oxm):
+    __slots__ = ["value", "value_mask"]
     type_len = 202504
 
     def __init__(self, value=None, value_mask=None):
@@ -1858,20 +1943,19 @@ class bsn_udf3_masked(oxm):
             self.value_mask = 0
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!L", self.type_len))
-        packed.append(struct.pack("!L", self.value))
-        packed.append(struct.pack("!L", self.value_mask))
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_LLL, buf, offset, self.type_len, self.value, self.value_mask)
+        return offset
+
+    def wire_length(self):
+        return 12
 
     @staticmethod
     def unpack(reader):
         obj = bsn_udf3_masked()
-        _type_len = reader.read("!L")[0]
+        _type_len, obj.value, obj.value_mask = reader.read_struct(_struct_LLL)
         assert(_type_len == 202504)
-        obj.value = reader.read("!L")[0]
-        obj.value_mask = reader.read("!L")[0]
         return obj
 
     def __eq__(self, other):
@@ -1896,6 +1980,7 @@ class bsn_udf3_masked(oxm):
 oxm.subtypes[202504] = bsn_udf3_masked
 
 class bsn_udf4(oxm):
+    __slots__ = ["value"]
     type_len = 202756
 
     def __init__(self, value=None):
@@ -1905,18 +1990,19 @@ class bsn_udf4(oxm):
             self.value = 0
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!L", self.type_len))
-        packed.append(struct.pack("!L", self.value))
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_LL, buf, offset, self.type_len, self.value)
+        return offset
+
+    def wire_length(self):
+        return 8
 
     @staticmethod
     def unpack(reader):
         obj = bsn_udf4()
-        _type_len = reader.read("!L")[0]
+        _type_len, obj.value = reader.read_struct(_struct_LL)
         assert(_type_len == 202756)
-        obj.value = reader.read("!L")[0]
         return obj
 
     def __eq__(self, other):
@@ -1937,6 +2023,7 @@ class bsn_udf4(oxm):
 oxm.subtypes[202756] = bsn_udf4
 
 class bsn_udf4_masked(oxm):
+    __slots__ = ["value", "value_mask"]
     type_len = 203016
 
     def __init__(self, value=None, value_mask=None):
@@ -1950,20 +2037,19 @@ class bsn_udf4_masked(oxm):
             self.value_mask = 0
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!L", self.type_len))
-        packed.append(struct.pack("!L", self.value))
-        packed.append(struct.pack("!L", self.value_mask))
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_LLL, buf, offset, self.type_len, self.value, self.value_mask)
+        return offset
+
+    def wire_length(self):
+        return 12
 
     @staticmethod
     def unpack(reader):
         obj = bsn_udf4_masked()
-        _type_len = reader.read("!L")[0]
+        _type_len, obj.value, obj.value_mask = reader.read_struct(_struct_LLL)
         assert(_type_len == 203016)
-        obj.value = reader.read("!L")[0]
-        obj.value_mask = reader.read("!L")[0]
         return obj
 
     def __eq__(self, other):
@@ -1988,6 +2074,7 @@ class bsn_udf4_masked(oxm):
 oxm.subtypes[203016] = bsn_udf4_masked
 
 class bsn_udf5(oxm):
+    __slots__ = ["value"]
     type_len = 203268
 
     def __init__(self, value=None):
@@ -1997,18 +2084,19 @@ class bsn_udf5(oxm):
             self.value = 0
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!L", self.type_len))
-        packed.append(struct.pack("!L", self.value))
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_LL, buf, offset, self.type_len, self.value)
+        return offset
+
+    def wire_length(self):
+        return 8
 
     @staticmethod
     def unpack(reader):
         obj = bsn_udf5()
-        _type_len = reader.read("!L")[0]
+        _type_len, obj.value = reader.read_struct(_struct_LL)
         assert(_type_len == 203268)
-        obj.value = reader.read("!L")[0]
         return obj
 
     def __eq__(self, other):
@@ -2029,6 +2117,7 @@ class bsn_udf5(oxm):
 oxm.subtypes[203268] = bsn_udf5
 
 class bsn_udf5_masked(oxm):
+    __slots__ = ["value", "value_mask"]
     type_len = 203528
 
     def __init__(self, value=None, value_mask=None):
@@ -2042,20 +2131,19 @@ class bsn_udf5_masked(oxm):
             self.value_mask = 0
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!L", self.type_len))
-        packed.append(struct.pack("!L", self.value))
-        packed.append(struct.pack("!L", self.value_mask))
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_LLL, buf, offset, self.type_len, self.value, self.value_mask)
+        return offset
+
+    def wire_length(self):
+        return 12
 
     @staticmethod
     def unpack(reader):
         obj = bsn_udf5_masked()
-        _type_len = reader.read("!L")[0]
+        _type_len, obj.value, obj.value_mask = reader.read_struct(_struct_LLL)
         assert(_type_len == 203528)
-        obj.value = reader.read("!L")[0]
-        obj.value_mask = reader.read("!L")[0]
         return obj
 
     def __eq__(self, other):
@@ -2080,6 +2168,7 @@ class bsn_udf5_masked(oxm):
 oxm.subtypes[203528] = bsn_udf5_masked
 
 class bsn_udf6(oxm):
+    __slots__ = ["value"]
     type_len = 203780
 
     def __init__(self, value=None):
@@ -2089,18 +2178,19 @@ class bsn_udf6(oxm):
             self.value = 0
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!L", self.type_len))
-        packed.append(struct.pack("!L", self.value))
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_LL, buf, offset, self.type_len, self.value)
+        return offset
+
+    def wire_length(self):
+        return 8
 
     @staticmethod
     def unpack(reader):
         obj = bsn_udf6()
-        _type_len = reader.read("!L")[0]
+        _type_len, obj.value = reader.read_struct(_struct_LL)
         assert(_type_len == 203780)
-        obj.value = reader.read("!L")[0]
         return obj
 
     def __eq__(self, other):
@@ -2121,6 +2211,7 @@ class bsn_udf6(oxm):
 oxm.subtypes[203780] = bsn_udf6
 
 class bsn_udf6_masked(oxm):
+    __slots__ = ["value", "value_mask"]
     type_len = 204040
 
     def __init__(self, value=None, value_mask=None):
@@ -2134,20 +2225,19 @@ class bsn_udf6_masked(oxm):
             self.value_mask = 0
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!L", self.type_len))
-        packed.append(struct.pack("!L", self.value))
-        packed.append(struct.pack("!L", self.value_mask))
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_LLL, buf, offset, self.type_len, self.value, self.value_mask)
+        return offset
+
+    def wire_length(self):
+        return 12
 
     @staticmethod
     def unpack(reader):
         obj = bsn_udf6_masked()
-        _type_len = reader.read("!L")[0]
+        _type_len, obj.value, obj.value_mask = reader.read_struct(_struct_LLL)
         assert(_type_len == 204040)
-        obj.value = reader.read("!L")[0]
-        obj.value_mask = reader.read("!L")[0]
         return obj
 
     def __eq__(self, other):
@@ -2172,6 +2262,7 @@ class bsn_udf6_masked(oxm):
 oxm.subtypes[204040] = bsn_udf6_masked
 
 class bsn_udf7(oxm):
+    __slots__ = ["value"]
     type_len = 204292
 
     def __init__(self, value=None):
@@ -2181,18 +2272,19 @@ class bsn_udf7(oxm):
             self.value = 0
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!L", self.type_len))
-        packed.append(struct.pack("!L", self.value))
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_LL, buf, offset, self.type_len, self.value)
+        return offset
+
+    def wire_length(self):
+        return 8
 
     @staticmethod
     def unpack(reader):
         obj = bsn_udf7()
-        _type_len = reader.read("!L")[0]
+        _type_len, obj.value = reader.read_struct(_struct_LL)
         assert(_type_len == 204292)
-        obj.value = reader.read("!L")[0]
         return obj
 
     def __eq__(self, other):
@@ -2213,6 +2305,7 @@ class bsn_udf7(oxm):
 oxm.subtypes[204292] = bsn_udf7
 
 class bsn_udf7_masked(oxm):
+    __slots__ = ["value", "value_mask"]
     type_len = 204552
 
     def __init__(self, value=None, value_mask=None):
@@ -2226,20 +2319,19 @@ class bsn_udf7_masked(oxm):
             self.value_mask = 0
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!L", self.type_len))
-        packed.append(struct.pack("!L", self.value))
-        packed.append(struct.pack("!L", self.value_mask))
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_LLL, buf, offset, self.type_len, self.value, self.value_mask)
+        return offset
+
+    def wire_length(self):
+        return 12
 
     @staticmethod
     def unpack(reader):
         obj = bsn_udf7_masked()
-        _type_len = reader.read("!L")[0]
+        _type_len, obj.value, obj.value_mask = reader.read_struct(_struct_LLL)
         assert(_type_len == 204552)
-        obj.value = reader.read("!L")[0]
-        obj.value_mask = reader.read("!L")[0]
         return obj
 
     def __eq__(self, other):
@@ -2264,6 +2356,7 @@ class bsn_udf7_masked(oxm):
 oxm.subtypes[204552] = bsn_udf7_masked
 
 class bsn_vlan_xlate_port_group_id(oxm):
+    __slots__ = ["value"]
     type_len = 205316
 
     def __init__(self, value=None):
@@ -2273,18 +2366,19 @@ class bsn_vlan_xlate_port_group_id(oxm):
             self.value = 0
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!L", self.type_len))
-        packed.append(struct.pack("!L", self.value))
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_LL, buf, offset, self.type_len, self.value)
+        return offset
+
+    def wire_length(self):
+        return 8
 
     @staticmethod
     def unpack(reader):
         obj = bsn_vlan_xlate_port_group_id()
-        _type_len = reader.read("!L")[0]
+        _type_len, obj.value = reader.read_struct(_struct_LL)
         assert(_type_len == 205316)
-        obj.value = reader.read("!L")[0]
         return obj
 
     def __eq__(self, other):
@@ -2305,6 +2399,7 @@ class bsn_vlan_xlate_port_group_id(oxm):
 oxm.subtypes[205316] = bsn_vlan_xlate_port_group_id
 
 class bsn_vlan_xlate_port_group_id_masked(oxm):
+    __slots__ = ["value", "value_mask"]
     type_len = 205576
 
     def __init__(self, value=None, value_mask=None):
@@ -2318,20 +2413,19 @@ class bsn_vlan_xlate_port_group_id_masked(oxm):
             self.value_mask = 0
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!L", self.type_len))
-        packed.append(struct.pack("!L", self.value))
-        packed.append(struct.pack("!L", self.value_mask))
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_LLL, buf, offset, self.type_len, self.value, self.value_mask)
+        return offset
+
+    def wire_length(self):
+        return 12
 
     @staticmethod
     def unpack(reader):
         obj = bsn_vlan_xlate_port_group_id_masked()
-        _type_len = reader.read("!L")[0]
+        _type_len, obj.value, obj.value_mask = reader.read_struct(_struct_LLL)
         assert(_type_len == 205576)
-        obj.value = reader.read("!L")[0]
-        obj.value_mask = reader.read("!L")[0]
         return obj
 
     def __eq__(self, other):
@@ -2356,6 +2450,7 @@ class bsn_vlan_xlate_port_group_id_masked(oxm):
 oxm.subtypes[205576] = bsn_vlan_xlate_port_group_id_masked
 
 class bsn_vrf(oxm):
+    __slots__ = ["value"]
     type_len = 197636
 
     def __init__(self, value=None):
@@ -2365,18 +2460,19 @@ class bsn_vrf(oxm):
             self.value = 0
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!L", self.type_len))
-        packed.append(struct.pack("!L", self.value))
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_LL, buf, offset, self.type_len, self.value)
+        return offset
+
+    def wire_length(self):
+        return 8
 
     @staticmethod
     def unpack(reader):
         obj = bsn_vrf()
-        _type_len = reader.read("!L")[0]
+        _type_len, obj.value = reader.read_struct(_struct_LL)
         assert(_type_len == 197636)
-        obj.value = reader.read("!L")[0]
         return obj
 
     def __eq__(self, other):
@@ -2397,6 +2493,7 @@ class bsn_vrf(oxm):
 oxm.subtypes[197636] = bsn_vrf
 
 class bsn_vrf_masked(oxm):
+    __slots__ = ["value", "value_mask"]
     type_len = 197896
 
     def __init__(self, value=None, value_mask=None):
@@ -2410,20 +2507,19 @@ class bsn_vrf_masked(oxm):
             self.value_mask = 0
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!L", self.type_len))
-        packed.append(struct.pack("!L", self.value))
-        packed.append(struct.pack("!L", self.value_mask))
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_LLL, buf, offset, self.type_len, self.value, self.value_mask)
+        return offset
+
+    def wire_length(self):
+        return 12
 
     @staticmethod
     def unpack(reader):
         obj = bsn_vrf_masked()
-        _type_len = reader.read("!L")[0]
+        _type_len, obj.value, obj.value_mask = reader.read_struct(_struct_LLL)
         assert(_type_len == 197896)
-        obj.value = reader.read("!L")[0]
-        obj.value_mask = reader.read("!L")[0]
         return obj
 
     def __eq__(self, other):
@@ -2448,6 +2544,7 @@ class bsn_vrf_masked(oxm):
 oxm.subtypes[197896] = bsn_vrf_masked
 
 class eth_dst(oxm):
+    __slots__ = ["value"]
     type_len = 2147485190
 
     def __init__(self, value=None):
@@ -2457,11 +2554,14 @@ class eth_dst(oxm):
             self.value = [0,0,0,0,0,0]
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!L", self.type_len))
-        packed.append(struct.pack("!6B", *self.value))
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_L, buf, offset, self.type_len)
+        offset = loxi.generic_util.pack_struct_into(_struct_6B, buf, offset, *self.value)
+        return offset
+
+    def wire_length(self):
+        return 10
 
     @staticmethod
     def unpack(reader):
@@ -2489,6 +2589,7 @@ class eth_dst(oxm):
 oxm.subtypes[2147485190] = eth_dst
 
 class eth_dst_masked(oxm):
+    __slots__ = ["value", "value_mask"]
     type_len = 2147485452
 
     def __init__(self, value=None, value_mask=None):
@@ -2502,12 +2603,15 @@ class eth_dst_masked(oxm):
             self.value_mask = [0,0,0,0,0,0]
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!L", self.type_len))
-        packed.append(struct.pack("!6B", *self.value))
-        packed.append(struct.pack("!6B", *self.value_mask))
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_L, buf, offset, self.type_len)
+        offset = loxi.generic_util.pack_struct_into(_struct_6B, buf, offset, *self.value)
+        offset = loxi.generic_util.pack_struct_into(_struct_6B, buf, offset, *self.value_mask)
+        return offset
+
+    def wire_length(self):
+        return 16
 
     @staticmethod
     def unpack(reader):
@@ -2540,6 +2644,7 @@ class eth_dst_masked(oxm):
 oxm.subtypes[2147485452] = eth_dst_masked
 
 class eth_src(oxm):
+    __slots__ = ["value"]
     type_len = 2147485702
 
     def __init__(self, value=None):
@@ -2549,11 +2654,14 @@ class eth_src(oxm):
             self.value = [0,0,0,0,0,0]
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!L", self.type_len))
-        packed.append(struct.pack("!6B", *self.value))
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_L, buf, offset, self.type_len)
+        offset = loxi.generic_util.pack_struct_into(_struct_6B, buf, offset, *self.value)
+        return offset
+
+    def wire_length(self):
+        return 10
 
     @staticmethod
     def unpack(reader):
@@ -2581,6 +2689,7 @@ class eth_src(oxm):
 oxm.subtypes[2147485702] = eth_src
 
 class eth_src_masked(oxm):
+    __slots__ = ["value", "value_mask"]
     type_len = 2147485964
 
     def __init__(self, value=None, value_mask=None):
@@ -2594,12 +2703,15 @@ class eth_src_masked(oxm):
             self.value_mask = [0,0,0,0,0,0]
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!L", self.type_len))
-        packed.append(struct.pack("!6B", *self.value))
-        packed.append(struct.pack("!6B", *self.value_mask))
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_L, buf, offset, self.type_len)
+        offset = loxi.generic_util.pack_struct_into(_struct_6B, buf, offset, *self.value)
+        offset = loxi.generic_util.pack_struct_into(_struct_6B, buf, offset, *self.value_mask)
+        return offset
+
+    def wire_length(self):
+        return 16
 
     @staticmethod
     def unpack(reader):
@@ -2632,6 +2744,7 @@ class eth_src_masked(oxm):
 oxm.subtypes[2147485964] = eth_src_masked
 
 class eth_type(oxm):
+    __slots__ = ["value"]
     type_len = 2147486210
 
     def __init__(self, value=None):
@@ -2641,18 +2754,19 @@ class eth_type(oxm):
             self.value = 0
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!L", self.type_len))
-        packed.append(struct.pack("!H", self.value))
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_LH, buf, offset, self.type_len, self.value)
+        return offset
+
+    def wire_length(self):
+        return 6
 
     @staticmethod
     def unpack(reader):
         obj = eth_type()
-        _type_len = reader.read("!L")[0]
+        _type_len, obj.value = reader.read_struct(_struct_LH)
         assert(_type_len == 2147486210)
-        obj.value = reader.read("!H")[0]
         return obj
 
     def __eq__(self, other):
@@ -2673,6 +2787,7 @@ class eth_type(oxm):
 oxm.subtypes[2147486210] = eth_type
 
 class eth_type_masked(oxm):
+    __slots__ = ["value", "value_mask"]
     type_len = 2147486468
 
     def __init__(self, value=None, value_mask=None):
@@ -2686,20 +2801,19 @@ class eth_type_masked(oxm):
             self.value_mask = 0
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!L", self.type_len))
-        packed.append(struct.pack("!H", self.value))
-        packed.append(struct.pack("!H", self.value_mask))
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_LHH, buf, offset, self.type_len, self.value, self.value_mask)
+        return offset
+
+    def wire_length(self):
+        return 8
 
     @staticmethod
     def unpack(reader):
         obj = eth_type_masked()
-        _type_len = reader.read("!L")[0]
+        _type_len, obj.value, obj.value_mask = reader.read_struct(_struct_LHH)
         assert(_type_len == 2147486468)
-        obj.value = reader.read("!H")[0]
-        obj.value_mask = reader.read("!H")[0]
         return obj
 
     def __eq__(self, other):
@@ -2724,6 +2838,7 @@ class eth_type_masked(oxm):
 oxm.subtypes[2147486468] = eth_type_masked
 
 class icmpv4_code(oxm):
+    __slots__ = ["value"]
     type_len = 2147493889
 
     def __init__(self, value=None):
@@ -2733,18 +2848,19 @@ class icmpv4_code(oxm):
             self.value = 0
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!L", self.type_len))
-        packed.append(struct.pack("!B", self.value))
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_LB, buf, offset, self.type_len, self.value)
+        return offset
+
+    def wire_length(self):
+        return 5
 
     @staticmethod
     def unpack(reader):
         obj = icmpv4_code()
-        _type_len = reader.read("!L")[0]
+        _type_len, obj.value = reader.read_struct(_struct_LB)
         assert(_type_len == 2147493889)
-        obj.value = reader.read("!B")[0]
         return obj
 
     def __eq__(self, other):
@@ -2765,6 +2881,7 @@ class icmpv4_code(oxm):
 oxm.subtypes[2147493889] = icmpv4_code
 
 class icmpv4_code_masked(oxm):
+    __slots__ = ["value", "value_mask"]
     type_len = 2147494146
 
     def __init__(self, value=None, value_mask=None):
@@ -2778,20 +2895,19 @@ class icmpv4_code_masked(oxm):
             self.value_mask = 0
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!L", self.type_len))
-        packed.append(struct.pack("!B", self.value))
-        packed.append(struct.pack("!B", self.value_mask))
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_LBB, buf, offset, self.type_len, self.value, self.value_mask)
+        return offset
+
+    def wire_length(self):
+        return 6
 
     @staticmethod
     def unpack(reader):
         obj = icmpv4_code_masked()
-        _type_len = reader.read("!L")[0]
+        _type_len, obj.value, obj.value_mask = reader.read_struct(_struct_LBB)
         assert(_type_len == 2147494146)
-        obj.value = reader.read("!B")[0]
-        obj.value_mask = reader.read("!B")[0]
         return obj
 
     def __eq__(self, other):
@@ -2816,6 +2932,7 @@ class icmpv4_code_masked(oxm):
 oxm.subtypes[2147494146] = icmpv4_code_masked
 
 class icmpv4_type(oxm):
+    __slots__ = ["value"]
     type_len = 2147493377
 
     def __init__(self, value=None):
@@ -2825,18 +2942,19 @@ class icmpv4_type(oxm):
             self.value = 0
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!L", self.type_len))
-        packed.append(struct.pack("!B", self.value))
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_LB, buf, offset, self.type_len, self.value)
+        return offset
+
+    def wire_length(self):
+        return 5
 
     @staticmethod
     def unpack(reader):
         obj = icmpv4_type()
-        _type_len = reader.read("!L")[0]
+        _type_len, obj.value = reader.read_struct(_struct_LB)
         assert(_type_len == 2147493377)
-        obj.value = reader.read("!B")[0]
         return obj
 
     def __eq__(self, other):
@@ -2857,6 +2975,7 @@ class icmpv4_type(oxm):
 oxm.subtypes[2147493377] = icmpv4_type
 
 class icmpv4_type_masked(oxm):
+    __slots__ = ["value", "value_mask"]
     type_len = 2147493634
 
     def __init__(self, value=None, value_mask=None):
@@ -2870,20 +2989,19 @@ class icmpv4_type_masked(oxm):
             self.value_mask = 0
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!L", self.type_len))
-        packed.append(struct.pack("!B", self.value))
-        packed.append(struct.pack("!B", self.value_mask))
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_LBB, buf, offset, self.type_len, self.value, self.value_mask)
+        return offset
+
+    def wire_length(self):
+        return 6
 
     @staticmethod
     def unpack(reader):
         obj = icmpv4_type_masked()
-        _type_len = reader.read("!L")[0]
+        _type_len, obj.value, obj.value_mask = reader.read_struct(_struct_LBB)
         assert(_type_len == 2147493634)
-        obj.value = reader.read("!B")[0]
-        obj.value_mask = reader.read("!B")[0]
         return obj
 
     def __eq__(self, other):
@@ -2908,6 +3026,7 @@ class icmpv4_type_masked(oxm):
 oxm.subtypes[2147493634] = icmpv4_type_masked
 
 class icmpv6_code(oxm):
+    __slots__ = ["value"]
     type_len = 2147499009
 
     def __init__(self, value=None):
@@ -2917,18 +3036,19 @@ class icmpv6_code(oxm):
             self.value = 0
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!L", self.type_len))
-        packed.append(struct.pack("!B", self.value))
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_LB, buf, offset, self.type_len, self.value)
+        return offset
+
+    def wire_length(self):
+        return 5
 
     @staticmethod
     def unpack(reader):
         obj = icmpv6_code()
-        _type_len = reader.read("!L")[0]
+        _type_len, obj.value = reader.read_struct(_struct_LB)
         assert(_type_len == 2147499009)
-        obj.value = reader.read("!B")[0]
         return obj
 
     def __eq__(self, other):
@@ -2949,6 +3069,7 @@ class icmpv6_code(oxm):
 oxm.subtypes[2147499009] = icmpv6_code
 
 class icmpv6_code_masked(oxm):
+    __slots__ = ["value", "value_mask"]
     type_len = 2147499266
 
     def __init__(self, value=None, value_mask=None):
@@ -2962,20 +3083,19 @@ class icmpv6_code_masked(oxm):
             self.value_mask = 0
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!L", self.type_len))
-        packed.append(struct.pack("!B", self.value))
-        packed.append(struct.pack("!B", self.value_mask))
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_LBB, buf, offset, self.type_len, self.value, self.value_mask)
+        return offset
+
+    def wire_length(self):
+        return 6
 
     @staticmethod
     def unpack(reader):
         obj = icmpv6_code_masked()
-        _type_len = reader.read("!L")[0]
+        _type_len, obj.value, obj.value_mask = reader.read_struct(_struct_LBB)
         assert(_type_len == 2147499266)
-        obj.value = reader.read("!B")[0]
-        obj.value_mask = reader.read("!B")[0]
         return obj
 
     def __eq__(self, other):
@@ -3000,6 +3120,7 @@ class icmpv6_code_masked(oxm):
 oxm.subtypes[2147499266] = icmpv6_code_masked
 
 class icmpv6_type(oxm):
+    __slots__ = ["value"]
     type_len = 2147498497
 
     def __init__(self, value=None):
@@ -3009,18 +3130,19 @@ class icmpv6_type(oxm):
             self.value = 0
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!L", self.type_len))
-        packed.append(struct.pack("!B", self.value))
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_LB, buf, offset, self.type_len, self.value)
+        return offset
+
+    def wire_length(self):
+        return 5
 
     @staticmethod
     def unpack(reader):
         obj = icmpv6_type()
-        _type_len = reader.read("!L")[0]
+        _type_len, obj.value = reader.read_struct(_struct_LB)
         assert(_type_len == 2147498497)
-        obj.value = reader.read("!B")[0]
         return obj
 
     def __eq__(self, other):
@@ -3041,6 +3163,7 @@ class icmpv6_type(oxm):
 oxm.subtypes[2147498497] = icmpv6_type
 
 class icmpv6_type_masked(oxm):
+    __slots__ = ["value", "value_mask"]
     type_len = 2147498754
 
     def __init__(self, value=None, value_mask=None):
@@ -3054,20 +3177,19 @@ class icmpv6_type_masked(oxm):
             self.value_mask = 0
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!L", self.type_len))
-        packed.append(struct.pack("!B", self.value))
-        packed.append(struct.pack("!B", self.value_mask))
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_LBB, buf, offset, self.type_len, self.value, self.value_mask)
+        return offset
+
+    def wire_length(self):
+        return 6
 
     @staticmethod
     def unpack(reader):
         obj = icmpv6_type_masked()
-        _type_len = reader.read("!L")[0]
+        _type_len, obj.value, obj.value_mask = reader.read_struct(_struct_LBB)
         assert(_type_len == 2147498754)
-        obj.value = reader.read("!B")[0]
-        obj.value_mask = reader.read("!B")[0]
         return obj
 
     def __eq__(self, other):
@@ -3092,6 +3214,7 @@ class icmpv6_type_masked(oxm):
 oxm.subtypes[2147498754] = icmpv6_type_masked
 
 class in_phy_port(oxm):
+    __slots__ = ["value"]
     type_len = 2147484164
 
     def __init__(self, value=None):
@@ -3101,18 +3224,19 @@ class in_phy_port(oxm):
             self.value = 0
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!L", self.type_len))
-        packed.append(util.pack_port_no(self.value))
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_LL, buf, offset, self.type_len, self.value)
+        return offset
+
+    def wire_length(self):
+        return 8
 
     @staticmethod
     def unpack(reader):
         obj = in_phy_port()
-        _type_len = reader.read("!L")[0]
+        _type_len, obj.value = reader.read_struct(_struct_LL)
         assert(_type_len == 2147484164)
-        obj.value = util.unpack_port_no(reader)
         return obj
 
     def __eq__(self, other):
@@ -3133,6 +3257,7 @@ class in_phy_port(oxm):
 oxm.subtypes[2147484164] = in_phy_port
 
 class in_phy_port_masked(oxm):
+    __slots__ = ["value", "value_mask"]
     type_len = 2147484424
 
     def __init__(self, value=None, value_mask=None):
@@ -3146,20 +3271,19 @@ class in_phy_port_masked(oxm):
             self.value_mask = 0
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!L", self.type_len))
-        packed.append(util.pack_port_no(self.value))
-        packed.append(util.pack_port_no(self.value_mask))
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_LLL, buf, offset, self.type_len, self.value, self.value_mask)
+        return offset
+
+    def wire_length(self):
+        return 12
 
     @staticmethod
     def unpack(reader):
         obj = in_phy_port_masked()
-        _type_len = reader.read("!L")[0]
+        _type_len, obj.value, obj.value_mask = reader.read_struct(_struct_LLL)
         assert(_type_len == 2147484424)
-        obj.value = util.unpack_port_no(reader)
-        obj.value_mask = util.unpack_port_no(reader)
         return obj
 
     def __eq__(self, other):
@@ -3184,6 +3308,7 @@ class in_phy_port_masked(oxm):
 oxm.subtypes[2147484424] = in_phy_port_masked
 
 class in_port(oxm):
+    __slots__ = ["value"]
     type_len = 2147483652
 
     def __init__(self, value=None):
@@ -3193,18 +3318,19 @@ class in_port(oxm):
             self.value = 0
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!L", self.type_len))
-        packed.append(util.pack_port_no(self.value))
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_LL, buf, offset, self.type_len, self.value)
+        return offset
+
+    def wire_length(self):
+        return 8
 
     @staticmethod
     def unpack(reader):
         obj = in_port()
-        _type_len = reader.read("!L")[0]
+        _type_len, obj.value = reader.read_struct(_struct_LL)
         assert(_type_len == 2147483652)
-        obj.value = util.unpack_port_no(reader)
         return obj
 
     def __eq__(self, other):
@@ -3225,6 +3351,7 @@ class in_port(oxm):
 oxm.subtypes[2147483652] = in_port
 
 class in_port_masked(oxm):
+    __slots__ = ["value", "value_mask"]
     type_len = 2147483912
 
     def __init__(self, value=None, value_mask=None):
@@ -3238,20 +3365,19 @@ class in_port_masked(oxm):
             self.value_mask = 0
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!L", self.type_len))
-        packed.append(util.pack_port_no(self.value))
-        packed.append(util.pack_port_no(self.value_mask))
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_LLL, buf, offset, self.type_len, self.value, self.value_mask)
+        return offset
+
+    def wire_length(self):
+        return 12
 
     @staticmethod
     def unpack(reader):
         obj = in_port_masked()
-        _type_len = reader.read("!L")[0]
+        _type_len, obj.value, obj.value_mask = reader.read_struct(_struct_LLL)
         assert(_type_len == 2147483912)
-        obj.value = util.unpack_port_no(reader)
-        obj.value_mask = util.unpack_port_no(reader)
         return obj
 
     def __eq__(self, other):
@@ -3276,6 +3402,7 @@ class in_port_masked(oxm):
 oxm.subtypes[2147483912] = in_port_masked
 
 class ip_dscp(oxm):
+    __slots__ = ["value"]
     type_len = 2147487745
 
     def __init__(self, value=None):
@@ -3285,18 +3412,19 @@ class ip_dscp(oxm):
             self.value = 0
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!L", self.type_len))
-        packed.append(struct.pack("!B", self.value))
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_LB, buf, offset, self.type_len, self.value)
+        return offset
+
+    def wire_length(self):
+        return 5
 
     @staticmethod
     def unpack(reader):
         obj = ip_dscp()
-        _type_len = reader.read("!L")[0]
+        _type_len, obj.value = reader.read_struct(_struct_LB)
         assert(_type_len == 2147487745)
-        obj.value = reader.read("!B")[0]
         return obj
 
     def __eq__(self, other):
@@ -3317,6 +3445,7 @@ class ip_dscp(oxm):
 oxm.subtypes[2147487745] = ip_dscp
 
 class ip_dscp_masked(oxm):
+    __slots__ = ["value", "value_mask"]
     type_len = 2147488002
 
     def __init__(self, value=None, value_mask=None):
@@ -3330,20 +3459,19 @@ class ip_dscp_masked(oxm):
             self.value_mask = 0
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!L", self.type_len))
-        packed.append(struct.pack("!B", self.value))
-        packed.append(struct.pack("!B", self.value_mask))
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_LBB, buf, offset, self.type_len, self.value, self.value_mask)
+        return offset
+
+    def wire_length(self):
+        return 6
 
     @staticmethod
     def unpack(reader):
         obj = ip_dscp_masked()
-        _type_len = reader.read("!L")[0]
+        _type_len, obj.value, obj.value_mask = reader.read_struct(_struct_LBB)
         assert(_type_len == 2147488002)
-        obj.value = reader.read("!B")[0]
-        obj.value_mask = reader.read("!B")[0]
         return obj
 
     def __eq__(self, other):
@@ -3368,6 +3496,7 @@ class ip_dscp_masked(oxm):
 oxm.subtypes[2147488002] = ip_dscp_masked
 
 class ip_ecn(oxm):
+    __slots__ = ["value"]
     type_len = 2147488257
 
     def __init__(self, value=None):
@@ -3377,18 +3506,19 @@ class ip_ecn(oxm):
             self.value = 0
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!L", self.type_len))
-        packed.append(struct.pack("!B", self.value))
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_LB, buf, offset, self.type_len, self.value)
+        return offset
+
+    def wire_length(self):
+        return 5
 
     @staticmethod
     def unpack(reader):
         obj = ip_ecn()
-        _type_len = reader.read("!L")[0]
+        _type_len, obj.value = reader.read_struct(_struct_LB)
         assert(_type_len == 2147488257)
-        obj.value = reader.read("!B")[0]
         return obj
 
     def __eq__(self, other):
@@ -3409,6 +3539,7 @@ class ip_ecn(oxm):
 oxm.subtypes[2147488257] = ip_ecn
 
 class ip_ecn_masked(oxm):
+    __slots__ = ["value", "value_mask"]
     type_len = 2147488514
 
     def __init__(self, value=None, value_mask=None):
@@ -3422,20 +3553,19 @@ class ip_ecn_masked(oxm):
             self.value_mask = 0
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!L", self.type_len))
-        packed.append(struct.pack("!B", self.value))
-        packed.append(struct.pack("!B", self.value_mask))
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_LBB, buf, offset, self.type_len, self.value, self.value_mask)
+        return offset
+
+    def wire_length(self):
+        return 6
 
     @staticmethod
     def unpack(reader):
         obj = ip_ecn_masked()
-        _type_len = reader.read("!L")[0]
+        _type_len, obj.value, obj.value_mask = reader.read_struct(_struct_LBB)
         assert(_type_len == 2147488514)
-        obj.value = reader.read("!B")[0]
-        obj.value_mask = reader.read("!B")[0]
         return obj
 
     def __eq__(self, other):
@@ -3460,6 +3590,7 @@ class ip_ecn_masked(oxm):
 oxm.subtypes[2147488514] = ip_ecn_masked
 
 class ip_proto(oxm):
+    __slots__ = ["value"]
     type_len = 2147488769
 
     def __init__(self, value=None):
@@ -3469,18 +3600,19 @@ class ip_proto(oxm):
             self.value = 0
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!L", self.type_len))
-        packed.append(struct.pack("!B", self.value))
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_LB, buf, offset, self.type_len, self.value)
+        return offset
+
+    def wire_length(self):
+        return 5
 
     @staticmethod
     def unpack(reader):
         obj = ip_proto()
-        _type_len = reader.read("!L")[0]
+        _type_len, obj.value = reader.read_struct(_struct_LB)
         assert(_type_len == 2147488769)
-        obj.value = reader.read("!B")[0]
         return obj
 
     def __eq__(self, other):
@@ -3501,6 +3633,7 @@ class ip_proto(oxm):
 oxm.subtypes[2147488769] = ip_proto
 
 class ip_proto_masked(oxm):
+    __slots__ = ["value", "value_mask"]
     type_len = 2147489026
 
     def __init__(self, value=None, value_mask=None):
@@ -3514,20 +3647,19 @@ class ip_proto_masked(oxm):
             self.value_mask = 0
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!L", self.type_len))
-        packed.append(struct.pack("!B", self.value))
-        packed.append(struct.pack("!B", self.value_mask))
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_LBB, buf, offset, self.type_len, self.value, self.value_mask)
+        return offset
+
+    def wire_length(self):
+        return 6
 
     @staticmethod
     def unpack(reader):
         obj = ip_proto_masked()
-        _type_len = reader.read("!L")[0]
+        _type_len, obj.value, obj.value_mask = reader.read_struct(_struct_LBB)
         assert(_type_len == 2147489026)
-        obj.value = reader.read("!B")[0]
-        obj.value_mask = reader.read("!B")[0]
         return obj
 
     def __eq__(self, other):
@@ -3552,6 +3684,7 @@ class ip_proto_masked(oxm):
 oxm.subtypes[2147489026] = ip_proto_masked
 
 class ipv4_dst(oxm):
+    __slots__ = ["value"]
     type_len = 2147489796
 
     def __init__(self, value=None):
@@ -3561,18 +3694,19 @@ class ipv4_dst(oxm):
             self.value = 0
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!L", self.type_len))
-        packed.append(struct.pack("!L", self.value))
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_LL, buf, offset, self.type_len, self.value)
+        return offset
+
+    def wire_length(self):
+        return 8
 
     @staticmethod
     def unpack(reader):
         obj = ipv4_dst()
-        _type_len = reader.read("!L")[0]
+        _type_len, obj.value = reader.read_struct(_struct_LL)
         assert(_type_len == 2147489796)
-        obj.value = reader.read("!L")[0]
         return obj
 
     def __eq__(self, other):
@@ -3593,6 +3727,7 @@ class ipv4_dst(oxm):
 oxm.subtypes[2147489796] = ipv4_dst
 
 class ipv4_dst_masked(oxm):
+    __slots__ = ["value", "value_mask"]
     type_len = 2147490056
 
     def __init__(self, value=None, value_mask=None):
@@ -3606,20 +3741,19 @@ class ipv4_dst_masked(oxm):
             self.value_mask = 0
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!L", self.type_len))
-        packed.append(struct.pack("!L", self.value))
-        packed.append(struct.pack("!L", self.value_mask))
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_LLL, buf, offset, self.type_len, self.value, self.value_mask)
+        return offset
+
+    def wire_length(self):
+        return 12
 
     @staticmethod
     def unpack(reader):
         obj = ipv4_dst_masked()
-        _type_len = reader.read("!L")[0]
+        _type_len, obj.value, obj.value_mask = reader.read_struct(_struct_LLL)
         assert(_type_len == 2147490056)
-        obj.value = reader.read("!L")[0]
-        obj.value_mask = reader.read("!L")[0]
         return obj
 
     def __eq__(self, other):
@@ -3644,6 +3778,7 @@ class ipv4_dst_masked(oxm):
 oxm.subtypes[2147490056] = ipv4_dst_masked
 
 class ipv4_src(oxm):
+    __slots__ = ["value"]
     type_len = 2147489284
 
     def __init__(self, value=None):
@@ -3653,18 +3788,19 @@ class ipv4_src(oxm):
             self.value = 0
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!L", self.type_len))
-        packed.append(struct.pack("!L", self.value))
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_LL, buf, offset, self.type_len, self.value)
+        return offset
+
+    def wire_length(self):
+        return 8
 
     @staticmethod
     def unpack(reader):
         obj = ipv4_src()
-        _type_len = reader.read("!L")[0]
+        _type_len, obj.value = reader.read_struct(_struct_LL)
         assert(_type_len == 2147489284)
-        obj.value = reader.read("!L")[0]
         return obj
 
     def __eq__(self, other):
@@ -3685,6 +3821,7 @@ class ipv4_src(oxm):
 oxm.subtypes[2147489284] = ipv4_src
 
 class ipv4_src_masked(oxm):
+    __slots__ = ["value", "value_mask"]
     type_len = 2147489544
 
     def __init__(self, value=None, value_mask=None):
@@ -3698,20 +3835,19 @@ class ipv4_src_masked(oxm):
             self.value_mask = 0
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!L", self.type_len))
-        packed.append(struct.pack("!L", self.value))
-        packed.append(struct.pack("!L", self.value_mask))
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_LLL, buf, offset, self.type_len, self.value, self.value_mask)
+        return offset
+
+    def wire_length(self):
+        return 12
 
     @staticmethod
     def unpack(reader):
         obj = ipv4_src_masked()
-        _type_len = reader.read("!L")[0]
+        _type_len, obj.value, obj.value_mask = reader.read_struct(_struct_LLL)
         assert(_type_len == 2147489544)
-        obj.value = reader.read("!L")[0]
-        obj.value_mask = reader.read("!L")[0]
         return obj
 
     def __eq__(self, other):
@@ -3736,6 +3872,7 @@ class ipv4_src_masked(oxm):
 oxm.subtypes[2147489544] = ipv4_src_masked
 
 class ipv6_dst(oxm):
+    __slots__ = ["value"]
     type_len = 2147497488
 
     def __init__(self, value=None):
@@ -3745,18 +3882,19 @@ class ipv6_dst(oxm):
             self.value = '\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!L", self.type_len))
-        packed.append(struct.pack("!16s", self.value))
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_L16s, buf, offset, self.type_len, self.value)
+        return offset
+
+    def wire_length(self):
+        return 20
 
     @staticmethod
     def unpack(reader):
         obj = ipv6_dst()
-        _type_len = reader.read("!L")[0]
+        _type_len, obj.value = reader.read_struct(_struct_L16s)
         assert(_type_len == 2147497488)
-        obj.value = reader.read('!16s')[0]
         return obj
 
     def __eq__(self, other):
@@ -3777,6 +3915,7 @@ class ipv6_dst(oxm):
 oxm.subtypes[2147497488] = ipv6_dst
 
 class ipv6_dst_masked(oxm):
+    __slots__ = ["value", "value_mask"]
     type_len = 2147497760
 
     def __init__(self, value=None, value_mask=None):
@@ -3790,20 +3929,19 @@ class ipv6_dst_masked(oxm):
             self.value_mask = '\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!L", self.type_len))
-        packed.append(struct.pack("!16s", self.value))
-        packed.append(struct.pack("!16s", self.value_mask))
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_L16s16s, buf, offset, self.type_len, self.value, self.value_mask)
+        return offset
+
+    def wire_length(self):
+        return 36
 
     @staticmethod
     def unpack(reader):
         obj = ipv6_dst_masked()
-        _type_len = reader.read("!L")[0]
+        _type_len, obj.value, obj.value_mask = reader.read_struct(_struct_L16s16s)
         assert(_type_len == 2147497760)
-        obj.value = reader.read('!16s')[0]
-        obj.value_mask = reader.read('!16s')[0]
         return obj
 
     def __eq__(self, other):
@@ -3828,6 +3966,7 @@ class ipv6_dst_masked(oxm):
 oxm.subtypes[2147497760] = ipv6_dst_masked
 
 class ipv6_exthdr(oxm):
+    __slots__ = ["value"]
     type_len = 2147503618
 
     def __init__(self, value=None):
@@ -3837,18 +3976,19 @@ class ipv6_exthdr(oxm):
             self.value = 0
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!L", self.type_len))
-        packed.append(struct.pack("!H", self.value))
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_LH, buf, offset, self.type_len, self.value)
+        return offset
+
+    def wire_length(self):
+        return 6
 
     @staticmethod
     def unpack(reader):
         obj = ipv6_exthdr()
-        _type_len = reader.read("!L")[0]
+        _type_len, obj.value = reader.read_struct(_struct_LH)
         assert(_type_len == 2147503618)
-        obj.value = reader.read("!H")[0]
         return obj
 
     def __eq__(self, other):
@@ -3869,6 +4009,7 @@ class ipv6_exthdr(oxm):
 oxm.subtypes[2147503618] = ipv6_exthdr
 
 class ipv6_exthdr_masked(oxm):
+    __slots__ = ["value", "value_mask"]
     type_len = 2147503876
 
     def __init__(self, value=None, value_mask=None):
@@ -3882,20 +4023,19 @@ class ipv6_exthdr_masked(oxm):
             self.value_mask = 0
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!L", self.type_len))
-        packed.append(struct.pack("!H", self.value))
-        packed.append(struct.pack("!H", self.value_mask))
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_LHH, buf, offset, self.type_len, self.value, self.value_mask)
+        return offset
+
+    def wire_length(self):
+        return 8
 
     @staticmethod
     def unpack(reader):
         obj = ipv6_exthdr_masked()
-        _type_len = reader.read("!L")[0]
+        _type_len, obj.value, obj.value_mask = reader.read_struct(_struct_LHH)
         assert(_type_len == 2147503876)
-        obj.value = reader.read("!H")[0]
-        obj.value_mask = reader.read("!H")[0]
         return obj
 
     def __eq__(self, other):
@@ -3920,6 +4060,7 @@ class ipv6_exthdr_masked(oxm):
 oxm.subtypes[2147503876] = ipv6_exthdr_masked
 
 class ipv6_flabel(oxm):
+    __slots__ = ["value"]
     type_len = 2147497988
 
     def __init__(self, value=None):
@@ -3929,18 +4070,19 @@ class ipv6_flabel(oxm):
             self.value = 0
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!L", self.type_len))
-        packed.append(struct.pack("!L", self.value))
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_LL, buf, offset, self.type_len, self.value)
+        return offset
+
+    def wire_length(self):
+        return 8
 
     @staticmethod
     def unpack(reader):
         obj = ipv6_flabel()
-        _type_len = reader.read("!L")[0]
+        _type_len, obj.value = reader.read_struct(_struct_LL)
         assert(_type_len == 2147497988)
-        obj.value = reader.read("!L")[0]
         return obj
 
     def __eq__(self, other):
@@ -3961,6 +4103,7 @@ class ipv6_flabel(oxm):
 oxm.subtypes[2147497988] = ipv6_flabel
 
 class ipv6_flabel_masked(oxm):
+    __slots__ = ["value", "value_mask"]
     type_len = 2147498248
 
     def __init__(self, value=None, value_mask=None):
@@ -3974,20 +4117,19 @@ class ipv6_flabel_masked(oxm):
             self.value_mask = 0
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!L", self.type_len))
-        packed.append(struct.pack("!L", self.value))
-        packed.append(struct.pack("!L", self.value_mask))
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_LLL, buf, offset, self.type_len, self.value, self.value_mask)
+        return offset
+
+    def wire_length(self):
+        return 12
 
     @staticmethod
     def unpack(reader):
         obj = ipv6_flabel_masked()
-        _type_len = reader.read("!L")[0]
+        _type_len, obj.value, obj.value_mask = reader.read_struct(_struct_LLL)
         assert(_type_len == 2147498248)
-        obj.value = reader.read("!L")[0]
-        obj.value_mask = reader.read("!L")[0]
         return obj
 
     def __eq__(self, other):
@@ -4012,6 +4154,7 @@ class ipv6_flabel_masked(oxm):
 oxm.subtypes[2147498248] = ipv6_flabel_masked
 
 class ipv6_nd_sll(oxm):
+    __slots__ = ["value"]
     type_len = 2147500038
 
     def __init__(self, value=None):
@@ -4021,11 +4164,14 @@ class ipv6_nd_sll(oxm):
             self.value = [0,0,0,0,0,0]
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!L", self.type_len))
-        packed.append(struct.pack("!6B", *self.value))
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_L, buf, offset, self.type_len)
+        offset = loxi.generic_util.pack_struct_into(_struct_6B, buf, offset, *self.value)
+        return offset
+
+    def wire_length(self):
+        return 10
 
     @staticmethod
     def unpack(reader):
@@ -4053,6 +4199,7 @@ class ipv6_nd_sll(oxm):
 oxm.subtypes[2147500038] = ipv6_nd_sll
 
 class ipv6_nd_sll_masked(oxm):
+    __slots__ = ["value", "value_mask"]
     type_len = 2147500300
 
     def __init__(self, value=None, value_mask=None):
@@ -4066,12 +4213,15 @@ class ipv6_nd_sll_masked(oxm):
             self.value_mask = [0,0,0,0,0,0]
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!L", self.type_len))
-        packed.append(struct.pack("!6B", *self.value))
-        packed.append(struct.pack("!6B", *self.value_mask))
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_L, buf, offset, self.type_len)
+        offset = loxi.generic_util.pack_struct_into(_struct_6B, buf, offset, *self.value)
+        offset = loxi.generic_util.pack_struct_into(_struct_6B, buf, offset, *self.value_mask)
+        return offset
+
+    def wire_length(self):
+        return 16
 
     @staticmethod
     def unpack(reader):
@@ -4104,6 +4254,7 @@ class ipv6_nd_sll_masked(oxm):
 oxm.subtypes[2147500300] = ipv6_nd_sll_masked
 
 class ipv6_nd_target(oxm):
+    __slots__ = ["value"]
     type_len = 2147499536
 
     def __init__(self, value=None):
@@ -4113,18 +4264,19 @@ class ipv6_nd_target(oxm):
             self.value = '\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!L", self.type_len))
-        packed.append(struct.pack("!16s", self.value))
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_L16s, buf, offset, self.type_len, self.value)
+        return offset
+
+    def wire_length(self):
+        return 20
 
     @staticmethod
     def unpack(reader):
         obj = ipv6_nd_target()
-        _type_len = reader.read("!L")[0]
+        _type_len, obj.value = reader.read_struct(_struct_L16s)
         assert(_type_len == 2147499536)
-        obj.value = reader.read('!16s')[0]
         return obj
 
     def __eq__(self, other):
@@ -4145,6 +4297,7 @@ class ipv6_nd_target(oxm):
 oxm.subtypes[2147499536] = ipv6_nd_target
 
 class ipv6_nd_target_masked(oxm):
+    __slots__ = ["value", "value_mask"]
     type_len = 2147499808
 
     def __init__(self, value=None, value_mask=None):
@@ -4158,20 +4311,19 @@ class ipv6_nd_target_masked(oxm):
             self.value_mask = '\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!L", self.type_len))
-        packed.append(struct.pack("!16s", self.value))
-        packed.append(struct.pack("!16s", self.value_mask))
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_L16s16s, buf, offset, self.type_len, self.value, self.value_mask)
+        return offset
+
+    def wire_length(self):
+        return 36
 
     @staticmethod
     def unpack(reader):
         obj = ipv6_nd_target_masked()
-        _type_len = reader.read("!L")[0]
+        _type_len, obj.value, obj.value_mask = reader.read_struct(_struct_L16s16s)
         assert(_type_len == 2147499808)
-        obj.value = reader.read('!16s')[0]
-        obj.value_mask = reader.read('!16s')[0]
         return obj
 
     def __eq__(self, other):
@@ -4196,6 +4348,7 @@ class ipv6_nd_target_masked(oxm):
 oxm.subtypes[2147499808] = ipv6_nd_target_masked
 
 class ipv6_nd_tll(oxm):
+    __slots__ = ["value"]
     type_len = 2147500550
 
     def __init__(self, value=None):
@@ -4205,11 +4358,14 @@ class ipv6_nd_tll(oxm):
             self.value = [0,0,0,0,0,0]
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!L", self.type_len))
-        packed.append(struct.pack("!6B", *self.value))
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_L, buf, offset, self.type_len)
+        offset = loxi.generic_util.pack_struct_into(_struct_6B, buf, offset, *self.value)
+        return offset
+
+    def wire_length(self):
+        return 10
 
     @staticmethod
     def unpack(reader):
@@ -4237,6 +4393,7 @@ class ipv6_nd_tll(oxm):
 oxm.subtypes[2147500550] = ipv6_nd_tll
 
 class ipv6_nd_tll_masked(oxm):
+    __slots__ = ["value", "value_mask"]
     type_len = 2147500812
 
     def __init__(self, value=None, value_mask=None):
@@ -4250,12 +4407,15 @@ class ipv6_nd_tll_masked(oxm):
             self.value_mask = [0,0,0,0,0,0]
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!L", self.type_len))
-        packed.append(struct.pack("!6B", *self.value))
-        packed.append(struct.pack("!6B", *self.value_mask))
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_L, buf, offset, self.type_len)
+        offset = loxi.generic_util.pack_struct_into(_struct_6B, buf, offset, *self.value)
+        offset = loxi.generic_util.pack_struct_into(_struct_6B, buf, offset, *self.value_mask)
+        return offset
+
+    def wire_length(self):
+        return 16
 
     @staticmethod
     def unpack(reader):
@@ -4288,6 +4448,7 @@ class ipv6_nd_tll_masked(oxm):
 oxm.subtypes[2147500812] = ipv6_nd_tll_masked
 
 class ipv6_src(oxm):
+    __slots__ = ["value"]
     type_len = 2147496976
 
     def __init__(self, value=None):
@@ -4297,18 +4458,19 @@ class ipv6_src(oxm):
             self.value = '\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!L", self.type_len))
-        packed.append(struct.pack("!16s", self.value))
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_L16s, buf, offset, self.type_len, self.value)
+        return offset
+
+    def wire_length(self):
+        return 20
 
     @staticmethod
     def unpack(reader):
         obj = ipv6_src()
-        _type_len = reader.read("!L")[0]
+        _type_len, obj.value = reader.read_struct(_struct_L16s)
         assert(_type_len == 2147496976)
-        obj.value = reader.read('!16s')[0]
         return obj
 
     def __eq__(self, other):
@@ -4329,6 +4491,7 @@ class ipv6_src(oxm):
 oxm.subtypes[2147496976] = ipv6_src
 
 class ipv6_src_masked(oxm):
+    __slots__ = ["value", "value_mask"]
     type_len = 2147497248
 
     def __init__(self, value=None, value_mask=None):
@@ -4342,20 +4505,19 @@ class ipv6_src_masked(oxm):
             self.value_mask = '\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!L", self.type_len))
-        packed.append(struct.pack("!16s", self.value))
-        packed.append(struct.pack("!16s", self.value_mask))
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_L16s16s, buf, offset, self.type_len, self.value, self.value_mask)
+        return offset
+
+    def wire_length(self):
+        return 36
 
     @staticmethod
     def unpack(reader):
         obj = ipv6_src_masked()
-        _type_len = reader.read("!L")[0]
+        _type_len, obj.value, obj.value_mask = reader.read_struct(_struct_L16s16s)
         assert(_type_len == 2147497248)
-        obj.value = reader.read('!16s')[0]
-        obj.value_mask = reader.read('!16s')[0]
         return obj
 
     def __eq__(self, other):
@@ -4380,6 +4542,7 @@ class ipv6_src_masked(oxm):
 oxm.subtypes[2147497248] = ipv6_src_masked
 
 class metadata(oxm):
+    __slots__ = ["value"]
     type_len = 2147484680
 
     def __init__(self, value=None):
@@ -4389,18 +4552,19 @@ class metadata(oxm):
             self.value = 0
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!L", self.type_len))
-        packed.append(struct.pack("!Q", self.value))
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_LQ, buf, offset, self.type_len, self.value)
+        return offset
+
+    def wire_length(self):
+        return 12
 
     @staticmethod
     def unpack(reader):
         obj = metadata()
-        _type_len = reader.read("!L")[0]
+        _type_len, obj.value = reader.read_struct(_struct_LQ)
         assert(_type_len == 2147484680)
-        obj.value = reader.read("!Q")[0]
         return obj
 
     def __eq__(self, other):
@@ -4421,6 +4585,7 @@ class metadata(oxm):
 oxm.subtypes[2147484680] = metadata
 
 class metadata_masked(oxm):
+    __slots__ = ["value", "value_mask"]
     type_len = 2147484944
 
     def __init__(self, value=None, value_mask=None):
@@ -4434,20 +4599,19 @@ class metadata_masked(oxm):
             self.value_mask = 0
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!L", self.type_len))
-        packed.append(struct.pack("!Q", self.value))
-        packed.append(struct.pack("!Q", self.value_mask))
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_LQQ, buf, offset, self.type_len, self.value, self.value_mask)
+        return offset
+
+    def wire_length(self):
+        return 20
 
     @staticmethod
     def unpack(reader):
         obj = metadata_masked()
-        _type_len = reader.read("!L")[0]
+        _type_len, obj.value, obj.value_mask = reader.read_struct(_struct_LQQ)
         assert(_type_len == 2147484944)
-        obj.value = reader.read("!Q")[0]
-        obj.value_mask = reader.read("!Q")[0]
         return obj
 
     def __eq__(self, other):
@@ -4472,6 +4636,7 @@ class metadata_masked(oxm):
 oxm.subtypes[2147484944] = metadata_masked
 
 class mpls_bos(oxm):
+    __slots__ = ["value"]
     type_len = 2147502081
 
     def __init__(self, value=None):
@@ -4481,18 +4646,19 @@ class mpls_bos(oxm):
             self.value = 0
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!L", self.type_len))
-        packed.append(struct.pack("!B", self.value))
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_LB, buf, offset, self.type_len, self.value)
+        return offset
+
+    def wire_length(self):
+        return 5
 
     @staticmethod
     def unpack(reader):
         obj = mpls_bos()
-        _type_len = reader.read("!L")[0]
+        _type_len, obj.value = reader.read_struct(_struct_LB)
         assert(_type_len == 2147502081)
-        obj.value = reader.read("!B")[0]
         return obj
 
     def __eq__(self, other):
@@ -4513,6 +4679,7 @@ class mpls_bos(oxm):
 oxm.subtypes[2147502081] = mpls_bos
 
 class mpls_bos_masked(oxm):
+    __slots__ = ["value", "value_mask"]
     type_len = 2147502338
 
     def __init__(self, value=None, value_mask=None):
@@ -4526,20 +4693,19 @@ class mpls_bos_masked(oxm):
             self.value_mask = 0
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!L", self.type_len))
-        packed.append(struct.pack("!B", self.value))
-        packed.append(struct.pack("!B", self.value_mask))
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_LBB, buf, offset, self.type_len, self.value, self.value_mask)
+        return offset
+
+    def wire_length(self):
+        return 6
 
     @staticmethod
     def unpack(reader):
         obj = mpls_bos_masked()
-        _type_len = reader.read("!L")[0]
+        _type_len, obj.value, obj.value_mask = reader.read_struct(_struct_LBB)
         assert(_type_len == 2147502338)
-        obj.value = reader.read("!B")[0]
-        obj.value_mask = reader.read("!B")[0]
         return obj
 
     def __eq__(self, other):
@@ -4564,6 +4730,7 @@ class mpls_bos_masked(oxm):
 oxm.subtypes[2147502338] = mpls_bos_masked
 
 class mpls_label(oxm):
+    __slots__ = ["value"]
     type_len = 2147501060
 
     def __init__(self, value=None):
@@ -4573,18 +4740,19 @@ class mpls_label(oxm):
             self.value = 0
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!L", self.type_len))
-        packed.append(struct.pack("!L", self.value))
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_LL, buf, offset, self.type_len, self.value)
+        return offset
+
+    def wire_length(self):
+        return 8
 
     @staticmethod
     def unpack(reader):
         obj = mpls_label()
-        _type_len = reader.read("!L")[0]
+        _type_len, obj.value = reader.read_struct(_struct_LL)
         assert(_type_len == 2147501060)
-        obj.value = reader.read("!L")[0]
         return obj
 
     def __eq__(self, other):
@@ -4605,6 +4773,7 @@ class mpls_label(oxm):
 oxm.subtypes[2147501060] = mpls_label
 
 class mpls_label_masked(oxm):
+    __slots__ = ["value", "value_mask"]
     type_len = 2147501320
 
     def __init__(self, value=None, value_mask=None):
@@ -4618,20 +4787,19 @@ class mpls_label_masked(oxm):
             self.value_mask = 0
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!L", self.type_len))
-        packed.append(struct.pack("!L", self.value))
-        packed.append(struct.pack("!L", self.value_mask))
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_LLL, buf, offset, self.type_len, self.value, self.value_mask)
+        return offset
+
+    def wire_length(self):
+        return 12
 
     @staticmethod
     def unpack(reader):
         obj = mpls_label_masked()
-        _type_len = reader.read("!L")[0]
+        _type_len, obj.value, obj.value_mask = reader.read_struct(_struct_LLL)
         assert(_type_len == 2147501320)
-        obj.value = reader.read("!L")[0]
-        obj.value_mask = reader.read("!L")[0]
         return obj
 
     def __eq__(self, other):
@@ -4656,6 +4824,7 @@ class mpls_label_masked(oxm):
 oxm.subtypes[2147501320] = mpls_label_masked
 
 class mpls_tc(oxm):
+    __slots__ = ["value"]
     type_len = 2147501569
 
     def __init__(self, value=None):
@@ -4665,18 +4834,19 @@ class mpls_tc(oxm):
             self.value = 0
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!L", self.type_len))
-        packed.append(struct.pack("!B", self.value))
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_LB, buf, offset, self.type_len, self.value)
+        return offset
+
+    def wire_length(self):
+        return 5
 
     @staticmethod
     def unpack(reader):
         obj = mpls_tc()
-        _type_len = reader.read("!L")[0]
+        _type_len, obj.value = reader.read_struct(_struct_LB)
         assert(_type_len == 2147501569)
-        obj.value = reader.read("!B")[0]
         return obj
 
     def __eq__(self, other):
@@ -4697,6 +4867,7 @@ class mpls_tc(oxm):
 oxm.subtypes[2147501569] = mpls_tc
 
 class mpls_tc_masked(oxm):
+    __slots__ = ["value", "value_mask"]
     type_len = 2147501826
 
     def __init__(self, value=None, value_mask=None):
@@ -4710,20 +4881,19 @@ class mpls_tc_masked(oxm):
             self.value_mask = 0
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!L", self.type_len))
-        packed.append(struct.pack("!B", self.value))
-        packed.append(struct.pack("!B", self.value_mask))
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_LBB, buf, offset, self.type_len, self.value, self.value_mask)
+        return offset
+
+    def wire_length(self):
+        return 6
 
     @staticmethod
     def unpack(reader):
         obj = mpls_tc_masked()
-        _type_len = reader.read("!L")[0]
+        _type_len, obj.value, obj.value_mask = reader.read_struct(_struct_LBB)
         assert(_type_len == 2147501826)
-        obj.value = reader.read("!B")[0]
-        obj.value_mask = reader.read("!B")[0]
         return obj
 
     def __eq__(self, other):
@@ -4748,6 +4918,7 @@ class mpls_tc_masked(oxm):
 oxm.subtypes[2147501826] = mpls_tc_masked
 
 class sctp_dst(oxm):
+    __slots__ = ["value"]
     type_len = 2147492866
 
     def __init__(self, value=None):
@@ -4757,18 +4928,19 @@ class sctp_dst(oxm):
             self.value = 0
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!L", self.type_len))
-        packed.append(struct.pack("!H", self.value))
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_LH, buf, offset, self.type_len, self.value)
+        return offset
+
+    def wire_length(self):
+        return 6
 
     @staticmethod
     def unpack(reader):
         obj = sctp_dst()
-        _type_len = reader.read("!L")[0]
+        _type_len, obj.value = reader.read_struct(_struct_LH)
         assert(_type_len == 2147492866)
-        obj.value = reader.read("!H")[0]
         return obj
 
     def __eq__(self, other):
@@ -4789,6 +4961,7 @@ class sctp_dst(oxm):
 oxm.subtypes[2147492866] = sctp_dst
 
 class sctp_dst_masked(oxm):
+    __slots__ = ["value", "value_mask"]
     type_len = 2147493124
 
     def __init__(self, value=None, value_mask=None):
@@ -4802,20 +4975,19 @@ class sctp_dst_masked(oxm):
             self.value_mask = 0
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!L", self.type_len))
-        packed.append(struct.pack("!H", self.value))
-        packed.append(struct.pack("!H", self.value_mask))
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_LHH, buf, offset, self.type_len, self.value, self.value_mask)
+        return offset
+
+    def wire_length(self):
+        return 8
 
     @staticmethod
     def unpack(reader):
         obj = sctp_dst_masked()
-        _type_len = reader.read("!L")[0]
+        _type_len, obj.value, obj.value_mask = reader.read_struct(_struct_LHH)
         assert(_type_len == 2147493124)
-        obj.value = reader.read("!H")[0]
-        obj.value_mask = reader.read("!H")[0]
         return obj
 
     def __eq__(self, other):
@@ -4840,6 +5012,7 @@ class sctp_dst_masked(oxm):
 oxm.subtypes[2147493124] = sctp_dst_masked
 
 class sctp_src(oxm):
+    __slots__ = ["value"]
     type_len = 2147492354
 
     def __init__(self, value=None):
@@ -4849,18 +5022,19 @@ class sctp_src(oxm):
             self.value = 0
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!L", self.type_len))
-        packed.append(struct.pack("!H", self.value))
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_LH, buf, offset, self.type_len, self.value)
+        return offset
+
+    def wire_length(self):
+        return 6
 
     @staticmethod
     def unpack(reader):
         obj = sctp_src()
-        _type_len = reader.read("!L")[0]
+        _type_len, obj.value = reader.read_struct(_struct_LH)
         assert(_type_len == 2147492354)
-        obj.value = reader.read("!H")[0]
         return obj
 
     def __eq__(self, other):
@@ -4881,6 +5055,7 @@ class sctp_src(oxm):
 oxm.subtypes[2147492354] = sctp_src
 
 class sctp_src_masked(oxm):
+    __slots__ = ["value", "value_mask"]
     type_len = 2147492612
 
     def __init__(self, value=None, value_mask=None):
@@ -4894,20 +5069,19 @@ class sctp_src_masked(oxm):
             self.value_mask = 0
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!L", self.type_len))
-        packed.append(struct.pack("!H", self.value))
-        packed.append(struct.pack("!H", self.value_mask))
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_LHH, buf, offset, self.type_len, self.value, self.value_mask)
+        return offset
+
+    def wire_length(self):
+        return 8
 
     @staticmethod
     def unpack(reader):
         obj = sctp_src_masked()
-        _type_len = reader.read("!L")[0]
+        _type_len, obj.value, obj.value_mask = reader.read_struct(_struct_LHH)
         assert(_type_len == 2147492612)
-        obj.value = reader.read("!H")[0]
-        obj.value_mask = reader.read("!H")[0]
         return obj
 
     def __eq__(self, other):
@@ -4932,6 +5106,7 @@ class sctp_src_masked(oxm):
 oxm.subtypes[2147492612] = sctp_src_masked
 
 class tcp_dst(oxm):
+    __slots__ = ["value"]
     type_len = 2147490818
 
     def __init__(self, value=None):
@@ -4941,18 +5116,19 @@ class tcp_dst(oxm):
             self.value = 0
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!L", self.type_len))
-        packed.append(struct.pack("!H", self.value))
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_LH, buf, offset, self.type_len, self.value)
+        return offset
+
+    def wire_length(self):
+        return 6
 
     @staticmethod
     def unpack(reader):
         obj = tcp_dst()
-        _type_len = reader.read("!L")[0]
+        _type_len, obj.value = reader.read_struct(_struct_LH)
         assert(_type_len == 2147490818)
-        obj.value = reader.read("!H")[0]
         return obj
 
     def __eq__(self, other):
@@ -4973,6 +5149,7 @@ class tcp_dst(oxm):
 oxm.subtypes[2147490818] = tcp_dst
 
 class tcp_dst_masked(oxm):
+    __slots__ = ["value", "value_mask"]
     type_len = 2147491076
 
     def __init__(self, value=None, value_mask=None):
@@ -4986,20 +5163,19 @@ class tcp_dst_masked(oxm):
             self.value_mask = 0
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!L", self.type_len))
-        packed.append(struct.pack("!H", self.value))
-        packed.append(struct.pack("!H", self.value_mask))
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_LHH, buf, offset, self.type_len, self.value, self.value_mask)
+        return offset
+
+    def wire_length(self):
+        return 8
 
     @staticmethod
     def unpack(reader):
         obj = tcp_dst_masked()
-        _type_len = reader.read("!L")[0]
+        _type_len, obj.value, obj.value_mask = reader.read_struct(_struct_LHH)
         assert(_type_len == 2147491076)
-        obj.value = reader.read("!H")[0]
-        obj.value_mask = reader.read("!H")[0]
         return obj
 
     def __eq__(self, other):
@@ -5024,6 +5200,7 @@ class tcp_dst_masked(oxm):
 oxm.subtypes[2147491076] = tcp_dst_masked
 
 class tcp_src(oxm):
+    __slots__ = ["value"]
     type_len = 2147490306
 
     def __init__(self, value=None):
@@ -5033,18 +5210,19 @@ class tcp_src(oxm):
             self.value = 0
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!L", self.type_len))
-        packed.append(struct.pack("!H", self.value))
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_LH, buf, offset, self.type_len, self.value)
+        return offset
+
+    def wire_length(self):
+        return 6
 
     @staticmethod
     def unpack(reader):
         obj = tcp_src()
-        _type_len = reader.read("!L")[0]
+        _type_len, obj.value = reader.read_struct(_struct_LH)
         assert(_type_len == 2147490306)
-        obj.value = reader.read("!H")[0]
         return obj
 
     def __eq__(self, other):
@@ -5065,6 +5243,7 @@ class tcp_src(oxm):
 oxm.subtypes[2147490306] = tcp_src
 
 class tcp_src_masked(oxm):
+    __slots__ = ["value", "value_mask"]
     type_len = 2147490564
 
     def __init__(self, value=None, value_mask=None):
@@ -5078,20 +5257,19 @@ class tcp_src_masked(oxm):
             self.value_mask = 0
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!L", self.type_len))
-        packed.append(struct.pack("!H", self.value))
-        packed.append(struct.pack("!H", self.value_mask))
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_LHH, buf, offset, self.type_len, self.value, self.value_mask)
+        return offset
+
+    def wire_length(self):
+        return 8
 
     @staticmethod
     def unpack(reader):
         obj = tcp_src_masked()
-        _type_len = reader.read("!L")[0]
+        _type_len, obj.value, obj.value_mask = reader.read_struct(_struct_LHH)
         assert(_type_len == 2147490564)
-        obj.value = reader.read("!H")[0]
-        obj.value_mask = reader.read("!H")[0]
         return obj
 
     def __eq__(self, other):
@@ -5116,6 +5294,7 @@ class tcp_src_masked(oxm):
 oxm.subtypes[2147490564] = tcp_src_masked
 
 class tunnel_id(oxm):
+    __slots__ = ["value"]
     type_len = 2147503112
 
     def __init__(self, value=None):
@@ -5125,18 +5304,19 @@ class tunnel_id(oxm):
             self.value = 0
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!L", self.type_len))
-        packed.append(struct.pack("!Q", self.value))
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_LQ, buf, offset, self.type_len, self.value)
+        return offset
+
+    def wire_length(self):
+        return 12
 
     @staticmethod
     def unpack(reader):
         obj = tunnel_id()
-        _type_len = reader.read("!L")[0]
+        _type_len, obj.value = reader.read_struct(_struct_LQ)
         assert(_type_len == 2147503112)
-        obj.value = reader.read("!Q")[0]
         return obj
 
     def __eq__(self, other):
@@ -5157,6 +5337,7 @@ class tunnel_id(oxm):
 oxm.subtypes[2147503112] = tunnel_id
 
 class tunnel_id_masked(oxm):
+    __slots__ = ["value", "value_mask"]
     type_len = 2147503376
 
     def __init__(self, value=None, value_mask=None):
@@ -5170,20 +5351,19 @@ class tunnel_id_masked(oxm):
             self.value_mask = 0
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!L", self.type_len))
-        packed.append(struct.pack("!Q", self.value))
-        packed.append(struct.pack("!Q", self.value_mask))
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_LQQ, buf, offset, self.type_len, self.value, self.value_mask)
+        return offset
+
+    def wire_length(self):
+        return 20
 
     @staticmethod
     def unpack(reader):
         obj = tunnel_id_masked()
-        _type_len = reader.read("!L")[0]
+        _type_len, obj.value, obj.value_mask = reader.read_struct(_struct_LQQ)
         assert(_type_len == 2147503376)
-        obj.value = reader.read("!Q")[0]
-        obj.value_mask = reader.read("!Q")[0]
         return obj
 
     def __eq__(self, other):
@@ -5208,6 +5388,7 @@ class tunnel_id_masked(oxm):
 oxm.subtypes[2147503376] = tunnel_id_masked
 
 class tunnel_ipv4_dst(oxm):
+    __slots__ = ["value"]
     type_len = 81924
 
     def __init__(self, value=None):
@@ -5217,18 +5398,19 @@ class tunnel_ipv4_dst(oxm):
             self.value = 0
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!L", self.type_len))
-        packed.append(struct.pack("!L", self.value))
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_LL, buf, offset, self.type_len, self.value)
+        return offset
+
+    def wire_length(self):
+        return 8
 
     @staticmethod
     def unpack(reader):
         obj = tunnel_ipv4_dst()
-        _type_len = reader.read("!L")[0]
+        _type_len, obj.value = reader.read_struct(_struct_LL)
         assert(_type_len == 81924)
-        obj.value = reader.read("!L")[0]
         return obj
 
     def __eq__(self, other):
@@ -5249,6 +5431,7 @@ class tunnel_ipv4_dst(oxm):
 oxm.subtypes[81924] = tunnel_ipv4_dst
 
 class tunnel_ipv4_dst_masked(oxm):
+    __slots__ = ["value", "value_mask"]
     type_len = 82184
 
     def __init__(self, value=None, value_mask=None):
@@ -5262,20 +5445,19 @@ class tunnel_ipv4_dst_masked(oxm):
             self.value_mask = 0
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!L", self.type_len))
-        packed.append(struct.pack("!L", self.value))
-        packed.append(struct.pack("!L", self.value_mask))
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_LLL, buf, offset, self.type_len, self.value, self.value_mask)
+        return offset
+
+    def wire_length(self):
+        return 12
 
     @staticmethod
     def unpack(reader):
         obj = tunnel_ipv4_dst_masked()
-        _type_len = reader.read("!L")[0]
+        _type_len, obj.value, obj.value_mask = reader.read_struct(_struct_LLL)
         assert(_type_len == 82184)
-        obj.value = reader.read("!L")[0]
-        obj.value_mask = reader.read("!L")[0]
         return obj
 
     def __eq__(self, other):
@@ -5300,6 +5482,7 @@ class tunnel_ipv4_dst_masked(oxm):
 oxm.subtypes[82184] = tunnel_ipv4_dst_masked
 
 class tunnel_ipv4_src(oxm):
+    __slots__ = ["value"]
     type_len = 81412
 
     def __init__(self, value=None):
@@ -5309,18 +5492,19 @@ class tunnel_ipv4_src(oxm):
             self.value = 0
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!L", self.type_len))
-        packed.append(struct.pack("!L", self.value))
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_LL, buf, offset, self.type_len, self.value)
+        return offset
+
+    def wire_length(self):
+        return 8
 
     @staticmethod
     def unpack(reader):
         obj = tunnel_ipv4_src()
-        _type_len = reader.read("!L")[0]
+        _type_len, obj.value = reader.read_struct(_struct_LL)
         assert(_type_len == 81412)
-        obj.value = reader.read("!L")[0]
         return obj
 
     def __eq__(self, other):
@@ -5341,6 +5525,7 @@ class tunnel_ipv4_src(oxm):
 oxm.subtypes[81412] = tunnel_ipv4_src
 
 class tunnel_ipv4_src_masked(oxm):
+    __slots__ = ["value", "value_mask"]
     type_len = 81672
 
     def __init__(self, value=None, value_mask=None):
@@ -5354,20 +5539,19 @@ class tunnel_ipv4_src_masked(oxm):
             self.value_mask = 0
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!L", self.type_len))
-        packed.append(struct.pack("!L", self.value))
-        packed.append(struct.pack("!L", self.value_mask))
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_LLL, buf, offset, self.type_len, self.value, self.value_mask)
+        return offset
+
+    def wire_length(self):
+        return 12
 
     @staticmethod
     def unpack(reader):
         obj = tunnel_ipv4_src_masked()
-        _type_len = reader.read("!L")[0]
+        _type_len, obj.value, obj.value_mask = reader.read_struct(_struct_LLL)
         assert(_type_len == 81672)
-        obj.value = reader.read("!L")[0]
-        obj.value_mask = reader.read("!L")[0]
         return obj
 
     def __eq__(self, other):
@@ -5392,6 +5576,7 @@ class tunnel_ipv4_src_masked(oxm):
 oxm.subtypes[81672] = tunnel_ipv4_src_masked
 
 class udp_dst(oxm):
+    __slots__ = ["value"]
     type_len = 2147491842
 
     def __init__(self, value=None):
@@ -5401,18 +5586,19 @@ class udp_dst(oxm):
             self.value = 0
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!L", self.type_len))
-        packed.append(struct.pack("!H", self.value))
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_LH, buf, offset, self.type_len, self.value)
+        return offset
+
+    def wire_length(self):
+        return 6
 
     @staticmethod
     def unpack(reader):
         obj = udp_dst()
-        _type_len = reader.read("!L")[0]
+        _type_len, obj.value = reader.read_struct(_struct_LH)
         assert(_type_len == 2147491842)
-        obj.value = reader.read("!H")[0]
         return obj
 
     def __eq__(self, other):
@@ -5433,6 +5619,7 @@ class udp_dst(oxm):
 oxm.subtypes[2147491842] = udp_dst
 
 class udp_dst_masked(oxm):
+    __slots__ = ["value", "value_mask"]
     type_len = 2147492100
 
     def __init__(self, value=None, value_mask=None):
@@ -5446,20 +5633,19 @@ class udp_dst_masked(oxm):
             self.value_mask = 0
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!L", self.type_len))
-        packed.append(struct.pack("!H", self.value))
-        packed.append(struct.pack("!H", self.value_mask))
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_LHH, buf, offset, self.type_len, self.value, self.value_mask)
+        return offset
+
+    def wire_length(self):
+        return 8
 
     @staticmethod
     def unpack(reader):
         obj = udp_dst_masked()
-        _type_len = reader.read("!L")[0]
+        _type_len, obj.value, obj.value_mask = reader.read_struct(_struct_LHH)
         assert(_type_len == 2147492100)
-        obj.value = reader.read("!H")[0]
-        obj.value_mask = reader.read("!H")[0]
         return obj
 
     def __eq__(self, other):
@@ -5484,6 +5670,7 @@ class udp_dst_masked(oxm):
 oxm.subtypes[2147492100] = udp_dst_masked
 
 class udp_src(oxm):
+    __slots__ = ["value"]
     type_len = 2147491330
 
     def __init__(self, value=None):
@@ -5493,18 +5680,19 @@ class udp_src(oxm):
             self.value = 0
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!L", self.type_len))
-        packed.append(struct.pack("!H", self.value))
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_LH, buf, offset, self.type_len, self.value)
+        return offset
+
+    def wire_length(self):
+        return 6
 
     @staticmethod
     def unpack(reader):
         obj = udp_src()
-        _type_len = reader.read("!L")[0]
+        _type_len, obj.value = reader.read_struct(_struct_LH)
         assert(_type_len == 2147491330)
-        obj.value = reader.read("!H")[0]
         return obj
 
     def __eq__(self, other):
@@ -5525,6 +5713,7 @@ class udp_src(oxm):
 oxm.subtypes[2147491330] = udp_src
 
 class udp_src_masked(oxm):
+    __slots__ = ["value", "value_mask"]
     type_len = 2147491588
 
     def __init__(self, value=None, value_mask=None):
@@ -5538,20 +5727,19 @@ class udp_src_masked(oxm):
             self.value_mask = 0
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!L", self.type_len))
-        packed.append(struct.pack("!H", self.value))
-        packed.append(struct.pack("!H", self.value_mask))
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_LHH, buf, offset, self.type_len, self.value, self.value_mask)
+        return offset
+
+    def wire_length(self):
+        return 8
 
     @staticmethod
     def unpack(reader):
         obj = udp_src_masked()
-        _type_len = reader.read("!L")[0]
+        _type_len, obj.value, obj.value_mask = reader.read_struct(_struct_LHH)
         assert(_type_len == 2147491588)
-        obj.value = reader.read("!H")[0]
-        obj.value_mask = reader.read("!H")[0]
         return obj
 
     def __eq__(self, other):
@@ -5576,6 +5764,7 @@ class udp_src_masked(oxm):
 oxm.subtypes[2147491588] = udp_src_masked
 
 class vlan_pcp(oxm):
+    __slots__ = ["value"]
     type_len = 2147487233
 
     def __init__(self, value=None):
@@ -5585,18 +5774,19 @@ class vlan_pcp(oxm):
             self.value = 0
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!L", self.type_len))
-        packed.append(struct.pack("!B", self.value))
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_LB, buf, offset, self.type_len, self.value)
+        return offset
+
+    def wire_length(self):
+        return 5
 
     @staticmethod
     def unpack(reader):
         obj = vlan_pcp()
-        _type_len = reader.read("!L")[0]
+        _type_len, obj.value = reader.read_struct(_struct_LB)
         assert(_type_len == 2147487233)
-        obj.value = reader.read("!B")[0]
         return obj
 
     def __eq__(self, other):
@@ -5617,6 +5807,7 @@ class vlan_pcp(oxm):
 oxm.subtypes[2147487233] = vlan_pcp
 
 class vlan_pcp_masked(oxm):
+    __slots__ = ["value", "value_mask"]
     type_len = 2147487490
 
     def __init__(self, value=None, value_mask=None):
@@ -5630,20 +5821,19 @@ class vlan_pcp_masked(oxm):
             self.value_mask = 0
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!L", self.type_len))
-        packed.append(struct.pack("!B", self.value))
-        packed.append(struct.pack("!B", self.value_mask))
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_LBB, buf, offset, self.type_len, self.value, self.value_mask)
+        return offset
+
+    def wire_length(self):
+        return 6
 
     @staticmethod
     def unpack(reader):
         obj = vlan_pcp_masked()
-        _type_len = reader.read("!L")[0]
+        _type_len, obj.value, obj.value_mask = reader.read_struct(_struct_LBB)
         assert(_type_len == 2147487490)
-        obj.value = reader.read("!B")[0]
-        obj.value_mask = reader.read("!B")[0]
         return obj
 
     def __eq__(self, other):
@@ -5668,6 +5858,7 @@ class vlan_pcp_masked(oxm):
 oxm.subtypes[2147487490] = vlan_pcp_masked
 
 class vlan_vid(oxm):
+    __slots__ = ["value"]
     type_len = 2147486722
 
     def __init__(self, value=None):
@@ -5677,18 +5868,19 @@ class vlan_vid(oxm):
             self.value = 0
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!L", self.type_len))
-        packed.append(struct.pack("!H", self.value))
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_LH, buf, offset, self.type_len, self.value)
+        return offset
+
+    def wire_length(self):
+        return 6
 
     @staticmethod
     def unpack(reader):
         obj = vlan_vid()
-        _type_len = reader.read("!L")[0]
+        _type_len, obj.value = reader.read_struct(_struct_LH)
         assert(_type_len == 2147486722)
-        obj.value = reader.read("!H")[0]
         return obj
 
     def __eq__(self, other):
@@ -5709,6 +5901,7 @@ class vlan_vid(oxm):
 oxm.subtypes[2147486722] = vlan_vid
 
 class vlan_vid_masked(oxm):
+    __slots__ = ["value", "value_mask"]
     type_len = 2147486980
 
     def __init__(self, value=None, value_mask=None):
@@ -5722,20 +5915,19 @@ class vlan_vid_masked(oxm):
             self.value_mask = 0
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!L", self.type_len))
-        packed.append(struct.pack("!H", self.value))
-        packed.append(struct.pack("!H", self.value_mask))
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_LHH, buf, offset, self.type_len, self.value, self.value_mask)
+        return offset
+
+    def wire_length(self):
+        return 8
 
     @staticmethod
     def unpack(reader):
         obj = vlan_vid_masked()
-        _type_len = reader.read("!L")[0]
+        _type_len, obj.value, obj.value_mask = reader.read_struct(_struct_LHH)
         assert(_type_len == 2147486980)
-        obj.value = reader.read("!H")[0]
-        obj.value_mask = reader.read("!H")[0]
         return obj
 
     def __eq__(self, other):
@@ -5760,3 +5952,203 @@ class vlan_vid_masked(oxm):
 oxm.subtypes[2147486980] = vlan_vid_masked
 
 
+# Layouts used by the table-driven OXM list codec below
+OXM_VALUE = 0
+OXM_MASKED = 1
+OXM_MAC = 2
+OXM_MAC_MASKED = 3
+
+# Every OXM made only of fixed-width fields, by type_len: (class, struct
+# covering the whole OXM including type_len, layout)
+fixed_layouts = {
+    81412: (tunnel_ipv4_src, _struct_LL, OXM_VALUE),
+    81672: (tunnel_ipv4_src_masked, _struct_LLL, OXM_MASKED),
+    81924: (tunnel_ipv4_dst, _struct_LL, OXM_VALUE),
+    82184: (tunnel_ipv4_dst_masked, _struct_LLL, OXM_MASKED),
+    197124: (bsn_lag_id, _struct_LL, OXM_VALUE),
+    197384: (bsn_lag_id_masked, _struct_LLL, OXM_MASKED),
+    197636: (bsn_vrf, _struct_LL, OXM_VALUE),
+    197896: (bsn_vrf_masked, _struct_LLL, OXM_MASKED),
+    198145: (bsn_global_vrf_allowed, _struct_LB, OXM_VALUE),
+    198402: (bsn_global_vrf_allowed_masked, _struct_LBB, OXM_MASKED),
+    198660: (bsn_l3_interface_class_id, _struct_LL, OXM_VALUE),
+    198920: (bsn_l3_interface_class_id_masked, _struct_LLL, OXM_MASKED),
+    199172: (bsn_l3_src_class_id, _struct_LL, OXM_VALUE),
+    199432: (bsn_l3_src_class_id_masked, _struct_LLL, OXM_MASKED),
+    199684: (bsn_l3_dst_class_id, _struct_LL, OXM_VALUE),
+    199944: (bsn_l3_dst_class_id_masked, _struct_LLL, OXM_MASKED),
+    200196: (bsn_egr_port_group_id, _struct_LL, OXM_VALUE),
+    200456: (bsn_egr_port_group_id_masked, _struct_LLL, OXM_MASKED),
+    200708: (bsn_udf0, _struct_LL, OXM_VALUE),
+    200968: (bsn_udf0_masked, _struct_LLL, OXM_MASKED),
+    201220: (bsn_udf1, _struct_LL, OXM_VALUE),
+    201480: (bsn_udf1_masked, _struct_LLL, OXM_MASKED),
+    201732: (bsn_udf2, _struct_LL, OXM_VALUE),
+    201992: (bsn_udf2_masked, _struct_LLL, OXM_MASKED),
+    202244: (bsn_udf3, _struct_LL, OXM_VALUE),
+    202504: (bsn_udf3_masked, _struct_LLL, OXM_MASKED),
+    202756: (bsn_udf4, _struct_LL, OXM_VALUE),
+    203016: (bsn_udf4_masked, _struct_LLL, OXM_MASKED),
+    203268: (bsn_udf5, _struct_LL, OXM_VALUE),
+    203528: (bsn_udf5_masked, _struct_LLL, OXM_MASKED),
+    203780: (bsn_udf6, _struct_LL, OXM_VALUE),
+    204040: (bsn_udf6_masked, _struct_LLL, OXM_MASKED),
+    204292: (bsn_udf7, _struct_LL, OXM_VALUE),
+    204552: (bsn_udf7_masked, _struct_LLL, OXM_MASKED),
+    204802: (bsn_tcp_flags, _struct_LH, OXM_VALUE),
+    205060: (bsn_tcp_flags_masked, _struct_LHH, OXM_MASKED),
+    205316: (bsn_vlan_xlate_port_group_id, _struct_LL, OXM_VALUE),
+    205576: (bsn_vlan_xlate_port_group_id_masked, _struct_LLL, OXM_MASKED),
+    205825: (bsn_l2_cache_hit, _struct_LB, OXM_VALUE),
+    206082: (bsn_l2_cache_hit_masked, _struct_LBB, OXM_MASKED),
+    206852: (bsn_ingress_port_group_id, _struct_LL, OXM_VALUE),
+    207112: (bsn_ingress_port_group_id_masked, _struct_LLL, OXM_MASKED),
+    2147483652: (in_port, _struct_LL, OXM_VALUE),
+    2147483912: (in_port_masked, _struct_LLL, OXM_MASKED),
+    2147484164: (in_phy_port, _struct_LL, OXM_VALUE),
+    2147484424: (in_phy_port_masked, _struct_LLL, OXM_MASKED),
+    2147484680: (metadata, _struct_LQ, OXM_VALUE),
+    2147484944: (metadata_masked, _struct_LQQ, OXM_MASKED),
+    2147485190: (eth_dst, _struct_L6B, OXM_MAC),
+    2147485452: (eth_dst_masked, _struct_L6B6B, OXM_MAC_MASKED),
+    2147485702: (eth_src, _struct_L6B, OXM_MAC),
+    2147485964: (eth_src_masked, _struct_L6B6B, OXM_MAC_MASKED),
+    2147486210: (eth_type, _struct_LH, OXM_VALUE),
+    2147486468: (eth_type_masked, _struct_LHH, OXM_MASKED),
+    2147486722: (vlan_vid, _struct_LH, OXM_VALUE),
+    2147486980: (vlan_vid_masked, _struct_LHH, OXM_MASKED),
+    2147487233: (vlan_pcp, _struct_LB, OXM_VALUE),
+    2147487490: (vlan_pcp_masked, _struct_LBB, OXM_MASKED),
+    2147487745: (ip_dscp, _struct_LB, OXM_VALUE),
+    2147488002: (ip_dscp_masked, _struct_LBB, OXM_MASKED),
+    2147488257: (ip_ecn, _struct_LB, OXM_VALUE),
+    2147488514: (ip_ecn_masked, _struct_LBB, OXM_MASKED),
+    2147488769: (ip_proto, _struct_LB, OXM_VALUE),
+    2147489026: (ip_proto_masked, _struct_LBB, OXM_MASKED),
+    2147489284: (ipv4_src, _struct_LL, OXM_VALUE),
+    2147489544: (ipv4_src_masked, _struct_LLL, OXM_MASKED),
+    2147489796: (ipv4_dst, _struct_LL, OXM_VALUE),
+    2147490056: (ipv4_dst_masked, _struct_LLL, OXM_MASKED),
+    2147490306: (tcp_src, _struct_LH, OXM_VALUE),
+    2147490564: (tcp_src_masked, _struct_LHH, OXM_MASKED),
+    2147490818: (tcp_dst, _struct_LH, OXM_VALUE),
+    2147491076: (tcp_dst_masked, _struct_LHH, OXM_MASKED),
+    2147491330: (udp_src, _struct_LH, OXM_VALUE),
+    2147491588: (udp_src_masked, _struct_LHH, OXM_MASKED),
+    2147491842: (udp_dst, _struct_LH, OXM_VALUE),
+    2147492100: (udp_dst_masked, _struct_LHH, OXM_MASKED),
+    2147492354: (sctp_src, _struct_LH, OXM_VALUE),
+    2147492612: (sctp_src_masked, _struct_LHH, OXM_MASKED),
+    2147492866: (sctp_dst, _struct_LH, OXM_VALUE),
+    2147493124: (sctp_dst_masked, _struct_LHH, OXM_MASKED),
+    2147493377: (icmpv4_type, _struct_LB, OXM_VALUE),
+    2147493634: (icmpv4_type_masked, _struct_LBB, OXM_MASKED),
+    2147493889: (icmpv4_code, _struct_LB, OXM_VALUE),
+    2147494146: (icmpv4_code_masked, _struct_LBB, OXM_MASKED),
+    2147494402: (arp_op, _struct_LH, OXM_VALUE),
+    2147494660: (arp_op_masked, _struct_LHH, OXM_MASKED),
+    2147494916: (arp_spa, _struct_LL, OXM_VALUE),
+    2147495176: (arp_spa_masked, _struct_LLL, OXM_MASKED),
+    2147495428: (arp_tpa, _struct_LL, OXM_VALUE),
+    2147495688: (arp_tpa_masked, _struct_LLL, OXM_MASKED),
+    2147495942: (arp_sha, _struct_L6B, OXM_MAC),
+    2147496204: (arp_sha_masked, _struct_L6B6B, OXM_MAC_MASKED),
+    2147496454: (arp_tha, _struct_L6B, OXM_MAC),
+    2147496716: (arp_tha_masked, _struct_L6B6B, OXM_MAC_MASKED),
+    2147496976: (ipv6_src, _struct_L16s, OXM_VALUE),
+    2147497248: (ipv6_src_masked, _struct_L16s16s, OXM_MASKED),
+    2147497488: (ipv6_dst, _struct_L16s, OXM_VALUE),
+    2147497760: (ipv6_dst_masked, _struct_L16s16s, OXM_MASKED),
+    2147497988: (ipv6_flabel, _struct_LL, OXM_VALUE),
+    2147498248: (ipv6_flabel_masked, _struct_LLL, OXM_MASKED),
+    2147498497: (icmpv6_type, _struct_LB, OXM_VALUE),
+    2147498754: (icmpv6_type_masked, _struct_LBB, OXM_MASKED),
+    2147499009: (icmpv6_code, _struct_LB, OXM_VALUE),
+    2147499266: (icmpv6_code_masked, _struct_LBB, OXM_MASKED),
+    2147499536: (ipv6_nd_target, _struct_L16s, OXM_VALUE),
+    2147499808: (ipv6_nd_target_masked, _struct_L16s16s, OXM_MASKED),
+    2147500038: (ipv6_nd_sll, _struct_L6B, OXM_MAC),
+    2147500300: (ipv6_nd_sll_masked, _struct_L6B6B, OXM_MAC_MASKED),
+    2147500550: (ipv6_nd_tll, _struct_L6B, OXM_MAC),
+    2147500812: (ipv6_nd_tll_masked, _struct_L6B6B, OXM_MAC_MASKED),
+    2147501060: (mpls_label, _struct_LL, OXM_VALUE),
+    2147501320: (mpls_label_masked, _struct_LLL, OXM_MASKED),
+    2147501569: (mpls_tc, _struct_LB, OXM_VALUE),
+    2147501826: (mpls_tc_masked, _struct_LBB, OXM_MASKED),
+    2147502081: (mpls_bos, _struct_LB, OXM_VALUE),
+    2147502338: (mpls_bos_masked, _struct_LBB, OXM_MASKED),
+    2147503112: (tunnel_id, _struct_LQ, OXM_VALUE),
+    2147503376: (tunnel_id_masked, _struct_LQQ, OXM_MASKED),
+    2147503618: (ipv6_exthdr, _struct_LH, OXM_VALUE),
+    2147503876: (ipv6_exthdr_masked, _struct_LHH, OXM_MASKED),
+}
+
+# The same layouts by class, for encoding
+fixed_layouts_by_class = dict((cls, (st, layout)) for (cls, st, layout) in fixed_layouts.values())
+
+def unpack_list(reader):
+    """
+    Decode the OXMs filling the rest of reader.
+
+    Fixed-layout OXMs are decoded in a single loop straight from the
+    buffer; anything else falls back to oxm.unpack.
+    """
+    entries = []
+    buf = reader.buf
+    base = reader.start
+    pos = base + reader.offset
+    end = base + reader.length
+    while pos < end:
+        if pos + 4 > end:
+            raise loxi.ProtocolError("Buffer too short")
+        type_len, = _struct_L.unpack_from(buf, pos)
+        entry = fixed_layouts.get(type_len)
+        if entry is None:
+            reader.offset = pos - base
+            entries.append(oxm.unpack(reader))
+            pos = base + reader.offset
+            continue
+        cls, st, layout = entry
+        if pos + st.size > end:
+            raise loxi.ProtocolError("Buffer too short")
+        fields = st.unpack_from(buf, pos)
+        pos += st.size
+        obj = cls.__new__(cls)
+        if layout == OXM_VALUE:
+            obj.value = fields[1]
+        elif layout == OXM_MASKED:
+            obj.value = fields[1]
+            obj.value_mask = fields[2]
+        elif layout == OXM_MAC:
+            obj.value = list(fields[1:7])
+        else:
+            obj.value = list(fields[1:7])
+            obj.value_mask = list(fields[7:13])
+        entries.append(obj)
+    reader.offset = pos - base
+    return entries
+
+def pack_list_into(values, buf, offset):
+    """
+    Encode a list of OXMs into buf at offset and return the offset past
+    the last one. The counterpart of unpack_list.
+    """
+    for obj in values:
+        entry = fixed_layouts_by_class.get(type(obj))
+        if entry is None:
+            offset = obj.pack_into(buf, offset)
+            continue
+        st, layout = entry
+        end = offset + st.size
+        if end > len(buf):
+            buf.extend("\x00" * (end - len(buf)))
+        if layout == OXM_VALUE:
+            st.pack_into(buf, offset, obj.type_len, obj.value)
+        elif layout == OXM_MASKED:
+            st.pack_into(buf, offset, obj.type_len, obj.value, obj.value_mask)
+        elif layout == OXM_MAC:
+            st.pack_into(buf, offset, obj.type_len, *obj.value)
+        else:
+            st.pack_into(buf, offset, obj.type_len, *(obj.value + obj.value_mask))
+        offset = end
+    return offset
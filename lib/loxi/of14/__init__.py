@@ -7,24 +7,32 @@
 # Do not modify
 
 import const
-import port_desc_prop
-import bsn_tlv
 import meter_band
-import table_mod_prop
 import instruction
-import queue_desc_prop
 import oxm
-import bundle_prop
 import common
 import instruction_id
 import action
-import role_prop
 import message
-import queue_stats_prop
-import port_stats_prop
-import port_mod_prop
-import async_config_prop
 import action_id
 from const import *
 from common import *
 from loxi import ProtocolError
+
+# Rarely used families, imported on first reference
+import loxi
+lazy_modules = (
+    "bsn_tlv",
+    "port_desc_prop",
+    "table_mod_prop",
+    "queue_desc_prop",
+    "bundle_prop",
+    "role_prop",
+    "queue_stats_prop",
+    "port_stats_prop",
+    "port_mod_prop",
+    "async_config_prop",
+)
+for _name in lazy_modules:
+    globals()[_name] = loxi.LazyModule(__name__, _name)
+del _name
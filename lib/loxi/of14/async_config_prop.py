@@ -14,7 +14,13 @@ import loxi.generic_util
 import sys
 ofp = sys.modules['loxi.of14']
 
+# Precompiled layouts for the fixed-length parts of each pack_into() and unpack()
+_struct_H = struct.Struct("!H")
+_struct_HH = struct.Struct("!HH")
+_struct_HHL = struct.Struct("!HHL")
+
 class async_config_prop(loxi.OFObject):
+    __slots__ = ["type"]
     subtypes = {}
 
 
@@ -25,13 +31,15 @@ class async_config_prop(loxi.OFObject):
             self.type = 0
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!H", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
-        length = sum([len(x) for x in packed])
-        packed[1] = struct.pack("!H", length)
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_HH, buf, offset, self.type, 0)
+        length = offset - start
+        _struct_H.pack_into(buf, start + 2, length)
+        return offset
+
+    def wire_length(self):
+        return 4
 
     @staticmethod
     def unpack(reader):
@@ -41,8 +49,7 @@ class async_config_prop(loxi.OFObject):
             return subclass.unpack(reader)
 
         obj = async_config_prop()
-        obj.type = reader.read("!H")[0]
-        _length = reader.read("!H")[0]
+        obj.type, _length = reader.read_struct(_struct_HH)
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
         return obj
@@ -62,25 +69,27 @@ class async_config_prop(loxi.OFObject):
 
 
 class experimenter_master(async_config_prop):
+    __slots__ = []
     type = 65535
 
     def __init__(self):
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!H", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
-        length = sum([len(x) for x in packed])
-        packed[1] = struct.pack("!H", length)
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_HH, buf, offset, self.type, 0)
+        length = offset - start
+        _struct_H.pack_into(buf, start + 2, length)
+        return offset
+
+    def wire_length(self):
+        return 4
 
     @staticmethod
     def unpack(reader):
         obj = experimenter_master()
-        _type = reader.read("!H")[0]
+        _type, _length = reader.read_struct(_struct_HH)
         assert(_type == 65535)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
         return obj
@@ -100,25 +109,27 @@ class experimenter_master(async_config_prop):
 async_config_prop.subtypes[65535] = experimenter_master
 
 class experimenter_slave(async_config_prop):
+    __slots__ = []
     type = 65534
 
     def __init__(self):
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!H", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
-        length = sum([len(x) for x in packed])
-        packed[1] = struct.pack("!H", length)
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_HH, buf, offset, self.type, 0)
+        length = offset - start
+        _struct_H.pack_into(buf, start + 2, length)
+        return offset
+
+    def wire_length(self):
+        return 4
 
     @staticmethod
     def unpack(reader):
         obj = experimenter_slave()
-        _type = reader.read("!H")[0]
+        _type, _length = reader.read_struct(_struct_HH)
         assert(_type == 65534)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
         return obj
@@ -138,6 +149,7 @@ class experimenter_slave(async_config_prop):
 async_config_prop.subtypes[65534] = experimenter_slave
 
 class flow_removed_master(async_config_prop):
+    __slots__ = ["mask"]
     type = 5
 
     def __init__(self, mask=None):
@@ -147,21 +159,21 @@ class flow_removed_master(async_config_prop):
             self.mask = 0
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!H", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
-        packed.append(struct.pack("!L", self.mask))
-        length = sum([len(x) for x in packed])
-        packed[1] = struct.pack("!H", length)
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_HHL, buf, offset, self.type, 0, self.mask)
+        length = offset - start
+        _struct_H.pack_into(buf, start + 2, length)
+        return offset
+
+    def wire_length(self):
+        return 8
 
     @staticmethod
     def unpack(reader):
         obj = flow_removed_master()
-        _type = reader.read("!H")[0]
+        _type, _length = reader.read_struct(_struct_HH)
         assert(_type == 5)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
         obj.mask = reader.read("!L")[0]
@@ -185,6 +197,7 @@ class flow_removed_master(async_config_prop):
 async_config_prop.subtypes[5] = flow_removed_master
 
 class flow_removed_slave(async_config_prop):
+    __slots__ = ["mask"]
     type = 4
 
     def __init__(self, mask=None):
@@ -194,21 +207,21 @@ class flow_removed_slave(async_config_prop):
             self.mask = 0
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!H", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
-        packed.append(struct.pack("!L", self.mask))
-        length = sum([len(x) for x in packed])
-        packed[1] = struct.pack("!H", length)
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_HHL, buf, offset, self.type, 0, self.mask)
+        length = offset - start
+        _struct_H.pack_into(buf, start + 2, length)
+        return offset
+
+    def wire_length(self):
+        return 8
 
     @staticmethod
     def unpack(reader):
         obj = flow_removed_slave()
-        _type = reader.read("!H")[0]
+        _type, _length = reader.read_struct(_struct_HH)
         assert(_type == 4)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
         obj.mask = reader.read("!L")[0]
@@ -232,6 +245,7 @@ class flow_removed_slave(async_config_prop):
 async_config_prop.subtypes[4] = flow_removed_slave
 
 class packet_in_master(async_config_prop):
+    __slots__ = ["mask"]
     type = 1
 
     def __init__(self, mask=None):
@@ -241,21 +255,21 @@ class packet_in_master(async_config_prop):
             self.mask = 0
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!H", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
-        packed.append(struct.pack("!L", self.mask))
-        length = sum([len(x) for x in packed])
-        packed[1] = struct.pack("!H", length)
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_HHL, buf, offset, self.type, 0, self.mask)
+        length = offset - start
+        _struct_H.pack_into(buf, start + 2, length)
+        return offset
+
+    def wire_length(self):
+        return 8
 
     @staticmethod
     def unpack(reader):
         obj = packet_in_master()
-        _type = reader.read("!H")[0]
+        _type, _length = reader.read_struct(_struct_HH)
         assert(_type == 1)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
         obj.mask = reader.read("!L")[0]
@@ -279,6 +293,7 @@ class packet_in_master(async_config_prop):
 async_config_prop.subtypes[1] = packet_in_master
 
 class packet_in_slave(async_config_prop):
+    __slots__ = ["mask"]
     type = 0
 
     def __init__(self, mask=None):
@@ -288,21 +303,21 @@ class packet_in_slave(async_config_prop):
             self.mask = 0
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!H", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
-        packed.append(struct.pack("!L", self.mask))
-        length = sum([len(x) for x in packed])
-        packed[1] = struct.pack("!H", length)
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_HHL, buf, offset, self.type, 0, self.mask)
+        length = offset - start
+        _struct_H.pack_into(buf, start + 2, length)
+        return offset
+
+    def wire_length(self):
+        return 8
 
     @staticmethod
     def unpack(reader):
         obj = packet_in_slave()
-        _type = reader.read("!H")[0]
+        _type, _length = reader.read_struct(_struct_HH)
         assert(_type == 0)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
         obj.mask = reader.read("!L")[0]
@@ -326,6 +341,7 @@ class packet_in_slave(async_config_prop):
 async_config_prop.subtypes[0] = packet_in_slave
 
 class port_status_master(async_config_prop):
+    __slots__ = ["mask"]
     type = 3
 
     def __init__(self, mask=None):
@@ -335,21 +351,21 @@ class port_status_master(async_config_prop):
             self.mask = 0
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!H", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
-        packed.append(struct.pack("!L", self.mask))
-        length = sum([len(x) for x in packed])
-        packed[1] = struct.pack("!H", length)
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_HHL, buf, offset, self.type, 0, self.mask)
+        length = offset - start
+        _struct_H.pack_into(buf, start + 2, length)
+        return offset
+
+    def wire_length(self):
+        return 8
 
     @staticmethod
     def unpack(reader):
         obj = port_status_master()
-        _type = reader.read("!H")[0]
+        _type, _length = reader.read_struct(_struct_HH)
         assert(_type == 3)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
         obj.mask = reader.read("!L")[0]
@@ -373,6 +389,7 @@ class port_status_master(async_config_prop):
 async_config_prop.subtypes[3] = port_status_master
 
 class port_status_slave(async_config_prop):
+    __slots__ = ["mask"]
     type = 2
 
     def __init__(self, mask=None):
@@ -382,21 +399,21 @@ class port_status_slave(async_config_prop):
             self.mask = 0
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!H", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
-        packed.append(struct.pack("!L", self.mask))
-        length = sum([len(x) for x in packed])
-        packed[1] = struct.pack("!H", length)
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_HHL, buf, offset, self.type, 0, self.mask)
+        length = offset - start
+        _struct_H.pack_into(buf, start + 2, length)
+        return offset
+
+    def wire_length(self):
+        return 8
 
     @staticmethod
     def unpack(reader):
         obj = port_status_slave()
-        _type = reader.read("!H")[0]
+        _type, _length = reader.read_struct(_struct_HH)
         assert(_type == 2)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
         obj.mask = reader.read("!L")[0]
@@ -420,6 +437,7 @@ class port_status_slave(async_config_prop):
 async_config_prop.subtypes[2] = port_status_slave
 
 class requestforward_master(async_config_prop):
+    __slots__ = ["mask"]
     type = 11
 
     def __init__(self, mask=None):
@@ -429,21 +447,21 @@ class requestforward_master(async_config_prop):
             self.mask = 0
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!H", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
-        packed.append(struct.pack("!L", self.mask))
-        length = sum([len(x) for x in packed])
-        packed[1] = struct.pack("!H", length)
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_HHL, buf, offset, self.type, 0, self.mask)
+        length = offset - start
+        _struct_H.pack_into(buf, start + 2, length)
+        return offset
+
+    def wire_length(self):
+        return 8
 
     @staticmethod
     def unpack(reader):
         obj = requestforward_master()
-        _type = reader.read("!H")[0]
+        _type, _length = reader.read_struct(_struct_HH)
         assert(_type == 11)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
         obj.mask = reader.read("!L")[0]
@@ -467,6 +485,7 @@ class requestforward_master(async_config_prop):
 async_config_prop.subtypes[11] = requestforward_master
 
 class requestforward_slave(async_config_prop):
+    __slots__ = ["mask"]
     type = 10
 
     def __init__(self, mask=None):
@@ -476,21 +495,21 @@ class requestforward_slave(async_config_prop):
             self.mask = 0
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!H", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
-        packed.append(struct.pack("!L", self.mask))
-        length = sum([len(x) for x in packed])
-        packed[1] = struct.pack("!H", length)
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_HHL, buf, offset, self.type, 0, self.mask)
+        length = offset - start
+        _struct_H.pack_into(buf, start + 2, length)
+        return offset
+
+    def wire_length(self):
+        return 8
 
     @staticmethod
     def unpack(reader):
         obj = requestforward_slave()
-        _type = reader.read("!H")[0]
+        _type, _length = reader.read_struct(_struct_HH)
         assert(_type == 10)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
         obj.mask = reader.read("!L")[0]
@@ -514,6 +533,7 @@ class requestforward_slave(async_config_prop):
 async_config_prop.subtypes[10] = requestforward_slave
 
 class role_status_master(async_config_prop):
+    __slots__ = ["mask"]
     type = 7
 
     def __init__(self, mask=None):
@@ -523,21 +543,21 @@ class role_status_master(async_config_prop):
             self.mask = 0
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!H", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
-        packed.append(struct.pack("!L", self.mask))
-        length = sum([len(x) for x in packed])
-        packed[1] = struct.pack("!H", length)
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_HHL, buf, offset, self.type, 0, self.mask)
+        length = offset - start
+        _struct_H.pack_into(buf, start + 2, length)
+        return offset
+
+    def wire_length(self):
+        return 8
 
     @staticmethod
     def unpack(reader):
         obj = role_status_master()
-        _type = reader.read("!H")[0]
+        _type, _length = reader.read_struct(_struct_HH)
         assert(_type == 7)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
         obj.mask = reader.read("!L")[0]
@@ -561,6 +581,7 @@ class role_status_master(async_config_prop):
 async_config_prop.subtypes[7] = role_status_master
 
 class role_status_slave(async_config_prop):
+    __slots__ = ["mask"]
     type = 6
 
     def __init__(self, mask=None):
@@ -570,21 +591,21 @@ class role_status_slave(async_config_prop):
             self.mask = 0
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!H", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
-        packed.append(struct.pack("!L", self.mask))
-        length = sum([len(x) for x in packed])
-        packed[1] = struct.pack("!H", length)
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_HHL, buf, offset, self.type, 0, self.mask)
+        length = offset - start
+        _struct_H.pack_into(buf, start + 2, length)
+        return offset
+
+    def wire_length(self):
+        return 8
 
     @staticmethod
     def unpack(reader):
         obj = role_status_slave()
-        _type = reader.read("!H")[0]
+        _type, _length = reader.read_struct(_struct_HH)
         assert(_type == 6)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
         obj.mask = reader.read("!L")[0]
@@ -608,6 +629,7 @@ class role_status_slave(async_config_prop):
 async_config_prop.subtypes[6] = role_status_slave
 
 class table_status_master(async_config_prop):
+    __slots__ = ["mask"]
     type = 9
 
     def __init__(self, mask=None):
@@ -617,21 +639,21 @@ class table_status_master(async_config_prop):
             self.mask = 0
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!H", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
-        packed.append(struct.pack("!L", self.mask))
-        length = sum([len(x) for x in packed])
-        packed[1] = struct.pack("!H", length)
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_HHL, buf, offset, self.type, 0, self.mask)
+        length = offset - start
+        _struct_H.pack_into(buf, start + 2, length)
+        return offset
+
+    def wire_length(self):
+        return 8
 
     @staticmethod
     def unpack(reader):
         obj = table_status_master()
-        _type = reader.read("!H")[0]
+        _type, _length = reader.read_struct(_struct_HH)
         assert(_type == 9)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
         obj.mask = reader.read("!L")[0]
@@ -655,6 +677,7 @@ class table_status_master(async_config_prop):
 async_config_prop.subtypes[9] = table_status_master
 
 class table_status_slave(async_config_prop):
+    __slots__ = ["mask"]
     type = 8
 
     def __init__(self, mask=None):
@@ -664,21 +687,21 @@ class table_status_slave(async_config_prop):
             self.mask = 0
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!H", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
-        packed.append(struct.pack("!L", self.mask))
-        length = sum([len(x) for x in packed])
-        packed[1] = struct.pack("!H", length)
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_HHL, buf, offset, self.type, 0, self.mask)
+        length = offset - start
+        _struct_H.pack_into(buf, start + 2, length)
+        return offset
+
+    def wire_length(self):
+        return 8
 
     @staticmethod
     def unpack(reader):
         obj = table_status_slave()
-        _type = reader.read("!H")[0]
+        _type, _length = reader.read_struct(_struct_HH)
         assert(_type == 8)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
         obj.mask = reader.read("!L")[0]
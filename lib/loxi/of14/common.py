@@ -14,7 +14,64 @@ import loxi.generic_util
 import sys
 ofp = sys.modules['loxi.of14']
 
+# Precompiled layouts for the fixed-length parts of each pack_into() and unpack()
+_struct_16sLL = struct.Struct("!16sLL")
+_struct_256s = struct.Struct("!256s")
+_struct_2x16sLL = struct.Struct("!2x16sLL")
+_struct_6B = struct.Struct("!6B")
+_struct_B = struct.Struct("!B")
+_struct_B3xLQQ = struct.Struct("!B3xLQQ")
+_struct_B5x32sQQLL = struct.Struct("!B5x32sQQLL")
+_struct_BB2xL256s = struct.Struct("!BB2xL256s")
+_struct_BBBx = struct.Struct("!BBBx")
+_struct_BQ = struct.Struct("!BQ")
+_struct_BxL = struct.Struct("!BxL")
+_struct_BxLLHHHHH2xQQQ = struct.Struct("!BxLLHHHHH2xQQQ")
+_struct_H = struct.Struct("!H")
+_struct_H2xL = struct.Struct("!H2xL")
+_struct_H2xLL4xQQLL = struct.Struct("!H2xLL4xQQLL")
+_struct_H2xLLLQQQQQQQQ = struct.Struct("!H2xLLLQQQQQQQQ")
+_struct_H32sLL4x = struct.Struct("!H32sLL4x")
+_struct_H6xLLQQQLL = struct.Struct("!H6xLLQQQLL")
+_struct_HB5x32sQQLL = struct.Struct("!HB5x32sQQLL")
+_struct_HBxL = struct.Struct("!HBxL")
+_struct_HBxLLHHHHH2xQQQ = struct.Struct("!HBxLLHHHHH2xQQQ")
+_struct_HH = struct.Struct("!HH")
+_struct_HH32sLL4x = struct.Struct("!HH32sLL4x")
+_struct_HH4x = struct.Struct("!HH4x")
+_struct_HH4xH6x = struct.Struct("!HH4xH6x")
+_struct_HH4xL4x = struct.Struct("!HH4xL4x")
+_struct_HHBBBx = struct.Struct("!HHBBBx")
+_struct_HHH2x = struct.Struct("!HHH2x")
+_struct_HHHBxH = struct.Struct("!HHHBxH")
+_struct_HHL = struct.Struct("!HHL")
+_struct_HHLHHHH16s = struct.Struct("!HHLHHHH16s")
+_struct_HHLL = struct.Struct("!HHLL")
+_struct_HHLL4x = struct.Struct("!HHLL4x")
+_struct_HHLLL = struct.Struct("!HHLLL")
+_struct_HL = struct.Struct("!HL")
+_struct_HLL4x = struct.Struct("!HLL4x")
+_struct_L = struct.Struct("!L")
+_struct_LH = struct.Struct("!LH")
+_struct_LH2x = struct.Struct("!LH2x")
+_struct_LH6xLQQLL = struct.Struct("!LH6xLQQLL")
+_struct_LHHHH16s = struct.Struct("!LHHHH16s")
+_struct_LL = struct.Struct("!LL")
+_struct_LL4xQQLL = struct.Struct("!LL4xQQLL")
+_struct_LLBB2xLL16s = struct.Struct("!LLBB2xLL16s")
+_struct_LLH = struct.Struct("!LLH")
+_struct_LLH6x = struct.Struct("!LLH6x")
+_struct_LLL = struct.Struct("!LLL")
+_struct_LLLBB2x = struct.Struct("!LLLBB2x")
+_struct_LLLQQQQQQQQ = struct.Struct("!LLLQQQQQQQQ")
+_struct_LLQQQLL = struct.Struct("!LLQQQLL")
+_struct_LQQLL = struct.Struct("!LQQLL")
+_struct_Q = struct.Struct("!Q")
+_struct_Q64s256s = struct.Struct("!Q64s256s")
+_struct_QQ = struct.Struct("!QQ")
+
 class bsn_controller_connection(loxi.OFObject):
+    __slots__ = ["auxiliary_id", "role", "state", "uri"]
 
     def __init__(self, state=None, auxiliary_id=None, role=None, uri=None):
         if state != None:
@@ -35,23 +92,19 @@ class bsn_controller_connection(loxi.OFObject):
             self.uri = ""
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!B", self.state))
-        packed.append(struct.pack("!B", self.auxiliary_id))
-        packed.append('\x00' * 2)
-        packed.append(struct.pack("!L", self.role))
-        packed.append(struct.pack("!256s", self.uri))
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_BB2xL256s, buf, offset, self.state, self.auxiliary_id, self.role, self.uri)
+        return offset
+
+    def wire_length(self):
+        return 264
 
     @staticmethod
     def unpack(reader):
         obj = bsn_controller_connection()
-        obj.state = reader.read("!B")[0]
-        obj.auxiliary_id = reader.read("!B")[0]
-        reader.skip(2)
-        obj.role = reader.read("!L")[0]
-        obj.uri = reader.read("!256s")[0].rstrip("\x00")
+        obj.state, obj.auxiliary_id, obj.role, obj.uri = reader.read_struct(_struct_BB2xL256s)
+        obj.uri = obj.uri.rstrip("\x00")
         return obj
 
     def __eq__(self, other):
@@ -83,6 +136,7 @@ class bsn_controller_connection(loxi.OFObject):
 
 
 class bsn_debug_counter_desc_stats_entry(loxi.OFObject):
+    __slots__ = ["counter_id", "description", "name"]
 
     def __init__(self, counter_id=None, name=None, description=None):
         if counter_id != None:
@@ -99,19 +153,20 @@ class bsn_debug_counter_desc_stats_entry(loxi.OFObject):
             self.description = ""
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!Q", self.counter_id))
-        packed.append(struct.pack("!64s", self.name))
-        packed.append(struct.pack("!256s", self.description))
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_Q64s256s, buf, offset, self.counter_id, self.name, self.description)
+        return offset
+
+    def wire_length(self):
+        return 328
 
     @staticmethod
     def unpack(reader):
         obj = bsn_debug_counter_desc_stats_entry()
-        obj.counter_id = reader.read("!Q")[0]
-        obj.name = reader.read("!64s")[0].rstrip("\x00")
-        obj.description = reader.read("!256s")[0].rstrip("\x00")
+        obj.counter_id, obj.name, obj.description = reader.read_struct(_struct_Q64s256s)
+        obj.name = obj.name.rstrip("\x00")
+        obj.description = obj.description.rstrip("\x00")
         return obj
 
     def __eq__(self, other):
@@ -139,6 +194,7 @@ class bsn_debug_counter_desc_stats_entry(loxi.OFObject):
 
 
 class bsn_debug_counter_stats_entry(loxi.OFObject):
+    __slots__ = ["counter_id", "value"]
 
     def __init__(self, counter_id=None, value=None):
         if counter_id != None:
@@ -151,17 +207,18 @@ class bsn_debug_counter_stats_entry(loxi.OFObject):
             self.value = 0
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!Q", self.counter_id))
-        packed.append(struct.pack("!Q", self.value))
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_QQ, buf, offset, self.counter_id, self.value)
+        return offset
+
+    def wire_length(self):
+        return 16
 
     @staticmethod
     def unpack(reader):
         obj = bsn_debug_counter_stats_entry()
-        obj.counter_id = reader.read("!Q")[0]
-        obj.value = reader.read("!Q")[0]
+        obj.counter_id, obj.value = reader.read_struct(_struct_QQ)
         return obj
 
     def __eq__(self, other):
@@ -185,6 +242,7 @@ class bsn_debug_counter_stats_entry(loxi.OFObject):
 
 
 class bsn_flow_checksum_bucket_stats_entry(loxi.OFObject):
+    __slots__ = ["checksum"]
 
     def __init__(self, checksum=None):
         if checksum != None:
@@ -193,10 +251,13 @@ class bsn_flow_checksum_bucket_stats_entry(loxi.OFObject):
             self.checksum = 0
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!Q", self.checksum))
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_Q, buf, offset, self.checksum)
+        return offset
+
+    def wire_length(self):
+        return 8
 
     @staticmethod
     def unpack(reader):
@@ -221,6 +282,7 @@ class bsn_flow_checksum_bucket_stats_entry(loxi.OFObject):
 
 
 class bsn_generic_stats_entry(loxi.OFObject):
+    __slots__ = ["tlvs"]
 
     def __init__(self, tlvs=None):
         if tlvs != None:
@@ -229,13 +291,16 @@ class bsn_generic_stats_entry(loxi.OFObject):
             self.tlvs = []
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 0
-        packed.append(loxi.generic_util.pack_list(self.tlvs))
-        length = sum([len(x) for x in packed])
-        packed[0] = struct.pack("!H", length)
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_H, buf, offset, 0)
+        offset = loxi.generic_util.pack_list_into(self.tlvs, buf, offset)
+        length = offset - start
+        _struct_H.pack_into(buf, start + 0, length)
+        return offset
+
+    def wire_length(self):
+        return 2 + loxi.generic_util.list_wire_length(self.tlvs)
 
     @staticmethod
     def unpack(reader):
@@ -263,6 +328,7 @@ class bsn_generic_stats_entry(loxi.OFObject):
 
 
 class bsn_gentable_bucket_stats_entry(loxi.OFObject):
+    __slots__ = ["checksum"]
 
     def __init__(self, checksum=None):
         if checksum != None:
@@ -271,10 +337,13 @@ class bsn_gentable_bucket_stats_entry(loxi.OFObject):
             self.checksum = 0
         return
 
-    def pack(self):
-        packed = []
-        packed.append(util.pack_checksum_128(self.checksum))
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_bytes_into(util.pack_checksum_128(self.checksum), buf, offset)
+        return offset
+
+    def wire_length(self):
+        return 16
 
     @staticmethod
     def unpack(reader):
@@ -299,6 +368,7 @@ class bsn_gentable_bucket_stats_entry(loxi.OFObject):
 
 
 class bsn_gentable_desc_stats_entry(loxi.OFObject):
+    __slots__ = ["buckets_size", "max_entries", "name", "table_id"]
 
     def __init__(self, table_id=None, name=None, buckets_size=None, max_entries=None):
         if table_id != None:
@@ -319,17 +389,15 @@ class bsn_gentable_desc_stats_entry(loxi.OFObject):
             self.max_entries = 0
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 0
-        packed.append(struct.pack("!H", self.table_id))
-        packed.append(struct.pack("!32s", self.name))
-        packed.append(struct.pack("!L", self.buckets_size))
-        packed.append(struct.pack("!L", self.max_entries))
-        packed.append('\x00' * 4)
-        length = sum([len(x) for x in packed])
-        packed[0] = struct.pack("!H", length)
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_HH32sLL4x, buf, offset, 0, self.table_id, self.name, self.buckets_size, self.max_entries)
+        length = offset - start
+        _struct_H.pack_into(buf, start + 0, length)
+        return offset
+
+    def wire_length(self):
+        return 48
 
     @staticmethod
     def unpack(reader):
@@ -337,11 +405,8 @@ class bsn_gentable_desc_stats_entry(loxi.OFObject):
         _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 2)
-        obj.table_id = reader.read("!H")[0]
-        obj.name = reader.read("!32s")[0].rstrip("\x00")
-        obj.buckets_size = reader.read("!L")[0]
-        obj.max_entries = reader.read("!L")[0]
-        reader.skip(4)
+        obj.table_id, obj.name, obj.buckets_size, obj.max_entries = reader.read_struct(_struct_H32sLL4x)
+        obj.name = obj.name.rstrip("\x00")
         return obj
 
     def __eq__(self, other):
@@ -373,6 +438,7 @@ class bsn_gentable_desc_stats_entry(loxi.OFObject):
 
 
 class bsn_gentable_entry_desc_stats_entry(loxi.OFObject):
+    __slots__ = ["checksum", "key", "value"]
 
     def __init__(self, checksum=None, key=None, value=None):
         if checksum != None:
@@ -389,17 +455,20 @@ class bsn_gentable_entry_desc_stats_entry(loxi.OFObject):
             self.value = []
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 0
-        packed.append(struct.pack("!H", 0)) # placeholder for key_length at index 1
-        packed.append(util.pack_checksum_128(self.checksum))
-        packed.append(loxi.generic_util.pack_list(self.key))
-        packed[1] = struct.pack("!H", len(packed[-1]))
-        packed.append(loxi.generic_util.pack_list(self.value))
-        length = sum([len(x) for x in packed])
-        packed[0] = struct.pack("!H", length)
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_HH, buf, offset, 0, 0)
+        offset = loxi.generic_util.pack_bytes_into(util.pack_checksum_128(self.checksum), buf, offset)
+        mark = offset
+        offset = loxi.generic_util.pack_list_into(self.key, buf, offset)
+        _struct_H.pack_into(buf, start + 2, offset - mark)
+        offset = loxi.generic_util.pack_list_into(self.value, buf, offset)
+        length = offset - start
+        _struct_H.pack_into(buf, start + 0, length)
+        return offset
+
+    def wire_length(self):
+        return 20 + loxi.generic_util.list_wire_length(self.key) + loxi.generic_util.list_wire_length(self.value)
 
     @staticmethod
     def unpack(reader):
@@ -438,6 +507,7 @@ class bsn_gentable_entry_desc_stats_entry(loxi.OFObject):
 
 
 class bsn_gentable_entry_stats_entry(loxi.OFObject):
+    __slots__ = ["key", "stats"]
 
     def __init__(self, key=None, stats=None):
         if key != None:
@@ -450,16 +520,19 @@ class bsn_gentable_entry_stats_entry(loxi.OFObject):
             self.stats = []
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 0
-        packed.append(struct.pack("!H", 0)) # placeholder for key_length at index 1
-        packed.append(loxi.generic_util.pack_list(self.key))
-        packed[1] = struct.pack("!H", len(packed[-1]))
-        packed.append(loxi.generic_util.pack_list(self.stats))
-        length = sum([len(x) for x in packed])
-        packed[0] = struct.pack("!H", length)
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_HH, buf, offset, 0, 0)
+        mark = offset
+        offset = loxi.generic_util.pack_list_into(self.key, buf, offset)
+        _struct_H.pack_into(buf, start + 2, offset - mark)
+        offset = loxi.generic_util.pack_list_into(self.stats, buf, offset)
+        length = offset - start
+        _struct_H.pack_into(buf, start + 0, length)
+        return offset
+
+    def wire_length(self):
+        return 4 + loxi.generic_util.list_wire_length(self.key) + loxi.generic_util.list_wire_length(self.stats)
 
     @staticmethod
     def unpack(reader):
@@ -493,6 +566,7 @@ class bsn_gentable_entry_stats_entry(loxi.OFObject):
 
 
 class bsn_gentable_stats_entry(loxi.OFObject):
+    __slots__ = ["checksum", "entry_count", "table_id"]
 
     def __init__(self, table_id=None, entry_count=None, checksum=None):
         if table_id != None:
@@ -509,20 +583,19 @@ class bsn_gentable_stats_entry(loxi.OFObject):
             self.checksum = 0
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!H", self.table_id))
-        packed.append('\x00' * 2)
-        packed.append(struct.pack("!L", self.entry_count))
-        packed.append(util.pack_checksum_128(self.checksum))
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_H2xL, buf, offset, self.table_id, self.entry_count)
+        offset = loxi.generic_util.pack_bytes_into(util.pack_checksum_128(self.checksum), buf, offset)
+        return offset
+
+    def wire_length(self):
+        return 24
 
     @staticmethod
     def unpack(reader):
         obj = bsn_gentable_stats_entry()
-        obj.table_id = reader.read("!H")[0]
-        reader.skip(2)
-        obj.entry_count = reader.read("!L")[0]
+        obj.table_id, obj.entry_count = reader.read_struct(_struct_H2xL)
         obj.checksum = util.unpack_checksum_128(reader)
         return obj
 
@@ -551,6 +624,7 @@ class bsn_gentable_stats_entry(loxi.OFObject):
 
 
 class bsn_interface(loxi.OFObject):
+    __slots__ = ["hw_addr", "ipv4_addr", "ipv4_netmask", "name"]
 
     def __init__(self, hw_addr=None, name=None, ipv4_addr=None, ipv4_netmask=None):
         if hw_addr != None:
@@ -571,23 +645,22 @@ class bsn_interface(loxi.OFObject):
             self.ipv4_netmask = 0
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!6B", *self.hw_addr))
-        packed.append('\x00' * 2)
-        packed.append(struct.pack("!16s", self.name))
-        packed.append(struct.pack("!L", self.ipv4_addr))
-        packed.append(struct.pack("!L", self.ipv4_netmask))
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_6B, buf, offset, *self.hw_addr)
+        offset = loxi.generic_util.pack_struct_into(_struct_2x16sLL, buf, offset, self.name, self.ipv4_addr, self.ipv4_netmask)
+        return offset
+
+    def wire_length(self):
+        return 32
 
     @staticmethod
     def unpack(reader):
         obj = bsn_interface()
         obj.hw_addr = list(reader.read('!6B'))
         reader.skip(2)
-        obj.name = reader.read("!16s")[0].rstrip("\x00")
-        obj.ipv4_addr = reader.read("!L")[0]
-        obj.ipv4_netmask = reader.read("!L")[0]
+        obj.name, obj.ipv4_addr, obj.ipv4_netmask = reader.read_struct(_struct_16sLL)
+        obj.name = obj.name.rstrip("\x00")
         return obj
 
     def __eq__(self, other):
@@ -619,6 +692,7 @@ class bsn_interface(loxi.OFObject):
 
 
 class bsn_lacp_stats_entry(loxi.OFObject):
+    __slots__ = ["actor_key", "actor_port_num", "actor_port_priority", "actor_sys_mac", "actor_sys_priority", "convergence_status", "partner_key", "partner_port_num", "partner_port_priority", "partner_sys_mac", "partner_sys_priority", "port_no"]
 
     def __init__(self, port_no=None, actor_sys_priority=None, actor_sys_mac=None, actor_port_priority=None, actor_port_num=None, actor_key=None, convergence_status=None, partner_sys_priority=None, partner_sys_mac=None, partner_port_priority=None, partner_port_num=None, partner_key=None):
         if port_no != None:
@@ -671,41 +745,26 @@ class bsn_lacp_stats_entry(loxi.OFObject):
             self.partner_key = 0
         return
 
-    def pack(self):
-        packed = []
-        packed.append(util.pack_port_no(self.port_no))
-        packed.append(struct.pack("!H", self.actor_sys_priority))
-        packed.append(struct.pack("!6B", *self.actor_sys_mac))
-        packed.append(struct.pack("!H", self.actor_port_priority))
-        packed.append(struct.pack("!H", self.actor_port_num))
-        packed.append(struct.pack("!H", self.actor_key))
-        packed.append(struct.pack("!B", self.convergence_status))
-        packed.append('\x00' * 1)
-        packed.append(struct.pack("!H", self.partner_sys_priority))
-        packed.append(struct.pack("!6B", *self.partner_sys_mac))
-        packed.append(struct.pack("!H", self.partner_port_priority))
-        packed.append(struct.pack("!H", self.partner_port_num))
-        packed.append(struct.pack("!H", self.partner_key))
-        packed.append('\x00' * 2)
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_LH, buf, offset, self.port_no, self.actor_sys_priority)
+        offset = loxi.generic_util.pack_struct_into(_struct_6B, buf, offset, *self.actor_sys_mac)
+        offset = loxi.generic_util.pack_struct_into(_struct_HHHBxH, buf, offset, self.actor_port_priority, self.actor_port_num, self.actor_key, self.convergence_status, self.partner_sys_priority)
+        offset = loxi.generic_util.pack_struct_into(_struct_6B, buf, offset, *self.partner_sys_mac)
+        offset = loxi.generic_util.pack_struct_into(_struct_HHH2x, buf, offset, self.partner_port_priority, self.partner_port_num, self.partner_key)
+        return offset
+
+    def wire_length(self):
+        return 36
 
     @staticmethod
     def unpack(reader):
         obj = bsn_lacp_stats_entry()
-        obj.port_no = util.unpack_port_no(reader)
-        obj.actor_sys_priority = reader.read("!H")[0]
+        obj.port_no, obj.actor_sys_priority = reader.read_struct(_struct_LH)
         obj.actor_sys_mac = list(reader.read('!6B'))
-        obj.actor_port_priority = reader.read("!H")[0]
-        obj.actor_port_num = reader.read("!H")[0]
-        obj.actor_key = reader.read("!H")[0]
-        obj.convergence_status = reader.read("!B")[0]
-        reader.skip(1)
-        obj.partner_sys_priority = reader.read("!H")[0]
+        obj.actor_port_priority, obj.actor_port_num, obj.actor_key, obj.convergence_status, obj.partner_sys_priority = reader.read_struct(_struct_HHHBxH)
         obj.partner_sys_mac = list(reader.read('!6B'))
-        obj.partner_port_priority = reader.read("!H")[0]
-        obj.partner_port_num = reader.read("!H")[0]
-        obj.partner_key = reader.read("!H")[0]
-        reader.skip(2)
+        obj.partner_port_priority, obj.partner_port_num, obj.partner_key = reader.read_struct(_struct_HHH2x)
         return obj
 
     def __eq__(self, other):
@@ -769,6 +828,7 @@ class bsn_lacp_stats_entry(loxi.OFObject):
 
 
 class bsn_port_counter_stats_entry(loxi.OFObject):
+    __slots__ = ["port_no", "values"]
 
     def __init__(self, port_no=None, values=None):
         if port_no != None:
@@ -781,15 +841,16 @@ class bsn_port_counter_stats_entry(loxi.OFObject):
             self.values = []
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 0
-        packed.append('\x00' * 2)
-        packed.append(util.pack_port_no(self.port_no))
-        packed.append(loxi.generic_util.pack_list(self.values))
-        length = sum([len(x) for x in packed])
-        packed[0] = struct.pack("!H", length)
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_H2xL, buf, offset, 0, self.port_no)
+        offset = loxi.generic_util.pack_list_into(self.values, buf, offset)
+        length = offset - start
+        _struct_H.pack_into(buf, start + 0, length)
+        return offset
+
+    def wire_length(self):
+        return 8 + loxi.generic_util.list_wire_length(self.values)
 
     @staticmethod
     def unpack(reader):
@@ -823,6 +884,7 @@ class bsn_port_counter_stats_entry(loxi.OFObject):
 
 
 class bsn_switch_pipeline_stats_entry(loxi.OFObject):
+    __slots__ = ["pipeline"]
 
     def __init__(self, pipeline=None):
         if pipeline != None:
@@ -831,10 +893,13 @@ class bsn_switch_pipeline_stats_entry(loxi.OFObject):
             self.pipeline = ""
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!256s", self.pipeline))
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_256s, buf, offset, self.pipeline)
+        return offset
+
+    def wire_length(self):
+        return 256
 
     @staticmethod
     def unpack(reader):
@@ -859,6 +924,7 @@ class bsn_switch_pipeline_stats_entry(loxi.OFObject):
 
 
 class bsn_table_checksum_stats_entry(loxi.OFObject):
+    __slots__ = ["checksum", "table_id"]
 
     def __init__(self, table_id=None, checksum=None):
         if table_id != None:
@@ -871,17 +937,18 @@ class bsn_table_checksum_stats_entry(loxi.OFObject):
             self.checksum = 0
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!B", self.table_id))
-        packed.append(struct.pack("!Q", self.checksum))
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_BQ, buf, offset, self.table_id, self.checksum)
+        return offset
+
+    def wire_length(self):
+        return 9
 
     @staticmethod
     def unpack(reader):
         obj = bsn_table_checksum_stats_entry()
-        obj.table_id = reader.read("!B")[0]
-        obj.checksum = reader.read("!Q")[0]
+        obj.table_id, obj.checksum = reader.read_struct(_struct_BQ)
         return obj
 
     def __eq__(self, other):
@@ -905,6 +972,7 @@ class bsn_table_checksum_stats_entry(loxi.OFObject):
 
 
 class bsn_vport(loxi.OFObject):
+    __slots__ = ["type"]
     subtypes = {}
 
 
@@ -915,13 +983,15 @@ class bsn_vport(loxi.OFObject):
             self.type = 0
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!H", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
-        length = sum([len(x) for x in packed])
-        packed[1] = struct.pack("!H", length)
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_HH, buf, offset, self.type, 0)
+        length = offset - start
+        _struct_H.pack_into(buf, start + 2, length)
+        return offset
+
+    def wire_length(self):
+        return 4
 
     @staticmethod
     def unpack(reader):
@@ -931,8 +1001,7 @@ class bsn_vport(loxi.OFObject):
             return subclass.unpack(reader)
 
         obj = bsn_vport()
-        obj.type = reader.read("!H")[0]
-        _length = reader.read("!H")[0]
+        obj.type, _length = reader.read_struct(_struct_HH)
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
         return obj
@@ -952,6 +1021,7 @@ class bsn_vport(loxi.OFObject):
 
 
 class bsn_vlan_counter_stats_entry(loxi.OFObject):
+    __slots__ = ["values", "vlan_vid"]
 
     def __init__(self, vlan_vid=None, values=None):
         if vlan_vid != None:
@@ -964,15 +1034,16 @@ class bsn_vlan_counter_stats_entry(loxi.OFObject):
             self.values = []
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 0
-        packed.append(struct.pack("!H", self.vlan_vid))
-        packed.append('\x00' * 4)
-        packed.append(loxi.generic_util.pack_list(self.values))
-        length = sum([len(x) for x in packed])
-        packed[0] = struct.pack("!H", length)
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_HH4x, buf, offset, 0, self.vlan_vid)
+        offset = loxi.generic_util.pack_list_into(self.values, buf, offset)
+        length = offset - start
+        _struct_H.pack_into(buf, start + 0, length)
+        return offset
+
+    def wire_length(self):
+        return 8 + loxi.generic_util.list_wire_length(self.values)
 
     @staticmethod
     def unpack(reader):
@@ -1006,6 +1077,7 @@ class bsn_vlan_counter_stats_entry(loxi.OFObject):
 
 
 class bsn_vport_l2gre(bsn_vport):
+    __slots__ = ["dscp", "dst_ip", "flags", "if_name", "local_mac", "loopback_port_no", "nh_mac", "port_no", "rate_limit", "src_ip", "ttl", "vpn"]
     type = 1
 
     def __init__(self, flags=None, port_no=None, loopback_port_no=None, local_mac=None, nh_mac=None, src_ip=None, dst_ip=None, dscp=None, ttl=None, vpn=None, rate_limit=None, if_name=None):
@@ -1059,48 +1131,31 @@ class bsn_vport_l2gre(bsn_vport):
             self.if_name = ""
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!H", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
-        packed.append(struct.pack("!L", self.flags))
-        packed.append(util.pack_port_no(self.port_no))
-        packed.append(util.pack_port_no(self.loopback_port_no))
-        packed.append(struct.pack("!6B", *self.local_mac))
-        packed.append(struct.pack("!6B", *self.nh_mac))
-        packed.append(struct.pack("!L", self.src_ip))
-        packed.append(struct.pack("!L", self.dst_ip))
-        packed.append(struct.pack("!B", self.dscp))
-        packed.append(struct.pack("!B", self.ttl))
-        packed.append('\x00' * 2)
-        packed.append(struct.pack("!L", self.vpn))
-        packed.append(struct.pack("!L", self.rate_limit))
-        packed.append(struct.pack("!16s", self.if_name))
-        length = sum([len(x) for x in packed])
-        packed[1] = struct.pack("!H", length)
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_HHLLL, buf, offset, self.type, 0, self.flags, self.port_no, self.loopback_port_no)
+        offset = loxi.generic_util.pack_struct_into(_struct_6B, buf, offset, *self.local_mac)
+        offset = loxi.generic_util.pack_struct_into(_struct_6B, buf, offset, *self.nh_mac)
+        offset = loxi.generic_util.pack_struct_into(_struct_LLBB2xLL16s, buf, offset, self.src_ip, self.dst_ip, self.dscp, self.ttl, self.vpn, self.rate_limit, self.if_name)
+        length = offset - start
+        _struct_H.pack_into(buf, start + 2, length)
+        return offset
+
+    def wire_length(self):
+        return 64
 
     @staticmethod
     def unpack(reader):
         obj = bsn_vport_l2gre()
-        _type = reader.read("!H")[0]
+        _type, _length = reader.read_struct(_struct_HH)
         assert(_type == 1)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.flags = reader.read("!L")[0]
-        obj.port_no = util.unpack_port_no(reader)
-        obj.loopback_port_no = util.unpack_port_no(reader)
+        obj.flags, obj.port_no, obj.loopback_port_no = reader.read_struct(_struct_LLL)
         obj.local_mac = list(reader.read('!6B'))
         obj.nh_mac = list(reader.read('!6B'))
-        obj.src_ip = reader.read("!L")[0]
-        obj.dst_ip = reader.read("!L")[0]
-        obj.dscp = reader.read("!B")[0]
-        obj.ttl = reader.read("!B")[0]
-        reader.skip(2)
-        obj.vpn = reader.read("!L")[0]
-        obj.rate_limit = reader.read("!L")[0]
-        obj.if_name = reader.read("!16s")[0].rstrip("\x00")
+        obj.src_ip, obj.dst_ip, obj.dscp, obj.ttl, obj.vpn, obj.rate_limit, obj.if_name = reader.read_struct(_struct_LLBB2xLL16s)
+        obj.if_name = obj.if_name.rstrip("\x00")
         return obj
 
     def __eq__(self, other):
@@ -1165,6 +1220,7 @@ class bsn_vport_l2gre(bsn_vport):
 bsn_vport.subtypes[1] = bsn_vport_l2gre
 
 class bsn_vport_q_in_q(bsn_vport):
+    __slots__ = ["egress_tpid", "egress_vlan_id", "if_name", "ingress_tpid", "ingress_vlan_id", "port_no"]
     type = 0
 
     def __init__(self, port_no=None, ingress_tpid=None, ingress_vlan_id=None, egress_tpid=None, egress_vlan_id=None, if_name=None):
@@ -1194,34 +1250,25 @@ class bsn_vport_q_in_q(bsn_vport):
             self.if_name = ""
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!H", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
-        packed.append(struct.pack("!L", self.port_no))
-        packed.append(struct.pack("!H", self.ingress_tpid))
-        packed.append(struct.pack("!H", self.ingress_vlan_id))
-        packed.append(struct.pack("!H", self.egress_tpid))
-        packed.append(struct.pack("!H", self.egress_vlan_id))
-        packed.append(struct.pack("!16s", self.if_name))
-        length = sum([len(x) for x in packed])
-        packed[1] = struct.pack("!H", length)
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_HHLHHHH16s, buf, offset, self.type, 0, self.port_no, self.ingress_tpid, self.ingress_vlan_id, self.egress_tpid, self.egress_vlan_id, self.if_name)
+        length = offset - start
+        _struct_H.pack_into(buf, start + 2, length)
+        return offset
+
+    def wire_length(self):
+        return 32
 
     @staticmethod
     def unpack(reader):
         obj = bsn_vport_q_in_q()
-        _type = reader.read("!H")[0]
+        _type, _length = reader.read_struct(_struct_HH)
         assert(_type == 0)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.port_no = reader.read("!L")[0]
-        obj.ingress_tpid = reader.read("!H")[0]
-        obj.ingress_vlan_id = reader.read("!H")[0]
-        obj.egress_tpid = reader.read("!H")[0]
-        obj.egress_vlan_id = reader.read("!H")[0]
-        obj.if_name = reader.read("!16s")[0].rstrip("\x00")
+        obj.port_no, obj.ingress_tpid, obj.ingress_vlan_id, obj.egress_tpid, obj.egress_vlan_id, obj.if_name = reader.read_struct(_struct_LHHHH16s)
+        obj.if_name = obj.if_name.rstrip("\x00")
         return obj
 
     def __eq__(self, other):
@@ -1262,6 +1309,7 @@ class bsn_vport_q_in_q(bsn_vport):
 bsn_vport.subtypes[0] = bsn_vport_q_in_q
 
 class bsn_vrf_counter_stats_entry(loxi.OFObject):
+    __slots__ = ["values", "vrf"]
 
     def __init__(self, vrf=None, values=None):
         if vrf != None:
@@ -1274,15 +1322,16 @@ class bsn_vrf_counter_stats_entry(loxi.OFObject):
             self.values = []
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 0
-        packed.append('\x00' * 2)
-        packed.append(struct.pack("!L", self.vrf))
-        packed.append(loxi.generic_util.pack_list(self.values))
-        length = sum([len(x) for x in packed])
-        packed[0] = struct.pack("!H", length)
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_H2xL, buf, offset, 0, self.vrf)
+        offset = loxi.generic_util.pack_list_into(self.values, buf, offset)
+        length = offset - start
+        _struct_H.pack_into(buf, start + 0, length)
+        return offset
+
+    def wire_length(self):
+        return 8 + loxi.generic_util.list_wire_length(self.values)
 
     @staticmethod
     def unpack(reader):
@@ -1316,6 +1365,7 @@ class bsn_vrf_counter_stats_entry(loxi.OFObject):
 
 
 class bucket(loxi.OFObject):
+    __slots__ = ["actions", "watch_group", "watch_port", "weight"]
 
     def __init__(self, weight=None, watch_port=None, watch_group=None, actions=None):
         if weight != None:
@@ -1336,17 +1386,16 @@ class bucket(loxi.OFObject):
             self.actions = []
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!H", 0)) # placeholder for len at index 0
-        packed.append(struct.pack("!H", self.weight))
-        packed.append(util.pack_port_no(self.watch_port))
-        packed.append(struct.pack("!L", self.watch_group))
-        packed.append('\x00' * 4)
-        packed.append(loxi.generic_util.pack_list(self.actions))
-        length = sum([len(x) for x in packed])
-        packed[0] = struct.pack("!H", length)
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_HHLL4x, buf, offset, 0, self.weight, self.watch_port, self.watch_group)
+        offset = loxi.generic_util.pack_list_into(self.actions, buf, offset)
+        length = offset - start
+        _struct_H.pack_into(buf, start + 0, length)
+        return offset
+
+    def wire_length(self):
+        return 16 + loxi.generic_util.list_wire_length(self.actions)
 
     @staticmethod
     def unpack(reader):
@@ -1354,10 +1403,7 @@ class bucket(loxi.OFObject):
         _len = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_len, 2)
-        obj.weight = reader.read("!H")[0]
-        obj.watch_port = util.unpack_port_no(reader)
-        obj.watch_group = reader.read("!L")[0]
-        reader.skip(4)
+        obj.weight, obj.watch_port, obj.watch_group = reader.read_struct(_struct_HLL4x)
         obj.actions = loxi.generic_util.unpack_list(reader, ofp.action.action.unpack)
         return obj
 
@@ -1390,6 +1436,7 @@ class bucket(loxi.OFObject):
 
 
 class bucket_counter(loxi.OFObject):
+    __slots__ = ["byte_count", "packet_count"]
 
     def __init__(self, packet_count=None, byte_count=None):
         if packet_count != None:
@@ -1402,17 +1449,18 @@ class bucket_counter(loxi.OFObject):
             self.byte_count = 0
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!Q", self.packet_count))
-        packed.append(struct.pack("!Q", self.byte_count))
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_QQ, buf, offset, self.packet_count, self.byte_count)
+        return offset
+
+    def wire_length(self):
+        return 16
 
     @staticmethod
     def unpack(reader):
         obj = bucket_counter()
-        obj.packet_count = reader.read("!Q")[0]
-        obj.byte_count = reader.read("!Q")[0]
+        obj.packet_count, obj.byte_count = reader.read_struct(_struct_QQ)
         return obj
 
     def __eq__(self, other):
@@ -1436,6 +1484,7 @@ class bucket_counter(loxi.OFObject):
 
 
 class flow_stats_entry(loxi.OFObject):
+    __slots__ = ["byte_count", "cookie", "duration_nsec", "duration_sec", "flags", "hard_timeout", "idle_timeout", "importance", "instructions", "match", "packet_count", "priority", "table_id"]
 
     def __init__(self, table_id=None, duration_sec=None, duration_nsec=None, priority=None, idle_timeout=None, hard_timeout=None, flags=None, importance=None, cookie=None, packet_count=None, byte_count=None, match=None, instructions=None):
         if table_id != None:
@@ -1492,27 +1541,17 @@ class flow_stats_entry(loxi.OFObject):
             self.instructions = []
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 0
-        packed.append(struct.pack("!B", self.table_id))
-        packed.append('\x00' * 1)
-        packed.append(struct.pack("!L", self.duration_sec))
-        packed.append(struct.pack("!L", self.duration_nsec))
-        packed.append(struct.pack("!H", self.priority))
-        packed.append(struct.pack("!H", self.idle_timeout))
-        packed.append(struct.pack("!H", self.hard_timeout))
-        packed.append(struct.pack("!H", self.flags))
-        packed.append(struct.pack("!H", self.importance))
-        packed.append('\x00' * 2)
-        packed.append(struct.pack("!Q", self.cookie))
-        packed.append(struct.pack("!Q", self.packet_count))
-        packed.append(struct.pack("!Q", self.byte_count))
-        packed.append(self.match.pack())
-        packed.append(loxi.generic_util.pack_list(self.instructions))
-        length = sum([len(x) for x in packed])
-        packed[0] = struct.pack("!H", length)
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_HBxLLHHHHH2xQQQ, buf, offset, 0, self.table_id, self.duration_sec, self.duration_nsec, self.priority, self.idle_timeout, self.hard_timeout, self.flags, self.importance, self.cookie, self.packet_count, self.byte_count)
+        offset = self.match.pack_into(buf, offset)
+        offset = loxi.generic_util.pack_list_into(self.instructions, buf, offset)
+        length = offset - start
+        _struct_H.pack_into(buf, start + 0, length)
+        return offset
+
+    def wire_length(self):
+        return 48 + self.match.wire_length() + loxi.generic_util.list_wire_length(self.instructions)
 
     @staticmethod
     def unpack(reader):
@@ -1520,19 +1559,7 @@ class flow_stats_entry(loxi.OFObject):
         _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 2)
-        obj.table_id = reader.read("!B")[0]
-        reader.skip(1)
-        obj.duration_sec = reader.read("!L")[0]
-        obj.duration_nsec = reader.read("!L")[0]
-        obj.priority = reader.read("!H")[0]
-        obj.idle_timeout = reader.read("!H")[0]
-        obj.hard_timeout = reader.read("!H")[0]
-        obj.flags = reader.read("!H")[0]
-        obj.importance = reader.read("!H")[0]
-        reader.skip(2)
-        obj.cookie = reader.read("!Q")[0]
-        obj.packet_count = reader.read("!Q")[0]
-        obj.byte_count = reader.read("!Q")[0]
+        obj.table_id, obj.duration_sec, obj.duration_nsec, obj.priority, obj.idle_timeout, obj.hard_timeout, obj.flags, obj.importance, obj.cookie, obj.packet_count, obj.byte_count = reader.read_struct(_struct_BxLLHHHHH2xQQQ)
         obj.match = ofp.match.unpack(reader)
         obj.instructions = loxi.generic_util.unpack_list(reader, ofp.instruction.instruction.unpack)
         return obj
@@ -1602,6 +1629,7 @@ class flow_stats_entry(loxi.OFObject):
 
 
 class group_desc_stats_entry(loxi.OFObject):
+    __slots__ = ["buckets", "group_id", "group_type"]
 
     def __init__(self, group_type=None, group_id=None, buckets=None):
         if group_type != None:
@@ -1618,16 +1646,16 @@ class group_desc_stats_entry(loxi.OFObject):
             self.buckets = []
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 0
-        packed.append(struct.pack("!B", self.group_type))
-        packed.append('\x00' * 1)
-        packed.append(struct.pack("!L", self.group_id))
-        packed.append(loxi.generic_util.pack_list(self.buckets))
-        length = sum([len(x) for x in packed])
-        packed[0] = struct.pack("!H", length)
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_HBxL, buf, offset, 0, self.group_type, self.group_id)
+        offset = loxi.generic_util.pack_list_into(self.buckets, buf, offset)
+        length = offset - start
+        _struct_H.pack_into(buf, start + 0, length)
+        return offset
+
+    def wire_length(self):
+        return 8 + loxi.generic_util.list_wire_length(self.buckets)
 
     @staticmethod
     def unpack(reader):
@@ -1635,9 +1663,7 @@ class group_desc_stats_entry(loxi.OFObject):
         _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 2)
-        obj.group_type = reader.read("!B")[0]
-        reader.skip(1)
-        obj.group_id = reader.read("!L")[0]
+        obj.group_type, obj.group_id = reader.read_struct(_struct_BxL)
         obj.buckets = loxi.generic_util.unpack_list(reader, ofp.common.bucket.unpack)
         return obj
 
@@ -1666,6 +1692,7 @@ class group_desc_stats_entry(loxi.OFObject):
 
 
 class group_stats_entry(loxi.OFObject):
+    __slots__ = ["bucket_stats", "byte_count", "duration_nsec", "duration_sec", "group_id", "packet_count", "ref_count"]
 
     def __init__(self, group_id=None, ref_count=None, packet_count=None, byte_count=None, duration_sec=None, duration_nsec=None, bucket_stats=None):
         if group_id != None:
@@ -1698,21 +1725,16 @@ class group_stats_entry(loxi.OFObject):
             self.bucket_stats = []
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 0
-        packed.append('\x00' * 2)
-        packed.append(struct.pack("!L", self.group_id))
-        packed.append(struct.pack("!L", self.ref_count))
-        packed.append('\x00' * 4)
-        packed.append(struct.pack("!Q", self.packet_count))
-        packed.append(struct.pack("!Q", self.byte_count))
-        packed.append(struct.pack("!L", self.duration_sec))
-        packed.append(struct.pack("!L", self.duration_nsec))
-        packed.append(loxi.generic_util.pack_list(self.bucket_stats))
-        length = sum([len(x) for x in packed])
-        packed[0] = struct.pack("!H", length)
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_H2xLL4xQQLL, buf, offset, 0, self.group_id, self.ref_count, self.packet_count, self.byte_count, self.duration_sec, self.duration_nsec)
+        offset = loxi.generic_util.pack_list_into(self.bucket_stats, buf, offset)
+        length = offset - start
+        _struct_H.pack_into(buf, start + 0, length)
+        return offset
+
+    def wire_length(self):
+        return 40 + loxi.generic_util.list_wire_length(self.bucket_stats)
 
     @staticmethod
     def unpack(reader):
@@ -1721,13 +1743,7 @@ class group_stats_entry(loxi.OFObject):
         orig_reader = reader
         reader = orig_reader.slice(_length, 2)
         reader.skip(2)
-        obj.group_id = reader.read("!L")[0]
-        obj.ref_count = reader.read("!L")[0]
-        reader.skip(4)
-        obj.packet_count = reader.read("!Q")[0]
-        obj.byte_count = reader.read("!Q")[0]
-        obj.duration_sec = reader.read("!L")[0]
-        obj.duration_nsec = reader.read("!L")[0]
+        obj.group_id, obj.ref_count, obj.packet_count, obj.byte_count, obj.duration_sec, obj.duration_nsec = reader.read_struct(_struct_LL4xQQLL)
         obj.bucket_stats = loxi.generic_util.unpack_list(reader, ofp.common.bucket_counter.unpack)
         return obj
 
@@ -1772,6 +1788,7 @@ class group_stats_entry(loxi.OFObject):
 
 
 class hello_elem(loxi.OFObject):
+    __slots__ = ["type"]
     subtypes = {}
 
 
@@ -1782,13 +1799,15 @@ class hello_elem(loxi.OFObject):
             self.type = 0
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!H", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
-        length = sum([len(x) for x in packed])
-        packed[1] = struct.pack("!H", length)
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_HH, buf, offset, self.type, 0)
+        length = offset - start
+        _struct_H.pack_into(buf, start + 2, length)
+        return offset
+
+    def wire_length(self):
+        return 4
 
     @staticmethod
     def unpack(reader):
@@ -1798,8 +1817,7 @@ class hello_elem(loxi.OFObject):
             return subclass.unpack(reader)
 
         obj = hello_elem()
-        obj.type = reader.read("!H")[0]
-        _length = reader.read("!H")[0]
+        obj.type, _length = reader.read_struct(_struct_HH)
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
         return obj
@@ -1819,6 +1837,7 @@ class hello_elem(loxi.OFObject):
 
 
 class hello_elem_versionbitmap(hello_elem):
+    __slots__ = ["bitmaps"]
     type = 1
 
     def __init__(self, bitmaps=None):
@@ -1828,21 +1847,22 @@ class hello_elem_versionbitmap(hello_elem):
             self.bitmaps = []
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!H", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
-        packed.append(loxi.generic_util.pack_list(self.bitmaps))
-        length = sum([len(x) for x in packed])
-        packed[1] = struct.pack("!H", length)
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_HH, buf, offset, self.type, 0)
+        offset = loxi.generic_util.pack_list_into(self.bitmaps, buf, offset)
+        length = offset - start
+        _struct_H.pack_into(buf, start + 2, length)
+        return offset
+
+    def wire_length(self):
+        return 4 + loxi.generic_util.list_wire_length(self.bitmaps)
 
     @staticmethod
     def unpack(reader):
         obj = hello_elem_versionbitmap()
-        _type = reader.read("!H")[0]
+        _type, _length = reader.read_struct(_struct_HH)
         assert(_type == 1)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
         obj.bitmaps = loxi.generic_util.unpack_list(reader, ofp.common.uint32.unpack)
@@ -1866,6 +1886,7 @@ class hello_elem_versionbitmap(hello_elem):
 hello_elem.subtypes[1] = hello_elem_versionbitmap
 
 class match_v3(loxi.OFObject):
+    __slots__ = ["oxm_list"]
     type = 1
 
     def __init__(self, oxm_list=None):
@@ -1875,25 +1896,29 @@ class match_v3(loxi.OFObject):
             self.oxm_list = []
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!H", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
-        packed.append(loxi.generic_util.pack_list(self.oxm_list))
-        length = sum([len(x) for x in packed])
-        packed[1] = struct.pack("!H", length)
-        packed.append(loxi.generic_util.pad_to(8, length))
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_HH, buf, offset, self.type, 0)
+        offset = ofp.oxm.pack_list_into(self.oxm_list, buf, offset)
+        length = offset - start
+        _struct_H.pack_into(buf, start + 2, length)
+        offset = loxi.generic_util.pack_pad_into(8, length, buf, offset)
+        return offset
+
+    def wire_length(self):
+        length = 4
+        length += loxi.generic_util.list_wire_length(self.oxm_list)
+        length = (length + 7) / 8 * 8
+        return length
 
     @staticmethod
     def unpack(reader):
         obj = match_v3()
-        _type = reader.read("!H")[0]
+        _type, _length = reader.read_struct(_struct_HH)
         assert(_type == 1)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.oxm_list = loxi.generic_util.unpack_list(reader, ofp.oxm.oxm.unpack)
+        obj.oxm_list = ofp.oxm.unpack_list(reader)
         orig_reader.skip_align()
         return obj
 
@@ -1914,6 +1939,7 @@ class match_v3(loxi.OFObject):
 
 
 class meter_band_stats(loxi.OFObject):
+    __slots__ = ["byte_band_count", "packet_band_count"]
 
     def __init__(self, packet_band_count=None, byte_band_count=None):
         if packet_band_count != None:
@@ -1926,17 +1952,18 @@ class meter_band_stats(loxi.OFObject):
             self.byte_band_count = 0
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!Q", self.packet_band_count))
-        packed.append(struct.pack("!Q", self.byte_band_count))
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_QQ, buf, offset, self.packet_band_count, self.byte_band_count)
+        return offset
+
+    def wire_length(self):
+        return 16
 
     @staticmethod
     def unpack(reader):
         obj = meter_band_stats()
-        obj.packet_band_count = reader.read("!Q")[0]
-        obj.byte_band_count = reader.read("!Q")[0]
+        obj.packet_band_count, obj.byte_band_count = reader.read_struct(_struct_QQ)
         return obj
 
     def __eq__(self, other):
@@ -1960,6 +1987,7 @@ class meter_band_stats(loxi.OFObject):
 
 
 class meter_config(loxi.OFObject):
+    __slots__ = ["entries", "flags", "meter_id"]
 
     def __init__(self, flags=None, meter_id=None, entries=None):
         if flags != None:
@@ -1976,15 +2004,16 @@ class meter_config(loxi.OFObject):
             self.entries = []
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 0
-        packed.append(struct.pack("!H", self.flags))
-        packed.append(struct.pack("!L", self.meter_id))
-        packed.append(loxi.generic_util.pack_list(self.entries))
-        length = sum([len(x) for x in packed])
-        packed[0] = struct.pack("!H", length)
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_HHL, buf, offset, 0, self.flags, self.meter_id)
+        offset = loxi.generic_util.pack_list_into(self.entries, buf, offset)
+        length = offset - start
+        _struct_H.pack_into(buf, start + 0, length)
+        return offset
+
+    def wire_length(self):
+        return 8 + loxi.generic_util.list_wire_length(self.entries)
 
     @staticmethod
     def unpack(reader):
@@ -1992,8 +2021,7 @@ class meter_config(loxi.OFObject):
         _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 2)
-        obj.flags = reader.read("!H")[0]
-        obj.meter_id = reader.read("!L")[0]
+        obj.flags, obj.meter_id = reader.read_struct(_struct_HL)
         obj.entries = loxi.generic_util.unpack_list(reader, ofp.meter_band.meter_band.unpack)
         return obj
 
@@ -2022,6 +2050,7 @@ class meter_config(loxi.OFObject):
 
 
 class meter_features(loxi.OFObject):
+    __slots__ = ["band_types", "capabilities", "max_bands", "max_color", "max_meter"]
 
     def __init__(self, max_meter=None, band_types=None, capabilities=None, max_bands=None, max_color=None):
         if max_meter != None:
@@ -2046,25 +2075,18 @@ class meter_features(loxi.OFObject):
             self.max_color = 0
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!L", self.max_meter))
-        packed.append(struct.pack("!L", self.band_types))
-        packed.append(struct.pack("!L", self.capabilities))
-        packed.append(struct.pack("!B", self.max_bands))
-        packed.append(struct.pack("!B", self.max_color))
-        packed.append('\x00' * 2)
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_LLLBB2x, buf, offset, self.max_meter, self.band_types, self.capabilities, self.max_bands, self.max_color)
+        return offset
+
+    def wire_length(self):
+        return 16
 
     @staticmethod
     def unpack(reader):
         obj = meter_features()
-        obj.max_meter = reader.read("!L")[0]
-        obj.band_types = reader.read("!L")[0]
-        obj.capabilities = reader.read("!L")[0]
-        obj.max_bands = reader.read("!B")[0]
-        obj.max_color = reader.read("!B")[0]
-        reader.skip(2)
+        obj.max_meter, obj.band_types, obj.capabilities, obj.max_bands, obj.max_color = reader.read_struct(_struct_LLLBB2x)
         return obj
 
     def __eq__(self, other):
@@ -2100,6 +2122,7 @@ class meter_features(loxi.OFObject):
 
 
 class meter_stats(loxi.OFObject):
+    __slots__ = ["band_stats", "byte_in_count", "duration_nsec", "duration_sec", "flow_count", "meter_id", "packet_in_count"]
 
     def __init__(self, meter_id=None, flow_count=None, packet_in_count=None, byte_in_count=None, duration_sec=None, duration_nsec=None, band_stats=None):
         if meter_id != None:
@@ -2132,34 +2155,25 @@ class meter_stats(loxi.OFObject):
             self.band_stats = []
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!L", self.meter_id))
-        packed.append(struct.pack("!H", 0)) # placeholder for len at index 1
-        packed.append('\x00' * 6)
-        packed.append(struct.pack("!L", self.flow_count))
-        packed.append(struct.pack("!Q", self.packet_in_count))
-        packed.append(struct.pack("!Q", self.byte_in_count))
-        packed.append(struct.pack("!L", self.duration_sec))
-        packed.append(struct.pack("!L", self.duration_nsec))
-        packed.append(loxi.generic_util.pack_list(self.band_stats))
-        length = sum([len(x) for x in packed])
-        packed[1] = struct.pack("!H", length)
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_LH6xLQQLL, buf, offset, self.meter_id, 0, self.flow_count, self.packet_in_count, self.byte_in_count, self.duration_sec, self.duration_nsec)
+        offset = loxi.generic_util.pack_list_into(self.band_stats, buf, offset)
+        length = offset - start
+        _struct_H.pack_into(buf, start + 4, length)
+        return offset
+
+    def wire_length(self):
+        return 40 + loxi.generic_util.list_wire_length(self.band_stats)
 
     @staticmethod
     def unpack(reader):
         obj = meter_stats()
-        obj.meter_id = reader.read("!L")[0]
-        _len = reader.read("!H")[0]
+        obj.meter_id, _len = reader.read_struct(_struct_LH)
         orig_reader = reader
         reader = orig_reader.slice(_len, 6)
         reader.skip(6)
-        obj.flow_count = reader.read("!L")[0]
-        obj.packet_in_count = reader.read("!Q")[0]
-        obj.byte_in_count = reader.read("!Q")[0]
-        obj.duration_sec = reader.read("!L")[0]
-        obj.duration_nsec = reader.read("!L")[0]
+        obj.flow_count, obj.packet_in_count, obj.byte_in_count, obj.duration_sec, obj.duration_nsec = reader.read_struct(_struct_LQQLL)
         obj.band_stats = loxi.generic_util.unpack_list(reader, ofp.common.meter_band_stats.unpack)
         return obj
 
@@ -2204,6 +2218,7 @@ class meter_stats(loxi.OFObject):
 
 
 class packet_queue(loxi.OFObject):
+    __slots__ = ["port", "properties", "queue_id"]
 
     def __init__(self, queue_id=None, port=None, properties=None):
         if queue_id != None:
@@ -2220,23 +2235,21 @@ class packet_queue(loxi.OFObject):
             self.properties = []
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!L", self.queue_id))
-        packed.append(util.pack_port_no(self.port))
-        packed.append(struct.pack("!H", 0)) # placeholder for len at index 2
-        packed.append('\x00' * 6)
-        packed.append(loxi.generic_util.pack_list(self.properties))
-        length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_LLH6x, buf, offset, self.queue_id, self.port, 0)
+        offset = loxi.generic_util.pack_list_into(self.properties, buf, offset)
+        length = offset - start
+        _struct_H.pack_into(buf, start + 8, length)
+        return offset
+
+    def wire_length(self):
+        return 16 + loxi.generic_util.list_wire_length(self.properties)
 
     @staticmethod
     def unpack(reader):
         obj = packet_queue()
-        obj.queue_id = reader.read("!L")[0]
-        obj.port = util.unpack_port_no(reader)
-        _len = reader.read("!H")[0]
+        obj.queue_id, obj.port, _len = reader.read_struct(_struct_LLH)
         orig_reader = reader
         reader = orig_reader.slice(_len, 10)
         reader.skip(6)
@@ -2268,6 +2281,7 @@ class packet_queue(loxi.OFObject):
 
 
 class port_desc(loxi.OFObject):
+    __slots__ = ["config", "hw_addr", "name", "port_no", "properties", "state"]
 
     def __init__(self, port_no=None, hw_addr=None, name=None, config=None, state=None, properties=None):
         if port_no != None:
@@ -2296,34 +2310,30 @@ class port_desc(loxi.OFObject):
             self.properties = []
         return
 
-    def pack(self):
-        packed = []
-        packed.append(util.pack_port_no(self.port_no))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
-        packed.append('\x00' * 2)
-        packed.append(struct.pack("!6B", *self.hw_addr))
-        packed.append('\x00' * 2)
-        packed.append(struct.pack("!16s", self.name))
-        packed.append(struct.pack("!L", self.config))
-        packed.append(struct.pack("!L", self.state))
-        packed.append(loxi.generic_util.pack_list(self.properties))
-        length = sum([len(x) for x in packed])
-        packed[1] = struct.pack("!H", length)
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_LH2x, buf, offset, self.port_no, 0)
+        offset = loxi.generic_util.pack_struct_into(_struct_6B, buf, offset, *self.hw_addr)
+        offset = loxi.generic_util.pack_struct_into(_struct_2x16sLL, buf, offset, self.name, self.config, self.state)
+        offset = loxi.generic_util.pack_list_into(self.properties, buf, offset)
+        length = offset - start
+        _struct_H.pack_into(buf, start + 4, length)
+        return offset
+
+    def wire_length(self):
+        return 40 + loxi.generic_util.list_wire_length(self.properties)
 
     @staticmethod
     def unpack(reader):
         obj = port_desc()
-        obj.port_no = util.unpack_port_no(reader)
-        _length = reader.read("!H")[0]
+        obj.port_no, _length = reader.read_struct(_struct_LH)
         orig_reader = reader
         reader = orig_reader.slice(_length, 6)
         reader.skip(2)
         obj.hw_addr = list(reader.read('!6B'))
         reader.skip(2)
-        obj.name = reader.read("!16s")[0].rstrip("\x00")
-        obj.config = reader.read("!L")[0]
-        obj.state = reader.read("!L")[0]
+        obj.name, obj.config, obj.state = reader.read_struct(_struct_16sLL)
+        obj.name = obj.name.rstrip("\x00")
         obj.properties = loxi.generic_util.unpack_list(reader, ofp.port_desc_prop.port_desc_prop.unpack)
         return obj
 
@@ -2364,6 +2374,7 @@ class port_desc(loxi.OFObject):
 
 
 class port_stats_entry(loxi.OFObject):
+    __slots__ = ["duration_nsec", "duration_sec", "port_no", "properties", "rx_bytes", "rx_dropped", "rx_errors", "rx_packets", "tx_bytes", "tx_dropped", "tx_errors", "tx_packets"]
 
     def __init__(self, port_no=None, duration_sec=None, duration_nsec=None, rx_packets=None, tx_packets=None, rx_bytes=None, tx_bytes=None, rx_dropped=None, tx_dropped=None, rx_errors=None, tx_errors=None, properties=None):
         if port_no != None:
@@ -2416,25 +2427,16 @@ class port_stats_entry(loxi.OFObject):
             self.properties = []
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 0
-        packed.append('\x00' * 2)
-        packed.append(util.pack_port_no(self.port_no))
-        packed.append(struct.pack("!L", self.duration_sec))
-        packed.append(struct.pack("!L", self.duration_nsec))
-        packed.append(struct.pack("!Q", self.rx_packets))
-        packed.append(struct.pack("!Q", self.tx_packets))
-        packed.append(struct.pack("!Q", self.rx_bytes))
-        packed.append(struct.pack("!Q", self.tx_bytes))
-        packed.append(struct.pack("!Q", self.rx_dropped))
-        packed.append(struct.pack("!Q", self.tx_dropped))
-        packed.append(struct.pack("!Q", self.rx_errors))
-        packed.append(struct.pack("!Q", self.tx_errors))
-        packed.append(loxi.generic_util.pack_list(self.properties))
-        length = sum([len(x) for x in packed])
-        packed[0] = struct.pack("!H", length)
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_H2xLLLQQQQQQQQ, buf, offset, 0, self.port_no, self.duration_sec, self.duration_nsec, self.rx_packets, self.tx_packets, self.rx_bytes, self.tx_bytes, self.rx_dropped, self.tx_dropped, self.rx_errors, self.tx_errors)
+        offset = loxi.generic_util.pack_list_into(self.properties, buf, offset)
+        length = offset - start
+        _struct_H.pack_into(buf, start + 0, length)
+        return offset
+
+    def wire_length(self):
+        return 80 + loxi.generic_util.list_wire_length(self.properties)
 
     @staticmethod
     def unpack(reader):
@@ -2443,17 +2445,7 @@ class port_stats_entry(loxi.OFObject):
         orig_reader = reader
         reader = orig_reader.slice(_length, 2)
         reader.skip(2)
-        obj.port_no = util.unpack_port_no(reader)
-        obj.duration_sec = reader.read("!L")[0]
-        obj.duration_nsec = reader.read("!L")[0]
-        obj.rx_packets = reader.read("!Q")[0]
-        obj.tx_packets = reader.read("!Q")[0]
-        obj.rx_bytes = reader.read("!Q")[0]
-        obj.tx_bytes = reader.read("!Q")[0]
-        obj.rx_dropped = reader.read("!Q")[0]
-        obj.tx_dropped = reader.read("!Q")[0]
-        obj.rx_errors = reader.read("!Q")[0]
-        obj.tx_errors = reader.read("!Q")[0]
+        obj.port_no, obj.duration_sec, obj.duration_nsec, obj.rx_packets, obj.tx_packets, obj.rx_bytes, obj.tx_bytes, obj.rx_dropped, obj.tx_dropped, obj.rx_errors, obj.tx_errors = reader.read_struct(_struct_LLLQQQQQQQQ)
         obj.properties = loxi.generic_util.unpack_list(reader, ofp.port_stats_prop.port_stats_prop.unpack)
         return obj
 
@@ -2518,6 +2510,7 @@ class port_stats_entry(loxi.OFObject):
 
 
 class queue_desc(loxi.OFObject):
+    __slots__ = ["port_no", "properties", "queue_id"]
 
     def __init__(self, port_no=None, queue_id=None, properties=None):
         if port_no != None:
@@ -2534,23 +2527,21 @@ class queue_desc(loxi.OFObject):
             self.properties = []
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!L", self.port_no))
-        packed.append(struct.pack("!L", self.queue_id))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append('\x00' * 6)
-        packed.append(loxi.generic_util.pack_list(self.properties))
-        length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_LLH6x, buf, offset, self.port_no, self.queue_id, 0)
+        offset = loxi.generic_util.pack_list_into(self.properties, buf, offset)
+        length = offset - start
+        _struct_H.pack_into(buf, start + 8, length)
+        return offset
+
+    def wire_length(self):
+        return 16 + loxi.generic_util.list_wire_length(self.properties)
 
     @staticmethod
     def unpack(reader):
         obj = queue_desc()
-        obj.port_no = reader.read("!L")[0]
-        obj.queue_id = reader.read("!L")[0]
-        _length = reader.read("!H")[0]
+        obj.port_no, obj.queue_id, _length = reader.read_struct(_struct_LLH)
         orig_reader = reader
         reader = orig_reader.slice(_length, 10)
         reader.skip(6)
@@ -2582,6 +2573,7 @@ class queue_desc(loxi.OFObject):
 
 
 class queue_prop(loxi.OFObject):
+    __slots__ = ["type"]
     subtypes = {}
 
 
@@ -2592,14 +2584,15 @@ class queue_prop(loxi.OFObject):
             self.type = 0
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!H", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for len at index 1
-        packed.append('\x00' * 4)
-        length = sum([len(x) for x in packed])
-        packed[1] = struct.pack("!H", length)
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_HH4x, buf, offset, self.type, 0)
+        length = offset - start
+        _struct_H.pack_into(buf, start + 2, length)
+        return offset
+
+    def wire_length(self):
+        return 8
 
     @staticmethod
     def unpack(reader):
@@ -2609,8 +2602,7 @@ class queue_prop(loxi.OFObject):
             return subclass.unpack(reader)
 
         obj = queue_prop()
-        obj.type = reader.read("!H")[0]
-        _len = reader.read("!H")[0]
+        obj.type, _len = reader.read_struct(_struct_HH)
         orig_reader = reader
         reader = orig_reader.slice(_len, 4)
         reader.skip(4)
@@ -2631,6 +2623,7 @@ class queue_prop(loxi.OFObject):
 
 
 class queue_prop_experimenter(queue_prop):
+    __slots__ = ["data", "experimenter"]
     subtypes = {}
 
     type = 65535
@@ -2646,17 +2639,16 @@ class queue_prop_experimenter(queue_prop):
             self.data = ''
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!H", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for len at index 1
-        packed.append('\x00' * 4)
-        packed.append(struct.pack("!L", self.experimenter))
-        packed.append('\x00' * 4)
-        packed.append(self.data)
-        length = sum([len(x) for x in packed])
-        packed[1] = struct.pack("!H", length)
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_HH4xL4x, buf, offset, self.type, 0, self.experimenter)
+        offset = loxi.generic_util.pack_bytes_into(self.data, buf, offset)
+        length = offset - start
+        _struct_H.pack_into(buf, start + 2, length)
+        return offset
+
+    def wire_length(self):
+        return 16 + len(self.data)
 
     @staticmethod
     def unpack(reader):
@@ -2666,15 +2658,14 @@ class queue_prop_experimenter(queue_prop):
             return subclass.unpack(reader)
 
         obj = queue_prop_experimenter()
-        _type = reader.read("!H")[0]
+        _type, _len = reader.read_struct(_struct_HH)
         assert(_type == 65535)
-        _len = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_len, 4)
         reader.skip(4)
         obj.experimenter = reader.read("!L")[0]
         reader.skip(4)
-        obj.data = str(reader.read_all())
+        obj.data = reader.read_all()
         return obj
 
     def __eq__(self, other):
@@ -2696,6 +2687,7 @@ class queue_prop_experimenter(queue_prop):
 queue_prop.subtypes[65535] = queue_prop_experimenter
 
 class queue_prop_max_rate(queue_prop):
+    __slots__ = ["rate"]
     type = 2
 
     def __init__(self, rate=None):
@@ -2705,23 +2697,21 @@ class queue_prop_max_rate(queue_prop):
             self.rate = 0
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!H", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for len at index 1
-        packed.append('\x00' * 4)
-        packed.append(struct.pack("!H", self.rate))
-        packed.append('\x00' * 6)
-        length = sum([len(x) for x in packed])
-        packed[1] = struct.pack("!H", length)
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_HH4xH6x, buf, offset, self.type, 0, self.rate)
+        length = offset - start
+        _struct_H.pack_into(buf, start + 2, length)
+        return offset
+
+    def wire_length(self):
+        return 16
 
     @staticmethod
     def unpack(reader):
         obj = queue_prop_max_rate()
-        _type = reader.read("!H")[0]
+        _type, _len = reader.read_struct(_struct_HH)
         assert(_type == 2)
-        _len = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_len, 4)
         reader.skip(4)
@@ -2747,6 +2737,7 @@ class queue_prop_max_rate(queue_prop):
 queue_prop.subtypes[2] = queue_prop_max_rate
 
 class queue_prop_min_rate(queue_prop):
+    __slots__ = ["rate"]
     type = 1
 
     def __init__(self, rate=None):
@@ -2756,23 +2747,21 @@ class queue_prop_min_rate(queue_prop):
             self.rate = 0
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!H", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for len at index 1
-        packed.append('\x00' * 4)
-        packed.append(struct.pack("!H", self.rate))
-        packed.append('\x00' * 6)
-        length = sum([len(x) for x in packed])
-        packed[1] = struct.pack("!H", length)
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_HH4xH6x, buf, offset, self.type, 0, self.rate)
+        length = offset - start
+        _struct_H.pack_into(buf, start + 2, length)
+        return offset
+
+    def wire_length(self):
+        return 16
 
     @staticmethod
     def unpack(reader):
         obj = queue_prop_min_rate()
-        _type = reader.read("!H")[0]
+        _type, _len = reader.read_struct(_struct_HH)
         assert(_type == 1)
-        _len = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_len, 4)
         reader.skip(4)
@@ -2798,6 +2787,7 @@ class queue_prop_min_rate(queue_prop):
 queue_prop.subtypes[1] = queue_prop_min_rate
 
 class queue_stats_entry(loxi.OFObject):
+    __slots__ = ["duration_nsec", "duration_sec", "port_no", "properties", "queue_id", "tx_bytes", "tx_errors", "tx_packets"]
 
     def __init__(self, port_no=None, queue_id=None, tx_bytes=None, tx_packets=None, tx_errors=None, duration_sec=None, duration_nsec=None, properties=None):
         if port_no != None:
@@ -2834,21 +2824,16 @@ class queue_stats_entry(loxi.OFObject):
             self.properties = []
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 0
-        packed.append('\x00' * 6)
-        packed.append(util.pack_port_no(self.port_no))
-        packed.append(struct.pack("!L", self.queue_id))
-        packed.append(struct.pack("!Q", self.tx_bytes))
-        packed.append(struct.pack("!Q", self.tx_packets))
-        packed.append(struct.pack("!Q", self.tx_errors))
-        packed.append(struct.pack("!L", self.duration_sec))
-        packed.append(struct.pack("!L", self.duration_nsec))
-        packed.append(loxi.generic_util.pack_list(self.properties))
-        length = sum([len(x) for x in packed])
-        packed[0] = struct.pack("!H", length)
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_H6xLLQQQLL, buf, offset, 0, self.port_no, self.queue_id, self.tx_bytes, self.tx_packets, self.tx_errors, self.duration_sec, self.duration_nsec)
+        offset = loxi.generic_util.pack_list_into(self.properties, buf, offset)
+        length = offset - start
+        _struct_H.pack_into(buf, start + 0, length)
+        return offset
+
+    def wire_length(self):
+        return 48 + loxi.generic_util.list_wire_length(self.properties)
 
     @staticmethod
     def unpack(reader):
@@ -2857,13 +2842,7 @@ class queue_stats_entry(loxi.OFObject):
         orig_reader = reader
         reader = orig_reader.slice(_length, 2)
         reader.skip(6)
-        obj.port_no = util.unpack_port_no(reader)
-        obj.queue_id = reader.read("!L")[0]
-        obj.tx_bytes = reader.read("!Q")[0]
-        obj.tx_packets = reader.read("!Q")[0]
-        obj.tx_errors = reader.read("!Q")[0]
-        obj.duration_sec = reader.read("!L")[0]
-        obj.duration_nsec = reader.read("!L")[0]
+        obj.port_no, obj.queue_id, obj.tx_bytes, obj.tx_packets, obj.tx_errors, obj.duration_sec, obj.duration_nsec = reader.read_struct(_struct_LLQQQLL)
         obj.properties = loxi.generic_util.unpack_list(reader, ofp.queue_stats_prop.queue_stats_prop.unpack)
         return obj
 
@@ -2912,6 +2891,7 @@ class queue_stats_entry(loxi.OFObject):
 
 
 class table_desc(loxi.OFObject):
+    __slots__ = ["config", "table_id"]
 
     def __init__(self, table_id=None, config=None):
         if table_id != None:
@@ -2924,15 +2904,15 @@ class table_desc(loxi.OFObject):
             self.config = 0
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 0
-        packed.append(struct.pack("!B", self.table_id))
-        packed.append('\x00' * 1)
-        packed.append(struct.pack("!L", self.config))
-        length = sum([len(x) for x in packed])
-        packed[0] = struct.pack("!H", length)
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_HBxL, buf, offset, 0, self.table_id, self.config)
+        length = offset - start
+        _struct_H.pack_into(buf, start + 0, length)
+        return offset
+
+    def wire_length(self):
+        return 8
 
     @staticmethod
     def unpack(reader):
@@ -2940,9 +2920,7 @@ class table_desc(loxi.OFObject):
         _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 2)
-        obj.table_id = reader.read("!B")[0]
-        reader.skip(1)
-        obj.config = reader.read("!L")[0]
+        obj.table_id, obj.config = reader.read_struct(_struct_BxL)
         return obj
 
     def __eq__(self, other):
@@ -2966,6 +2944,7 @@ class table_desc(loxi.OFObject):
 
 
 class table_feature_prop(loxi.OFObject):
+    __slots__ = ["type"]
     subtypes = {}
 
 
@@ -2976,13 +2955,15 @@ class table_feature_prop(loxi.OFObject):
             self.type = 0
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!H", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
-        length = sum([len(x) for x in packed])
-        packed[1] = struct.pack("!H", length)
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_HH, buf, offset, self.type, 0)
+        length = offset - start
+        _struct_H.pack_into(buf, start + 2, length)
+        return offset
+
+    def wire_length(self):
+        return 4
 
     @staticmethod
     def unpack(reader):
@@ -2992,8 +2973,7 @@ class table_feature_prop(loxi.OFObject):
             return subclass.unpack(reader)
 
         obj = table_feature_prop()
-        obj.type = reader.read("!H")[0]
-        _length = reader.read("!H")[0]
+        obj.type, _length = reader.read_struct(_struct_HH)
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
         return obj
@@ -3013,6 +2993,7 @@ class table_feature_prop(loxi.OFObject):
 
 
 class table_feature_prop_apply_actions(table_feature_prop):
+    __slots__ = ["action_ids"]
     type = 6
 
     def __init__(self, action_ids=None):
@@ -3022,21 +3003,22 @@ class table_feature_prop_apply_actions(table_feature_prop):
             self.action_ids = []
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!H", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
-        packed.append(loxi.generic_util.pack_list(self.action_ids))
-        length = sum([len(x) for x in packed])
-        packed[1] = struct.pack("!H", length)
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_HH, buf, offset, self.type, 0)
+        offset = loxi.generic_util.pack_list_into(self.action_ids, buf, offset)
+        length = offset - start
+        _struct_H.pack_into(buf, start + 2, length)
+        return offset
+
+    def wire_length(self):
+        return 4 + loxi.generic_util.list_wire_length(self.action_ids)
 
     @staticmethod
     def unpack(reader):
         obj = table_feature_prop_apply_actions()
-        _type = reader.read("!H")[0]
+        _type, _length = reader.read_struct(_struct_HH)
         assert(_type == 6)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
         obj.action_ids = loxi.generic_util.unpack_list(reader, ofp.action_id.action_id.unpack)
@@ -3060,6 +3042,7 @@ class table_feature_prop_apply_actions(table_feature_prop):
 table_feature_prop.subtypes[6] = table_feature_prop_apply_actions
 
 class table_feature_prop_apply_actions_miss(table_feature_prop):
+    __slots__ = ["action_ids"]
     type = 7
 
     def __init__(self, action_ids=None):
@@ -3069,21 +3052,22 @@ class table_feature_prop_apply_actions_miss(table_feature_prop):
             self.action_ids = []
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!H", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
-        packed.append(loxi.generic_util.pack_list(self.action_ids))
-        length = sum([len(x) for x in packed])
-        packed[1] = struct.pack("!H", length)
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_HH, buf, offset, self.type, 0)
+        offset = loxi.generic_util.pack_list_into(self.action_ids, buf, offset)
+        length = offset - start
+        _struct_H.pack_into(buf, start + 2, length)
+        return offset
+
+    def wire_length(self):
+        return 4 + loxi.generic_util.list_wire_length(self.action_ids)
 
     @staticmethod
     def unpack(reader):
         obj = table_feature_prop_apply_actions_miss()
-        _type = reader.read("!H")[0]
+        _type, _length = reader.read_struct(_struct_HH)
         assert(_type == 7)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
         obj.action_ids = loxi.generic_util.unpack_list(reader, ofp.action_id.action_id.unpack)
@@ -3107,6 +3091,7 @@ class table_feature_prop_apply_actions_miss(table_feature_prop):
 table_feature_prop.subtypes[7] = table_feature_prop_apply_actions_miss
 
 class table_feature_prop_apply_setfield(table_feature_prop):
+    __slots__ = ["oxm_ids"]
     type = 14
 
     def __init__(self, oxm_ids=None):
@@ -3116,21 +3101,22 @@ class table_feature_prop_apply_setfield(table_feature_prop):
             self.oxm_ids = []
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!H", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
-        packed.append(loxi.generic_util.pack_list(self.oxm_ids))
-        length = sum([len(x) for x in packed])
-        packed[1] = struct.pack("!H", length)
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_HH, buf, offset, self.type, 0)
+        offset = loxi.generic_util.pack_list_into(self.oxm_ids, buf, offset)
+        length = offset - start
+        _struct_H.pack_into(buf, start + 2, length)
+        return offset
+
+    def wire_length(self):
+        return 4 + loxi.generic_util.list_wire_length(self.oxm_ids)
 
     @staticmethod
     def unpack(reader):
         obj = table_feature_prop_apply_setfield()
-        _type = reader.read("!H")[0]
+        _type, _length = reader.read_struct(_struct_HH)
         assert(_type == 14)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
         obj.oxm_ids = loxi.generic_util.unpack_list(reader, ofp.common.uint32.unpack)
@@ -3154,6 +3140,7 @@ class table_feature_prop_apply_setfield(table_feature_prop):
 table_feature_prop.subtypes[14] = table_feature_prop_apply_setfield
 
 class table_feature_prop_apply_setfield_miss(table_feature_prop):
+    __slots__ = ["oxm_ids"]
     type = 15
 
     def __init__(self, oxm_ids=None):
@@ -3163,21 +3150,22 @@ class table_feature_prop_apply_setfield_miss(table_feature_prop):
             self.oxm_ids = []
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!H", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
-        packed.append(loxi.generic_util.pack_list(self.oxm_ids))
-        length = sum([len(x) for x in packed])
-        packed[1] = struct.pack("!H", length)
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_HH, buf, offset, self.type, 0)
+        offset = loxi.generic_util.pack_list_into(self.oxm_ids, buf, offset)
+        length = offset - start
+        _struct_H.pack_into(buf, start + 2, length)
+        return offset
+
+    def wire_length(self):
+        return 4 + loxi.generic_util.list_wire_length(self.oxm_ids)
 
     @staticmethod
     def unpack(reader):
         obj = table_feature_prop_apply_setfield_miss()
-        _type = reader.read("!H")[0]
+        _type, _length = reader.read_struct(_struct_HH)
         assert(_type == 15)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
         obj.oxm_ids = loxi.generic_util.unpack_list(reader, ofp.common.uint32.unpack)
@@ -3201,6 +3189,7 @@ class table_feature_prop_apply_setfield_miss(table_feature_prop):
 table_feature_prop.subtypes[15] = table_feature_prop_apply_setfield_miss
 
 class table_feature_prop_experimenter(table_feature_prop):
+    __slots__ = ["experimenter", "experimenter_data", "subtype"]
     subtypes = {}
 
     type = 65534
@@ -3220,16 +3209,16 @@ class table_feature_prop_experimenter(table_feature_prop):
             self.experimenter_data = ''
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!H", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
-        packed.append(struct.pack("!L", self.experimenter))
-        packed.append(struct.pack("!L", self.subtype))
-        packed.append(self.experimenter_data)
-        length = sum([len(x) for x in packed])
-        packed[1] = struct.pack("!H", length)
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_HHLL, buf, offset, self.type, 0, self.experimenter, self.subtype)
+        offset = loxi.generic_util.pack_bytes_into(self.experimenter_data, buf, offset)
+        length = offset - start
+        _struct_H.pack_into(buf, start + 2, length)
+        return offset
+
+    def wire_length(self):
+        return 12 + len(self.experimenter_data)
 
     @staticmethod
     def unpack(reader):
@@ -3239,14 +3228,12 @@ class table_feature_prop_experimenter(table_feature_prop):
             return subclass.unpack(reader)
 
         obj = table_feature_prop_experimenter()
-        _type = reader.read("!H")[0]
+        _type, _length = reader.read_struct(_struct_HH)
         assert(_type == 65534)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.experimenter = reader.read("!L")[0]
-        obj.subtype = reader.read("!L")[0]
-        obj.experimenter_data = str(reader.read_all())
+        obj.experimenter, obj.subtype = reader.read_struct(_struct_LL)
+        obj.experimenter_data = reader.read_all()
         return obj
 
     def __eq__(self, other):
@@ -3272,6 +3259,7 @@ class table_feature_prop_experimenter(table_feature_prop):
 table_feature_prop.subtypes[65534] = table_feature_prop_experimenter
 
 class table_feature_prop_experimenter_miss(table_feature_prop):
+    __slots__ = ["experimenter", "experimenter_data", "subtype"]
     subtypes = {}
 
     type = 65535
@@ -3291,16 +3279,16 @@ class table_feature_prop_experimenter_miss(table_feature_prop):
             self.experimenter_data = ''
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!H", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
-        packed.append(struct.pack("!L", self.experimenter))
-        packed.append(struct.pack("!L", self.subtype))
-        packed.append(self.experimenter_data)
-        length = sum([len(x) for x in packed])
-        packed[1] = struct.pack("!H", length)
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_HHLL, buf, offset, self.type, 0, self.experimenter, self.subtype)
+        offset = loxi.generic_util.pack_bytes_into(self.experimenter_data, buf, offset)
+        length = offset - start
+        _struct_H.pack_into(buf, start + 2, length)
+        return offset
+
+    def wire_length(self):
+        return 12 + len(self.experimenter_data)
 
     @staticmethod
     def unpack(reader):
@@ -3310,14 +3298,12 @@ class table_feature_prop_experimenter_miss(table_feature_prop):
             return subclass.unpack(reader)
 
         obj = table_feature_prop_experimenter_miss()
-        _type = reader.read("!H")[0]
+        _type, _length = reader.read_struct(_struct_HH)
         assert(_type == 65535)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.experimenter = reader.read("!L")[0]
-        obj.subtype = reader.read("!L")[0]
-        obj.experimenter_data = str(reader.read_all())
+        obj.experimenter, obj.subtype = reader.read_struct(_struct_LL)
+        obj.experimenter_data = reader.read_all()
         return obj
 
     def __eq__(self, other):
@@ -3343,6 +3329,7 @@ class table_feature_prop_experimenter_miss(table_feature_prop):
 table_feature_prop.subtypes[65535] = table_feature_prop_experimenter_miss
 
 class table_feature_prop_instructions(table_feature_prop):
+    __slots__ = ["instruction_ids"]
     type = 0
 
     def __init__(self, instruction_ids=None):
@@ -3352,21 +3339,22 @@ class table_feature_prop_instructions(table_feature_prop):
             self.instruction_ids = []
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!H", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
-        packed.append(loxi.generic_util.pack_list(self.instruction_ids))
-        length = sum([len(x) for x in packed])
-        packed[1] = struct.pack("!H", length)
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_HH, buf, offset, self.type, 0)
+        offset = loxi.generic_util.pack_list_into(self.instruction_ids, buf, offset)
+        length = offset - start
+        _struct_H.pack_into(buf, start + 2, length)
+        return offset
+
+    def wire_length(self):
+        return 4 + loxi.generic_util.list_wire_length(self.instruction_ids)
 
     @staticmethod
     def unpack(reader):
         obj = table_feature_prop_instructions()
-        _type = reader.read("!H")[0]
+        _type, _length = reader.read_struct(_struct_HH)
         assert(_type == 0)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
         obj.instruction_ids = loxi.generic_util.unpack_list(reader, ofp.instruction_id.instruction_id.unpack)
@@ -3390,6 +3378,7 @@ class table_feature_prop_instructions(table_feature_prop):
 table_feature_prop.subtypes[0] = table_feature_prop_instructions
 
 class table_feature_prop_instructions_miss(table_feature_prop):
+    __slots__ = ["instruction_ids"]
     type = 1
 
     def __init__(self, instruction_ids=None):
@@ -3399,21 +3388,22 @@ class table_feature_prop_instructions_miss(table_feature_prop):
             self.instruction_ids = []
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!H", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
-        packed.append(loxi.generic_util.pack_list(self.instruction_ids))
-        length = sum([len(x) for x in packed])
-        packed[1] = struct.pack("!H", length)
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_HH, buf, offset, self.type, 0)
+        offset = loxi.generic_util.pack_list_into(self.instruction_ids, buf, offset)
+        length = offset - start
+        _struct_H.pack_into(buf, start + 2, length)
+        return offset
+
+    def wire_length(self):
+        return 4 + loxi.generic_util.list_wire_length(self.instruction_ids)
 
     @staticmethod
     def unpack(reader):
         obj = table_feature_prop_instructions_miss()
-        _type = reader.read("!H")[0]
+        _type, _length = reader.read_struct(_struct_HH)
         assert(_type == 1)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
         obj.instruction_ids = loxi.generic_util.unpack_list(reader, ofp.instruction_id.instruction_id.unpack)
@@ -3437,6 +3427,7 @@ class table_feature_prop_instructions_miss(table_feature_prop):
 table_feature_prop.subtypes[1] = table_feature_prop_instructions_miss
 
 class table_feature_prop_match(table_feature_prop):
+    __slots__ = ["oxm_ids"]
     type = 8
 
     def __init__(self, oxm_ids=None):
@@ -3446,21 +3437,22 @@ class table_feature_prop_match(table_feature_prop):
             self.oxm_ids = []
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!H", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
-        packed.append(loxi.generic_util.pack_list(self.oxm_ids))
-        length = sum([len(x) for x in packed])
-        packed[1] = struct.pack("!H", length)
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_HH, buf, offset, self.type, 0)
+        offset = loxi.generic_util.pack_list_into(self.oxm_ids, buf, offset)
+        length = offset - start
+        _struct_H.pack_into(buf, start + 2, length)
+        return offset
+
+    def wire_length(self):
+        return 4 + loxi.generic_util.list_wire_length(self.oxm_ids)
 
     @staticmethod
     def unpack(reader):
         obj = table_feature_prop_match()
-        _type = reader.read("!H")[0]
+        _type, _length = reader.read_struct(_struct_HH)
         assert(_type == 8)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
         obj.oxm_ids = loxi.generic_util.unpack_list(reader, ofp.common.uint32.unpack)
@@ -3484,6 +3476,7 @@ class table_feature_prop_match(table_feature_prop):
 table_feature_prop.subtypes[8] = table_feature_prop_match
 
 class table_feature_prop_next_tables(table_feature_prop):
+    __slots__ = ["next_table_ids"]
     type = 2
 
     def __init__(self, next_table_ids=None):
@@ -3493,21 +3486,22 @@ class table_feature_prop_next_tables(table_feature_prop):
             self.next_table_ids = []
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!H", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
-        packed.append(loxi.generic_util.pack_list(self.next_table_ids))
-        length = sum([len(x) for x in packed])
-        packed[1] = struct.pack("!H", length)
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_HH, buf, offset, self.type, 0)
+        offset = loxi.generic_util.pack_list_into(self.next_table_ids, buf, offset)
+        length = offset - start
+        _struct_H.pack_into(buf, start + 2, length)
+        return offset
+
+    def wire_length(self):
+        return 4 + loxi.generic_util.list_wire_length(self.next_table_ids)
 
     @staticmethod
     def unpack(reader):
         obj = table_feature_prop_next_tables()
-        _type = reader.read("!H")[0]
+        _type, _length = reader.read_struct(_struct_HH)
         assert(_type == 2)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
         obj.next_table_ids = loxi.generic_util.unpack_list(reader, ofp.common.uint8.unpack)
@@ -3531,6 +3525,7 @@ class table_feature_prop_next_tables(table_feature_prop):
 table_feature_prop.subtypes[2] = table_feature_prop_next_tables
 
 class table_feature_prop_next_tables_miss(table_feature_prop):
+    __slots__ = ["next_table_ids"]
     type = 3
 
     def __init__(self, next_table_ids=None):
@@ -3540,21 +3535,22 @@ class table_feature_prop_next_tables_miss(table_feature_prop):
             self.next_table_ids = []
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!H", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
-        packed.append(loxi.generic_util.pack_list(self.next_table_ids))
-        length = sum([len(x) for x in packed])
-        packed[1] = struct.pack("!H", length)
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_HH, buf, offset, self.type, 0)
+        offset = loxi.generic_util.pack_list_into(self.next_table_ids, buf, offset)
+        length = offset - start
+        _struct_H.pack_into(buf, start + 2, length)
+        return offset
+
+    def wire_length(self):
+        return 4 + loxi.generic_util.list_wire_length(self.next_table_ids)
 
     @staticmethod
     def unpack(reader):
         obj = table_feature_prop_next_tables_miss()
-        _type = reader.read("!H")[0]
+        _type, _length = reader.read_struct(_struct_HH)
         assert(_type == 3)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
         obj.next_table_ids = loxi.generic_util.unpack_list(reader, ofp.common.uint8.unpack)
@@ -3578,6 +3574,7 @@ class table_feature_prop_next_tables_miss(table_feature_prop):
 table_feature_prop.subtypes[3] = table_feature_prop_next_tables_miss
 
 class table_feature_prop_table_sync_from(table_feature_prop):
+    __slots__ = ["table_ids"]
     type = 16
 
     def __init__(self, table_ids=None):
@@ -3587,21 +3584,22 @@ class table_feature_prop_table_sync_from(table_feature_prop):
             self.table_ids = []
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!H", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
-        packed.append(loxi.generic_util.pack_list(self.table_ids))
-        length = sum([len(x) for x in packed])
-        packed[1] = struct.pack("!H", length)
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_HH, buf, offset, self.type, 0)
+        offset = loxi.generic_util.pack_list_into(self.table_ids, buf, offset)
+        length = offset - start
+        _struct_H.pack_into(buf, start + 2, length)
+        return offset
+
+    def wire_length(self):
+        return 4 + loxi.generic_util.list_wire_length(self.table_ids)
 
     @staticmethod
     def unpack(reader):
         obj = table_feature_prop_table_sync_from()
-        _type = reader.read("!H")[0]
+        _type, _length = reader.read_struct(_struct_HH)
         assert(_type == 16)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
         obj.table_ids = loxi.generic_util.unpack_list(reader, ofp.common.uint8.unpack)
@@ -3625,6 +3623,7 @@ class table_feature_prop_table_sync_from(table_feature_prop):
 table_feature_prop.subtypes[16] = table_feature_prop_table_sync_from
 
 class table_feature_prop_wildcards(table_feature_prop):
+    __slots__ = ["oxm_ids"]
     type = 10
 
     def __init__(self, oxm_ids=None):
@@ -3634,21 +3633,22 @@ class table_feature_prop_wildcards(table_feature_prop):
             self.oxm_ids = []
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!H", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
-        packed.append(loxi.generic_util.pack_list(self.oxm_ids))
-        length = sum([len(x) for x in packed])
-        packed[1] = struct.pack("!H", length)
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_HH, buf, offset, self.type, 0)
+        offset = loxi.generic_util.pack_list_into(self.oxm_ids, buf, offset)
+        length = offset - start
+        _struct_H.pack_into(buf, start + 2, length)
+        return offset
+
+    def wire_length(self):
+        return 4 + loxi.generic_util.list_wire_length(self.oxm_ids)
 
     @staticmethod
     def unpack(reader):
         obj = table_feature_prop_wildcards()
-        _type = reader.read("!H")[0]
+        _type, _length = reader.read_struct(_struct_HH)
         assert(_type == 10)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
         obj.oxm_ids = loxi.generic_util.unpack_list(reader, ofp.common.uint32.unpack)
@@ -3672,6 +3672,7 @@ class table_feature_prop_wildcards(table_feature_prop):
 table_feature_prop.subtypes[10] = table_feature_prop_wildcards
 
 class table_feature_prop_write_actions(table_feature_prop):
+    __slots__ = ["action_ids"]
     type = 4
 
     def __init__(self, action_ids=None):
@@ -3681,21 +3682,22 @@ class table_feature_prop_write_actions(table_feature_prop):
             self.action_ids = []
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!H", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
-        packed.append(loxi.generic_util.pack_list(self.action_ids))
-        length = sum([len(x) for x in packed])
-        packed[1] = struct.pack("!H", length)
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_HH, buf, offset, self.type, 0)
+        offset = loxi.generic_util.pack_list_into(self.action_ids, buf, offset)
+        length = offset - start
+        _struct_H.pack_into(buf, start + 2, length)
+        return offset
+
+    def wire_length(self):
+        return 4 + loxi.generic_util.list_wire_length(self.action_ids)
 
     @staticmethod
     def unpack(reader):
         obj = table_feature_prop_write_actions()
-        _type = reader.read("!H")[0]
+        _type, _length = reader.read_struct(_struct_HH)
         assert(_type == 4)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
         obj.action_ids = loxi.generic_util.unpack_list(reader, ofp.action_id.action_id.unpack)
@@ -3719,6 +3721,7 @@ class table_feature_prop_write_actions(table_feature_prop):
 table_feature_prop.subtypes[4] = table_feature_prop_write_actions
 
 class table_feature_prop_write_actions_miss(table_feature_prop):
+    __slots__ = ["action_ids"]
     type = 5
 
     def __init__(self, action_ids=None):
@@ -3728,21 +3731,22 @@ class table_feature_prop_write_actions_miss(table_feature_prop):
             self.action_ids = []
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!H", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
-        packed.append(loxi.generic_util.pack_list(self.action_ids))
-        length = sum([len(x) for x in packed])
-        packed[1] = struct.pack("!H", length)
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_HH, buf, offset, self.type, 0)
+        offset = loxi.generic_util.pack_list_into(self.action_ids, buf, offset)
+        length = offset - start
+        _struct_H.pack_into(buf, start + 2, length)
+        return offset
+
+    def wire_length(self):
+        return 4 + loxi.generic_util.list_wire_length(self.action_ids)
 
     @staticmethod
     def unpack(reader):
         obj = table_feature_prop_write_actions_miss()
-        _type = reader.read("!H")[0]
+        _type, _length = reader.read_struct(_struct_HH)
         assert(_type == 5)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
         obj.action_ids = loxi.generic_util.unpack_list(reader, ofp.action_id.action_id.unpack)
@@ -3766,6 +3770,7 @@ class table_feature_prop_write_actions_miss(table_feature_prop):
 table_feature_prop.subtypes[5] = table_feature_prop_write_actions_miss
 
 class table_feature_prop_write_setfield(table_feature_prop):
+    __slots__ = ["oxm_ids"]
     type = 12
 
     def __init__(self, oxm_ids=None):
@@ -3775,21 +3780,22 @@ class table_feature_prop_write_setfield(table_feature_prop):
             self.oxm_ids = []
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!H", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
-        packed.append(loxi.generic_util.pack_list(self.oxm_ids))
-        length = sum([len(x) for x in packed])
-        packed[1] = struct.pack("!H", length)
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_HH, buf, offset, self.type, 0)
+        offset = loxi.generic_util.pack_list_into(self.oxm_ids, buf, offset)
+        length = offset - start
+        _struct_H.pack_into(buf, start + 2, length)
+        return offset
+
+    def wire_length(self):
+        return 4 + loxi.generic_util.list_wire_length(self.oxm_ids)
 
     @staticmethod
     def unpack(reader):
         obj = table_feature_prop_write_setfield()
-        _type = reader.read("!H")[0]
+        _type, _length = reader.read_struct(_struct_HH)
         assert(_type == 12)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
         obj.oxm_ids = loxi.generic_util.unpack_list(reader, ofp.common.uint32.unpack)
@@ -3813,6 +3819,7 @@ class table_feature_prop_write_setfield(table_feature_prop):
 table_feature_prop.subtypes[12] = table_feature_prop_write_setfield
 
 class table_feature_prop_write_setfield_miss(table_feature_prop):
+    __slots__ = ["oxm_ids"]
     type = 13
 
     def __init__(self, oxm_ids=None):
@@ -3822,21 +3829,22 @@ class table_feature_prop_write_setfield_miss(table_feature_prop):
             self.oxm_ids = []
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!H", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
-        packed.append(loxi.generic_util.pack_list(self.oxm_ids))
-        length = sum([len(x) for x in packed])
-        packed[1] = struct.pack("!H", length)
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_HH, buf, offset, self.type, 0)
+        offset = loxi.generic_util.pack_list_into(self.oxm_ids, buf, offset)
+        length = offset - start
+        _struct_H.pack_into(buf, start + 2, length)
+        return offset
+
+    def wire_length(self):
+        return 4 + loxi.generic_util.list_wire_length(self.oxm_ids)
 
     @staticmethod
     def unpack(reader):
         obj = table_feature_prop_write_setfield_miss()
-        _type = reader.read("!H")[0]
+        _type, _length = reader.read_struct(_struct_HH)
         assert(_type == 13)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
         obj.oxm_ids = loxi.generic_util.unpack_list(reader, ofp.common.uint32.unpack)
@@ -3860,6 +3868,7 @@ class table_feature_prop_write_setfield_miss(table_feature_prop):
 table_feature_prop.subtypes[13] = table_feature_prop_write_setfield_miss
 
 class table_features(loxi.OFObject):
+    __slots__ = ["config", "max_entries", "metadata_match", "metadata_write", "name", "properties", "table_id"]
 
     def __init__(self, table_id=None, name=None, metadata_match=None, metadata_write=None, config=None, max_entries=None, properties=None):
         if table_id != None:
@@ -3892,20 +3901,16 @@ class table_features(loxi.OFObject):
             self.properties = []
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 0
-        packed.append(struct.pack("!B", self.table_id))
-        packed.append('\x00' * 5)
-        packed.append(struct.pack("!32s", self.name))
-        packed.append(struct.pack("!Q", self.metadata_match))
-        packed.append(struct.pack("!Q", self.metadata_write))
-        packed.append(struct.pack("!L", self.config))
-        packed.append(struct.pack("!L", self.max_entries))
-        packed.append(loxi.generic_util.pack_list(self.properties))
-        length = sum([len(x) for x in packed])
-        packed[0] = struct.pack("!H", length)
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_HB5x32sQQLL, buf, offset, 0, self.table_id, self.name, self.metadata_match, self.metadata_write, self.config, self.max_entries)
+        offset = loxi.generic_util.pack_list_into(self.properties, buf, offset)
+        length = offset - start
+        _struct_H.pack_into(buf, start + 0, length)
+        return offset
+
+    def wire_length(self):
+        return 64 + loxi.generic_util.list_wire_length(self.properties)
 
     @staticmethod
     def unpack(reader):
@@ -3913,13 +3918,8 @@ class table_features(loxi.OFObject):
         _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 2)
-        obj.table_id = reader.read("!B")[0]
-        reader.skip(5)
-        obj.name = reader.read("!32s")[0].rstrip("\x00")
-        obj.metadata_match = reader.read("!Q")[0]
-        obj.metadata_write = reader.read("!Q")[0]
-        obj.config = reader.read("!L")[0]
-        obj.max_entries = reader.read("!L")[0]
+        obj.table_id, obj.name, obj.metadata_match, obj.metadata_write, obj.config, obj.max_entries = reader.read_struct(_struct_B5x32sQQLL)
+        obj.name = obj.name.rstrip("\x00")
         obj.properties = loxi.generic_util.unpack_list(reader, ofp.common.table_feature_prop.unpack)
         return obj
 
@@ -3964,6 +3964,7 @@ class table_features(loxi.OFObject):
 
 
 class table_mod_prop_eviction(loxi.OFObject):
+    __slots__ = ["flags"]
     type = 2
 
     def __init__(self, flags=None):
@@ -3973,21 +3974,21 @@ class table_mod_prop_eviction(loxi.OFObject):
             self.flags = 0
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!H", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
-        packed.append(struct.pack("!L", self.flags))
-        length = sum([len(x) for x in packed])
-        packed[1] = struct.pack("!H", length)
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_HHL, buf, offset, self.type, 0, self.flags)
+        length = offset - start
+        _struct_H.pack_into(buf, start + 2, length)
+        return offset
+
+    def wire_length(self):
+        return 8
 
     @staticmethod
     def unpack(reader):
         obj = table_mod_prop_eviction()
-        _type = reader.read("!H")[0]
+        _type, _length = reader.read_struct(_struct_HH)
         assert(_type == 2)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
         obj.flags = reader.read("!L")[0]
@@ -4010,6 +4011,7 @@ class table_mod_prop_eviction(loxi.OFObject):
 
 
 class table_mod_prop_experimenter(loxi.OFObject):
+    __slots__ = ["exp_type", "experimenter"]
     subtypes = {}
 
     type = 65535
@@ -4025,15 +4027,15 @@ class table_mod_prop_experimenter(loxi.OFObject):
             self.exp_type = 0
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!H", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
-        packed.append(struct.pack("!L", self.experimenter))
-        packed.append(struct.pack("!L", self.exp_type))
-        length = sum([len(x) for x in packed])
-        packed[1] = struct.pack("!H", length)
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_HHLL, buf, offset, self.type, 0, self.experimenter, self.exp_type)
+        length = offset - start
+        _struct_H.pack_into(buf, start + 2, length)
+        return offset
+
+    def wire_length(self):
+        return 12
 
     @staticmethod
     def unpack(reader):
@@ -4043,13 +4045,11 @@ class table_mod_prop_experimenter(loxi.OFObject):
             return subclass.unpack(reader)
 
         obj = table_mod_prop_experimenter()
-        _type = reader.read("!H")[0]
+        _type, _length = reader.read_struct(_struct_HH)
         assert(_type == 65535)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.experimenter = reader.read("!L")[0]
-        obj.exp_type = reader.read("!L")[0]
+        obj.experimenter, obj.exp_type = reader.read_struct(_struct_LL)
         return obj
 
     def __eq__(self, other):
@@ -4070,6 +4070,7 @@ class table_mod_prop_experimenter(loxi.OFObject):
 
 
 class table_mod_prop_vacancy(loxi.OFObject):
+    __slots__ = ["vacancy", "vacancy_down", "vacancy_up"]
     type = 3
 
     def __init__(self, vacancy_down=None, vacancy_up=None, vacancy=None):
@@ -4087,30 +4088,24 @@ class table_mod_prop_vacancy(loxi.OFObject):
             self.vacancy = 0
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!H", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
-        packed.append(struct.pack("!B", self.vacancy_down))
-        packed.append(struct.pack("!B", self.vacancy_up))
-        packed.append(struct.pack("!B", self.vacancy))
-        packed.append('\x00' * 1)
-        length = sum([len(x) for x in packed])
-        packed[1] = struct.pack("!H", length)
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_HHBBBx, buf, offset, self.type, 0, self.vacancy_down, self.vacancy_up, self.vacancy)
+        length = offset - start
+        _struct_H.pack_into(buf, start + 2, length)
+        return offset
+
+    def wire_length(self):
+        return 8
 
     @staticmethod
     def unpack(reader):
         obj = table_mod_prop_vacancy()
-        _type = reader.read("!H")[0]
+        _type, _length = reader.read_struct(_struct_HH)
         assert(_type == 3)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.vacancy_down = reader.read("!B")[0]
-        obj.vacancy_up = reader.read("!B")[0]
-        obj.vacancy = reader.read("!B")[0]
-        reader.skip(1)
+        obj.vacancy_down, obj.vacancy_up, obj.vacancy = reader.read_struct(_struct_BBBx)
         return obj
 
     def __eq__(self, other):
@@ -4138,6 +4133,7 @@ class table_mod_prop_vacancy(loxi.OFObject):
 
 
 class table_stats_entry(loxi.OFObject):
+    __slots__ = ["active_count", "lookup_count", "matched_count", "table_id"]
 
     def __init__(self, table_id=None, active_count=None, lookup_count=None, matched_count=None):
         if table_id != None:
@@ -4158,23 +4154,18 @@ class table_stats_entry(loxi.OFObject):
             self.matched_count = 0
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!B", self.table_id))
-        packed.append('\x00' * 3)
-        packed.append(struct.pack("!L", self.active_count))
-        packed.append(struct.pack("!Q", self.lookup_count))
-        packed.append(struct.pack("!Q", self.matched_count))
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_B3xLQQ, buf, offset, self.table_id, self.active_count, self.lookup_count, self.matched_count)
+        return offset
+
+    def wire_length(self):
+        return 24
 
     @staticmethod
     def unpack(reader):
         obj = table_stats_entry()
-        obj.table_id = reader.read("!B")[0]
-        reader.skip(3)
-        obj.active_count = reader.read("!L")[0]
-        obj.lookup_count = reader.read("!Q")[0]
-        obj.matched_count = reader.read("!Q")[0]
+        obj.table_id, obj.active_count, obj.lookup_count, obj.matched_count = reader.read_struct(_struct_B3xLQQ)
         return obj
 
     def __eq__(self, other):
@@ -4206,6 +4197,7 @@ class table_stats_entry(loxi.OFObject):
 
 
 class uint32(loxi.OFObject):
+    __slots__ = ["value"]
 
     def __init__(self, value=None):
         if value != None:
@@ -4214,10 +4206,13 @@ class uint32(loxi.OFObject):
             self.value = 0
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!L", self.value))
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_L, buf, offset, self.value)
+        return offset
+
+    def wire_length(self):
+        return 4
 
     @staticmethod
     def unpack(reader):
@@ -4242,6 +4237,7 @@ class uint32(loxi.OFObject):
 
 
 class uint64(loxi.OFObject):
+    __slots__ = ["value"]
 
     def __init__(self, value=None):
         if value != None:
@@ -4250,10 +4246,13 @@ class uint64(loxi.OFObject):
             self.value = 0
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!Q", self.value))
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_Q, buf, offset, self.value)
+        return offset
+
+    def wire_length(self):
+        return 8
 
     @staticmethod
     def unpack(reader):
@@ -4278,6 +4277,7 @@ class uint64(loxi.OFObject):
 
 
 class uint8(loxi.OFObject):
+    __slots__ = ["value"]
 
     def __init__(self, value=None):
         if value != None:
@@ -4286,10 +4286,13 @@ class uint8(loxi.OFObject):
             self.value = 0
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!B", self.value))
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_B, buf, offset, self.value)
+        return offset
+
+    def wire_length(self):
+        return 1
 
     @staticmethod
     def unpack(reader):
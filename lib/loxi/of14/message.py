@@ -14,7 +14,124 @@ import loxi.generic_util
 import sys
 ofp = sys.modules['loxi.of14']
 
+# Precompiled layouts for the fixed-length parts of each pack_into() and unpack()
+_struct_2x = struct.Struct("!2x")
+_struct_2xLL = struct.Struct("!2xLL")
+_struct_6B = struct.Struct("!6B")
+_struct_B = struct.Struct("!B")
+_struct_BBH = struct.Struct("!BBH")
+_struct_BBHL = struct.Struct("!BBHL")
+_struct_BBHLB3xL = struct.Struct("!BBHLB3xL")
+_struct_BBHLB7x = struct.Struct("!BBHLB7x")
+_struct_BBHLH = struct.Struct("!BBHLH")
+_struct_BBHLHBxL = struct.Struct("!BBHLHBxL")
+_struct_BBHLHH = struct.Struct("!BBHLHH")
+_struct_BBHLHH4x = struct.Struct("!BBHLHH4x")
+_struct_BBHLHH4x256s256s256s32s256s = struct.Struct("!BBHLHH4x256s256s256s32s256s")
+_struct_BBHLHH4xB3xLL4xQQ = struct.Struct("!BBHLHH4xB3xLL4xQQ")
+_struct_BBHLHH4xL4x = struct.Struct("!BBHLHH4xL4x")
+_struct_BBHLHH4xLL = struct.Struct("!BBHLHH4xLL")
+_struct_BBHLHH4xLL256s256s = struct.Struct("!BBHLHH4xLL256s256s")
+_struct_BBHLHH4xLL64s = struct.Struct("!BBHLHH4xLL64s")
+_struct_BBHLHH4xLLB = struct.Struct("!BBHLHH4xLLB")
+_struct_BBHLHH4xLLH = struct.Struct("!BBHLHH4xLLH")
+_struct_BBHLHH4xLLH2x = struct.Struct("!BBHLHH4xLLH2x")
+_struct_BBHLHH4xLLL = struct.Struct("!BBHLHH4xLLL")
+_struct_BBHLHH4xLLLLLLLLLL = struct.Struct("!BBHLHH4xLLLLLLLLLL")
+_struct_BBHLHH4xQQL4x = struct.Struct("!BBHLHH4xQQL4x")
+_struct_BBHLHHL = struct.Struct("!BBHLHHL")
+_struct_BBHLL = struct.Struct("!BBHLL")
+_struct_BBHLL2xH = struct.Struct("!BBHLL2xH")
+_struct_BBHLL4x = struct.Struct("!BBHLL4x")
+_struct_BBHLL4xQ = struct.Struct("!BBHLL4xQ")
+_struct_BBHLLB3xQ = struct.Struct("!BBHLLB3xQ")
+_struct_BBHLLB7x = struct.Struct("!BBHLLB7x")
+_struct_BBHLLHBBQ = struct.Struct("!BBHLLHBBQ")
+_struct_BBHLLHH = struct.Struct("!BBHLLHH")
+_struct_BBHLLL = struct.Struct("!BBHLLL")
+_struct_BBHLLL256s = struct.Struct("!BBHLLL256s")
+_struct_BBHLLLB = struct.Struct("!BBHLLLB")
+_struct_BBHLLLB3x = struct.Struct("!BBHLLLB3x")
+_struct_BBHLLLB3xLH = struct.Struct("!BBHLLLB3xLH")
+_struct_BBHLLLBxHHHQ = struct.Struct("!BBHLLLBxHHHQ")
+_struct_BBHLLLH = struct.Struct("!BBHLLLH")
+_struct_BBHLLLH2x = struct.Struct("!BBHLLLH2x")
+_struct_BBHLLLH2xL = struct.Struct("!BBHLLLH2xL")
+_struct_BBHLLLH2xLL = struct.Struct("!BBHLLLH2xLL")
+_struct_BBHLLLH64s = struct.Struct("!BBHLLLH64s")
+_struct_BBHLLLH6x = struct.Struct("!BBHLLLH6x")
+_struct_BBHLLLHH = struct.Struct("!BBHLLLHH")
+_struct_BBHLLLL = struct.Struct("!BBHLLLL")
+_struct_BBHLLLLB = struct.Struct("!BBHLLLLB")
+_struct_BBHLLLLL = struct.Struct("!BBHLLLLL")
+_struct_BBHLLLLLB = struct.Struct("!BBHLLLLLB")
+_struct_BBHLLLLLB3x = struct.Struct("!BBHLLLLLB3x")
+_struct_BBHLLLQ = struct.Struct("!BBHLLLQ")
+_struct_BBHLLLQHB5x = struct.Struct("!BBHLLLQHB5x")
+_struct_BBHLLLxB2xL = struct.Struct("!BBHLLLxB2xL")
+_struct_BBHLQHBBLLHHQQ = struct.Struct("!BBHLQHBBLLHHQQ")
+_struct_BBHLQLBB2xLL = struct.Struct("!BBHLQLBB2xLL")
+_struct_BBHLQQBBHHHLLLH2x = struct.Struct("!BBHLQQBBHHHLLLH2x")
+_struct_BBHLQQBBHHHLLLHH = struct.Struct("!BBHLQQBBHHHLLLHH")
+_struct_H = struct.Struct("!H")
+_struct_HHH = struct.Struct("!HHH")
+_struct_HHHH = struct.Struct("!HHHH")
+_struct_L = struct.Struct("!L")
+_struct_LB3xL = struct.Struct("!LB3xL")
+_struct_LB7x = struct.Struct("!LB7x")
+_struct_LH = struct.Struct("!LH")
+_struct_LHBxL = struct.Struct("!LHBxL")
+_struct_LHH = struct.Struct("!LHH")
+_struct_LHH4x = struct.Struct("!LHH4x")
+_struct_LHH4x256s256s256s32s256s = struct.Struct("!LHH4x256s256s256s32s256s")
+_struct_LHH4xB3xLL4xQQ = struct.Struct("!LHH4xB3xLL4xQQ")
+_struct_LHH4xL4x = struct.Struct("!LHH4xL4x")
+_struct_LHH4xLL = struct.Struct("!LHH4xLL")
+_struct_LHH4xLL256s256s = struct.Struct("!LHH4xLL256s256s")
+_struct_LHH4xLL64s = struct.Struct("!LHH4xLL64s")
+_struct_LHH4xLLB = struct.Struct("!LHH4xLLB")
+_struct_LHH4xLLH = struct.Struct("!LHH4xLLH")
+_struct_LHH4xLLH2x = struct.Struct("!LHH4xLLH2x")
+_struct_LHH4xLLL = struct.Struct("!LHH4xLLL")
+_struct_LHH4xLLLLLLLLLL = struct.Struct("!LHH4xLLLLLLLLLL")
+_struct_LHH4xQQL4x = struct.Struct("!LHH4xQQL4x")
+_struct_LHHL = struct.Struct("!LHHL")
+_struct_LL = struct.Struct("!LL")
+_struct_LL2xH = struct.Struct("!LL2xH")
+_struct_LL4x = struct.Struct("!LL4x")
+_struct_LL4xQ = struct.Struct("!LL4xQ")
+_struct_LLB3xQ = struct.Struct("!LLB3xQ")
+_struct_LLB7x = struct.Struct("!LLB7x")
+_struct_LLHBBQ = struct.Struct("!LLHBBQ")
+_struct_LLHH = struct.Struct("!LLHH")
+_struct_LLL = struct.Struct("!LLL")
+_struct_LLL256s = struct.Struct("!LLL256s")
+_struct_LLLB = struct.Struct("!LLLB")
+_struct_LLLB3x = struct.Struct("!LLLB3x")
+_struct_LLLB3xLH = struct.Struct("!LLLB3xLH")
+_struct_LLLBxHHHQ = struct.Struct("!LLLBxHHHQ")
+_struct_LLLH = struct.Struct("!LLLH")
+_struct_LLLH2x = struct.Struct("!LLLH2x")
+_struct_LLLH2xL = struct.Struct("!LLLH2xL")
+_struct_LLLH2xLL = struct.Struct("!LLLH2xLL")
+_struct_LLLH64s = struct.Struct("!LLLH64s")
+_struct_LLLH6x = struct.Struct("!LLLH6x")
+_struct_LLLHH = struct.Struct("!LLLHH")
+_struct_LLLL = struct.Struct("!LLLL")
+_struct_LLLLB = struct.Struct("!LLLLB")
+_struct_LLLLL = struct.Struct("!LLLLL")
+_struct_LLLLLB = struct.Struct("!LLLLLB")
+_struct_LLLLLB3x = struct.Struct("!LLLLLB3x")
+_struct_LLLQ = struct.Struct("!LLLQ")
+_struct_LLLQHB5x = struct.Struct("!LLLQHB5x")
+_struct_LLLxB2xL = struct.Struct("!LLLxB2xL")
+_struct_LQHBBLLHHQQ = struct.Struct("!LQHBBLLHHQQ")
+_struct_LQLBB2xLL = struct.Struct("!LQLBB2xLL")
+_struct_LQQBBHHHLLLH2x = struct.Struct("!LQQBBHHHLLLH2x")
+_struct_LQQBBHHHLLLHH = struct.Struct("!LQQBBHHHLLLHH")
+
 class message(loxi.OFObject):
+    __slots__ = ["type", "xid"]
     subtypes = {}
 
     version = 5
@@ -30,15 +147,15 @@ class message(loxi.OFObject):
             self.xid = None
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_BBHL, buf, offset, self.version, self.type, 0, self.xid)
+        length = offset - start
+        _struct_H.pack_into(buf, start + 2, length)
+        return offset
+
+    def wire_length(self):
+        return 8
 
     @staticmethod
     def unpack(reader):
@@ -48,10 +165,8 @@ class message(loxi.OFObject):
             return subclass.unpack(reader)
 
         obj = message()
-        _version = reader.read("!B")[0]
+        _version, obj.type, _length = reader.read_struct(_struct_BBH)
         assert(_version == 5)
-        obj.type = reader.read("!B")[0]
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
         obj.xid = reader.read("!L")[0]
@@ -78,6 +193,7 @@ class message(loxi.OFObject):
 
 
 class stats_reply(message):
+    __slots__ = ["flags", "stats_type"]
     subtypes = {}
 
     version = 5
@@ -98,18 +214,15 @@ class stats_reply(message):
             self.flags = 0
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!H", self.stats_type))
-        packed.append(struct.pack("!H", self.flags))
-        packed.append('\x00' * 4)
-        length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_BBHLHH4x, buf, offset, self.version, self.type, 0, self.xid, self.stats_type, self.flags)
+        length = offset - start
+        _struct_H.pack_into(buf, start + 2, length)
+        return offset
+
+    def wire_length(self):
+        return 16
 
     @staticmethod
     def unpack(reader):
@@ -119,17 +232,12 @@ class stats_reply(message):
             return subclass.unpack(reader)
 
         obj = stats_reply()
-        _version = reader.read("!B")[0]
+        _version, _type, _length = reader.read_struct(_struct_BBH)
         assert(_version == 5)
-        _type = reader.read("!B")[0]
         assert(_type == 19)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        obj.stats_type = reader.read("!H")[0]
-        obj.flags = reader.read("!H")[0]
-        reader.skip(4)
+        obj.xid, obj.stats_type, obj.flags = reader.read_struct(_struct_LHH4x)
         return obj
 
     def __eq__(self, other):
@@ -158,6 +266,7 @@ class stats_reply(message):
 message.subtypes[19] = stats_reply
 
 class aggregate_stats_reply(stats_reply):
+    __slots__ = ["byte_count", "flow_count", "packet_count"]
     version = 5
     type = 19
     stats_type = 2
@@ -185,42 +294,26 @@ class aggregate_stats_reply(stats_reply):
             self.flow_count = 0
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!H", self.stats_type))
-        packed.append(struct.pack("!H", self.flags))
-        packed.append('\x00' * 4)
-        packed.append(struct.pack("!Q", self.packet_count))
-        packed.append(struct.pack("!Q", self.byte_count))
-        packed.append(struct.pack("!L", self.flow_count))
-        packed.append('\x00' * 4)
-        length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_BBHLHH4xQQL4x, buf, offset, self.version, self.type, 0, self.xid, self.stats_type, self.flags, self.packet_count, self.byte_count, self.flow_count)
+        length = offset - start
+        _struct_H.pack_into(buf, start + 2, length)
+        return offset
+
+    def wire_length(self):
+        return 40
 
     @staticmethod
     def unpack(reader):
         obj = aggregate_stats_reply()
-        _version = reader.read("!B")[0]
+        _version, _type, _length = reader.read_struct(_struct_BBH)
         assert(_version == 5)
-        _type = reader.read("!B")[0]
         assert(_type == 19)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        _stats_type = reader.read("!H")[0]
+        obj.xid, _stats_type, obj.flags, obj.packet_count, obj.byte_count, obj.flow_count = reader.read_struct(_struct_LHH4xQQL4x)
         assert(_stats_type == 2)
-        obj.flags = reader.read("!H")[0]
-        reader.skip(4)
-        obj.packet_count = reader.read("!Q")[0]
-        obj.byte_count = reader.read("!Q")[0]
-        obj.flow_count = reader.read("!L")[0]
-        reader.skip(4)
         return obj
 
     def __eq__(self, other):
@@ -260,6 +353,7 @@ class aggregate_stats_reply(stats_reply):
 stats_reply.subtypes[2] = aggregate_stats_reply
 
 class stats_request(message):
+    __slots__ = ["flags", "stats_type"]
     subtypes = {}
 
     version = 5
@@ -280,18 +374,15 @@ class stats_request(message):
             self.flags = 0
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!H", self.stats_type))
-        packed.append(struct.pack("!H", self.flags))
-        packed.append('\x00' * 4)
-        length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_BBHLHH4x, buf, offset, self.version, self.type, 0, self.xid, self.stats_type, self.flags)
+        length = offset - start
+        _struct_H.pack_into(buf, start + 2, length)
+        return offset
+
+    def wire_length(self):
+        return 16
 
     @staticmethod
     def unpack(reader):
@@ -301,17 +392,12 @@ class stats_request(message):
             return subclass.unpack(reader)
 
         obj = stats_request()
-        _version = reader.read("!B")[0]
+        _version, _type, _length = reader.read_struct(_struct_BBH)
         assert(_version == 5)
-        _type = reader.read("!B")[0]
         assert(_type == 18)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        obj.stats_type = reader.read("!H")[0]
-        obj.flags = reader.read("!H")[0]
-        reader.skip(4)
+        obj.xid, obj.stats_type, obj.flags = reader.read_struct(_struct_LHH4x)
         return obj
 
     def __eq__(self, other):
@@ -340,6 +426,7 @@ class stats_request(message):
 message.subtypes[18] = stats_request
 
 class aggregate_stats_request(stats_request):
+    __slots__ = ["cookie", "cookie_mask", "match", "out_group", "out_port", "table_id"]
     version = 5
     type = 18
     stats_type = 2
@@ -379,49 +466,27 @@ class aggregate_stats_request(stats_request):
             self.match = ofp.match()
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!H", self.stats_type))
-        packed.append(struct.pack("!H", self.flags))
-        packed.append('\x00' * 4)
-        packed.append(struct.pack("!B", self.table_id))
-        packed.append('\x00' * 3)
-        packed.append(util.pack_port_no(self.out_port))
-        packed.append(struct.pack("!L", self.out_group))
-        packed.append('\x00' * 4)
-        packed.append(struct.pack("!Q", self.cookie))
-        packed.append(struct.pack("!Q", self.cookie_mask))
-        packed.append(self.match.pack())
-        length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_BBHLHH4xB3xLL4xQQ, buf, offset, self.version, self.type, 0, self.xid, self.stats_type, self.flags, self.table_id, self.out_port, self.out_group, self.cookie, self.cookie_mask)
+        offset = self.match.pack_into(buf, offset)
+        length = offset - start
+        _struct_H.pack_into(buf, start + 2, length)
+        return offset
+
+    def wire_length(self):
+        return 48 + self.match.wire_length()
 
     @staticmethod
     def unpack(reader):
         obj = aggregate_stats_request()
-        _version = reader.read("!B")[0]
+        _version, _type, _length = reader.read_struct(_struct_BBH)
         assert(_version == 5)
-        _type = reader.read("!B")[0]
         assert(_type == 18)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        _stats_type = reader.read("!H")[0]
+        obj.xid, _stats_type, obj.flags, obj.table_id, obj.out_port, obj.out_group, obj.cookie, obj.cookie_mask = reader.read_struct(_struct_LHH4xB3xLL4xQQ)
         assert(_stats_type == 2)
-        obj.flags = reader.read("!H")[0]
-        reader.skip(4)
-        obj.table_id = reader.read("!B")[0]
-        reader.skip(3)
-        obj.out_port = util.unpack_port_no(reader)
-        obj.out_group = reader.read("!L")[0]
-        reader.skip(4)
-        obj.cookie = reader.read("!Q")[0]
-        obj.cookie_mask = reader.read("!Q")[0]
         obj.match = ofp.match.unpack(reader)
         return obj
 
@@ -474,6 +539,7 @@ class aggregate_stats_request(stats_request):
 stats_request.subtypes[2] = aggregate_stats_request
 
 class error_msg(message):
+    __slots__ = ["err_type"]
     subtypes = {}
 
     version = 5
@@ -490,16 +556,15 @@ class error_msg(message):
             self.err_type = 0
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!H", self.err_type))
-        length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_BBHLH, buf, offset, self.version, self.type, 0, self.xid, self.err_type)
+        length = offset - start
+        _struct_H.pack_into(buf, start + 2, length)
+        return offset
+
+    def wire_length(self):
+        return 10
 
     @staticmethod
     def unpack(reader):
@@ -509,15 +574,12 @@ class error_msg(message):
             return subclass.unpack(reader)
 
         obj = error_msg()
-        _version = reader.read("!B")[0]
+        _version, _type, _length = reader.read_struct(_struct_BBH)
         assert(_version == 5)
-        _type = reader.read("!B")[0]
         assert(_type == 1)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        obj.err_type = reader.read("!H")[0]
+        obj.xid, obj.err_type = reader.read_struct(_struct_LH)
         return obj
 
     def __eq__(self, other):
@@ -542,6 +604,7 @@ class error_msg(message):
 message.subtypes[1] = error_msg
 
 class async_config_failed_error_msg(error_msg):
+    __slots__ = ["code", "data"]
     version = 5
     type = 1
     err_type = 15
@@ -561,34 +624,28 @@ class async_config_failed_error_msg(error_msg):
             self.data = ''
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!H", self.err_type))
-        packed.append(struct.pack("!H", self.code))
-        packed.append(self.data)
-        length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_BBHLHH, buf, offset, self.version, self.type, 0, self.xid, self.err_type, self.code)
+        offset = loxi.generic_util.pack_bytes_into(self.data, buf, offset)
+        length = offset - start
+        _struct_H.pack_into(buf, start + 2, length)
+        return offset
+
+    def wire_length(self):
+        return 12 + len(self.data)
 
     @staticmethod
     def unpack(reader):
         obj = async_config_failed_error_msg()
-        _version = reader.read("!B")[0]
+        _version, _type, _length = reader.read_struct(_struct_BBH)
         assert(_version == 5)
-        _type = reader.read("!B")[0]
         assert(_type == 1)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        _err_type = reader.read("!H")[0]
+        obj.xid, _err_type, obj.code = reader.read_struct(_struct_LHH)
         assert(_err_type == 15)
-        obj.code = reader.read("!H")[0]
-        obj.data = str(reader.read_all())
+        obj.data = reader.read_all()
         return obj
 
     def __eq__(self, other):
@@ -620,6 +677,7 @@ class async_config_failed_error_msg(error_msg):
 error_msg.subtypes[15] = async_config_failed_error_msg
 
 class async_get_reply(message):
+    __slots__ = ["properties"]
     version = 5
     type = 27
 
@@ -634,25 +692,23 @@ class async_get_reply(message):
             self.properties = []
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(loxi.generic_util.pack_list(self.properties))
-        length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_BBHL, buf, offset, self.version, self.type, 0, self.xid)
+        offset = loxi.generic_util.pack_list_into(self.properties, buf, offset)
+        length = offset - start
+        _struct_H.pack_into(buf, start + 2, length)
+        return offset
+
+    def wire_length(self):
+        return 8 + loxi.generic_util.list_wire_length(self.properties)
 
     @staticmethod
     def unpack(reader):
         obj = async_get_reply()
-        _version = reader.read("!B")[0]
+        _version, _type, _length = reader.read_struct(_struct_BBH)
         assert(_version == 5)
-        _type = reader.read("!B")[0]
         assert(_type == 27)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
         obj.xid = reader.read("!L")[0]
@@ -684,6 +740,7 @@ class async_get_reply(message):
 message.subtypes[27] = async_get_reply
 
 class async_get_request(message):
+    __slots__ = ["properties"]
     version = 5
     type = 26
 
@@ -698,25 +755,23 @@ class async_get_request(message):
             self.properties = []
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(loxi.generic_util.pack_list(self.properties))
-        length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_BBHL, buf, offset, self.version, self.type, 0, self.xid)
+        offset = loxi.generic_util.pack_list_into(self.properties, buf, offset)
+        length = offset - start
+        _struct_H.pack_into(buf, start + 2, length)
+        return offset
+
+    def wire_length(self):
+        return 8 + loxi.generic_util.list_wire_length(self.properties)
 
     @staticmethod
     def unpack(reader):
         obj = async_get_request()
-        _version = reader.read("!B")[0]
+        _version, _type, _length = reader.read_struct(_struct_BBH)
         assert(_version == 5)
-        _type = reader.read("!B")[0]
         assert(_type == 26)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
         obj.xid = reader.read("!L")[0]
@@ -748,6 +803,7 @@ class async_get_request(message):
 message.subtypes[26] = async_get_request
 
 class async_set(message):
+    __slots__ = ["properties"]
     version = 5
     type = 28
 
@@ -762,25 +818,23 @@ class async_set(message):
             self.properties = []
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(loxi.generic_util.pack_list(self.properties))
-        length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_BBHL, buf, offset, self.version, self.type, 0, self.xid)
+        offset = loxi.generic_util.pack_list_into(self.properties, buf, offset)
+        length = offset - start
+        _struct_H.pack_into(buf, start + 2, length)
+        return offset
+
+    def wire_length(self):
+        return 8 + loxi.generic_util.list_wire_length(self.properties)
 
     @staticmethod
     def unpack(reader):
         obj = async_set()
-        _version = reader.read("!B")[0]
+        _version, _type, _length = reader.read_struct(_struct_BBH)
         assert(_version == 5)
-        _type = reader.read("!B")[0]
         assert(_type == 28)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
         obj.xid = reader.read("!L")[0]
@@ -812,6 +866,7 @@ class async_set(message):
 message.subtypes[28] = async_set
 
 class bad_action_error_msg(error_msg):
+    __slots__ = ["code", "data"]
     version = 5
     type = 1
     err_type = 2
@@ -831,34 +886,28 @@ class bad_action_error_msg(error_msg):
             self.data = ''
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!H", self.err_type))
-        packed.append(struct.pack("!H", self.code))
-        packed.append(self.data)
-        length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_BBHLHH, buf, offset, self.version, self.type, 0, self.xid, self.err_type, self.code)
+        offset = loxi.generic_util.pack_bytes_into(self.data, buf, offset)
+        length = offset - start
+        _struct_H.pack_into(buf, start + 2, length)
+        return offset
+
+    def wire_length(self):
+        return 12 + len(self.data)
 
     @staticmethod
     def unpack(reader):
         obj = bad_action_error_msg()
-        _version = reader.read("!B")[0]
+        _version, _type, _length = reader.read_struct(_struct_BBH)
         assert(_version == 5)
-        _type = reader.read("!B")[0]
         assert(_type == 1)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        _err_type = reader.read("!H")[0]
+        obj.xid, _err_type, obj.code = reader.read_struct(_struct_LHH)
         assert(_err_type == 2)
-        obj.code = reader.read("!H")[0]
-        obj.data = str(reader.read_all())
+        obj.data = reader.read_all()
         return obj
 
     def __eq__(self, other):
@@ -890,6 +939,7 @@ class bad_action_error_msg(error_msg):
 error_msg.subtypes[2] = bad_action_error_msg
 
 class bad_instruction_error_msg(error_msg):
+    __slots__ = ["code", "data"]
     version = 5
     type = 1
     err_type = 3
@@ -909,34 +959,28 @@ class bad_instruction_error_msg(error_msg):
             self.data = ''
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!H", self.err_type))
-        packed.append(struct.pack("!H", self.code))
-        packed.append(self.data)
-        length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_BBHLHH, buf, offset, self.version, self.type, 0, self.xid, self.err_type, self.code)
+        offset = loxi.generic_util.pack_bytes_into(self.data, buf, offset)
+        length = offset - start
+        _struct_H.pack_into(buf, start + 2, length)
+        return offset
+
+    def wire_length(self):
+        return 12 + len(self.data)
 
     @staticmethod
     def unpack(reader):
         obj = bad_instruction_error_msg()
-        _version = reader.read("!B")[0]
+        _version, _type, _length = reader.read_struct(_struct_BBH)
         assert(_version == 5)
-        _type = reader.read("!B")[0]
         assert(_type == 1)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        _err_type = reader.read("!H")[0]
+        obj.xid, _err_type, obj.code = reader.read_struct(_struct_LHH)
         assert(_err_type == 3)
-        obj.code = reader.read("!H")[0]
-        obj.data = str(reader.read_all())
+        obj.data = reader.read_all()
         return obj
 
     def __eq__(self, other):
@@ -968,6 +1012,7 @@ class bad_instruction_error_msg(error_msg):
 error_msg.subtypes[3] = bad_instruction_error_msg
 
 class bad_match_error_msg(error_msg):
+    __slots__ = ["code", "data"]
     version = 5
     type = 1
     err_type = 4
@@ -987,34 +1032,28 @@ class bad_match_error_msg(error_msg):
             self.data = ''
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!H", self.err_type))
-        packed.append(struct.pack("!H", self.code))
-        packed.append(self.data)
-        length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_BBHLHH, buf, offset, self.version, self.type, 0, self.xid, self.err_type, self.code)
+        offset = loxi.generic_util.pack_bytes_into(self.data, buf, offset)
+        length = offset - start
+        _struct_H.pack_into(buf, start + 2, length)
+        return offset
+
+    def wire_length(self):
+        return 12 + len(self.data)
 
     @staticmethod
     def unpack(reader):
         obj = bad_match_error_msg()
-        _version = reader.read("!B")[0]
+        _version, _type, _length = reader.read_struct(_struct_BBH)
         assert(_version == 5)
-        _type = reader.read("!B")[0]
         assert(_type == 1)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        _err_type = reader.read("!H")[0]
+        obj.xid, _err_type, obj.code = reader.read_struct(_struct_LHH)
         assert(_err_type == 4)
-        obj.code = reader.read("!H")[0]
-        obj.data = str(reader.read_all())
+        obj.data = reader.read_all()
         return obj
 
     def __eq__(self, other):
@@ -1046,6 +1085,7 @@ class bad_match_error_msg(error_msg):
 error_msg.subtypes[4] = bad_match_error_msg
 
 class bad_property_error_msg(error_msg):
+    __slots__ = ["code", "data"]
     version = 5
     type = 1
     err_type = 14
@@ -1065,34 +1105,28 @@ class bad_property_error_msg(error_msg):
             self.data = ''
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!H", self.err_type))
-        packed.append(struct.pack("!H", self.code))
-        packed.append(self.data)
-        length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_BBHLHH, buf, offset, self.version, self.type, 0, self.xid, self.err_type, self.code)
+        offset = loxi.generic_util.pack_bytes_into(self.data, buf, offset)
+        length = offset - start
+        _struct_H.pack_into(buf, start + 2, length)
+        return offset
+
+    def wire_length(self):
+        return 12 + len(self.data)
 
     @staticmethod
     def unpack(reader):
         obj = bad_property_error_msg()
-        _version = reader.read("!B")[0]
+        _version, _type, _length = reader.read_struct(_struct_BBH)
         assert(_version == 5)
-        _type = reader.read("!B")[0]
         assert(_type == 1)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        _err_type = reader.read("!H")[0]
+        obj.xid, _err_type, obj.code = reader.read_struct(_struct_LHH)
         assert(_err_type == 14)
-        obj.code = reader.read("!H")[0]
-        obj.data = str(reader.read_all())
+        obj.data = reader.read_all()
         return obj
 
     def __eq__(self, other):
@@ -1124,6 +1158,7 @@ class bad_property_error_msg(error_msg):
 error_msg.subtypes[14] = bad_property_error_msg
 
 class bad_request_error_msg(error_msg):
+    __slots__ = ["code", "data"]
     version = 5
     type = 1
     err_type = 1
@@ -1143,34 +1178,28 @@ class bad_request_error_msg(error_msg):
             self.data = ''
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!H", self.err_type))
-        packed.append(struct.pack("!H", self.code))
-        packed.append(self.data)
-        length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_BBHLHH, buf, offset, self.version, self.type, 0, self.xid, self.err_type, self.code)
+        offset = loxi.generic_util.pack_bytes_into(self.data, buf, offset)
+        length = offset - start
+        _struct_H.pack_into(buf, start + 2, length)
+        return offset
+
+    def wire_length(self):
+        return 12 + len(self.data)
 
     @staticmethod
     def unpack(reader):
         obj = bad_request_error_msg()
-        _version = reader.read("!B")[0]
+        _version, _type, _length = reader.read_struct(_struct_BBH)
         assert(_version == 5)
-        _type = reader.read("!B")[0]
         assert(_type == 1)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        _err_type = reader.read("!H")[0]
+        obj.xid, _err_type, obj.code = reader.read_struct(_struct_LHH)
         assert(_err_type == 1)
-        obj.code = reader.read("!H")[0]
-        obj.data = str(reader.read_all())
+        obj.data = reader.read_all()
         return obj
 
     def __eq__(self, other):
@@ -1202,6 +1231,7 @@ class bad_request_error_msg(error_msg):
 error_msg.subtypes[1] = bad_request_error_msg
 
 class barrier_reply(message):
+    __slots__ = []
     version = 5
     type = 21
 
@@ -1212,24 +1242,22 @@ class barrier_reply(message):
             self.xid = None
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_BBHL, buf, offset, self.version, self.type, 0, self.xid)
+        length = offset - start
+        _struct_H.pack_into(buf, start + 2, length)
+        return offset
+
+    def wire_length(self):
+        return 8
 
     @staticmethod
     def unpack(reader):
         obj = barrier_reply()
-        _version = reader.read("!B")[0]
+        _version, _type, _length = reader.read_struct(_struct_BBH)
         assert(_version == 5)
-        _type = reader.read("!B")[0]
         assert(_type == 21)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
         obj.xid = reader.read("!L")[0]
@@ -1256,6 +1284,7 @@ class barrier_reply(message):
 message.subtypes[21] = barrier_reply
 
 class barrier_request(message):
+    __slots__ = []
     version = 5
     type = 20
 
@@ -1266,24 +1295,22 @@ class barrier_request(message):
             self.xid = None
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_BBHL, buf, offset, self.version, self.type, 0, self.xid)
+        length = offset - start
+        _struct_H.pack_into(buf, start + 2, length)
+        return offset
+
+    def wire_length(self):
+        return 8
 
     @staticmethod
     def unpack(reader):
         obj = barrier_request()
-        _version = reader.read("!B")[0]
+        _version, _type, _length = reader.read_struct(_struct_BBH)
         assert(_version == 5)
-        _type = reader.read("!B")[0]
         assert(_type == 20)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
         obj.xid = reader.read("!L")[0]
@@ -1310,6 +1337,7 @@ class barrier_request(message):
 message.subtypes[20] = barrier_request
 
 class experimenter(message):
+    __slots__ = ["data", "experimenter", "subtype"]
     subtypes = {}
 
     version = 5
@@ -1334,18 +1362,16 @@ class experimenter(message):
             self.data = ''
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!L", self.experimenter))
-        packed.append(struct.pack("!L", self.subtype))
-        packed.append(self.data)
-        length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_BBHLLL, buf, offset, self.version, self.type, 0, self.xid, self.experimenter, self.subtype)
+        offset = loxi.generic_util.pack_bytes_into(self.data, buf, offset)
+        length = offset - start
+        _struct_H.pack_into(buf, start + 2, length)
+        return offset
+
+    def wire_length(self):
+        return 16 + len(self.data)
 
     @staticmethod
     def unpack(reader):
@@ -1355,17 +1381,13 @@ class experimenter(message):
             return subclass.unpack(reader)
 
         obj = experimenter()
-        _version = reader.read("!B")[0]
+        _version, _type, _length = reader.read_struct(_struct_BBH)
         assert(_version == 5)
-        _type = reader.read("!B")[0]
         assert(_type == 4)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        obj.experimenter = reader.read("!L")[0]
-        obj.subtype = reader.read("!L")[0]
-        obj.data = str(reader.read_all())
+        obj.xid, obj.experimenter, obj.subtype = reader.read_struct(_struct_LLL)
+        obj.data = reader.read_all()
         return obj
 
     def __eq__(self, other):
@@ -1398,6 +1420,7 @@ class experimenter(message):
 message.subtypes[4] = experimenter
 
 class bsn_header(experimenter):
+    __slots__ = []
     subtypes = {}
 
     version = 5
@@ -1415,17 +1438,15 @@ class bsn_header(experimenter):
             self.subtype = 0
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!L", self.experimenter))
-        packed.append(struct.pack("!L", self.subtype))
-        length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_BBHLLL, buf, offset, self.version, self.type, 0, self.xid, self.experimenter, self.subtype)
+        length = offset - start
+        _struct_H.pack_into(buf, start + 2, length)
+        return offset
+
+    def wire_length(self):
+        return 16
 
     @staticmethod
     def unpack(reader):
@@ -1435,17 +1456,13 @@ class bsn_header(experimenter):
             return subclass.unpack(reader)
 
         obj = bsn_header()
-        _version = reader.read("!B")[0]
+        _version, _type, _length = reader.read_struct(_struct_BBH)
         assert(_version == 5)
-        _type = reader.read("!B")[0]
         assert(_type == 4)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        _experimenter = reader.read("!L")[0]
+        obj.xid, _experimenter, obj.subtype = reader.read_struct(_struct_LLL)
         assert(_experimenter == 6035143)
-        obj.subtype = reader.read("!L")[0]
         return obj
 
     def __eq__(self, other):
@@ -1470,6 +1487,7 @@ class bsn_header(experimenter):
 experimenter.subtypes[6035143] = bsn_header
 
 class bsn_arp_idle(bsn_header):
+    __slots__ = ["ipv4_addr", "vlan_vid"]
     version = 5
     type = 4
     experimenter = 6035143
@@ -1490,39 +1508,27 @@ class bsn_arp_idle(bsn_header):
             self.ipv4_addr = 0
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!L", self.experimenter))
-        packed.append(struct.pack("!L", self.subtype))
-        packed.append(struct.pack("!H", self.vlan_vid))
-        packed.append('\x00' * 2)
-        packed.append(struct.pack("!L", self.ipv4_addr))
-        length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_BBHLLLH2xL, buf, offset, self.version, self.type, 0, self.xid, self.experimenter, self.subtype, self.vlan_vid, self.ipv4_addr)
+        length = offset - start
+        _struct_H.pack_into(buf, start + 2, length)
+        return offset
+
+    def wire_length(self):
+        return 24
 
     @staticmethod
     def unpack(reader):
         obj = bsn_arp_idle()
-        _version = reader.read("!B")[0]
+        _version, _type, _length = reader.read_struct(_struct_BBH)
         assert(_version == 5)
-        _type = reader.read("!B")[0]
         assert(_type == 4)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        _experimenter = reader.read("!L")[0]
+        obj.xid, _experimenter, _subtype, obj.vlan_vid, obj.ipv4_addr = reader.read_struct(_struct_LLLH2xL)
         assert(_experimenter == 6035143)
-        _subtype = reader.read("!L")[0]
         assert(_subtype == 60)
-        obj.vlan_vid = reader.read("!H")[0]
-        reader.skip(2)
-        obj.ipv4_addr = reader.read("!L")[0]
         return obj
 
     def __eq__(self, other):
@@ -1554,6 +1560,7 @@ class bsn_arp_idle(bsn_header):
 bsn_header.subtypes[60] = bsn_arp_idle
 
 class bsn_bw_clear_data_reply(bsn_header):
+    __slots__ = ["status"]
     version = 5
     type = 4
     experimenter = 6035143
@@ -1570,35 +1577,27 @@ class bsn_bw_clear_data_reply(bsn_header):
             self.status = 0
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!L", self.experimenter))
-        packed.append(struct.pack("!L", self.subtype))
-        packed.append(struct.pack("!L", self.status))
-        length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_BBHLLLL, buf, offset, self.version, self.type, 0, self.xid, self.experimenter, self.subtype, self.status)
+        length = offset - start
+        _struct_H.pack_into(buf, start + 2, length)
+        return offset
+
+    def wire_length(self):
+        return 20
 
     @staticmethod
     def unpack(reader):
         obj = bsn_bw_clear_data_reply()
-        _version = reader.read("!B")[0]
+        _version, _type, _length = reader.read_struct(_struct_BBH)
         assert(_version == 5)
-        _type = reader.read("!B")[0]
         assert(_type == 4)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        _experimenter = reader.read("!L")[0]
+        obj.xid, _experimenter, _subtype, obj.status = reader.read_struct(_struct_LLLL)
         assert(_experimenter == 6035143)
-        _subtype = reader.read("!L")[0]
         assert(_subtype == 22)
-        obj.status = reader.read("!L")[0]
         return obj
 
     def __eq__(self, other):
@@ -1626,6 +1625,7 @@ class bsn_bw_clear_data_reply(bsn_header):
 bsn_header.subtypes[22] = bsn_bw_clear_data_reply
 
 class bsn_bw_clear_data_request(bsn_header):
+    __slots__ = []
     version = 5
     type = 4
     experimenter = 6035143
@@ -1638,32 +1638,26 @@ class bsn_bw_clear_data_request(bsn_header):
             self.xid = None
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!L", self.experimenter))
-        packed.append(struct.pack("!L", self.subtype))
-        length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_BBHLLL, buf, offset, self.version, self.type, 0, self.xid, self.experimenter, self.subtype)
+        length = offset - start
+        _struct_H.pack_into(buf, start + 2, length)
+        return offset
+
+    def wire_length(self):
+        return 16
 
     @staticmethod
     def unpack(reader):
         obj = bsn_bw_clear_data_request()
-        _version = reader.read("!B")[0]
+        _version, _type, _length = reader.read_struct(_struct_BBH)
         assert(_version == 5)
-        _type = reader.read("!B")[0]
         assert(_type == 4)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        _experimenter = reader.read("!L")[0]
+        obj.xid, _experimenter, _subtype = reader.read_struct(_struct_LLL)
         assert(_experimenter == 6035143)
-        _subtype = reader.read("!L")[0]
         assert(_subtype == 21)
         return obj
 
@@ -1688,6 +1682,7 @@ class bsn_bw_clear_data_request(bsn_header):
 bsn_header.subtypes[21] = bsn_bw_clear_data_request
 
 class bsn_bw_enable_get_reply(bsn_header):
+    __slots__ = ["enabled"]
     version = 5
     type = 4
     experimenter = 6035143
@@ -1704,35 +1699,27 @@ class bsn_bw_enable_get_reply(bsn_header):
             self.enabled = 0
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!L", self.experimenter))
-        packed.append(struct.pack("!L", self.subtype))
-        packed.append(struct.pack("!L", self.enabled))
-        length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_BBHLLLL, buf, offset, self.version, self.type, 0, self.xid, self.experimenter, self.subtype, self.enabled)
+        length = offset - start
+        _struct_H.pack_into(buf, start + 2, length)
+        return offset
+
+    def wire_length(self):
+        return 20
 
     @staticmethod
     def unpack(reader):
         obj = bsn_bw_enable_get_reply()
-        _version = reader.read("!B")[0]
+        _version, _type, _length = reader.read_struct(_struct_BBH)
         assert(_version == 5)
-        _type = reader.read("!B")[0]
         assert(_type == 4)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        _experimenter = reader.read("!L")[0]
+        obj.xid, _experimenter, _subtype, obj.enabled = reader.read_struct(_struct_LLLL)
         assert(_experimenter == 6035143)
-        _subtype = reader.read("!L")[0]
         assert(_subtype == 20)
-        obj.enabled = reader.read("!L")[0]
         return obj
 
     def __eq__(self, other):
@@ -1760,6 +1747,7 @@ class bsn_bw_enable_get_reply(bsn_header):
 bsn_header.subtypes[20] = bsn_bw_enable_get_reply
 
 class bsn_bw_enable_get_request(bsn_header):
+    __slots__ = []
     version = 5
     type = 4
     experimenter = 6035143
@@ -1772,32 +1760,26 @@ class bsn_bw_enable_get_request(bsn_header):
             self.xid = None
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!L", self.experimenter))
-        packed.append(struct.pack("!L", self.subtype))
-        length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_BBHLLL, buf, offset, self.version, self.type, 0, self.xid, self.experimenter, self.subtype)
+        length = offset - start
+        _struct_H.pack_into(buf, start + 2, length)
+        return offset
+
+    def wire_length(self):
+        return 16
 
     @staticmethod
     def unpack(reader):
         obj = bsn_bw_enable_get_request()
-        _version = reader.read("!B")[0]
+        _version, _type, _length = reader.read_struct(_struct_BBH)
         assert(_version == 5)
-        _type = reader.read("!B")[0]
         assert(_type == 4)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        _experimenter = reader.read("!L")[0]
+        obj.xid, _experimenter, _subtype = reader.read_struct(_struct_LLL)
         assert(_experimenter == 6035143)
-        _subtype = reader.read("!L")[0]
         assert(_subtype == 19)
         return obj
 
@@ -1822,6 +1804,7 @@ class bsn_bw_enable_get_request(bsn_header):
 bsn_header.subtypes[19] = bsn_bw_enable_get_request
 
 class bsn_bw_enable_set_reply(bsn_header):
+    __slots__ = ["enable", "status"]
     version = 5
     type = 4
     experimenter = 6035143
@@ -1842,37 +1825,27 @@ class bsn_bw_enable_set_reply(bsn_header):
             self.status = 0
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!L", self.experimenter))
-        packed.append(struct.pack("!L", self.subtype))
-        packed.append(struct.pack("!L", self.enable))
-        packed.append(struct.pack("!L", self.status))
-        length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_BBHLLLLL, buf, offset, self.version, self.type, 0, self.xid, self.experimenter, self.subtype, self.enable, self.status)
+        length = offset - start
+        _struct_H.pack_into(buf, start + 2, length)
+        return offset
+
+    def wire_length(self):
+        return 24
 
     @staticmethod
     def unpack(reader):
         obj = bsn_bw_enable_set_reply()
-        _version = reader.read("!B")[0]
+        _version, _type, _length = reader.read_struct(_struct_BBH)
         assert(_version == 5)
-        _type = reader.read("!B")[0]
         assert(_type == 4)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        _experimenter = reader.read("!L")[0]
+        obj.xid, _experimenter, _subtype, obj.enable, obj.status = reader.read_struct(_struct_LLLLL)
         assert(_experimenter == 6035143)
-        _subtype = reader.read("!L")[0]
         assert(_subtype == 23)
-        obj.enable = reader.read("!L")[0]
-        obj.status = reader.read("!L")[0]
         return obj
 
     def __eq__(self, other):
@@ -1904,6 +1877,7 @@ class bsn_bw_enable_set_reply(bsn_header):
 bsn_header.subtypes[23] = bsn_bw_enable_set_reply
 
 class bsn_bw_enable_set_request(bsn_header):
+    __slots__ = ["enable"]
     version = 5
     type = 4
     experimenter = 6035143
@@ -1920,35 +1894,27 @@ class bsn_bw_enable_set_request(bsn_header):
             self.enable = 0
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!L", self.experimenter))
-        packed.append(struct.pack("!L", self.subtype))
-        packed.append(struct.pack("!L", self.enable))
-        length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_BBHLLLL, buf, offset, self.version, self.type, 0, self.xid, self.experimenter, self.subtype, self.enable)
+        length = offset - start
+        _struct_H.pack_into(buf, start + 2, length)
+        return offset
+
+    def wire_length(self):
+        return 20
 
     @staticmethod
     def unpack(reader):
         obj = bsn_bw_enable_set_request()
-        _version = reader.read("!B")[0]
+        _version, _type, _length = reader.read_struct(_struct_BBH)
         assert(_version == 5)
-        _type = reader.read("!B")[0]
         assert(_type == 4)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        _experimenter = reader.read("!L")[0]
+        obj.xid, _experimenter, _subtype, obj.enable = reader.read_struct(_struct_LLLL)
         assert(_experimenter == 6035143)
-        _subtype = reader.read("!L")[0]
         assert(_subtype == 18)
-        obj.enable = reader.read("!L")[0]
         return obj
 
     def __eq__(self, other):
@@ -1976,6 +1942,7 @@ class bsn_bw_enable_set_request(bsn_header):
 bsn_header.subtypes[18] = bsn_bw_enable_set_request
 
 class bsn_controller_connections_reply(bsn_header):
+    __slots__ = ["connections"]
     version = 5
     type = 4
     experimenter = 6035143
@@ -1992,33 +1959,27 @@ class bsn_controller_connections_reply(bsn_header):
             self.connections = []
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!L", self.experimenter))
-        packed.append(struct.pack("!L", self.subtype))
-        packed.append(loxi.generic_util.pack_list(self.connections))
-        length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_BBHLLL, buf, offset, self.version, self.type, 0, self.xid, self.experimenter, self.subtype)
+        offset = loxi.generic_util.pack_list_into(self.connections, buf, offset)
+        length = offset - start
+        _struct_H.pack_into(buf, start + 2, length)
+        return offset
+
+    def wire_length(self):
+        return 16 + loxi.generic_util.list_wire_length(self.connections)
 
     @staticmethod
     def unpack(reader):
         obj = bsn_controller_connections_reply()
-        _version = reader.read("!B")[0]
+        _version, _type, _length = reader.read_struct(_struct_BBH)
         assert(_version == 5)
-        _type = reader.read("!B")[0]
         assert(_type == 4)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        _experimenter = reader.read("!L")[0]
+        obj.xid, _experimenter, _subtype = reader.read_struct(_struct_LLL)
         assert(_experimenter == 6035143)
-        _subtype = reader.read("!L")[0]
         assert(_subtype == 57)
         obj.connections = loxi.generic_util.unpack_list(reader, ofp.common.bsn_controller_connection.unpack)
         return obj
@@ -2048,6 +2009,7 @@ class bsn_controller_connections_reply(bsn_header):
 bsn_header.subtypes[57] = bsn_controller_connections_reply
 
 class bsn_controller_connections_request(bsn_header):
+    __slots__ = []
     version = 5
     type = 4
     experimenter = 6035143
@@ -2060,32 +2022,26 @@ class bsn_controller_connections_request(bsn_header):
             self.xid = None
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!L", self.experimenter))
-        packed.append(struct.pack("!L", self.subtype))
-        length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_BBHLLL, buf, offset, self.version, self.type, 0, self.xid, self.experimenter, self.subtype)
+        length = offset - start
+        _struct_H.pack_into(buf, start + 2, length)
+        return offset
+
+    def wire_length(self):
+        return 16
 
     @staticmethod
     def unpack(reader):
         obj = bsn_controller_connections_request()
-        _version = reader.read("!B")[0]
+        _version, _type, _length = reader.read_struct(_struct_BBH)
         assert(_version == 5)
-        _type = reader.read("!B")[0]
         assert(_type == 4)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        _experimenter = reader.read("!L")[0]
+        obj.xid, _experimenter, _subtype = reader.read_struct(_struct_LLL)
         assert(_experimenter == 6035143)
-        _subtype = reader.read("!L")[0]
         assert(_subtype == 56)
         return obj
 
@@ -2110,6 +2066,7 @@ class bsn_controller_connections_request(bsn_header):
 bsn_header.subtypes[56] = bsn_controller_connections_request
 
 class experimenter_stats_reply(stats_reply):
+    __slots__ = ["experimenter", "subtype"]
     subtypes = {}
 
     version = 5
@@ -2135,20 +2092,15 @@ class experimenter_stats_reply(stats_reply):
             self.subtype = 0
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!H", self.stats_type))
-        packed.append(struct.pack("!H", self.flags))
-        packed.append('\x00' * 4)
-        packed.append(struct.pack("!L", self.experimenter))
-        packed.append(struct.pack("!L", self.subtype))
-        length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_BBHLHH4xLL, buf, offset, self.version, self.type, 0, self.xid, self.stats_type, self.flags, self.experimenter, self.subtype)
+        length = offset - start
+        _struct_H.pack_into(buf, start + 2, length)
+        return offset
+
+    def wire_length(self):
+        return 24
 
     @staticmethod
     def unpack(reader):
@@ -2158,20 +2110,13 @@ class experimenter_stats_reply(stats_reply):
             return subclass.unpack(reader)
 
         obj = experimenter_stats_reply()
-        _version = reader.read("!B")[0]
+        _version, _type, _length = reader.read_struct(_struct_BBH)
         assert(_version == 5)
-        _type = reader.read("!B")[0]
         assert(_type == 19)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        _stats_type = reader.read("!H")[0]
+        obj.xid, _stats_type, obj.flags, obj.experimenter, obj.subtype = reader.read_struct(_struct_LHH4xLL)
         assert(_stats_type == 65535)
-        obj.flags = reader.read("!H")[0]
-        reader.skip(4)
-        obj.experimenter = reader.read("!L")[0]
-        obj.subtype = reader.read("!L")[0]
         return obj
 
     def __eq__(self, other):
@@ -2204,6 +2149,7 @@ class experimenter_stats_reply(stats_reply):
 stats_reply.subtypes[65535] = experimenter_stats_reply
 
 class bsn_stats_reply(experimenter_stats_reply):
+    __slots__ = []
     subtypes = {}
 
     version = 5
@@ -2226,20 +2172,15 @@ class bsn_stats_reply(experimenter_stats_reply):
             self.subtype = 0
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!H", self.stats_type))
-        packed.append(struct.pack("!H", self.flags))
-        packed.append('\x00' * 4)
-        packed.append(struct.pack("!L", self.experimenter))
-        packed.append(struct.pack("!L", self.subtype))
-        length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_BBHLHH4xLL, buf, offset, self.version, self.type, 0, self.xid, self.stats_type, self.flags, self.experimenter, self.subtype)
+        length = offset - start
+        _struct_H.pack_into(buf, start + 2, length)
+        return offset
+
+    def wire_length(self):
+        return 24
 
     @staticmethod
     def unpack(reader):
@@ -2249,21 +2190,14 @@ class bsn_stats_reply(experimenter_stats_reply):
             return subclass.unpack(reader)
 
         obj = bsn_stats_reply()
-        _version = reader.read("!B")[0]
+        _version, _type, _length = reader.read_struct(_struct_BBH)
         assert(_version == 5)
-        _type = reader.read("!B")[0]
         assert(_type == 19)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        _stats_type = reader.read("!H")[0]
+        obj.xid, _stats_type, obj.flags, _experimenter, obj.subtype = reader.read_struct(_struct_LHH4xLL)
         assert(_stats_type == 65535)
-        obj.flags = reader.read("!H")[0]
-        reader.skip(4)
-        _experimenter = reader.read("!L")[0]
         assert(_experimenter == 6035143)
-        obj.subtype = reader.read("!L")[0]
         return obj
 
     def __eq__(self, other):
@@ -2292,6 +2226,7 @@ class bsn_stats_reply(experimenter_stats_reply):
 experimenter_stats_reply.subtypes[6035143] = bsn_stats_reply
 
 class bsn_debug_counter_desc_stats_reply(bsn_stats_reply):
+    __slots__ = ["entries"]
     version = 5
     type = 19
     stats_type = 65535
@@ -2313,40 +2248,28 @@ class bsn_debug_counter_desc_stats_reply(bsn_stats_reply):
             self.entries = []
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!H", self.stats_type))
-        packed.append(struct.pack("!H", self.flags))
-        packed.append('\x00' * 4)
-        packed.append(struct.pack("!L", self.experimenter))
-        packed.append(struct.pack("!L", self.subtype))
-        packed.append(loxi.generic_util.pack_list(self.entries))
-        length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_BBHLHH4xLL, buf, offset, self.version, self.type, 0, self.xid, self.stats_type, self.flags, self.experimenter, self.subtype)
+        offset = loxi.generic_util.pack_list_into(self.entries, buf, offset)
+        length = offset - start
+        _struct_H.pack_into(buf, start + 2, length)
+        return offset
+
+    def wire_length(self):
+        return 24 + loxi.generic_util.list_wire_length(self.entries)
 
     @staticmethod
     def unpack(reader):
         obj = bsn_debug_counter_desc_stats_reply()
-        _version = reader.read("!B")[0]
+        _version, _type, _length = reader.read_struct(_struct_BBH)
         assert(_version == 5)
-        _type = reader.read("!B")[0]
         assert(_type == 19)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        _stats_type = reader.read("!H")[0]
+        obj.xid, _stats_type, obj.flags, _experimenter, _subtype = reader.read_struct(_struct_LHH4xLL)
         assert(_stats_type == 65535)
-        obj.flags = reader.read("!H")[0]
-        reader.skip(4)
-        _experimenter = reader.read("!L")[0]
         assert(_experimenter == 6035143)
-        _subtype = reader.read("!L")[0]
         assert(_subtype == 13)
         obj.entries = loxi.generic_util.unpack_list(reader, ofp.common.bsn_debug_counter_desc_stats_entry.unpack)
         return obj
@@ -2380,6 +2303,7 @@ class bsn_debug_counter_desc_stats_reply(bsn_stats_reply):
 bsn_stats_reply.subtypes[13] = bsn_debug_counter_desc_stats_reply
 
 class experimenter_stats_request(stats_request):
+    __slots__ = ["experimenter", "subtype"]
     subtypes = {}
 
     version = 5
@@ -2405,20 +2329,15 @@ class experimenter_stats_request(stats_request):
             self.subtype = 0
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!H", self.stats_type))
-        packed.append(struct.pack("!H", self.flags))
-        packed.append('\x00' * 4)
-        packed.append(struct.pack("!L", self.experimenter))
-        packed.append(struct.pack("!L", self.subtype))
-        length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_BBHLHH4xLL, buf, offset, self.version, self.type, 0, self.xid, self.stats_type, self.flags, self.experimenter, self.subtype)
+        length = offset - start
+        _struct_H.pack_into(buf, start + 2, length)
+        return offset
+
+    def wire_length(self):
+        return 24
 
     @staticmethod
     def unpack(reader):
@@ -2428,20 +2347,13 @@ class experimenter_stats_request(stats_request):
             return subclass.unpack(reader)
 
         obj = experimenter_stats_request()
-        _version = reader.read("!B")[0]
+        _version, _type, _length = reader.read_struct(_struct_BBH)
         assert(_version == 5)
-        _type = reader.read("!B")[0]
         assert(_type == 18)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        _stats_type = reader.read("!H")[0]
+        obj.xid, _stats_type, obj.flags, obj.experimenter, obj.subtype = reader.read_struct(_struct_LHH4xLL)
         assert(_stats_type == 65535)
-        obj.flags = reader.read("!H")[0]
-        reader.skip(4)
-        obj.experimenter = reader.read("!L")[0]
-        obj.subtype = reader.read("!L")[0]
         return obj
 
     def __eq__(self, other):
@@ -2474,6 +2386,7 @@ class experimenter_stats_request(stats_request):
 stats_request.subtypes[65535] = experimenter_stats_request
 
 class bsn_stats_request(experimenter_stats_request):
+    __slots__ = []
     subtypes = {}
 
     version = 5
@@ -2496,20 +2409,15 @@ class bsn_stats_request(experimenter_stats_request):
             self.subtype = 0
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!H", self.stats_type))
-        packed.append(struct.pack("!H", self.flags))
-        packed.append('\x00' * 4)
-        packed.append(struct.pack("!L", self.experimenter))
-        packed.append(struct.pack("!L", self.subtype))
-        length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_BBHLHH4xLL, buf, offset, self.version, self.type, 0, self.xid, self.stats_type, self.flags, self.experimenter, self.subtype)
+        length = offset - start
+        _struct_H.pack_into(buf, start + 2, length)
+        return offset
+
+    def wire_length(self):
+        return 24
 
     @staticmethod
     def unpack(reader):
@@ -2519,21 +2427,14 @@ class bsn_stats_request(experimenter_stats_request):
             return subclass.unpack(reader)
 
         obj = bsn_stats_request()
-        _version = reader.read("!B")[0]
+        _version, _type, _length = reader.read_struct(_struct_BBH)
         assert(_version == 5)
-        _type = reader.read("!B")[0]
         assert(_type == 18)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        _stats_type = reader.read("!H")[0]
+        obj.xid, _stats_type, obj.flags, _experimenter, obj.subtype = reader.read_struct(_struct_LHH4xLL)
         assert(_stats_type == 65535)
-        obj.flags = reader.read("!H")[0]
-        reader.skip(4)
-        _experimenter = reader.read("!L")[0]
         assert(_experimenter == 6035143)
-        obj.subtype = reader.read("!L")[0]
         return obj
 
     def __eq__(self, other):
@@ -2562,6 +2463,7 @@ class bsn_stats_request(experimenter_stats_request):
 experimenter_stats_request.subtypes[6035143] = bsn_stats_request
 
 class bsn_debug_counter_desc_stats_request(bsn_stats_request):
+    __slots__ = []
     version = 5
     type = 18
     stats_type = 65535
@@ -2579,39 +2481,27 @@ class bsn_debug_counter_desc_stats_request(bsn_stats_request):
             self.flags = 0
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!H", self.stats_type))
-        packed.append(struct.pack("!H", self.flags))
-        packed.append('\x00' * 4)
-        packed.append(struct.pack("!L", self.experimenter))
-        packed.append(struct.pack("!L", self.subtype))
-        length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_BBHLHH4xLL, buf, offset, self.version, self.type, 0, self.xid, self.stats_type, self.flags, self.experimenter, self.subtype)
+        length = offset - start
+        _struct_H.pack_into(buf, start + 2, length)
+        return offset
+
+    def wire_length(self):
+        return 24
 
     @staticmethod
     def unpack(reader):
         obj = bsn_debug_counter_desc_stats_request()
-        _version = reader.read("!B")[0]
+        _version, _type, _length = reader.read_struct(_struct_BBH)
         assert(_version == 5)
-        _type = reader.read("!B")[0]
         assert(_type == 18)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        _stats_type = reader.read("!H")[0]
+        obj.xid, _stats_type, obj.flags, _experimenter, _subtype = reader.read_struct(_struct_LHH4xLL)
         assert(_stats_type == 65535)
-        obj.flags = reader.read("!H")[0]
-        reader.skip(4)
-        _experimenter = reader.read("!L")[0]
         assert(_experimenter == 6035143)
-        _subtype = reader.read("!L")[0]
         assert(_subtype == 13)
         return obj
 
@@ -2640,6 +2530,7 @@ class bsn_debug_counter_desc_stats_request(bsn_stats_request):
 bsn_stats_request.subtypes[13] = bsn_debug_counter_desc_stats_request
 
 class bsn_debug_counter_stats_reply(bsn_stats_reply):
+    __slots__ = ["entries"]
     version = 5
     type = 19
     stats_type = 65535
@@ -2661,40 +2552,28 @@ class bsn_debug_counter_stats_reply(bsn_stats_reply):
             self.entries = []
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!H", self.stats_type))
-        packed.append(struct.pack("!H", self.flags))
-        packed.append('\x00' * 4)
-        packed.append(struct.pack("!L", self.experimenter))
-        packed.append(struct.pack("!L", self.subtype))
-        packed.append(loxi.generic_util.pack_list(self.entries))
-        length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_BBHLHH4xLL, buf, offset, self.version, self.type, 0, self.xid, self.stats_type, self.flags, self.experimenter, self.subtype)
+        offset = loxi.generic_util.pack_list_into(self.entries, buf, offset)
+        length = offset - start
+        _struct_H.pack_into(buf, start + 2, length)
+        return offset
+
+    def wire_length(self):
+        return 24 + loxi.generic_util.list_wire_length(self.entries)
 
     @staticmethod
     def unpack(reader):
         obj = bsn_debug_counter_stats_reply()
-        _version = reader.read("!B")[0]
+        _version, _type, _length = reader.read_struct(_struct_BBH)
         assert(_version == 5)
-        _type = reader.read("!B")[0]
         assert(_type == 19)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        _stats_type = reader.read("!H")[0]
+        obj.xid, _stats_type, obj.flags, _experimenter, _subtype = reader.read_struct(_struct_LHH4xLL)
         assert(_stats_type == 65535)
-        obj.flags = reader.read("!H")[0]
-        reader.skip(4)
-        _experimenter = reader.read("!L")[0]
         assert(_experimenter == 6035143)
-        _subtype = reader.read("!L")[0]
         assert(_subtype == 12)
         obj.entries = loxi.generic_util.unpack_list(reader, ofp.common.bsn_debug_counter_stats_entry.unpack)
         return obj
@@ -2728,6 +2607,7 @@ class bsn_debug_counter_stats_reply(bsn_stats_reply):
 bsn_stats_reply.subtypes[12] = bsn_debug_counter_stats_reply
 
 class bsn_debug_counter_stats_request(bsn_stats_request):
+    __slots__ = []
     version = 5
     type = 18
     stats_type = 65535
@@ -2745,39 +2625,27 @@ class bsn_debug_counter_stats_request(bsn_stats_request):
             self.flags = 0
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!H", self.stats_type))
-        packed.append(struct.pack("!H", self.flags))
-        packed.append('\x00' * 4)
-        packed.append(struct.pack("!L", self.experimenter))
-        packed.append(struct.pack("!L", self.subtype))
-        length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_BBHLHH4xLL, buf, offset, self.version, self.type, 0, self.xid, self.stats_type, self.flags, self.experimenter, self.subtype)
+        length = offset - start
+        _struct_H.pack_into(buf, start + 2, length)
+        return offset
+
+    def wire_length(self):
+        return 24
 
     @staticmethod
     def unpack(reader):
         obj = bsn_debug_counter_stats_request()
-        _version = reader.read("!B")[0]
+        _version, _type, _length = reader.read_struct(_struct_BBH)
         assert(_version == 5)
-        _type = reader.read("!B")[0]
         assert(_type == 18)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        _stats_type = reader.read("!H")[0]
+        obj.xid, _stats_type, obj.flags, _experimenter, _subtype = reader.read_struct(_struct_LHH4xLL)
         assert(_stats_type == 65535)
-        obj.flags = reader.read("!H")[0]
-        reader.skip(4)
-        _experimenter = reader.read("!L")[0]
         assert(_experimenter == 6035143)
-        _subtype = reader.read("!L")[0]
         assert(_subtype == 12)
         return obj
 
@@ -2806,6 +2674,7 @@ class bsn_debug_counter_stats_request(bsn_stats_request):
 bsn_stats_request.subtypes[12] = bsn_debug_counter_stats_request
 
 class bsn_flow_checksum_bucket_stats_reply(bsn_stats_reply):
+    __slots__ = ["entries"]
     version = 5
     type = 19
     stats_type = 65535
@@ -2827,40 +2696,28 @@ class bsn_flow_checksum_bucket_stats_reply(bsn_stats_reply):
             self.entries = []
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!H", self.stats_type))
-        packed.append(struct.pack("!H", self.flags))
-        packed.append('\x00' * 4)
-        packed.append(struct.pack("!L", self.experimenter))
-        packed.append(struct.pack("!L", self.subtype))
-        packed.append(loxi.generic_util.pack_list(self.entries))
-        length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_BBHLHH4xLL, buf, offset, self.version, self.type, 0, self.xid, self.stats_type, self.flags, self.experimenter, self.subtype)
+        offset = loxi.generic_util.pack_list_into(self.entries, buf, offset)
+        length = offset - start
+        _struct_H.pack_into(buf, start + 2, length)
+        return offset
+
+    def wire_length(self):
+        return 24 + loxi.generic_util.list_wire_length(self.entries)
 
     @staticmethod
     def unpack(reader):
         obj = bsn_flow_checksum_bucket_stats_reply()
-        _version = reader.read("!B")[0]
+        _version, _type, _length = reader.read_struct(_struct_BBH)
         assert(_version == 5)
-        _type = reader.read("!B")[0]
         assert(_type == 19)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        _stats_type = reader.read("!H")[0]
+        obj.xid, _stats_type, obj.flags, _experimenter, _subtype = reader.read_struct(_struct_LHH4xLL)
         assert(_stats_type == 65535)
-        obj.flags = reader.read("!H")[0]
-        reader.skip(4)
-        _experimenter = reader.read("!L")[0]
         assert(_experimenter == 6035143)
-        _subtype = reader.read("!L")[0]
         assert(_subtype == 10)
         obj.entries = loxi.generic_util.unpack_list(reader, ofp.common.bsn_flow_checksum_bucket_stats_entry.unpack)
         return obj
@@ -2894,6 +2751,7 @@ class bsn_flow_checksum_bucket_stats_reply(bsn_stats_reply):
 bsn_stats_reply.subtypes[10] = bsn_flow_checksum_bucket_stats_reply
 
 class bsn_flow_checksum_bucket_stats_request(bsn_stats_request):
+    __slots__ = ["table_id"]
     version = 5
     type = 18
     stats_type = 65535
@@ -2915,42 +2773,28 @@ class bsn_flow_checksum_bucket_stats_request(bsn_stats_request):
             self.table_id = 0
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!H", self.stats_type))
-        packed.append(struct.pack("!H", self.flags))
-        packed.append('\x00' * 4)
-        packed.append(struct.pack("!L", self.experimenter))
-        packed.append(struct.pack("!L", self.subtype))
-        packed.append(struct.pack("!B", self.table_id))
-        length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_BBHLHH4xLLB, buf, offset, self.version, self.type, 0, self.xid, self.stats_type, self.flags, self.experimenter, self.subtype, self.table_id)
+        length = offset - start
+        _struct_H.pack_into(buf, start + 2, length)
+        return offset
+
+    def wire_length(self):
+        return 25
 
     @staticmethod
     def unpack(reader):
         obj = bsn_flow_checksum_bucket_stats_request()
-        _version = reader.read("!B")[0]
+        _version, _type, _length = reader.read_struct(_struct_BBH)
         assert(_version == 5)
-        _type = reader.read("!B")[0]
         assert(_type == 18)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        _stats_type = reader.read("!H")[0]
+        obj.xid, _stats_type, obj.flags, _experimenter, _subtype, obj.table_id = reader.read_struct(_struct_LHH4xLLB)
         assert(_stats_type == 65535)
-        obj.flags = reader.read("!H")[0]
-        reader.skip(4)
-        _experimenter = reader.read("!L")[0]
         assert(_experimenter == 6035143)
-        _subtype = reader.read("!L")[0]
         assert(_subtype == 10)
-        obj.table_id = reader.read("!B")[0]
         return obj
 
     def __eq__(self, other):
@@ -2982,6 +2826,7 @@ class bsn_flow_checksum_bucket_stats_request(bsn_stats_request):
 bsn_stats_request.subtypes[10] = bsn_flow_checksum_bucket_stats_request
 
 class bsn_flow_idle(bsn_header):
+    __slots__ = ["cookie", "match", "priority", "table_id"]
     version = 5
     type = 4
     experimenter = 6035143
@@ -3010,42 +2855,28 @@ class bsn_flow_idle(bsn_header):
             self.match = ofp.match()
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!L", self.experimenter))
-        packed.append(struct.pack("!L", self.subtype))
-        packed.append(struct.pack("!Q", self.cookie))
-        packed.append(struct.pack("!H", self.priority))
-        packed.append(struct.pack("!B", self.table_id))
-        packed.append('\x00' * 5)
-        packed.append(self.match.pack())
-        length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_BBHLLLQHB5x, buf, offset, self.version, self.type, 0, self.xid, self.experimenter, self.subtype, self.cookie, self.priority, self.table_id)
+        offset = self.match.pack_into(buf, offset)
+        length = offset - start
+        _struct_H.pack_into(buf, start + 2, length)
+        return offset
+
+    def wire_length(self):
+        return 32 + self.match.wire_length()
 
     @staticmethod
     def unpack(reader):
         obj = bsn_flow_idle()
-        _version = reader.read("!B")[0]
+        _version, _type, _length = reader.read_struct(_struct_BBH)
         assert(_version == 5)
-        _type = reader.read("!B")[0]
         assert(_type == 4)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        _experimenter = reader.read("!L")[0]
+        obj.xid, _experimenter, _subtype, obj.cookie, obj.priority, obj.table_id = reader.read_struct(_struct_LLLQHB5x)
         assert(_experimenter == 6035143)
-        _subtype = reader.read("!L")[0]
         assert(_subtype == 40)
-        obj.cookie = reader.read("!Q")[0]
-        obj.priority = reader.read("!H")[0]
-        obj.table_id = reader.read("!B")[0]
-        reader.skip(5)
         obj.match = ofp.match.unpack(reader)
         return obj
 
@@ -3086,6 +2917,7 @@ class bsn_flow_idle(bsn_header):
 bsn_header.subtypes[40] = bsn_flow_idle
 
 class bsn_flow_idle_enable_get_reply(bsn_header):
+    __slots__ = ["enabled"]
     version = 5
     type = 4
     experimenter = 6035143
@@ -3102,35 +2934,27 @@ class bsn_flow_idle_enable_get_reply(bsn_header):
             self.enabled = 0
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!L", self.experimenter))
-        packed.append(struct.pack("!L", self.subtype))
-        packed.append(struct.pack("!L", self.enabled))
-        length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_BBHLLLL, buf, offset, self.version, self.type, 0, self.xid, self.experimenter, self.subtype, self.enabled)
+        length = offset - start
+        _struct_H.pack_into(buf, start + 2, length)
+        return offset
+
+    def wire_length(self):
+        return 20
 
     @staticmethod
     def unpack(reader):
         obj = bsn_flow_idle_enable_get_reply()
-        _version = reader.read("!B")[0]
+        _version, _type, _length = reader.read_struct(_struct_BBH)
         assert(_version == 5)
-        _type = reader.read("!B")[0]
         assert(_type == 4)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        _experimenter = reader.read("!L")[0]
+        obj.xid, _experimenter, _subtype, obj.enabled = reader.read_struct(_struct_LLLL)
         assert(_experimenter == 6035143)
-        _subtype = reader.read("!L")[0]
         assert(_subtype == 39)
-        obj.enabled = reader.read("!L")[0]
         return obj
 
     def __eq__(self, other):
@@ -3158,6 +2982,7 @@ class bsn_flow_idle_enable_get_reply(bsn_header):
 bsn_header.subtypes[39] = bsn_flow_idle_enable_get_reply
 
 class bsn_flow_idle_enable_get_request(bsn_header):
+    __slots__ = []
     version = 5
     type = 4
     experimenter = 6035143
@@ -3170,32 +2995,26 @@ class bsn_flow_idle_enable_get_request(bsn_header):
             self.xid = None
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!L", self.experimenter))
-        packed.append(struct.pack("!L", self.subtype))
-        length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_BBHLLL, buf, offset, self.version, self.type, 0, self.xid, self.experimenter, self.subtype)
+        length = offset - start
+        _struct_H.pack_into(buf, start + 2, length)
+        return offset
+
+    def wire_length(self):
+        return 16
 
     @staticmethod
     def unpack(reader):
         obj = bsn_flow_idle_enable_get_request()
-        _version = reader.read("!B")[0]
+        _version, _type, _length = reader.read_struct(_struct_BBH)
         assert(_version == 5)
-        _type = reader.read("!B")[0]
         assert(_type == 4)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        _experimenter = reader.read("!L")[0]
+        obj.xid, _experimenter, _subtype = reader.read_struct(_struct_LLL)
         assert(_experimenter == 6035143)
-        _subtype = reader.read("!L")[0]
         assert(_subtype == 38)
         return obj
 
@@ -3220,6 +3039,7 @@ class bsn_flow_idle_enable_get_request(bsn_header):
 bsn_header.subtypes[38] = bsn_flow_idle_enable_get_request
 
 class bsn_flow_idle_enable_set_reply(bsn_header):
+    __slots__ = ["enable", "status"]
     version = 5
     type = 4
     experimenter = 6035143
@@ -3240,37 +3060,27 @@ class bsn_flow_idle_enable_set_reply(bsn_header):
             self.status = 0
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!L", self.experimenter))
-        packed.append(struct.pack("!L", self.subtype))
-        packed.append(struct.pack("!L", self.enable))
-        packed.append(struct.pack("!L", self.status))
-        length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_BBHLLLLL, buf, offset, self.version, self.type, 0, self.xid, self.experimenter, self.subtype, self.enable, self.status)
+        length = offset - start
+        _struct_H.pack_into(buf, start + 2, length)
+        return offset
+
+    def wire_length(self):
+        return 24
 
     @staticmethod
     def unpack(reader):
         obj = bsn_flow_idle_enable_set_reply()
-        _version = reader.read("!B")[0]
+        _version, _type, _length = reader.read_struct(_struct_BBH)
         assert(_version == 5)
-        _type = reader.read("!B")[0]
         assert(_type == 4)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        _experimenter = reader.read("!L")[0]
+        obj.xid, _experimenter, _subtype, obj.enable, obj.status = reader.read_struct(_struct_LLLLL)
         assert(_experimenter == 6035143)
-        _subtype = reader.read("!L")[0]
         assert(_subtype == 37)
-        obj.enable = reader.read("!L")[0]
-        obj.status = reader.read("!L")[0]
         return obj
 
     def __eq__(self, other):
@@ -3302,6 +3112,7 @@ class bsn_flow_idle_enable_set_reply(bsn_header):
 bsn_header.subtypes[37] = bsn_flow_idle_enable_set_reply
 
 class bsn_flow_idle_enable_set_request(bsn_header):
+    __slots__ = ["enable"]
     version = 5
     type = 4
     experimenter = 6035143
@@ -3318,35 +3129,27 @@ class bsn_flow_idle_enable_set_request(bsn_header):
             self.enable = 0
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!L", self.experimenter))
-        packed.append(struct.pack("!L", self.subtype))
-        packed.append(struct.pack("!L", self.enable))
-        length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_BBHLLLL, buf, offset, self.version, self.type, 0, self.xid, self.experimenter, self.subtype, self.enable)
+        length = offset - start
+        _struct_H.pack_into(buf, start + 2, length)
+        return offset
+
+    def wire_length(self):
+        return 20
 
     @staticmethod
     def unpack(reader):
         obj = bsn_flow_idle_enable_set_request()
-        _version = reader.read("!B")[0]
+        _version, _type, _length = reader.read_struct(_struct_BBH)
         assert(_version == 5)
-        _type = reader.read("!B")[0]
         assert(_type == 4)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        _experimenter = reader.read("!L")[0]
+        obj.xid, _experimenter, _subtype, obj.enable = reader.read_struct(_struct_LLLL)
         assert(_experimenter == 6035143)
-        _subtype = reader.read("!L")[0]
         assert(_subtype == 36)
-        obj.enable = reader.read("!L")[0]
         return obj
 
     def __eq__(self, other):
@@ -3374,6 +3177,7 @@ class bsn_flow_idle_enable_set_request(bsn_header):
 bsn_header.subtypes[36] = bsn_flow_idle_enable_set_request
 
 class bsn_generic_stats_reply(bsn_stats_reply):
+    __slots__ = ["entries"]
     version = 5
     type = 19
     stats_type = 65535
@@ -3395,40 +3199,28 @@ class bsn_generic_stats_reply(bsn_stats_reply):
             self.entries = []
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!H", self.stats_type))
-        packed.append(struct.pack("!H", self.flags))
-        packed.append('\x00' * 4)
-        packed.append(struct.pack("!L", self.experimenter))
-        packed.append(struct.pack("!L", self.subtype))
-        packed.append(loxi.generic_util.pack_list(self.entries))
-        length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_BBHLHH4xLL, buf, offset, self.version, self.type, 0, self.xid, self.stats_type, self.flags, self.experimenter, self.subtype)
+        offset = loxi.generic_util.pack_list_into(self.entries, buf, offset)
+        length = offset - start
+        _struct_H.pack_into(buf, start + 2, length)
+        return offset
+
+    def wire_length(self):
+        return 24 + loxi.generic_util.list_wire_length(self.entries)
 
     @staticmethod
     def unpack(reader):
         obj = bsn_generic_stats_reply()
-        _version = reader.read("!B")[0]
+        _version, _type, _length = reader.read_struct(_struct_BBH)
         assert(_version == 5)
-        _type = reader.read("!B")[0]
         assert(_type == 19)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        _stats_type = reader.read("!H")[0]
+        obj.xid, _stats_type, obj.flags, _experimenter, _subtype = reader.read_struct(_struct_LHH4xLL)
         assert(_stats_type == 65535)
-        obj.flags = reader.read("!H")[0]
-        reader.skip(4)
-        _experimenter = reader.read("!L")[0]
         assert(_experimenter == 6035143)
-        _subtype = reader.read("!L")[0]
         assert(_subtype == 16)
         obj.entries = loxi.generic_util.unpack_list(reader, ofp.common.bsn_generic_stats_entry.unpack)
         return obj
@@ -3462,6 +3254,7 @@ class bsn_generic_stats_reply(bsn_stats_reply):
 bsn_stats_reply.subtypes[16] = bsn_generic_stats_reply
 
 class bsn_generic_stats_request(bsn_stats_request):
+    __slots__ = ["name", "tlvs"]
     version = 5
     type = 18
     stats_type = 65535
@@ -3487,43 +3280,30 @@ class bsn_generic_stats_request(bsn_stats_request):
             self.tlvs = []
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!H", self.stats_type))
-        packed.append(struct.pack("!H", self.flags))
-        packed.append('\x00' * 4)
-        packed.append(struct.pack("!L", self.experimenter))
-        packed.append(struct.pack("!L", self.subtype))
-        packed.append(struct.pack("!64s", self.name))
-        packed.append(loxi.generic_util.pack_list(self.tlvs))
-        length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_BBHLHH4xLL64s, buf, offset, self.version, self.type, 0, self.xid, self.stats_type, self.flags, self.experimenter, self.subtype, self.name)
+        offset = loxi.generic_util.pack_list_into(self.tlvs, buf, offset)
+        length = offset - start
+        _struct_H.pack_into(buf, start + 2, length)
+        return offset
+
+    def wire_length(self):
+        return 88 + loxi.generic_util.list_wire_length(self.tlvs)
 
     @staticmethod
     def unpack(reader):
         obj = bsn_generic_stats_request()
-        _version = reader.read("!B")[0]
+        _version, _type, _length = reader.read_struct(_struct_BBH)
         assert(_version == 5)
-        _type = reader.read("!B")[0]
         assert(_type == 18)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        _stats_type = reader.read("!H")[0]
+        obj.xid, _stats_type, obj.flags, _experimenter, _subtype, obj.name = reader.read_struct(_struct_LHH4xLL64s)
         assert(_stats_type == 65535)
-        obj.flags = reader.read("!H")[0]
-        reader.skip(4)
-        _experimenter = reader.read("!L")[0]
         assert(_experimenter == 6035143)
-        _subtype = reader.read("!L")[0]
         assert(_subtype == 16)
-        obj.name = reader.read("!64s")[0].rstrip("\x00")
+        obj.name = obj.name.rstrip("\x00")
         obj.tlvs = loxi.generic_util.unpack_list(reader, ofp.bsn_tlv.bsn_tlv.unpack)
         return obj
 
@@ -3560,6 +3340,7 @@ class bsn_generic_stats_request(bsn_stats_request):
 bsn_stats_request.subtypes[16] = bsn_generic_stats_request
 
 class bsn_gentable_bucket_stats_reply(bsn_stats_reply):
+    __slots__ = ["entries"]
     version = 5
     type = 19
     stats_type = 65535
@@ -3581,40 +3362,28 @@ class bsn_gentable_bucket_stats_reply(bsn_stats_reply):
             self.entries = []
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!H", self.stats_type))
-        packed.append(struct.pack("!H", self.flags))
-        packed.append('\x00' * 4)
-        packed.append(struct.pack("!L", self.experimenter))
-        packed.append(struct.pack("!L", self.subtype))
-        packed.append(loxi.generic_util.pack_list(self.entries))
-        length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_BBHLHH4xLL, buf, offset, self.version, self.type, 0, self.xid, self.stats_type, self.flags, self.experimenter, self.subtype)
+        offset = loxi.generic_util.pack_list_into(self.entries, buf, offset)
+        length = offset - start
+        _struct_H.pack_into(buf, start + 2, length)
+        return offset
+
+    def wire_length(self):
+        return 24 + loxi.generic_util.list_wire_length(self.entries)
 
     @staticmethod
     def unpack(reader):
         obj = bsn_gentable_bucket_stats_reply()
-        _version = reader.read("!B")[0]
+        _version, _type, _length = reader.read_struct(_struct_BBH)
         assert(_version == 5)
-        _type = reader.read("!B")[0]
         assert(_type == 19)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        _stats_type = reader.read("!H")[0]
+        obj.xid, _stats_type, obj.flags, _experimenter, _subtype = reader.read_struct(_struct_LHH4xLL)
         assert(_stats_type == 65535)
-        obj.flags = reader.read("!H")[0]
-        reader.skip(4)
-        _experimenter = reader.read("!L")[0]
         assert(_experimenter == 6035143)
-        _subtype = reader.read("!L")[0]
         assert(_subtype == 5)
         obj.entries = loxi.generic_util.unpack_list(reader, ofp.common.bsn_gentable_bucket_stats_entry.unpack)
         return obj
@@ -3648,6 +3417,7 @@ class bsn_gentable_bucket_stats_reply(bsn_stats_reply):
 bsn_stats_reply.subtypes[5] = bsn_gentable_bucket_stats_reply
 
 class bsn_gentable_bucket_stats_request(bsn_stats_request):
+    __slots__ = ["table_id"]
     version = 5
     type = 18
     stats_type = 65535
@@ -3669,42 +3439,28 @@ class bsn_gentable_bucket_stats_request(bsn_stats_request):
             self.table_id = 0
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!H", self.stats_type))
-        packed.append(struct.pack("!H", self.flags))
-        packed.append('\x00' * 4)
-        packed.append(struct.pack("!L", self.experimenter))
-        packed.append(struct.pack("!L", self.subtype))
-        packed.append(struct.pack("!H", self.table_id))
-        length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_BBHLHH4xLLH, buf, offset, self.version, self.type, 0, self.xid, self.stats_type, self.flags, self.experimenter, self.subtype, self.table_id)
+        length = offset - start
+        _struct_H.pack_into(buf, start + 2, length)
+        return offset
+
+    def wire_length(self):
+        return 26
 
     @staticmethod
     def unpack(reader):
         obj = bsn_gentable_bucket_stats_request()
-        _version = reader.read("!B")[0]
+        _version, _type, _length = reader.read_struct(_struct_BBH)
         assert(_version == 5)
-        _type = reader.read("!B")[0]
         assert(_type == 18)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        _stats_type = reader.read("!H")[0]
+        obj.xid, _stats_type, obj.flags, _experimenter, _subtype, obj.table_id = reader.read_struct(_struct_LHH4xLLH)
         assert(_stats_type == 65535)
-        obj.flags = reader.read("!H")[0]
-        reader.skip(4)
-        _experimenter = reader.read("!L")[0]
         assert(_experimenter == 6035143)
-        _subtype = reader.read("!L")[0]
         assert(_subtype == 5)
-        obj.table_id = reader.read("!H")[0]
         return obj
 
     def __eq__(self, other):
@@ -3736,6 +3492,7 @@ class bsn_gentable_bucket_stats_request(bsn_stats_request):
 bsn_stats_request.subtypes[5] = bsn_gentable_bucket_stats_request
 
 class bsn_gentable_clear_reply(bsn_header):
+    __slots__ = ["deleted_count", "error_count", "table_id"]
     version = 5
     type = 4
     experimenter = 6035143
@@ -3760,41 +3517,27 @@ class bsn_gentable_clear_reply(bsn_header):
             self.error_count = 0
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!L", self.experimenter))
-        packed.append(struct.pack("!L", self.subtype))
-        packed.append(struct.pack("!H", self.table_id))
-        packed.append('\x00' * 2)
-        packed.append(struct.pack("!L", self.deleted_count))
-        packed.append(struct.pack("!L", self.error_count))
-        length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_BBHLLLH2xLL, buf, offset, self.version, self.type, 0, self.xid, self.experimenter, self.subtype, self.table_id, self.deleted_count, self.error_count)
+        length = offset - start
+        _struct_H.pack_into(buf, start + 2, length)
+        return offset
+
+    def wire_length(self):
+        return 28
 
     @staticmethod
     def unpack(reader):
         obj = bsn_gentable_clear_reply()
-        _version = reader.read("!B")[0]
+        _version, _type, _length = reader.read_struct(_struct_BBH)
         assert(_version == 5)
-        _type = reader.read("!B")[0]
         assert(_type == 4)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        _experimenter = reader.read("!L")[0]
+        obj.xid, _experimenter, _subtype, obj.table_id, obj.deleted_count, obj.error_count = reader.read_struct(_struct_LLLH2xLL)
         assert(_experimenter == 6035143)
-        _subtype = reader.read("!L")[0]
         assert(_subtype == 49)
-        obj.table_id = reader.read("!H")[0]
-        reader.skip(2)
-        obj.deleted_count = reader.read("!L")[0]
-        obj.error_count = reader.read("!L")[0]
         return obj
 
     def __eq__(self, other):
@@ -3830,6 +3573,7 @@ class bsn_gentable_clear_reply(bsn_header):
 bsn_header.subtypes[49] = bsn_gentable_clear_reply
 
 class bsn_gentable_clear_request(bsn_header):
+    __slots__ = ["checksum", "checksum_mask", "table_id"]
     version = 5
     type = 4
     experimenter = 6035143
@@ -3854,39 +3598,29 @@ class bsn_gentable_clear_request(bsn_header):
             self.checksum_mask = 0
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!L", self.experimenter))
-        packed.append(struct.pack("!L", self.subtype))
-        packed.append(struct.pack("!H", self.table_id))
-        packed.append('\x00' * 2)
-        packed.append(util.pack_checksum_128(self.checksum))
-        packed.append(util.pack_checksum_128(self.checksum_mask))
-        length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_BBHLLLH2x, buf, offset, self.version, self.type, 0, self.xid, self.experimenter, self.subtype, self.table_id)
+        offset = loxi.generic_util.pack_bytes_into(util.pack_checksum_128(self.checksum), buf, offset)
+        offset = loxi.generic_util.pack_bytes_into(util.pack_checksum_128(self.checksum_mask), buf, offset)
+        length = offset - start
+        _struct_H.pack_into(buf, start + 2, length)
+        return offset
+
+    def wire_length(self):
+        return 52
 
     @staticmethod
     def unpack(reader):
         obj = bsn_gentable_clear_request()
-        _version = reader.read("!B")[0]
+        _version, _type, _length = reader.read_struct(_struct_BBH)
         assert(_version == 5)
-        _type = reader.read("!B")[0]
         assert(_type == 4)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        _experimenter = reader.read("!L")[0]
+        obj.xid, _experimenter, _subtype, obj.table_id = reader.read_struct(_struct_LLLH2x)
         assert(_experimenter == 6035143)
-        _subtype = reader.read("!L")[0]
         assert(_subtype == 48)
-        obj.table_id = reader.read("!H")[0]
-        reader.skip(2)
         obj.checksum = util.unpack_checksum_128(reader)
         obj.checksum_mask = util.unpack_checksum_128(reader)
         return obj
@@ -3924,6 +3658,7 @@ class bsn_gentable_clear_request(bsn_header):
 bsn_header.subtypes[48] = bsn_gentable_clear_request
 
 class bsn_gentable_desc_stats_reply(bsn_stats_reply):
+    __slots__ = ["entries"]
     version = 5
     type = 19
     stats_type = 65535
@@ -3945,40 +3680,28 @@ class bsn_gentable_desc_stats_reply(bsn_stats_reply):
             self.entries = []
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!H", self.stats_type))
-        packed.append(struct.pack("!H", self.flags))
-        packed.append('\x00' * 4)
-        packed.append(struct.pack("!L", self.experimenter))
-        packed.append(struct.pack("!L", self.subtype))
-        packed.append(loxi.generic_util.pack_list(self.entries))
-        length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_BBHLHH4xLL, buf, offset, self.version, self.type, 0, self.xid, self.stats_type, self.flags, self.experimenter, self.subtype)
+        offset = loxi.generic_util.pack_list_into(self.entries, buf, offset)
+        length = offset - start
+        _struct_H.pack_into(buf, start + 2, length)
+        return offset
+
+    def wire_length(self):
+        return 24 + loxi.generic_util.list_wire_length(self.entries)
 
     @staticmethod
     def unpack(reader):
         obj = bsn_gentable_desc_stats_reply()
-        _version = reader.read("!B")[0]
+        _version, _type, _length = reader.read_struct(_struct_BBH)
         assert(_version == 5)
-        _type = reader.read("!B")[0]
         assert(_type == 19)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        _stats_type = reader.read("!H")[0]
+        obj.xid, _stats_type, obj.flags, _experimenter, _subtype = reader.read_struct(_struct_LHH4xLL)
         assert(_stats_type == 65535)
-        obj.flags = reader.read("!H")[0]
-        reader.skip(4)
-        _experimenter = reader.read("!L")[0]
         assert(_experimenter == 6035143)
-        _subtype = reader.read("!L")[0]
         assert(_subtype == 4)
         obj.entries = loxi.generic_util.unpack_list(reader, ofp.common.bsn_gentable_desc_stats_entry.unpack)
         return obj
@@ -4012,6 +3735,7 @@ class bsn_gentable_desc_stats_reply(bsn_stats_reply):
 bsn_stats_reply.subtypes[4] = bsn_gentable_desc_stats_reply
 
 class bsn_gentable_desc_stats_request(bsn_stats_request):
+    __slots__ = []
     version = 5
     type = 18
     stats_type = 65535
@@ -4029,39 +3753,27 @@ class bsn_gentable_desc_stats_request(bsn_stats_request):
             self.flags = 0
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!H", self.stats_type))
-        packed.append(struct.pack("!H", self.flags))
-        packed.append('\x00' * 4)
-        packed.append(struct.pack("!L", self.experimenter))
-        packed.append(struct.pack("!L", self.subtype))
-        length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_BBHLHH4xLL, buf, offset, self.version, self.type, 0, self.xid, self.stats_type, self.flags, self.experimenter, self.subtype)
+        length = offset - start
+        _struct_H.pack_into(buf, start + 2, length)
+        return offset
+
+    def wire_length(self):
+        return 24
 
     @staticmethod
     def unpack(reader):
         obj = bsn_gentable_desc_stats_request()
-        _version = reader.read("!B")[0]
+        _version, _type, _length = reader.read_struct(_struct_BBH)
         assert(_version == 5)
-        _type = reader.read("!B")[0]
         assert(_type == 18)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        _stats_type = reader.read("!H")[0]
+        obj.xid, _stats_type, obj.flags, _experimenter, _subtype = reader.read_struct(_struct_LHH4xLL)
         assert(_stats_type == 65535)
-        obj.flags = reader.read("!H")[0]
-        reader.skip(4)
-        _experimenter = reader.read("!L")[0]
         assert(_experimenter == 6035143)
-        _subtype = reader.read("!L")[0]
         assert(_subtype == 4)
         return obj
 
@@ -4090,6 +3802,7 @@ class bsn_gentable_desc_stats_request(bsn_stats_request):
 bsn_stats_request.subtypes[4] = bsn_gentable_desc_stats_request
 
 class bsn_gentable_entry_add(bsn_header):
+    __slots__ = ["checksum", "key", "table_id", "value"]
     version = 5
     type = 4
     experimenter = 6035143
@@ -4118,41 +3831,32 @@ class bsn_gentable_entry_add(bsn_header):
             self.value = []
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!L", self.experimenter))
-        packed.append(struct.pack("!L", self.subtype))
-        packed.append(struct.pack("!H", self.table_id))
-        packed.append(struct.pack("!H", 0)) # placeholder for key_length at index 7
-        packed.append(util.pack_checksum_128(self.checksum))
-        packed.append(loxi.generic_util.pack_list(self.key))
-        packed[7] = struct.pack("!H", len(packed[-1]))
-        packed.append(loxi.generic_util.pack_list(self.value))
-        length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_BBHLLLHH, buf, offset, self.version, self.type, 0, self.xid, self.experimenter, self.subtype, self.table_id, 0)
+        offset = loxi.generic_util.pack_bytes_into(util.pack_checksum_128(self.checksum), buf, offset)
+        mark = offset
+        offset = loxi.generic_util.pack_list_into(self.key, buf, offset)
+        _struct_H.pack_into(buf, start + 18, offset - mark)
+        offset = loxi.generic_util.pack_list_into(self.value, buf, offset)
+        length = offset - start
+        _struct_H.pack_into(buf, start + 2, length)
+        return offset
+
+    def wire_length(self):
+        return 36 + loxi.generic_util.list_wire_length(self.key) + loxi.generic_util.list_wire_length(self.value)
 
     @staticmethod
     def unpack(reader):
         obj = bsn_gentable_entry_add()
-        _version = reader.read("!B")[0]
+        _version, _type, _length = reader.read_struct(_struct_BBH)
         assert(_version == 5)
-        _type = reader.read("!B")[0]
         assert(_type == 4)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        _experimenter = reader.read("!L")[0]
+        obj.xid, _experimenter, _subtype, obj.table_id, _key_length = reader.read_struct(_struct_LLLHH)
         assert(_experimenter == 6035143)
-        _subtype = reader.read("!L")[0]
         assert(_subtype == 46)
-        obj.table_id = reader.read("!H")[0]
-        _key_length = reader.read("!H")[0]
         obj.checksum = util.unpack_checksum_128(reader)
         obj.key = loxi.generic_util.unpack_list(reader.slice(_key_length), ofp.bsn_tlv.bsn_tlv.unpack)
         obj.value = loxi.generic_util.unpack_list(reader, ofp.bsn_tlv.bsn_tlv.unpack)
@@ -4195,6 +3899,7 @@ class bsn_gentable_entry_add(bsn_header):
 bsn_header.subtypes[46] = bsn_gentable_entry_add
 
 class bsn_gentable_entry_delete(bsn_header):
+    __slots__ = ["key", "table_id"]
     version = 5
     type = 4
     experimenter = 6035143
@@ -4215,36 +3920,28 @@ class bsn_gentable_entry_delete(bsn_header):
             self.key = []
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!L", self.experimenter))
-        packed.append(struct.pack("!L", self.subtype))
-        packed.append(struct.pack("!H", self.table_id))
-        packed.append(loxi.generic_util.pack_list(self.key))
-        length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_BBHLLLH, buf, offset, self.version, self.type, 0, self.xid, self.experimenter, self.subtype, self.table_id)
+        offset = loxi.generic_util.pack_list_into(self.key, buf, offset)
+        length = offset - start
+        _struct_H.pack_into(buf, start + 2, length)
+        return offset
+
+    def wire_length(self):
+        return 18 + loxi.generic_util.list_wire_length(self.key)
 
     @staticmethod
     def unpack(reader):
         obj = bsn_gentable_entry_delete()
-        _version = reader.read("!B")[0]
+        _version, _type, _length = reader.read_struct(_struct_BBH)
         assert(_version == 5)
-        _type = reader.read("!B")[0]
         assert(_type == 4)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        _experimenter = reader.read("!L")[0]
+        obj.xid, _experimenter, _subtype, obj.table_id = reader.read_struct(_struct_LLLH)
         assert(_experimenter == 6035143)
-        _subtype = reader.read("!L")[0]
         assert(_subtype == 47)
-        obj.table_id = reader.read("!H")[0]
         obj.key = loxi.generic_util.unpack_list(reader, ofp.bsn_tlv.bsn_tlv.unpack)
         return obj
 
@@ -4277,6 +3974,7 @@ class bsn_gentable_entry_delete(bsn_header):
 bsn_header.subtypes[47] = bsn_gentable_entry_delete
 
 class bsn_gentable_entry_desc_stats_reply(bsn_stats_reply):
+    __slots__ = ["entries"]
     version = 5
     type = 19
     stats_type = 65535
@@ -4298,40 +3996,28 @@ class bsn_gentable_entry_desc_stats_reply(bsn_stats_reply):
             self.entries = []
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!H", self.stats_type))
-        packed.append(struct.pack("!H", self.flags))
-        packed.append('\x00' * 4)
-        packed.append(struct.pack("!L", self.experimenter))
-        packed.append(struct.pack("!L", self.subtype))
-        packed.append(loxi.generic_util.pack_list(self.entries))
-        length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_BBHLHH4xLL, buf, offset, self.version, self.type, 0, self.xid, self.stats_type, self.flags, self.experimenter, self.subtype)
+        offset = loxi.generic_util.pack_list_into(self.entries, buf, offset)
+        length = offset - start
+        _struct_H.pack_into(buf, start + 2, length)
+        return offset
+
+    def wire_length(self):
+        return 24 + loxi.generic_util.list_wire_length(self.entries)
 
     @staticmethod
     def unpack(reader):
         obj = bsn_gentable_entry_desc_stats_reply()
-        _version = reader.read("!B")[0]
+        _version, _type, _length = reader.read_struct(_struct_BBH)
         assert(_version == 5)
-        _type = reader.read("!B")[0]
         assert(_type == 19)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        _stats_type = reader.read("!H")[0]
+        obj.xid, _stats_type, obj.flags, _experimenter, _subtype = reader.read_struct(_struct_LHH4xLL)
         assert(_stats_type == 65535)
-        obj.flags = reader.read("!H")[0]
-        reader.skip(4)
-        _experimenter = reader.read("!L")[0]
         assert(_experimenter == 6035143)
-        _subtype = reader.read("!L")[0]
         assert(_subtype == 2)
         obj.entries = loxi.generic_util.unpack_list(reader, ofp.common.bsn_gentable_entry_desc_stats_entry.unpack)
         return obj
@@ -4365,6 +4051,7 @@ class bsn_gentable_entry_desc_stats_reply(bsn_stats_reply):
 bsn_stats_reply.subtypes[2] = bsn_gentable_entry_desc_stats_reply
 
 class bsn_gentable_entry_desc_stats_request(bsn_stats_request):
+    __slots__ = ["checksum", "checksum_mask", "table_id"]
     version = 5
     type = 18
     stats_type = 65535
@@ -4394,46 +4081,30 @@ class bsn_gentable_entry_desc_stats_request(bsn_stats_request):
             self.checksum_mask = 0
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!H", self.stats_type))
-        packed.append(struct.pack("!H", self.flags))
-        packed.append('\x00' * 4)
-        packed.append(struct.pack("!L", self.experimenter))
-        packed.append(struct.pack("!L", self.subtype))
-        packed.append(struct.pack("!H", self.table_id))
-        packed.append('\x00' * 2)
-        packed.append(util.pack_checksum_128(self.checksum))
-        packed.append(util.pack_checksum_128(self.checksum_mask))
-        length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_BBHLHH4xLLH2x, buf, offset, self.version, self.type, 0, self.xid, self.stats_type, self.flags, self.experimenter, self.subtype, self.table_id)
+        offset = loxi.generic_util.pack_bytes_into(util.pack_checksum_128(self.checksum), buf, offset)
+        offset = loxi.generic_util.pack_bytes_into(util.pack_checksum_128(self.checksum_mask), buf, offset)
+        length = offset - start
+        _struct_H.pack_into(buf, start + 2, length)
+        return offset
+
+    def wire_length(self):
+        return 60
 
     @staticmethod
     def unpack(reader):
         obj = bsn_gentable_entry_desc_stats_request()
-        _version = reader.read("!B")[0]
+        _version, _type, _length = reader.read_struct(_struct_BBH)
         assert(_version == 5)
-        _type = reader.read("!B")[0]
         assert(_type == 18)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        _stats_type = reader.read("!H")[0]
+        obj.xid, _stats_type, obj.flags, _experimenter, _subtype, obj.table_id = reader.read_struct(_struct_LHH4xLLH2x)
         assert(_stats_type == 65535)
-        obj.flags = reader.read("!H")[0]
-        reader.skip(4)
-        _experimenter = reader.read("!L")[0]
         assert(_experimenter == 6035143)
-        _subtype = reader.read("!L")[0]
         assert(_subtype == 2)
-        obj.table_id = reader.read("!H")[0]
-        reader.skip(2)
         obj.checksum = util.unpack_checksum_128(reader)
         obj.checksum_mask = util.unpack_checksum_128(reader)
         return obj
@@ -4475,6 +4146,7 @@ class bsn_gentable_entry_desc_stats_request(bsn_stats_request):
 bsn_stats_request.subtypes[2] = bsn_gentable_entry_desc_stats_request
 
 class bsn_gentable_entry_stats_reply(bsn_stats_reply):
+    __slots__ = ["entries"]
     version = 5
     type = 19
     stats_type = 65535
@@ -4496,40 +4168,28 @@ class bsn_gentable_entry_stats_reply(bsn_stats_reply):
             self.entries = []
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!H", self.stats_type))
-        packed.append(struct.pack("!H", self.flags))
-        packed.append('\x00' * 4)
-        packed.append(struct.pack("!L", self.experimenter))
-        packed.append(struct.pack("!L", self.subtype))
-        packed.append(loxi.generic_util.pack_list(self.entries))
-        length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_BBHLHH4xLL, buf, offset, self.version, self.type, 0, self.xid, self.stats_type, self.flags, self.experimenter, self.subtype)
+        offset = loxi.generic_util.pack_list_into(self.entries, buf, offset)
+        length = offset - start
+        _struct_H.pack_into(buf, start + 2, length)
+        return offset
+
+    def wire_length(self):
+        return 24 + loxi.generic_util.list_wire_length(self.entries)
 
     @staticmethod
     def unpack(reader):
         obj = bsn_gentable_entry_stats_reply()
-        _version = reader.read("!B")[0]
+        _version, _type, _length = reader.read_struct(_struct_BBH)
         assert(_version == 5)
-        _type = reader.read("!B")[0]
         assert(_type == 19)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        _stats_type = reader.read("!H")[0]
+        obj.xid, _stats_type, obj.flags, _experimenter, _subtype = reader.read_struct(_struct_LHH4xLL)
         assert(_stats_type == 65535)
-        obj.flags = reader.read("!H")[0]
-        reader.skip(4)
-        _experimenter = reader.read("!L")[0]
         assert(_experimenter == 6035143)
-        _subtype = reader.read("!L")[0]
         assert(_subtype == 3)
         obj.entries = loxi.generic_util.unpack_list(reader, ofp.common.bsn_gentable_entry_stats_entry.unpack)
         return obj
@@ -4563,6 +4223,7 @@ class bsn_gentable_entry_stats_reply(bsn_stats_reply):
 bsn_stats_reply.subtypes[3] = bsn_gentable_entry_stats_reply
 
 class bsn_gentable_entry_stats_request(bsn_stats_request):
+    __slots__ = ["checksum", "checksum_mask", "table_id"]
     version = 5
     type = 18
     stats_type = 65535
@@ -4592,46 +4253,30 @@ class bsn_gentable_entry_stats_request(bsn_stats_request):
             self.checksum_mask = 0
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!H", self.stats_type))
-        packed.append(struct.pack("!H", self.flags))
-        packed.append('\x00' * 4)
-        packed.append(struct.pack("!L", self.experimenter))
-        packed.append(struct.pack("!L", self.subtype))
-        packed.append(struct.pack("!H", self.table_id))
-        packed.append('\x00' * 2)
-        packed.append(util.pack_checksum_128(self.checksum))
-        packed.append(util.pack_checksum_128(self.checksum_mask))
-        length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_BBHLHH4xLLH2x, buf, offset, self.version, self.type, 0, self.xid, self.stats_type, self.flags, self.experimenter, self.subtype, self.table_id)
+        offset = loxi.generic_util.pack_bytes_into(util.pack_checksum_128(self.checksum), buf, offset)
+        offset = loxi.generic_util.pack_bytes_into(util.pack_checksum_128(self.checksum_mask), buf, offset)
+        length = offset - start
+        _struct_H.pack_into(buf, start + 2, length)
+        return offset
+
+    def wire_length(self):
+        return 60
 
     @staticmethod
     def unpack(reader):
         obj = bsn_gentable_entry_stats_request()
-        _version = reader.read("!B")[0]
+        _version, _type, _length = reader.read_struct(_struct_BBH)
         assert(_version == 5)
-        _type = reader.read("!B")[0]
         assert(_type == 18)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        _stats_type = reader.read("!H")[0]
+        obj.xid, _stats_type, obj.flags, _experimenter, _subtype, obj.table_id = reader.read_struct(_struct_LHH4xLLH2x)
         assert(_stats_type == 65535)
-        obj.flags = reader.read("!H")[0]
-        reader.skip(4)
-        _experimenter = reader.read("!L")[0]
         assert(_experimenter == 6035143)
-        _subtype = reader.read("!L")[0]
         assert(_subtype == 3)
-        obj.table_id = reader.read("!H")[0]
-        reader.skip(2)
         obj.checksum = util.unpack_checksum_128(reader)
         obj.checksum_mask = util.unpack_checksum_128(reader)
         return obj
@@ -4673,6 +4318,7 @@ class bsn_gentable_entry_stats_request(bsn_stats_request):
 bsn_stats_request.subtypes[3] = bsn_gentable_entry_stats_request
 
 class bsn_gentable_set_buckets_size(bsn_header):
+    __slots__ = ["buckets_size", "table_id"]
     version = 5
     type = 4
     experimenter = 6035143
@@ -4693,39 +4339,27 @@ class bsn_gentable_set_buckets_size(bsn_header):
             self.buckets_size = 0
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!L", self.experimenter))
-        packed.append(struct.pack("!L", self.subtype))
-        packed.append(struct.pack("!H", self.table_id))
-        packed.append('\x00' * 2)
-        packed.append(struct.pack("!L", self.buckets_size))
-        length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_BBHLLLH2xL, buf, offset, self.version, self.type, 0, self.xid, self.experimenter, self.subtype, self.table_id, self.buckets_size)
+        length = offset - start
+        _struct_H.pack_into(buf, start + 2, length)
+        return offset
+
+    def wire_length(self):
+        return 24
 
     @staticmethod
     def unpack(reader):
         obj = bsn_gentable_set_buckets_size()
-        _version = reader.read("!B")[0]
+        _version, _type, _length = reader.read_struct(_struct_BBH)
         assert(_version == 5)
-        _type = reader.read("!B")[0]
         assert(_type == 4)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        _experimenter = reader.read("!L")[0]
+        obj.xid, _experimenter, _subtype, obj.table_id, obj.buckets_size = reader.read_struct(_struct_LLLH2xL)
         assert(_experimenter == 6035143)
-        _subtype = reader.read("!L")[0]
         assert(_subtype == 50)
-        obj.table_id = reader.read("!H")[0]
-        reader.skip(2)
-        obj.buckets_size = reader.read("!L")[0]
         return obj
 
     def __eq__(self, other):
@@ -4757,6 +4391,7 @@ class bsn_gentable_set_buckets_size(bsn_header):
 bsn_header.subtypes[50] = bsn_gentable_set_buckets_size
 
 class bsn_gentable_stats_reply(bsn_stats_reply):
+    __slots__ = ["entries"]
     version = 5
     type = 19
     stats_type = 65535
@@ -4778,40 +4413,28 @@ class bsn_gentable_stats_reply(bsn_stats_reply):
             self.entries = []
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!H", self.stats_type))
-        packed.append(struct.pack("!H", self.flags))
-        packed.append('\x00' * 4)
-        packed.append(struct.pack("!L", self.experimenter))
-        packed.append(struct.pack("!L", self.subtype))
-        packed.append(loxi.generic_util.pack_list(self.entries))
-        length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_BBHLHH4xLL, buf, offset, self.version, self.type, 0, self.xid, self.stats_type, self.flags, self.experimenter, self.subtype)
+        offset = loxi.generic_util.pack_list_into(self.entries, buf, offset)
+        length = offset - start
+        _struct_H.pack_into(buf, start + 2, length)
+        return offset
+
+    def wire_length(self):
+        return 24 + loxi.generic_util.list_wire_length(self.entries)
 
     @staticmethod
     def unpack(reader):
         obj = bsn_gentable_stats_reply()
-        _version = reader.read("!B")[0]
+        _version, _type, _length = reader.read_struct(_struct_BBH)
         assert(_version == 5)
-        _type = reader.read("!B")[0]
         assert(_type == 19)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        _stats_type = reader.read("!H")[0]
+        obj.xid, _stats_type, obj.flags, _experimenter, _subtype = reader.read_struct(_struct_LHH4xLL)
         assert(_stats_type == 65535)
-        obj.flags = reader.read("!H")[0]
-        reader.skip(4)
-        _experimenter = reader.read("!L")[0]
         assert(_experimenter == 6035143)
-        _subtype = reader.read("!L")[0]
         assert(_subtype == 7)
         obj.entries = loxi.generic_util.unpack_list(reader, ofp.common.bsn_gentable_stats_entry.unpack)
         return obj
@@ -4845,6 +4468,7 @@ class bsn_gentable_stats_reply(bsn_stats_reply):
 bsn_stats_reply.subtypes[7] = bsn_gentable_stats_reply
 
 class bsn_gentable_stats_request(bsn_stats_request):
+    __slots__ = []
     version = 5
     type = 18
     stats_type = 65535
@@ -4862,39 +4486,27 @@ class bsn_gentable_stats_request(bsn_stats_request):
             self.flags = 0
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!H", self.stats_type))
-        packed.append(struct.pack("!H", self.flags))
-        packed.append('\x00' * 4)
-        packed.append(struct.pack("!L", self.experimenter))
-        packed.append(struct.pack("!L", self.subtype))
-        length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_BBHLHH4xLL, buf, offset, self.version, self.type, 0, self.xid, self.stats_type, self.flags, self.experimenter, self.subtype)
+        length = offset - start
+        _struct_H.pack_into(buf, start + 2, length)
+        return offset
+
+    def wire_length(self):
+        return 24
 
     @staticmethod
     def unpack(reader):
         obj = bsn_gentable_stats_request()
-        _version = reader.read("!B")[0]
+        _version, _type, _length = reader.read_struct(_struct_BBH)
         assert(_version == 5)
-        _type = reader.read("!B")[0]
         assert(_type == 18)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        _stats_type = reader.read("!H")[0]
+        obj.xid, _stats_type, obj.flags, _experimenter, _subtype = reader.read_struct(_struct_LHH4xLL)
         assert(_stats_type == 65535)
-        obj.flags = reader.read("!H")[0]
-        reader.skip(4)
-        _experimenter = reader.read("!L")[0]
         assert(_experimenter == 6035143)
-        _subtype = reader.read("!L")[0]
         assert(_subtype == 7)
         return obj
 
@@ -4923,6 +4535,7 @@ class bsn_gentable_stats_request(bsn_stats_request):
 bsn_stats_request.subtypes[7] = bsn_gentable_stats_request
 
 class bsn_get_interfaces_reply(bsn_header):
+    __slots__ = ["interfaces"]
     version = 5
     type = 4
     experimenter = 6035143
@@ -4939,33 +4552,27 @@ class bsn_get_interfaces_reply(bsn_header):
             self.interfaces = []
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!L", self.experimenter))
-        packed.append(struct.pack("!L", self.subtype))
-        packed.append(loxi.generic_util.pack_list(self.interfaces))
-        length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_BBHLLL, buf, offset, self.version, self.type, 0, self.xid, self.experimenter, self.subtype)
+        offset = loxi.generic_util.pack_list_into(self.interfaces, buf, offset)
+        length = offset - start
+        _struct_H.pack_into(buf, start + 2, length)
+        return offset
+
+    def wire_length(self):
+        return 16 + loxi.generic_util.list_wire_length(self.interfaces)
 
     @staticmethod
     def unpack(reader):
         obj = bsn_get_interfaces_reply()
-        _version = reader.read("!B")[0]
+        _version, _type, _length = reader.read_struct(_struct_BBH)
         assert(_version == 5)
-        _type = reader.read("!B")[0]
         assert(_type == 4)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        _experimenter = reader.read("!L")[0]
+        obj.xid, _experimenter, _subtype = reader.read_struct(_struct_LLL)
         assert(_experimenter == 6035143)
-        _subtype = reader.read("!L")[0]
         assert(_subtype == 10)
         obj.interfaces = loxi.generic_util.unpack_list(reader, ofp.common.bsn_interface.unpack)
         return obj
@@ -4995,6 +4602,7 @@ class bsn_get_interfaces_reply(bsn_header):
 bsn_header.subtypes[10] = bsn_get_interfaces_reply
 
 class bsn_get_interfaces_request(bsn_header):
+    __slots__ = []
     version = 5
     type = 4
     experimenter = 6035143
@@ -5007,32 +4615,26 @@ class bsn_get_interfaces_request(bsn_header):
             self.xid = None
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!L", self.experimenter))
-        packed.append(struct.pack("!L", self.subtype))
-        length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_BBHLLL, buf, offset, self.version, self.type, 0, self.xid, self.experimenter, self.subtype)
+        length = offset - start
+        _struct_H.pack_into(buf, start + 2, length)
+        return offset
+
+    def wire_length(self):
+        return 16
 
     @staticmethod
     def unpack(reader):
         obj = bsn_get_interfaces_request()
-        _version = reader.read("!B")[0]
+        _version, _type, _length = reader.read_struct(_struct_BBH)
         assert(_version == 5)
-        _type = reader.read("!B")[0]
         assert(_type == 4)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        _experimenter = reader.read("!L")[0]
+        obj.xid, _experimenter, _subtype = reader.read_struct(_struct_LLL)
         assert(_experimenter == 6035143)
-        _subtype = reader.read("!L")[0]
         assert(_subtype == 9)
         return obj
 
@@ -5057,6 +4659,7 @@ class bsn_get_interfaces_request(bsn_header):
 bsn_header.subtypes[9] = bsn_get_interfaces_request
 
 class bsn_get_mirroring_reply(bsn_header):
+    __slots__ = ["report_mirror_ports"]
     version = 5
     type = 4
     experimenter = 6035143
@@ -5073,37 +4676,27 @@ class bsn_get_mirroring_reply(bsn_header):
             self.report_mirror_ports = 0
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!L", self.experimenter))
-        packed.append(struct.pack("!L", self.subtype))
-        packed.append(struct.pack("!B", self.report_mirror_ports))
-        packed.append('\x00' * 3)
-        length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_BBHLLLB3x, buf, offset, self.version, self.type, 0, self.xid, self.experimenter, self.subtype, self.report_mirror_ports)
+        length = offset - start
+        _struct_H.pack_into(buf, start + 2, length)
+        return offset
+
+    def wire_length(self):
+        return 20
 
     @staticmethod
     def unpack(reader):
         obj = bsn_get_mirroring_reply()
-        _version = reader.read("!B")[0]
+        _version, _type, _length = reader.read_struct(_struct_BBH)
         assert(_version == 5)
-        _type = reader.read("!B")[0]
         assert(_type == 4)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        _experimenter = reader.read("!L")[0]
+        obj.xid, _experimenter, _subtype, obj.report_mirror_ports = reader.read_struct(_struct_LLLB3x)
         assert(_experimenter == 6035143)
-        _subtype = reader.read("!L")[0]
         assert(_subtype == 5)
-        obj.report_mirror_ports = reader.read("!B")[0]
-        reader.skip(3)
         return obj
 
     def __eq__(self, other):
@@ -5131,6 +4724,7 @@ class bsn_get_mirroring_reply(bsn_header):
 bsn_header.subtypes[5] = bsn_get_mirroring_reply
 
 class bsn_get_mirroring_request(bsn_header):
+    __slots__ = ["report_mirror_ports"]
     version = 5
     type = 4
     experimenter = 6035143
@@ -5147,37 +4741,27 @@ class bsn_get_mirroring_request(bsn_header):
             self.report_mirror_ports = 0
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!L", self.experimenter))
-        packed.append(struct.pack("!L", self.subtype))
-        packed.append(struct.pack("!B", self.report_mirror_ports))
-        packed.append('\x00' * 3)
-        length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_BBHLLLB3x, buf, offset, self.version, self.type, 0, self.xid, self.experimenter, self.subtype, self.report_mirror_ports)
+        length = offset - start
+        _struct_H.pack_into(buf, start + 2, length)
+        return offset
+
+    def wire_length(self):
+        return 20
 
     @staticmethod
     def unpack(reader):
         obj = bsn_get_mirroring_request()
-        _version = reader.read("!B")[0]
+        _version, _type, _length = reader.read_struct(_struct_BBH)
         assert(_version == 5)
-        _type = reader.read("!B")[0]
         assert(_type == 4)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        _experimenter = reader.read("!L")[0]
+        obj.xid, _experimenter, _subtype, obj.report_mirror_ports = reader.read_struct(_struct_LLLB3x)
         assert(_experimenter == 6035143)
-        _subtype = reader.read("!L")[0]
         assert(_subtype == 4)
-        obj.report_mirror_ports = reader.read("!B")[0]
-        reader.skip(3)
         return obj
 
     def __eq__(self, other):
@@ -5205,6 +4789,7 @@ class bsn_get_mirroring_request(bsn_header):
 bsn_header.subtypes[4] = bsn_get_mirroring_request
 
 class bsn_get_switch_pipeline_reply(bsn_header):
+    __slots__ = ["pipeline"]
     version = 5
     type = 4
     experimenter = 6035143
@@ -5221,35 +4806,28 @@ class bsn_get_switch_pipeline_reply(bsn_header):
             self.pipeline = ""
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!L", self.experimenter))
-        packed.append(struct.pack("!L", self.subtype))
-        packed.append(struct.pack("!256s", self.pipeline))
-        length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_BBHLLL256s, buf, offset, self.version, self.type, 0, self.xid, self.experimenter, self.subtype, self.pipeline)
+        length = offset - start
+        _struct_H.pack_into(buf, start + 2, length)
+        return offset
+
+    def wire_length(self):
+        return 272
 
     @staticmethod
     def unpack(reader):
         obj = bsn_get_switch_pipeline_reply()
-        _version = reader.read("!B")[0]
+        _version, _type, _length = reader.read_struct(_struct_BBH)
         assert(_version == 5)
-        _type = reader.read("!B")[0]
         assert(_type == 4)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        _experimenter = reader.read("!L")[0]
+        obj.xid, _experimenter, _subtype, obj.pipeline = reader.read_struct(_struct_LLL256s)
         assert(_experimenter == 6035143)
-        _subtype = reader.read("!L")[0]
         assert(_subtype == 52)
-        obj.pipeline = reader.read("!256s")[0].rstrip("\x00")
+        obj.pipeline = obj.pipeline.rstrip("\x00")
         return obj
 
     def __eq__(self, other):
@@ -5277,6 +4855,7 @@ class bsn_get_switch_pipeline_reply(bsn_header):
 bsn_header.subtypes[52] = bsn_get_switch_pipeline_reply
 
 class bsn_get_switch_pipeline_request(bsn_header):
+    __slots__ = []
     version = 5
     type = 4
     experimenter = 6035143
@@ -5289,32 +4868,26 @@ class bsn_get_switch_pipeline_request(bsn_header):
             self.xid = None
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!L", self.experimenter))
-        packed.append(struct.pack("!L", self.subtype))
-        length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_BBHLLL, buf, offset, self.version, self.type, 0, self.xid, self.experimenter, self.subtype)
+        length = offset - start
+        _struct_H.pack_into(buf, start + 2, length)
+        return offset
+
+    def wire_length(self):
+        return 16
 
     @staticmethod
     def unpack(reader):
         obj = bsn_get_switch_pipeline_request()
-        _version = reader.read("!B")[0]
+        _version, _type, _length = reader.read_struct(_struct_BBH)
         assert(_version == 5)
-        _type = reader.read("!B")[0]
         assert(_type == 4)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        _experimenter = reader.read("!L")[0]
+        obj.xid, _experimenter, _subtype = reader.read_struct(_struct_LLL)
         assert(_experimenter == 6035143)
-        _subtype = reader.read("!L")[0]
         assert(_subtype == 51)
         return obj
 
@@ -5339,6 +4912,7 @@ class bsn_get_switch_pipeline_request(bsn_header):
 bsn_header.subtypes[51] = bsn_get_switch_pipeline_request
 
 class bsn_image_desc_stats_reply(bsn_stats_reply):
+    __slots__ = ["image_checksum", "startup_config_checksum"]
     version = 5
     type = 19
     stats_type = 65535
@@ -5364,44 +4938,30 @@ class bsn_image_desc_stats_reply(bsn_stats_reply):
             self.startup_config_checksum = ""
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!H", self.stats_type))
-        packed.append(struct.pack("!H", self.flags))
-        packed.append('\x00' * 4)
-        packed.append(struct.pack("!L", self.experimenter))
-        packed.append(struct.pack("!L", self.subtype))
-        packed.append(struct.pack("!256s", self.image_checksum))
-        packed.append(struct.pack("!256s", self.startup_config_checksum))
-        length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_BBHLHH4xLL256s256s, buf, offset, self.version, self.type, 0, self.xid, self.stats_type, self.flags, self.experimenter, self.subtype, self.image_checksum, self.startup_config_checksum)
+        length = offset - start
+        _struct_H.pack_into(buf, start + 2, length)
+        return offset
+
+    def wire_length(self):
+        return 536
 
     @staticmethod
     def unpack(reader):
         obj = bsn_image_desc_stats_reply()
-        _version = reader.read("!B")[0]
+        _version, _type, _length = reader.read_struct(_struct_BBH)
         assert(_version == 5)
-        _type = reader.read("!B")[0]
         assert(_type == 19)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        _stats_type = reader.read("!H")[0]
+        obj.xid, _stats_type, obj.flags, _experimenter, _subtype, obj.image_checksum, obj.startup_config_checksum = reader.read_struct(_struct_LHH4xLL256s256s)
         assert(_stats_type == 65535)
-        obj.flags = reader.read("!H")[0]
-        reader.skip(4)
-        _experimenter = reader.read("!L")[0]
         assert(_experimenter == 6035143)
-        _subtype = reader.read("!L")[0]
         assert(_subtype == 14)
-        obj.image_checksum = reader.read("!256s")[0].rstrip("\x00")
-        obj.startup_config_checksum = reader.read("!256s")[0].rstrip("\x00")
+        obj.image_checksum = obj.image_checksum.rstrip("\x00")
+        obj.startup_config_checksum = obj.startup_config_checksum.rstrip("\x00")
         return obj
 
     def __eq__(self, other):
@@ -5437,6 +4997,7 @@ class bsn_image_desc_stats_reply(bsn_stats_reply):
 bsn_stats_reply.subtypes[14] = bsn_image_desc_stats_reply
 
 class bsn_image_desc_stats_request(bsn_stats_request):
+    __slots__ = []
     version = 5
     type = 18
     stats_type = 65535
@@ -5454,39 +5015,27 @@ class bsn_image_desc_stats_request(bsn_stats_request):
             self.flags = 0
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!H", self.stats_type))
-        packed.append(struct.pack("!H", self.flags))
-        packed.append('\x00' * 4)
-        packed.append(struct.pack("!L", self.experimenter))
-        packed.append(struct.pack("!L", self.subtype))
-        length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_BBHLHH4xLL, buf, offset, self.version, self.type, 0, self.xid, self.stats_type, self.flags, self.experimenter, self.subtype)
+        length = offset - start
+        _struct_H.pack_into(buf, start + 2, length)
+        return offset
+
+    def wire_length(self):
+        return 24
 
     @staticmethod
     def unpack(reader):
         obj = bsn_image_desc_stats_request()
-        _version = reader.read("!B")[0]
+        _version, _type, _length = reader.read_struct(_struct_BBH)
         assert(_version == 5)
-        _type = reader.read("!B")[0]
         assert(_type == 18)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        _stats_type = reader.read("!H")[0]
+        obj.xid, _stats_type, obj.flags, _experimenter, _subtype = reader.read_struct(_struct_LHH4xLL)
         assert(_stats_type == 65535)
-        obj.flags = reader.read("!H")[0]
-        reader.skip(4)
-        _experimenter = reader.read("!L")[0]
         assert(_experimenter == 6035143)
-        _subtype = reader.read("!L")[0]
         assert(_subtype == 14)
         return obj
 
@@ -5515,6 +5064,7 @@ class bsn_image_desc_stats_request(bsn_stats_request):
 bsn_stats_request.subtypes[14] = bsn_image_desc_stats_request
 
 class bsn_lacp_convergence_notif(bsn_header):
+    __slots__ = ["actor_key", "actor_port_num", "actor_port_priority", "actor_sys_mac", "actor_sys_priority", "convergence_status", "partner_key", "partner_port_num", "partner_port_priority", "partner_sys_mac", "partner_sys_priority", "port_no"]
     version = 5
     type = 4
     experimenter = 6035143
@@ -5575,59 +5125,35 @@ class bsn_lacp_convergence_notif(bsn_header):
             self.partner_key = 0
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!L", self.experimenter))
-        packed.append(struct.pack("!L", self.subtype))
-        packed.append(struct.pack("!B", self.convergence_status))
-        packed.append('\x00' * 3)
-        packed.append(util.pack_port_no(self.port_no))
-        packed.append(struct.pack("!H", self.actor_sys_priority))
-        packed.append(struct.pack("!6B", *self.actor_sys_mac))
-        packed.append(struct.pack("!H", self.actor_port_priority))
-        packed.append(struct.pack("!H", self.actor_port_num))
-        packed.append(struct.pack("!H", self.actor_key))
-        packed.append(struct.pack("!H", self.partner_sys_priority))
-        packed.append(struct.pack("!6B", *self.partner_sys_mac))
-        packed.append(struct.pack("!H", self.partner_port_priority))
-        packed.append(struct.pack("!H", self.partner_port_num))
-        packed.append(struct.pack("!H", self.partner_key))
-        length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_BBHLLLB3xLH, buf, offset, self.version, self.type, 0, self.xid, self.experimenter, self.subtype, self.convergence_status, self.port_no, self.actor_sys_priority)
+        offset = loxi.generic_util.pack_struct_into(_struct_6B, buf, offset, *self.actor_sys_mac)
+        offset = loxi.generic_util.pack_struct_into(_struct_HHHH, buf, offset, self.actor_port_priority, self.actor_port_num, self.actor_key, self.partner_sys_priority)
+        offset = loxi.generic_util.pack_struct_into(_struct_6B, buf, offset, *self.partner_sys_mac)
+        offset = loxi.generic_util.pack_struct_into(_struct_HHH, buf, offset, self.partner_port_priority, self.partner_port_num, self.partner_key)
+        length = offset - start
+        _struct_H.pack_into(buf, start + 2, length)
+        return offset
+
+    def wire_length(self):
+        return 52
 
     @staticmethod
     def unpack(reader):
         obj = bsn_lacp_convergence_notif()
-        _version = reader.read("!B")[0]
+        _version, _type, _length = reader.read_struct(_struct_BBH)
         assert(_version == 5)
-        _type = reader.read("!B")[0]
         assert(_type == 4)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        _experimenter = reader.read("!L")[0]
+        obj.xid, _experimenter, _subtype, obj.convergence_status, obj.port_no, obj.actor_sys_priority = reader.read_struct(_struct_LLLB3xLH)
         assert(_experimenter == 6035143)
-        _subtype = reader.read("!L")[0]
         assert(_subtype == 43)
-        obj.convergence_status = reader.read("!B")[0]
-        reader.skip(3)
-        obj.port_no = util.unpack_port_no(reader)
-        obj.actor_sys_priority = reader.read("!H")[0]
         obj.actor_sys_mac = list(reader.read('!6B'))
-        obj.actor_port_priority = reader.read("!H")[0]
-        obj.actor_port_num = reader.read("!H")[0]
-        obj.actor_key = reader.read("!H")[0]
-        obj.partner_sys_priority = reader.read("!H")[0]
+        obj.actor_port_priority, obj.actor_port_num, obj.actor_key, obj.partner_sys_priority = reader.read_struct(_struct_HHHH)
         obj.partner_sys_mac = list(reader.read('!6B'))
-        obj.partner_port_priority = reader.read("!H")[0]
-        obj.partner_port_num = reader.read("!H")[0]
-        obj.partner_key = reader.read("!H")[0]
+        obj.partner_port_priority, obj.partner_port_num, obj.partner_key = reader.read_struct(_struct_HHH)
         return obj
 
     def __eq__(self, other):
@@ -5699,6 +5225,7 @@ class bsn_lacp_convergence_notif(bsn_header):
 bsn_header.subtypes[43] = bsn_lacp_convergence_notif
 
 class bsn_lacp_stats_reply(bsn_stats_reply):
+    __slots__ = ["entries"]
     version = 5
     type = 19
     stats_type = 65535
@@ -5720,40 +5247,28 @@ class bsn_lacp_stats_reply(bsn_stats_reply):
             self.entries = []
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!H", self.stats_type))
-        packed.append(struct.pack("!H", self.flags))
-        packed.append('\x00' * 4)
-        packed.append(struct.pack("!L", self.experimenter))
-        packed.append(struct.pack("!L", self.subtype))
-        packed.append(loxi.generic_util.pack_list(self.entries))
-        length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_BBHLHH4xLL, buf, offset, self.version, self.type, 0, self.xid, self.stats_type, self.flags, self.experimenter, self.subtype)
+        offset = loxi.generic_util.pack_list_into(self.entries, buf, offset)
+        length = offset - start
+        _struct_H.pack_into(buf, start + 2, length)
+        return offset
+
+    def wire_length(self):
+        return 24 + loxi.generic_util.list_wire_length(self.entries)
 
     @staticmethod
     def unpack(reader):
         obj = bsn_lacp_stats_reply()
-        _version = reader.read("!B")[0]
+        _version, _type, _length = reader.read_struct(_struct_BBH)
         assert(_version == 5)
-        _type = reader.read("!B")[0]
         assert(_type == 19)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        _stats_type = reader.read("!H")[0]
+        obj.xid, _stats_type, obj.flags, _experimenter, _subtype = reader.read_struct(_struct_LHH4xLL)
         assert(_stats_type == 65535)
-        obj.flags = reader.read("!H")[0]
-        reader.skip(4)
-        _experimenter = reader.read("!L")[0]
         assert(_experimenter == 6035143)
-        _subtype = reader.read("!L")[0]
         assert(_subtype == 1)
         obj.entries = loxi.generic_util.unpack_list(reader, ofp.common.bsn_lacp_stats_entry.unpack)
         return obj
@@ -5787,6 +5302,7 @@ class bsn_lacp_stats_reply(bsn_stats_reply):
 bsn_stats_reply.subtypes[1] = bsn_lacp_stats_reply
 
 class bsn_lacp_stats_request(bsn_stats_request):
+    __slots__ = []
     version = 5
     type = 18
     stats_type = 65535
@@ -5804,39 +5320,27 @@ class bsn_lacp_stats_request(bsn_stats_request):
             self.flags = 0
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!H", self.stats_type))
-        packed.append(struct.pack("!H", self.flags))
-        packed.append('\x00' * 4)
-        packed.append(struct.pack("!L", self.experimenter))
-        packed.append(struct.pack("!L", self.subtype))
-        length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_BBHLHH4xLL, buf, offset, self.version, self.type, 0, self.xid, self.stats_type, self.flags, self.experimenter, self.subtype)
+        length = offset - start
+        _struct_H.pack_into(buf, start + 2, length)
+        return offset
+
+    def wire_length(self):
+        return 24
 
     @staticmethod
     def unpack(reader):
         obj = bsn_lacp_stats_request()
-        _version = reader.read("!B")[0]
+        _version, _type, _length = reader.read_struct(_struct_BBH)
         assert(_version == 5)
-        _type = reader.read("!B")[0]
         assert(_type == 18)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        _stats_type = reader.read("!H")[0]
+        obj.xid, _stats_type, obj.flags, _experimenter, _subtype = reader.read_struct(_struct_LHH4xLL)
         assert(_stats_type == 65535)
-        obj.flags = reader.read("!H")[0]
-        reader.skip(4)
-        _experimenter = reader.read("!L")[0]
         assert(_experimenter == 6035143)
-        _subtype = reader.read("!L")[0]
         assert(_subtype == 1)
         return obj
 
@@ -5865,6 +5369,7 @@ class bsn_lacp_stats_request(bsn_stats_request):
 bsn_stats_request.subtypes[1] = bsn_lacp_stats_request
 
 class bsn_log(bsn_header):
+    __slots__ = ["loglevel"]
     version = 5
     type = 4
     experimenter = 6035143
@@ -5885,37 +5390,29 @@ class bsn_log(bsn_header):
             self.data = ''
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!L", self.experimenter))
-        packed.append(struct.pack("!L", self.subtype))
-        packed.append(struct.pack("!B", self.loglevel))
-        packed.append(self.data)
-        length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_BBHLLLB, buf, offset, self.version, self.type, 0, self.xid, self.experimenter, self.subtype, self.loglevel)
+        offset = loxi.generic_util.pack_bytes_into(self.data, buf, offset)
+        length = offset - start
+        _struct_H.pack_into(buf, start + 2, length)
+        return offset
+
+    def wire_length(self):
+        return 17 + len(self.data)
 
     @staticmethod
     def unpack(reader):
         obj = bsn_log()
-        _version = reader.read("!B")[0]
+        _version, _type, _length = reader.read_struct(_struct_BBH)
         assert(_version == 5)
-        _type = reader.read("!B")[0]
         assert(_type == 4)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        _experimenter = reader.read("!L")[0]
+        obj.xid, _experimenter, _subtype, obj.loglevel = reader.read_struct(_struct_LLLB)
         assert(_experimenter == 6035143)
-        _subtype = reader.read("!L")[0]
         assert(_subtype == 63)
-        obj.loglevel = reader.read("!B")[0]
-        obj.data = str(reader.read_all())
+        obj.data = reader.read_all()
         return obj
 
     def __eq__(self, other):
@@ -5947,6 +5444,7 @@ class bsn_log(bsn_header):
 bsn_header.subtypes[63] = bsn_log
 
 class bsn_lua_command_reply(bsn_header):
+    __slots__ = []
     version = 5
     type = 4
     experimenter = 6035143
@@ -5963,35 +5461,29 @@ class bsn_lua_command_reply(bsn_header):
             self.data = ''
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!L", self.experimenter))
-        packed.append(struct.pack("!L", self.subtype))
-        packed.append(self.data)
-        length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_BBHLLL, buf, offset, self.version, self.type, 0, self.xid, self.experimenter, self.subtype)
+        offset = loxi.generic_util.pack_bytes_into(self.data, buf, offset)
+        length = offset - start
+        _struct_H.pack_into(buf, start + 2, length)
+        return offset
+
+    def wire_length(self):
+        return 16 + len(self.data)
 
     @staticmethod
     def unpack(reader):
         obj = bsn_lua_command_reply()
-        _version = reader.read("!B")[0]
+        _version, _type, _length = reader.read_struct(_struct_BBH)
         assert(_version == 5)
-        _type = reader.read("!B")[0]
         assert(_type == 4)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        _experimenter = reader.read("!L")[0]
+        obj.xid, _experimenter, _subtype = reader.read_struct(_struct_LLL)
         assert(_experimenter == 6035143)
-        _subtype = reader.read("!L")[0]
         assert(_subtype == 66)
-        obj.data = str(reader.read_all())
+        obj.data = reader.read_all()
         return obj
 
     def __eq__(self, other):
@@ -6019,6 +5511,7 @@ class bsn_lua_command_reply(bsn_header):
 bsn_header.subtypes[66] = bsn_lua_command_reply
 
 class bsn_lua_command_request(bsn_header):
+    __slots__ = []
     version = 5
     type = 4
     experimenter = 6035143
@@ -6035,35 +5528,29 @@ class bsn_lua_command_request(bsn_header):
             self.data = ''
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!L", self.experimenter))
-        packed.append(struct.pack("!L", self.subtype))
-        packed.append(self.data)
-        length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_BBHLLL, buf, offset, self.version, self.type, 0, self.xid, self.experimenter, self.subtype)
+        offset = loxi.generic_util.pack_bytes_into(self.data, buf, offset)
+        length = offset - start
+        _struct_H.pack_into(buf, start + 2, length)
+        return offset
+
+    def wire_length(self):
+        return 16 + len(self.data)
 
     @staticmethod
     def unpack(reader):
         obj = bsn_lua_command_request()
-        _version = reader.read("!B")[0]
+        _version, _type, _length = reader.read_struct(_struct_BBH)
         assert(_version == 5)
-        _type = reader.read("!B")[0]
         assert(_type == 4)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        _experimenter = reader.read("!L")[0]
+        obj.xid, _experimenter, _subtype = reader.read_struct(_struct_LLL)
         assert(_experimenter == 6035143)
-        _subtype = reader.read("!L")[0]
         assert(_subtype == 65)
-        obj.data = str(reader.read_all())
+        obj.data = reader.read_all()
         return obj
 
     def __eq__(self, other):
@@ -6091,6 +5578,7 @@ class bsn_lua_command_request(bsn_header):
 bsn_header.subtypes[65] = bsn_lua_command_request
 
 class bsn_lua_notification(bsn_header):
+    __slots__ = []
     version = 5
     type = 4
     experimenter = 6035143
@@ -6107,35 +5595,29 @@ class bsn_lua_notification(bsn_header):
             self.data = ''
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!L", self.experimenter))
-        packed.append(struct.pack("!L", self.subtype))
-        packed.append(self.data)
-        length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_BBHLLL, buf, offset, self.version, self.type, 0, self.xid, self.experimenter, self.subtype)
+        offset = loxi.generic_util.pack_bytes_into(self.data, buf, offset)
+        length = offset - start
+        _struct_H.pack_into(buf, start + 2, length)
+        return offset
+
+    def wire_length(self):
+        return 16 + len(self.data)
 
     @staticmethod
     def unpack(reader):
         obj = bsn_lua_notification()
-        _version = reader.read("!B")[0]
+        _version, _type, _length = reader.read_struct(_struct_BBH)
         assert(_version == 5)
-        _type = reader.read("!B")[0]
         assert(_type == 4)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        _experimenter = reader.read("!L")[0]
+        obj.xid, _experimenter, _subtype = reader.read_struct(_struct_LLL)
         assert(_experimenter == 6035143)
-        _subtype = reader.read("!L")[0]
         assert(_subtype == 67)
-        obj.data = str(reader.read_all())
+        obj.data = reader.read_all()
         return obj
 
     def __eq__(self, other):
@@ -6163,6 +5645,7 @@ class bsn_lua_notification(bsn_header):
 bsn_header.subtypes[67] = bsn_lua_notification
 
 class bsn_lua_upload(bsn_header):
+    __slots__ = ["filename", "flags"]
     version = 5
     type = 4
     experimenter = 6035143
@@ -6187,39 +5670,30 @@ class bsn_lua_upload(bsn_header):
             self.data = ''
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!L", self.experimenter))
-        packed.append(struct.pack("!L", self.subtype))
-        packed.append(struct.pack("!H", self.flags))
-        packed.append(struct.pack("!64s", self.filename))
-        packed.append(self.data)
-        length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_BBHLLLH64s, buf, offset, self.version, self.type, 0, self.xid, self.experimenter, self.subtype, self.flags, self.filename)
+        offset = loxi.generic_util.pack_bytes_into(self.data, buf, offset)
+        length = offset - start
+        _struct_H.pack_into(buf, start + 2, length)
+        return offset
+
+    def wire_length(self):
+        return 82 + len(self.data)
 
     @staticmethod
     def unpack(reader):
         obj = bsn_lua_upload()
-        _version = reader.read("!B")[0]
+        _version, _type, _length = reader.read_struct(_struct_BBH)
         assert(_version == 5)
-        _type = reader.read("!B")[0]
         assert(_type == 4)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        _experimenter = reader.read("!L")[0]
+        obj.xid, _experimenter, _subtype, obj.flags, obj.filename = reader.read_struct(_struct_LLLH64s)
         assert(_experimenter == 6035143)
-        _subtype = reader.read("!L")[0]
         assert(_subtype == 64)
-        obj.flags = reader.read("!H")[0]
-        obj.filename = reader.read("!64s")[0].rstrip("\x00")
-        obj.data = str(reader.read_all())
+        obj.filename = obj.filename.rstrip("\x00")
+        obj.data = reader.read_all()
         return obj
 
     def __eq__(self, other):
@@ -6255,6 +5729,7 @@ class bsn_lua_upload(bsn_header):
 bsn_header.subtypes[64] = bsn_lua_upload
 
 class bsn_pdu_rx_reply(bsn_header):
+    __slots__ = ["port_no", "slot_num", "status"]
     version = 5
     type = 4
     experimenter = 6035143
@@ -6279,39 +5754,27 @@ class bsn_pdu_rx_reply(bsn_header):
             self.slot_num = 0
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!L", self.experimenter))
-        packed.append(struct.pack("!L", self.subtype))
-        packed.append(struct.pack("!L", self.status))
-        packed.append(util.pack_port_no(self.port_no))
-        packed.append(struct.pack("!B", self.slot_num))
-        length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_BBHLLLLLB, buf, offset, self.version, self.type, 0, self.xid, self.experimenter, self.subtype, self.status, self.port_no, self.slot_num)
+        length = offset - start
+        _struct_H.pack_into(buf, start + 2, length)
+        return offset
+
+    def wire_length(self):
+        return 25
 
     @staticmethod
     def unpack(reader):
         obj = bsn_pdu_rx_reply()
-        _version = reader.read("!B")[0]
+        _version, _type, _length = reader.read_struct(_struct_BBH)
         assert(_version == 5)
-        _type = reader.read("!B")[0]
         assert(_type == 4)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        _experimenter = reader.read("!L")[0]
+        obj.xid, _experimenter, _subtype, obj.status, obj.port_no, obj.slot_num = reader.read_struct(_struct_LLLLLB)
         assert(_experimenter == 6035143)
-        _subtype = reader.read("!L")[0]
         assert(_subtype == 34)
-        obj.status = reader.read("!L")[0]
-        obj.port_no = util.unpack_port_no(reader)
-        obj.slot_num = reader.read("!B")[0]
         return obj
 
     def __eq__(self, other):
@@ -6347,6 +5810,7 @@ class bsn_pdu_rx_reply(bsn_header):
 bsn_header.subtypes[34] = bsn_pdu_rx_reply
 
 class bsn_pdu_rx_request(bsn_header):
+    __slots__ = ["port_no", "slot_num", "timeout_ms"]
     version = 5
     type = 4
     experimenter = 6035143
@@ -6375,43 +5839,29 @@ class bsn_pdu_rx_request(bsn_header):
             self.data = ''
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!L", self.experimenter))
-        packed.append(struct.pack("!L", self.subtype))
-        packed.append(struct.pack("!L", self.timeout_ms))
-        packed.append(util.pack_port_no(self.port_no))
-        packed.append(struct.pack("!B", self.slot_num))
-        packed.append('\x00' * 3)
-        packed.append(self.data)
-        length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_BBHLLLLLB3x, buf, offset, self.version, self.type, 0, self.xid, self.experimenter, self.subtype, self.timeout_ms, self.port_no, self.slot_num)
+        offset = loxi.generic_util.pack_bytes_into(self.data, buf, offset)
+        length = offset - start
+        _struct_H.pack_into(buf, start + 2, length)
+        return offset
+
+    def wire_length(self):
+        return 28 + len(self.data)
 
     @staticmethod
     def unpack(reader):
         obj = bsn_pdu_rx_request()
-        _version = reader.read("!B")[0]
+        _version, _type, _length = reader.read_struct(_struct_BBH)
         assert(_version == 5)
-        _type = reader.read("!B")[0]
         assert(_type == 4)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        _experimenter = reader.read("!L")[0]
+        obj.xid, _experimenter, _subtype, obj.timeout_ms, obj.port_no, obj.slot_num = reader.read_struct(_struct_LLLLLB3x)
         assert(_experimenter == 6035143)
-        _subtype = reader.read("!L")[0]
         assert(_subtype == 33)
-        obj.timeout_ms = reader.read("!L")[0]
-        obj.port_no = util.unpack_port_no(reader)
-        obj.slot_num = reader.read("!B")[0]
-        reader.skip(3)
-        obj.data = str(reader.read_all())
+        obj.data = reader.read_all()
         return obj
 
     def __eq__(self, other):
@@ -6451,6 +5901,7 @@ class bsn_pdu_rx_request(bsn_header):
 bsn_header.subtypes[33] = bsn_pdu_rx_request
 
 class bsn_pdu_rx_timeout(bsn_header):
+    __slots__ = ["port_no", "slot_num"]
     version = 5
     type = 4
     experimenter = 6035143
@@ -6471,37 +5922,27 @@ class bsn_pdu_rx_timeout(bsn_header):
             self.slot_num = 0
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!L", self.experimenter))
-        packed.append(struct.pack("!L", self.subtype))
-        packed.append(util.pack_port_no(self.port_no))
-        packed.append(struct.pack("!B", self.slot_num))
-        length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_BBHLLLLB, buf, offset, self.version, self.type, 0, self.xid, self.experimenter, self.subtype, self.port_no, self.slot_num)
+        length = offset - start
+        _struct_H.pack_into(buf, start + 2, length)
+        return offset
+
+    def wire_length(self):
+        return 21
 
     @staticmethod
     def unpack(reader):
         obj = bsn_pdu_rx_timeout()
-        _version = reader.read("!B")[0]
+        _version, _type, _length = reader.read_struct(_struct_BBH)
         assert(_version == 5)
-        _type = reader.read("!B")[0]
         assert(_type == 4)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        _experimenter = reader.read("!L")[0]
+        obj.xid, _experimenter, _subtype, obj.port_no, obj.slot_num = reader.read_struct(_struct_LLLLB)
         assert(_experimenter == 6035143)
-        _subtype = reader.read("!L")[0]
         assert(_subtype == 35)
-        obj.port_no = util.unpack_port_no(reader)
-        obj.slot_num = reader.read("!B")[0]
         return obj
 
     def __eq__(self, other):
@@ -6533,6 +5974,7 @@ class bsn_pdu_rx_timeout(bsn_header):
 bsn_header.subtypes[35] = bsn_pdu_rx_timeout
 
 class bsn_pdu_tx_reply(bsn_header):
+    __slots__ = ["port_no", "slot_num", "status"]
     version = 5
     type = 4
     experimenter = 6035143
@@ -6557,39 +5999,27 @@ class bsn_pdu_tx_reply(bsn_header):
             self.slot_num = 0
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!L", self.experimenter))
-        packed.append(struct.pack("!L", self.subtype))
-        packed.append(struct.pack("!L", self.status))
-        packed.append(util.pack_port_no(self.port_no))
-        packed.append(struct.pack("!B", self.slot_num))
-        length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_BBHLLLLLB, buf, offset, self.version, self.type, 0, self.xid, self.experimenter, self.subtype, self.status, self.port_no, self.slot_num)
+        length = offset - start
+        _struct_H.pack_into(buf, start + 2, length)
+        return offset
+
+    def wire_length(self):
+        return 25
 
     @staticmethod
     def unpack(reader):
         obj = bsn_pdu_tx_reply()
-        _version = reader.read("!B")[0]
+        _version, _type, _length = reader.read_struct(_struct_BBH)
         assert(_version == 5)
-        _type = reader.read("!B")[0]
         assert(_type == 4)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        _experimenter = reader.read("!L")[0]
+        obj.xid, _experimenter, _subtype, obj.status, obj.port_no, obj.slot_num = reader.read_struct(_struct_LLLLLB)
         assert(_experimenter == 6035143)
-        _subtype = reader.read("!L")[0]
         assert(_subtype == 32)
-        obj.status = reader.read("!L")[0]
-        obj.port_no = util.unpack_port_no(reader)
-        obj.slot_num = reader.read("!B")[0]
         return obj
 
     def __eq__(self, other):
@@ -6625,6 +6055,7 @@ class bsn_pdu_tx_reply(bsn_header):
 bsn_header.subtypes[32] = bsn_pdu_tx_reply
 
 class bsn_pdu_tx_request(bsn_header):
+    __slots__ = ["port_no", "slot_num", "tx_interval_ms"]
     version = 5
     type = 4
     experimenter = 6035143
@@ -6653,43 +6084,29 @@ class bsn_pdu_tx_request(bsn_header):
             self.data = ''
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!L", self.experimenter))
-        packed.append(struct.pack("!L", self.subtype))
-        packed.append(struct.pack("!L", self.tx_interval_ms))
-        packed.append(util.pack_port_no(self.port_no))
-        packed.append(struct.pack("!B", self.slot_num))
-        packed.append('\x00' * 3)
-        packed.append(self.data)
-        length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_BBHLLLLLB3x, buf, offset, self.version, self.type, 0, self.xid, self.experimenter, self.subtype, self.tx_interval_ms, self.port_no, self.slot_num)
+        offset = loxi.generic_util.pack_bytes_into(self.data, buf, offset)
+        length = offset - start
+        _struct_H.pack_into(buf, start + 2, length)
+        return offset
+
+    def wire_length(self):
+        return 28 + len(self.data)
 
     @staticmethod
     def unpack(reader):
         obj = bsn_pdu_tx_request()
-        _version = reader.read("!B")[0]
+        _version, _type, _length = reader.read_struct(_struct_BBH)
         assert(_version == 5)
-        _type = reader.read("!B")[0]
         assert(_type == 4)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        _experimenter = reader.read("!L")[0]
+        obj.xid, _experimenter, _subtype, obj.tx_interval_ms, obj.port_no, obj.slot_num = reader.read_struct(_struct_LLLLLB3x)
         assert(_experimenter == 6035143)
-        _subtype = reader.read("!L")[0]
         assert(_subtype == 31)
-        obj.tx_interval_ms = reader.read("!L")[0]
-        obj.port_no = util.unpack_port_no(reader)
-        obj.slot_num = reader.read("!B")[0]
-        reader.skip(3)
-        obj.data = str(reader.read_all())
+        obj.data = reader.read_all()
         return obj
 
     def __eq__(self, other):
@@ -6729,6 +6146,7 @@ class bsn_pdu_tx_request(bsn_header):
 bsn_header.subtypes[31] = bsn_pdu_tx_request
 
 class bsn_port_counter_stats_reply(bsn_stats_reply):
+    __slots__ = ["entries"]
     version = 5
     type = 19
     stats_type = 65535
@@ -6750,40 +6168,28 @@ class bsn_port_counter_stats_reply(bsn_stats_reply):
             self.entries = []
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!H", self.stats_type))
-        packed.append(struct.pack("!H", self.flags))
-        packed.append('\x00' * 4)
-        packed.append(struct.pack("!L", self.experimenter))
-        packed.append(struct.pack("!L", self.subtype))
-        packed.append(loxi.generic_util.pack_list(self.entries))
-        length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_BBHLHH4xLL, buf, offset, self.version, self.type, 0, self.xid, self.stats_type, self.flags, self.experimenter, self.subtype)
+        offset = loxi.generic_util.pack_list_into(self.entries, buf, offset)
+        length = offset - start
+        _struct_H.pack_into(buf, start + 2, length)
+        return offset
+
+    def wire_length(self):
+        return 24 + loxi.generic_util.list_wire_length(self.entries)
 
     @staticmethod
     def unpack(reader):
         obj = bsn_port_counter_stats_reply()
-        _version = reader.read("!B")[0]
+        _version, _type, _length = reader.read_struct(_struct_BBH)
         assert(_version == 5)
-        _type = reader.read("!B")[0]
         assert(_type == 19)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        _stats_type = reader.read("!H")[0]
+        obj.xid, _stats_type, obj.flags, _experimenter, _subtype = reader.read_struct(_struct_LHH4xLL)
         assert(_stats_type == 65535)
-        obj.flags = reader.read("!H")[0]
-        reader.skip(4)
-        _experimenter = reader.read("!L")[0]
         assert(_experimenter == 6035143)
-        _subtype = reader.read("!L")[0]
         assert(_subtype == 8)
         obj.entries = loxi.generic_util.unpack_list(reader, ofp.common.bsn_port_counter_stats_entry.unpack)
         return obj
@@ -6817,6 +6223,7 @@ class bsn_port_counter_stats_reply(bsn_stats_reply):
 bsn_stats_reply.subtypes[8] = bsn_port_counter_stats_reply
 
 class bsn_port_counter_stats_request(bsn_stats_request):
+    __slots__ = ["port_no"]
     version = 5
     type = 18
     stats_type = 65535
@@ -6838,42 +6245,28 @@ class bsn_port_counter_stats_request(bsn_stats_request):
             self.port_no = 0
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!H", self.stats_type))
-        packed.append(struct.pack("!H", self.flags))
-        packed.append('\x00' * 4)
-        packed.append(struct.pack("!L", self.experimenter))
-        packed.append(struct.pack("!L", self.subtype))
-        packed.append(util.pack_port_no(self.port_no))
-        length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_BBHLHH4xLLL, buf, offset, self.version, self.type, 0, self.xid, self.stats_type, self.flags, self.experimenter, self.subtype, self.port_no)
+        length = offset - start
+        _struct_H.pack_into(buf, start + 2, length)
+        return offset
+
+    def wire_length(self):
+        return 28
 
     @staticmethod
     def unpack(reader):
         obj = bsn_port_counter_stats_request()
-        _version = reader.read("!B")[0]
+        _version, _type, _length = reader.read_struct(_struct_BBH)
         assert(_version == 5)
-        _type = reader.read("!B")[0]
         assert(_type == 18)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        _stats_type = reader.read("!H")[0]
+        obj.xid, _stats_type, obj.flags, _experimenter, _subtype, obj.port_no = reader.read_struct(_struct_LHH4xLLL)
         assert(_stats_type == 65535)
-        obj.flags = reader.read("!H")[0]
-        reader.skip(4)
-        _experimenter = reader.read("!L")[0]
         assert(_experimenter == 6035143)
-        _subtype = reader.read("!L")[0]
         assert(_subtype == 8)
-        obj.port_no = util.unpack_port_no(reader)
         return obj
 
     def __eq__(self, other):
@@ -6905,6 +6298,7 @@ class bsn_port_counter_stats_request(bsn_stats_request):
 bsn_stats_request.subtypes[8] = bsn_port_counter_stats_request
 
 class bsn_set_aux_cxns_reply(bsn_header):
+    __slots__ = ["num_aux", "status"]
     version = 5
     type = 4
     experimenter = 6035143
@@ -6925,37 +6319,27 @@ class bsn_set_aux_cxns_reply(bsn_header):
             self.status = 0
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!L", self.experimenter))
-        packed.append(struct.pack("!L", self.subtype))
-        packed.append(struct.pack("!L", self.num_aux))
-        packed.append(struct.pack("!L", self.status))
-        length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_BBHLLLLL, buf, offset, self.version, self.type, 0, self.xid, self.experimenter, self.subtype, self.num_aux, self.status)
+        length = offset - start
+        _struct_H.pack_into(buf, start + 2, length)
+        return offset
+
+    def wire_length(self):
+        return 24
 
     @staticmethod
     def unpack(reader):
         obj = bsn_set_aux_cxns_reply()
-        _version = reader.read("!B")[0]
+        _version, _type, _length = reader.read_struct(_struct_BBH)
         assert(_version == 5)
-        _type = reader.read("!B")[0]
         assert(_type == 4)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        _experimenter = reader.read("!L")[0]
+        obj.xid, _experimenter, _subtype, obj.num_aux, obj.status = reader.read_struct(_struct_LLLLL)
         assert(_experimenter == 6035143)
-        _subtype = reader.read("!L")[0]
         assert(_subtype == 59)
-        obj.num_aux = reader.read("!L")[0]
-        obj.status = reader.read("!L")[0]
         return obj
 
     def __eq__(self, other):
@@ -6987,6 +6371,7 @@ class bsn_set_aux_cxns_reply(bsn_header):
 bsn_header.subtypes[59] = bsn_set_aux_cxns_reply
 
 class bsn_set_aux_cxns_request(bsn_header):
+    __slots__ = ["num_aux"]
     version = 5
     type = 4
     experimenter = 6035143
@@ -7003,35 +6388,27 @@ class bsn_set_aux_cxns_request(bsn_header):
             self.num_aux = 0
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!L", self.experimenter))
-        packed.append(struct.pack("!L", self.subtype))
-        packed.append(struct.pack("!L", self.num_aux))
-        length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_BBHLLLL, buf, offset, self.version, self.type, 0, self.xid, self.experimenter, self.subtype, self.num_aux)
+        length = offset - start
+        _struct_H.pack_into(buf, start + 2, length)
+        return offset
+
+    def wire_length(self):
+        return 20
 
     @staticmethod
     def unpack(reader):
         obj = bsn_set_aux_cxns_request()
-        _version = reader.read("!B")[0]
+        _version, _type, _length = reader.read_struct(_struct_BBH)
         assert(_version == 5)
-        _type = reader.read("!B")[0]
         assert(_type == 4)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        _experimenter = reader.read("!L")[0]
+        obj.xid, _experimenter, _subtype, obj.num_aux = reader.read_struct(_struct_LLLL)
         assert(_experimenter == 6035143)
-        _subtype = reader.read("!L")[0]
         assert(_subtype == 58)
-        obj.num_aux = reader.read("!L")[0]
         return obj
 
     def __eq__(self, other):
@@ -7059,6 +6436,7 @@ class bsn_set_aux_cxns_request(bsn_header):
 bsn_header.subtypes[58] = bsn_set_aux_cxns_request
 
 class bsn_set_lacp_reply(bsn_header):
+    __slots__ = ["port_no", "status"]
     version = 5
     type = 4
     experimenter = 6035143
@@ -7079,37 +6457,27 @@ class bsn_set_lacp_reply(bsn_header):
             self.port_no = 0
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!L", self.experimenter))
-        packed.append(struct.pack("!L", self.subtype))
-        packed.append(struct.pack("!L", self.status))
-        packed.append(util.pack_port_no(self.port_no))
-        length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_BBHLLLLL, buf, offset, self.version, self.type, 0, self.xid, self.experimenter, self.subtype, self.status, self.port_no)
+        length = offset - start
+        _struct_H.pack_into(buf, start + 2, length)
+        return offset
+
+    def wire_length(self):
+        return 24
 
     @staticmethod
     def unpack(reader):
         obj = bsn_set_lacp_reply()
-        _version = reader.read("!B")[0]
+        _version, _type, _length = reader.read_struct(_struct_BBH)
         assert(_version == 5)
-        _type = reader.read("!B")[0]
         assert(_type == 4)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        _experimenter = reader.read("!L")[0]
+        obj.xid, _experimenter, _subtype, obj.status, obj.port_no = reader.read_struct(_struct_LLLLL)
         assert(_experimenter == 6035143)
-        _subtype = reader.read("!L")[0]
         assert(_subtype == 42)
-        obj.status = reader.read("!L")[0]
-        obj.port_no = util.unpack_port_no(reader)
         return obj
 
     def __eq__(self, other):
@@ -7141,6 +6509,7 @@ class bsn_set_lacp_reply(bsn_header):
 bsn_header.subtypes[42] = bsn_set_lacp_reply
 
 class bsn_set_lacp_request(bsn_header):
+    __slots__ = ["actor_key", "actor_port_num", "actor_port_priority", "actor_sys_mac", "actor_sys_priority", "enabled", "port_no"]
     version = 5
     type = 4
     experimenter = 6035143
@@ -7181,49 +6550,31 @@ class bsn_set_lacp_request(bsn_header):
             self.actor_key = 0
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!L", self.experimenter))
-        packed.append(struct.pack("!L", self.subtype))
-        packed.append(struct.pack("!B", self.enabled))
-        packed.append('\x00' * 3)
-        packed.append(util.pack_port_no(self.port_no))
-        packed.append(struct.pack("!H", self.actor_sys_priority))
-        packed.append(struct.pack("!6B", *self.actor_sys_mac))
-        packed.append(struct.pack("!H", self.actor_port_priority))
-        packed.append(struct.pack("!H", self.actor_port_num))
-        packed.append(struct.pack("!H", self.actor_key))
-        length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_BBHLLLB3xLH, buf, offset, self.version, self.type, 0, self.xid, self.experimenter, self.subtype, self.enabled, self.port_no, self.actor_sys_priority)
+        offset = loxi.generic_util.pack_struct_into(_struct_6B, buf, offset, *self.actor_sys_mac)
+        offset = loxi.generic_util.pack_struct_into(_struct_HHH, buf, offset, self.actor_port_priority, self.actor_port_num, self.actor_key)
+        length = offset - start
+        _struct_H.pack_into(buf, start + 2, length)
+        return offset
+
+    def wire_length(self):
+        return 38
 
     @staticmethod
     def unpack(reader):
         obj = bsn_set_lacp_request()
-        _version = reader.read("!B")[0]
+        _version, _type, _length = reader.read_struct(_struct_BBH)
         assert(_version == 5)
-        _type = reader.read("!B")[0]
         assert(_type == 4)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        _experimenter = reader.read("!L")[0]
+        obj.xid, _experimenter, _subtype, obj.enabled, obj.port_no, obj.actor_sys_priority = reader.read_struct(_struct_LLLB3xLH)
         assert(_experimenter == 6035143)
-        _subtype = reader.read("!L")[0]
         assert(_subtype == 41)
-        obj.enabled = reader.read("!B")[0]
-        reader.skip(3)
-        obj.port_no = util.unpack_port_no(reader)
-        obj.actor_sys_priority = reader.read("!H")[0]
         obj.actor_sys_mac = list(reader.read('!6B'))
-        obj.actor_port_priority = reader.read("!H")[0]
-        obj.actor_port_num = reader.read("!H")[0]
-        obj.actor_key = reader.read("!H")[0]
+        obj.actor_port_priority, obj.actor_port_num, obj.actor_key = reader.read_struct(_struct_HHH)
         return obj
 
     def __eq__(self, other):
@@ -7275,6 +6626,7 @@ class bsn_set_lacp_request(bsn_header):
 bsn_header.subtypes[41] = bsn_set_lacp_request
 
 class bsn_set_mirroring(bsn_header):
+    __slots__ = ["report_mirror_ports"]
     version = 5
     type = 4
     experimenter = 6035143
@@ -7291,37 +6643,27 @@ class bsn_set_mirroring(bsn_header):
             self.report_mirror_ports = 0
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!L", self.experimenter))
-        packed.append(struct.pack("!L", self.subtype))
-        packed.append(struct.pack("!B", self.report_mirror_ports))
-        packed.append('\x00' * 3)
-        length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_BBHLLLB3x, buf, offset, self.version, self.type, 0, self.xid, self.experimenter, self.subtype, self.report_mirror_ports)
+        length = offset - start
+        _struct_H.pack_into(buf, start + 2, length)
+        return offset
+
+    def wire_length(self):
+        return 20
 
     @staticmethod
     def unpack(reader):
         obj = bsn_set_mirroring()
-        _version = reader.read("!B")[0]
+        _version, _type, _length = reader.read_struct(_struct_BBH)
         assert(_version == 5)
-        _type = reader.read("!B")[0]
         assert(_type == 4)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        _experimenter = reader.read("!L")[0]
+        obj.xid, _experimenter, _subtype, obj.report_mirror_ports = reader.read_struct(_struct_LLLB3x)
         assert(_experimenter == 6035143)
-        _subtype = reader.read("!L")[0]
         assert(_subtype == 3)
-        obj.report_mirror_ports = reader.read("!B")[0]
-        reader.skip(3)
         return obj
 
     def __eq__(self, other):
@@ -7349,6 +6691,7 @@ class bsn_set_mirroring(bsn_header):
 bsn_header.subtypes[3] = bsn_set_mirroring
 
 class bsn_set_pktin_suppression_reply(bsn_header):
+    __slots__ = ["status"]
     version = 5
     type = 4
     experimenter = 6035143
@@ -7365,35 +6708,27 @@ class bsn_set_pktin_suppression_reply(bsn_header):
             self.status = 0
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!L", self.experimenter))
-        packed.append(struct.pack("!L", self.subtype))
-        packed.append(struct.pack("!L", self.status))
-        length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_BBHLLLL, buf, offset, self.version, self.type, 0, self.xid, self.experimenter, self.subtype, self.status)
+        length = offset - start
+        _struct_H.pack_into(buf, start + 2, length)
+        return offset
+
+    def wire_length(self):
+        return 20
 
     @staticmethod
     def unpack(reader):
         obj = bsn_set_pktin_suppression_reply()
-        _version = reader.read("!B")[0]
+        _version, _type, _length = reader.read_struct(_struct_BBH)
         assert(_version == 5)
-        _type = reader.read("!B")[0]
         assert(_type == 4)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        _experimenter = reader.read("!L")[0]
+        obj.xid, _experimenter, _subtype, obj.status = reader.read_struct(_struct_LLLL)
         assert(_experimenter == 6035143)
-        _subtype = reader.read("!L")[0]
         assert(_subtype == 25)
-        obj.status = reader.read("!L")[0]
         return obj
 
     def __eq__(self, other):
@@ -7421,6 +6756,7 @@ class bsn_set_pktin_suppression_reply(bsn_header):
 bsn_header.subtypes[25] = bsn_set_pktin_suppression_reply
 
 class bsn_set_pktin_suppression_request(bsn_header):
+    __slots__ = ["cookie", "enabled", "hard_timeout", "idle_timeout", "priority"]
     version = 5
     type = 4
     experimenter = 6035143
@@ -7453,45 +6789,27 @@ class bsn_set_pktin_suppression_request(bsn_header):
             self.cookie = 0
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!L", self.experimenter))
-        packed.append(struct.pack("!L", self.subtype))
-        packed.append(struct.pack("!B", self.enabled))
-        packed.append('\x00' * 1)
-        packed.append(struct.pack("!H", self.idle_timeout))
-        packed.append(struct.pack("!H", self.hard_timeout))
-        packed.append(struct.pack("!H", self.priority))
-        packed.append(struct.pack("!Q", self.cookie))
-        length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_BBHLLLBxHHHQ, buf, offset, self.version, self.type, 0, self.xid, self.experimenter, self.subtype, self.enabled, self.idle_timeout, self.hard_timeout, self.priority, self.cookie)
+        length = offset - start
+        _struct_H.pack_into(buf, start + 2, length)
+        return offset
+
+    def wire_length(self):
+        return 32
 
     @staticmethod
     def unpack(reader):
         obj = bsn_set_pktin_suppression_request()
-        _version = reader.read("!B")[0]
+        _version, _type, _length = reader.read_struct(_struct_BBH)
         assert(_version == 5)
-        _type = reader.read("!B")[0]
         assert(_type == 4)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        _experimenter = reader.read("!L")[0]
+        obj.xid, _experimenter, _subtype, obj.enabled, obj.idle_timeout, obj.hard_timeout, obj.priority, obj.cookie = reader.read_struct(_struct_LLLBxHHHQ)
         assert(_experimenter == 6035143)
-        _subtype = reader.read("!L")[0]
         assert(_subtype == 11)
-        obj.enabled = reader.read("!B")[0]
-        reader.skip(1)
-        obj.idle_timeout = reader.read("!H")[0]
-        obj.hard_timeout = reader.read("!H")[0]
-        obj.priority = reader.read("!H")[0]
-        obj.cookie = reader.read("!Q")[0]
         return obj
 
     def __eq__(self, other):
@@ -7535,6 +6853,7 @@ class bsn_set_pktin_suppression_request(bsn_header):
 bsn_header.subtypes[11] = bsn_set_pktin_suppression_request
 
 class bsn_set_switch_pipeline_reply(bsn_header):
+    __slots__ = ["status"]
     version = 5
     type = 4
     experimenter = 6035143
@@ -7551,35 +6870,27 @@ class bsn_set_switch_pipeline_reply(bsn_header):
             self.status = 0
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!L", self.experimenter))
-        packed.append(struct.pack("!L", self.subtype))
-        packed.append(struct.pack("!L", self.status))
-        length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_BBHLLLL, buf, offset, self.version, self.type, 0, self.xid, self.experimenter, self.subtype, self.status)
+        length = offset - start
+        _struct_H.pack_into(buf, start + 2, length)
+        return offset
+
+    def wire_length(self):
+        return 20
 
     @staticmethod
     def unpack(reader):
         obj = bsn_set_switch_pipeline_reply()
-        _version = reader.read("!B")[0]
+        _version, _type, _length = reader.read_struct(_struct_BBH)
         assert(_version == 5)
-        _type = reader.read("!B")[0]
         assert(_type == 4)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        _experimenter = reader.read("!L")[0]
+        obj.xid, _experimenter, _subtype, obj.status = reader.read_struct(_struct_LLLL)
         assert(_experimenter == 6035143)
-        _subtype = reader.read("!L")[0]
         assert(_subtype == 54)
-        obj.status = reader.read("!L")[0]
         return obj
 
     def __eq__(self, other):
@@ -7607,6 +6918,7 @@ class bsn_set_switch_pipeline_reply(bsn_header):
 bsn_header.subtypes[54] = bsn_set_switch_pipeline_reply
 
 class bsn_set_switch_pipeline_request(bsn_header):
+    __slots__ = ["pipeline"]
     version = 5
     type = 4
     experimenter = 6035143
@@ -7623,35 +6935,28 @@ class bsn_set_switch_pipeline_request(bsn_header):
             self.pipeline = ""
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!L", self.experimenter))
-        packed.append(struct.pack("!L", self.subtype))
-        packed.append(struct.pack("!256s", self.pipeline))
-        length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_BBHLLL256s, buf, offset, self.version, self.type, 0, self.xid, self.experimenter, self.subtype, self.pipeline)
+        length = offset - start
+        _struct_H.pack_into(buf, start + 2, length)
+        return offset
+
+    def wire_length(self):
+        return 272
 
     @staticmethod
     def unpack(reader):
         obj = bsn_set_switch_pipeline_request()
-        _version = reader.read("!B")[0]
+        _version, _type, _length = reader.read_struct(_struct_BBH)
         assert(_version == 5)
-        _type = reader.read("!B")[0]
         assert(_type == 4)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        _experimenter = reader.read("!L")[0]
+        obj.xid, _experimenter, _subtype, obj.pipeline = reader.read_struct(_struct_LLL256s)
         assert(_experimenter == 6035143)
-        _subtype = reader.read("!L")[0]
         assert(_subtype == 53)
-        obj.pipeline = reader.read("!256s")[0].rstrip("\x00")
+        obj.pipeline = obj.pipeline.rstrip("\x00")
         return obj
 
     def __eq__(self, other):
@@ -7679,6 +6984,7 @@ class bsn_set_switch_pipeline_request(bsn_header):
 bsn_header.subtypes[53] = bsn_set_switch_pipeline_request
 
 class bsn_switch_pipeline_stats_reply(bsn_stats_reply):
+    __slots__ = ["entries"]
     version = 5
     type = 19
     stats_type = 65535
@@ -7700,40 +7006,28 @@ class bsn_switch_pipeline_stats_reply(bsn_stats_reply):
             self.entries = []
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!H", self.stats_type))
-        packed.append(struct.pack("!H", self.flags))
-        packed.append('\x00' * 4)
-        packed.append(struct.pack("!L", self.experimenter))
-        packed.append(struct.pack("!L", self.subtype))
-        packed.append(loxi.generic_util.pack_list(self.entries))
-        length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_BBHLHH4xLL, buf, offset, self.version, self.type, 0, self.xid, self.stats_type, self.flags, self.experimenter, self.subtype)
+        offset = loxi.generic_util.pack_list_into(self.entries, buf, offset)
+        length = offset - start
+        _struct_H.pack_into(buf, start + 2, length)
+        return offset
+
+    def wire_length(self):
+        return 24 + loxi.generic_util.list_wire_length(self.entries)
 
     @staticmethod
     def unpack(reader):
         obj = bsn_switch_pipeline_stats_reply()
-        _version = reader.read("!B")[0]
+        _version, _type, _length = reader.read_struct(_struct_BBH)
         assert(_version == 5)
-        _type = reader.read("!B")[0]
         assert(_type == 19)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        _stats_type = reader.read("!H")[0]
+        obj.xid, _stats_type, obj.flags, _experimenter, _subtype = reader.read_struct(_struct_LHH4xLL)
         assert(_stats_type == 65535)
-        obj.flags = reader.read("!H")[0]
-        reader.skip(4)
-        _experimenter = reader.read("!L")[0]
         assert(_experimenter == 6035143)
-        _subtype = reader.read("!L")[0]
         assert(_subtype == 6)
         obj.entries = loxi.generic_util.unpack_list(reader, ofp.common.bsn_switch_pipeline_stats_entry.unpack)
         return obj
@@ -7767,6 +7061,7 @@ class bsn_switch_pipeline_stats_reply(bsn_stats_reply):
 bsn_stats_reply.subtypes[6] = bsn_switch_pipeline_stats_reply
 
 class bsn_switch_pipeline_stats_request(bsn_stats_request):
+    __slots__ = []
     version = 5
     type = 18
     stats_type = 65535
@@ -7784,39 +7079,27 @@ class bsn_switch_pipeline_stats_request(bsn_stats_request):
             self.flags = 0
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!H", self.stats_type))
-        packed.append(struct.pack("!H", self.flags))
-        packed.append('\x00' * 4)
-        packed.append(struct.pack("!L", self.experimenter))
-        packed.append(struct.pack("!L", self.subtype))
-        length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_BBHLHH4xLL, buf, offset, self.version, self.type, 0, self.xid, self.stats_type, self.flags, self.experimenter, self.subtype)
+        length = offset - start
+        _struct_H.pack_into(buf, start + 2, length)
+        return offset
+
+    def wire_length(self):
+        return 24
 
     @staticmethod
     def unpack(reader):
         obj = bsn_switch_pipeline_stats_request()
-        _version = reader.read("!B")[0]
+        _version, _type, _length = reader.read_struct(_struct_BBH)
         assert(_version == 5)
-        _type = reader.read("!B")[0]
         assert(_type == 18)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        _stats_type = reader.read("!H")[0]
+        obj.xid, _stats_type, obj.flags, _experimenter, _subtype = reader.read_struct(_struct_LHH4xLL)
         assert(_stats_type == 65535)
-        obj.flags = reader.read("!H")[0]
-        reader.skip(4)
-        _experimenter = reader.read("!L")[0]
         assert(_experimenter == 6035143)
-        _subtype = reader.read("!L")[0]
         assert(_subtype == 6)
         return obj
 
@@ -7845,6 +7128,7 @@ class bsn_switch_pipeline_stats_request(bsn_stats_request):
 bsn_stats_request.subtypes[6] = bsn_switch_pipeline_stats_request
 
 class bsn_table_checksum_stats_reply(bsn_stats_reply):
+    __slots__ = ["entries"]
     version = 5
     type = 19
     stats_type = 65535
@@ -7866,40 +7150,28 @@ class bsn_table_checksum_stats_reply(bsn_stats_reply):
             self.entries = []
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!H", self.stats_type))
-        packed.append(struct.pack("!H", self.flags))
-        packed.append('\x00' * 4)
-        packed.append(struct.pack("!L", self.experimenter))
-        packed.append(struct.pack("!L", self.subtype))
-        packed.append(loxi.generic_util.pack_list(self.entries))
-        length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_BBHLHH4xLL, buf, offset, self.version, self.type, 0, self.xid, self.stats_type, self.flags, self.experimenter, self.subtype)
+        offset = loxi.generic_util.pack_list_into(self.entries, buf, offset)
+        length = offset - start
+        _struct_H.pack_into(buf, start + 2, length)
+        return offset
+
+    def wire_length(self):
+        return 24 + loxi.generic_util.list_wire_length(self.entries)
 
     @staticmethod
     def unpack(reader):
         obj = bsn_table_checksum_stats_reply()
-        _version = reader.read("!B")[0]
+        _version, _type, _length = reader.read_struct(_struct_BBH)
         assert(_version == 5)
-        _type = reader.read("!B")[0]
         assert(_type == 19)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        _stats_type = reader.read("!H")[0]
+        obj.xid, _stats_type, obj.flags, _experimenter, _subtype = reader.read_struct(_struct_LHH4xLL)
         assert(_stats_type == 65535)
-        obj.flags = reader.read("!H")[0]
-        reader.skip(4)
-        _experimenter = reader.read("!L")[0]
         assert(_experimenter == 6035143)
-        _subtype = reader.read("!L")[0]
         assert(_subtype == 11)
         obj.entries = loxi.generic_util.unpack_list(reader, ofp.common.bsn_table_checksum_stats_entry.unpack)
         return obj
@@ -7933,6 +7205,7 @@ class bsn_table_checksum_stats_reply(bsn_stats_reply):
 bsn_stats_reply.subtypes[11] = bsn_table_checksum_stats_reply
 
 class bsn_table_checksum_stats_request(bsn_stats_request):
+    __slots__ = []
     version = 5
     type = 18
     stats_type = 65535
@@ -7950,39 +7223,27 @@ class bsn_table_checksum_stats_request(bsn_stats_request):
             self.flags = 0
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!H", self.stats_type))
-        packed.append(struct.pack("!H", self.flags))
-        packed.append('\x00' * 4)
-        packed.append(struct.pack("!L", self.experimenter))
-        packed.append(struct.pack("!L", self.subtype))
-        length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_BBHLHH4xLL, buf, offset, self.version, self.type, 0, self.xid, self.stats_type, self.flags, self.experimenter, self.subtype)
+        length = offset - start
+        _struct_H.pack_into(buf, start + 2, length)
+        return offset
+
+    def wire_length(self):
+        return 24
 
     @staticmethod
     def unpack(reader):
         obj = bsn_table_checksum_stats_request()
-        _version = reader.read("!B")[0]
+        _version, _type, _length = reader.read_struct(_struct_BBH)
         assert(_version == 5)
-        _type = reader.read("!B")[0]
         assert(_type == 18)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        _stats_type = reader.read("!H")[0]
+        obj.xid, _stats_type, obj.flags, _experimenter, _subtype = reader.read_struct(_struct_LHH4xLL)
         assert(_stats_type == 65535)
-        obj.flags = reader.read("!H")[0]
-        reader.skip(4)
-        _experimenter = reader.read("!L")[0]
         assert(_experimenter == 6035143)
-        _subtype = reader.read("!L")[0]
         assert(_subtype == 11)
         return obj
 
@@ -8011,6 +7272,7 @@ class bsn_table_checksum_stats_request(bsn_stats_request):
 bsn_stats_request.subtypes[11] = bsn_table_checksum_stats_request
 
 class bsn_table_set_buckets_size(bsn_header):
+    __slots__ = ["buckets_size", "table_id"]
     version = 5
     type = 4
     experimenter = 6035143
@@ -8031,41 +7293,27 @@ class bsn_table_set_buckets_size(bsn_header):
             self.buckets_size = 0
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!L", self.experimenter))
-        packed.append(struct.pack("!L", self.subtype))
-        packed.append('\x00' * 1)
-        packed.append(struct.pack("!B", self.table_id))
-        packed.append('\x00' * 2)
-        packed.append(struct.pack("!L", self.buckets_size))
-        length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_BBHLLLxB2xL, buf, offset, self.version, self.type, 0, self.xid, self.experimenter, self.subtype, self.table_id, self.buckets_size)
+        length = offset - start
+        _struct_H.pack_into(buf, start + 2, length)
+        return offset
+
+    def wire_length(self):
+        return 24
 
     @staticmethod
     def unpack(reader):
         obj = bsn_table_set_buckets_size()
-        _version = reader.read("!B")[0]
+        _version, _type, _length = reader.read_struct(_struct_BBH)
         assert(_version == 5)
-        _type = reader.read("!B")[0]
         assert(_type == 4)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        _experimenter = reader.read("!L")[0]
+        obj.xid, _experimenter, _subtype, obj.table_id, obj.buckets_size = reader.read_struct(_struct_LLLxB2xL)
         assert(_experimenter == 6035143)
-        _subtype = reader.read("!L")[0]
         assert(_subtype == 61)
-        reader.skip(1)
-        obj.table_id = reader.read("!B")[0]
-        reader.skip(2)
-        obj.buckets_size = reader.read("!L")[0]
         return obj
 
     def __eq__(self, other):
@@ -8097,6 +7345,7 @@ class bsn_table_set_buckets_size(bsn_header):
 bsn_header.subtypes[61] = bsn_table_set_buckets_size
 
 class bsn_time_reply(bsn_header):
+    __slots__ = ["time_ms"]
     version = 5
     type = 4
     experimenter = 6035143
@@ -8113,35 +7362,27 @@ class bsn_time_reply(bsn_header):
             self.time_ms = 0
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!L", self.experimenter))
-        packed.append(struct.pack("!L", self.subtype))
-        packed.append(struct.pack("!Q", self.time_ms))
-        length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_BBHLLLQ, buf, offset, self.version, self.type, 0, self.xid, self.experimenter, self.subtype, self.time_ms)
+        length = offset - start
+        _struct_H.pack_into(buf, start + 2, length)
+        return offset
+
+    def wire_length(self):
+        return 24
 
     @staticmethod
     def unpack(reader):
         obj = bsn_time_reply()
-        _version = reader.read("!B")[0]
+        _version, _type, _length = reader.read_struct(_struct_BBH)
         assert(_version == 5)
-        _type = reader.read("!B")[0]
         assert(_type == 4)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        _experimenter = reader.read("!L")[0]
+        obj.xid, _experimenter, _subtype, obj.time_ms = reader.read_struct(_struct_LLLQ)
         assert(_experimenter == 6035143)
-        _subtype = reader.read("!L")[0]
         assert(_subtype == 45)
-        obj.time_ms = reader.read("!Q")[0]
         return obj
 
     def __eq__(self, other):
@@ -8169,6 +7410,7 @@ class bsn_time_reply(bsn_header):
 bsn_header.subtypes[45] = bsn_time_reply
 
 class bsn_time_request(bsn_header):
+    __slots__ = []
     version = 5
     type = 4
     experimenter = 6035143
@@ -8181,32 +7423,26 @@ class bsn_time_request(bsn_header):
             self.xid = None
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!L", self.experimenter))
-        packed.append(struct.pack("!L", self.subtype))
-        length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_BBHLLL, buf, offset, self.version, self.type, 0, self.xid, self.experimenter, self.subtype)
+        length = offset - start
+        _struct_H.pack_into(buf, start + 2, length)
+        return offset
+
+    def wire_length(self):
+        return 16
 
     @staticmethod
     def unpack(reader):
         obj = bsn_time_request()
-        _version = reader.read("!B")[0]
+        _version, _type, _length = reader.read_struct(_struct_BBH)
         assert(_version == 5)
-        _type = reader.read("!B")[0]
         assert(_type == 4)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        _experimenter = reader.read("!L")[0]
+        obj.xid, _experimenter, _subtype = reader.read_struct(_struct_LLL)
         assert(_experimenter == 6035143)
-        _subtype = reader.read("!L")[0]
         assert(_subtype == 44)
         return obj
 
@@ -8231,6 +7467,7 @@ class bsn_time_request(bsn_header):
 bsn_header.subtypes[44] = bsn_time_request
 
 class bsn_virtual_port_create_reply(bsn_header):
+    __slots__ = ["status", "vport_no"]
     version = 5
     type = 4
     experimenter = 6035143
@@ -8251,37 +7488,27 @@ class bsn_virtual_port_create_reply(bsn_header):
             self.vport_no = 0
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!L", self.experimenter))
-        packed.append(struct.pack("!L", self.subtype))
-        packed.append(struct.pack("!L", self.status))
-        packed.append(struct.pack("!L", self.vport_no))
-        length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_BBHLLLLL, buf, offset, self.version, self.type, 0, self.xid, self.experimenter, self.subtype, self.status, self.vport_no)
+        length = offset - start
+        _struct_H.pack_into(buf, start + 2, length)
+        return offset
+
+    def wire_length(self):
+        return 24
 
     @staticmethod
     def unpack(reader):
         obj = bsn_virtual_port_create_reply()
-        _version = reader.read("!B")[0]
+        _version, _type, _length = reader.read_struct(_struct_BBH)
         assert(_version == 5)
-        _type = reader.read("!B")[0]
         assert(_type == 4)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        _experimenter = reader.read("!L")[0]
+        obj.xid, _experimenter, _subtype, obj.status, obj.vport_no = reader.read_struct(_struct_LLLLL)
         assert(_experimenter == 6035143)
-        _subtype = reader.read("!L")[0]
         assert(_subtype == 16)
-        obj.status = reader.read("!L")[0]
-        obj.vport_no = reader.read("!L")[0]
         return obj
 
     def __eq__(self, other):
@@ -8313,6 +7540,7 @@ class bsn_virtual_port_create_reply(bsn_header):
 bsn_header.subtypes[16] = bsn_virtual_port_create_reply
 
 class bsn_virtual_port_create_request(bsn_header):
+    __slots__ = ["vport"]
     version = 5
     type = 4
     experimenter = 6035143
@@ -8329,33 +7557,27 @@ class bsn_virtual_port_create_request(bsn_header):
             self.vport = ofp.bsn_vport()
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!L", self.experimenter))
-        packed.append(struct.pack("!L", self.subtype))
-        packed.append(self.vport.pack())
-        length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_BBHLLL, buf, offset, self.version, self.type, 0, self.xid, self.experimenter, self.subtype)
+        offset = self.vport.pack_into(buf, offset)
+        length = offset - start
+        _struct_H.pack_into(buf, start + 2, length)
+        return offset
+
+    def wire_length(self):
+        return 16 + self.vport.wire_length()
 
     @staticmethod
     def unpack(reader):
         obj = bsn_virtual_port_create_request()
-        _version = reader.read("!B")[0]
+        _version, _type, _length = reader.read_struct(_struct_BBH)
         assert(_version == 5)
-        _type = reader.read("!B")[0]
         assert(_type == 4)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        _experimenter = reader.read("!L")[0]
+        obj.xid, _experimenter, _subtype = reader.read_struct(_struct_LLL)
         assert(_experimenter == 6035143)
-        _subtype = reader.read("!L")[0]
         assert(_subtype == 15)
         obj.vport = ofp.bsn_vport.unpack(reader)
         return obj
@@ -8385,6 +7607,7 @@ class bsn_virtual_port_create_request(bsn_header):
 bsn_header.subtypes[15] = bsn_virtual_port_create_request
 
 class bsn_virtual_port_remove_reply(bsn_header):
+    __slots__ = ["status"]
     version = 5
     type = 4
     experimenter = 6035143
@@ -8401,35 +7624,27 @@ class bsn_virtual_port_remove_reply(bsn_header):
             self.status = 0
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!L", self.experimenter))
-        packed.append(struct.pack("!L", self.subtype))
-        packed.append(struct.pack("!L", self.status))
-        length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_BBHLLLL, buf, offset, self.version, self.type, 0, self.xid, self.experimenter, self.subtype, self.status)
+        length = offset - start
+        _struct_H.pack_into(buf, start + 2, length)
+        return offset
+
+    def wire_length(self):
+        return 20
 
     @staticmethod
     def unpack(reader):
         obj = bsn_virtual_port_remove_reply()
-        _version = reader.read("!B")[0]
+        _version, _type, _length = reader.read_struct(_struct_BBH)
         assert(_version == 5)
-        _type = reader.read("!B")[0]
         assert(_type == 4)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        _experimenter = reader.read("!L")[0]
+        obj.xid, _experimenter, _subtype, obj.status = reader.read_struct(_struct_LLLL)
         assert(_experimenter == 6035143)
-        _subtype = reader.read("!L")[0]
         assert(_subtype == 26)
-        obj.status = reader.read("!L")[0]
         return obj
 
     def __eq__(self, other):
@@ -8457,6 +7672,7 @@ class bsn_virtual_port_remove_reply(bsn_header):
 bsn_header.subtypes[26] = bsn_virtual_port_remove_reply
 
 class bsn_virtual_port_remove_request(bsn_header):
+    __slots__ = ["vport_no"]
     version = 5
     type = 4
     experimenter = 6035143
@@ -8473,35 +7689,27 @@ class bsn_virtual_port_remove_request(bsn_header):
             self.vport_no = 0
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!L", self.experimenter))
-        packed.append(struct.pack("!L", self.subtype))
-        packed.append(struct.pack("!L", self.vport_no))
-        length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_BBHLLLL, buf, offset, self.version, self.type, 0, self.xid, self.experimenter, self.subtype, self.vport_no)
+        length = offset - start
+        _struct_H.pack_into(buf, start + 2, length)
+        return offset
+
+    def wire_length(self):
+        return 20
 
     @staticmethod
     def unpack(reader):
         obj = bsn_virtual_port_remove_request()
-        _version = reader.read("!B")[0]
+        _version, _type, _length = reader.read_struct(_struct_BBH)
         assert(_version == 5)
-        _type = reader.read("!B")[0]
         assert(_type == 4)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        _experimenter = reader.read("!L")[0]
+        obj.xid, _experimenter, _subtype, obj.vport_no = reader.read_struct(_struct_LLLL)
         assert(_experimenter == 6035143)
-        _subtype = reader.read("!L")[0]
         assert(_subtype == 17)
-        obj.vport_no = reader.read("!L")[0]
         return obj
 
     def __eq__(self, other):
@@ -8529,6 +7737,7 @@ class bsn_virtual_port_remove_request(bsn_header):
 bsn_header.subtypes[17] = bsn_virtual_port_remove_request
 
 class bsn_vlan_counter_stats_reply(bsn_stats_reply):
+    __slots__ = ["entries"]
     version = 5
     type = 19
     stats_type = 65535
@@ -8550,40 +7759,28 @@ class bsn_vlan_counter_stats_reply(bsn_stats_reply):
             self.entries = []
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!H", self.stats_type))
-        packed.append(struct.pack("!H", self.flags))
-        packed.append('\x00' * 4)
-        packed.append(struct.pack("!L", self.experimenter))
-        packed.append(struct.pack("!L", self.subtype))
-        packed.append(loxi.generic_util.pack_list(self.entries))
-        length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_BBHLHH4xLL, buf, offset, self.version, self.type, 0, self.xid, self.stats_type, self.flags, self.experimenter, self.subtype)
+        offset = loxi.generic_util.pack_list_into(self.entries, buf, offset)
+        length = offset - start
+        _struct_H.pack_into(buf, start + 2, length)
+        return offset
+
+    def wire_length(self):
+        return 24 + loxi.generic_util.list_wire_length(self.entries)
 
     @staticmethod
     def unpack(reader):
         obj = bsn_vlan_counter_stats_reply()
-        _version = reader.read("!B")[0]
+        _version, _type, _length = reader.read_struct(_struct_BBH)
         assert(_version == 5)
-        _type = reader.read("!B")[0]
         assert(_type == 19)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        _stats_type = reader.read("!H")[0]
+        obj.xid, _stats_type, obj.flags, _experimenter, _subtype = reader.read_struct(_struct_LHH4xLL)
         assert(_stats_type == 65535)
-        obj.flags = reader.read("!H")[0]
-        reader.skip(4)
-        _experimenter = reader.read("!L")[0]
         assert(_experimenter == 6035143)
-        _subtype = reader.read("!L")[0]
         assert(_subtype == 9)
         obj.entries = loxi.generic_util.unpack_list(reader, ofp.common.bsn_vlan_counter_stats_entry.unpack)
         return obj
@@ -8617,6 +7814,7 @@ class bsn_vlan_counter_stats_reply(bsn_stats_reply):
 bsn_stats_reply.subtypes[9] = bsn_vlan_counter_stats_reply
 
 class bsn_vlan_counter_stats_request(bsn_stats_request):
+    __slots__ = ["vlan_vid"]
     version = 5
     type = 18
     stats_type = 65535
@@ -8638,42 +7836,28 @@ class bsn_vlan_counter_stats_request(bsn_stats_request):
             self.vlan_vid = 0
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!H", self.stats_type))
-        packed.append(struct.pack("!H", self.flags))
-        packed.append('\x00' * 4)
-        packed.append(struct.pack("!L", self.experimenter))
-        packed.append(struct.pack("!L", self.subtype))
-        packed.append(struct.pack("!H", self.vlan_vid))
-        length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_BBHLHH4xLLH, buf, offset, self.version, self.type, 0, self.xid, self.stats_type, self.flags, self.experimenter, self.subtype, self.vlan_vid)
+        length = offset - start
+        _struct_H.pack_into(buf, start + 2, length)
+        return offset
+
+    def wire_length(self):
+        return 26
 
     @staticmethod
     def unpack(reader):
         obj = bsn_vlan_counter_stats_request()
-        _version = reader.read("!B")[0]
+        _version, _type, _length = reader.read_struct(_struct_BBH)
         assert(_version == 5)
-        _type = reader.read("!B")[0]
         assert(_type == 18)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        _stats_type = reader.read("!H")[0]
+        obj.xid, _stats_type, obj.flags, _experimenter, _subtype, obj.vlan_vid = reader.read_struct(_struct_LHH4xLLH)
         assert(_stats_type == 65535)
-        obj.flags = reader.read("!H")[0]
-        reader.skip(4)
-        _experimenter = reader.read("!L")[0]
         assert(_experimenter == 6035143)
-        _subtype = reader.read("!L")[0]
         assert(_subtype == 9)
-        obj.vlan_vid = reader.read("!H")[0]
         return obj
 
     def __eq__(self, other):
@@ -8705,6 +7889,7 @@ class bsn_vlan_counter_stats_request(bsn_stats_request):
 bsn_stats_request.subtypes[9] = bsn_vlan_counter_stats_request
 
 class bsn_vrf_counter_stats_reply(bsn_stats_reply):
+    __slots__ = ["entries"]
     version = 5
     type = 19
     stats_type = 65535
@@ -8726,40 +7911,28 @@ class bsn_vrf_counter_stats_reply(bsn_stats_reply):
             self.entries = []
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!H", self.stats_type))
-        packed.append(struct.pack("!H", self.flags))
-        packed.append('\x00' * 4)
-        packed.append(struct.pack("!L", self.experimenter))
-        packed.append(struct.pack("!L", self.subtype))
-        packed.append(loxi.generic_util.pack_list(self.entries))
-        length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_BBHLHH4xLL, buf, offset, self.version, self.type, 0, self.xid, self.stats_type, self.flags, self.experimenter, self.subtype)
+        offset = loxi.generic_util.pack_list_into(self.entries, buf, offset)
+        length = offset - start
+        _struct_H.pack_into(buf, start + 2, length)
+        return offset
+
+    def wire_length(self):
+        return 24 + loxi.generic_util.list_wire_length(self.entries)
 
     @staticmethod
     def unpack(reader):
         obj = bsn_vrf_counter_stats_reply()
-        _version = reader.read("!B")[0]
+        _version, _type, _length = reader.read_struct(_struct_BBH)
         assert(_version == 5)
-        _type = reader.read("!B")[0]
         assert(_type == 19)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        _stats_type = reader.read("!H")[0]
+        obj.xid, _stats_type, obj.flags, _experimenter, _subtype = reader.read_struct(_struct_LHH4xLL)
         assert(_stats_type == 65535)
-        obj.flags = reader.read("!H")[0]
-        reader.skip(4)
-        _experimenter = reader.read("!L")[0]
         assert(_experimenter == 6035143)
-        _subtype = reader.read("!L")[0]
         assert(_subtype == 15)
         obj.entries = loxi.generic_util.unpack_list(reader, ofp.common.bsn_vrf_counter_stats_entry.unpack)
         return obj
@@ -8793,6 +7966,7 @@ class bsn_vrf_counter_stats_reply(bsn_stats_reply):
 bsn_stats_reply.subtypes[15] = bsn_vrf_counter_stats_reply
 
 class bsn_vrf_counter_stats_request(bsn_stats_request):
+    __slots__ = ["vrf"]
     version = 5
     type = 18
     stats_type = 65535
@@ -8814,42 +7988,28 @@ class bsn_vrf_counter_stats_request(bsn_stats_request):
             self.vrf = 0
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!H", self.stats_type))
-        packed.append(struct.pack("!H", self.flags))
-        packed.append('\x00' * 4)
-        packed.append(struct.pack("!L", self.experimenter))
-        packed.append(struct.pack("!L", self.subtype))
-        packed.append(struct.pack("!L", self.vrf))
-        length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_BBHLHH4xLLL, buf, offset, self.version, self.type, 0, self.xid, self.stats_type, self.flags, self.experimenter, self.subtype, self.vrf)
+        length = offset - start
+        _struct_H.pack_into(buf, start + 2, length)
+        return offset
+
+    def wire_length(self):
+        return 28
 
     @staticmethod
     def unpack(reader):
         obj = bsn_vrf_counter_stats_request()
-        _version = reader.read("!B")[0]
+        _version, _type, _length = reader.read_struct(_struct_BBH)
         assert(_version == 5)
-        _type = reader.read("!B")[0]
         assert(_type == 18)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        _stats_type = reader.read("!H")[0]
+        obj.xid, _stats_type, obj.flags, _experimenter, _subtype, obj.vrf = reader.read_struct(_struct_LHH4xLLL)
         assert(_stats_type == 65535)
-        obj.flags = reader.read("!H")[0]
-        reader.skip(4)
-        _experimenter = reader.read("!L")[0]
         assert(_experimenter == 6035143)
-        _subtype = reader.read("!L")[0]
         assert(_subtype == 15)
-        obj.vrf = reader.read("!L")[0]
         return obj
 
     def __eq__(self, other):
@@ -8881,6 +8041,7 @@ class bsn_vrf_counter_stats_request(bsn_stats_request):
 bsn_stats_request.subtypes[15] = bsn_vrf_counter_stats_request
 
 class bundle_add_msg(message):
+    __slots__ = ["bundle_id", "data", "flags"]
     version = 5
     type = 34
 
@@ -8903,35 +8064,27 @@ class bundle_add_msg(message):
             self.data = ''
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!L", self.bundle_id))
-        packed.append('\x00' * 2)
-        packed.append(struct.pack("!H", self.flags))
-        packed.append(self.data)
-        length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_BBHLL2xH, buf, offset, self.version, self.type, 0, self.xid, self.bundle_id, self.flags)
+        offset = loxi.generic_util.pack_bytes_into(self.data, buf, offset)
+        length = offset - start
+        _struct_H.pack_into(buf, start + 2, length)
+        return offset
+
+    def wire_length(self):
+        return 16 + len(self.data)
 
     @staticmethod
     def unpack(reader):
         obj = bundle_add_msg()
-        _version = reader.read("!B")[0]
+        _version, _type, _length = reader.read_struct(_struct_BBH)
         assert(_version == 5)
-        _type = reader.read("!B")[0]
         assert(_type == 34)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        obj.bundle_id = reader.read("!L")[0]
-        reader.skip(2)
-        obj.flags = reader.read("!H")[0]
-        obj.data = str(reader.read_all())
+        obj.xid, obj.bundle_id, obj.flags = reader.read_struct(_struct_LL2xH)
+        obj.data = reader.read_all()
         return obj
 
     def __eq__(self, other):
@@ -8967,6 +8120,7 @@ class bundle_add_msg(message):
 message.subtypes[34] = bundle_add_msg
 
 class bundle_ctrl_msg(message):
+    __slots__ = ["bundle_ctrl_type", "bundle_id", "flags", "properties"]
     version = 5
     type = 33
 
@@ -8993,34 +8147,26 @@ class bundle_ctrl_msg(message):
             self.properties = []
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!L", self.bundle_id))
-        packed.append(struct.pack("!H", self.bundle_ctrl_type))
-        packed.append(struct.pack("!H", self.flags))
-        packed.append(loxi.generic_util.pack_list(self.properties))
-        length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_BBHLLHH, buf, offset, self.version, self.type, 0, self.xid, self.bundle_id, self.bundle_ctrl_type, self.flags)
+        offset = loxi.generic_util.pack_list_into(self.properties, buf, offset)
+        length = offset - start
+        _struct_H.pack_into(buf, start + 2, length)
+        return offset
+
+    def wire_length(self):
+        return 16 + loxi.generic_util.list_wire_length(self.properties)
 
     @staticmethod
     def unpack(reader):
         obj = bundle_ctrl_msg()
-        _version = reader.read("!B")[0]
+        _version, _type, _length = reader.read_struct(_struct_BBH)
         assert(_version == 5)
-        _type = reader.read("!B")[0]
         assert(_type == 33)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        obj.bundle_id = reader.read("!L")[0]
-        obj.bundle_ctrl_type = reader.read("!H")[0]
-        obj.flags = reader.read("!H")[0]
+        obj.xid, obj.bundle_id, obj.bundle_ctrl_type, obj.flags = reader.read_struct(_struct_LLHH)
         obj.properties = loxi.generic_util.unpack_list(reader, ofp.bundle_prop.bundle_prop.unpack)
         return obj
 
@@ -9061,6 +8207,7 @@ class bundle_ctrl_msg(message):
 message.subtypes[33] = bundle_ctrl_msg
 
 class bundle_failed_error_msg(error_msg):
+    __slots__ = ["code", "data"]
     version = 5
     type = 1
     err_type = 17
@@ -9080,34 +8227,28 @@ class bundle_failed_error_msg(error_msg):
             self.data = ''
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!H", self.err_type))
-        packed.append(struct.pack("!H", self.code))
-        packed.append(self.data)
-        length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_BBHLHH, buf, offset, self.version, self.type, 0, self.xid, self.err_type, self.code)
+        offset = loxi.generic_util.pack_bytes_into(self.data, buf, offset)
+        length = offset - start
+        _struct_H.pack_into(buf, start + 2, length)
+        return offset
+
+    def wire_length(self):
+        return 12 + len(self.data)
 
     @staticmethod
     def unpack(reader):
         obj = bundle_failed_error_msg()
-        _version = reader.read("!B")[0]
+        _version, _type, _length = reader.read_struct(_struct_BBH)
         assert(_version == 5)
-        _type = reader.read("!B")[0]
         assert(_type == 1)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        _err_type = reader.read("!H")[0]
+        obj.xid, _err_type, obj.code = reader.read_struct(_struct_LHH)
         assert(_err_type == 17)
-        obj.code = reader.read("!H")[0]
-        obj.data = str(reader.read_all())
+        obj.data = reader.read_all()
         return obj
 
     def __eq__(self, other):
@@ -9139,6 +8280,7 @@ class bundle_failed_error_msg(error_msg):
 error_msg.subtypes[17] = bundle_failed_error_msg
 
 class desc_stats_reply(stats_reply):
+    __slots__ = ["dp_desc", "hw_desc", "mfr_desc", "serial_num", "sw_desc"]
     version = 5
     type = 19
     stats_type = 0
@@ -9174,44 +8316,31 @@ class desc_stats_reply(stats_reply):
             self.dp_desc = ""
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!H", self.stats_type))
-        packed.append(struct.pack("!H", self.flags))
-        packed.append('\x00' * 4)
-        packed.append(struct.pack("!256s", self.mfr_desc))
-        packed.append(struct.pack("!256s", self.hw_desc))
-        packed.append(struct.pack("!256s", self.sw_desc))
-        packed.append(struct.pack("!32s", self.serial_num))
-        packed.append(struct.pack("!256s", self.dp_desc))
-        length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_BBHLHH4x256s256s256s32s256s, buf, offset, self.version, self.type, 0, self.xid, self.stats_type, self.flags, self.mfr_desc, self.hw_desc, self.sw_desc, self.serial_num, self.dp_desc)
+        length = offset - start
+        _struct_H.pack_into(buf, start + 2, length)
+        return offset
+
+    def wire_length(self):
+        return 1072
 
     @staticmethod
     def unpack(reader):
         obj = desc_stats_reply()
-        _version = reader.read("!B")[0]
+        _version, _type, _length = reader.read_struct(_struct_BBH)
         assert(_version == 5)
-        _type = reader.read("!B")[0]
         assert(_type == 19)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        _stats_type = reader.read("!H")[0]
+        obj.xid, _stats_type, obj.flags, obj.mfr_desc, obj.hw_desc, obj.sw_desc, obj.serial_num, obj.dp_desc = reader.read_struct(_struct_LHH4x256s256s256s32s256s)
         assert(_stats_type == 0)
-        obj.flags = reader.read("!H")[0]
-        reader.skip(4)
-        obj.mfr_desc = reader.read("!256s")[0].rstrip("\x00")
-        obj.hw_desc = reader.read("!256s")[0].rstrip("\x00")
-        obj.sw_desc = reader.read("!256s")[0].rstrip("\x00")
-        obj.serial_num = reader.read("!32s")[0].rstrip("\x00")
-        obj.dp_desc = reader.read("!256s")[0].rstrip("\x00")
+        obj.mfr_desc = obj.mfr_desc.rstrip("\x00")
+        obj.hw_desc = obj.hw_desc.rstrip("\x00")
+        obj.sw_desc = obj.sw_desc.rstrip("\x00")
+        obj.serial_num = obj.serial_num.rstrip("\x00")
+        obj.dp_desc = obj.dp_desc.rstrip("\x00")
         return obj
 
     def __eq__(self, other):
@@ -9259,6 +8388,7 @@ class desc_stats_reply(stats_reply):
 stats_reply.subtypes[0] = desc_stats_reply
 
 class desc_stats_request(stats_request):
+    __slots__ = []
     version = 5
     type = 18
     stats_type = 0
@@ -9274,34 +8404,26 @@ class desc_stats_request(stats_request):
             self.flags = 0
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!H", self.stats_type))
-        packed.append(struct.pack("!H", self.flags))
-        packed.append('\x00' * 4)
-        length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_BBHLHH4x, buf, offset, self.version, self.type, 0, self.xid, self.stats_type, self.flags)
+        length = offset - start
+        _struct_H.pack_into(buf, start + 2, length)
+        return offset
+
+    def wire_length(self):
+        return 16
 
     @staticmethod
     def unpack(reader):
         obj = desc_stats_request()
-        _version = reader.read("!B")[0]
+        _version, _type, _length = reader.read_struct(_struct_BBH)
         assert(_version == 5)
-        _type = reader.read("!B")[0]
         assert(_type == 18)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        _stats_type = reader.read("!H")[0]
+        obj.xid, _stats_type, obj.flags = reader.read_struct(_struct_LHH4x)
         assert(_stats_type == 0)
-        obj.flags = reader.read("!H")[0]
-        reader.skip(4)
         return obj
 
     def __eq__(self, other):
@@ -9329,6 +8451,7 @@ class desc_stats_request(stats_request):
 stats_request.subtypes[0] = desc_stats_request
 
 class echo_reply(message):
+    __slots__ = ["data"]
     version = 5
     type = 3
 
@@ -9343,29 +8466,27 @@ class echo_reply(message):
             self.data = ''
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(self.data)
-        length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_BBHL, buf, offset, self.version, self.type, 0, self.xid)
+        offset = loxi.generic_util.pack_bytes_into(self.data, buf, offset)
+        length = offset - start
+        _struct_H.pack_into(buf, start + 2, length)
+        return offset
+
+    def wire_length(self):
+        return 8 + len(self.data)
 
     @staticmethod
     def unpack(reader):
         obj = echo_reply()
-        _version = reader.read("!B")[0]
+        _version, _type, _length = reader.read_struct(_struct_BBH)
         assert(_version == 5)
-        _type = reader.read("!B")[0]
         assert(_type == 3)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
         obj.xid = reader.read("!L")[0]
-        obj.data = str(reader.read_all())
+        obj.data = reader.read_all()
         return obj
 
     def __eq__(self, other):
@@ -9393,6 +8514,7 @@ class echo_reply(message):
 message.subtypes[3] = echo_reply
 
 class echo_request(message):
+    __slots__ = ["data"]
     version = 5
     type = 2
 
@@ -9407,29 +8529,27 @@ class echo_request(message):
             self.data = ''
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(self.data)
-        length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_BBHL, buf, offset, self.version, self.type, 0, self.xid)
+        offset = loxi.generic_util.pack_bytes_into(self.data, buf, offset)
+        length = offset - start
+        _struct_H.pack_into(buf, start + 2, length)
+        return offset
+
+    def wire_length(self):
+        return 8 + len(self.data)
 
     @staticmethod
     def unpack(reader):
         obj = echo_request()
-        _version = reader.read("!B")[0]
+        _version, _type, _length = reader.read_struct(_struct_BBH)
         assert(_version == 5)
-        _type = reader.read("!B")[0]
         assert(_type == 2)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
         obj.xid = reader.read("!L")[0]
-        obj.data = str(reader.read_all())
+        obj.data = reader.read_all()
         return obj
 
     def __eq__(self, other):
@@ -9457,6 +8577,7 @@ class echo_request(message):
 message.subtypes[2] = echo_request
 
 class experimenter_error_msg(error_msg):
+    __slots__ = ["data", "experimenter", "subtype"]
     version = 5
     type = 1
     err_type = 65535
@@ -9480,36 +8601,28 @@ class experimenter_error_msg(error_msg):
             self.data = ''
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!H", self.err_type))
-        packed.append(struct.pack("!H", self.subtype))
-        packed.append(struct.pack("!L", self.experimenter))
-        packed.append(self.data)
-        length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_BBHLHHL, buf, offset, self.version, self.type, 0, self.xid, self.err_type, self.subtype, self.experimenter)
+        offset = loxi.generic_util.pack_bytes_into(self.data, buf, offset)
+        length = offset - start
+        _struct_H.pack_into(buf, start + 2, length)
+        return offset
+
+    def wire_length(self):
+        return 16 + len(self.data)
 
     @staticmethod
     def unpack(reader):
         obj = experimenter_error_msg()
-        _version = reader.read("!B")[0]
+        _version, _type, _length = reader.read_struct(_struct_BBH)
         assert(_version == 5)
-        _type = reader.read("!B")[0]
         assert(_type == 1)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        _err_type = reader.read("!H")[0]
+        obj.xid, _err_type, obj.subtype, obj.experimenter = reader.read_struct(_struct_LHHL)
         assert(_err_type == 65535)
-        obj.subtype = reader.read("!H")[0]
-        obj.experimenter = reader.read("!L")[0]
-        obj.data = str(reader.read_all())
+        obj.data = reader.read_all()
         return obj
 
     def __eq__(self, other):
@@ -9545,6 +8658,7 @@ class experimenter_error_msg(error_msg):
 error_msg.subtypes[65535] = experimenter_error_msg
 
 class features_reply(message):
+    __slots__ = ["auxiliary_id", "capabilities", "datapath_id", "n_buffers", "n_tables", "reserved"]
     version = 5
     type = 6
 
@@ -9579,41 +8693,25 @@ class features_reply(message):
             self.reserved = 0
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!Q", self.datapath_id))
-        packed.append(struct.pack("!L", self.n_buffers))
-        packed.append(struct.pack("!B", self.n_tables))
-        packed.append(struct.pack("!B", self.auxiliary_id))
-        packed.append('\x00' * 2)
-        packed.append(struct.pack("!L", self.capabilities))
-        packed.append(struct.pack("!L", self.reserved))
-        length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_BBHLQLBB2xLL, buf, offset, self.version, self.type, 0, self.xid, self.datapath_id, self.n_buffers, self.n_tables, self.auxiliary_id, self.capabilities, self.reserved)
+        length = offset - start
+        _struct_H.pack_into(buf, start + 2, length)
+        return offset
+
+    def wire_length(self):
+        return 32
 
     @staticmethod
     def unpack(reader):
         obj = features_reply()
-        _version = reader.read("!B")[0]
+        _version, _type, _length = reader.read_struct(_struct_BBH)
         assert(_version == 5)
-        _type = reader.read("!B")[0]
         assert(_type == 6)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        obj.datapath_id = reader.read("!Q")[0]
-        obj.n_buffers = reader.read("!L")[0]
-        obj.n_tables = reader.read("!B")[0]
-        obj.auxiliary_id = reader.read("!B")[0]
-        reader.skip(2)
-        obj.capabilities = reader.read("!L")[0]
-        obj.reserved = reader.read("!L")[0]
+        obj.xid, obj.datapath_id, obj.n_buffers, obj.n_tables, obj.auxiliary_id, obj.capabilities, obj.reserved = reader.read_struct(_struct_LQLBB2xLL)
         return obj
 
     def __eq__(self, other):
@@ -9661,6 +8759,7 @@ class features_reply(message):
 message.subtypes[6] = features_reply
 
 class features_request(message):
+    __slots__ = []
     version = 5
     type = 5
 
@@ -9671,24 +8770,22 @@ class features_request(message):
             self.xid = None
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_BBHL, buf, offset, self.version, self.type, 0, self.xid)
+        length = offset - start
+        _struct_H.pack_into(buf, start + 2, length)
+        return offset
+
+    def wire_length(self):
+        return 8
 
     @staticmethod
     def unpack(reader):
         obj = features_request()
-        _version = reader.read("!B")[0]
+        _version, _type, _length = reader.read_struct(_struct_BBH)
         assert(_version == 5)
-        _type = reader.read("!B")[0]
         assert(_type == 5)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
         obj.xid = reader.read("!L")[0]
@@ -9715,6 +8812,7 @@ class features_request(message):
 message.subtypes[5] = features_request
 
 class flow_mod(message):
+    __slots__ = ["_command", "buffer_id", "cookie", "cookie_mask", "flags", "hard_timeout", "idle_timeout", "instructions", "match", "out_group", "out_port", "priority", "table_id"]
     subtypes = {}
 
     version = 5
@@ -9779,29 +8877,17 @@ class flow_mod(message):
             self.instructions = []
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!Q", self.cookie))
-        packed.append(struct.pack("!Q", self.cookie_mask))
-        packed.append(struct.pack("!B", self.table_id))
-        packed.append(util.pack_fm_cmd(self._command))
-        packed.append(struct.pack("!H", self.idle_timeout))
-        packed.append(struct.pack("!H", self.hard_timeout))
-        packed.append(struct.pack("!H", self.priority))
-        packed.append(struct.pack("!L", self.buffer_id))
-        packed.append(util.pack_port_no(self.out_port))
-        packed.append(struct.pack("!L", self.out_group))
-        packed.append(struct.pack("!H", self.flags))
-        packed.append('\x00' * 2)
-        packed.append(self.match.pack())
-        packed.append(loxi.generic_util.pack_list(self.instructions))
-        length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_BBHLQQBBHHHLLLH2x, buf, offset, self.version, self.type, 0, self.xid, self.cookie, self.cookie_mask, self.table_id, self._command, self.idle_timeout, self.hard_timeout, self.priority, self.buffer_id, self.out_port, self.out_group, self.flags)
+        offset = self.match.pack_into(buf, offset)
+        offset = loxi.generic_util.pack_list_into(self.instructions, buf, offset)
+        length = offset - start
+        _struct_H.pack_into(buf, start + 2, length)
+        return offset
+
+    def wire_length(self):
+        return 48 + self.match.wire_length() + loxi.generic_util.list_wire_length(self.instructions)
 
     @staticmethod
     def unpack(reader):
@@ -9811,26 +8897,12 @@ class flow_mod(message):
             return subclass.unpack(reader)
 
         obj = flow_mod()
-        _version = reader.read("!B")[0]
+        _version, _type, _length = reader.read_struct(_struct_BBH)
         assert(_version == 5)
-        _type = reader.read("!B")[0]
         assert(_type == 14)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        obj.cookie = reader.read("!Q")[0]
-        obj.cookie_mask = reader.read("!Q")[0]
-        obj.table_id = reader.read("!B")[0]
-        obj._command = util.unpack_fm_cmd(reader)
-        obj.idle_timeout = reader.read("!H")[0]
-        obj.hard_timeout = reader.read("!H")[0]
-        obj.priority = reader.read("!H")[0]
-        obj.buffer_id = reader.read("!L")[0]
-        obj.out_port = util.unpack_port_no(reader)
-        obj.out_group = reader.read("!L")[0]
-        obj.flags = reader.read("!H")[0]
-        reader.skip(2)
+        obj.xid, obj.cookie, obj.cookie_mask, obj.table_id, obj._command, obj.idle_timeout, obj.hard_timeout, obj.priority, obj.buffer_id, obj.out_port, obj.out_group, obj.flags = reader.read_struct(_struct_LQQBBHHHLLLH2x)
         obj.match = ofp.match.unpack(reader)
         obj.instructions = loxi.generic_util.unpack_list(reader, ofp.instruction.instruction.unpack)
         return obj
@@ -9905,6 +8977,7 @@ class flow_mod(message):
 message.subtypes[14] = flow_mod
 
 class flow_add(flow_mod):
+    __slots__ = ["importance"]
     version = 5
     type = 14
     _command = 0
@@ -9968,54 +9041,28 @@ class flow_add(flow_mod):
             self.instructions = []
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!Q", self.cookie))
-        packed.append(struct.pack("!Q", self.cookie_mask))
-        packed.append(struct.pack("!B", self.table_id))
-        packed.append(util.pack_fm_cmd(self._command))
-        packed.append(struct.pack("!H", self.idle_timeout))
-        packed.append(struct.pack("!H", self.hard_timeout))
-        packed.append(struct.pack("!H", self.priority))
-        packed.append(struct.pack("!L", self.buffer_id))
-        packed.append(util.pack_port_no(self.out_port))
-        packed.append(struct.pack("!L", self.out_group))
-        packed.append(struct.pack("!H", self.flags))
-        packed.append(struct.pack("!H", self.importance))
-        packed.append(self.match.pack())
-        packed.append(loxi.generic_util.pack_list(self.instructions))
-        length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_BBHLQQBBHHHLLLHH, buf, offset, self.version, self.type, 0, self.xid, self.cookie, self.cookie_mask, self.table_id, self._command, self.idle_timeout, self.hard_timeout, self.priority, self.buffer_id, self.out_port, self.out_group, self.flags, self.importance)
+        offset = self.match.pack_into(buf, offset)
+        offset = loxi.generic_util.pack_list_into(self.instructions, buf, offset)
+        length = offset - start
+        _struct_H.pack_into(buf, start + 2, length)
+        return offset
+
+    def wire_length(self):
+        return 48 + self.match.wire_length() + loxi.generic_util.list_wire_length(self.instructions)
 
     @staticmethod
     def unpack(reader):
         obj = flow_add()
-        _version = reader.read("!B")[0]
+        _version, _type, _length = reader.read_struct(_struct_BBH)
         assert(_version == 5)
-        _type = reader.read("!B")[0]
         assert(_type == 14)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        obj.cookie = reader.read("!Q")[0]
-        obj.cookie_mask = reader.read("!Q")[0]
-        obj.table_id = reader.read("!B")[0]
-        __command = util.unpack_fm_cmd(reader)
+        obj.xid, obj.cookie, obj.cookie_mask, obj.table_id, __command, obj.idle_timeout, obj.hard_timeout, obj.priority, obj.buffer_id, obj.out_port, obj.out_group, obj.flags, obj.importance = reader.read_struct(_struct_LQQBBHHHLLLHH)
         assert(__command == 0)
-        obj.idle_timeout = reader.read("!H")[0]
-        obj.hard_timeout = reader.read("!H")[0]
-        obj.priority = reader.read("!H")[0]
-        obj.buffer_id = reader.read("!L")[0]
-        obj.out_port = util.unpack_port_no(reader)
-        obj.out_group = reader.read("!L")[0]
-        obj.flags = reader.read("!H")[0]
-        obj.importance = reader.read("!H")[0]
         obj.match = ofp.match.unpack(reader)
         obj.instructions = loxi.generic_util.unpack_list(reader, ofp.instruction.instruction.unpack)
         return obj
@@ -10093,6 +9140,7 @@ class flow_add(flow_mod):
 flow_mod.subtypes[0] = flow_add
 
 class flow_delete(flow_mod):
+    __slots__ = ["importance"]
     version = 5
     type = 14
     _command = 3
@@ -10156,54 +9204,28 @@ class flow_delete(flow_mod):
             self.instructions = []
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!Q", self.cookie))
-        packed.append(struct.pack("!Q", self.cookie_mask))
-        packed.append(struct.pack("!B", self.table_id))
-        packed.append(util.pack_fm_cmd(self._command))
-        packed.append(struct.pack("!H", self.idle_timeout))
-        packed.append(struct.pack("!H", self.hard_timeout))
-        packed.append(struct.pack("!H", self.priority))
-        packed.append(struct.pack("!L", self.buffer_id))
-        packed.append(util.pack_port_no(self.out_port))
-        packed.append(struct.pack("!L", self.out_group))
-        packed.append(struct.pack("!H", self.flags))
-        packed.append(struct.pack("!H", self.importance))
-        packed.append(self.match.pack())
-        packed.append(loxi.generic_util.pack_list(self.instructions))
-        length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_BBHLQQBBHHHLLLHH, buf, offset, self.version, self.type, 0, self.xid, self.cookie, self.cookie_mask, self.table_id, self._command, self.idle_timeout, self.hard_timeout, self.priority, self.buffer_id, self.out_port, self.out_group, self.flags, self.importance)
+        offset = self.match.pack_into(buf, offset)
+        offset = loxi.generic_util.pack_list_into(self.instructions, buf, offset)
+        length = offset - start
+        _struct_H.pack_into(buf, start + 2, length)
+        return offset
+
+    def wire_length(self):
+        return 48 + self.match.wire_length() + loxi.generic_util.list_wire_length(self.instructions)
 
     @staticmethod
     def unpack(reader):
         obj = flow_delete()
-        _version = reader.read("!B")[0]
+        _version, _type, _length = reader.read_struct(_struct_BBH)
         assert(_version == 5)
-        _type = reader.read("!B")[0]
         assert(_type == 14)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        obj.cookie = reader.read("!Q")[0]
-        obj.cookie_mask = reader.read("!Q")[0]
-        obj.table_id = reader.read("!B")[0]
-        __command = util.unpack_fm_cmd(reader)
+        obj.xid, obj.cookie, obj.cookie_mask, obj.table_id, __command, obj.idle_timeout, obj.hard_timeout, obj.priority, obj.buffer_id, obj.out_port, obj.out_group, obj.flags, obj.importance = reader.read_struct(_struct_LQQBBHHHLLLHH)
         assert(__command == 3)
-        obj.idle_timeout = reader.read("!H")[0]
-        obj.hard_timeout = reader.read("!H")[0]
-        obj.priority = reader.read("!H")[0]
-        obj.buffer_id = reader.read("!L")[0]
-        obj.out_port = util.unpack_port_no(reader)
-        obj.out_group = reader.read("!L")[0]
-        obj.flags = reader.read("!H")[0]
-        obj.importance = reader.read("!H")[0]
         obj.match = ofp.match.unpack(reader)
         obj.instructions = loxi.generic_util.unpack_list(reader, ofp.instruction.instruction.unpack)
         return obj
@@ -10281,6 +9303,7 @@ class flow_delete(flow_mod):
 flow_mod.subtypes[3] = flow_delete
 
 class flow_delete_strict(flow_mod):
+    __slots__ = ["importance"]
     version = 5
     type = 14
     _command = 4
@@ -10344,54 +9367,28 @@ class flow_delete_strict(flow_mod):
             self.instructions = []
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!Q", self.cookie))
-        packed.append(struct.pack("!Q", self.cookie_mask))
-        packed.append(struct.pack("!B", self.table_id))
-        packed.append(util.pack_fm_cmd(self._command))
-        packed.append(struct.pack("!H", self.idle_timeout))
-        packed.append(struct.pack("!H", self.hard_timeout))
-        packed.append(struct.pack("!H", self.priority))
-        packed.append(struct.pack("!L", self.buffer_id))
-        packed.append(util.pack_port_no(self.out_port))
-        packed.append(struct.pack("!L", self.out_group))
-        packed.append(struct.pack("!H", self.flags))
-        packed.append(struct.pack("!H", self.importance))
-        packed.append(self.match.pack())
-        packed.append(loxi.generic_util.pack_list(self.instructions))
-        length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_BBHLQQBBHHHLLLHH, buf, offset, self.version, self.type, 0, self.xid, self.cookie, self.cookie_mask, self.table_id, self._command, self.idle_timeout, self.hard_timeout, self.priority, self.buffer_id, self.out_port, self.out_group, self.flags, self.importance)
+        offset = self.match.pack_into(buf, offset)
+        offset = loxi.generic_util.pack_list_into(self.instructions, buf, offset)
+        length = offset - start
+        _struct_H.pack_into(buf, start + 2, length)
+        return offset
+
+    def wire_length(self):
+        return 48 + self.match.wire_length() + loxi.generic_util.list_wire_length(self.instructions)
 
     @staticmethod
     def unpack(reader):
         obj = flow_delete_strict()
-        _version = reader.read("!B")[0]
+        _version, _type, _length = reader.read_struct(_struct_BBH)
         assert(_version == 5)
-        _type = reader.read("!B")[0]
         assert(_type == 14)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        obj.cookie = reader.read("!Q")[0]
-        obj.cookie_mask = reader.read("!Q")[0]
-        obj.table_id = reader.read("!B")[0]
-        __command = util.unpack_fm_cmd(reader)
+        obj.xid, obj.cookie, obj.cookie_mask, obj.table_id, __command, obj.idle_timeout, obj.hard_timeout, obj.priority, obj.buffer_id, obj.out_port, obj.out_group, obj.flags, obj.importance = reader.read_struct(_struct_LQQBBHHHLLLHH)
         assert(__command == 4)
-        obj.idle_timeout = reader.read("!H")[0]
-        obj.hard_timeout = reader.read("!H")[0]
-        obj.priority = reader.read("!H")[0]
-        obj.buffer_id = reader.read("!L")[0]
-        obj.out_port = util.unpack_port_no(reader)
-        obj.out_group = reader.read("!L")[0]
-        obj.flags = reader.read("!H")[0]
-        obj.importance = reader.read("!H")[0]
         obj.match = ofp.match.unpack(reader)
         obj.instructions = loxi.generic_util.unpack_list(reader, ofp.instruction.instruction.unpack)
         return obj
@@ -10469,6 +9466,7 @@ class flow_delete_strict(flow_mod):
 flow_mod.subtypes[4] = flow_delete_strict
 
 class flow_mod_failed_error_msg(error_msg):
+    __slots__ = ["code", "data"]
     version = 5
     type = 1
     err_type = 5
@@ -10488,34 +9486,28 @@ class flow_mod_failed_error_msg(error_msg):
             self.data = ''
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!H", self.err_type))
-        packed.append(struct.pack("!H", self.code))
-        packed.append(self.data)
-        length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_BBHLHH, buf, offset, self.version, self.type, 0, self.xid, self.err_type, self.code)
+        offset = loxi.generic_util.pack_bytes_into(self.data, buf, offset)
+        length = offset - start
+        _struct_H.pack_into(buf, start + 2, length)
+        return offset
+
+    def wire_length(self):
+        return 12 + len(self.data)
 
     @staticmethod
     def unpack(reader):
         obj = flow_mod_failed_error_msg()
-        _version = reader.read("!B")[0]
+        _version, _type, _length = reader.read_struct(_struct_BBH)
         assert(_version == 5)
-        _type = reader.read("!B")[0]
         assert(_type == 1)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        _err_type = reader.read("!H")[0]
+        obj.xid, _err_type, obj.code = reader.read_struct(_struct_LHH)
         assert(_err_type == 5)
-        obj.code = reader.read("!H")[0]
-        obj.data = str(reader.read_all())
+        obj.data = reader.read_all()
         return obj
 
     def __eq__(self, other):
@@ -10547,6 +9539,7 @@ class flow_mod_failed_error_msg(error_msg):
 error_msg.subtypes[5] = flow_mod_failed_error_msg
 
 class flow_modify(flow_mod):
+    __slots__ = ["importance"]
     version = 5
     type = 14
     _command = 1
@@ -10610,54 +9603,28 @@ class flow_modify(flow_mod):
             self.instructions = []
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!Q", self.cookie))
-        packed.append(struct.pack("!Q", self.cookie_mask))
-        packed.append(struct.pack("!B", self.table_id))
-        packed.append(util.pack_fm_cmd(self._command))
-        packed.append(struct.pack("!H", self.idle_timeout))
-        packed.append(struct.pack("!H", self.hard_timeout))
-        packed.append(struct.pack("!H", self.priority))
-        packed.append(struct.pack("!L", self.buffer_id))
-        packed.append(util.pack_port_no(self.out_port))
-        packed.append(struct.pack("!L", self.out_group))
-        packed.append(struct.pack("!H", self.flags))
-        packed.append(struct.pack("!H", self.importance))
-        packed.append(self.match.pack())
-        packed.append(loxi.generic_util.pack_list(self.instructions))
-        length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_BBHLQQBBHHHLLLHH, buf, offset, self.version, self.type, 0, self.xid, self.cookie, self.cookie_mask, self.table_id, self._command, self.idle_timeout, self.hard_timeout, self.priority, self.buffer_id, self.out_port, self.out_group, self.flags, self.importance)
+        offset = self.match.pack_into(buf, offset)
+        offset = loxi.generic_util.pack_list_into(self.instructions, buf, offset)
+        length = offset - start
+        _struct_H.pack_into(buf, start + 2, length)
+        return offset
+
+    def wire_length(self):
+        return 48 + self.match.wire_length() + loxi.generic_util.list_wire_length(self.instructions)
 
     @staticmethod
     def unpack(reader):
         obj = flow_modify()
-        _version = reader.read("!B")[0]
+        _version, _type, _length = reader.read_struct(_struct_BBH)
         assert(_version == 5)
-        _type = reader.read("!B")[0]
         assert(_type == 14)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        obj.cookie = reader.read("!Q")[0]
-        obj.cookie_mask = reader.read("!Q")[0]
-        obj.table_id = reader.read("!B")[0]
-        __command = util.unpack_fm_cmd(reader)
+        obj.xid, obj.cookie, obj.cookie_mask, obj.table_id, __command, obj.idle_timeout, obj.hard_timeout, obj.priority, obj.buffer_id, obj.out_port, obj.out_group, obj.flags, obj.importance = reader.read_struct(_struct_LQQBBHHHLLLHH)
         assert(__command == 1)
-        obj.idle_timeout = reader.read("!H")[0]
-        obj.hard_timeout = reader.read("!H")[0]
-        obj.priority = reader.read("!H")[0]
-        obj.buffer_id = reader.read("!L")[0]
-        obj.out_port = util.unpack_port_no(reader)
-        obj.out_group = reader.read("!L")[0]
-        obj.flags = reader.read("!H")[0]
-        obj.importance = reader.read("!H")[0]
         obj.match = ofp.match.unpack(reader)
         obj.instructions = loxi.generic_util.unpack_list(reader, ofp.instruction.instruction.unpack)
         return obj
@@ -10735,6 +9702,7 @@ class flow_modify(flow_mod):
 flow_mod.subtypes[1] = flow_modify
 
 class flow_modify_strict(flow_mod):
+    __slots__ = ["importance"]
     version = 5
     type = 14
     _command = 2
@@ -10798,54 +9766,28 @@ class flow_modify_strict(flow_mod):
             self.instructions = []
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!Q", self.cookie))
-        packed.append(struct.pack("!Q", self.cookie_mask))
-        packed.append(struct.pack("!B", self.table_id))
-        packed.append(util.pack_fm_cmd(self._command))
-        packed.append(struct.pack("!H", self.idle_timeout))
-        packed.append(struct.pack("!H", self.hard_timeout))
-        packed.append(struct.pack("!H", self.priority))
-        packed.append(struct.pack("!L", self.buffer_id))
-        packed.append(util.pack_port_no(self.out_port))
-        packed.append(struct.pack("!L", self.out_group))
-        packed.append(struct.pack("!H", self.flags))
-        packed.append(struct.pack("!H", self.importance))
-        packed.append(self.match.pack())
-        packed.append(loxi.generic_util.pack_list(self.instructions))
-        length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_BBHLQQBBHHHLLLHH, buf, offset, self.version, self.type, 0, self.xid, self.cookie, self.cookie_mask, self.table_id, self._command, self.idle_timeout, self.hard_timeout, self.priority, self.buffer_id, self.out_port, self.out_group, self.flags, self.importance)
+        offset = self.match.pack_into(buf, offset)
+        offset = loxi.generic_util.pack_list_into(self.instructions, buf, offset)
+        length = offset - start
+        _struct_H.pack_into(buf, start + 2, length)
+        return offset
+
+    def wire_length(self):
+        return 48 + self.match.wire_length() + loxi.generic_util.list_wire_length(self.instructions)
 
     @staticmethod
     def unpack(reader):
         obj = flow_modify_strict()
-        _version = reader.read("!B")[0]
+        _version, _type, _length = reader.read_struct(_struct_BBH)
         assert(_version == 5)
-        _type = reader.read("!B")[0]
         assert(_type == 14)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        obj.cookie = reader.read("!Q")[0]
-        obj.cookie_mask = reader.read("!Q")[0]
-        obj.table_id = reader.read("!B")[0]
-        __command = util.unpack_fm_cmd(reader)
+        obj.xid, obj.cookie, obj.cookie_mask, obj.table_id, __command, obj.idle_timeout, obj.hard_timeout, obj.priority, obj.buffer_id, obj.out_port, obj.out_group, obj.flags, obj.importance = reader.read_struct(_struct_LQQBBHHHLLLHH)
         assert(__command == 2)
-        obj.idle_timeout = reader.read("!H")[0]
-        obj.hard_timeout = reader.read("!H")[0]
-        obj.priority = reader.read("!H")[0]
-        obj.buffer_id = reader.read("!L")[0]
-        obj.out_port = util.unpack_port_no(reader)
-        obj.out_group = reader.read("!L")[0]
-        obj.flags = reader.read("!H")[0]
-        obj.importance = reader.read("!H")[0]
         obj.match = ofp.match.unpack(reader)
         obj.instructions = loxi.generic_util.unpack_list(reader, ofp.instruction.instruction.unpack)
         return obj
@@ -10923,6 +9865,7 @@ class flow_modify_strict(flow_mod):
 flow_mod.subtypes[2] = flow_modify_strict
 
 class flow_monitor_failed_error_msg(error_msg):
+    __slots__ = ["code", "data"]
     version = 5
     type = 1
     err_type = 16
@@ -10942,34 +9885,28 @@ class flow_monitor_failed_error_msg(error_msg):
             self.data = ''
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!H", self.err_type))
-        packed.append(struct.pack("!H", self.code))
-        packed.append(self.data)
-        length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_BBHLHH, buf, offset, self.version, self.type, 0, self.xid, self.err_type, self.code)
+        offset = loxi.generic_util.pack_bytes_into(self.data, buf, offset)
+        length = offset - start
+        _struct_H.pack_into(buf, start + 2, length)
+        return offset
+
+    def wire_length(self):
+        return 12 + len(self.data)
 
     @staticmethod
     def unpack(reader):
         obj = flow_monitor_failed_error_msg()
-        _version = reader.read("!B")[0]
+        _version, _type, _length = reader.read_struct(_struct_BBH)
         assert(_version == 5)
-        _type = reader.read("!B")[0]
         assert(_type == 1)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        _err_type = reader.read("!H")[0]
+        obj.xid, _err_type, obj.code = reader.read_struct(_struct_LHH)
         assert(_err_type == 16)
-        obj.code = reader.read("!H")[0]
-        obj.data = str(reader.read_all())
+        obj.data = reader.read_all()
         return obj
 
     def __eq__(self, other):
@@ -11001,6 +9938,7 @@ class flow_monitor_failed_error_msg(error_msg):
 error_msg.subtypes[16] = flow_monitor_failed_error_msg
 
 class flow_removed(message):
+    __slots__ = ["byte_count", "cookie", "duration_nsec", "duration_sec", "hard_timeout", "idle_timeout", "match", "packet_count", "priority", "reason", "table_id"]
     version = 5
     type = 11
 
@@ -11055,48 +9993,26 @@ class flow_removed(message):
             self.match = ofp.match()
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!Q", self.cookie))
-        packed.append(struct.pack("!H", self.priority))
-        packed.append(struct.pack("!B", self.reason))
-        packed.append(struct.pack("!B", self.table_id))
-        packed.append(struct.pack("!L", self.duration_sec))
-        packed.append(struct.pack("!L", self.duration_nsec))
-        packed.append(struct.pack("!H", self.idle_timeout))
-        packed.append(struct.pack("!H", self.hard_timeout))
-        packed.append(struct.pack("!Q", self.packet_count))
-        packed.append(struct.pack("!Q", self.byte_count))
-        packed.append(self.match.pack())
-        length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_BBHLQHBBLLHHQQ, buf, offset, self.version, self.type, 0, self.xid, self.cookie, self.priority, self.reason, self.table_id, self.duration_sec, self.duration_nsec, self.idle_timeout, self.hard_timeout, self.packet_count, self.byte_count)
+        offset = self.match.pack_into(buf, offset)
+        length = offset - start
+        _struct_H.pack_into(buf, start + 2, length)
+        return offset
+
+    def wire_length(self):
+        return 48 + self.match.wire_length()
 
     @staticmethod
     def unpack(reader):
         obj = flow_removed()
-        _version = reader.read("!B")[0]
+        _version, _type, _length = reader.read_struct(_struct_BBH)
         assert(_version == 5)
-        _type = reader.read("!B")[0]
         assert(_type == 11)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        obj.cookie = reader.read("!Q")[0]
-        obj.priority = reader.read("!H")[0]
-        obj.reason = reader.read("!B")[0]
-        obj.table_id = reader.read("!B")[0]
-        obj.duration_sec = reader.read("!L")[0]
-        obj.duration_nsec = reader.read("!L")[0]
-        obj.idle_timeout = reader.read("!H")[0]
-        obj.hard_timeout = reader.read("!H")[0]
-        obj.packet_count = reader.read("!Q")[0]
-        obj.byte_count = reader.read("!Q")[0]
+        obj.xid, obj.cookie, obj.priority, obj.reason, obj.table_id, obj.duration_sec, obj.duration_nsec, obj.idle_timeout, obj.hard_timeout, obj.packet_count, obj.byte_count = reader.read_struct(_struct_LQHBBLLHHQQ)
         obj.match = ofp.match.unpack(reader)
         return obj
 
@@ -11165,6 +10081,7 @@ class flow_removed(message):
 message.subtypes[11] = flow_removed
 
 class flow_stats_reply(stats_reply):
+    __slots__ = ["entries"]
     version = 5
     type = 19
     stats_type = 1
@@ -11184,35 +10101,27 @@ class flow_stats_reply(stats_reply):
             self.entries = []
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!H", self.stats_type))
-        packed.append(struct.pack("!H", self.flags))
-        packed.append('\x00' * 4)
-        packed.append(loxi.generic_util.pack_list(self.entries))
-        length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_BBHLHH4x, buf, offset, self.version, self.type, 0, self.xid, self.stats_type, self.flags)
+        offset = loxi.generic_util.pack_list_into(self.entries, buf, offset)
+        length = offset - start
+        _struct_H.pack_into(buf, start + 2, length)
+        return offset
+
+    def wire_length(self):
+        return 16 + loxi.generic_util.list_wire_length(self.entries)
 
     @staticmethod
     def unpack(reader):
         obj = flow_stats_reply()
-        _version = reader.read("!B")[0]
+        _version, _type, _length = reader.read_struct(_struct_BBH)
         assert(_version == 5)
-        _type = reader.read("!B")[0]
         assert(_type == 19)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        _stats_type = reader.read("!H")[0]
+        obj.xid, _stats_type, obj.flags = reader.read_struct(_struct_LHH4x)
         assert(_stats_type == 1)
-        obj.flags = reader.read("!H")[0]
-        reader.skip(4)
         obj.entries = loxi.generic_util.unpack_list(reader, ofp.common.flow_stats_entry.unpack)
         return obj
 
@@ -11245,6 +10154,7 @@ class flow_stats_reply(stats_reply):
 stats_reply.subtypes[1] = flow_stats_reply
 
 class flow_stats_request(stats_request):
+    __slots__ = ["cookie", "cookie_mask", "match", "out_group", "out_port", "table_id"]
     version = 5
     type = 18
     stats_type = 1
@@ -11284,49 +10194,27 @@ class flow_stats_request(stats_request):
             self.match = ofp.match()
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!H", self.stats_type))
-        packed.append(struct.pack("!H", self.flags))
-        packed.append('\x00' * 4)
-        packed.append(struct.pack("!B", self.table_id))
-        packed.append('\x00' * 3)
-        packed.append(util.pack_port_no(self.out_port))
-        packed.append(struct.pack("!L", self.out_group))
-        packed.append('\x00' * 4)
-        packed.append(struct.pack("!Q", self.cookie))
-        packed.append(struct.pack("!Q", self.cookie_mask))
-        packed.append(self.match.pack())
-        length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_BBHLHH4xB3xLL4xQQ, buf, offset, self.version, self.type, 0, self.xid, self.stats_type, self.flags, self.table_id, self.out_port, self.out_group, self.cookie, self.cookie_mask)
+        offset = self.match.pack_into(buf, offset)
+        length = offset - start
+        _struct_H.pack_into(buf, start + 2, length)
+        return offset
+
+    def wire_length(self):
+        return 48 + self.match.wire_length()
 
     @staticmethod
     def unpack(reader):
         obj = flow_stats_request()
-        _version = reader.read("!B")[0]
+        _version, _type, _length = reader.read_struct(_struct_BBH)
         assert(_version == 5)
-        _type = reader.read("!B")[0]
         assert(_type == 18)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        _stats_type = reader.read("!H")[0]
+        obj.xid, _stats_type, obj.flags, obj.table_id, obj.out_port, obj.out_group, obj.cookie, obj.cookie_mask = reader.read_struct(_struct_LHH4xB3xLL4xQQ)
         assert(_stats_type == 1)
-        obj.flags = reader.read("!H")[0]
-        reader.skip(4)
-        obj.table_id = reader.read("!B")[0]
-        reader.skip(3)
-        obj.out_port = util.unpack_port_no(reader)
-        obj.out_group = reader.read("!L")[0]
-        reader.skip(4)
-        obj.cookie = reader.read("!Q")[0]
-        obj.cookie_mask = reader.read("!Q")[0]
         obj.match = ofp.match.unpack(reader)
         return obj
 
@@ -11379,6 +10267,7 @@ class flow_stats_request(stats_request):
 stats_request.subtypes[1] = flow_stats_request
 
 class get_config_reply(message):
+    __slots__ = ["flags", "miss_send_len"]
     version = 5
     type = 8
 
@@ -11397,31 +10286,25 @@ class get_config_reply(message):
             self.miss_send_len = 0
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!H", self.flags))
-        packed.append(struct.pack("!H", self.miss_send_len))
-        length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_BBHLHH, buf, offset, self.version, self.type, 0, self.xid, self.flags, self.miss_send_len)
+        length = offset - start
+        _struct_H.pack_into(buf, start + 2, length)
+        return offset
+
+    def wire_length(self):
+        return 12
 
     @staticmethod
     def unpack(reader):
         obj = get_config_reply()
-        _version = reader.read("!B")[0]
+        _version, _type, _length = reader.read_struct(_struct_BBH)
         assert(_version == 5)
-        _type = reader.read("!B")[0]
         assert(_type == 8)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        obj.flags = reader.read("!H")[0]
-        obj.miss_send_len = reader.read("!H")[0]
+        obj.xid, obj.flags, obj.miss_send_len = reader.read_struct(_struct_LHH)
         return obj
 
     def __eq__(self, other):
@@ -11453,6 +10336,7 @@ class get_config_reply(message):
 message.subtypes[8] = get_config_reply
 
 class get_config_request(message):
+    __slots__ = []
     version = 5
     type = 7
 
@@ -11463,24 +10347,22 @@ class get_config_request(message):
             self.xid = None
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_BBHL, buf, offset, self.version, self.type, 0, self.xid)
+        length = offset - start
+        _struct_H.pack_into(buf, start + 2, length)
+        return offset
+
+    def wire_length(self):
+        return 8
 
     @staticmethod
     def unpack(reader):
         obj = get_config_request()
-        _version = reader.read("!B")[0]
+        _version, _type, _length = reader.read_struct(_struct_BBH)
         assert(_version == 5)
-        _type = reader.read("!B")[0]
         assert(_type == 7)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
         obj.xid = reader.read("!L")[0]
@@ -11507,6 +10389,7 @@ class get_config_request(message):
 message.subtypes[7] = get_config_request
 
 class group_mod(message):
+    __slots__ = ["buckets", "command", "group_id", "group_type"]
     subtypes = {}
 
     version = 5
@@ -11535,20 +10418,16 @@ class group_mod(message):
             self.buckets = []
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!H", self.command))
-        packed.append(struct.pack("!B", self.group_type))
-        packed.append('\x00' * 1)
-        packed.append(struct.pack("!L", self.group_id))
-        packed.append(loxi.generic_util.pack_list(self.buckets))
-        length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_BBHLHBxL, buf, offset, self.version, self.type, 0, self.xid, self.command, self.group_type, self.group_id)
+        offset = loxi.generic_util.pack_list_into(self.buckets, buf, offset)
+        length = offset - start
+        _struct_H.pack_into(buf, start + 2, length)
+        return offset
+
+    def wire_length(self):
+        return 16 + loxi.generic_util.list_wire_length(self.buckets)
 
     @staticmethod
     def unpack(reader):
@@ -11558,18 +10437,12 @@ class group_mod(message):
             return subclass.unpack(reader)
 
         obj = group_mod()
-        _version = reader.read("!B")[0]
+        _version, _type, _length = reader.read_struct(_struct_BBH)
         assert(_version == 5)
-        _type = reader.read("!B")[0]
         assert(_type == 15)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        obj.command = reader.read("!H")[0]
-        obj.group_type = reader.read("!B")[0]
-        reader.skip(1)
-        obj.group_id = reader.read("!L")[0]
+        obj.xid, obj.command, obj.group_type, obj.group_id = reader.read_struct(_struct_LHBxL)
         obj.buckets = loxi.generic_util.unpack_list(reader, ofp.common.bucket.unpack)
         return obj
 
@@ -11607,6 +10480,7 @@ class group_mod(message):
 message.subtypes[15] = group_mod
 
 class group_add(group_mod):
+    __slots__ = []
     version = 5
     type = 15
     command = 0
@@ -11630,37 +10504,27 @@ class group_add(group_mod):
             self.buckets = []
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!H", self.command))
-        packed.append(struct.pack("!B", self.group_type))
-        packed.append('\x00' * 1)
-        packed.append(struct.pack("!L", self.group_id))
-        packed.append(loxi.generic_util.pack_list(self.buckets))
-        length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_BBHLHBxL, buf, offset, self.version, self.type, 0, self.xid, self.command, self.group_type, self.group_id)
+        offset = loxi.generic_util.pack_list_into(self.buckets, buf, offset)
+        length = offset - start
+        _struct_H.pack_into(buf, start + 2, length)
+        return offset
+
+    def wire_length(self):
+        return 16 + loxi.generic_util.list_wire_length(self.buckets)
 
     @staticmethod
     def unpack(reader):
         obj = group_add()
-        _version = reader.read("!B")[0]
+        _version, _type, _length = reader.read_struct(_struct_BBH)
         assert(_version == 5)
-        _type = reader.read("!B")[0]
         assert(_type == 15)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        _command = reader.read("!H")[0]
+        obj.xid, _command, obj.group_type, obj.group_id = reader.read_struct(_struct_LHBxL)
         assert(_command == 0)
-        obj.group_type = reader.read("!B")[0]
-        reader.skip(1)
-        obj.group_id = reader.read("!L")[0]
         obj.buckets = loxi.generic_util.unpack_list(reader, ofp.common.bucket.unpack)
         return obj
 
@@ -11697,6 +10561,7 @@ class group_add(group_mod):
 group_mod.subtypes[0] = group_add
 
 class group_delete(group_mod):
+    __slots__ = []
     version = 5
     type = 15
     command = 2
@@ -11720,37 +10585,27 @@ class group_delete(group_mod):
             self.buckets = []
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!H", self.command))
-        packed.append(struct.pack("!B", self.group_type))
-        packed.append('\x00' * 1)
-        packed.append(struct.pack("!L", self.group_id))
-        packed.append(loxi.generic_util.pack_list(self.buckets))
-        length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_BBHLHBxL, buf, offset, self.version, self.type, 0, self.xid, self.command, self.group_type, self.group_id)
+        offset = loxi.generic_util.pack_list_into(self.buckets, buf, offset)
+        length = offset - start
+        _struct_H.pack_into(buf, start + 2, length)
+        return offset
+
+    def wire_length(self):
+        return 16 + loxi.generic_util.list_wire_length(self.buckets)
 
     @staticmethod
     def unpack(reader):
         obj = group_delete()
-        _version = reader.read("!B")[0]
+        _version, _type, _length = reader.read_struct(_struct_BBH)
         assert(_version == 5)
-        _type = reader.read("!B")[0]
         assert(_type == 15)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        _command = reader.read("!H")[0]
+        obj.xid, _command, obj.group_type, obj.group_id = reader.read_struct(_struct_LHBxL)
         assert(_command == 2)
-        obj.group_type = reader.read("!B")[0]
-        reader.skip(1)
-        obj.group_id = reader.read("!L")[0]
         obj.buckets = loxi.generic_util.unpack_list(reader, ofp.common.bucket.unpack)
         return obj
 
@@ -11787,6 +10642,7 @@ class group_delete(group_mod):
 group_mod.subtypes[2] = group_delete
 
 class group_desc_stats_reply(stats_reply):
+    __slots__ = ["entries"]
     version = 5
     type = 19
     stats_type = 7
@@ -11806,35 +10662,27 @@ class group_desc_stats_reply(stats_reply):
             self.entries = []
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!H", self.stats_type))
-        packed.append(struct.pack("!H", self.flags))
-        packed.append('\x00' * 4)
-        packed.append(loxi.generic_util.pack_list(self.entries))
-        length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_BBHLHH4x, buf, offset, self.version, self.type, 0, self.xid, self.stats_type, self.flags)
+        offset = loxi.generic_util.pack_list_into(self.entries, buf, offset)
+        length = offset - start
+        _struct_H.pack_into(buf, start + 2, length)
+        return offset
+
+    def wire_length(self):
+        return 16 + loxi.generic_util.list_wire_length(self.entries)
 
     @staticmethod
     def unpack(reader):
         obj = group_desc_stats_reply()
-        _version = reader.read("!B")[0]
+        _version, _type, _length = reader.read_struct(_struct_BBH)
         assert(_version == 5)
-        _type = reader.read("!B")[0]
         assert(_type == 19)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        _stats_type = reader.read("!H")[0]
+        obj.xid, _stats_type, obj.flags = reader.read_struct(_struct_LHH4x)
         assert(_stats_type == 7)
-        obj.flags = reader.read("!H")[0]
-        reader.skip(4)
         obj.entries = loxi.generic_util.unpack_list(reader, ofp.common.group_desc_stats_entry.unpack)
         return obj
 
@@ -11867,6 +10715,7 @@ class group_desc_stats_reply(stats_reply):
 stats_reply.subtypes[7] = group_desc_stats_reply
 
 class group_desc_stats_request(stats_request):
+    __slots__ = []
     version = 5
     type = 18
     stats_type = 7
@@ -11882,34 +10731,26 @@ class group_desc_stats_request(stats_request):
             self.flags = 0
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!H", self.stats_type))
-        packed.append(struct.pack("!H", self.flags))
-        packed.append('\x00' * 4)
-        length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_BBHLHH4x, buf, offset, self.version, self.type, 0, self.xid, self.stats_type, self.flags)
+        length = offset - start
+        _struct_H.pack_into(buf, start + 2, length)
+        return offset
+
+    def wire_length(self):
+        return 16
 
     @staticmethod
     def unpack(reader):
         obj = group_desc_stats_request()
-        _version = reader.read("!B")[0]
+        _version, _type, _length = reader.read_struct(_struct_BBH)
         assert(_version == 5)
-        _type = reader.read("!B")[0]
         assert(_type == 18)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        _stats_type = reader.read("!H")[0]
+        obj.xid, _stats_type, obj.flags = reader.read_struct(_struct_LHH4x)
         assert(_stats_type == 7)
-        obj.flags = reader.read("!H")[0]
-        reader.skip(4)
         return obj
 
     def __eq__(self, other):
@@ -11937,6 +10778,7 @@ class group_desc_stats_request(stats_request):
 stats_request.subtypes[7] = group_desc_stats_request
 
 class group_features_stats_reply(stats_reply):
+    __slots__ = ["actions_all", "actions_ff", "actions_indirect", "actions_select", "capabilities", "max_groups_all", "max_groups_ff", "max_groups_indirect", "max_groups_select", "types"]
     version = 5
     type = 19
     stats_type = 8
@@ -11992,54 +10834,26 @@ class group_features_stats_reply(stats_reply):
             self.actions_ff = 0
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!H", self.stats_type))
-        packed.append(struct.pack("!H", self.flags))
-        packed.append('\x00' * 4)
-        packed.append(struct.pack("!L", self.types))
-        packed.append(struct.pack("!L", self.capabilities))
-        packed.append(struct.pack("!L", self.max_groups_all))
-        packed.append(struct.pack("!L", self.max_groups_select))
-        packed.append(struct.pack("!L", self.max_groups_indirect))
-        packed.append(struct.pack("!L", self.max_groups_ff))
-        packed.append(struct.pack("!L", self.actions_all))
-        packed.append(struct.pack("!L", self.actions_select))
-        packed.append(struct.pack("!L", self.actions_indirect))
-        packed.append(struct.pack("!L", self.actions_ff))
-        length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_BBHLHH4xLLLLLLLLLL, buf, offset, self.version, self.type, 0, self.xid, self.stats_type, self.flags, self.types, self.capabilities, self.max_groups_all, self.max_groups_select, self.max_groups_indirect, self.max_groups_ff, self.actions_all, self.actions_select, self.actions_indirect, self.actions_ff)
+        length = offset - start
+        _struct_H.pack_into(buf, start + 2, length)
+        return offset
+
+    def wire_length(self):
+        return 56
 
     @staticmethod
     def unpack(reader):
         obj = group_features_stats_reply()
-        _version = reader.read("!B")[0]
+        _version, _type, _length = reader.read_struct(_struct_BBH)
         assert(_version == 5)
-        _type = reader.read("!B")[0]
         assert(_type == 19)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        _stats_type = reader.read("!H")[0]
+        obj.xid, _stats_type, obj.flags, obj.types, obj.capabilities, obj.max_groups_all, obj.max_groups_select, obj.max_groups_indirect, obj.max_groups_ff, obj.actions_all, obj.actions_select, obj.actions_indirect, obj.actions_ff = reader.read_struct(_struct_LHH4xLLLLLLLLLL)
         assert(_stats_type == 8)
-        obj.flags = reader.read("!H")[0]
-        reader.skip(4)
-        obj.types = reader.read("!L")[0]
-        obj.capabilities = reader.read("!L")[0]
-        obj.max_groups_all = reader.read("!L")[0]
-        obj.max_groups_select = reader.read("!L")[0]
-        obj.max_groups_indirect = reader.read("!L")[0]
-        obj.max_groups_ff = reader.read("!L")[0]
-        obj.actions_all = reader.read("!L")[0]
-        obj.actions_select = reader.read("!L")[0]
-        obj.actions_indirect = reader.read("!L")[0]
-        obj.actions_ff = reader.read("!L")[0]
         return obj
 
     def __eq__(self, other):
@@ -12107,6 +10921,7 @@ class group_features_stats_reply(stats_reply):
 stats_reply.subtypes[8] = group_features_stats_reply
 
 class group_features_stats_request(stats_request):
+    __slots__ = []
     version = 5
     type = 18
     stats_type = 8
@@ -12122,34 +10937,26 @@ class group_features_stats_request(stats_request):
             self.flags = 0
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!H", self.stats_type))
-        packed.append(struct.pack("!H", self.flags))
-        packed.append('\x00' * 4)
-        length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_BBHLHH4x, buf, offset, self.version, self.type, 0, self.xid, self.stats_type, self.flags)
+        length = offset - start
+        _struct_H.pack_into(buf, start + 2, length)
+        return offset
+
+    def wire_length(self):
+        return 16
 
     @staticmethod
     def unpack(reader):
         obj = group_features_stats_request()
-        _version = reader.read("!B")[0]
+        _version, _type, _length = reader.read_struct(_struct_BBH)
         assert(_version == 5)
-        _type = reader.read("!B")[0]
         assert(_type == 18)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        _stats_type = reader.read("!H")[0]
+        obj.xid, _stats_type, obj.flags = reader.read_struct(_struct_LHH4x)
         assert(_stats_type == 8)
-        obj.flags = reader.read("!H")[0]
-        reader.skip(4)
         return obj
 
     def __eq__(self, other):
@@ -12177,6 +10984,7 @@ class group_features_stats_request(stats_request):
 stats_request.subtypes[8] = group_features_stats_request
 
 class group_mod_failed_error_msg(error_msg):
+    __slots__ = ["code", "data"]
     version = 5
     type = 1
     err_type = 6
@@ -12196,34 +11004,28 @@ class group_mod_failed_error_msg(error_msg):
             self.data = ''
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!H", self.err_type))
-        packed.append(struct.pack("!H", self.code))
-        packed.append(self.data)
-        length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_BBHLHH, buf, offset, self.version, self.type, 0, self.xid, self.err_type, self.code)
+        offset = loxi.generic_util.pack_bytes_into(self.data, buf, offset)
+        length = offset - start
+        _struct_H.pack_into(buf, start + 2, length)
+        return offset
+
+    def wire_length(self):
+        return 12 + len(self.data)
 
     @staticmethod
     def unpack(reader):
         obj = group_mod_failed_error_msg()
-        _version = reader.read("!B")[0]
+        _version, _type, _length = reader.read_struct(_struct_BBH)
         assert(_version == 5)
-        _type = reader.read("!B")[0]
         assert(_type == 1)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        _err_type = reader.read("!H")[0]
+        obj.xid, _err_type, obj.code = reader.read_struct(_struct_LHH)
         assert(_err_type == 6)
-        obj.code = reader.read("!H")[0]
-        obj.data = str(reader.read_all())
+        obj.data = reader.read_all()
         return obj
 
     def __eq__(self, other):
@@ -12255,6 +11057,7 @@ class group_mod_failed_error_msg(error_msg):
 error_msg.subtypes[6] = group_mod_failed_error_msg
 
 class group_modify(group_mod):
+    __slots__ = []
     version = 5
     type = 15
     command = 1
@@ -12278,37 +11081,27 @@ class group_modify(group_mod):
             self.buckets = []
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!H", self.command))
-        packed.append(struct.pack("!B", self.group_type))
-        packed.append('\x00' * 1)
-        packed.append(struct.pack("!L", self.group_id))
-        packed.append(loxi.generic_util.pack_list(self.buckets))
-        length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_BBHLHBxL, buf, offset, self.version, self.type, 0, self.xid, self.command, self.group_type, self.group_id)
+        offset = loxi.generic_util.pack_list_into(self.buckets, buf, offset)
+        length = offset - start
+        _struct_H.pack_into(buf, start + 2, length)
+        return offset
+
+    def wire_length(self):
+        return 16 + loxi.generic_util.list_wire_length(self.buckets)
 
     @staticmethod
     def unpack(reader):
         obj = group_modify()
-        _version = reader.read("!B")[0]
+        _version, _type, _length = reader.read_struct(_struct_BBH)
         assert(_version == 5)
-        _type = reader.read("!B")[0]
         assert(_type == 15)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        _command = reader.read("!H")[0]
+        obj.xid, _command, obj.group_type, obj.group_id = reader.read_struct(_struct_LHBxL)
         assert(_command == 1)
-        obj.group_type = reader.read("!B")[0]
-        reader.skip(1)
-        obj.group_id = reader.read("!L")[0]
         obj.buckets = loxi.generic_util.unpack_list(reader, ofp.common.bucket.unpack)
         return obj
 
@@ -12345,6 +11138,7 @@ class group_modify(group_mod):
 group_mod.subtypes[1] = group_modify
 
 class group_stats_reply(stats_reply):
+    __slots__ = ["entries"]
     version = 5
     type = 19
     stats_type = 6
@@ -12364,35 +11158,27 @@ class group_stats_reply(stats_reply):
             self.entries = []
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!H", self.stats_type))
-        packed.append(struct.pack("!H", self.flags))
-        packed.append('\x00' * 4)
-        packed.append(loxi.generic_util.pack_list(self.entries))
-        length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_BBHLHH4x, buf, offset, self.version, self.type, 0, self.xid, self.stats_type, self.flags)
+        offset = loxi.generic_util.pack_list_into(self.entries, buf, offset)
+        length = offset - start
+        _struct_H.pack_into(buf, start + 2, length)
+        return offset
+
+    def wire_length(self):
+        return 16 + loxi.generic_util.list_wire_length(self.entries)
 
     @staticmethod
     def unpack(reader):
         obj = group_stats_reply()
-        _version = reader.read("!B")[0]
+        _version, _type, _length = reader.read_struct(_struct_BBH)
         assert(_version == 5)
-        _type = reader.read("!B")[0]
         assert(_type == 19)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        _stats_type = reader.read("!H")[0]
+        obj.xid, _stats_type, obj.flags = reader.read_struct(_struct_LHH4x)
         assert(_stats_type == 6)
-        obj.flags = reader.read("!H")[0]
-        reader.skip(4)
         obj.entries = loxi.generic_util.unpack_list(reader, ofp.common.group_stats_entry.unpack)
         return obj
 
@@ -12425,6 +11211,7 @@ class group_stats_reply(stats_reply):
 stats_reply.subtypes[6] = group_stats_reply
 
 class group_stats_request(stats_request):
+    __slots__ = ["group_id"]
     version = 5
     type = 18
     stats_type = 6
@@ -12444,38 +11231,26 @@ class group_stats_request(stats_request):
             self.group_id = 0
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!H", self.stats_type))
-        packed.append(struct.pack("!H", self.flags))
-        packed.append('\x00' * 4)
-        packed.append(struct.pack("!L", self.group_id))
-        packed.append('\x00' * 4)
-        length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_BBHLHH4xL4x, buf, offset, self.version, self.type, 0, self.xid, self.stats_type, self.flags, self.group_id)
+        length = offset - start
+        _struct_H.pack_into(buf, start + 2, length)
+        return offset
+
+    def wire_length(self):
+        return 24
 
     @staticmethod
     def unpack(reader):
         obj = group_stats_request()
-        _version = reader.read("!B")[0]
+        _version, _type, _length = reader.read_struct(_struct_BBH)
         assert(_version == 5)
-        _type = reader.read("!B")[0]
         assert(_type == 18)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        _stats_type = reader.read("!H")[0]
+        obj.xid, _stats_type, obj.flags, obj.group_id = reader.read_struct(_struct_LHH4xL4x)
         assert(_stats_type == 6)
-        obj.flags = reader.read("!H")[0]
-        reader.skip(4)
-        obj.group_id = reader.read("!L")[0]
-        reader.skip(4)
         return obj
 
     def __eq__(self, other):
@@ -12507,6 +11282,7 @@ class group_stats_request(stats_request):
 stats_request.subtypes[6] = group_stats_request
 
 class hello(message):
+    __slots__ = ["elements"]
     version = 5
     type = 0
 
@@ -12521,25 +11297,23 @@ class hello(message):
             self.elements = []
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(loxi.generic_util.pack_list(self.elements))
-        length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_BBHL, buf, offset, self.version, self.type, 0, self.xid)
+        offset = loxi.generic_util.pack_list_into(self.elements, buf, offset)
+        length = offset - start
+        _struct_H.pack_into(buf, start + 2, length)
+        return offset
+
+    def wire_length(self):
+        return 8 + loxi.generic_util.list_wire_length(self.elements)
 
     @staticmethod
     def unpack(reader):
         obj = hello()
-        _version = reader.read("!B")[0]
+        _version, _type, _length = reader.read_struct(_struct_BBH)
         assert(_version == 5)
-        _type = reader.read("!B")[0]
         assert(_type == 0)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
         obj.xid = reader.read("!L")[0]
@@ -12571,6 +11345,7 @@ class hello(message):
 message.subtypes[0] = hello
 
 class hello_failed_error_msg(error_msg):
+    __slots__ = ["code", "data"]
     version = 5
     type = 1
     err_type = 0
@@ -12590,34 +11365,28 @@ class hello_failed_error_msg(error_msg):
             self.data = ''
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!H", self.err_type))
-        packed.append(struct.pack("!H", self.code))
-        packed.append(self.data)
-        length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_BBHLHH, buf, offset, self.version, self.type, 0, self.xid, self.err_type, self.code)
+        offset = loxi.generic_util.pack_bytes_into(self.data, buf, offset)
+        length = offset - start
+        _struct_H.pack_into(buf, start + 2, length)
+        return offset
+
+    def wire_length(self):
+        return 12 + len(self.data)
 
     @staticmethod
     def unpack(reader):
         obj = hello_failed_error_msg()
-        _version = reader.read("!B")[0]
+        _version, _type, _length = reader.read_struct(_struct_BBH)
         assert(_version == 5)
-        _type = reader.read("!B")[0]
         assert(_type == 1)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        _err_type = reader.read("!H")[0]
+        obj.xid, _err_type, obj.code = reader.read_struct(_struct_LHH)
         assert(_err_type == 0)
-        obj.code = reader.read("!H")[0]
-        obj.data = str(reader.read_all())
+        obj.data = reader.read_all()
         return obj
 
     def __eq__(self, other):
@@ -12649,6 +11418,7 @@ class hello_failed_error_msg(error_msg):
 error_msg.subtypes[0] = hello_failed_error_msg
 
 class meter_config_stats_reply(stats_reply):
+    __slots__ = ["entries"]
     version = 5
     type = 19
     stats_type = 10
@@ -12668,35 +11438,27 @@ class meter_config_stats_reply(stats_reply):
             self.entries = []
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!H", self.stats_type))
-        packed.append(struct.pack("!H", self.flags))
-        packed.append('\x00' * 4)
-        packed.append(loxi.generic_util.pack_list(self.entries))
-        length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_BBHLHH4x, buf, offset, self.version, self.type, 0, self.xid, self.stats_type, self.flags)
+        offset = loxi.generic_util.pack_list_into(self.entries, buf, offset)
+        length = offset - start
+        _struct_H.pack_into(buf, start + 2, length)
+        return offset
+
+    def wire_length(self):
+        return 16 + loxi.generic_util.list_wire_length(self.entries)
 
     @staticmethod
     def unpack(reader):
         obj = meter_config_stats_reply()
-        _version = reader.read("!B")[0]
+        _version, _type, _length = reader.read_struct(_struct_BBH)
         assert(_version == 5)
-        _type = reader.read("!B")[0]
         assert(_type == 19)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        _stats_type = reader.read("!H")[0]
+        obj.xid, _stats_type, obj.flags = reader.read_struct(_struct_LHH4x)
         assert(_stats_type == 10)
-        obj.flags = reader.read("!H")[0]
-        reader.skip(4)
         obj.entries = loxi.generic_util.unpack_list(reader, ofp.meter_band.meter_band.unpack)
         return obj
 
@@ -12729,6 +11491,7 @@ class meter_config_stats_reply(stats_reply):
 stats_reply.subtypes[10] = meter_config_stats_reply
 
 class meter_config_stats_request(stats_request):
+    __slots__ = ["meter_id"]
     version = 5
     type = 18
     stats_type = 10
@@ -12748,38 +11511,26 @@ class meter_config_stats_request(stats_request):
             self.meter_id = 0
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!H", self.stats_type))
-        packed.append(struct.pack("!H", self.flags))
-        packed.append('\x00' * 4)
-        packed.append(struct.pack("!L", self.meter_id))
-        packed.append('\x00' * 4)
-        length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_BBHLHH4xL4x, buf, offset, self.version, self.type, 0, self.xid, self.stats_type, self.flags, self.meter_id)
+        length = offset - start
+        _struct_H.pack_into(buf, start + 2, length)
+        return offset
+
+    def wire_length(self):
+        return 24
 
     @staticmethod
     def unpack(reader):
         obj = meter_config_stats_request()
-        _version = reader.read("!B")[0]
+        _version, _type, _length = reader.read_struct(_struct_BBH)
         assert(_version == 5)
-        _type = reader.read("!B")[0]
         assert(_type == 18)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        _stats_type = reader.read("!H")[0]
+        obj.xid, _stats_type, obj.flags, obj.meter_id = reader.read_struct(_struct_LHH4xL4x)
         assert(_stats_type == 10)
-        obj.flags = reader.read("!H")[0]
-        reader.skip(4)
-        obj.meter_id = reader.read("!L")[0]
-        reader.skip(4)
         return obj
 
     def __eq__(self, other):
@@ -12811,6 +11562,7 @@ class meter_config_stats_request(stats_request):
 stats_request.subtypes[10] = meter_config_stats_request
 
 class meter_features_stats_reply(stats_reply):
+    __slots__ = ["features"]
     version = 5
     type = 19
     stats_type = 11
@@ -12830,35 +11582,27 @@ class meter_features_stats_reply(stats_reply):
             self.features = ofp.meter_features()
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!H", self.stats_type))
-        packed.append(struct.pack("!H", self.flags))
-        packed.append('\x00' * 4)
-        packed.append(self.features.pack())
-        length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_BBHLHH4x, buf, offset, self.version, self.type, 0, self.xid, self.stats_type, self.flags)
+        offset = self.features.pack_into(buf, offset)
+        length = offset - start
+        _struct_H.pack_into(buf, start + 2, length)
+        return offset
+
+    def wire_length(self):
+        return 16 + self.features.wire_length()
 
     @staticmethod
     def unpack(reader):
         obj = meter_features_stats_reply()
-        _version = reader.read("!B")[0]
+        _version, _type, _length = reader.read_struct(_struct_BBH)
         assert(_version == 5)
-        _type = reader.read("!B")[0]
         assert(_type == 19)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        _stats_type = reader.read("!H")[0]
+        obj.xid, _stats_type, obj.flags = reader.read_struct(_struct_LHH4x)
         assert(_stats_type == 11)
-        obj.flags = reader.read("!H")[0]
-        reader.skip(4)
         obj.features = ofp.meter_features.unpack(reader)
         return obj
 
@@ -12891,6 +11635,7 @@ class meter_features_stats_reply(stats_reply):
 stats_reply.subtypes[11] = meter_features_stats_reply
 
 class meter_features_stats_request(stats_request):
+    __slots__ = []
     version = 5
     type = 18
     stats_type = 11
@@ -12906,34 +11651,26 @@ class meter_features_stats_request(stats_request):
             self.flags = 0
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!H", self.stats_type))
-        packed.append(struct.pack("!H", self.flags))
-        packed.append('\x00' * 4)
-        length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_BBHLHH4x, buf, offset, self.version, self.type, 0, self.xid, self.stats_type, self.flags)
+        length = offset - start
+        _struct_H.pack_into(buf, start + 2, length)
+        return offset
+
+    def wire_length(self):
+        return 16
 
     @staticmethod
     def unpack(reader):
         obj = meter_features_stats_request()
-        _version = reader.read("!B")[0]
+        _version, _type, _length = reader.read_struct(_struct_BBH)
         assert(_version == 5)
-        _type = reader.read("!B")[0]
         assert(_type == 18)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        _stats_type = reader.read("!H")[0]
+        obj.xid, _stats_type, obj.flags = reader.read_struct(_struct_LHH4x)
         assert(_stats_type == 11)
-        obj.flags = reader.read("!H")[0]
-        reader.skip(4)
         return obj
 
     def __eq__(self, other):
@@ -12961,6 +11698,7 @@ class meter_features_stats_request(stats_request):
 stats_request.subtypes[11] = meter_features_stats_request
 
 class meter_mod(message):
+    __slots__ = ["bands", "command", "flags", "meter_id"]
     version = 5
     type = 29
 
@@ -12987,34 +11725,26 @@ class meter_mod(message):
             self.bands = []
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!H", self.command))
-        packed.append(struct.pack("!H", self.flags))
-        packed.append(struct.pack("!L", self.meter_id))
-        packed.append(loxi.generic_util.pack_list(self.bands))
-        length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_BBHLHHL, buf, offset, self.version, self.type, 0, self.xid, self.command, self.flags, self.meter_id)
+        offset = loxi.generic_util.pack_list_into(self.bands, buf, offset)
+        length = offset - start
+        _struct_H.pack_into(buf, start + 2, length)
+        return offset
+
+    def wire_length(self):
+        return 16 + loxi.generic_util.list_wire_length(self.bands)
 
     @staticmethod
     def unpack(reader):
         obj = meter_mod()
-        _version = reader.read("!B")[0]
+        _version, _type, _length = reader.read_struct(_struct_BBH)
         assert(_version == 5)
-        _type = reader.read("!B")[0]
         assert(_type == 29)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        obj.command = reader.read("!H")[0]
-        obj.flags = reader.read("!H")[0]
-        obj.meter_id = reader.read("!L")[0]
+        obj.xid, obj.command, obj.flags, obj.meter_id = reader.read_struct(_struct_LHHL)
         obj.bands = loxi.generic_util.unpack_list(reader, ofp.meter_band.meter_band.unpack)
         return obj
 
@@ -13055,6 +11785,7 @@ class meter_mod(message):
 message.subtypes[29] = meter_mod
 
 class meter_mod_failed_error_msg(error_msg):
+    __slots__ = ["code", "data"]
     version = 5
     type = 1
     err_type = 12
@@ -13074,34 +11805,28 @@ class meter_mod_failed_error_msg(error_msg):
             self.data = ''
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!H", self.err_type))
-        packed.append(struct.pack("!H", self.code))
-        packed.append(self.data)
-        length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_BBHLHH, buf, offset, self.version, self.type, 0, self.xid, self.err_type, self.code)
+        offset = loxi.generic_util.pack_bytes_into(self.data, buf, offset)
+        length = offset - start
+        _struct_H.pack_into(buf, start + 2, length)
+        return offset
+
+    def wire_length(self):
+        return 12 + len(self.data)
 
     @staticmethod
     def unpack(reader):
         obj = meter_mod_failed_error_msg()
-        _version = reader.read("!B")[0]
+        _version, _type, _length = reader.read_struct(_struct_BBH)
         assert(_version == 5)
-        _type = reader.read("!B")[0]
         assert(_type == 1)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        _err_type = reader.read("!H")[0]
+        obj.xid, _err_type, obj.code = reader.read_struct(_struct_LHH)
         assert(_err_type == 12)
-        obj.code = reader.read("!H")[0]
-        obj.data = str(reader.read_all())
+        obj.data = reader.read_all()
         return obj
 
     def __eq__(self, other):
@@ -13133,6 +11858,7 @@ class meter_mod_failed_error_msg(error_msg):
 error_msg.subtypes[12] = meter_mod_failed_error_msg
 
 class meter_stats_reply(stats_reply):
+    __slots__ = ["entries"]
     version = 5
     type = 19
     stats_type = 9
@@ -13152,35 +11878,27 @@ class meter_stats_reply(stats_reply):
             self.entries = []
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!H", self.stats_type))
-        packed.append(struct.pack("!H", self.flags))
-        packed.append('\x00' * 4)
-        packed.append(loxi.generic_util.pack_list(self.entries))
-        length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_BBHLHH4x, buf, offset, self.version, self.type, 0, self.xid, self.stats_type, self.flags)
+        offset = loxi.generic_util.pack_list_into(self.entries, buf, offset)
+        length = offset - start
+        _struct_H.pack_into(buf, start + 2, length)
+        return offset
+
+    def wire_length(self):
+        return 16 + loxi.generic_util.list_wire_length(self.entries)
 
     @staticmethod
     def unpack(reader):
         obj = meter_stats_reply()
-        _version = reader.read("!B")[0]
+        _version, _type, _length = reader.read_struct(_struct_BBH)
         assert(_version == 5)
-        _type = reader.read("!B")[0]
         assert(_type == 19)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        _stats_type = reader.read("!H")[0]
+        obj.xid, _stats_type, obj.flags = reader.read_struct(_struct_LHH4x)
         assert(_stats_type == 9)
-        obj.flags = reader.read("!H")[0]
-        reader.skip(4)
         obj.entries = loxi.generic_util.unpack_list(reader, ofp.common.meter_stats.unpack)
         return obj
 
@@ -13213,6 +11931,7 @@ class meter_stats_reply(stats_reply):
 stats_reply.subtypes[9] = meter_stats_reply
 
 class meter_stats_request(stats_request):
+    __slots__ = ["meter_id"]
     version = 5
     type = 18
     stats_type = 9
@@ -13232,38 +11951,26 @@ class meter_stats_request(stats_request):
             self.meter_id = 0
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!H", self.stats_type))
-        packed.append(struct.pack("!H", self.flags))
-        packed.append('\x00' * 4)
-        packed.append(struct.pack("!L", self.meter_id))
-        packed.append('\x00' * 4)
-        length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_BBHLHH4xL4x, buf, offset, self.version, self.type, 0, self.xid, self.stats_type, self.flags, self.meter_id)
+        length = offset - start
+        _struct_H.pack_into(buf, start + 2, length)
+        return offset
+
+    def wire_length(self):
+        return 24
 
     @staticmethod
     def unpack(reader):
         obj = meter_stats_request()
-        _version = reader.read("!B")[0]
+        _version, _type, _length = reader.read_struct(_struct_BBH)
         assert(_version == 5)
-        _type = reader.read("!B")[0]
         assert(_type == 18)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        _stats_type = reader.read("!H")[0]
+        obj.xid, _stats_type, obj.flags, obj.meter_id = reader.read_struct(_struct_LHH4xL4x)
         assert(_stats_type == 9)
-        obj.flags = reader.read("!H")[0]
-        reader.skip(4)
-        obj.meter_id = reader.read("!L")[0]
-        reader.skip(4)
         return obj
 
     def __eq__(self, other):
@@ -13295,6 +12002,7 @@ class meter_stats_request(stats_request):
 stats_request.subtypes[9] = meter_stats_request
 
 class nicira_header(experimenter):
+    __slots__ = []
     subtypes = {}
 
     version = 5
@@ -13312,17 +12020,15 @@ class nicira_header(experimenter):
             self.subtype = 0
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!L", self.experimenter))
-        packed.append(struct.pack("!L", self.subtype))
-        length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_BBHLLL, buf, offset, self.version, self.type, 0, self.xid, self.experimenter, self.subtype)
+        length = offset - start
+        _struct_H.pack_into(buf, start + 2, length)
+        return offset
+
+    def wire_length(self):
+        return 16
 
     @staticmethod
     def unpack(reader):
@@ -13332,17 +12038,13 @@ class nicira_header(experimenter):
             return subclass.unpack(reader)
 
         obj = nicira_header()
-        _version = reader.read("!B")[0]
+        _version, _type, _length = reader.read_struct(_struct_BBH)
         assert(_version == 5)
-        _type = reader.read("!B")[0]
         assert(_type == 4)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        _experimenter = reader.read("!L")[0]
+        obj.xid, _experimenter, obj.subtype = reader.read_struct(_struct_LLL)
         assert(_experimenter == 8992)
-        obj.subtype = reader.read("!L")[0]
         return obj
 
     def __eq__(self, other):
@@ -13367,6 +12069,7 @@ class nicira_header(experimenter):
 experimenter.subtypes[8992] = nicira_header
 
 class packet_in(message):
+    __slots__ = ["buffer_id", "cookie", "data", "match", "reason", "table_id", "total_len"]
     version = 5
     type = 10
 
@@ -13405,43 +12108,31 @@ class packet_in(message):
             self.data = ''
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!L", self.buffer_id))
-        packed.append(struct.pack("!H", self.total_len))
-        packed.append(struct.pack("!B", self.reason))
-        packed.append(struct.pack("!B", self.table_id))
-        packed.append(struct.pack("!Q", self.cookie))
-        packed.append(self.match.pack())
-        packed.append('\x00' * 2)
-        packed.append(self.data)
-        length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_BBHLLHBBQ, buf, offset, self.version, self.type, 0, self.xid, self.buffer_id, self.total_len, self.reason, self.table_id, self.cookie)
+        offset = self.match.pack_into(buf, offset)
+        offset = loxi.generic_util.pack_struct_into(_struct_2x, buf, offset, )
+        offset = loxi.generic_util.pack_bytes_into(self.data, buf, offset)
+        length = offset - start
+        _struct_H.pack_into(buf, start + 2, length)
+        return offset
+
+    def wire_length(self):
+        return 26 + self.match.wire_length() + len(self.data)
 
     @staticmethod
     def unpack(reader):
         obj = packet_in()
-        _version = reader.read("!B")[0]
+        _version, _type, _length = reader.read_struct(_struct_BBH)
         assert(_version == 5)
-        _type = reader.read("!B")[0]
         assert(_type == 10)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        obj.buffer_id = reader.read("!L")[0]
-        obj.total_len = reader.read("!H")[0]
-        obj.reason = reader.read("!B")[0]
-        obj.table_id = reader.read("!B")[0]
-        obj.cookie = reader.read("!Q")[0]
+        obj.xid, obj.buffer_id, obj.total_len, obj.reason, obj.table_id, obj.cookie = reader.read_struct(_struct_LLHBBQ)
         obj.match = ofp.match.unpack(reader)
         reader.skip(2)
-        obj.data = str(reader.read_all())
+        obj.data = reader.read_all()
         return obj
 
     def __eq__(self, other):
@@ -13493,6 +12184,7 @@ class packet_in(message):
 message.subtypes[10] = packet_in
 
 class packet_out(message):
+    __slots__ = ["actions", "buffer_id", "data", "in_port"]
     version = 5
     type = 13
 
@@ -13519,40 +12211,31 @@ class packet_out(message):
             self.data = ''
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!L", self.buffer_id))
-        packed.append(util.pack_port_no(self.in_port))
-        packed.append(struct.pack("!H", 0)) # placeholder for actions_len at index 6
-        packed.append('\x00' * 6)
-        packed.append(loxi.generic_util.pack_list(self.actions))
-        packed[6] = struct.pack("!H", len(packed[-1]))
-        packed.append(self.data)
-        length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_BBHLLLH6x, buf, offset, self.version, self.type, 0, self.xid, self.buffer_id, self.in_port, 0)
+        mark = offset
+        offset = loxi.generic_util.pack_list_into(self.actions, buf, offset)
+        _struct_H.pack_into(buf, start + 16, offset - mark)
+        offset = loxi.generic_util.pack_bytes_into(self.data, buf, offset)
+        length = offset - start
+        _struct_H.pack_into(buf, start + 2, length)
+        return offset
+
+    def wire_length(self):
+        return 24 + loxi.generic_util.list_wire_length(self.actions) + len(self.data)
 
     @staticmethod
     def unpack(reader):
         obj = packet_out()
-        _version = reader.read("!B")[0]
+        _version, _type, _length = reader.read_struct(_struct_BBH)
         assert(_version == 5)
-        _type = reader.read("!B")[0]
         assert(_type == 13)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        obj.buffer_id = reader.read("!L")[0]
-        obj.in_port = util.unpack_port_no(reader)
-        _actions_len = reader.read("!H")[0]
-        reader.skip(6)
+        obj.xid, obj.buffer_id, obj.in_port, _actions_len = reader.read_struct(_struct_LLLH6x)
         obj.actions = loxi.generic_util.unpack_list(reader.slice(_actions_len), ofp.action.action.unpack)
-        obj.data = str(reader.read_all())
+        obj.data = reader.read_all()
         return obj
 
     def __eq__(self, other):
@@ -13592,6 +12275,7 @@ class packet_out(message):
 message.subtypes[13] = packet_out
 
 class port_desc_stats_reply(stats_reply):
+    __slots__ = ["entries"]
     version = 5
     type = 19
     stats_type = 13
@@ -13611,35 +12295,27 @@ class port_desc_stats_reply(stats_reply):
             self.entries = []
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!H", self.stats_type))
-        packed.append(struct.pack("!H", self.flags))
-        packed.append('\x00' * 4)
-        packed.append(loxi.generic_util.pack_list(self.entries))
-        length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_BBHLHH4x, buf, offset, self.version, self.type, 0, self.xid, self.stats_type, self.flags)
+        offset = loxi.generic_util.pack_list_into(self.entries, buf, offset)
+        length = offset - start
+        _struct_H.pack_into(buf, start + 2, length)
+        return offset
+
+    def wire_length(self):
+        return 16 + loxi.generic_util.list_wire_length(self.entries)
 
     @staticmethod
     def unpack(reader):
         obj = port_desc_stats_reply()
-        _version = reader.read("!B")[0]
+        _version, _type, _length = reader.read_struct(_struct_BBH)
         assert(_version == 5)
-        _type = reader.read("!B")[0]
         assert(_type == 19)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        _stats_type = reader.read("!H")[0]
+        obj.xid, _stats_type, obj.flags = reader.read_struct(_struct_LHH4x)
         assert(_stats_type == 13)
-        obj.flags = reader.read("!H")[0]
-        reader.skip(4)
         obj.entries = loxi.generic_util.unpack_list(reader, ofp.common.port_desc.unpack)
         return obj
 
@@ -13672,6 +12348,7 @@ class port_desc_stats_reply(stats_reply):
 stats_reply.subtypes[13] = port_desc_stats_reply
 
 class port_desc_stats_request(stats_request):
+    __slots__ = []
     version = 5
     type = 18
     stats_type = 13
@@ -13687,34 +12364,26 @@ class port_desc_stats_request(stats_request):
             self.flags = 0
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!H", self.stats_type))
-        packed.append(struct.pack("!H", self.flags))
-        packed.append('\x00' * 4)
-        length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_BBHLHH4x, buf, offset, self.version, self.type, 0, self.xid, self.stats_type, self.flags)
+        length = offset - start
+        _struct_H.pack_into(buf, start + 2, length)
+        return offset
+
+    def wire_length(self):
+        return 16
 
     @staticmethod
     def unpack(reader):
         obj = port_desc_stats_request()
-        _version = reader.read("!B")[0]
+        _version, _type, _length = reader.read_struct(_struct_BBH)
         assert(_version == 5)
-        _type = reader.read("!B")[0]
         assert(_type == 18)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        _stats_type = reader.read("!H")[0]
+        obj.xid, _stats_type, obj.flags = reader.read_struct(_struct_LHH4x)
         assert(_stats_type == 13)
-        obj.flags = reader.read("!H")[0]
-        reader.skip(4)
         return obj
 
     def __eq__(self, other):
@@ -13742,6 +12411,7 @@ class port_desc_stats_request(stats_request):
 stats_request.subtypes[13] = port_desc_stats_request
 
 class port_mod(message):
+    __slots__ = ["config", "hw_addr", "mask", "port_no", "properties"]
     version = 5
     type = 16
 
@@ -13772,40 +12442,31 @@ class port_mod(message):
             self.properties = []
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(util.pack_port_no(self.port_no))
-        packed.append('\x00' * 4)
-        packed.append(struct.pack("!6B", *self.hw_addr))
-        packed.append('\x00' * 2)
-        packed.append(struct.pack("!L", self.config))
-        packed.append(struct.pack("!L", self.mask))
-        packed.append(loxi.generic_util.pack_list(self.properties))
-        length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_BBHLL4x, buf, offset, self.version, self.type, 0, self.xid, self.port_no)
+        offset = loxi.generic_util.pack_struct_into(_struct_6B, buf, offset, *self.hw_addr)
+        offset = loxi.generic_util.pack_struct_into(_struct_2xLL, buf, offset, self.config, self.mask)
+        offset = loxi.generic_util.pack_list_into(self.properties, buf, offset)
+        length = offset - start
+        _struct_H.pack_into(buf, start + 2, length)
+        return offset
+
+    def wire_length(self):
+        return 32 + loxi.generic_util.list_wire_length(self.properties)
 
     @staticmethod
     def unpack(reader):
         obj = port_mod()
-        _version = reader.read("!B")[0]
+        _version, _type, _length = reader.read_struct(_struct_BBH)
         assert(_version == 5)
-        _type = reader.read("!B")[0]
         assert(_type == 16)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        obj.port_no = util.unpack_port_no(reader)
-        reader.skip(4)
+        obj.xid, obj.port_no = reader.read_struct(_struct_LL4x)
         obj.hw_addr = list(reader.read('!6B'))
         reader.skip(2)
-        obj.config = reader.read("!L")[0]
-        obj.mask = reader.read("!L")[0]
+        obj.config, obj.mask = reader.read_struct(_struct_LL)
         obj.properties = loxi.generic_util.unpack_list(reader, ofp.port_mod_prop.port_mod_prop.unpack)
         return obj
 
@@ -13850,6 +12511,7 @@ class port_mod(message):
 message.subtypes[16] = port_mod
 
 class port_mod_failed_error_msg(error_msg):
+    __slots__ = ["code", "data"]
     version = 5
     type = 1
     err_type = 7
@@ -13869,34 +12531,28 @@ class port_mod_failed_error_msg(error_msg):
             self.data = ''
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!H", self.err_type))
-        packed.append(struct.pack("!H", self.code))
-        packed.append(self.data)
-        length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_BBHLHH, buf, offset, self.version, self.type, 0, self.xid, self.err_type, self.code)
+        offset = loxi.generic_util.pack_bytes_into(self.data, buf, offset)
+        length = offset - start
+        _struct_H.pack_into(buf, start + 2, length)
+        return offset
+
+    def wire_length(self):
+        return 12 + len(self.data)
 
     @staticmethod
     def unpack(reader):
         obj = port_mod_failed_error_msg()
-        _version = reader.read("!B")[0]
+        _version, _type, _length = reader.read_struct(_struct_BBH)
         assert(_version == 5)
-        _type = reader.read("!B")[0]
         assert(_type == 1)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        _err_type = reader.read("!H")[0]
+        obj.xid, _err_type, obj.code = reader.read_struct(_struct_LHH)
         assert(_err_type == 7)
-        obj.code = reader.read("!H")[0]
-        obj.data = str(reader.read_all())
+        obj.data = reader.read_all()
         return obj
 
     def __eq__(self, other):
@@ -13928,6 +12584,7 @@ class port_mod_failed_error_msg(error_msg):
 error_msg.subtypes[7] = port_mod_failed_error_msg
 
 class port_stats_reply(stats_reply):
+    __slots__ = ["entries"]
     version = 5
     type = 19
     stats_type = 4
@@ -13947,35 +12604,27 @@ class port_stats_reply(stats_reply):
             self.entries = []
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!H", self.stats_type))
-        packed.append(struct.pack("!H", self.flags))
-        packed.append('\x00' * 4)
-        packed.append(loxi.generic_util.pack_list(self.entries))
-        length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_BBHLHH4x, buf, offset, self.version, self.type, 0, self.xid, self.stats_type, self.flags)
+        offset = loxi.generic_util.pack_list_into(self.entries, buf, offset)
+        length = offset - start
+        _struct_H.pack_into(buf, start + 2, length)
+        return offset
+
+    def wire_length(self):
+        return 16 + loxi.generic_util.list_wire_length(self.entries)
 
     @staticmethod
     def unpack(reader):
         obj = port_stats_reply()
-        _version = reader.read("!B")[0]
+        _version, _type, _length = reader.read_struct(_struct_BBH)
         assert(_version == 5)
-        _type = reader.read("!B")[0]
         assert(_type == 19)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        _stats_type = reader.read("!H")[0]
+        obj.xid, _stats_type, obj.flags = reader.read_struct(_struct_LHH4x)
         assert(_stats_type == 4)
-        obj.flags = reader.read("!H")[0]
-        reader.skip(4)
         obj.entries = loxi.generic_util.unpack_list(reader, ofp.common.port_stats_entry.unpack)
         return obj
 
@@ -14008,6 +12657,7 @@ class port_stats_reply(stats_reply):
 stats_reply.subtypes[4] = port_stats_reply
 
 class port_stats_request(stats_request):
+    __slots__ = ["port_no"]
     version = 5
     type = 18
     stats_type = 4
@@ -14027,38 +12677,26 @@ class port_stats_request(stats_request):
             self.port_no = 0
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!H", self.stats_type))
-        packed.append(struct.pack("!H", self.flags))
-        packed.append('\x00' * 4)
-        packed.append(util.pack_port_no(self.port_no))
-        packed.append('\x00' * 4)
-        length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_BBHLHH4xL4x, buf, offset, self.version, self.type, 0, self.xid, self.stats_type, self.flags, self.port_no)
+        length = offset - start
+        _struct_H.pack_into(buf, start + 2, length)
+        return offset
+
+    def wire_length(self):
+        return 24
 
     @staticmethod
     def unpack(reader):
         obj = port_stats_request()
-        _version = reader.read("!B")[0]
+        _version, _type, _length = reader.read_struct(_struct_BBH)
         assert(_version == 5)
-        _type = reader.read("!B")[0]
         assert(_type == 18)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        _stats_type = reader.read("!H")[0]
+        obj.xid, _stats_type, obj.flags, obj.port_no = reader.read_struct(_struct_LHH4xL4x)
         assert(_stats_type == 4)
-        obj.flags = reader.read("!H")[0]
-        reader.skip(4)
-        obj.port_no = util.unpack_port_no(reader)
-        reader.skip(4)
         return obj
 
     def __eq__(self, other):
@@ -14090,6 +12728,7 @@ class port_stats_request(stats_request):
 stats_request.subtypes[4] = port_stats_request
 
 class port_status(message):
+    __slots__ = ["desc", "reason"]
     version = 5
     type = 12
 
@@ -14108,32 +12747,26 @@ class port_status(message):
             self.desc = ofp.port_desc()
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!B", self.reason))
-        packed.append('\x00' * 7)
-        packed.append(self.desc.pack())
-        length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_BBHLB7x, buf, offset, self.version, self.type, 0, self.xid, self.reason)
+        offset = self.desc.pack_into(buf, offset)
+        length = offset - start
+        _struct_H.pack_into(buf, start + 2, length)
+        return offset
+
+    def wire_length(self):
+        return 16 + self.desc.wire_length()
 
     @staticmethod
     def unpack(reader):
         obj = port_status()
-        _version = reader.read("!B")[0]
+        _version, _type, _length = reader.read_struct(_struct_BBH)
         assert(_version == 5)
-        _type = reader.read("!B")[0]
         assert(_type == 12)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        obj.reason = reader.read("!B")[0]
-        reader.skip(7)
+        obj.xid, obj.reason = reader.read_struct(_struct_LB7x)
         obj.desc = ofp.port_desc.unpack(reader)
         return obj
 
@@ -14166,6 +12799,7 @@ class port_status(message):
 message.subtypes[12] = port_status
 
 class queue_desc_stats_reply(stats_reply):
+    __slots__ = ["entries"]
     version = 5
     type = 19
     stats_type = 15
@@ -14185,35 +12819,27 @@ class queue_desc_stats_reply(stats_reply):
             self.entries = []
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!H", self.stats_type))
-        packed.append(struct.pack("!H", self.flags))
-        packed.append('\x00' * 4)
-        packed.append(loxi.generic_util.pack_list(self.entries))
-        length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_BBHLHH4x, buf, offset, self.version, self.type, 0, self.xid, self.stats_type, self.flags)
+        offset = loxi.generic_util.pack_list_into(self.entries, buf, offset)
+        length = offset - start
+        _struct_H.pack_into(buf, start + 2, length)
+        return offset
+
+    def wire_length(self):
+        return 16 + loxi.generic_util.list_wire_length(self.entries)
 
     @staticmethod
     def unpack(reader):
         obj = queue_desc_stats_reply()
-        _version = reader.read("!B")[0]
+        _version, _type, _length = reader.read_struct(_struct_BBH)
         assert(_version == 5)
-        _type = reader.read("!B")[0]
         assert(_type == 19)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        _stats_type = reader.read("!H")[0]
+        obj.xid, _stats_type, obj.flags = reader.read_struct(_struct_LHH4x)
         assert(_stats_type == 15)
-        obj.flags = reader.read("!H")[0]
-        reader.skip(4)
         obj.entries = loxi.generic_util.unpack_list(reader, ofp.common.queue_desc.unpack)
         return obj
 
@@ -14246,6 +12872,7 @@ class queue_desc_stats_reply(stats_reply):
 stats_reply.subtypes[15] = queue_desc_stats_reply
 
 class queue_desc_stats_request(stats_request):
+    __slots__ = []
     version = 5
     type = 18
     stats_type = 15
@@ -14261,34 +12888,26 @@ class queue_desc_stats_request(stats_request):
             self.flags = 0
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!H", self.stats_type))
-        packed.append(struct.pack("!H", self.flags))
-        packed.append('\x00' * 4)
-        length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_BBHLHH4x, buf, offset, self.version, self.type, 0, self.xid, self.stats_type, self.flags)
+        length = offset - start
+        _struct_H.pack_into(buf, start + 2, length)
+        return offset
+
+    def wire_length(self):
+        return 16
 
     @staticmethod
     def unpack(reader):
         obj = queue_desc_stats_request()
-        _version = reader.read("!B")[0]
+        _version, _type, _length = reader.read_struct(_struct_BBH)
         assert(_version == 5)
-        _type = reader.read("!B")[0]
         assert(_type == 18)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        _stats_type = reader.read("!H")[0]
+        obj.xid, _stats_type, obj.flags = reader.read_struct(_struct_LHH4x)
         assert(_stats_type == 15)
-        obj.flags = reader.read("!H")[0]
-        reader.skip(4)
         return obj
 
     def __eq__(self, other):
@@ -14316,6 +12935,7 @@ class queue_desc_stats_request(stats_request):
 stats_request.subtypes[15] = queue_desc_stats_request
 
 class queue_op_failed_error_msg(error_msg):
+    __slots__ = ["code", "data"]
     version = 5
     type = 1
     err_type = 9
@@ -14335,34 +12955,28 @@ class queue_op_failed_error_msg(error_msg):
             self.data = ''
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!H", self.err_type))
-        packed.append(struct.pack("!H", self.code))
-        packed.append(self.data)
-        length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_BBHLHH, buf, offset, self.version, self.type, 0, self.xid, self.err_type, self.code)
+        offset = loxi.generic_util.pack_bytes_into(self.data, buf, offset)
+        length = offset - start
+        _struct_H.pack_into(buf, start + 2, length)
+        return offset
+
+    def wire_length(self):
+        return 12 + len(self.data)
 
     @staticmethod
     def unpack(reader):
         obj = queue_op_failed_error_msg()
-        _version = reader.read("!B")[0]
+        _version, _type, _length = reader.read_struct(_struct_BBH)
         assert(_version == 5)
-        _type = reader.read("!B")[0]
         assert(_type == 1)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        _err_type = reader.read("!H")[0]
+        obj.xid, _err_type, obj.code = reader.read_struct(_struct_LHH)
         assert(_err_type == 9)
-        obj.code = reader.read("!H")[0]
-        obj.data = str(reader.read_all())
+        obj.data = reader.read_all()
         return obj
 
     def __eq__(self, other):
@@ -14394,6 +13008,7 @@ class queue_op_failed_error_msg(error_msg):
 error_msg.subtypes[9] = queue_op_failed_error_msg
 
 class queue_stats_reply(stats_reply):
+    __slots__ = ["entries"]
     version = 5
     type = 19
     stats_type = 5
@@ -14413,35 +13028,27 @@ class queue_stats_reply(stats_reply):
             self.entries = []
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!H", self.stats_type))
-        packed.append(struct.pack("!H", self.flags))
-        packed.append('\x00' * 4)
-        packed.append(loxi.generic_util.pack_list(self.entries))
-        length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_BBHLHH4x, buf, offset, self.version, self.type, 0, self.xid, self.stats_type, self.flags)
+        offset = loxi.generic_util.pack_list_into(self.entries, buf, offset)
+        length = offset - start
+        _struct_H.pack_into(buf, start + 2, length)
+        return offset
+
+    def wire_length(self):
+        return 16 + loxi.generic_util.list_wire_length(self.entries)
 
     @staticmethod
     def unpack(reader):
         obj = queue_stats_reply()
-        _version = reader.read("!B")[0]
+        _version, _type, _length = reader.read_struct(_struct_BBH)
         assert(_version == 5)
-        _type = reader.read("!B")[0]
         assert(_type == 19)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        _stats_type = reader.read("!H")[0]
+        obj.xid, _stats_type, obj.flags = reader.read_struct(_struct_LHH4x)
         assert(_stats_type == 5)
-        obj.flags = reader.read("!H")[0]
-        reader.skip(4)
         obj.entries = loxi.generic_util.unpack_list(reader, ofp.common.queue_stats_entry.unpack)
         return obj
 
@@ -14474,6 +13081,7 @@ class queue_stats_reply(stats_reply):
 stats_reply.subtypes[5] = queue_stats_reply
 
 class queue_stats_request(stats_request):
+    __slots__ = ["port_no", "queue_id"]
     version = 5
     type = 18
     stats_type = 5
@@ -14497,38 +13105,26 @@ class queue_stats_request(stats_request):
             self.queue_id = 0
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!H", self.stats_type))
-        packed.append(struct.pack("!H", self.flags))
-        packed.append('\x00' * 4)
-        packed.append(util.pack_port_no(self.port_no))
-        packed.append(struct.pack("!L", self.queue_id))
-        length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_BBHLHH4xLL, buf, offset, self.version, self.type, 0, self.xid, self.stats_type, self.flags, self.port_no, self.queue_id)
+        length = offset - start
+        _struct_H.pack_into(buf, start + 2, length)
+        return offset
+
+    def wire_length(self):
+        return 24
 
     @staticmethod
     def unpack(reader):
         obj = queue_stats_request()
-        _version = reader.read("!B")[0]
+        _version, _type, _length = reader.read_struct(_struct_BBH)
         assert(_version == 5)
-        _type = reader.read("!B")[0]
         assert(_type == 18)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        _stats_type = reader.read("!H")[0]
+        obj.xid, _stats_type, obj.flags, obj.port_no, obj.queue_id = reader.read_struct(_struct_LHH4xLL)
         assert(_stats_type == 5)
-        obj.flags = reader.read("!H")[0]
-        reader.skip(4)
-        obj.port_no = util.unpack_port_no(reader)
-        obj.queue_id = reader.read("!L")[0]
         return obj
 
     def __eq__(self, other):
@@ -14564,6 +13160,7 @@ class queue_stats_request(stats_request):
 stats_request.subtypes[5] = queue_stats_request
 
 class requestforward(message):
+    __slots__ = ["data", "role"]
     version = 5
     type = 32
 
@@ -14582,31 +13179,27 @@ class requestforward(message):
             self.data = ''
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!L", self.role))
-        packed.append(self.data)
-        length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_BBHLL, buf, offset, self.version, self.type, 0, self.xid, self.role)
+        offset = loxi.generic_util.pack_bytes_into(self.data, buf, offset)
+        length = offset - start
+        _struct_H.pack_into(buf, start + 2, length)
+        return offset
+
+    def wire_length(self):
+        return 12 + len(self.data)
 
     @staticmethod
     def unpack(reader):
         obj = requestforward()
-        _version = reader.read("!B")[0]
+        _version, _type, _length = reader.read_struct(_struct_BBH)
         assert(_version == 5)
-        _type = reader.read("!B")[0]
         assert(_type == 32)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        obj.role = reader.read("!L")[0]
-        obj.data = str(reader.read_all())
+        obj.xid, obj.role = reader.read_struct(_struct_LL)
+        obj.data = reader.read_all()
         return obj
 
     def __eq__(self, other):
@@ -14638,6 +13231,7 @@ class requestforward(message):
 message.subtypes[32] = requestforward
 
 class role_reply(message):
+    __slots__ = ["generation_id", "role"]
     version = 5
     type = 25
 
@@ -14656,33 +13250,25 @@ class role_reply(message):
             self.generation_id = 0
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!L", self.role))
-        packed.append('\x00' * 4)
-        packed.append(struct.pack("!Q", self.generation_id))
-        length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_BBHLL4xQ, buf, offset, self.version, self.type, 0, self.xid, self.role, self.generation_id)
+        length = offset - start
+        _struct_H.pack_into(buf, start + 2, length)
+        return offset
+
+    def wire_length(self):
+        return 24
 
     @staticmethod
     def unpack(reader):
         obj = role_reply()
-        _version = reader.read("!B")[0]
+        _version, _type, _length = reader.read_struct(_struct_BBH)
         assert(_version == 5)
-        _type = reader.read("!B")[0]
         assert(_type == 25)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        obj.role = reader.read("!L")[0]
-        reader.skip(4)
-        obj.generation_id = reader.read("!Q")[0]
+        obj.xid, obj.role, obj.generation_id = reader.read_struct(_struct_LL4xQ)
         return obj
 
     def __eq__(self, other):
@@ -14714,6 +13300,7 @@ class role_reply(message):
 message.subtypes[25] = role_reply
 
 class role_request(message):
+    __slots__ = ["generation_id", "role"]
     version = 5
     type = 24
 
@@ -14732,33 +13319,25 @@ class role_request(message):
             self.generation_id = 0
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!L", self.role))
-        packed.append('\x00' * 4)
-        packed.append(struct.pack("!Q", self.generation_id))
-        length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_BBHLL4xQ, buf, offset, self.version, self.type, 0, self.xid, self.role, self.generation_id)
+        length = offset - start
+        _struct_H.pack_into(buf, start + 2, length)
+        return offset
+
+    def wire_length(self):
+        return 24
 
     @staticmethod
     def unpack(reader):
         obj = role_request()
-        _version = reader.read("!B")[0]
+        _version, _type, _length = reader.read_struct(_struct_BBH)
         assert(_version == 5)
-        _type = reader.read("!B")[0]
         assert(_type == 24)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        obj.role = reader.read("!L")[0]
-        reader.skip(4)
-        obj.generation_id = reader.read("!Q")[0]
+        obj.xid, obj.role, obj.generation_id = reader.read_struct(_struct_LL4xQ)
         return obj
 
     def __eq__(self, other):
@@ -14790,6 +13369,7 @@ class role_request(message):
 message.subtypes[24] = role_request
 
 class role_request_failed_error_msg(error_msg):
+    __slots__ = ["code", "data"]
     version = 5
     type = 1
     err_type = 11
@@ -14809,34 +13389,28 @@ class role_request_failed_error_msg(error_msg):
             self.data = ''
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!H", self.err_type))
-        packed.append(struct.pack("!H", self.code))
-        packed.append(self.data)
-        length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_BBHLHH, buf, offset, self.version, self.type, 0, self.xid, self.err_type, self.code)
+        offset = loxi.generic_util.pack_bytes_into(self.data, buf, offset)
+        length = offset - start
+        _struct_H.pack_into(buf, start + 2, length)
+        return offset
+
+    def wire_length(self):
+        return 12 + len(self.data)
 
     @staticmethod
     def unpack(reader):
         obj = role_request_failed_error_msg()
-        _version = reader.read("!B")[0]
+        _version, _type, _length = reader.read_struct(_struct_BBH)
         assert(_version == 5)
-        _type = reader.read("!B")[0]
         assert(_type == 1)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        _err_type = reader.read("!H")[0]
+        obj.xid, _err_type, obj.code = reader.read_struct(_struct_LHH)
         assert(_err_type == 11)
-        obj.code = reader.read("!H")[0]
-        obj.data = str(reader.read_all())
+        obj.data = reader.read_all()
         return obj
 
     def __eq__(self, other):
@@ -14868,6 +13442,7 @@ class role_request_failed_error_msg(error_msg):
 error_msg.subtypes[11] = role_request_failed_error_msg
 
 class role_status(message):
+    __slots__ = ["generation_id", "properties", "reason", "role"]
     version = 5
     type = 30
 
@@ -14894,36 +13469,26 @@ class role_status(message):
             self.properties = []
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!L", self.role))
-        packed.append(struct.pack("!B", self.reason))
-        packed.append('\x00' * 3)
-        packed.append(struct.pack("!Q", self.generation_id))
-        packed.append(loxi.generic_util.pack_list(self.properties))
-        length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_BBHLLB3xQ, buf, offset, self.version, self.type, 0, self.xid, self.role, self.reason, self.generation_id)
+        offset = loxi.generic_util.pack_list_into(self.properties, buf, offset)
+        length = offset - start
+        _struct_H.pack_into(buf, start + 2, length)
+        return offset
+
+    def wire_length(self):
+        return 24 + loxi.generic_util.list_wire_length(self.properties)
 
     @staticmethod
     def unpack(reader):
         obj = role_status()
-        _version = reader.read("!B")[0]
+        _version, _type, _length = reader.read_struct(_struct_BBH)
         assert(_version == 5)
-        _type = reader.read("!B")[0]
         assert(_type == 30)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        obj.role = reader.read("!L")[0]
-        obj.reason = reader.read("!B")[0]
-        reader.skip(3)
-        obj.generation_id = reader.read("!Q")[0]
+        obj.xid, obj.role, obj.reason, obj.generation_id = reader.read_struct(_struct_LLB3xQ)
         obj.properties = loxi.generic_util.unpack_list(reader, ofp.role_prop.role_prop.unpack)
         return obj
 
@@ -14964,6 +13529,7 @@ class role_status(message):
 message.subtypes[30] = role_status
 
 class set_config(message):
+    __slots__ = ["flags", "miss_send_len"]
     version = 5
     type = 9
 
@@ -14982,31 +13548,25 @@ class set_config(message):
             self.miss_send_len = 0
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!H", self.flags))
-        packed.append(struct.pack("!H", self.miss_send_len))
-        length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_BBHLHH, buf, offset, self.version, self.type, 0, self.xid, self.flags, self.miss_send_len)
+        length = offset - start
+        _struct_H.pack_into(buf, start + 2, length)
+        return offset
+
+    def wire_length(self):
+        return 12
 
     @staticmethod
     def unpack(reader):
         obj = set_config()
-        _version = reader.read("!B")[0]
+        _version, _type, _length = reader.read_struct(_struct_BBH)
         assert(_version == 5)
-        _type = reader.read("!B")[0]
         assert(_type == 9)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        obj.flags = reader.read("!H")[0]
-        obj.miss_send_len = reader.read("!H")[0]
+        obj.xid, obj.flags, obj.miss_send_len = reader.read_struct(_struct_LHH)
         return obj
 
     def __eq__(self, other):
@@ -15038,6 +13598,7 @@ class set_config(message):
 message.subtypes[9] = set_config
 
 class switch_config_failed_error_msg(error_msg):
+    __slots__ = ["code", "data"]
     version = 5
     type = 1
     err_type = 10
@@ -15057,34 +13618,28 @@ class switch_config_failed_error_msg(error_msg):
             self.data = ''
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!H", self.err_type))
-        packed.append(struct.pack("!H", self.code))
-        packed.append(self.data)
-        length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_BBHLHH, buf, offset, self.version, self.type, 0, self.xid, self.err_type, self.code)
+        offset = loxi.generic_util.pack_bytes_into(self.data, buf, offset)
+        length = offset - start
+        _struct_H.pack_into(buf, start + 2, length)
+        return offset
+
+    def wire_length(self):
+        return 12 + len(self.data)
 
     @staticmethod
     def unpack(reader):
         obj = switch_config_failed_error_msg()
-        _version = reader.read("!B")[0]
+        _version, _type, _length = reader.read_struct(_struct_BBH)
         assert(_version == 5)
-        _type = reader.read("!B")[0]
         assert(_type == 1)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        _err_type = reader.read("!H")[0]
+        obj.xid, _err_type, obj.code = reader.read_struct(_struct_LHH)
         assert(_err_type == 10)
-        obj.code = reader.read("!H")[0]
-        obj.data = str(reader.read_all())
+        obj.data = reader.read_all()
         return obj
 
     def __eq__(self, other):
@@ -15116,6 +13671,7 @@ class switch_config_failed_error_msg(error_msg):
 error_msg.subtypes[10] = switch_config_failed_error_msg
 
 class table_desc_stats_reply(stats_reply):
+    __slots__ = ["entries"]
     version = 5
     type = 19
     stats_type = 14
@@ -15135,35 +13691,27 @@ class table_desc_stats_reply(stats_reply):
             self.entries = []
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!H", self.stats_type))
-        packed.append(struct.pack("!H", self.flags))
-        packed.append('\x00' * 4)
-        packed.append(loxi.generic_util.pack_list(self.entries))
-        length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_BBHLHH4x, buf, offset, self.version, self.type, 0, self.xid, self.stats_type, self.flags)
+        offset = loxi.generic_util.pack_list_into(self.entries, buf, offset)
+        length = offset - start
+        _struct_H.pack_into(buf, start + 2, length)
+        return offset
+
+    def wire_length(self):
+        return 16 + loxi.generic_util.list_wire_length(self.entries)
 
     @staticmethod
     def unpack(reader):
         obj = table_desc_stats_reply()
-        _version = reader.read("!B")[0]
+        _version, _type, _length = reader.read_struct(_struct_BBH)
         assert(_version == 5)
-        _type = reader.read("!B")[0]
         assert(_type == 19)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        _stats_type = reader.read("!H")[0]
+        obj.xid, _stats_type, obj.flags = reader.read_struct(_struct_LHH4x)
         assert(_stats_type == 14)
-        obj.flags = reader.read("!H")[0]
-        reader.skip(4)
         obj.entries = loxi.generic_util.unpack_list(reader, ofp.common.table_desc.unpack)
         return obj
 
@@ -15196,6 +13744,7 @@ class table_desc_stats_reply(stats_reply):
 stats_reply.subtypes[14] = table_desc_stats_reply
 
 class table_desc_stats_request(stats_request):
+    __slots__ = []
     version = 5
     type = 18
     stats_type = 14
@@ -15211,34 +13760,26 @@ class table_desc_stats_request(stats_request):
             self.flags = 0
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!H", self.stats_type))
-        packed.append(struct.pack("!H", self.flags))
-        packed.append('\x00' * 4)
-        length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_BBHLHH4x, buf, offset, self.version, self.type, 0, self.xid, self.stats_type, self.flags)
+        length = offset - start
+        _struct_H.pack_into(buf, start + 2, length)
+        return offset
+
+    def wire_length(self):
+        return 16
 
     @staticmethod
     def unpack(reader):
         obj = table_desc_stats_request()
-        _version = reader.read("!B")[0]
+        _version, _type, _length = reader.read_struct(_struct_BBH)
         assert(_version == 5)
-        _type = reader.read("!B")[0]
         assert(_type == 18)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        _stats_type = reader.read("!H")[0]
+        obj.xid, _stats_type, obj.flags = reader.read_struct(_struct_LHH4x)
         assert(_stats_type == 14)
-        obj.flags = reader.read("!H")[0]
-        reader.skip(4)
         return obj
 
     def __eq__(self, other):
@@ -15266,6 +13807,7 @@ class table_desc_stats_request(stats_request):
 stats_request.subtypes[14] = table_desc_stats_request
 
 class table_features_failed_error_msg(error_msg):
+    __slots__ = ["code", "data"]
     version = 5
     type = 1
     err_type = 13
@@ -15285,34 +13827,28 @@ class table_features_failed_error_msg(error_msg):
             self.data = ''
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!H", self.err_type))
-        packed.append(struct.pack("!H", self.code))
-        packed.append(self.data)
-        length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_BBHLHH, buf, offset, self.version, self.type, 0, self.xid, self.err_type, self.code)
+        offset = loxi.generic_util.pack_bytes_into(self.data, buf, offset)
+        length = offset - start
+        _struct_H.pack_into(buf, start + 2, length)
+        return offset
+
+    def wire_length(self):
+        return 12 + len(self.data)
 
     @staticmethod
     def unpack(reader):
         obj = table_features_failed_error_msg()
-        _version = reader.read("!B")[0]
+        _version, _type, _length = reader.read_struct(_struct_BBH)
         assert(_version == 5)
-        _type = reader.read("!B")[0]
         assert(_type == 1)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        _err_type = reader.read("!H")[0]
+        obj.xid, _err_type, obj.code = reader.read_struct(_struct_LHH)
         assert(_err_type == 13)
-        obj.code = reader.read("!H")[0]
-        obj.data = str(reader.read_all())
+        obj.data = reader.read_all()
         return obj
 
     def __eq__(self, other):
@@ -15344,6 +13880,7 @@ class table_features_failed_error_msg(error_msg):
 error_msg.subtypes[13] = table_features_failed_error_msg
 
 class table_features_stats_reply(stats_reply):
+    __slots__ = ["entries"]
     version = 5
     type = 19
     stats_type = 12
@@ -15363,35 +13900,27 @@ class table_features_stats_reply(stats_reply):
             self.entries = []
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!H", self.stats_type))
-        packed.append(struct.pack("!H", self.flags))
-        packed.append('\x00' * 4)
-        packed.append(loxi.generic_util.pack_list(self.entries))
-        length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_BBHLHH4x, buf, offset, self.version, self.type, 0, self.xid, self.stats_type, self.flags)
+        offset = loxi.generic_util.pack_list_into(self.entries, buf, offset)
+        length = offset - start
+        _struct_H.pack_into(buf, start + 2, length)
+        return offset
+
+    def wire_length(self):
+        return 16 + loxi.generic_util.list_wire_length(self.entries)
 
     @staticmethod
     def unpack(reader):
         obj = table_features_stats_reply()
-        _version = reader.read("!B")[0]
+        _version, _type, _length = reader.read_struct(_struct_BBH)
         assert(_version == 5)
-        _type = reader.read("!B")[0]
         assert(_type == 19)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        _stats_type = reader.read("!H")[0]
+        obj.xid, _stats_type, obj.flags = reader.read_struct(_struct_LHH4x)
         assert(_stats_type == 12)
-        obj.flags = reader.read("!H")[0]
-        reader.skip(4)
         obj.entries = loxi.generic_util.unpack_list(reader, ofp.common.table_features.unpack)
         return obj
 
@@ -15424,6 +13953,7 @@ class table_features_stats_reply(stats_reply):
 stats_reply.subtypes[12] = table_features_stats_reply
 
 class table_features_stats_request(stats_request):
+    __slots__ = ["entries"]
     version = 5
     type = 18
     stats_type = 12
@@ -15443,35 +13973,27 @@ class table_features_stats_request(stats_request):
             self.entries = []
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!H", self.stats_type))
-        packed.append(struct.pack("!H", self.flags))
-        packed.append('\x00' * 4)
-        packed.append(loxi.generic_util.pack_list(self.entries))
-        length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_BBHLHH4x, buf, offset, self.version, self.type, 0, self.xid, self.stats_type, self.flags)
+        offset = loxi.generic_util.pack_list_into(self.entries, buf, offset)
+        length = offset - start
+        _struct_H.pack_into(buf, start + 2, length)
+        return offset
+
+    def wire_length(self):
+        return 16 + loxi.generic_util.list_wire_length(self.entries)
 
     @staticmethod
     def unpack(reader):
         obj = table_features_stats_request()
-        _version = reader.read("!B")[0]
+        _version, _type, _length = reader.read_struct(_struct_BBH)
         assert(_version == 5)
-        _type = reader.read("!B")[0]
         assert(_type == 18)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        _stats_type = reader.read("!H")[0]
+        obj.xid, _stats_type, obj.flags = reader.read_struct(_struct_LHH4x)
         assert(_stats_type == 12)
-        obj.flags = reader.read("!H")[0]
-        reader.skip(4)
         obj.entries = loxi.generic_util.unpack_list(reader, ofp.common.table_features.unpack)
         return obj
 
@@ -15504,6 +14026,7 @@ class table_features_stats_request(stats_request):
 stats_request.subtypes[12] = table_features_stats_request
 
 class table_mod(message):
+    __slots__ = ["config", "properties", "table_id"]
     version = 5
     type = 17
 
@@ -15526,34 +14049,26 @@ class table_mod(message):
             self.properties = []
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!B", self.table_id))
-        packed.append('\x00' * 3)
-        packed.append(struct.pack("!L", self.config))
-        packed.append(loxi.generic_util.pack_list(self.properties))
-        length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_BBHLB3xL, buf, offset, self.version, self.type, 0, self.xid, self.table_id, self.config)
+        offset = loxi.generic_util.pack_list_into(self.properties, buf, offset)
+        length = offset - start
+        _struct_H.pack_into(buf, start + 2, length)
+        return offset
+
+    def wire_length(self):
+        return 16 + loxi.generic_util.list_wire_length(self.properties)
 
     @staticmethod
     def unpack(reader):
         obj = table_mod()
-        _version = reader.read("!B")[0]
+        _version, _type, _length = reader.read_struct(_struct_BBH)
         assert(_version == 5)
-        _type = reader.read("!B")[0]
         assert(_type == 17)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        obj.table_id = reader.read("!B")[0]
-        reader.skip(3)
-        obj.config = reader.read("!L")[0]
+        obj.xid, obj.table_id, obj.config = reader.read_struct(_struct_LB3xL)
         obj.properties = loxi.generic_util.unpack_list(reader, ofp.table_mod_prop.table_mod_prop.unpack)
         return obj
 
@@ -15590,6 +14105,7 @@ class table_mod(message):
 message.subtypes[17] = table_mod
 
 class table_mod_failed_error_msg(error_msg):
+    __slots__ = ["code", "data"]
     version = 5
     type = 1
     err_type = 8
@@ -15609,34 +14125,28 @@ class table_mod_failed_error_msg(error_msg):
             self.data = ''
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!H", self.err_type))
-        packed.append(struct.pack("!H", self.code))
-        packed.append(self.data)
-        length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_BBHLHH, buf, offset, self.version, self.type, 0, self.xid, self.err_type, self.code)
+        offset = loxi.generic_util.pack_bytes_into(self.data, buf, offset)
+        length = offset - start
+        _struct_H.pack_into(buf, start + 2, length)
+        return offset
+
+    def wire_length(self):
+        return 12 + len(self.data)
 
     @staticmethod
     def unpack(reader):
         obj = table_mod_failed_error_msg()
-        _version = reader.read("!B")[0]
+        _version, _type, _length = reader.read_struct(_struct_BBH)
         assert(_version == 5)
-        _type = reader.read("!B")[0]
         assert(_type == 1)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        _err_type = reader.read("!H")[0]
+        obj.xid, _err_type, obj.code = reader.read_struct(_struct_LHH)
         assert(_err_type == 8)
-        obj.code = reader.read("!H")[0]
-        obj.data = str(reader.read_all())
+        obj.data = reader.read_all()
         return obj
 
     def __eq__(self, other):
@@ -15668,6 +14178,7 @@ class table_mod_failed_error_msg(error_msg):
 error_msg.subtypes[8] = table_mod_failed_error_msg
 
 class table_stats_reply(stats_reply):
+    __slots__ = ["entries"]
     version = 5
     type = 19
     stats_type = 3
@@ -15687,35 +14198,27 @@ class table_stats_reply(stats_reply):
             self.entries = []
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!H", self.stats_type))
-        packed.append(struct.pack("!H", self.flags))
-        packed.append('\x00' * 4)
-        packed.append(loxi.generic_util.pack_list(self.entries))
-        length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_BBHLHH4x, buf, offset, self.version, self.type, 0, self.xid, self.stats_type, self.flags)
+        offset = loxi.generic_util.pack_list_into(self.entries, buf, offset)
+        length = offset - start
+        _struct_H.pack_into(buf, start + 2, length)
+        return offset
+
+    def wire_length(self):
+        return 16 + loxi.generic_util.list_wire_length(self.entries)
 
     @staticmethod
     def unpack(reader):
         obj = table_stats_reply()
-        _version = reader.read("!B")[0]
+        _version, _type, _length = reader.read_struct(_struct_BBH)
         assert(_version == 5)
-        _type = reader.read("!B")[0]
         assert(_type == 19)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        _stats_type = reader.read("!H")[0]
+        obj.xid, _stats_type, obj.flags = reader.read_struct(_struct_LHH4x)
         assert(_stats_type == 3)
-        obj.flags = reader.read("!H")[0]
-        reader.skip(4)
         obj.entries = loxi.generic_util.unpack_list(reader, ofp.common.table_stats_entry.unpack)
         return obj
 
@@ -15748,6 +14251,7 @@ class table_stats_reply(stats_reply):
 stats_reply.subtypes[3] = table_stats_reply
 
 class table_stats_request(stats_request):
+    __slots__ = []
     version = 5
     type = 18
     stats_type = 3
@@ -15763,34 +14267,26 @@ class table_stats_request(stats_request):
             self.flags = 0
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!H", self.stats_type))
-        packed.append(struct.pack("!H", self.flags))
-        packed.append('\x00' * 4)
-        length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_BBHLHH4x, buf, offset, self.version, self.type, 0, self.xid, self.stats_type, self.flags)
+        length = offset - start
+        _struct_H.pack_into(buf, start + 2, length)
+        return offset
+
+    def wire_length(self):
+        return 16
 
     @staticmethod
     def unpack(reader):
         obj = table_stats_request()
-        _version = reader.read("!B")[0]
+        _version, _type, _length = reader.read_struct(_struct_BBH)
         assert(_version == 5)
-        _type = reader.read("!B")[0]
         assert(_type == 18)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        _stats_type = reader.read("!H")[0]
+        obj.xid, _stats_type, obj.flags = reader.read_struct(_struct_LHH4x)
         assert(_stats_type == 3)
-        obj.flags = reader.read("!H")[0]
-        reader.skip(4)
         return obj
 
     def __eq__(self, other):
@@ -15818,6 +14314,7 @@ class table_stats_request(stats_request):
 stats_request.subtypes[3] = table_stats_request
 
 class table_status(message):
+    __slots__ = ["reason", "role", "table"]
     version = 5
     type = 31
 
@@ -15840,34 +14337,26 @@ class table_status(message):
             self.table = ofp.table_desc()
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!B", self.version))
-        packed.append(struct.pack("!B", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 2
-        packed.append(struct.pack("!L", self.xid))
-        packed.append(struct.pack("!L", self.role))
-        packed.append(struct.pack("!B", self.reason))
-        packed.append('\x00' * 7)
-        packed.append(self.table.pack())
-        length = sum([len(x) for x in packed])
-        packed[2] = struct.pack("!H", length)
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_BBHLLB7x, buf, offset, self.version, self.type, 0, self.xid, self.role, self.reason)
+        offset = self.table.pack_into(buf, offset)
+        length = offset - start
+        _struct_H.pack_into(buf, start + 2, length)
+        return offset
+
+    def wire_length(self):
+        return 20 + self.table.wire_length()
 
     @staticmethod
     def unpack(reader):
         obj = table_status()
-        _version = reader.read("!B")[0]
+        _version, _type, _length = reader.read_struct(_struct_BBH)
         assert(_version == 5)
-        _type = reader.read("!B")[0]
         assert(_type == 31)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.xid = reader.read("!L")[0]
-        obj.role = reader.read("!L")[0]
-        obj.reason = reader.read("!B")[0]
-        reader.skip(7)
+        obj.xid, obj.role, obj.reason = reader.read_struct(_struct_LLB7x)
         obj.table = ofp.table_desc.unpack(reader)
         return obj
 
@@ -15904,15 +14393,51 @@ class table_status(message):
 message.subtypes[31] = table_status
 
 
+# Field each message class with subtypes is dispatched on, as (struct, offset)
+_subtype_fields = {
+    message: (_struct_B, 1),
+    stats_reply: (_struct_H, 8),
+    stats_request: (_struct_H, 8),
+    error_msg: (_struct_H, 8),
+    experimenter: (_struct_L, 8),
+    bsn_header: (_struct_L, 12),
+    experimenter_stats_reply: (_struct_L, 16),
+    bsn_stats_reply: (_struct_L, 20),
+    experimenter_stats_request: (_struct_L, 16),
+    bsn_stats_request: (_struct_L, 20),
+    flow_mod: (_struct_B, 25),
+    group_mod: (_struct_H, 8),
+    nicira_header: (_struct_L, 12),
+}
+
+_dispatch_table = None
+
 def parse_header(buf):
     if len(buf) < 8:
         raise loxi.ProtocolError("too short to be an OpenFlow message")
     return struct.unpack_from("!BBHL", buf)
 
-def parse_message(buf):
+def parse_message(buf, lazy=False):
+    """
+    Deserialize a complete OpenFlow message.
+
+    If lazy is true, only the header is parsed and a LazyMessage is returned
+    which unpacks the rest of the message on first use.
+    """
     msg_ver, msg_type, msg_len, msg_xid = parse_header(buf)
     if msg_ver != ofp.OFP_VERSION and msg_type != ofp.OFPT_HELLO:
         raise loxi.ProtocolError("wrong OpenFlow version (expected %d, got %d)" % (ofp.OFP_VERSION, msg_ver))
     if len(buf) != msg_len:
         raise loxi.ProtocolError("incorrect message size")
-    return message.unpack(loxi.generic_util.OFReader(buf))
+    if lazy:
+        return loxi.generic_util.LazyMessage(buf, unpack_message)
+    return unpack_message(loxi.generic_util.OFReader(buf))
+
+def unpack_message(reader):
+    """
+    Unpack a message, going straight to the unpack() of its leaf class.
+    """
+    global _dispatch_table
+    if _dispatch_table is None:
+        _dispatch_table = loxi.generic_util.dispatch_table(message, _subtype_fields)
+    return loxi.generic_util.unpack_dispatched(reader, _dispatch_table)
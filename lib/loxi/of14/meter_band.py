@@ -14,7 +14,18 @@ import loxi.generic_util
 import sys
 ofp = sys.modules['loxi.of14']
 
+# Precompiled layouts for the fixed-length parts of each pack_into() and unpack()
+_struct_H = struct.Struct("!H")
+_struct_HH = struct.Struct("!HH")
+_struct_HHLL4x = struct.Struct("!HHLL4x")
+_struct_HHLLB3x = struct.Struct("!HHLLB3x")
+_struct_HHLLL = struct.Struct("!HHLLL")
+_struct_LL4x = struct.Struct("!LL4x")
+_struct_LLB3x = struct.Struct("!LLB3x")
+_struct_LLL = struct.Struct("!LLL")
+
 class meter_band(loxi.OFObject):
+    __slots__ = ["type"]
     subtypes = {}
 
 
@@ -25,13 +36,15 @@ class meter_band(loxi.OFObject):
             self.type = 0
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!H", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for len at index 1
-        length = sum([len(x) for x in packed])
-        packed[1] = struct.pack("!H", length)
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_HH, buf, offset, self.type, 0)
+        length = offset - start
+        _struct_H.pack_into(buf, start + 2, length)
+        return offset
+
+    def wire_length(self):
+        return 4
 
     @staticmethod
     def unpack(reader):
@@ -41,8 +54,7 @@ class meter_band(loxi.OFObject):
             return subclass.unpack(reader)
 
         obj = meter_band()
-        obj.type = reader.read("!H")[0]
-        _len = reader.read("!H")[0]
+        obj.type, _len = reader.read_struct(_struct_HH)
         orig_reader = reader
         reader = orig_reader.slice(_len, 4)
         return obj
@@ -62,6 +74,7 @@ class meter_band(loxi.OFObject):
 
 
 class drop(meter_band):
+    __slots__ = ["burst_size", "rate"]
     type = 1
 
     def __init__(self, rate=None, burst_size=None):
@@ -75,28 +88,24 @@ class drop(meter_band):
             self.burst_size = 0
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!H", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for len at index 1
-        packed.append(struct.pack("!L", self.rate))
-        packed.append(struct.pack("!L", self.burst_size))
-        packed.append('\x00' * 4)
-        length = sum([len(x) for x in packed])
-        packed[1] = struct.pack("!H", length)
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_HHLL4x, buf, offset, self.type, 0, self.rate, self.burst_size)
+        length = offset - start
+        _struct_H.pack_into(buf, start + 2, length)
+        return offset
+
+    def wire_length(self):
+        return 16
 
     @staticmethod
     def unpack(reader):
         obj = drop()
-        _type = reader.read("!H")[0]
+        _type, _len = reader.read_struct(_struct_HH)
         assert(_type == 1)
-        _len = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_len, 4)
-        obj.rate = reader.read("!L")[0]
-        obj.burst_size = reader.read("!L")[0]
-        reader.skip(4)
+        obj.rate, obj.burst_size = reader.read_struct(_struct_LL4x)
         return obj
 
     def __eq__(self, other):
@@ -121,6 +130,7 @@ class drop(meter_band):
 meter_band.subtypes[1] = drop
 
 class dscp_remark(meter_band):
+    __slots__ = ["burst_size", "prec_level", "rate"]
     type = 2
 
     def __init__(self, rate=None, burst_size=None, prec_level=None):
@@ -138,30 +148,24 @@ class dscp_remark(meter_band):
             self.prec_level = 0
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!H", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for len at index 1
-        packed.append(struct.pack("!L", self.rate))
-        packed.append(struct.pack("!L", self.burst_size))
-        packed.append(struct.pack("!B", self.prec_level))
-        packed.append('\x00' * 3)
-        length = sum([len(x) for x in packed])
-        packed[1] = struct.pack("!H", length)
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_HHLLB3x, buf, offset, self.type, 0, self.rate, self.burst_size, self.prec_level)
+        length = offset - start
+        _struct_H.pack_into(buf, start + 2, length)
+        return offset
+
+    def wire_length(self):
+        return 16
 
     @staticmethod
     def unpack(reader):
         obj = dscp_remark()
-        _type = reader.read("!H")[0]
+        _type, _len = reader.read_struct(_struct_HH)
         assert(_type == 2)
-        _len = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_len, 4)
-        obj.rate = reader.read("!L")[0]
-        obj.burst_size = reader.read("!L")[0]
-        obj.prec_level = reader.read("!B")[0]
-        reader.skip(3)
+        obj.rate, obj.burst_size, obj.prec_level = reader.read_struct(_struct_LLB3x)
         return obj
 
     def __eq__(self, other):
@@ -190,6 +194,7 @@ class dscp_remark(meter_band):
 meter_band.subtypes[2] = dscp_remark
 
 class experimenter(meter_band):
+    __slots__ = ["burst_size", "experimenter", "rate"]
     type = 65535
 
     def __init__(self, rate=None, burst_size=None, experimenter=None):
@@ -207,28 +212,24 @@ class experimenter(meter_band):
             self.experimenter = 0
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!H", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for len at index 1
-        packed.append(struct.pack("!L", self.rate))
-        packed.append(struct.pack("!L", self.burst_size))
-        packed.append(struct.pack("!L", self.experimenter))
-        length = sum([len(x) for x in packed])
-        packed[1] = struct.pack("!H", length)
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_HHLLL, buf, offset, self.type, 0, self.rate, self.burst_size, self.experimenter)
+        length = offset - start
+        _struct_H.pack_into(buf, start + 2, length)
+        return offset
+
+    def wire_length(self):
+        return 16
 
     @staticmethod
     def unpack(reader):
         obj = experimenter()
-        _type = reader.read("!H")[0]
+        _type, _len = reader.read_struct(_struct_HH)
         assert(_type == 65535)
-        _len = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_len, 4)
-        obj.rate = reader.read("!L")[0]
-        obj.burst_size = reader.read("!L")[0]
-        obj.experimenter = reader.read("!L")[0]
+        obj.rate, obj.burst_size, obj.experimenter = reader.read_struct(_struct_LLL)
         return obj
 
     def __eq__(self, other):
@@ -14,7 +14,18 @@ import loxi.generic_util
 import sys
 ofp = sys.modules['loxi.of14']
 
+# Precompiled layouts for the fixed-length parts of each pack_into() and unpack()
+_struct_H = struct.Struct("!H")
+_struct_HH = struct.Struct("!HH")
+_struct_HH4xLLLLLL = struct.Struct("!HH4xLLLLLL")
+_struct_HH4xLLLLLLLLL = struct.Struct("!HH4xLLLLLLLLL")
+_struct_HHLL = struct.Struct("!HHLL")
+_struct_LL = struct.Struct("!LL")
+_struct_LLLLLL = struct.Struct("!LLLLLL")
+_struct_LLLLLLLLL = struct.Struct("!LLLLLLLLL")
+
 class port_desc_prop(loxi.OFObject):
+    __slots__ = ["type"]
     subtypes = {}
 
 
@@ -25,13 +36,15 @@ class port_desc_prop(loxi.OFObject):
             self.type = 0
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!H", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
-        length = sum([len(x) for x in packed])
-        packed[1] = struct.pack("!H", length)
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_HH, buf, offset, self.type, 0)
+        length = offset - start
+        _struct_H.pack_into(buf, start + 2, length)
+        return offset
+
+    def wire_length(self):
+        return 4
 
     @staticmethod
     def unpack(reader):
@@ -41,8 +54,7 @@ class port_desc_prop(loxi.OFObject):
             return subclass.unpack(reader)
 
         obj = port_desc_prop()
-        obj.type = reader.read("!H")[0]
-        _length = reader.read("!H")[0]
+        obj.type, _length = reader.read_struct(_struct_HH)
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
         return obj
@@ -62,6 +74,7 @@ class port_desc_prop(loxi.OFObject):
 
 
 class experimenter(port_desc_prop):
+    __slots__ = ["exp_type", "experimenter"]
     subtypes = {}
 
     type = 65535
@@ -77,15 +90,15 @@ class experimenter(port_desc_prop):
             self.exp_type = 0
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!H", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
-        packed.append(struct.pack("!L", self.experimenter))
-        packed.append(struct.pack("!L", self.exp_type))
-        length = sum([len(x) for x in packed])
-        packed[1] = struct.pack("!H", length)
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_HHLL, buf, offset, self.type, 0, self.experimenter, self.exp_type)
+        length = offset - start
+        _struct_H.pack_into(buf, start + 2, length)
+        return offset
+
+    def wire_length(self):
+        return 12
 
     @staticmethod
     def unpack(reader):
@@ -95,13 +108,11 @@ class experimenter(port_desc_prop):
             return subclass.unpack(reader)
 
         obj = experimenter()
-        _type = reader.read("!H")[0]
+        _type, _length = reader.read_struct(_struct_HH)
         assert(_type == 65535)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.experimenter = reader.read("!L")[0]
-        obj.exp_type = reader.read("!L")[0]
+        obj.experimenter, obj.exp_type = reader.read_struct(_struct_LL)
         return obj
 
     def __eq__(self, other):
@@ -123,6 +134,7 @@ class experimenter(port_desc_prop):
 port_desc_prop.subtypes[65535] = experimenter
 
 class bsn(experimenter):
+    __slots__ = []
     subtypes = {}
 
     type = 65535
@@ -135,15 +147,15 @@ class bsn(experimenter):
             self.exp_type = 0
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!H", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
-        packed.append(struct.pack("!L", self.experimenter))
-        packed.append(struct.pack("!L", self.exp_type))
-        length = sum([len(x) for x in packed])
-        packed[1] = struct.pack("!H", length)
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_HHLL, buf, offset, self.type, 0, self.experimenter, self.exp_type)
+        length = offset - start
+        _struct_H.pack_into(buf, start + 2, length)
+        return offset
+
+    def wire_length(self):
+        return 12
 
     @staticmethod
     def unpack(reader):
@@ -153,14 +165,12 @@ class bsn(experimenter):
             return subclass.unpack(reader)
 
         obj = bsn()
-        _type = reader.read("!H")[0]
+        _type, _length = reader.read_struct(_struct_HH)
         assert(_type == 65535)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        _experimenter = reader.read("!L")[0]
+        _experimenter, obj.exp_type = reader.read_struct(_struct_LL)
         assert(_experimenter == 6035143)
-        obj.exp_type = reader.read("!L")[0]
         return obj
 
     def __eq__(self, other):
@@ -179,6 +189,7 @@ class bsn(experimenter):
 experimenter.subtypes[6035143] = bsn
 
 class bsn_uplink(bsn):
+    __slots__ = []
     type = 65535
     experimenter = 6035143
     exp_type = 0
@@ -186,27 +197,25 @@ class bsn_uplink(bsn):
     def __init__(self):
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!H", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
-        packed.append(struct.pack("!L", self.experimenter))
-        packed.append(struct.pack("!L", self.exp_type))
-        length = sum([len(x) for x in packed])
-        packed[1] = struct.pack("!H", length)
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_HHLL, buf, offset, self.type, 0, self.experimenter, self.exp_type)
+        length = offset - start
+        _struct_H.pack_into(buf, start + 2, length)
+        return offset
+
+    def wire_length(self):
+        return 12
 
     @staticmethod
     def unpack(reader):
         obj = bsn_uplink()
-        _type = reader.read("!H")[0]
+        _type, _length = reader.read_struct(_struct_HH)
         assert(_type == 65535)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        _experimenter = reader.read("!L")[0]
+        _experimenter, _exp_type = reader.read_struct(_struct_LL)
         assert(_experimenter == 6035143)
-        _exp_type = reader.read("!L")[0]
         assert(_exp_type == 0)
         return obj
 
@@ -225,6 +234,7 @@ class bsn_uplink(bsn):
 bsn.subtypes[0] = bsn_uplink
 
 class ethernet(port_desc_prop):
+    __slots__ = ["advertised", "curr", "curr_speed", "max_speed", "peer", "supported"]
     type = 0
 
     def __init__(self, curr=None, advertised=None, supported=None, peer=None, curr_speed=None, max_speed=None):
@@ -254,36 +264,25 @@ class ethernet(port_desc_prop):
             self.max_speed = 0
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!H", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
-        packed.append('\x00' * 4)
-        packed.append(struct.pack("!L", self.curr))
-        packed.append(struct.pack("!L", self.advertised))
-        packed.append(struct.pack("!L", self.supported))
-        packed.append(struct.pack("!L", self.peer))
-        packed.append(struct.pack("!L", self.curr_speed))
-        packed.append(struct.pack("!L", self.max_speed))
-        length = sum([len(x) for x in packed])
-        packed[1] = struct.pack("!H", length)
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_HH4xLLLLLL, buf, offset, self.type, 0, self.curr, self.advertised, self.supported, self.peer, self.curr_speed, self.max_speed)
+        length = offset - start
+        _struct_H.pack_into(buf, start + 2, length)
+        return offset
+
+    def wire_length(self):
+        return 32
 
     @staticmethod
     def unpack(reader):
         obj = ethernet()
-        _type = reader.read("!H")[0]
+        _type, _length = reader.read_struct(_struct_HH)
         assert(_type == 0)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
         reader.skip(4)
-        obj.curr = reader.read("!L")[0]
-        obj.advertised = reader.read("!L")[0]
-        obj.supported = reader.read("!L")[0]
-        obj.peer = reader.read("!L")[0]
-        obj.curr_speed = reader.read("!L")[0]
-        obj.max_speed = reader.read("!L")[0]
+        obj.curr, obj.advertised, obj.supported, obj.peer, obj.curr_speed, obj.max_speed = reader.read_struct(_struct_LLLLLL)
         return obj
 
     def __eq__(self, other):
@@ -324,6 +323,7 @@ class ethernet(port_desc_prop):
 port_desc_prop.subtypes[0] = ethernet
 
 class optical(port_desc_prop):
+    __slots__ = ["rx_grid_freq_lmda", "rx_max_freq_lmda", "rx_min_freq_lmda", "supported", "tx_grid_freq_lmda", "tx_max_freq_lmda", "tx_min_freq_lmda", "tx_pwr_max", "tx_pwr_min"]
     type = 1
 
     def __init__(self, supported=None, tx_min_freq_lmda=None, tx_max_freq_lmda=None, tx_grid_freq_lmda=None, rx_min_freq_lmda=None, rx_max_freq_lmda=None, rx_grid_freq_lmda=None, tx_pwr_min=None, tx_pwr_max=None):
@@ -365,42 +365,25 @@ class optical(port_desc_prop):
             self.tx_pwr_max = 0
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!H", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
-        packed.append('\x00' * 4)
-        packed.append(struct.pack("!L", self.supported))
-        packed.append(struct.pack("!L", self.tx_min_freq_lmda))
-        packed.append(struct.pack("!L", self.tx_max_freq_lmda))
-        packed.append(struct.pack("!L", self.tx_grid_freq_lmda))
-        packed.append(struct.pack("!L", self.rx_min_freq_lmda))
-        packed.append(struct.pack("!L", self.rx_max_freq_lmda))
-        packed.append(struct.pack("!L", self.rx_grid_freq_lmda))
-        packed.append(struct.pack("!L", self.tx_pwr_min))
-        packed.append(struct.pack("!L", self.tx_pwr_max))
-        length = sum([len(x) for x in packed])
-        packed[1] = struct.pack("!H", length)
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_HH4xLLLLLLLLL, buf, offset, self.type, 0, self.supported, self.tx_min_freq_lmda, self.tx_max_freq_lmda, self.tx_grid_freq_lmda, self.rx_min_freq_lmda, self.rx_max_freq_lmda, self.rx_grid_freq_lmda, self.tx_pwr_min, self.tx_pwr_max)
+        length = offset - start
+        _struct_H.pack_into(buf, start + 2, length)
+        return offset
+
+    def wire_length(self):
+        return 44
 
     @staticmethod
     def unpack(reader):
         obj = optical()
-        _type = reader.read("!H")[0]
+        _type, _length = reader.read_struct(_struct_HH)
         assert(_type == 1)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
         reader.skip(4)
-        obj.supported = reader.read("!L")[0]
-        obj.tx_min_freq_lmda = reader.read("!L")[0]
-        obj.tx_max_freq_lmda = reader.read("!L")[0]
-        obj.tx_grid_freq_lmda = reader.read("!L")[0]
-        obj.rx_min_freq_lmda = reader.read("!L")[0]
-        obj.rx_max_freq_lmda = reader.read("!L")[0]
-        obj.rx_grid_freq_lmda = reader.read("!L")[0]
-        obj.tx_pwr_min = reader.read("!L")[0]
-        obj.tx_pwr_max = reader.read("!L")[0]
+        obj.supported, obj.tx_min_freq_lmda, obj.tx_max_freq_lmda, obj.tx_grid_freq_lmda, obj.rx_min_freq_lmda, obj.rx_max_freq_lmda, obj.rx_grid_freq_lmda, obj.tx_pwr_min, obj.tx_pwr_max = reader.read_struct(_struct_LLLLLLLLL)
         return obj
 
     def __eq__(self, other):
@@ -14,7 +14,17 @@ import loxi.generic_util
 import sys
 ofp = sys.modules['loxi.of14']
 
+# Precompiled layouts for the fixed-length parts of each pack_into() and unpack()
+_struct_H = struct.Struct("!H")
+_struct_HH = struct.Struct("!HH")
+_struct_HHL = struct.Struct("!HHL")
+_struct_HHLL = struct.Struct("!HHLL")
+_struct_HHLLLLL = struct.Struct("!HHLLLLL")
+_struct_LL = struct.Struct("!LL")
+_struct_LLLLL = struct.Struct("!LLLLL")
+
 class port_mod_prop(loxi.OFObject):
+    __slots__ = ["type"]
     subtypes = {}
 
 
@@ -25,13 +35,15 @@ class port_mod_prop(loxi.OFObject):
             self.type = 0
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!H", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
-        length = sum([len(x) for x in packed])
-        packed[1] = struct.pack("!H", length)
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_HH, buf, offset, self.type, 0)
+        length = offset - start
+        _struct_H.pack_into(buf, start + 2, length)
+        return offset
+
+    def wire_length(self):
+        return 4
 
     @staticmethod
     def unpack(reader):
@@ -41,8 +53,7 @@ class port_mod_prop(loxi.OFObject):
             return subclass.unpack(reader)
 
         obj = port_mod_prop()
-        obj.type = reader.read("!H")[0]
-        _length = reader.read("!H")[0]
+        obj.type, _length = reader.read_struct(_struct_HH)
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
         return obj
@@ -62,6 +73,7 @@ class port_mod_prop(loxi.OFObject):
 
 
 class ethernet(port_mod_prop):
+    __slots__ = ["advertise"]
     type = 0
 
     def __init__(self, advertise=None):
@@ -71,21 +83,21 @@ class ethernet(port_mod_prop):
             self.advertise = 0
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!H", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
-        packed.append(struct.pack("!L", self.advertise))
-        length = sum([len(x) for x in packed])
-        packed[1] = struct.pack("!H", length)
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_HHL, buf, offset, self.type, 0, self.advertise)
+        length = offset - start
+        _struct_H.pack_into(buf, start + 2, length)
+        return offset
+
+    def wire_length(self):
+        return 8
 
     @staticmethod
     def unpack(reader):
         obj = ethernet()
-        _type = reader.read("!H")[0]
+        _type, _length = reader.read_struct(_struct_HH)
         assert(_type == 0)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
         obj.advertise = reader.read("!L")[0]
@@ -109,6 +121,7 @@ class ethernet(port_mod_prop):
 port_mod_prop.subtypes[0] = ethernet
 
 class experimenter(port_mod_prop):
+    __slots__ = ["exp_type", "experimenter"]
     subtypes = {}
 
     type = 65535
@@ -124,15 +137,15 @@ class experimenter(port_mod_prop):
             self.exp_type = 0
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!H", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
-        packed.append(struct.pack("!L", self.experimenter))
-        packed.append(struct.pack("!L", self.exp_type))
-        length = sum([len(x) for x in packed])
-        packed[1] = struct.pack("!H", length)
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_HHLL, buf, offset, self.type, 0, self.experimenter, self.exp_type)
+        length = offset - start
+        _struct_H.pack_into(buf, start + 2, length)
+        return offset
+
+    def wire_length(self):
+        return 12
 
     @staticmethod
     def unpack(reader):
@@ -142,13 +155,11 @@ class experimenter(port_mod_prop):
             return subclass.unpack(reader)
 
         obj = experimenter()
-        _type = reader.read("!H")[0]
+        _type, _length = reader.read_struct(_struct_HH)
         assert(_type == 65535)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.experimenter = reader.read("!L")[0]
-        obj.exp_type = reader.read("!L")[0]
+        obj.experimenter, obj.exp_type = reader.read_struct(_struct_LL)
         return obj
 
     def __eq__(self, other):
@@ -170,6 +181,7 @@ class experimenter(port_mod_prop):
 port_mod_prop.subtypes[65535] = experimenter
 
 class optical(port_mod_prop):
+    __slots__ = ["configure", "fl_offset", "freq_ldma", "grid_span", "tx_pwr"]
     type = 1
 
     def __init__(self, configure=None, freq_ldma=None, fl_offset=None, grid_span=None, tx_pwr=None):
@@ -195,32 +207,24 @@ class optical(port_mod_prop):
             self.tx_pwr = 0
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!H", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
-        packed.append(struct.pack("!L", self.configure))
-        packed.append(struct.pack("!L", self.freq_ldma))
-        packed.append(struct.pack("!L", self.fl_offset))
-        packed.append(struct.pack("!L", self.grid_span))
-        packed.append(struct.pack("!L", self.tx_pwr))
-        length = sum([len(x) for x in packed])
-        packed[1] = struct.pack("!H", length)
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_HHLLLLL, buf, offset, self.type, 0, self.configure, self.freq_ldma, self.fl_offset, self.grid_span, self.tx_pwr)
+        length = offset - start
+        _struct_H.pack_into(buf, start + 2, length)
+        return offset
+
+    def wire_length(self):
+        return 24
 
     @staticmethod
     def unpack(reader):
         obj = optical()
-        _type = reader.read("!H")[0]
+        _type, _length = reader.read_struct(_struct_HH)
         assert(_type == 1)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.configure = reader.read("!L")[0]
-        obj.freq_ldma = reader.read("!L")[0]
-        obj.fl_offset = reader.read("!L")[0]
-        obj.grid_span = reader.read("!L")[0]
-        obj.tx_pwr = reader.read("!L")[0]
+        obj.configure, obj.freq_ldma, obj.fl_offset, obj.grid_span, obj.tx_pwr = reader.read_struct(_struct_LLLLL)
         return obj
 
     def __eq__(self, other):
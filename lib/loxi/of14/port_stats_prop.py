@@ -14,7 +14,18 @@ import loxi.generic_util
 import sys
 ofp = sys.modules['loxi.of14']
 
+# Precompiled layouts for the fixed-length parts of each pack_into() and unpack()
+_struct_H = struct.Struct("!H")
+_struct_HH = struct.Struct("!HH")
+_struct_HH4xLLLLLLLHHHH = struct.Struct("!HH4xLLLLLLLHHHH")
+_struct_HH4xQQQQ = struct.Struct("!HH4xQQQQ")
+_struct_HHLL = struct.Struct("!HHLL")
+_struct_LL = struct.Struct("!LL")
+_struct_LLLLLLLHHHH = struct.Struct("!LLLLLLLHHHH")
+_struct_QQQQ = struct.Struct("!QQQQ")
+
 class port_stats_prop(loxi.OFObject):
+    __slots__ = ["type"]
     subtypes = {}
 
 
@@ -25,13 +36,15 @@ class port_stats_prop(loxi.OFObject):
             self.type = 0
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!H", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
-        length = sum([len(x) for x in packed])
-        packed[1] = struct.pack("!H", length)
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_HH, buf, offset, self.type, 0)
+        length = offset - start
+        _struct_H.pack_into(buf, start + 2, length)
+        return offset
+
+    def wire_length(self):
+        return 4
 
     @staticmethod
     def unpack(reader):
@@ -41,8 +54,7 @@ class port_stats_prop(loxi.OFObject):
             return subclass.unpack(reader)
 
         obj = port_stats_prop()
-        obj.type = reader.read("!H")[0]
-        _length = reader.read("!H")[0]
+        obj.type, _length = reader.read_struct(_struct_HH)
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
         return obj
@@ -62,6 +74,7 @@ class port_stats_prop(loxi.OFObject):
 
 
 class ethernet(port_stats_prop):
+    __slots__ = ["collisions", "rx_crc_err", "rx_frame_err", "rx_over_err"]
     type = 0
 
     def __init__(self, rx_frame_err=None, rx_over_err=None, rx_crc_err=None, collisions=None):
@@ -83,32 +96,25 @@ class ethernet(port_stats_prop):
             self.collisions = 0
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!H", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
-        packed.append('\x00' * 4)
-        packed.append(struct.pack("!Q", self.rx_frame_err))
-        packed.append(struct.pack("!Q", self.rx_over_err))
-        packed.append(struct.pack("!Q", self.rx_crc_err))
-        packed.append(struct.pack("!Q", self.collisions))
-        length = sum([len(x) for x in packed])
-        packed[1] = struct.pack("!H", length)
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_HH4xQQQQ, buf, offset, self.type, 0, self.rx_frame_err, self.rx_over_err, self.rx_crc_err, self.collisions)
+        length = offset - start
+        _struct_H.pack_into(buf, start + 2, length)
+        return offset
+
+    def wire_length(self):
+        return 40
 
     @staticmethod
     def unpack(reader):
         obj = ethernet()
-        _type = reader.read("!H")[0]
+        _type, _length = reader.read_struct(_struct_HH)
         assert(_type == 0)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
         reader.skip(4)
-        obj.rx_frame_err = reader.read("!Q")[0]
-        obj.rx_over_err = reader.read("!Q")[0]
-        obj.rx_crc_err = reader.read("!Q")[0]
-        obj.collisions = reader.read("!Q")[0]
+        obj.rx_frame_err, obj.rx_over_err, obj.rx_crc_err, obj.collisions = reader.read_struct(_struct_QQQQ)
         return obj
 
     def __eq__(self, other):
@@ -141,6 +147,7 @@ class ethernet(port_stats_prop):
 port_stats_prop.subtypes[0] = ethernet
 
 class experimenter(port_stats_prop):
+    __slots__ = ["exp_type", "experimenter", "experimenter_data"]
     subtypes = {}
 
     type = 65535
@@ -160,16 +167,16 @@ class experimenter(port_stats_prop):
             self.experimenter_data = ''
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!H", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
-        packed.append(struct.pack("!L", self.experimenter))
-        packed.append(struct.pack("!L", self.exp_type))
-        packed.append(self.experimenter_data)
-        length = sum([len(x) for x in packed])
-        packed[1] = struct.pack("!H", length)
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_HHLL, buf, offset, self.type, 0, self.experimenter, self.exp_type)
+        offset = loxi.generic_util.pack_bytes_into(self.experimenter_data, buf, offset)
+        length = offset - start
+        _struct_H.pack_into(buf, start + 2, length)
+        return offset
+
+    def wire_length(self):
+        return 12 + len(self.experimenter_data)
 
     @staticmethod
     def unpack(reader):
@@ -179,14 +186,12 @@ class experimenter(port_stats_prop):
             return subclass.unpack(reader)
 
         obj = experimenter()
-        _type = reader.read("!H")[0]
+        _type, _length = reader.read_struct(_struct_HH)
         assert(_type == 65535)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
-        obj.experimenter = reader.read("!L")[0]
-        obj.exp_type = reader.read("!L")[0]
-        obj.experimenter_data = str(reader.read_all())
+        obj.experimenter, obj.exp_type = reader.read_struct(_struct_LL)
+        obj.experimenter_data = reader.read_all()
         return obj
 
     def __eq__(self, other):
@@ -212,6 +217,7 @@ class experimenter(port_stats_prop):
 port_stats_prop.subtypes[65535] = experimenter
 
 class optical(port_stats_prop):
+    __slots__ = ["bias_current", "flags", "rx_freq_lmda", "rx_grid_span", "rx_offset", "rx_pwr", "temperature", "tx_freq_lmda", "tx_grid_span", "tx_offset", "tx_pwr"]
     type = 1
 
     def __init__(self, flags=None, tx_freq_lmda=None, tx_offset=None, tx_grid_span=None, rx_freq_lmda=None, rx_offset=None, rx_grid_span=None, tx_pwr=None, rx_pwr=None, bias_current=None, temperature=None):
@@ -261,46 +267,25 @@ class optical(port_stats_prop):
             self.temperature = 0
         return
 
-    def pack(self):
-        packed = []
-        packed.append(struct.pack("!H", self.type))
-        packed.append(struct.pack("!H", 0)) # placeholder for length at index 1
-        packed.append('\x00' * 4)
-        packed.append(struct.pack("!L", self.flags))
-        packed.append(struct.pack("!L", self.tx_freq_lmda))
-        packed.append(struct.pack("!L", self.tx_offset))
-        packed.append(struct.pack("!L", self.tx_grid_span))
-        packed.append(struct.pack("!L", self.rx_freq_lmda))
-        packed.append(struct.pack("!L", self.rx_offset))
-        packed.append(struct.pack("!L", self.rx_grid_span))
-        packed.append(struct.pack("!H", self.tx_pwr))
-        packed.append(struct.pack("!H", self.rx_pwr))
-        packed.append(struct.pack("!H", self.bias_current))
-        packed.append(struct.pack("!H", self.temperature))
-        length = sum([len(x) for x in packed])
-        packed[1] = struct.pack("!H", length)
-        return ''.join(packed)
+    def pack_into(self, buf, offset):
+        start = offset
+        offset = loxi.generic_util.pack_struct_into(_struct_HH4xLLLLLLLHHHH, buf, offset, self.type, 0, self.flags, self.tx_freq_lmda, self.tx_offset, self.tx_grid_span, self.rx_freq_lmda, self.rx_offset, self.rx_grid_span, self.tx_pwr, self.rx_pwr, self.bias_current, self.temperature)
+        length = offset - start
+        _struct_H.pack_into(buf, start + 2, length)
+        return offset
+
+    def wire_length(self):
+        return 44
 
     @staticmethod
     def unpack(reader):
         obj = optical()
-        _type = reader.read("!H")[0]
+        _type, _length = reader.read_struct(_struct_HH)
         assert(_type == 1)
-        _length = reader.read("!H")[0]
         orig_reader = reader
         reader = orig_reader.slice(_length, 4)
         reader.skip(4)
-        obj.flags = reader.read("!L")[0]
-        obj.tx_freq_lmda = reader.read("!L")[0]
-        obj.tx_offset = reader.read("!L")[0]
-        obj.tx_grid_span = reader.read("!L")[0]
-        obj.rx_freq_lmda = reader.read("!L")[0]
-        obj.rx_offset = reader.read("!L")[0]
-        obj.rx_grid_span = reader.read("!L")[0]
-        obj.tx_pwr = reader.read("!H")[0]
-        obj.rx_pwr = reader.read("!H")[0]
-        obj.bias_current = reader.read("!H")[0]
-        obj.temperature = reader.read("!H")[0]
+        obj.flags, obj.tx_freq_lmda, obj.tx_offset, obj.tx_grid_span, obj.rx_freq_lmda, obj.rx_offset, obj.rx_grid_span, obj.tx_pwr, obj.rx_pwr, obj.bias_current, obj.temperature = reader.read_struct(_struct_LLLLLLLHHHH)
         return obj
 
     def __eq__(self, other):
@@ -11,18 +11,55 @@ Example usage:
   [ 1, 2 ],
   [ 3, 4 ]
 ]
+
+Output is streamed: a group is written out as soon as it is known whether
+it fits on the line, so only up to a line's worth of text is buffered.
+pp_stream writes straight to a file-like object. Long lists and deep
+nesting can be cut short with max_entries and max_depth:
+
+>>> pp_stream(reply, sys.stdout, max_entries=10, max_depth=3)
+
+lazy returns an object that is only pretty-printed when converted to a
+string, for log messages that may not be emitted:
+
+>>> logging.debug(lazy(reply))
 """
 import unittest
+from collections import deque
 from contextlib import contextmanager
+from cStringIO import StringIO
 
-def pp(obj, maxwidth=79):
+def pp(obj, maxwidth=79, max_entries=None, max_depth=None):
     """
     Pretty-print the given object.
     """
-    ctx = PrettyPrinter(maxwidth=maxwidth)
+    ctx = PrettyPrinter(maxwidth=maxwidth, max_entries=max_entries,
+                        max_depth=max_depth)
     ctx.pp(obj)
     return str(ctx)
 
+def pp_stream(obj, stream, maxwidth=79, max_entries=None, max_depth=None):
+    """
+    Pretty-print the given object to a file-like object.
+    """
+    ctx = PrettyPrinter(maxwidth=maxwidth, stream=stream,
+                        max_entries=max_entries, max_depth=max_depth)
+    ctx.pp(obj)
+    ctx.finish()
+
+class lazy(object):
+    """
+    Pretty-print the given object when converted to a string.
+    """
+    __slots__ = ["obj", "kwargs"]
+
+    def __init__(self, obj, **kwargs):
+        self.obj = obj
+        self.kwargs = kwargs
+
+    def __str__(self):
+        return pp(self.obj, **self.kwargs)
+
 
 ## Pretty-printers for builtin classes
 
@@ -30,9 +67,12 @@ def pretty_print_list(pp, obj):
     with pp.group():
         pp.text('[')
         with pp.indent(2):
-            for v in obj:
+            for i, v in enumerate(obj):
                 if not pp.first(): pp.text(',')
                 pp.breakable()
+                if i == pp.max_entries:
+                    pp.text('... %d more' % (len(obj) - i))
+                    break
                 pp.pp(v)
         pp.breakable()
         pp.text(']')
@@ -41,38 +81,79 @@ def pretty_print_dict(pp, obj):
     with pp.group():
         pp.text('{')
         with pp.indent(2):
-            for (k, v) in sorted(obj.items()):
+            for i, (k, v) in enumerate(sorted(obj.items())):
                 if not pp.first(): pp.text(',')
                 pp.breakable()
+                if i == pp.max_entries:
+                    pp.text('... %d more' % (len(obj) - i))
+                    break
                 pp.pp(k)
                 pp.text(': ')
                 pp.pp(v)
         pp.breakable()
         pp.text('}')
 
+def pretty_print_memoryview(pp, obj):
+    pp.text(repr(obj.tobytes()))
+
 pretty_printers = {
     list: pretty_print_list,
     dict: pretty_print_dict,
+    memoryview: pretty_print_memoryview,
 }
 
 
 ## Implementation
 
+# Kinds of pending tokens
+TEXT, BREAKABLE, GROUP = range(3)
+
 class PrettyPrinter(object):
-    def __init__(self, maxwidth):
+    """
+    Streaming pretty-printer
+
+    A group breaks all its breakables if its flat length does not fit in
+    the rest of the line it starts on. Text after the start of the first
+    group not yet known to fit or break is held in a queue of pending
+    tokens, and written out once that group is decided.
+    """
+    def __init__(self, maxwidth, stream=None, max_entries=None, max_depth=None):
         self.maxwidth = maxwidth
+        if stream is None:
+            stream = StringIO()
+        self.stream = stream
+        self.max_entries = max_entries
+        self.max_depth = max_depth
+        self.depth = 0
         self.cur_indent = 0
-        self.root_group = Group()
+        self.col = 0 # column of the written output
+        self.pos = 0 # flat length of the written and pending output
+        self.pending = deque()
+        self.root_group = Group(0)
         self.group_stack = [self.root_group]
+        self.pending.append((GROUP, self.root_group))
 
     def current_group(self):
         return self.group_stack[-1]
 
     def text(self, s):
-        self.current_group().append(str(s))
+        s = str(s)
+        self.pos += len(s)
+        if self.pending:
+            self.pending.append((TEXT, s))
+            self._advance()
+        else:
+            self.stream.write(s)
+            self.col += len(s)
 
     def breakable(self, sep=' '):
-        self.current_group().append(Breakable(sep, self.cur_indent))
+        self.pos += len(sep)
+        token = (BREAKABLE, sep, self.cur_indent, self.current_group())
+        if self.pending:
+            self.pending.append(token)
+            self._advance()
+        else:
+            self._write_breakable(token)
 
     def first(self):
         return self.current_group().first()
@@ -85,72 +166,97 @@ class PrettyPrinter(object):
 
     @contextmanager
     def group(self):
-        self.group_stack.append(Group())
+        new_group = Group(self.pos)
+        self.group_stack.append(new_group)
+        self.pending.append((GROUP, new_group))
+        self._advance()
         yield
-        new_group = self.group_stack.pop()
-        self.current_group().append(new_group)
+        self.group_stack.pop()
+        new_group.end = self.pos
+        self._advance()
 
     def pp(self, obj):
-        if hasattr(obj, "pretty_print"):
-            obj.pretty_print(self)
-        elif type(obj) in pretty_printers:
-            pretty_printers[type(obj)](self, obj)
-        else:
-            self.text(repr(obj))
+        if self.max_depth is not None and self.depth >= self.max_depth and \
+           (hasattr(obj, "pretty_print") or isinstance(obj, (list, dict))):
+            self.text('...')
+            return
+        self.depth += 1
+        try:
+            if hasattr(obj, "pretty_print"):
+                obj.pretty_print(self)
+            elif type(obj) in pretty_printers:
+                pretty_printers[type(obj)](self, obj)
+            elif isinstance(obj, list):
+                pretty_print_list(self, obj)
+            else:
+                self.text(repr(obj))
+        finally:
+            self.depth -= 1
+
+    def finish(self):
+        """
+        Write out any pending output.
+        """
+        if self.root_group.end is None:
+            self.root_group.end = self.pos
+            self._advance()
 
     def __str__(self):
-        return self.root_group.render(0, self.maxwidth)
+        self.finish()
+        return self.stream.getvalue()
+
+    def _advance(self):
+        # Write out pending tokens up to the first undecided group
+        pending = self.pending
+        while pending:
+            token = pending[0]
+            kind = token[0]
+            if kind == GROUP:
+                group = token[1]
+                if group.broken is None:
+                    space = self.maxwidth - self.col
+                    if group.end is not None:
+                        group.broken = group.end - group.start > space
+                    elif self.pos - group.start > space:
+                        group.broken = True
+                    else:
+                        return
+            elif kind == TEXT:
+                self.stream.write(token[1])
+                self.col += len(token[1])
+            else:
+                self._write_breakable(token)
+            pending.popleft()
+
+    def _write_breakable(self, token):
+        _, sep, indent, group = token
+        if group.broken:
+            self.stream.write('\n' + ' ' * indent)
+            self.col = indent
+        else:
+            self.stream.write(sep)
+            self.col += len(sep)
 
 class Group(object):
-    __slots__ = ["fragments", "length", "_first"]
+    """
+    start: flat position of the start of the group
+    end: flat position of the end of the group, once closed
+    broken: whether the breakables of the group are line breaks, once known
+    """
+    __slots__ = ["start", "end", "broken", "_first"]
 
-    def __init__(self):
-        self.fragments = []
-        self.length = 0
+    def __init__(self, start):
+        self.start = start
+        self.end = None
+        self.broken = None
         self._first = True
 
-    def append(self, x):
-        self.fragments.append(x)
-        self.length += len(x)
-
     def first(self):
         if self._first:
             self._first = False
             return True
         return False
 
-    def __len__(self):
-        return self.length
-
-    def render(self, curwidth, maxwidth):
-        dobreak = len(self) > (maxwidth - curwidth)
-
-        a = []
-        for x in self.fragments:
-            if isinstance(x, Breakable):
-                if dobreak:
-                    a.append('\n')
-                    a.append(' ' * x.indent)
-                    curwidth = 0
-                else:
-                    a.append(x.sep)
-            elif isinstance(x, Group):
-                a.append(x.render(curwidth, maxwidth))
-            else:
-                a.append(x)
-            curwidth += len(a[-1])
-        return ''.join(a)
-
-class Breakable(object):
-    __slots__ = ["sep", "indent"]
-
-    def __init__(self, sep, indent):
-        self.sep = sep
-        self.indent = indent
-
-    def __len__(self):
-        return len(self.sep)
-
 
 ## Tests
 
@@ -159,6 +265,9 @@ class TestPP(unittest.TestCase):
         self.assertEquals(pp(1), "1")
         self.assertEquals(pp("foo"), "'foo'")
 
+    def test_memoryview(self):
+        self.assertEquals(pp(memoryview(bytearray("foo"))), "'foo'")
+
     def test_hash(self):
         expected = """{ 1: 'a', 'b': 2 }"""
         self.assertEquals(pp(eval(expected)), expected)
@@ -229,6 +338,19 @@ class TestPP(unittest.TestCase):
 ]"""
         self.assertEquals(pp(eval(expected), maxwidth=15), expected)
 
+    def test_truncation(self):
+        self.assertEquals(pp(range(5), max_entries=2), "[ 0, 1, ... 3 more ]")
+        self.assertEquals(pp({ 1: 'a', 2: 'b' }, max_entries=1), "{ 1: 'a', ... 1 more }")
+        self.assertEquals(pp([[1, [2]], 3], max_depth=2), "[ [ 1, ... ], 3 ]")
+
+    def test_stream(self):
+        stream = StringIO()
+        pp_stream([[1, 2], [3, 4]], stream, maxwidth=15)
+        self.assertEquals(stream.getvalue(), "[\n  [ 1, 2 ],\n  [ 3, 4 ]\n]")
+
+    def test_lazy(self):
+        self.assertEquals(str(lazy(range(3), maxwidth=0)), "[\n  0,\n  1,\n  2\n]")
+
     # This is an edge case where our simpler algorithm breaks down.
     @unittest.expectedFailure
     def test_greedy_breaking(self):
@@ -0,0 +1,101 @@
+"""
+template - pre-packed messages with patchable fields
+
+A template packs a message once and emits copies of its bytes with the xid,
+and optionally other fixed-position integer fields, patched in place. It is
+meant for messages sent again and again with only a few fields changing:
+
+>>> barrier = Template(ofp.message.barrier_request())
+>>> ctrl.transact(barrier.pack(xid=1234))
+
+>>> flow_del = Template(ofp.message.flow_delete(table_id=0), fields=["cookie"])
+>>> flow_del.pack(xid=5, cookie=0x10)
+
+Fields other than xid are located by packing the message with the field
+set to its minimum and maximum values, so they must be integers whose
+position does not depend on their value.
+"""
+
+import copy
+import struct
+import loxi
+import loxi.generic_util
+
+class Template(object):
+    """
+    Packed message with patchable fields
+
+    msg: message object the template is packed from
+    fields: names of integer fields to patch, besides xid
+    """
+    def __init__(self, msg, fields=()):
+        # Work on a copy, fields are set while locating them
+        msg = copy.deepcopy(msg)
+        if msg.xid is None:
+            msg.xid = 0
+        self.packed = msg.pack()
+        self.fields = { "xid": (4, _layouts[4]) }
+        for name in fields:
+            self.fields[name] = _locate(msg, name)
+
+    def pack(self, **values):
+        """
+        Return the packed message with the given fields patched.
+        """
+        buf = bytearray(self.packed)
+        self.patch(buf, 0, **values)
+        return str(buf)
+
+    def pack_into(self, buf, offset, **values):
+        """
+        Write the packed message into the bytearray buf at offset, growing
+        it if needed, patch the given fields and return the offset past the
+        end.
+        """
+        end = loxi.generic_util.pack_bytes_into(self.packed, buf, offset)
+        self.patch(buf, offset, **values)
+        return end
+
+    def patch(self, buf, offset, **values):
+        """
+        Overwrite the given fields of a copy of the message in buf at offset.
+        """
+        for name, value in values.items():
+            field_offset, st = self.fields[name]
+            st.pack_into(buf, offset + field_offset, value)
+
+    def __len__(self):
+        return len(self.packed)
+
+_layouts = {
+    1: struct.Struct("!B"),
+    2: struct.Struct("!H"),
+    4: struct.Struct("!L"),
+    8: struct.Struct("!Q"),
+}
+
+def _locate(msg, name):
+    """
+    Return (offset, struct) of the integer field name in the packed msg.
+    """
+    if not isinstance(getattr(msg, name, None), (int, long)):
+        raise ValueError("%s is not an integer field of %s" % (name, type(msg).__name__))
+    orig = getattr(msg, name)
+    try:
+        setattr(msg, name, 0)
+        low = msg.pack()
+        for width in (8, 4, 2, 1):
+            setattr(msg, name, (1 << (width * 8)) - 1)
+            try:
+                high = msg.pack()
+            except struct.error:
+                continue
+            break
+        else:
+            raise ValueError("cannot locate field %s of %s" % (name, type(msg).__name__))
+    finally:
+        setattr(msg, name, orig)
+    diff = [i for i in range(len(low)) if low[i] != high[i]]
+    if len(low) != len(high) or not diff or diff[-1] - diff[0] + 1 != width or len(diff) != width:
+        raise ValueError("%s is not a fixed-position field of %s" % (name, type(msg).__name__))
+    return (diff[0], _layouts[width])
@@ -0,0 +1,91 @@
+#!/usr/bin/env python
+import unittest
+import loxi
+from loxi.frozen import freeze, FrozenObject
+
+ofp = loxi.protocol(4)
+
+def flow(priority, port=1):
+    return ofp.message.flow_add(
+        xid=1, priority=priority,
+        match=ofp.match([ofp.oxm.in_port(port)]),
+        instructions=[ofp.instruction.apply_actions([ofp.action.output(port=2)])])
+
+class TestFrozen(unittest.TestCase):
+    def test_freeze(self):
+        msg = flow(5)
+        frozen = freeze(msg)
+        self.assertTrue(isinstance(frozen, FrozenObject))
+        self.assertTrue(isinstance(frozen, ofp.message.flow_add))
+        self.assertTrue(isinstance(frozen.match, FrozenObject))
+        self.assertEquals(frozen.pack(), msg.pack())
+        self.assertTrue(freeze(frozen) is frozen)
+
+    def test_invalidate(self):
+        frozen = freeze(flow(5))
+        frozen.packed()
+        frozen.match.oxm_list = [ofp.oxm.in_port(7)]
+        self.assertEquals(frozen.pack(), flow(5, port=7).pack())
+
+    def test_frozen_list(self):
+        frozen = freeze(flow(5))
+        self.assertRaises(TypeError, frozen.instructions.append,
+                          ofp.instruction.clear_actions())
+
+    def test_eq_hash(self):
+        a, b = freeze(flow(5)), freeze(flow(5))
+        self.assertEquals(a, b)
+        self.assertEquals(hash(a), hash(b))
+        self.assertNotEquals(a, freeze(flow(6)))
+        self.assertNotEquals(a, freeze(ofp.message.flow_delete(xid=1)))
+
+    def test_eq_unfrozen(self):
+        msg = flow(5)
+        frozen = freeze(msg)
+        self.assertTrue(frozen == msg)
+        self.assertTrue(msg == frozen)
+        self.assertFalse(frozen != msg)
+        self.assertFalse(msg != frozen)
+        self.assertNotEquals(frozen, flow(6))
+        self.assertNotEquals(flow(6), frozen)
+        self.assertNotEquals(frozen, ofp.message.flow_delete(xid=1))
+
+    def test_frozen_child(self):
+        match = freeze(ofp.match([ofp.oxm.in_port(1)]))
+        a = ofp.message.flow_add(xid=1, match=match)
+        b = ofp.message.flow_add(xid=1, match=ofp.match([ofp.oxm.in_port(1)]))
+        self.assertEquals(a.pack(), b.pack())
+        self.assertTrue(a == b)
+        self.assertTrue(b == a)
+        self.assertEquals(a, ofp.message.parse_message(a.pack()))
+        self.assertEquals(ofp.message.parse_message(a.pack()), a)
+        self.assertNotEquals(a, ofp.message.flow_add(
+            xid=1, match=ofp.match([ofp.oxm.in_port(2)])))
+
+    def test_unpackable(self):
+        # A message without an xid cannot be packed
+        a = freeze(ofp.message.barrier_request())
+        b = freeze(ofp.message.barrier_request())
+        self.assertEquals(a, b)
+        self.assertEquals(hash(a), hash(b))
+        self.assertNotEquals(a, freeze(ofp.message.barrier_request(xid=1)))
+        self.assertEquals(a, ofp.message.barrier_request())
+        self.assertEquals(ofp.message.barrier_request(), a)
+        self.assertEquals(len(set([a, b, freeze(ofp.message.barrier_request(xid=1))])), 2)
+
+    def test_set_difference(self):
+        expected = [flow(p) for p in range(10)]
+        actual = [flow(p) for p in range(1, 11)]
+        missing = set(map(freeze, expected)) - set(map(freeze, actual))
+        self.assertEquals([x.priority for x in missing], [0])
+
+    def test_clone(self):
+        frozen = freeze(flow(5))
+        frozen.packed()
+        clone = frozen.clone(priority=6)
+        self.assertEquals(clone, freeze(flow(6)))
+        self.assertEquals(frozen, freeze(flow(5)))
+        self.assertFalse(clone.match is frozen.match)
+
+if __name__ == '__main__':
+    unittest.main()
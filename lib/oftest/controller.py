@@ -24,21 +24,28 @@ the controller.   There seems
 to be no clean way to interrupt an accept call.  Using select that also listens
 on an administrative socket and can shut down the socket might work.
 
+ControllerServer keeps its listen socket open and serves any number of
+switch connections from a single thread, each with its own Controller.
+
 """
 
 import sys
 import os
+import errno
 import socket
 import time
 import struct
 import select
 import logging
+from collections import deque
 from threading import Thread
 from threading import Lock
 from threading import Condition
 
 import ofutils
 import loxi
+import loxi.generic_util
+import loxi.template
 
 # Configured openflow version
 import ofp as cfg_ofp
@@ -65,6 +72,7 @@ def hex_dump_buffer(src, length=16):
 ##@todo Find a better home for these identifiers (controller)
 RCV_SIZE_DEFAULT = 32768
 LISTEN_QUEUE_SIZE = 1
+SERVER_LISTEN_QUEUE_SIZE = 128
 
 class Controller(Thread):
     """
@@ -83,6 +91,7 @@ class Controller(Thread):
     @todo Test transaction code
 
     @var rcv_size The receive size to use for receive calls
+    @var rcvbuf_size If not None, the SO_RCVBUF of the switch socket
     @var max_pkts The max size of the receive queue
     @var keep_alive If true, listen for echo requests and respond w/
     echo replies
@@ -94,13 +103,23 @@ class Controller(Thread):
     @var packets_total Total number of packets received
     @var packets_expired Number of packets popped from queue as queue full
     @var packets_handled Number of packets handled by something
+    @var handle_errors Number of exceptions raised handling messages from
+    the switch, each closing the connection of a ControllerServer
+    @var lazy_decode If true, received messages are parsed header-only and
+    only fully decoded once a handler, poll or transact looks at them
+    @var max_stats_parts The max number of received parts of a multipart
+    stats reply waiting to be consumed by stats_replies() before the
+    switch socket stops being read
     @var dbg_state Debug indication of state
+    @var server The ControllerServer serving this connection, if any
     """
 
-    def __init__(self, switch=None, host='127.0.0.1', port=6653, max_pkts=1024):
+    def __init__(self, switch=None, host='127.0.0.1', port=6653, max_pkts=1024,
+                 server=None):
         Thread.__init__(self)
         # Socket related
         self.rcv_size = RCV_SIZE_DEFAULT
+        self.rcvbuf_size = None
         self.listen_socket = None
         self.switch_socket = None
         self.switch_addr = None
@@ -109,11 +128,17 @@ class Controller(Thread):
         self.tx_lock = Lock()
 
         # Used to wake up the event loop from another thread
-        self.waker = ofutils.EventDescriptor()
+        # A connection of a ControllerServer wakes up the server's loop
+        self.server = server
+        if server is None:
+            self.waker = ofutils.EventDescriptor()
+        else:
+            self.waker = None
 
         # Counters
         self.socket_errors = 0
         self.parse_errors = 0
+        self.handle_errors = 0
         self.packets_total = 0
         self.packets_expired = 0
         self.packets_handled = 0
@@ -128,7 +153,7 @@ class Controller(Thread):
 
         # OpenFlow message/packet queue
         # Protected by the packets_cv lock / condition variable
-        self.packets = []
+        self.packets = MessageQueue()
         self.packets_cv = Condition()
         self.packet_in_count = 0
 
@@ -145,19 +170,36 @@ class Controller(Thread):
         self.pkt_in_filter_limit = 50 # Count on run of packet ins
         self.pkt_in_dropped = 0 # Total dropped packet ins
         self.transact_to = 15 # Transact timeout default value; add to config
+        self.lazy_decode = False
 
         # Transaction and message type waiting variables 
         #   xid_cv: Condition variable (semaphore) for packet waiters
-        #   xid: Transaction ID being waited on
-        #   xid_response: Transaction response message
+        #   transactions: Outstanding Transaction objects by xid
         self.xid_cv = Condition()
-        self.xid = None
-        self.xid_response = None
-
-        self.buffered_input = ""
+        self.transactions = {}
+
+        # Multipart stats reply being streamed by stats_replies()
+        #   stats_cv: Condition variable for the parts below
+        #   stats_xid: Transaction ID of the stats request
+        #   stats_parts: Received (msg, pkt) parts not yet consumed
+        #   stats_discard: True once the consumer stopped early
+        self.stats_cv = Condition()
+        self.stats_xid = None
+        self.stats_parts = []
+        self.stats_discard = False
+        self.max_stats_parts = 4
+
+        # Receive buffer, holding rcv_len bytes of incomplete messages
+        # followed by free space received into. Only used by the thread
+        # reading the switch socket
+        self.rcv_buf = bytearray()
+        self.rcv_len = 0
+
+        # Protocol modules by wire version for this connection
+        self.protocols = {}
 
         # Create listen socket
-        if self.passive:
+        if self.passive and server is None:
             self.logger.info("Create/listen at " + self.host + ":" +
                              str(self.port))
             ai = socket.getaddrinfo(self.host, self.port, socket.AF_UNSPEC,
@@ -192,7 +234,7 @@ class Controller(Thread):
 
         return False
 
-    def _pkt_handle(self, pkt):
+    def _pkt_handle(self, pkt=None):
         """
         Check for all packet handling conditions
 
@@ -205,69 +247,93 @@ class Controller(Thread):
 
         an echo request in case keep_alive is true, followed by
         registered message handlers.
-        @param pkt The raw packet (string) which may contain multiple OF msgs
+        @param pkt The raw packet (string) which may contain multiple OF msgs,
+        or None if the data was already received into the receive buffer
         """
 
-        # snag any left over data from last read()
-        pkt = self.buffered_input + pkt
-        self.buffered_input = ""
+        if pkt:
+            self._rcv_reserve(len(pkt))
+            self.rcv_buf[self.rcv_len:self.rcv_len + len(pkt)] = pkt
+            self.rcv_len += len(pkt)
 
-        # Process each of the OF msgs inside the pkt
-        offset = 0
-        while offset < len(pkt):
-            if offset + 8 > len(pkt):
-                break
-
-            # Parse the header to get type
-            hdr_version, hdr_type, hdr_length, hdr_xid = cfg_ofp.message.parse_header(pkt[offset:])
-
-            # Use loxi to resolve to ofp of matching version
-            ofp = loxi.protocol(hdr_version)
+        # Frame the messages in place, only the ones kept are copied out
+        view = memoryview(self.rcv_buf)[:self.rcv_len]
+        stream = loxi.parse_stream(view, lazy=True, protocols=self.protocols)
+        try:
+            self._msgs_handle(stream, view)
+        finally:
+            self._rcv_consume(stream.offset)
+        # The buffer cannot be resized while viewed
+        del stream, view
+        self._rcv_shrink()
+
+    def _msgs_handle(self, stream, view):
+        """
+        Handle each complete message framed by stream over view
+        """
+        for (frame, start, end) in stream:
+            hdr_version, hdr_type, hdr_length, hdr_xid = \
+                frame.version, frame.type, frame.length, frame.xid
 
-            # Extract the raw message bytes
-            if (offset + hdr_length) > len(pkt):
-                break
-            rawmsg = pkt[offset : offset + hdr_length]
-            offset += hdr_length
+            # Protocol module of matching version, resolved by the stream
+            ofp = self.protocols[hdr_version]
 
             #if self.filter_packet(rawmsg, hdr):
             #    continue
 
-            msg = ofp.message.parse_message(rawmsg)
-            if not msg:
-                self.parse_errors += 1
-                self.logger.warn("Could not parse message")
-                continue
-
-            self.logger.debug("Msg in: version %d class %s len %d xid %d",
-                              hdr_version, type(msg).__name__, hdr_length, hdr_xid)
+            self.logger.debug("Msg in: version %d type %d len %d xid %d",
+                              hdr_version, hdr_type, hdr_length, hdr_xid)
 
             with self.sync:
                 # Check if transaction is waiting
                 with self.xid_cv:
-                    if self.xid and hdr_xid == self.xid:
+                    trans = self.transactions.get(hdr_xid)
+                    if trans is not None and not trans.done:
                         self.logger.debug("Matched expected XID " + str(hdr_xid))
-                        self.xid_response = (msg, rawmsg)
-                        self.xid = None
-                        self.xid_cv.notify()
+                        (msg, rawmsg) = self._frame_copy(ofp, view, start, end)
+                        trans.replies.append((msg, rawmsg))
+                        if not trans.multipart or hdr_type != ofp.OFPT_STATS_REPLY or \
+                           not _stats_flags(rawmsg) & ofp.OFPSF_REPLY_MORE:
+                            del self.transactions[hdr_xid]
+                            trans.complete()
+                        self.xid_cv.notifyAll()
+                        continue
+
+                # Check if a multipart stats reply is being streamed
+                with self.stats_cv:
+                    if self.stats_xid is not None and hdr_xid == self.stats_xid:
+                        if self.stats_discard:
+                            self.poll_discards += 1
+                            if hdr_type != ofp.OFPT_STATS_REPLY or \
+                               not _stats_flags(view[start:end]) & ofp.OFPSF_REPLY_MORE:
+                                self.stats_xid = None
+                        else:
+                            # Decoded by stats_replies() if the consumer asks
+                            self.stats_parts.append(
+                                self._frame_copy(ofp, view, start, end, lazy=True))
+                            self.stats_cv.notify()
                         continue
 
                 # Check if keep alive is set; if so, respond to echo requests
                 if self.keep_alive:
                     if hdr_type == ofp.OFPT_ECHO_REQUEST:
                         self.logger.debug("Responding to echo request")
-                        rep = ofp.message.echo_reply()
-                        rep.xid = hdr_xid
                         # Ignoring additional data
-                        self.message_send(rep)
+                        self.message_send(_echo_reply(ofp, hdr_xid))
                         continue
 
+                (msg, rawmsg) = self._frame_copy(ofp, view, start, end)
+                if not msg:
+                    self.parse_errors += 1
+                    self.logger.warn("Could not parse message")
+                    continue
+
                 # Generalize to counters for all packet types?
                 if msg.type == ofp.OFPT_PACKET_IN:
                     self.packet_in_count += 1
 
                 # Log error messages
-                if isinstance(msg, ofp.message.error_msg):
+                if hdr_type == ofp.OFPT_ERROR and isinstance(msg, ofp.message.error_msg):
                     #pylint: disable=E1103
                     if msg.err_type in ofp.ofp_error_type_map:
                         type_str = ofp.ofp_error_type_map[msg.err_type]
@@ -307,19 +373,53 @@ class Controller(Thread):
                 if not handled: # Not handled, enqueue
                     with self.packets_cv:
                         if len(self.packets) >= self.max_pkts:
-                            self.packets.pop(0)
+                            self.packets.popleft()
                             self.packets_expired += 1
-                        self.packets.append((msg, rawmsg))
+                        self.packets.append(hdr_type, msg, rawmsg)
                         self.packets_cv.notify_all()
                     self.packets_total += 1
                 else:
                     self.packets_handled += 1
                     self.logger.debug("Message handled by callback")
 
-        # end of 'while offset < len(pkt)'
-        #   note that if offset = len(pkt), this is
-        #   appends a harmless empty string
-        self.buffered_input += pkt[offset:]
+    def _frame_copy(self, ofp, view, start, end, lazy=None):
+        """
+        Copy a message out of the receive buffer and parse it
+
+        @param lazy Parse the header only; if None use lazy_decode
+        @retval A pair (msg, pkt) owning its bytes
+        """
+        if lazy is None:
+            lazy = self.lazy_decode
+        rawmsg = view[start:end].tobytes()
+        return (ofp.message.parse_message(rawmsg, lazy=lazy), rawmsg)
+
+    def _rcv_reserve(self, size=0):
+        """
+        Grow the receive buffer to hold rcv_size bytes, size more bytes and
+        the rest of a partially received message
+        """
+        end = max(self.rcv_size, self.rcv_len + size)
+        if self.rcv_len >= 4:
+            end = max(end, _length_struct.unpack_from(self.rcv_buf, 2)[0])
+        if len(self.rcv_buf) < end:
+            self.rcv_buf.extend(bytearray(end - len(self.rcv_buf)))
+
+    def _rcv_consume(self, count):
+        """
+        Remove count bytes of handled messages from the receive buffer
+        """
+        rest = self.rcv_len - count
+        if rest and count:
+            self.rcv_buf[:rest] = self.rcv_buf[count:self.rcv_len]
+        self.rcv_len = rest
+
+    def _rcv_shrink(self):
+        """
+        Give back the memory a large message grew the receive buffer to
+        """
+        if len(self.rcv_buf) > self.rcv_size >= self.rcv_len:
+            del self.rcv_buf[self.rcv_size:]
 
     def _socket_ready_handle(self, s):
         """
@@ -341,23 +441,17 @@ class Controller(Thread):
             except:
                 self.logger.warning("Error on listen socket accept")
                 return -1
-            self.logger.info(self.host+":"+str(self.port)+": Incoming connection from "+str(addr))
-
-            with self.connect_cv:
-                (self.switch_socket, self.switch_addr) = (sock, addr)
-                self.switch_socket.setsockopt(socket.IPPROTO_TCP,
-                                              socket.TCP_NODELAY, True)
-                if self.initial_hello:
-                    self.message_send(cfg_ofp.message.hello())
-                self.connect_cv.notify() # Notify anyone waiting
+            self.attach(sock, addr)
 
             # Prevent further connections
             self.listen_socket.close()
             self.listen_socket = None
         elif s and s == self.switch_socket:
+            self._rcv_reserve()
             for idx in range(3): # debug: try a couple of times
                 try:
-                    pkt = self.switch_socket.recv(self.rcv_size)
+                    count = self.switch_socket.recv_into(
+                        memoryview(self.rcv_buf)[self.rcv_len:])
                 except:
                     self.logger.warning("Error on switch read")
                     return -1
@@ -365,17 +459,18 @@ class Controller(Thread):
                 if not self.active:
                     return 0
       
-                if len(pkt) == 0:
+                if count == 0:
                     self.logger.warning("Zero-length switch read, %d" % idx)
                 else:
                     break
 
-            if len(pkt) == 0: # Still no packet
+            if count == 0: # Still no packet
                 self.logger.warning("Zero-length switch read; closing cxn")
                 self.logger.info(str(self))
                 return -1
 
-            self._pkt_handle(pkt)
+            self.rcv_len += count
+            self._pkt_handle()
         elif s and s == self.waker:
             self.waker.wait()
         else:
@@ -384,6 +479,26 @@ class Controller(Thread):
 
         return 0
 
+    def attach(self, sock, addr):
+        """
+        Take over an accepted switch connection
+
+        @param sock The connected switch socket
+        @param addr The address of the switch
+        """
+        self.logger.info(self.host+":"+str(self.port)+": Incoming connection from "+str(addr))
+
+        with self.connect_cv:
+            (self.switch_socket, self.switch_addr) = (sock, addr)
+            self.switch_socket.setsockopt(socket.IPPROTO_TCP,
+                                          socket.TCP_NODELAY, True)
+            if self.rcvbuf_size is not None:
+                self.switch_socket.setsockopt(socket.SOL_SOCKET,
+                                              socket.SO_RCVBUF, self.rcvbuf_size)
+            if self.initial_hello:
+                self.message_send(cfg_ofp.message.hello())
+            self.connect_cv.notify() # Notify anyone waiting
+
     def active_connect(self):
         """
         Actively connect to a switch IP addr
@@ -391,6 +506,10 @@ class Controller(Thread):
         try:
             self.logger.info("Trying active connection to %s" % self.switch)
             soc = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+            if self.rcvbuf_size is not None:
+                # Before connecting, so the TCP window scale can use it
+                soc.setsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF,
+                               self.rcvbuf_size)
             soc.connect((self.switch, self.port))
             self.logger.info("Connected to " + self.switch + " on " +
                          str(self.port))
@@ -406,13 +525,25 @@ class Controller(Thread):
         """
         Wake up the event loop, presumably from another thread.
         """
-        self.waker.notify()
+        if self.server is not None:
+            self.server.wakeup()
+        else:
+            self.waker.notify()
+
+    def read_paused(self):
+        """
+        Return True if the switch socket should not be read for now.
+        """
+        # Leave the switch waiting until stats_replies() catches up
+        return len(self.stats_parts) >= self.max_stats_parts
 
     def sockets(self):
         """
         Return list of sockets to select on.
         """
         socs = [self.listen_socket, self.switch_socket, self.waker]
+        if self.switch_socket and self.read_paused():
+            socs.remove(self.switch_socket)
         return [x for x in socs if x]
 
     def run(self):
@@ -494,10 +625,17 @@ class Controller(Thread):
             self.switch_socket.close()
             self.switch_socket = None
             self.switch_addr = None
+            self.rcv_len = 0
             with self.packets_cv:
-                self.packets = []
+                self.packets.clear()
+            with self.stats_cv:
+                self.stats_parts = []
+            self._transactions_complete()
             with self.connect_cv:
                 self.connect_cv.notifyAll()
+            if self.server is not None:
+                # Let the server forget the connection
+                self.server.wakeup()
 
     def wait_disconnected(self, timeout=-1):
         """
@@ -517,7 +655,11 @@ class Controller(Thread):
         """
         self.active = False
         self.wakeup()
-        self.join()
+        if self.server is not None:
+            # Not a running thread, the server reads its socket
+            self.shutdown()
+        else:
+            self.join()
 
     def shutdown(self):
         """
@@ -531,6 +673,8 @@ class Controller(Thread):
             self.switch_socket.shutdown(socket.SHUT_RDWR)
         except:
             self.logger.info("Ignoring switch soc shutdown error")
+        if self.switch_socket:
+            self.switch_socket.close()
         self.switch_socket = None
 
         try:
@@ -540,8 +684,7 @@ class Controller(Thread):
         self.listen_socket = None
 
         # Wakeup condition variables on which controller may be wait
-        with self.xid_cv:
-            self.xid_cv.notifyAll()
+        self._transactions_complete()
 
         with self.connect_cv:
             self.connect_cv.notifyAll()
@@ -600,22 +743,28 @@ class Controller(Thread):
 
         self.logger.debug("Polling for %s", klass.__name__)
 
+        # Look up messages by header type so lazily parsed messages of
+        # other types are not decoded just to be rejected. Abstract classes
+        # have a slot, not a type
+        klass_type = getattr(klass, "type", None)
+        if not isinstance(klass_type, int):
+            klass_type = None
+
         # Take the packet from the queue
         def grab():
-            for i, (msg, pkt) in enumerate(self.packets):
-                if klass is None or isinstance(msg, klass):
-                    self.logger.debug("Got %s message", msg.__class__.__name__)
-                    return self.packets.pop(i)
-            # Not found
-            self.logger.debug("%s message not in queue", klass.__name__)
-            return None
+            ret = self.packets.pop(klass, klass_type)
+            if ret is None:
+                self.logger.debug("%s message not in queue", klass.__name__)
+            else:
+                self.logger.debug("Got %s message", ret[0].__class__.__name__)
+            return ret
 
         with self.packets_cv:
             ret = ofutils.timed_wait(self.packets_cv, grab, timeout=timeout)
 
         if ret != None:
             (msg, pkt) = ret
-            return (msg, pkt)
+            return (_decoded(msg), pkt)
         else:
             return (None, None)
 
@@ -627,36 +776,256 @@ class Controller(Thread):
         transaction id.  Transactions have the highest priority in
         received message handling.
 
-        @param msg The message object to send; must not be a string
+        @param msg The message object to send, or a packed message string
+        such as one from a loxi.template.Template
         @param timeout The timeout in seconds; if -1 use default.
         """
 
-        if msg.xid == None:
-            msg.xid = ofutils.gen_xid()
+        trans = self._transaction(msg, multipart=False)
+        xid = trans.xid
 
-        self.logger.debug("Running transaction %d" % msg.xid)
+        self.logger.debug("Running transaction %d" % xid)
 
         with self.xid_cv:
-            if self.xid:
-                self.logger.error("Can only run one transaction at a time")
+            if xid in self.transactions:
+                self.logger.error("Transaction %d already running" % xid)
                 return (None, None)
+            self.transactions[xid] = trans
 
-            self.xid = msg.xid
-            self.xid_response = None
+        try:
             self.message_send(msg)
 
-            self.logger.debug("Waiting for transaction %d" % msg.xid)
-            ofutils.timed_wait(self.xid_cv, lambda: self.xid_response, timeout=timeout)
+            self.logger.debug("Waiting for transaction %d" % xid)
+            with self.xid_cv:
+                ofutils.timed_wait(self.xid_cv, lambda: trans.done or None, timeout=timeout)
+        finally:
+            with self.xid_cv:
+                self._forget(trans)
 
-            if self.xid_response:
-                (resp, pkt) = self.xid_response
-                self.xid_response = None
-            else:
-                (resp, pkt) = (None, None)
+        if not trans.replies:
+            self.logger.warning("No response for xid " + str(xid))
+            return (None, None)
+        (resp, pkt) = trans.replies[0]
+        return (_decoded(resp), pkt)
+
+    def transact_many(self, msgs, timeout=-1):
+        """
+        Run several message transactions with the switch at once
+
+        All the messages in msgs are sent without waiting for replies, then
+        the replies are collected as they arrive in any order. A stats
+        request collects every part of its multipart reply; any other
+        message collects its first reply. Error replies are collected like
+        any other reply.
+
+        @param msgs The message objects to send, or packed message strings.
+        Each must have a distinct xid; those without one are assigned one.
+        @param timeout The timeout in seconds for all the replies; if -1
+        use default.
+        @retval A dict mapping the xid of each message to the list of
+        (msg, pkt) pairs received for it, empty if none arrived in time.
+        """
+
+        transactions = [self._transaction(msg) for msg in msgs]
+
+        with self.xid_cv:
+            for trans in transactions:
+                if trans.xid in self.transactions:
+                    raise AssertionError("Transaction %d already running" % trans.xid)
+            xids = set(trans.xid for trans in transactions)
+            if len(xids) != len(transactions):
+                raise AssertionError("Duplicate xid in transact_many")
+            for trans in transactions:
+                self.transactions[trans.xid] = trans
 
-        if resp is None:
-            self.logger.warning("No response for xid " + str(self.xid))
-        return (resp, pkt)
+        self.logger.debug("Running %d transactions", len(transactions))
+
+        try:
+            for msg in msgs:
+                self.message_send(msg)
+
+            with self.xid_cv:
+                ofutils.timed_wait(self.xid_cv,
+                                   lambda: all(trans.done for trans in transactions) or None,
+                                   timeout=timeout)
+        finally:
+            with self.xid_cv:
+                for trans in transactions:
+                    self._forget(trans)
+
+        result = {}
+        for trans in transactions:
+            if not trans.done:
+                self.logger.warning("No complete response for xid " + str(trans.xid))
+            result[trans.xid] = trans.result()
+        return result
+
+    def transact_async(self, msg, callback=None):
+        """
+        Start a message transaction with the switch without waiting
+
+        The message is sent and its Transaction returned at once. The
+        replies are collected as in transact_many(), and the Transaction's
+        done callbacks are called by the thread reading the switch socket
+        once the last reply is in, or when the switch disconnects. Like
+        registered handlers, callbacks must not block; they may send
+        messages and start further transactions, so a single event loop
+        thread can drive many switches.
+
+        @param msg The message object to send, or a packed message string
+        @param callback If not None, added as a done callback
+        @retval The Transaction
+        """
+
+        trans = self._transaction(msg)
+        if callback is not None:
+            trans.add_done_callback(callback)
+
+        with self.xid_cv:
+            if trans.xid in self.transactions:
+                raise AssertionError("Transaction %d already running" % trans.xid)
+            self.transactions[trans.xid] = trans
+
+        try:
+            self.message_send(msg)
+        except:
+            with self.xid_cv:
+                self._forget(trans)
+            raise
+        return trans
+
+    def transact_wait(self, trans, timeout=-1):
+        """
+        Wait for a transaction started by transact_async() to complete
+
+        @param trans The Transaction
+        @param timeout The timeout in seconds; if -1 use default.
+        @retval The list of (msg, pkt) pairs received, which may be
+        incomplete or empty on timeout
+        """
+        with self.xid_cv:
+            ofutils.timed_wait(self.xid_cv, lambda: trans.done or None, timeout=timeout)
+        return trans.result()
+
+    def _transactions_complete(self):
+        """
+        Complete every pending transaction, as no more replies will come
+        """
+        with self.xid_cv:
+            pending = self.transactions.values()
+            self.transactions = {}
+            for trans in pending:
+                trans.complete()
+            self.xid_cv.notifyAll()
+
+    def _forget(self, trans):
+        """
+        Stop collecting replies for a transaction. Call with xid_cv held.
+        """
+        if self.transactions.get(trans.xid) is trans:
+            del self.transactions[trans.xid]
+
+    def _transaction(self, msg, multipart=None):
+        """
+        Return a new Transaction for a message, assigning it an xid if it
+        has none. Stats requests expect a multipart reply unless multipart
+        is given.
+        """
+        if isinstance(msg, str):
+            (version, msg_type, _, xid) = cfg_ofp.message.parse_header(msg)
+        else:
+            if msg.xid == None:
+                msg.xid = ofutils.gen_xid()
+            (version, msg_type, xid) = (msg.version, msg.type, msg.xid)
+        if multipart is None:
+            multipart = version == cfg_ofp.OFP_VERSION and \
+                msg_type == cfg_ofp.OFPT_STATS_REQUEST
+        return Transaction(xid, multipart)
+
+    def stats_replies(self, req, timeout=-1, decode=True):
+        """
+        Send a stats request and iterate over the parts of its reply
+
+        Yields a pair (msg, pkt) for each part of the multipart reply as it
+        arrives, until the part without OFPSF_REPLY_MORE. At most
+        max_stats_parts received parts wait to be consumed; beyond that the
+        switch socket is not read until the consumer catches up. Closing
+        the iterator early discards the remaining parts as they arrive.
+
+        An iterator kept alive but neither exhausted nor closed leaves the
+        switch socket unread once max_stats_parts parts wait, stalling
+        echoes and transactions on the connection until it is closed or
+        garbage collected. Close iterators stopped early.
+
+        @param req The stats request message object
+        @param timeout The timeout in seconds for each part; if -1 use default.
+        @param decode If False, msg is only parsed header-only, for
+        consumers reading the entries straight from pkt
+        """
+
+        if req.xid == None:
+            req.xid = ofutils.gen_xid()
+
+        with self.stats_cv:
+            if self.stats_xid is not None and not self.stats_discard:
+                raise AssertionError("Can only stream one stats reply at a time")
+            self.stats_xid = req.xid
+            self.stats_parts = []
+            self.stats_discard = False
+
+        # Take the next part from the queue
+        def grab():
+            if self.stats_parts:
+                part = self.stats_parts.pop(0)
+                if len(self.stats_parts) == self.max_stats_parts - 1:
+                    # The event loop stopped reading the switch socket
+                    self.wakeup()
+                return part
+            return None
+
+        done = False
+        try:
+            self.message_send(req)
+            while not done:
+                with self.stats_cv:
+                    part = ofutils.timed_wait(self.stats_cv, grab, timeout=timeout)
+                if part is None:
+                    raise AssertionError("No response to stats request xid %d" % req.xid)
+
+                (msg, pkt) = part
+                ofp = self.protocols[msg.version]
+                if msg.type != ofp.OFPT_STATS_REPLY:
+                    # Such as an error, ending the reply
+                    done = True
+                    raise AssertionError("Unexpected %s message in response to stats request" %
+                                         type(_decoded(msg)).__name__)
+                done = not _stats_flags(pkt) & ofp.OFPSF_REPLY_MORE
+                if decode:
+                    msg = _decoded(msg)
+                yield (msg, pkt)
+        finally:
+            with self.stats_cv:
+                if done:
+                    self.stats_xid = None
+                else:
+                    self.stats_discard = True
+                self.stats_parts = []
+            self.wakeup()
+
+    def stats_entries(self, req, timeout=-1):
+        """
+        Send a stats request and iterate over the entries of its reply
+
+        Entries are yielded as each part of the multipart reply arrives and
+        is decoded, so only one part is held decoded at a time. See
+        stats_replies().
+
+        @param req The stats request message object
+        @param timeout The timeout in seconds for each part; if -1 use default.
+        """
+        for (msg, pkt) in self.stats_replies(req, timeout=timeout):
+            for entry in msg.entries:
+                yield entry
 
     def message_send(self, msg):
         """
@@ -670,13 +1039,19 @@ class Controller(Thread):
             # Sending a string indicates the message is ready to go
             raise Exception("no socket")
 
-        if msg.xid == None:
-            msg.xid = ofutils.gen_xid()
+        if isinstance(msg, str):
+            outpkt = msg
+            (version, msg_type, length, xid) = cfg_ofp.message.parse_header(outpkt)
+            self.logger.debug("Msg out: version %d type %d len %d xid %d",
+                              version, msg_type, length, xid)
+        else:
+            if msg.xid == None:
+                msg.xid = ofutils.gen_xid()
 
-        outpkt = msg.pack()
+            outpkt = msg.pack()
 
-        self.logger.debug("Msg out: version %d class %s len %d xid %d",
-                          msg.version, type(msg).__name__, len(outpkt), msg.xid)
+            self.logger.debug("Msg out: version %d class %s len %d xid %d",
+                              msg.version, type(msg).__name__, len(outpkt), msg.xid)
 
         with self.tx_lock:
             if self.switch_socket.sendall(outpkt) is not None:
@@ -689,9 +1064,9 @@ class Controller(Thread):
         Clear the input queue and report the number of messages
         that were in it
         """
-        enqueued_pkt_count = len(self.packets)
         with self.packets_cv:
-            self.packets = []
+            enqueued_pkt_count = len(self.packets)
+            self.packets.clear()
         return enqueued_pkt_count
 
     def __str__(self):
@@ -705,6 +1080,7 @@ class Controller(Thread):
         string += "  poll discards   " + str(self.poll_discards) + "\n"
         string += "  parse errors    " + str(self.parse_errors) + "\n"
         string += "  sock errrors    " + str(self.socket_errors) + "\n"
+        string += "  handle errors   " + str(self.handle_errors) + "\n"
         string += "  max pkts        " + str(self.max_pkts) + "\n"
         string += "  target switch   " + str(self.switch) + "\n"
         string += "  host            " + str(self.host) + "\n"
@@ -717,6 +1093,396 @@ class Controller(Thread):
     def show(self):
         print str(self)
 
+class ControllerServer(Thread):
+    """
+    Event loop serving many switch connections
+
+    The listen socket stays open, and each accepted switch connection gets
+    its own Controller with its own receive buffer, message queue,
+    transactions and counters, so poll, transact, message_send and the
+    rest work on it as usual. The Controllers are not threads: this one
+    thread reads every switch socket, using epoll where available.
+
+    @var controllers The Controllers of the connected switches
+    @var max_pkts The max size of the receive queue of each connection
+    @var keep_alive, initial_hello, lazy_decode, rcv_size, rcvbuf_size
+    Settings given to the Controller of each new connection
+    @var connections_total Total number of connections accepted
+    @var dbg_state Debug indication of state
+    """
+
+    def __init__(self, host='0.0.0.0', port=6653, max_pkts=1024):
+        Thread.__init__(self)
+        self.host = host
+        self.port = port
+        self.max_pkts = max_pkts
+        self.keep_alive = False
+        self.initial_hello = True
+        self.lazy_decode = False
+        self.rcv_size = RCV_SIZE_DEFAULT
+        self.rcvbuf_size = None
+        self.active = True
+        self.dbg_state = "init"
+        self.logger = logging.getLogger("controller")
+
+        # Connected Controllers and the ones not yet returned by accept()
+        # Protected by the connect_cv lock / condition variable
+        self.controllers = []
+        self.accepted = []
+        self.connect_cv = Condition()
+        self.connections_total = 0
+
+        # Switch socket descriptors and the Controllers owning them, and
+        # those not being read until their stats consumer catches up
+        self.fds = {}
+        self.paused = set()
+
+        self.waker = ofutils.EventDescriptor()
+        if hasattr(select, "epoll"):
+            self.poller = select.epoll()
+            self.poll_timeout = 1
+        else:
+            self.poller = select.poll()
+            self.poll_timeout = 1000
+
+        self.logger.info("Create/listen at " + self.host + ":" +
+                         str(self.port))
+        ai = socket.getaddrinfo(self.host, self.port, socket.AF_UNSPEC,
+                                socket.SOCK_STREAM, 0, socket.AI_PASSIVE)
+        (family, socktype, proto, name, sockaddr) = ai[0]
+        self.listen_socket = socket.socket(family, socktype)
+        self.listen_socket.setsockopt(socket.SOL_SOCKET,
+                                      socket.SO_REUSEADDR, 1)
+        self.listen_socket.bind(sockaddr)
+        self.listen_socket.listen(SERVER_LISTEN_QUEUE_SIZE)
+
+        self.poller.register(self.listen_socket.fileno(), select.POLLIN)
+        self.poller.register(self.waker.fileno(), select.POLLIN)
+
+    def wakeup(self):
+        """
+        Wake up the event loop, presumably from another thread.
+        """
+        self.waker.notify()
+
+    def accept(self, timeout=-1):
+        """
+        Wait for a switch connection not returned by an earlier call
+
+        @param timeout Block for up to timeout seconds. Pass -1 for the default.
+        @return The Controller of the connection, or None on timeout
+        """
+        with self.connect_cv:
+            return ofutils.timed_wait(self.connect_cv,
+                                      lambda: self.accepted and self.accepted.pop(0) or None,
+                                      timeout=timeout)
+
+    def _accept(self):
+        try:
+            (sock, addr) = self.listen_socket.accept()
+        except socket.error:
+            self.logger.warning("Error on listen socket accept")
+            return
+
+        con = Controller(host=self.host, port=self.port,
+                         max_pkts=self.max_pkts, server=self)
+        con.keep_alive = self.keep_alive
+        con.initial_hello = self.initial_hello
+        con.lazy_decode = self.lazy_decode
+        con.rcv_size = self.rcv_size
+        con.rcvbuf_size = self.rcvbuf_size
+        con.dbg_state = "running"
+        con.attach(sock, addr)
+
+        if sock.fileno() in self.fds:
+            # Reused descriptor of a connection its Controller closed
+            self._drop(sock.fileno())
+        self.fds[sock.fileno()] = con
+        self.poller.register(sock.fileno(), select.POLLIN)
+        with self.connect_cv:
+            self.controllers.append(con)
+            self.accepted.append(con)
+            self.connections_total += 1
+            self.connect_cv.notifyAll()
+
+    def _drop(self, fd):
+        """
+        Stop serving the connection on fd and disconnect it
+        """
+        con = self.fds.pop(fd)
+        self.paused.discard(fd)
+        try:
+            self.poller.unregister(fd)
+        except (IOError, OSError, KeyError, ValueError):
+            # Already closed by its Controller
+            pass
+        con.disconnect()
+        with self.connect_cv:
+            if con in self.controllers:
+                self.controllers.remove(con)
+            if con in self.accepted:
+                self.accepted.remove(con)
+
+    def _switch_ready(self, fd, events):
+        con = self.fds.get(fd)
+        if con is None:
+            return
+        if con.switch_socket is None or events & (select.POLLERR | select.POLLHUP) and \
+           not events & select.POLLIN:
+            self._drop(fd)
+            return
+        try:
+            ret = con._socket_ready_handle(con.switch_socket)
+        except Exception:
+            # A bad message or a failing handler only costs its connection
+            con.handle_errors += 1
+            self.logger.exception("Error handling switch %s, disconnecting",
+                                  str(con.switch_addr))
+            ret = -1
+        if ret == -1:
+            self._drop(fd)
+            return
+        if con.read_paused():
+            self.poller.modify(fd, 0)
+            self.paused.add(fd)
+
+    def _wakeup_handle(self):
+        self.waker.wait()
+        # Forget connections closed by their Controller
+        for fd, con in self.fds.items():
+            if con.switch_socket is None:
+                self._drop(fd)
+        # Resume reading switches whose stats consumer caught up
+        for fd in list(self.paused):
+            if not self.fds[fd].read_paused():
+                self.poller.modify(fd, select.POLLIN)
+                self.paused.discard(fd)
+
+    def run(self):
+        """
+        Activity function for class
+
+        Accept switch connections and read every switch socket until
+        killed.
+        """
+        self.dbg_state = "running"
+        listen_fd = self.listen_socket.fileno()
+        waker_fd = self.waker.fileno()
+
+        while self.active:
+            try:
+                events = self.poller.poll(self.poll_timeout)
+            except (IOError, OSError, select.error), e:
+                if e.args[0] == errno.EINTR:
+                    continue
+                self.logger.error("Poll error, stopping: %s" % str(e))
+                break
+
+            for (fd, event) in events:
+                if fd == listen_fd:
+                    self._accept()
+                elif fd == waker_fd:
+                    self._wakeup_handle()
+                else:
+                    self._switch_ready(fd, event)
+
+        # End of main loop
+        self.dbg_state = "closing"
+        self.logger.info("Exiting controller server thread")
+        self.shutdown()
+
+    def kill(self):
+        """
+        Force the server thread to quit, disconnecting every switch
+        """
+        self.active = False
+        self.wakeup()
+        self.join()
+
+    def shutdown(self):
+        """
+        Close the listen socket and every switch connection
+        """
+        self.active = False
+        for fd in self.fds.keys():
+            self._drop(fd)
+        try:
+            self.listen_socket.close()
+        except:
+            self.logger.info("Ignoring listen soc close error")
+        self.dbg_state = "down"
+
+class Transaction(object):
+    """
+    A request waiting for its replies
+
+    @var xid Transaction ID of the request
+    @var multipart True if the reply may come in several parts
+    @var replies List of (msg, pkt) pairs received so far
+    @var done True once the last reply has been received, or the switch
+    disconnected
+    """
+    __slots__ = ["xid", "multipart", "replies", "done", "callbacks"]
+
+    def __init__(self, xid, multipart=False):
+        self.xid = xid
+        self.multipart = multipart
+        self.replies = []
+        self.done = False
+        self.callbacks = []
+
+    def add_done_callback(self, fn):
+        """
+        Call fn(transaction) once the transaction is done, or now if it
+        already is. Outside of transact_async() and done callbacks, call
+        with the controller's xid_cv held.
+        """
+        if self.done:
+            fn(self)
+        else:
+            self.callbacks.append(fn)
+
+    def complete(self):
+        """
+        Mark the transaction done and call its done callbacks
+        """
+        self.done = True
+        callbacks, self.callbacks = self.callbacks, []
+        for fn in callbacks:
+            fn(self)
+
+    def result(self):
+        """
+        Return the (msg, pkt) pairs received, fully decoded
+        """
+        return [(_decoded(resp), pkt) for (resp, pkt) in self.replies]
+
+class MessageQueue(object):
+    """
+    Receive queue of a controller, indexed by message type
+
+    Holds (msg, pkt) pairs in arrival order, with a deque per OpenFlow
+    message type so taking the oldest message of a type does not scan the
+    messages of other types. Messages taken by type are only marked as
+    taken in the arrival order, which is compacted once mostly taken.
+    """
+    def __init__(self):
+        self.order = deque()
+        self.by_type = {}
+        self.count = 0
+
+    def __len__(self):
+        return self.count
+
+    def __iter__(self):
+        for entry in self.order:
+            if entry.live:
+                yield (entry.msg, entry.pkt)
+
+    def append(self, msg_type, msg, pkt):
+        """
+        Queue a message with the type from its header
+        """
+        entry = _QueueEntry(msg_type, msg, pkt)
+        self.order.append(entry)
+        queue = self.by_type.get(msg_type)
+        if queue is None:
+            queue = self.by_type[msg_type] = deque()
+        queue.append(entry)
+        self.count += 1
+
+    def popleft(self):
+        """
+        Take the oldest message, return (msg, pkt) or None if empty
+        """
+        order = self.order
+        while order:
+            entry = order.popleft()
+            if entry.live:
+                # The oldest message is also the oldest of its type
+                self.by_type[entry.msg_type].popleft()
+                return self._take(entry)
+        return None
+
+    def pop(self, klass=None, klass_type=None):
+        """
+        Take the oldest message that is an instance of klass
+
+        @param klass Message class, or None for any message
+        @param klass_type Header type of the messages of klass, or None if
+        they can have several types
+        @retval (msg, pkt) or None if there is no such message
+        """
+        if klass is None:
+            return self.popleft()
+        if klass_type is not None:
+            queue = self.by_type.get(klass_type)
+            if queue:
+                for i, entry in enumerate(queue):
+                    if isinstance(entry.msg, klass):
+                        del queue[i]
+                        return self._take(entry)
+            return None
+        for entry in self.order:
+            if entry.live and isinstance(entry.msg, klass):
+                self.by_type[entry.msg_type].remove(entry)
+                return self._take(entry)
+        return None
+
+    def clear(self):
+        """
+        Drop every message
+        """
+        self.order.clear()
+        self.by_type.clear()
+        self.count = 0
+
+    def _take(self, entry):
+        entry.live = False
+        self.count -= 1
+        if len(self.order) > 2 * self.count + 64:
+            self.order = deque(entry for entry in self.order if entry.live)
+        return (entry.msg, entry.pkt)
+
+class _QueueEntry(object):
+    __slots__ = ["msg_type", "msg", "pkt", "live"]
+
+    def __init__(self, msg_type, msg, pkt):
+        self.msg_type = msg_type
+        self.msg = msg
+        self.pkt = pkt
+        self.live = True
+
+# Echo reply templates by wire version
+_echo_reply_templates = {}
+
+def _echo_reply(ofp, xid):
+    """
+    Return a packed echo reply with the given xid
+    """
+    template = _echo_reply_templates.get(ofp.OFP_VERSION)
+    if template is None:
+        template = loxi.template.Template(ofp.message.echo_reply())
+        _echo_reply_templates[ofp.OFP_VERSION] = template
+    return template.pack(xid=xid)
+
+_stats_flags_struct = struct.Struct("!H")
+_length_struct = struct.Struct("!H")
+
+def _stats_flags(rawmsg):
+    """
+    Return the flags of a raw stats reply without decoding it
+    """
+    return _stats_flags_struct.unpack_from(rawmsg, 10)[0]
+
+def _decoded(msg):
+    """
+    Return the fully decoded message for a possibly lazily parsed one
+    """
+    if isinstance(msg, loxi.generic_util.LazyMessage):
+        return msg.decode()
+    return msg
+
 def sample_handler(controller, msg, pkt):
     """
     Sample message handler
@@ -0,0 +1,450 @@
+#!/usr/bin/env python
+import sys
+import time
+import socket
+import select
+import struct
+import unittest
+import loxi
+
+# controller.py needs the ofp module, set up by the florence script
+if "ofp" not in sys.modules:
+    sys.modules["ofp"] = loxi.protocol(4)
+import ofp
+import ofutils
+import controller
+
+def recv_message(sock, timeout=2):
+    """
+    Read one OpenFlow message from sock, or return None if it was closed
+    """
+    sock.settimeout(timeout)
+    data = ""
+    while len(data) < 8 or len(data) < struct.unpack_from("!H", data, 2)[0]:
+        chunk = sock.recv(65536)
+        if not chunk:
+            return None
+        data += chunk
+    return ofp.message.parse_message(data)
+
+def connected_controller():
+    """
+    Return a Controller attached to a TCP connection and the switch end
+    of it. The controller thread is not started; feed it with _pkt_handle
+    """
+    con = controller.Controller(switch='127.0.0.1')
+    con.initial_hello = False
+    listener = socket.socket()
+    listener.bind(('127.0.0.1', 0))
+    listener.listen(1)
+    switch = socket.create_connection(listener.getsockname())
+    con.attach(*listener.accept())
+    listener.close()
+    return (con, switch)
+
+class TestControllerReceive(unittest.TestCase):
+    def setUp(self):
+        ofutils.default_timeout = 0
+        self.controller = controller.Controller(switch='127.0.0.1')
+
+    def test_split_messages(self):
+        self.controller.lazy_decode = True
+        a = ofp.message.packet_in(xid=1, data="A" * 100).pack()
+        b = ofp.message.packet_in(xid=2, data="B" * 100).pack()
+        self.controller._pkt_handle(a + b[:50])
+        self.controller._pkt_handle(b[50:] + a[:3])
+        self.controller._pkt_handle(a[3:])
+        # Queued messages own their bytes, the buffer is reused
+        self.assertEquals([(m.xid, m.data, p) for m, p in self.controller.packets],
+                          [(1, "A" * 100, a), (2, "B" * 100, b), (1, "A" * 100, a)])
+        self.assertEquals(self.controller.rcv_len, 0)
+
+    def test_large_message(self):
+        entries = [ofp.port_stats_entry(port_no=i) for i in range(500)]
+        reply = ofp.message.port_stats_reply(xid=1, entries=entries).pack()
+        self.assertTrue(len(reply) > self.controller.rcv_size)
+        for i in range(0, len(reply), 1000):
+            self.controller._pkt_handle(reply[i:i + 1000])
+        msg, pkt = self.controller.poll(ofp.message.port_stats_reply)
+        self.assertEquals(pkt, reply)
+        self.assertEquals(len(msg.entries), 500)
+        self.assertEquals(len(self.controller.rcv_buf), self.controller.rcv_size)
+
+class TestMessageQueue(unittest.TestCase):
+    def setUp(self):
+        self.queue = controller.MessageQueue()
+
+    def add(self, msg):
+        self.queue.append(msg.type, msg, msg.pack())
+
+    def xids(self):
+        return [msg.xid for msg, pkt in self.queue]
+
+    def test_pop_by_type(self):
+        for xid in range(4):
+            self.add(ofp.message.packet_in(xid=xid) if xid % 2 else
+                     ofp.message.echo_reply(xid=xid))
+        msg, pkt = self.queue.pop(ofp.message.packet_in, ofp.OFPT_PACKET_IN)
+        self.assertEquals(msg.xid, 1)
+        self.assertEquals(pkt, msg.pack())
+        self.assertEquals(self.xids(), [0, 2, 3])
+        self.assertEquals(len(self.queue), 3)
+        # Only instances of the class, even among messages of its type
+        self.add(ofp.message.port_stats_reply(xid=4))
+        self.assertEquals(self.queue.pop(ofp.message.flow_stats_reply,
+                                         ofp.OFPT_STATS_REPLY), None)
+        self.assertEquals(self.queue.pop(ofp.message.hello, ofp.OFPT_HELLO), None)
+        self.assertEquals(len(self.queue), 4)
+
+    def test_pop_abstract(self):
+        self.add(ofp.message.echo_reply(xid=0))
+        self.add(ofp.message.port_stats_reply(xid=1))
+        self.add(ofp.message.flow_stats_reply(xid=2))
+        msg, pkt = self.queue.pop(ofp.message.stats_reply)
+        self.assertEquals(msg.xid, 1)
+        self.assertEquals(self.queue.pop(ofp.message.message)[0].xid, 0)
+        self.assertEquals(self.xids(), [2])
+        self.assertEquals(self.queue.pop(ofp.message.flow_stats_reply,
+                                         ofp.OFPT_STATS_REPLY)[0].xid, 2)
+        self.assertEquals(len(self.queue), 0)
+
+    def test_evict(self):
+        for xid in range(3):
+            self.add(ofp.message.packet_in(xid=xid) if xid != 1 else
+                     ofp.message.echo_reply(xid=xid))
+        self.queue.pop(ofp.message.packet_in, ofp.OFPT_PACKET_IN)
+        # The oldest left, skipping the one taken by type
+        self.assertEquals(self.queue.popleft()[0].xid, 1)
+        self.assertEquals(self.xids(), [2])
+        self.assertEquals(self.queue.pop(ofp.message.packet_in, ofp.OFPT_PACKET_IN)[0].xid, 2)
+        self.assertEquals(self.queue.popleft(), None)
+        self.assertEquals(len(self.queue), 0)
+
+    def test_compact(self):
+        for xid in range(300):
+            self.add(ofp.message.packet_in(xid=xid) if xid % 3 else
+                     ofp.message.echo_reply(xid=xid))
+        for i in range(200):
+            self.queue.pop(ofp.message.packet_in, ofp.OFPT_PACKET_IN)
+        self.assertEquals(len(self.queue), 100)
+        self.assertEquals(self.xids(), range(0, 300, 3))
+        self.assertTrue(len(self.queue.order) <= 2 * len(self.queue) + 64)
+        self.assertEquals([self.queue.popleft()[0].xid for i in range(100)], range(0, 300, 3))
+
+    def test_clear(self):
+        self.add(ofp.message.packet_in(xid=1))
+        self.add(ofp.message.echo_reply(xid=2))
+        self.queue.clear()
+        self.assertEquals(len(self.queue), 0)
+        self.assertEquals(self.xids(), [])
+        self.assertEquals(self.queue.pop(ofp.message.packet_in, ofp.OFPT_PACKET_IN), None)
+        self.add(ofp.message.packet_in(xid=3))
+        self.assertEquals(self.queue.popleft()[0].xid, 3)
+
+class TestTransactions(unittest.TestCase):
+    def setUp(self):
+        ofutils.default_timeout = 0
+        (self.controller, self.switch) = connected_controller()
+
+    def tearDown(self):
+        self.controller.disconnect()
+        self.switch.close()
+
+    def reply(self, msg):
+        self.controller._pkt_handle(msg.pack())
+
+    def answer(self, last_xid, *replies):
+        # Reply once the request with last_xid is sent
+        send = self.controller.message_send
+
+        def message_send(msg):
+            send(msg)
+            if msg.xid == last_xid:
+                for reply in replies:
+                    self.reply(reply)
+        self.controller.message_send = message_send
+
+    def test_out_of_order(self):
+        self.answer(3, *[ofp.message.echo_reply(xid=xid, data=str(xid)) for xid in (3, 1, 2)])
+        result = self.controller.transact_many(
+            [ofp.message.echo_request(xid=xid) for xid in (1, 2, 3)])
+        self.assertEquals(dict((xid, [msg.data for msg, pkt in replies])
+                               for xid, replies in result.items()),
+                          {1: ["1"], 2: ["2"], 3: ["3"]})
+        self.assertEquals(self.controller.transactions, {})
+
+    def test_multipart(self):
+        def part(flags, port_no):
+            return ofp.message.port_stats_reply(
+                xid=40, flags=flags, entries=[ofp.port_stats_entry(port_no=port_no)])
+        more = ofp.OFPSF_REPLY_MORE
+        self.answer(41, part(more, 0), ofp.message.echo_reply(xid=41), part(more, 1),
+                    part(0, 2), part(0, 3))
+        result = self.controller.transact_many(
+            [ofp.message.port_stats_request(xid=40), ofp.message.echo_request(xid=41)])
+        # Parts up to the one without OFPSF_REPLY_MORE
+        self.assertEquals([msg.entries[0].port_no for msg, pkt in result[40]], [0, 1, 2])
+        self.assertEquals(len(result[41]), 1)
+        # Later ones are queued
+        msg, pkt = self.controller.poll(ofp.message.port_stats_reply)
+        self.assertEquals(msg.entries[0].port_no, 3)
+
+    def test_stats_error(self):
+        self.answer(42, ofp.message.bad_request_error_msg(xid=42, code=ofp.OFPBRC_BAD_STAT))
+        trans = self.controller.transact_async(ofp.message.port_stats_request(xid=42))
+        self.assertTrue(trans.multipart)
+        self.assertTrue(trans.done)
+        self.assertEquals([type(msg) for msg, pkt in trans.result()],
+                          [ofp.message.bad_request_error_msg])
+        self.assertEquals(self.controller.transactions, {})
+
+    def test_timeout(self):
+        self.answer(44, ofp.message.echo_reply(xid=44))
+        result = self.controller.transact_many(
+            [ofp.message.echo_request(xid=43), ofp.message.echo_request(xid=44)])
+        self.assertEquals(result[43], [])
+        self.assertEquals(len(result[44]), 1)
+        self.assertEquals(self.controller.transactions, {})
+        # A late reply is queued
+        self.reply(ofp.message.echo_reply(xid=43))
+        msg, pkt = self.controller.poll(ofp.message.echo_reply)
+        self.assertEquals(msg.xid, 43)
+        self.assertEquals(self.controller.transact(ofp.message.echo_request(xid=45)),
+                          (None, None))
+
+    def test_duplicate_xid(self):
+        self.assertRaises(AssertionError, self.controller.transact_many,
+                          [ofp.message.echo_request(xid=46), ofp.message.echo_request(xid=46)])
+        self.assertEquals(self.controller.transactions, {})
+        trans = self.controller.transact_async(ofp.message.echo_request(xid=47))
+        self.assertRaises(AssertionError, self.controller.transact_async,
+                          ofp.message.echo_request(xid=47))
+        self.assertRaises(AssertionError, self.controller.transact_many,
+                          [ofp.message.echo_request(xid=47)])
+        self.assertEquals(self.controller.transact(ofp.message.echo_request(xid=47)),
+                          (None, None))
+        self.assertTrue(self.controller.transactions[47] is trans)
+        # Only the first request was sent
+        self.assertEquals(recv_message(self.switch).xid, 47)
+        self.switch.settimeout(0.1)
+        self.assertRaises(socket.timeout, self.switch.recv, 1)
+
+    def test_callback(self):
+        done = []
+        trans = self.controller.transact_async(
+            ofp.message.echo_request(xid=10), callback=done.append)
+        self.assertEquals(recv_message(self.switch).xid, 10)
+        self.assertFalse(trans.done)
+        self.assertEquals(done, [])
+        self.reply(ofp.message.echo_reply(xid=10))
+        self.assertEquals(done, [trans])
+        self.assertEquals([msg.xid for msg, pkt in trans.result()], [10])
+        self.assertEquals(self.controller.transactions, {})
+        # Already done, called at once
+        trans.add_done_callback(done.append)
+        self.assertEquals(done, [trans, trans])
+
+    def test_callback_chain(self):
+        # Each callback starts the next transaction
+        xids = []
+
+        def next_request(trans):
+            xids.append(trans.xid)
+            if trans.xid < 23:
+                self.controller.transact_async(
+                    ofp.message.echo_request(xid=trans.xid + 1), callback=next_request)
+        self.controller.transact_async(
+            ofp.message.echo_request(xid=20), callback=next_request)
+        for xid in range(20, 24):
+            self.assertEquals(recv_message(self.switch).xid, xid)
+            self.reply(ofp.message.echo_reply(xid=xid))
+        self.assertEquals(xids, [20, 21, 22, 23])
+
+    def test_wait(self):
+        trans = self.controller.transact_async(ofp.message.echo_request(xid=11))
+        self.assertEquals(self.controller.transact_wait(trans), [])
+        self.reply(ofp.message.echo_reply(xid=11))
+        replies = self.controller.transact_wait(trans)
+        self.assertEquals([type(msg) for msg, pkt in replies], [ofp.message.echo_reply])
+
+    def test_disconnect(self):
+        done = []
+        trans = self.controller.transact_async(
+            ofp.message.echo_request(xid=12), callback=done.append)
+        self.controller.disconnect()
+        self.assertEquals(done, [trans])
+        self.assertTrue(trans.done)
+        self.assertEquals(trans.result(), [])
+        self.assertEquals(self.controller.transactions, {})
+
+    def test_shutdown(self):
+        done = []
+        self.controller.transact_async(
+            ofp.message.echo_request(xid=13), callback=done.append)
+        self.controller.shutdown()
+        self.assertEquals([trans.xid for trans in done], [13])
+        self.assertEquals(self.controller.transactions, {})
+
+class TestStatsReplies(unittest.TestCase):
+    def setUp(self):
+        ofutils.default_timeout = 0
+        (self.controller, self.switch) = connected_controller()
+        self.controller.max_stats_parts = 2
+
+    def tearDown(self):
+        self.controller.disconnect()
+        self.switch.close()
+
+    def reply(self, xid, count, more=True):
+        for i in range(count):
+            last = not more and i == count - 1
+            self.controller._pkt_handle(ofp.message.port_stats_reply(
+                xid=xid, flags=0 if last else ofp.OFPSF_REPLY_MORE,
+                entries=[ofp.port_stats_entry(port_no=i)]).pack())
+
+    def answer(self, count, more=True):
+        # Reply as soon as the request is sent
+        send = self.controller.message_send
+
+        def message_send(msg):
+            send(msg)
+            self.reply(msg.xid, count, more)
+        self.controller.message_send = message_send
+
+    def woken(self):
+        waker = self.controller.waker
+        if not select.select([waker], [], [], 0)[0]:
+            return False
+        waker.wait()
+        return True
+
+    def paused(self):
+        paused = self.controller.read_paused()
+        self.assertEquals(paused, self.controller.switch_socket not in self.controller.sockets())
+        return paused
+
+    def test_stream(self):
+        self.answer(3, more=False)
+        replies = self.controller.stats_replies(ofp.message.port_stats_request(xid=30))
+        self.assertEquals([msg.entries[0].port_no for msg, pkt in replies], [0, 1, 2])
+        self.assertEquals(self.controller.stats_xid, None)
+        self.assertFalse(self.paused())
+
+    def test_pause_resume(self):
+        self.answer(3)
+        replies = self.controller.stats_replies(ofp.message.port_stats_request(xid=31))
+        replies.next()
+        # Two parts wait, the switch is not read
+        self.assertEquals(len(self.controller.stats_parts), 2)
+        self.assertTrue(self.paused())
+        self.assertFalse(self.woken())
+        replies.next()
+        # The part was taken before waking up the event loop
+        self.assertFalse(self.paused())
+        self.assertTrue(self.woken())
+        self.reply(31, 1, more=False)
+        self.assertEquals(len(list(replies)), 2)
+        self.assertEquals(self.controller.stats_xid, None)
+
+    def test_discard(self):
+        self.answer(3)
+        replies = self.controller.stats_replies(ofp.message.port_stats_request(xid=32))
+        replies.next()
+        replies.close()
+        self.assertFalse(self.paused())
+        self.assertTrue(self.woken())
+        # Remaining parts are dropped as they arrive, other messages are not
+        self.reply(32, 2)
+        self.controller._pkt_handle(ofp.message.packet_in(xid=35).pack())
+        self.reply(32, 1, more=False)
+        self.assertEquals(self.controller.poll_discards, 3)
+        self.assertEquals(self.controller.stats_xid, None)
+        self.assertEquals(self.controller.stats_parts, [])
+        self.assertEquals([msg.xid for msg, pkt in self.controller.packets], [35])
+
+    def test_error(self):
+        send = self.controller.message_send
+
+        def message_send(msg):
+            send(msg)
+            self.reply(msg.xid, 1)
+            self.controller._pkt_handle(ofp.message.bad_request_error_msg(
+                xid=msg.xid, code=ofp.OFPBRC_BAD_STAT).pack())
+        self.controller.message_send = message_send
+        replies = self.controller.stats_replies(ofp.message.port_stats_request(xid=33))
+        replies.next()
+        self.assertRaises(AssertionError, replies.next)
+        # The error ends the reply
+        self.assertEquals(self.controller.stats_xid, None)
+        self.assertFalse(self.controller.stats_discard)
+        self.controller._pkt_handle(ofp.message.echo_reply(xid=33).pack())
+        self.assertEquals(len(self.controller.packets), 1)
+
+    def test_timeout(self):
+        replies = self.controller.stats_replies(ofp.message.port_stats_request(xid=34))
+        self.assertRaises(AssertionError, replies.next)
+        self.assertTrue(self.controller.stats_discard)
+
+class TestControllerServer(unittest.TestCase):
+    def setUp(self):
+        ofutils.default_timeout = 2
+        self.server = controller.ControllerServer(host='127.0.0.1', port=0)
+        self.server.keep_alive = True
+        self.server.start()
+        port = self.server.listen_socket.getsockname()[1]
+        self.switches = []
+        self.cons = []
+        for i in range(3):
+            sock = socket.create_connection(('127.0.0.1', port))
+            self.switches.append(sock)
+            self.cons.append(self.server.accept())
+            self.assertTrue(isinstance(recv_message(sock), ofp.message.hello))
+
+    def tearDown(self):
+        self.server.kill()
+        for sock in self.switches:
+            sock.close()
+
+    def test_malformed_frame(self):
+        bad, good = self.switches[0], self.switches[1]
+        # Length 4 is shorter than the header
+        bad.sendall(struct.pack("!BBHL", 4, 0, 4, 1))
+        self.assertEquals(recv_message(bad), None)
+        self.assertEquals(self.cons[0].handle_errors, 1)
+
+        self.assertTrue(self.server.is_alive())
+        good.sendall(ofp.message.echo_request(xid=2).pack())
+        reply = recv_message(good)
+        self.assertTrue(isinstance(reply, ofp.message.echo_reply))
+        self.assertEquals(reply.xid, 2)
+        self.assertEquals(len(self.server.controllers), 2)
+
+    def test_handler_error(self):
+        def handler(con, msg, pkt):
+            raise ValueError("handler failed")
+        self.cons[2].register(ofp.OFPT_PACKET_IN, handler)
+        self.switches[2].sendall(ofp.message.packet_in(xid=3).pack())
+        self.assertEquals(recv_message(self.switches[2]), None)
+
+        self.switches[1].sendall(ofp.message.packet_in(xid=4).pack())
+        msg, pkt = self.cons[1].poll(ofp.message.packet_in)
+        self.assertEquals(msg.xid, 4)
+
+    def test_kill_connection(self):
+        done = []
+        con = self.cons[0]
+        trans = con.transact_async(ofp.message.echo_request(xid=5), callback=done.append)
+        self.assertEquals(recv_message(self.switches[0]).xid, 5)
+        con.kill()
+        self.assertEquals(done, [trans])
+        # The server forgets the connection and the switch sees it closed
+        self.assertEquals(recv_message(self.switches[0]), None)
+        for i in range(20):
+            if con not in self.server.controllers:
+                break
+            time.sleep(0.05)
+        self.assertEquals(self.server.controllers, self.cons[1:])
+        self.assertEquals(len(self.server.fds), 2)
+
+if __name__ == '__main__':
+    unittest.main()
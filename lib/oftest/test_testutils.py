@@ -0,0 +1,98 @@
+#!/usr/bin/env python
+import sys
+import unittest
+import loxi
+import florence
+
+# testutils needs the config and the ofp module, set up by the florence script
+if not florence.config:
+    florence.config.update(florence.CONFIG_DEFAULT)
+if "ofp" not in sys.modules:
+    sys.modules["ofp"] = loxi.protocol(4)
+import ofp
+import ofutils
+import controller
+import testutils
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+class FlowStatsController(controller.Controller):
+    """
+    Controller answering flow stats requests with canned replies
+    """
+    def __init__(self, entries, per_reply):
+        controller.Controller.__init__(self, switch='127.0.0.1')
+        self.entries = entries
+        self.per_reply = per_reply
+
+    def message_send(self, msg):
+        for i in range(0, len(self.entries), self.per_reply):
+            more = i + self.per_reply < len(self.entries)
+            reply = ofp.message.flow_stats_reply(
+                xid=msg.xid, flags=ofp.OFPSF_REPLY_MORE if more else 0,
+                entries=self.entries[i:i + self.per_reply])
+            self._pkt_handle(reply.pack())
+
+class TestFlowCounters(unittest.TestCase):
+    def setUp(self):
+        ofutils.default_timeout = 1
+        entries = []
+        for i in range(25):
+            match = ofp.match([ofp.oxm.in_port(i)] * (i % 3))
+            actions = [ofp.action.output(port=p) for p in range(i % 4)]
+            entries.append(ofp.flow_stats_entry(
+                match=match, priority=i,
+                instructions=[ofp.instruction.apply_actions(actions)],
+                packet_count=i * 1000 + 1, byte_count=(i << 40) + 64))
+        self.controller = FlowStatsController(entries, per_reply=7)
+
+    def fallback_counters(self):
+        # Import loxi.arrays as if NumPy was missing
+        saved = sys.modules.get("loxi.arrays")
+        sys.modules["loxi.arrays"] = None
+        try:
+            return testutils.get_flow_counters(self, ofp.match())
+        finally:
+            if saved is None:
+                del sys.modules["loxi.arrays"]
+            else:
+                sys.modules["loxi.arrays"] = saved
+
+    @unittest.skipIf(numpy is None, "NumPy is not installed")
+    def test_columns_match_entries(self):
+        columns = testutils.get_flow_counters(self, ofp.match())
+        entries = testutils.get_flow_stats(self, ofp.match())
+        self.assertEquals(len(entries), 25)
+        # As verify_flow_stats accumulates its initial entries
+        expected = (sum(stat.packet_count for stat in entries),
+                    sum(stat.byte_count for stat in entries))
+        self.assertEquals(columns, expected)
+        self.assertEquals(self.fallback_counters(), expected)
+
+    @unittest.skipIf(numpy is None, "NumPy is not installed")
+    def test_columns_skip_entries(self):
+        unpacked = []
+        unpack = ofp.flow_stats_entry.unpack
+
+        def counting_unpack(reader):
+            unpacked.append(1)
+            return unpack(reader)
+        ofp.flow_stats_entry.unpack = staticmethod(counting_unpack)
+        try:
+            testutils.get_flow_counters(self, ofp.match())
+            self.assertEquals(len(unpacked), 0)
+            testutils.get_flow_stats(self, ofp.match())
+            self.assertEquals(len(unpacked), 25)
+        finally:
+            ofp.flow_stats_entry.unpack = staticmethod(unpack)
+
+    def test_fallback(self):
+        self.assertEquals(self.fallback_counters(),
+                          (sum(i * 1000 + 1 for i in range(25)),
+                           sum((i << 40) + 64 for i in range(25))))
+
+if __name__ == '__main__':
+    unittest.main()
@@ -14,6 +14,8 @@ import oftest.parse
 import oftest.ofutils
 import ofp
 import florence
+import loxi.template
+import loxi.pp
 
 global skipped_test_count
 skipped_test_count = 0
@@ -35,6 +37,12 @@ def delete_all_flows(ctrl, send_barrier=True):
     """
 
     logging.info("Deleting all flows")
+    ctrl.message_send(_delete_all_flows.pack(xid=oftest.ofutils.gen_xid()))
+    if send_barrier:
+        do_barrier(ctrl)
+    return 0 # for backwards compatibility
+
+def _delete_all_flows_msg():
     msg = ofp.message.flow_delete()
     if ofp.OFP_VERSION in [1, 2]:
         msg.match.wildcards = ofp.OFPFW_ALL
@@ -45,10 +53,12 @@ def delete_all_flows(ctrl, send_barrier=True):
         msg.buffer_id = ofp.OFP_NO_BUFFER
         msg.out_port = ofp.OFPP_ANY
         msg.out_group = ofp.OFPG_ANY
-    ctrl.message_send(msg)
-    if send_barrier:
-        do_barrier(ctrl)
-    return 0 # for backwards compatibility
+    return msg
+
+# Messages sent by every test, packed once; only the xid changes
+_import_blacklist.update(['_delete_all_flows_msg', '_delete_all_flows', '_barrier_request'])
+_delete_all_flows = loxi.template.Template(_delete_all_flows_msg())
+_barrier_request = loxi.template.Template(ofp.message.barrier_request())
 
 def delete_all_groups(ctrl):
     """
@@ -506,7 +516,7 @@ def do_barrier(ctrl, timeout=-1):
     Do a barrier command
     Return 0 on success, -1 on error
     """
-    b = ofp.message.barrier_request()
+    b = _barrier_request.pack(xid=oftest.ofutils.gen_xid())
     (resp, pkt) = ctrl.transact(b, timeout=timeout)
     if resp is None:
         raise AssertionError("barrier failed")
@@ -530,7 +540,7 @@ def port_config_get(controller, port_no):
         if reply is None:
             logging.warn("Get feature request failed")
             return None, None, None
-        logging.debug(reply.show())
+        logging.debug(loxi.pp.lazy(reply))
         ports = reply.ports
     else:
         request = ofp.message.port_desc_stats_request()
@@ -539,7 +549,7 @@ def port_config_get(controller, port_no):
         if reply is None:
             logging.warn("Port desc stats request failed")
             return None, None, None
-        logging.debug(reply.show())
+        logging.debug(loxi.pp.lazy(reply))
         ports = reply.entries
 
     for port in ports:
@@ -776,7 +786,7 @@ def flow_msg_create(parent, pkt, ing_port=None, action_list=None, wildcards=None
             act.port = egr_port
             actions.append(act)
 
-    logging.debug(request.show())
+    logging.debug(loxi.pp.lazy(request))
 
     return request
 
@@ -868,7 +878,7 @@ def flow_match_test_pktout(parent, ing_port, egr_ports,
             act.port = egr_port
             msg.actions.append(act)
 
-    logging.debug(msg.show())
+    logging.debug(loxi.pp.lazy(msg))
     parent.controller.message_send(msg)
 
     exp_ports = [ing_port if port == ofp.OFPP_IN_PORT else port for port in egr_ports]
@@ -1318,22 +1328,40 @@ assert(parse_version("1.0") == set(["1.0"]))
 assert(parse_version("1.0,1.2,1.3") == set(["1.0", "1.2", "1.3"]))
 assert(parse_version("1.0+") == set(["1.0", "1.1", "1.2", "1.3"]))
 
+def get_stats_replies(test, req, decode=True):
+    """
+    Iterate over the stats replies to a request as (msg, pkt) pairs as
+    they arrive. Handles OFPSF_REPLY_MORE. With decode=False msg is only
+    parsed header-only.
+    """
+    return test.controller.stats_replies(req, decode=decode)
+
 def get_stats(test, req):
     """
     Retrieve a list of stats entries. Handles OFPSF_REPLY_MORE.
     """
-    msgtype = ofp.OFPT_STATS_REPLY
-    more_flag = ofp.OFPSF_REPLY_MORE
-    stats = []
-    reply, _ = test.controller.transact(req)
-    test.assertTrue(reply is not None, "No response to stats request")
-    test.assertEquals(reply.type, msgtype, "Response had unexpected message type")
-    stats.extend(reply.entries)
-    while reply.flags & more_flag != 0:
-        reply, pkt = test.controller.poll(exp_msg=msgtype)
-        test.assertTrue(reply is not None, "No response to stats request")
-        stats.extend(reply.entries)
-    return stats
+    return list(test.controller.stats_entries(req))
+
+def get_stats_many(test, reqs):
+    """
+    Retrieve the lists of stats entries for several requests at once.
+
+    The requests are pipelined with transact_many instead of waiting for
+    each reply in turn. Handles OFPSF_REPLY_MORE.
+    """
+    results = test.controller.transact_many(reqs)
+    entries = []
+    for req in reqs:
+        replies = results[req.xid]
+        test.assertTrue(replies, "No response to stats request xid %d" % req.xid)
+        stats = []
+        for (msg, pkt) in replies:
+            test.assertEqual(msg.type, ofp.OFPT_STATS_REPLY,
+                             "Unexpected %s message in response to stats request" %
+                             type(msg).__name__)
+            stats.extend(msg.entries)
+        entries.append(stats)
+    return entries
 
 def get_flow_stats(test, match, table_id=None,
                    out_port=None, out_group=None,
@@ -1341,6 +1369,41 @@ def get_flow_stats(test, match, table_id=None,
     """
     Retrieve a list of flow stats entries.
     """
+    req = flow_stats_request(match, table_id=table_id,
+                             out_port=out_port, out_group=out_group,
+                             cookie=cookie, cookie_mask=cookie_mask)
+    return get_stats(test, req)
+
+def get_flow_counters(test, match, table_id=None):
+    """
+    Retrieve the total packet and byte counts of the matching flows.
+
+    Sums the counter columns of the raw replies with loxi.arrays when
+    NumPy is available, instead of walking a flow_stats_entry per flow.
+    """
+    req = flow_stats_request(match, table_id=table_id)
+    try:
+        import loxi.arrays
+    except ImportError:
+        pkts = byte_counts = 0
+        for stat in get_stats(test, req):
+            pkts += stat.packet_count
+            byte_counts += stat.byte_count
+        return (pkts, byte_counts)
+
+    pkts = byte_counts = 0
+    for _, pkt in get_stats_replies(test, req, decode=False):
+        columns = loxi.arrays.decode_flow_stats_columns(pkt)
+        pkts += int(columns["packet_count"].sum())
+        byte_counts += int(columns["byte_count"].sum())
+    return (pkts, byte_counts)
+
+def flow_stats_request(match, table_id=None,
+                       out_port=None, out_group=None,
+                       cookie=0, cookie_mask=0):
+    """
+    Build a flow stats request, defaulting to all tables and ports.
+    """
 
     if table_id == None:
         if ofp.OFP_VERSION <= 2:
@@ -1366,7 +1429,7 @@ def get_flow_stats(test, match, table_id=None,
         req.cookie = cookie
         req.cookie_mask = cookie_mask
 
-    return get_stats(test, req)
+    return req
 
 def get_port_stats(test, port_no):
     """
@@ -1405,8 +1468,7 @@ def verify_flow_stats(test, match, table_id=0xff,
     # Wait 10s for counters to update
     pkt_diff = byte_diff = None
     for i in range(0, 100):
-        stats = get_flow_stats(test, match, table_id=table_id)
-        pkts_after, bytes_after = accumulate(stats)
+        pkts_after, bytes_after = get_flow_counters(test, match, table_id=table_id)
         pkt_diff = pkts_after - pkts_before
         byte_diff = bytes_after - bytes_before
         if (pkts == None or pkt_diff >= pkts) and \
@@ -0,0 +1,276 @@
+#!/usr/bin/python
+# Loxi codec micro-benchmarks
+
+"""
+Time pack(), unpack(), __eq__ and show() of every loxi class and write the
+results as JSON.
+
+Each concrete class is benchmarked on an instance built with its default
+constructor, with integer fields set to nonzero values. A few common
+messages are also benchmarked with populated matches, action lists and
+entries, under names ending in "[full]".
+
+For each operation the results give ops/sec and the number of
+garbage-collected objects (lists, tuples, loxi objects) allocated and
+still alive per call, which is what an unpacked or shown object holds on
+to. Strings and integers are not counted.
+
+Compare two runs with --compare:
+
+$ python ./script/loxi-bench.py -o before.json
+$ python ./script/loxi-bench.py -o after.json --compare before.json
+"""
+
+import os
+import re
+import sys
+import gc
+import time
+import json
+import inspect
+import argparse
+import platform
+
+try:
+    import loxi
+except ImportError:
+    # Run from the source tree
+    sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)),
+                                    "..", "lib"))
+    import loxi
+import loxi.generic_util
+
+gParser = argparse.ArgumentParser(description="loxi-bench")
+gParser.add_argument('-o', '--output', metavar="FILE",
+                     help="Write the results to FILE instead of stdout")
+gParser.add_argument('-v', '--version', type=int, action='append',
+                     choices=sorted(loxi.version_names),
+                     help="Wire version to benchmark, may be repeated "
+                          "(default all)")
+gParser.add_argument('-f', '--filter', metavar="REGEX",
+                     help="Only benchmark classes whose name matches REGEX")
+gParser.add_argument('-t', '--time', type=float, default=0.01,
+                     help="Seconds to spend on each timing run "
+                          "(default %(default)s)")
+gParser.add_argument('-r', '--repeat', type=int, default=3,
+                     help="Timing runs per operation, the best is kept "
+                          "(default %(default)s)")
+gParser.add_argument('--compare', metavar="FILE",
+                     help="Print the operations whose ops/sec changed "
+                          "against FILE")
+gParser.add_argument('--threshold', type=float, default=0.1,
+                     help="Relative change reported by --compare "
+                          "(default %(default)s)")
+
+
+operations = ("pack", "unpack", "eq", "show")
+
+
+def set_fields(obj):
+    """
+    Give the integer fields of obj nonzero values that fit in any width.
+    """
+    for name in loxi.generic_util.fields(type(obj)):
+        value = getattr(obj, name, None)
+        if name.startswith("_") or name in ("type", "length", "len"):
+            # Derived from the class or computed by pack()
+            continue
+        if name == "xid" or type(value) in (int, long):
+            setattr(obj, name, 1 + sum(map(ord, name)) % 200)
+    return obj
+
+
+def full_objects(ofp):
+    """
+    Return {name: object} of messages with populated lists for version ofp.
+    """
+    actions = [ofp.action.output(port=p) for p in range(1, 5)]
+    if ofp.OFP_VERSION == 1:
+        match = ofp.match(wildcards=0, in_port=1, eth_type=0x800,
+                          ipv4_dst=0x0a000001)
+        instructions = None
+    else:
+        match = ofp.match([ofp.oxm.in_port(1), ofp.oxm.eth_type(0x800),
+                           ofp.oxm.ipv4_dst(0x0a000001)])
+        instructions = [ofp.instruction.apply_actions(actions)]
+    objs = {}
+    if instructions is None:
+        objs["message.flow_add"] = ofp.message.flow_add(
+            xid=1, match=match, actions=actions)
+        entry = ofp.flow_stats_entry(
+            match=match, actions=actions, packet_count=10)
+    else:
+        objs["message.flow_add"] = ofp.message.flow_add(
+            xid=1, match=match, instructions=instructions)
+        entry = ofp.flow_stats_entry(
+            match=match, instructions=instructions, packet_count=10)
+        buckets = [ofp.bucket(weight=1, actions=actions) for i in range(4)]
+        objs["message.group_add"] = ofp.message.group_add(
+            xid=1, group_id=1, buckets=buckets)
+    objs["message.flow_stats_reply"] = ofp.message.flow_stats_reply(
+        xid=1, entries=[entry] * 16)
+    entries = [set_fields(ofp.port_stats_entry(port_no=p)) for p in range(16)]
+    objs["message.port_stats_reply"] = ofp.message.port_stats_reply(
+        xid=1, entries=entries)
+    objs["message.packet_in"] = ofp.message.packet_in(
+        xid=1, data="\x00" * 128)
+    return objs
+
+
+def corpus(ofp, pattern):
+    """
+    Yield (name, object) for every class of the protocol module ofp.
+    """
+    loxi.load_lazy_modules(ofp)
+    prefix = ofp.__name__ + "."
+    modules = set(module for module in vars(ofp).values()
+                  if inspect.ismodule(module) and
+                  module.__name__.startswith(prefix))
+    objs = {}
+    for module in modules:
+        for name, cls in vars(module).items():
+            if not (inspect.isclass(cls) and issubclass(cls, loxi.OFObject)):
+                continue
+            if cls.__module__ != module.__name__:
+                continue
+            if cls.__dict__.get("subtypes"):
+                # Abstract class, its subclasses are benchmarked instead
+                continue
+            try:
+                key = module.__name__[len(prefix):] + "." + name
+                objs[key] = set_fields(cls())
+            except Exception:
+                continue
+    for name, obj in full_objects(ofp).items():
+        objs[name + "[full]"] = obj
+    for name in sorted(objs):
+        if pattern is None or pattern.search(name):
+            yield name, objs[name]
+
+
+def measure(func, seconds, repeat):
+    """
+    Return the best ops/sec of func over repeat runs of about seconds each,
+    and the number of GC-tracked objects each call leaves allocated.
+    """
+    number = 1
+    while True:
+        start = time.time()
+        for i in xrange(number):
+            func()
+        elapsed = time.time() - start
+        if elapsed >= seconds / 10 or number >= 1 << 20:
+            break
+        number *= 10
+    number = max(1, int(number * seconds / max(elapsed, 1e-9)))
+    best = None
+    for i in range(repeat):
+        start = time.time()
+        for i in xrange(number):
+            func()
+        elapsed = time.time() - start
+        if best is None or elapsed < best:
+            best = elapsed
+
+    results = [None] * 100
+    gc.collect()
+    gc.disable()
+    try:
+        before = gc.get_count()[0]
+        for i in xrange(len(results)):
+            results[i] = func()
+        after = gc.get_count()[0]
+    finally:
+        gc.enable()
+    objects = max(0, after - before) / float(len(results))
+    return number / max(best, 1e-9), objects
+
+
+def benchmark(obj, seconds, repeat):
+    """
+    Return {operation: {"ops": ops/sec, "objects": objects per call}}.
+    """
+    packed = obj.pack()
+    cls = type(obj)
+
+    def unpack():
+        return cls.unpack(loxi.generic_util.OFReader(packed))
+
+    other = unpack()
+
+    def eq():
+        return obj == other
+
+    funcs = {
+        "pack": obj.pack,
+        "unpack": unpack,
+        "eq": eq,
+        "show": obj.show,
+    }
+    results = {}
+    for op in operations:
+        ops, objects = measure(funcs[op], seconds, repeat)
+        results[op] = {"ops": round(ops, 1), "objects": round(objects, 2)}
+    return results
+
+
+def compare(old, new, threshold):
+    """
+    Print the operations whose ops/sec changed by more than threshold.
+    """
+    changes = []
+    for name, ops in sorted(new["results"].items()):
+        if name not in old["results"]:
+            continue
+        for op in operations:
+            before = old["results"][name][op]["ops"]
+            after = ops[op]["ops"]
+            ratio = after / before - 1
+            if abs(ratio) > threshold:
+                changes.append((ratio, name, op, before, after))
+    changes.sort()
+    for ratio, name, op, before, after in changes:
+        print "%+7.1f%% %-60s %-6s %12.1f -> %12.1f" % (
+            ratio * 100, name, op, before, after)
+    compared = len(set(new["results"]) & set(old["results"]))
+    print "%d of %d classes compared, %d changes" % (
+        compared, len(new["results"]), len(changes))
+
+
+def main():
+    args = gParser.parse_args()
+    versions = args.version or sorted(loxi.version_names)
+    pattern = args.filter and re.compile(args.filter)
+
+    output = {
+        "python": platform.python_version(),
+        "time": args.time,
+        "repeat": args.repeat,
+        "results": {},
+    }
+    for version in versions:
+        ofp = loxi.protocol(version)
+        for name, obj in corpus(ofp, pattern):
+            try:
+                result = benchmark(obj, args.time, args.repeat)
+            except Exception as e:
+                sys.stderr.write("%s.%s: %s: %s\n" % (
+                    ofp.__name__, name, type(e).__name__, e))
+                continue
+            key = "%s.%s" % (ofp.__name__.split(".")[-1], name)
+            output["results"][key] = result
+
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(output, f, indent=1, sort_keys=True)
+    else:
+        json.dump(output, sys.stdout, indent=1, sort_keys=True)
+        print
+
+    if args.compare:
+        with open(args.compare) as f:
+            compare(json.load(f), output, args.threshold)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,363 @@
+"""
+Field-aware mutation of packed OpenFlow messages
+
+A Mutator packs a loxi message once and learns its wire layout by tracing
+the message's own unpack(): the offset and width of every integer field,
+the length fields and the regions they cover, and the elements of TLV
+lists (actions, instructions, buckets, OXMs, ...). Mutations are then
+applied directly to copies of the packed bytes:
+
+    length    skew a length field
+    truncate  cut the message short, keeping the header length consistent
+    duplicate repeat a list element, fixing up the enclosing lengths
+    type      set a type field to an out-of-range value
+    field     set an integer field to a boundary value
+
+By default the message header (version, type, length and xid) is left
+alone, so the switch keeps framing the stream and replies can be matched:
+
+    mutator = Mutator(ofp.message.flow_add(match=match, instructions=[inst]))
+    for desc, data in mutator.mutations(10000):
+        controller.message_send(data)
+"""
+
+import random
+import struct
+import loxi.generic_util
+
+# Field kinds
+INT = "int"
+TYPE = "type"
+LENGTH = "length"
+
+
+class Field(object):
+    """
+    Integer field of a packed message
+
+    offset: position in the message
+    struct: single-field struct.Struct of its width
+    value: value in the packed message
+    kind: INT, TYPE or LENGTH
+    """
+    __slots__ = ["offset", "struct", "value", "kind"]
+
+    def __init__(self, offset, st, value, kind=INT):
+        self.offset = offset
+        self.struct = st
+        self.value = value
+        self.kind = kind
+
+
+class Region(object):
+    """
+    Span of a packed message covered by a length field
+
+    length_field: the Field holding end - start, or None
+    parent: the enclosing Region, or None for the message itself
+    align: the region is followed by padding to this alignment, or None
+    """
+    __slots__ = ["start", "end", "length_field", "parent", "align"]
+
+    def __init__(self, start, end, length_field, parent):
+        self.start = start
+        self.end = end
+        self.length_field = length_field
+        self.parent = parent
+        self.align = None
+
+
+class Layout(object):
+    """
+    Wire layout of a packed message
+
+    fields: every integer Field, in offset order
+    regions: every Region, outermost first
+    elements: (start, end, region) of each TLV list element, region being
+    the innermost Region containing the list
+    """
+    def __init__(self, packed, cls):
+        self.fields = []
+        self.regions = []
+        self.elements = []
+        cls.unpack(_TracingReader(packed, 0, len(packed), self, None))
+        # OpenFlow 1.0 has no OXMs, nor padded regions
+        oxm = getattr(loxi.protocol(cls.version), "oxm", None)
+        oxm_layouts = getattr(oxm, "fixed_layouts", {})
+        for region in list(self.regions):
+            if region.align is not None:
+                # Only OXM matches are padded, their OXMs are decoded
+                # straight from the buffer without going through the reader
+                self._trace_oxms(packed, region, oxm_layouts)
+        self.fields.sort(key=lambda field: field.offset)
+
+    def _trace_oxms(self, packed, match, oxm_layouts):
+        offset = match.start + 4
+        while offset + 4 <= match.end:
+            length = ord(packed[offset + 3])
+            if offset + 4 + length > match.end:
+                break
+            # Class, field and hasmask, then the payload length
+            oxm_class, = _field_structs["H"].unpack_from(packed, offset)
+            self.fields.append(Field(offset, _field_structs["H"], oxm_class,
+                                     TYPE))
+            self.fields.append(Field(offset + 2, _field_structs["B"],
+                                     ord(packed[offset + 2]), TYPE))
+            length_field = Field(offset + 3, _field_structs["B"], length,
+                                 LENGTH)
+            self.fields.append(length_field)
+            self.regions.append(Region(offset + 4, offset + 4 + length,
+                                       length_field, match))
+            self.elements.append((offset, offset + 4 + length, match))
+            # Value and mask, from the struct covering the whole OXM
+            type_len, = _field_structs["L"].unpack_from(packed, offset)
+            layout = oxm_layouts.get(type_len)
+            if layout is not None:
+                for field_offset, field_struct in \
+                        _struct_fields(layout[1].format)[1:]:
+                    if field_struct is not None:
+                        value, = field_struct.unpack_from(
+                            packed, offset + field_offset)
+                        self.fields.append(Field(offset + field_offset,
+                                                 field_struct, value))
+            offset += 4 + length
+
+
+class _TracingReader(loxi.generic_util.OFReader):
+    """
+    OFReader recording the fields, regions and list elements it reads
+    """
+    def __init__(self, buf, start, length, layout, region):
+        loxi.generic_util.OFReader.__init__(self, buf, start, length)
+        self.layout = layout
+        self.region = region
+        self.element_start = None
+        self.last_region = None
+
+    def read_struct(self, st):
+        position = self.start + self.offset
+        result = loxi.generic_util.OFReader.read_struct(self, st)
+        values = iter(result)
+        for offset, field_struct in _struct_fields(st.format):
+            value = next(values)
+            if field_struct is not None:
+                self.layout.fields.append(Field(position + offset,
+                                                field_struct, value))
+        return result
+
+    def is_empty(self):
+        # Called by unpack_list before each element and after the last one
+        position = self.start + self.offset
+        if self.element_start is not None and position > self.element_start:
+            self.layout.elements.append((self.element_start, position,
+                                         self.region))
+        empty = loxi.generic_util.OFReader.is_empty(self)
+        self.element_start = None if empty else position
+        return empty
+
+    def skip_align(self):
+        region = self.last_region
+        if region is not None and region.end == self.start + self.offset:
+            region.align = 8
+        loxi.generic_util.OFReader.skip_align(self)
+
+    def slice(self, length, rewind=0):
+        if self.offset + length - rewind > self.length:
+            raise loxi.ProtocolError("Buffer too short")
+        start = self.start + self.offset - rewind
+        length_field = None
+        for field in reversed(self.layout.fields):
+            if field.offset < start:
+                break
+            if field.value == length:
+                length_field = field
+                break
+        if length_field is not None:
+            # Fields ahead of the length field of an object are its type
+            length_field.kind = LENGTH
+            for field in self.layout.fields:
+                if start <= field.offset < length_field.offset:
+                    field.kind = TYPE
+        region = Region(start, start + length, length_field, self.region)
+        self.layout.regions.append(region)
+        self.last_region = region
+        reader = _TracingReader(self.buf, start, length, self.layout, region)
+        reader.skip(rewind)
+        self.offset += length - rewind
+        return reader
+
+
+_field_structs = {
+    "B": struct.Struct("!B"),
+    "H": struct.Struct("!H"),
+    "L": struct.Struct("!L"),
+    "Q": struct.Struct("!Q"),
+}
+
+
+_struct_field_cache = {}
+
+
+def _struct_fields(fmt):
+    """
+    Return (offset, struct) for each value unpacked with fmt, the struct
+    being None for strings.
+    """
+    fields = _struct_field_cache.get(fmt)
+    if fields is None:
+        fields = []
+        offset = 0
+        count = ""
+        for c in fmt.lstrip("!"):
+            if c.isdigit():
+                count += c
+                continue
+            n = int(count or 1)
+            count = ""
+            if c == "x":
+                offset += n
+            elif c == "s":
+                fields.append((offset, None))
+                offset += n
+            else:
+                for i in range(n):
+                    fields.append((offset, _field_structs[c]))
+                    offset += _field_structs[c].size
+        _struct_field_cache[fmt] = fields
+    return fields
+
+
+class Mutator(object):
+    """
+    Generator of field-aware mutations of a message
+
+    msg: loxi message to mutate
+    seed: seed of the random generator, for reproducible campaigns
+    header: also mutate the version, type and length in the header, which
+    can make the switch drop the connection
+    """
+    def __init__(self, msg, seed=None, header=False):
+        if msg.xid is None:
+            msg = msg.clone(xid=0)
+        self.packed = msg.pack()
+        self.layout = Layout(self.packed, type(msg))
+        self.random = random.Random(seed)
+        self.header = header
+
+        fields = [field for field in self.layout.fields
+                  if header or field.offset >= 8]
+        self.int_fields = [field for field in fields if field.kind == INT]
+        self.type_fields = [field for field in fields if field.kind == TYPE]
+        self.length_fields = [field for field in fields
+                              if field.kind == LENGTH]
+        self.operators = []
+        if self.length_fields:
+            self.operators.append(self.skew_length)
+        if len(self.packed) > 8:
+            self.operators.append(self.truncate)
+        if self.layout.elements:
+            self.operators.append(self.duplicate)
+        if self.type_fields:
+            self.operators.append(self.bad_type)
+        if self.int_fields:
+            self.operators.append(self.boundary)
+
+    def mutate(self, xid=None):
+        """
+        Return (description, data) for a random mutation, with the xid
+        patched in if given.
+        """
+        desc, buf = self.random.choice(self.operators)()
+        if xid is not None:
+            _field_structs["L"].pack_into(buf, 4, xid)
+        return desc, str(buf)
+
+    def mutations(self, count, xid=None):
+        """
+        Yield count random mutations as (description, data).
+        """
+        for i in xrange(count):
+            yield self.mutate(xid)
+
+    def skew_length(self):
+        """
+        Skew a length field by a small amount or to an extreme.
+        """
+        field = self.random.choice(self.length_fields)
+        limit = 1 << (field.struct.size * 8)
+        value = self.random.choice((
+            field.value + self.random.randint(1, 8),
+            field.value - self.random.randint(1, 8),
+            0, limit - 1, self.random.randrange(limit)))
+        return self._set(field, value % limit, "length")
+
+    def truncate(self):
+        """
+        Cut the message short, at a field boundary or anywhere after the
+        header, and set the header length to match.
+        """
+        boundaries = [field.offset for field in self.layout.fields
+                      if field.offset > 8]
+        if boundaries and self.random.random() < 0.5:
+            end = self.random.choice(boundaries)
+        else:
+            end = self.random.randrange(8, len(self.packed))
+        buf = bytearray(self.packed[:end])
+        _field_structs["H"].pack_into(buf, 2, end)
+        return "truncate@%d" % end, buf
+
+    def duplicate(self):
+        """
+        Repeat a TLV list element, growing the lengths of the regions
+        containing it.
+        """
+        start, end, region = self.random.choice(self.layout.elements)
+        buf = bytearray(self.packed)
+        buf[end:end] = buf[start:end]
+        delta = end - start
+        while region is not None:
+            field = region.length_field
+            if field is not None:
+                length = region.end - region.start
+                limit = 1 << (field.struct.size * 8)
+                field.struct.pack_into(buf, field.offset,
+                                       (field.value + delta) % limit)
+                if region.align is not None:
+                    old_pad = -length % region.align
+                    new_pad = -(length + delta) % region.align
+                    pad = region.end + delta
+                    if new_pad > old_pad:
+                        buf[pad:pad] = "\x00" * (new_pad - old_pad)
+                    else:
+                        del buf[pad:pad + old_pad - new_pad]
+                    delta += new_pad - old_pad
+            region = region.parent
+        return "duplicate@%d:%d" % (start, end), buf
+
+    def bad_type(self):
+        """
+        Set a type field to a value unlikely to be defined.
+        """
+        field = self.random.choice(self.type_fields)
+        limit = 1 << (field.struct.size * 8)
+        value = self.random.choice((
+            limit - 1, limit - 2, limit >> 1,
+            (field.value + self.random.randint(1, 16)) % limit,
+            self.random.randrange(limit)))
+        return self._set(field, value, "type")
+
+    def boundary(self):
+        """
+        Set an integer field to a boundary value.
+        """
+        field = self.random.choice(self.int_fields)
+        limit = 1 << (field.struct.size * 8)
+        value = self.random.choice((
+            0, 1, limit - 1, limit >> 1, field.value ^ 1,
+            self.random.randrange(limit)))
+        return self._set(field, value, "field")
+
+    def _set(self, field, value, name):
+        buf = bytearray(self.packed)
+        field.struct.pack_into(buf, field.offset, value)
+        return "%s@%d=%d" % (name, field.offset, value), buf
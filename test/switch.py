@@ -7,6 +7,7 @@ import logging
 from florence import config, Color
 import florence.controller_role_setup as role_setup
 import florence.malformed_message as malformed_message
+import florence.mutation as mutation
 import oftest.base_tests as base_tests
 import ofp
 import oftest.testutils as testutils
@@ -536,6 +537,46 @@ class MalformedBufferIDValue(base_tests.SimpleDataPlane):
             log.info(REASON + " -> "+ str(Err))
 
 
+class MutatedFlowMod(base_tests.SimpleDataPlane):
+    """
+    Verify that the switch stays connected and responsive while it receives
+    a stream of flow mod messages with skewed lengths, truncated bodies,
+    duplicated TLVs, out-of-range types and boundary field values.
+    """
+    def runTest(self):
+        INFO = " 1.1.180 - Mutated Flow Mod Robustness"
+        in_port, out_port1 = testutils.openflow_ports(2)
+        testutils.delete_all_flows(self.controller)
+
+        match = ofp.match([
+            ofp.oxm.in_port(in_port),
+            ofp.oxm.eth_type(0x800),
+        ])
+        inst = ofp.instruction.apply_actions([ofp.action.output(out_port1)])
+        request = ofp.message.flow_add(table_id=10,
+                                       match=match,
+                                       instructions=[inst],
+                                       hard_timeout=1000)
+        mutator = mutation.Mutator(request, seed=config["random_seed"])
+        logging.info("Sending mutated flow mods")
+        try:
+            count = 0
+            for desc, data in mutator.mutations(10000):
+                self.assertTrue(self.controller.switch_socket is not None,
+                                "Switch disconnected after mutation " + desc)
+                self.controller.message_send(data)
+                count += 1
+                if count % 1000 == 0:
+                    reply, pkt = self.controller.transact(
+                        ofp.message.echo_request())
+                    self.assertTrue(reply is not None,
+                                    "No echo reply after mutation " + desc)
+            log.info(PASS + INFO)
+        except AssertionError, Err:
+            log.info(FAIL + INFO)
+            log.info(REASON + " -> " + str(Err))
+
+
 class SlaveControllerViolation(base_tests.SimpleDataPlane):
     """
     Verify that the switch rejects unsupported control messages
@@ -581,7 +622,7 @@ class SlaveControllerViolation(base_tests.SimpleDataPlane):
         try:
             err_count = 0
             while self.controller.packets:
-                msg = self.controller.packets.pop(0)[0]
+                msg = self.controller.packets.popleft()[0]
                 if msg.type == ofp.OFPT_ERROR:
                     self.assertEquals(msg.err_type, ofp.OFPET_BAD_REQUEST)
                     self.assertEquals(msg.code, ofp.OFPBRC_EPERM)